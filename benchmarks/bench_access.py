@@ -0,0 +1,56 @@
+"""
+Benchmark reading and writing datatype properties
+
+Compares attribute access through the generated property descriptors with item access through
+__getitem__ and __setitem__, for orphan objects and for objects nested in a figure
+
+Usage:
+
+    $ python benchmarks/bench_access.py [--number N]
+"""
+import argparse
+import timeit
+
+from ipyplotly.datatypes import Figure
+from ipyplotly.datatypes.trace.scatter import Marker
+
+
+def time_best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    marker = Marker(size=3)
+    fig = Figure()
+    fig.add_scatter(y=[1, 2, 3], marker={'size': 3})
+    fig.add_scatter(y=[1, 2, 3], marker={'size': 3})
+    trace = fig.data[1]
+    trace_marker = trace.marker
+    xaxis = fig.layout.xaxis
+    xaxis.range = [0, 1]
+
+    cases = [
+        ('orphan marker.size get', lambda: marker['size'], lambda: marker.size),
+        ('orphan marker.size set', lambda: marker.__setitem__('size', 4), lambda: setattr(marker, 'size', 4)),
+        ('trace.opacity get', lambda: trace['opacity'], lambda: trace.opacity),
+        ('trace.marker get', lambda: trace['marker'], lambda: trace.marker),
+        ('trace.marker.size get', lambda: trace_marker['size'], lambda: trace_marker.size),
+        ('trace.marker.size set', lambda: trace_marker.__setitem__('size', 3),
+         lambda: setattr(trace_marker, 'size', 3)),
+        ('layout.xaxis.range get', lambda: xaxis['range'], lambda: xaxis.range),
+    ]
+
+    print(f'{"case":<30}{"item":>12}{"attribute":>12}{"speedup":>10}')
+    for name, item_access, attribute_access in cases:
+        item_time = time_best(item_access, args.number)
+        attribute_time = time_best(attribute_access, args.number)
+        print(f'{name:<30}{item_time * 1e6:>10.2f}us{attribute_time * 1e6:>10.2f}us'
+              f'{item_time / attribute_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark copying validated datatype objects
+
+Compares re-validating copies (constructing a new object from the _props of an existing one,
+as CompoundValidator used to) with adopting the already validated props through
+_from_validated_props
+
+Usage:
+
+    $ python benchmarks/bench_copy.py [--traces N] [--points N] [--annotations N]
+"""
+import argparse
+import timeit
+from copy import deepcopy
+
+import numpy as np
+
+from ipyplotly.datatypes import Layout
+from ipyplotly.datatypes.trace import Scatter
+from ipyplotly.validators import LayoutValidator
+
+
+def build_traces(num_traces, num_points):
+    return [Scatter(x=np.arange(num_points), y=np.random.rand(num_points),
+                    text=['point %d' % i for i in range(num_points)],
+                    marker={'color': np.random.rand(num_points), 'size': 6, 'colorbar': {'title': 'c'}},
+                    line={'width': 2}, name='trace %d' % i)
+            for i in range(num_traces)]
+
+
+def build_layout(num_annotations):
+    return Layout(title='Benchmark', xaxis={'title': 'x'}, xaxis2={'title': 'x2'},
+                  annotations=[{'text': 'annotation %d' % i, 'x': i, 'y': i} for i in range(num_annotations)])
+
+
+def time_best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--traces', type=int, default=20)
+    parser.add_argument('--points', type=int, default=10000)
+    parser.add_argument('--annotations', type=int, default=200)
+    args = parser.parse_args()
+
+    traces = build_traces(args.traces, args.points)
+    layout = build_layout(args.annotations)
+    layout_validator = LayoutValidator()
+
+    cases = [
+        (f'{args.traces} traces of {args.points} points',
+         # type is a read-only property, it isn't accepted by trace constructors
+         lambda: [type(t)(**{k: v for k, v in t._props.items() if k != 'type'}) for t in traces],
+         lambda: [type(t)._from_validated_props(t.plotly_name, deepcopy(t._props)) for t in traces]),
+        (f'layout with {args.annotations} annotations',
+         lambda: Layout(**layout._props),
+         lambda: layout_validator.validate_coerce(layout)),
+    ]
+
+    print(f'{"case":<40}{"re-validate":>14}{"adopt":>14}{"speedup":>10}')
+    for name, revalidate, adopt in cases:
+        revalidate_time = time_best(revalidate, number=3)
+        adopt_time = time_best(adopt, number=3)
+        print(f'{name:<40}{revalidate_time * 1000:>12.1f}ms{adopt_time * 1000:>12.1f}ms'
+              f'{revalidate_time / adopt_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,77 +1,351 @@
 import json
 import os.path as opath
-import os
-import shutil
+from multiprocessing import Pool
 
-import time
+from codegen.datatypes import write_datatypes_py, append_figure_class, format_datatypes_py, figure_classes
+from codegen.docs import write_docs_resources
+from codegen.manifest import CodegenManifest, compute_generator_hash, compute_node_hash, compute_hash
+from codegen.packages import write_package_init_pys
+from codegen.paths import append_property_paths_pys
+from codegen.profiles import select_trace_types
+from codegen.profiler import (start_profiler, stop_profiler, get_active_profiler, profile_phase,
+                              profile_node)
+from codegen.staging import StagedOutputTree
+from codegen.transforms import add_trace_transforms
+from codegen.utils import TraceNode, PlotlyNode, LayoutNode, FrameNode, TransformNode, PlotlySchemaIndex
+from codegen.validators import (write_validator_py, append_traces_validator_py, format_validators_py,
+                               format_validator_tables_py, append_transforms_validator_py)
 
-from codegen.datatypes import build_datatypes_py, write_datatypes_py, append_figure_class
-from codegen.utils import TraceNode, PlotlyNode, LayoutNode, FrameNode
-from codegen.validators import write_validator_py, append_traces_validator_py
+
+def load_plotly_schema(trace_types=None):
+    """
+    Load the plotly schema, optionally restricted to a subset of its trace types
+    (see codegen.profiles.select_trace_types), with the transforms property added to every
+    trace type (see codegen.transforms.add_trace_transforms)
+    """
+    with open('codegen/resources/plot-schema.json', 'r') as f:
+        plotly_schema = json.load(f)
+
+    return add_trace_transforms(select_trace_types(plotly_schema, trace_types))
+
+
+def compute_codegen_nodes(plotly_schema):
+    """
+    Compute the nodes that codegen generates source code for
+
+    The ordering of each list of nodes is deterministic for a given schema, so nodes may be
+    referenced by (group, index) pairs across processes
+
+    Returns
+    -------
+    dict
+        Dict with keys 'base_trace', 'trace', 'layout', 'frame', 'extra_layout', 'base_transform',
+        'transform_types', and 'transform'
+    """
+    schema_index = PlotlySchemaIndex(plotly_schema)
+
+    # The root transform node only has datatypes (the classes of the transform types). The
+    # validators of its children are replaced by the transforms validator of every trace type
+    base_transform_node = schema_index.get_node(TransformNode)
+    transform_nodes = [node for node in
+                       PlotlyNode.get_all_compound_datatype_nodes(plotly_schema, TransformNode, schema_index)
+                       if node is not base_transform_node]
+
+    return {'base_trace': schema_index.get_node(TraceNode),
+            'trace': PlotlyNode.get_all_compound_datatype_nodes(plotly_schema, TraceNode, schema_index),
+            'layout': PlotlyNode.get_all_compound_datatype_nodes(plotly_schema, LayoutNode, schema_index),
+            'frame': PlotlyNode.get_all_compound_datatype_nodes(plotly_schema, FrameNode, schema_index),
+            'extra_layout': PlotlyNode.get_all_trace_layout_nodes(plotly_schema, schema_index),
+            'base_transform': base_transform_node,
+            'transform_types': [base_transform_node],
+            'transform': transform_nodes}
+
+
+def format_node_task(codegen_nodes, task):
+    """
+    Build and format the source code for a single (kind, group, index) codegen task
+
+    Returns
+    -------
+    OrderedDict
+        Dict from module name to formatted module source code
+    """
+    kind, group, i = task
+    node = codegen_nodes[group][i]
+    extra_nodes = codegen_nodes['extra_layout'] if group == 'layout' else {}
+
+    with profile_node(node_task_key(codegen_nodes, task)):
+        if kind == 'validators':
+            return format_validators_py(node, extra_nodes)
+        elif kind == 'validator_tables':
+            return format_validator_tables_py(node, extra_nodes)
+        elif kind == 'datatypes':
+            return format_datatypes_py(node, extra_nodes)
+        else:
+            raise ValueError('Unknown codegen task kind: %s' % kind)
+
+
+# Worker process state
+# --------------------
+_worker_codegen_nodes = None
+_worker_profile = False
+
+
+def _init_worker(profile=False, trace_types=None):
+    global _worker_codegen_nodes, _worker_profile
+    _worker_codegen_nodes = compute_codegen_nodes(load_plotly_schema(trace_types))
+    _worker_profile = profile
+
+
+def _format_node_task_in_worker(task):
+    # Each task is profiled separately and the times are merged into the main process's profiler
+    if _worker_profile:
+        start_profiler()
+
+    formatted_source = format_node_task(_worker_codegen_nodes, task)
+    return formatted_source, stop_profiler()
+
+
+def format_node_tasks(codegen_nodes, tasks, jobs=1, trace_types=None):
+    """
+    Build and format the source code for a list of codegen tasks, optionally across a pool of
+    worker processes. Worker processes compute their own nodes, restricted to trace_types
+
+    Returns
+    -------
+    list of OrderedDict
+        Formatted module source code for each task, in the same order as tasks
+    """
+    if jobs > 1:
+        profiler = get_active_profiler()
+        with Pool(processes=jobs, initializer=_init_worker, initargs=(profiler is not None, trace_types)) as pool:
+            results = pool.map(_format_node_task_in_worker, tasks, chunksize=1)
+
+        formatted_sources = []
+        for formatted_source, task_profiler in results:
+            if profiler is not None:
+                profiler.merge(task_profiler)
+            formatted_sources.append(formatted_source)
+
+        return formatted_sources
+    else:
+        return [format_node_task(codegen_nodes, task) for task in tasks]
+
+
+def node_task_key(codegen_nodes, task):
+    kind, group, i = task
+    return f'{kind}/{group}/{codegen_nodes[group][i].dir_str}'
+
+
+def node_task_hash(codegen_nodes, task):
+    kind, group, i = task
+    extra_nodes = codegen_nodes['extra_layout'] if group == 'layout' else {}
+    return compute_node_hash(codegen_nodes[group][i], extra_nodes)
 
 
-def perform_codegen():
+# Validators generation modes, and the kind of codegen task that generates the validators of a
+# node in each mode
+validators_modes = {'classes': 'validators', 'tables': 'validator_tables'}
+
+
+def perform_codegen(jobs=1, full=False, cache_dir='codegen/.cache', profile=False, profile_report=None,
+                    trace_types=None, validators_mode='classes'):
+    """
+    Generate the validators and datatypes packages from the plotly schema
+
+    Parameters
+    ----------
+    jobs : int
+        Number of worker processes used to build and format source code
+    full : bool
+        If True, regenerate the source code of every node. Otherwise only nodes whose schema
+        subtree changed since the last run are regenerated
+    cache_dir : str
+        Directory that holds the codegen manifest and cached source code
+    profile : bool
+        If True, print the time spent in each codegen phase and by the slowest nodes, and write
+        the timings to a JSON report
+    profile_report : str or None
+        Path of the JSON profile report. Defaults to profile.json in cache_dir
+    trace_types : list of str or None
+        If specified, only generate these trace types (plus the default 'scatter' trace type),
+        along with their trace-specific layout properties. Otherwise generate every trace type
+        in the schema
+    validators_mode : str
+        'classes' to generate a module and class per validator, with validate_coerce methods
+        specialized for each property. 'tables' to generate a single table module per validators
+        package, from which validator classes are built on first use (see
+        ipyplotly.importers.validator_table). Tables import faster and use less memory, but the
+        validators use the generic validate_coerce methods of their base validators
+    """
+    if validators_mode not in validators_modes:
+        raise ValueError('Invalid validators_mode: {mode}\n'
+                         '    Valid modes: {modes}'.format(mode=validators_mode, modes=list(validators_modes)))
+
+    if profile:
+        profiler = start_profiler()
+        try:
+            _perform_codegen(jobs, full, cache_dir, trace_types, validators_mode)
+        finally:
+            stop_profiler()
+
+        if profile_report is None:
+            profile_report = opath.join(cache_dir, 'profile.json')
+
+        print(profiler.format_report())
+        profiler.write_json(profile_report, jobs=jobs, full=full)
+        print(f'Wrote profile report to {profile_report}')
+    else:
+        _perform_codegen(jobs, full, cache_dir, trace_types, validators_mode)
+
+
+def _perform_codegen(jobs, full, cache_dir, trace_types, validators_mode):
     outdir = 'ipyplotly/'
     # outdir = 'codegen/output'
     # Load plotly schema
     # ------------------
-    with open('codegen/resources/plot-schema.json', 'r') as f:
-        plotly_schema = json.load(f)
+    with profile_phase('load_schema'):
+        plotly_schema = load_plotly_schema(trace_types)
 
     # Compute property paths
     # ----------------------
-    base_traces_node = TraceNode(plotly_schema)
-    compound_trace_nodes = PlotlyNode.get_all_compound_datatype_nodes(plotly_schema, TraceNode)
-    compound_layout_nodes = PlotlyNode.get_all_compound_datatype_nodes(plotly_schema, LayoutNode)
-    compound_frame_nodes = PlotlyNode.get_all_compound_datatype_nodes(plotly_schema, FrameNode)
+    with profile_phase('compute_nodes'):
+        codegen_nodes = compute_codegen_nodes(plotly_schema)
+    base_traces_node = codegen_nodes['base_trace']
+    extra_layout_nodes = codegen_nodes['extra_layout']
+
+    # Load manifest
+    # -------------
+    with profile_phase('manifest'):
+        manifest = CodegenManifest(cache_dir, compute_generator_hash(), reuse=not full)
+
+    # Build and format source code
+    # ----------------------------
+    # Tasks are listed in the order their output is written to disk so that parallel runs
+    # produce a tree identical to serial runs
+    validators_kind = validators_modes[validators_mode]
+    task_groups = [(validators_kind, ('layout', 'trace', 'frame', 'transform')),
+                   ('datatypes', ('layout', 'trace', 'frame', 'transform_types', 'transform'))]
+    tasks = [(kind, group, i)
+             for kind, groups in task_groups
+             for group in groups
+             for i in range(len(codegen_nodes[group]))]
+
+    with profile_phase('hash'):
+        task_keys = {task: node_task_key(codegen_nodes, task) for task in tasks}
+        task_hashes = {task: node_task_hash(codegen_nodes, task) for task in tasks}
+
+    # ### Reuse sources of unchanged nodes ###
+    with profile_phase('manifest'):
+        formatted_sources = {task: manifest.get_source(task_keys[task], task_hashes[task]) for task in tasks}
+
+    # ### Regenerate sources of changed nodes ###
+    changed_tasks = [task for task in tasks if formatted_sources[task] is None]
+    changed_sources = format_node_tasks(codegen_nodes, changed_tasks, jobs=jobs, trace_types=trace_types)
+    for task, formatted_source in zip(changed_tasks, changed_sources):
+        manifest.set_source(task_keys[task], task_hashes[task], formatted_source)
+        formatted_sources[task] = formatted_source
 
-    extra_layout_nodes = PlotlyNode.get_all_trace_layout_nodes(plotly_schema)
+    print(f'Regenerated {len(changed_tasks)} of {len(tasks)} node sources')
+
+    # Stage output tree
+    # -----------------
+    # The generated packages are assembled in memory and only written to disk once complete
+    output_tree = StagedOutputTree()
+
+    def write_node_sources(kind, group, extra_nodes={}):
+        write_py = write_datatypes_py if kind == 'datatypes' else write_validator_py
+        for i, node in enumerate(codegen_nodes[group]):
+            write_py(output_tree, node, extra_nodes, formatted_sources=formatted_sources[(kind, group, i)])
 
     # Write out validators
     # --------------------
-    validators_pkgdir = opath.join(outdir, 'validators')
-    if opath.exists(validators_pkgdir):
-        shutil.rmtree(validators_pkgdir)
-
     # ### Layout ###
-    for node in compound_layout_nodes:
-        write_validator_py(outdir, node, extra_layout_nodes)
+    write_node_sources(validators_kind, 'layout', extra_layout_nodes)
 
     # ### Trace ###
-    for node in compound_trace_nodes:
-        write_validator_py(outdir, node)
+    write_node_sources(validators_kind, 'trace')
 
     # Write out datatypes
     # -------------------
-    datatypes_pkgdir = opath.join(outdir, 'datatypes')
-    if opath.exists(datatypes_pkgdir):
-        shutil.rmtree(datatypes_pkgdir)
-
     # ### Layout ###
-    for node in compound_layout_nodes:
-        write_datatypes_py(outdir, node, extra_layout_nodes)
+    write_node_sources('datatypes', 'layout', extra_layout_nodes)
 
     # ### Trace ###
-    for node in compound_trace_nodes:
-        write_datatypes_py(outdir, node)
+    write_node_sources('datatypes', 'trace')
 
     # Append traces validator class
     # -----------------------------
-    append_traces_validator_py(validators_pkgdir, base_traces_node)
+    traces_validator_key = 'validators/base_trace'
+    traces_validator_hash = compute_hash(list(plotly_schema['traces']))
+    with profile_node(traces_validator_key):
+        traces_validator_source = append_traces_validator_py(
+            output_tree, base_traces_node,
+            formatted_source=manifest.get_source(traces_validator_key, traces_validator_hash))
+    manifest.set_source(traces_validator_key, traces_validator_hash, traces_validator_source)
+
+    # Append property path tables
+    # ----------------------------
+    # Tables of the properties of each trace type and of the layout, used to validate dotted
+    # path restyle and relayout operations. Cheap to build, so they aren't cached
+    layout_node = [node for node in codegen_nodes['layout'] if node.dir_path == ['layout']][0]
+    append_property_paths_pys(output_tree, base_traces_node, layout_node, extra_layout_nodes)
 
     # Add Frames
     # ----------
     # ### Validator ###
-    for node in compound_frame_nodes:
-        write_validator_py(outdir, node)
+    write_node_sources(validators_kind, 'frame')
 
     # ### Datatypes ###
-    for node in compound_frame_nodes:
-        write_datatypes_py(outdir, node)
+    write_node_sources('datatypes', 'frame')
+
+    # Add Transforms
+    # --------------
+    # ### Validators ###
+    write_node_sources(validators_kind, 'transform')
+
+    transforms_validator_key = 'validators/base_transform'
+    transforms_validator_hash = compute_hash([node.plotly_name for node in
+                                              codegen_nodes['base_transform'].child_compound_datatypes])
+    with profile_node(transforms_validator_key):
+        transforms_validator_source = append_transforms_validator_py(
+            output_tree, codegen_nodes['base_transform'],
+            formatted_source=manifest.get_source(transforms_validator_key, transforms_validator_hash))
+    manifest.set_source(transforms_validator_key, transforms_validator_hash, transforms_validator_source)
+
+    # ### Datatypes ###
+    write_node_sources('datatypes', 'transform_types')
+    write_node_sources('datatypes', 'transform')
 
     # Append figure class to datatypes
     # --------------------------------
-    append_figure_class(datatypes_pkgdir, base_traces_node)
+    # Figure docstrings include the descriptions of the data, layout, and frames validators
+    figure_hash = compute_hash(plotly_schema['traces'], plotly_schema['layout'], plotly_schema['frames'])
+    figure_sources = {fig_classname: manifest.get_source(f'datatypes/figure/{fig_classname}', figure_hash)
+                      for _, _, fig_classname in figure_classes}
+    figure_sources = {fig_classname: source for fig_classname, source in figure_sources.items() if source}
+
+    figure_sources = append_figure_class(output_tree, base_traces_node, figure_sources)
+    for fig_classname, source in figure_sources.items():
+        manifest.set_source(f'datatypes/figure/{fig_classname}', figure_hash, source)
+
+    # Write docs resources
+    # --------------------
+    # Descriptions of the properties of every datatype class, loaded by the generated classes
+    # on first use (see ipyplotly.lazydocs). Cheap to build, so they aren't cached
+    write_docs_resources(output_tree, codegen_nodes)
+
+    # Commit output tree
+    # ------------------
+    # Replaces the validators and datatypes packages in a single pass
+    with profile_phase('write'):
+        write_package_init_pys(output_tree)
+        output_tree.commit(outdir)
+
+    # Save manifest
+    # -------------
+    with profile_phase('manifest'):
+        manifest.save()
 
 
 if __name__ == '__main__':
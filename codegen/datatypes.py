@@ -1,11 +1,10 @@
+from collections import OrderedDict
 from io import StringIO
-import os
-import os.path as opath
-import textwrap
-import importlib
 from typing import List, Dict
 
-from codegen.utils import TraceNode, format_source, PlotlyNode
+from codegen.profiler import profile_phase, profile_node
+from codegen.staging import StagedOutputTree
+from codegen.utils import TraceNode, format_source, PlotlyNode, custom_validator_datatypes
 
 
 def get_typing_type(plotly_type, array_ok=False):
@@ -21,6 +20,8 @@ def get_typing_type(plotly_type, array_ok=False):
         pytype = 'int'
     elif plotly_type == 'boolean':
         pytype = 'bool'
+    elif plotly_type == 'transforms':
+        pytype = 'Tuple'
     else:
         raise ValueError('Unknown plotly type: %s' % plotly_type)
 
@@ -30,98 +31,95 @@ def get_typing_type(plotly_type, array_ok=False):
         return pytype
 
 
-def build_datatypes_py(parent_node: PlotlyNode,
-                       extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+def get_datatype_module_name(compound_node: PlotlyNode):
+    """
+    Name of the module of the datatype class of compound_node (e.g. '_marker')
+    """
+    return '_' + compound_node.plotly_name
 
-    compound_nodes = parent_node.child_compound_datatypes
-    if not compound_nodes:
-        return None
 
+def build_datatype_py(parent_node: PlotlyNode,
+                      compound_node: PlotlyNode,
+                      extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the source code of the module of a single datatype class
+    """
     buffer = StringIO()
 
     # Imports
     # -------
     buffer.write('from typing import *\n')
     buffer.write('from numbers import Number\n')
-    buffer.write(f'from ipyplotly.basedatatypes import {parent_node.base_datatype_class}\n')
+    buffer.write(f'from ipyplotly.basedatatypes import ({parent_node.base_datatype_class}, SimpleProperty, '
+                 f'CompoundProperty, CompoundArrayProperty, ItemProperty)\n')
+    buffer.write('from ipyplotly.lazydocs import lazy_class_doc\n')
 
     # ### Validators ###
-    validators_csv = ', '.join([f'{n.plotly_name} as v_{n.plotly_name}' for n in compound_nodes])
-    buffer.write(f'from ipyplotly.validators{parent_node.pkg_str} import ({validators_csv})\n')
+    buffer.write(f'from ipyplotly.validators{parent_node.pkg_str} import '
+                 f'({compound_node.plotly_name} as v_{compound_node.plotly_name})\n')
 
     # ### Datatypes ###
-    datatypes_csv = ', '.join([f'{n.plotly_name} as d_{n.plotly_name}' for n in compound_nodes if n.child_compound_datatypes])
-    if datatypes_csv:
-        buffer.write(f'from ipyplotly.datatypes{parent_node.pkg_str} import ({datatypes_csv})\n')
-
-    # Compound datatypes loop
-    # -----------------------
-    for compound_node in compound_nodes:
+    if compound_node.child_compound_datatypes:
+        buffer.write(f'from ipyplotly.datatypes{parent_node.pkg_str} import '
+                     f'({compound_node.plotly_name} as d_{compound_node.plotly_name})\n')
 
-        # grab literals
-        literal_nodes = [n for n in compound_node.child_literals if n.plotly_name in ['type']]
+    # grab literals
+    literal_nodes = [n for n in compound_node.child_literals if n.plotly_name in ['type']]
 
-        # ### Class definition ###
-        buffer.write(f"""
+    # ### Class definition ###
+    buffer.write(f"""
 
 class {compound_node.name_class}({parent_node.base_datatype_class}):\n""")
 
-        # ### Property definitions ###
-        child_datatype_nodes = compound_node.child_datatypes
-        extra_subtype_nodes = [node for node_name, node in
-                               extra_nodes.items() if
-                               node_name.startswith(compound_node.dir_str)]
-
-        subtype_nodes = child_datatype_nodes + extra_subtype_nodes
-        for subtype_node in subtype_nodes:
-            if subtype_node.is_array_element:
-                prop_type = f'Tuple[d_{compound_node.plotly_name}.{subtype_node.name_class}]'
-            elif subtype_node.is_compound:
-                prop_type = f'd_{compound_node.plotly_name}.{subtype_node.name_class}'
-            else:
-                prop_type = get_typing_type(subtype_node.datatype)
-
-
-            # #### Get property description ####
-            raw_description = subtype_node.description
-            property_description = '\n'.join(textwrap.wrap(raw_description,
-                                                           subsequent_indent=' ' * 8,
-                                                           width=80 - 8))
-
-            # #### Get validator description ####
-            validator = subtype_node.validator_instance
-            validator_description = reindent_validator_description(validator, 4)
-
-            # #### Combine to form property docstring ####
-            if property_description.strip():
-                property_docstring = f"""{property_description}  
-                
-        {validator_description}"""
-            else:
-                property_docstring = validator_description
-
-            # #### Write property ###
-            buffer.write(f"""\
+    # Instances store their state in the slots of the base classes, don't give them a __dict__
+    buffer.write("""
+    __slots__ = ()
+""")
+
+    # Docstrings are built from the docs resources on first use (see codegen/docs.py)
+    buffer.write(f"""
+    __doc__ = lazy_class_doc
+    _docs_key = '{compound_node.dir_str}'
+""")
+
+    # ### Property definitions ###
+    child_datatype_nodes = compound_node.child_datatypes
+    extra_subtype_nodes = [node for node_name, node in
+                           extra_nodes.items() if
+                           node_name.startswith(compound_node.dir_str)]
+
+    subtype_nodes = child_datatype_nodes + extra_subtype_nodes
+    for subtype_node in subtype_nodes:
+        # Compound types are quoted so that the classes aren't imported until they're used
+        if subtype_node.is_array_element:
+            prop_type = f"'Tuple[d_{compound_node.plotly_name}.{subtype_node.name_class}]'"
+        elif subtype_node.is_compound:
+            prop_type = f"'d_{compound_node.plotly_name}.{subtype_node.name_class}'"
+        else:
+            prop_type = get_typing_type(subtype_node.datatype)
+
+        # #### Write property ###
+        # Properties are declared with the descriptor of their kind (see
+        # ipyplotly.basedatatypes.SimpleProperty), so reads and writes don't dispatch on the
+        # validator type. Properties with custom validators go through __getitem__ and __setitem__
+        if subtype_node.dir_str in custom_validator_datatypes:
+            descriptor_class = 'ItemProperty'
+        elif subtype_node.is_array_element or subtype_node.datatype == 'transforms':
+            descriptor_class = 'CompoundArrayProperty'
+        elif subtype_node.is_compound:
+            descriptor_class = 'CompoundProperty'
+        else:
+            descriptor_class = 'SimpleProperty'
+
+        buffer.write(f"""\
 
     # {subtype_node.name_property}
     # {'-' * len(subtype_node.name_property)}
-    @property
-    def {subtype_node.name_property}(self) -> {prop_type}:
-        \"\"\"
-        {property_docstring}
-        \"\"\"
-        return self['{subtype_node.name_property}']""")
+    {subtype_node.name_property}: {prop_type} = {descriptor_class}()\n""")
 
-            # #### Set property ###
-            buffer.write(f"""
-
-    @{subtype_node.name_property}.setter
-    def {subtype_node.name_property}(self, val):
-        self['{subtype_node.name_property}'] = val\n""")
-
-        # ### Literals ###
-        for literal_node in literal_nodes:
-            buffer.write(f"""\
+    # ### Literals ###
+    for literal_node in literal_nodes:
+        buffer.write(f"""\
 
     # {literal_node.name_property}
     # {'-' * len(literal_node.name_property)}
@@ -129,70 +127,75 @@ class {compound_node.name_class}({parent_node.base_datatype_class}):\n""")
     def {literal_node.name_property}(self) -> {prop_type}:
         return self._props['{literal_node.name_property}']\n""")
 
-        # ### Self properties description ###
-        buffer.write(f"""
+    # ### Parent path ###
+    buffer.write(f"""
 
     # property parent name
     # --------------------
     @property
     def _parent_path(self) -> str:
-        return '{compound_node.parent_dir_str}'
-
-    # Self properties description
-    # ---------------------------
-    @property
-    def _prop_descriptions(self) -> str:
-        return \"\"\"\\""")
+        return '{compound_node.parent_dir_str}'""")
 
-        buffer.write(compound_node.get_constructor_params_docstring(
-            indent=8,
-            extra_nodes=extra_subtype_nodes))
+    # ### Validators ###
+    buffer.write(f"""
 
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {{""")
+    for subtype_node in subtype_nodes:
         buffer.write(f"""
-        \"\"\"""")
+            '{subtype_node.name_property}': v_{compound_node.plotly_name}.{subtype_node.name_validator}(),""")
 
-        # ### Constructor ###
-        buffer.write(f"""
+    buffer.write(f"""
+        }}
+""")
+
+    # ### Constructor ###
+    buffer.write(f"""
     def __init__(self""")
 
-        add_constructor_params(buffer, subtype_nodes)
-        add_docstring(buffer, compound_node, extra_subtype_nodes)
+    add_constructor_params(buffer, subtype_nodes)
 
-        buffer.write(f"""
+    buffer.write(f"""
         super().__init__('{compound_node.name_property}', **kwargs)
-        
-        # Initialize validators
-        # ---------------------""")
-        for subtype_node in subtype_nodes:
 
-            buffer.write(f"""
-        self._validators['{subtype_node.name_property}'] = v_{compound_node.plotly_name}.{subtype_node.name_validator}()""")
-
-        buffer.write(f"""
-        
         # Populate data dict with properties
         # ----------------------------------""")
-        for subtype_node in subtype_nodes:
-            buffer.write(f"""
+    for subtype_node in subtype_nodes:
+        buffer.write(f"""
         self.{subtype_node.name_property} = {subtype_node.name_property}""")
 
-        # ### Literals ###
-        literal_nodes = [n for n in compound_node.child_literals if n.plotly_name in ['type']]
-        if literal_nodes:
-            buffer.write(f"""
+    # ### Literals ###
+    literal_nodes = [n for n in compound_node.child_literals if n.plotly_name in ['type']]
+    if literal_nodes:
+        buffer.write(f"""
 
         # Read-only literals
         # ------------------""")
-            for literal_node in literal_nodes:
-                buffer.write(f"""
+        for literal_node in literal_nodes:
+            buffer.write(f"""
         self._props['{literal_node.name_property}'] = '{literal_node.node_data}'""")
 
+    buffer.write('\n')
     return buffer.getvalue()
 
 
-def reindent_validator_description(validator, extra_indent):
-    # Remove leading indent and add extra spaces to subsequent indent
-    return ('\n' + ' ' * extra_indent).join(validator.description().strip().split('\n'))
+def build_datatypes_py(parent_node: PlotlyNode,
+                       extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the source code of the datatype modules of the compound children of parent_node
+
+    Returns
+    -------
+    OrderedDict
+        Dict from module name (e.g. '_marker') to module source code. Empty if parent_node
+        has no compound children
+    """
+    return OrderedDict([(get_datatype_module_name(compound_node),
+                         build_datatype_py(parent_node, compound_node, extra_nodes))
+                        for compound_node in parent_node.child_compound_datatypes])
 
 
 def add_constructor_params(buffer, subtype_nodes, colon=True):
@@ -207,53 +210,46 @@ def add_constructor_params(buffer, subtype_nodes, colon=True):
         ){':' if colon else ''}""")
 
 
-def add_docstring(buffer, compound_node, extra_subtype_nodes=[]):
-    # ### Docstring ###
-    buffer.write(f"""
-        \"\"\"
-        Construct a new {compound_node.name_pascal_case} object
-        
-        Parameters
-        ----------""")
-    buffer.write(compound_node.get_constructor_params_docstring(
-        indent=8,
-        extra_nodes=extra_subtype_nodes ))
-
-    # #### close docstring ####
-    buffer.write(f"""
-
-        Returns
-        -------
-        {compound_node.name_pascal_case}
-        \"\"\"""")
-
-
-def write_datatypes_py(outdir, node: PlotlyNode,
-                       extra_nodes: Dict[str, 'PlotlyNode']={}):
+def format_datatypes_py(node: PlotlyNode,
+                        extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build and format the source code of the datatype modules of the compound children of node
 
+    Returns
+    -------
+    OrderedDict
+        Dict from module name to formatted module source code
+    """
     # Generate source code
     # --------------------
-    datatype_source = build_datatypes_py(node, extra_nodes)
-    if datatype_source:
+    with profile_phase('build'):
+        datatype_sources = build_datatypes_py(node, extra_nodes)
+
+    formatted_sources = OrderedDict()
+    for module_name, datatype_source in datatype_sources.items():
         try:
-            formatted_source = format_source(datatype_source)
+            formatted_sources[module_name] = format_source(datatype_source)
         except Exception as e:
             print(datatype_source)
             raise e
 
-        # Write file
-        # ----------
-        filedir = opath.join(outdir, 'datatypes', *node.dir_path)
-        os.makedirs(filedir, exist_ok=True)
-        filepath = opath.join(filedir, '__init__.py')
+    return formatted_sources
+
 
-        mode = 'at' if os.path.exists(filepath) else 'wt'
-        with open(filepath, mode) as f:
-            if mode == 'at':
-                f.write("\n\n")
-            f.write(formatted_source)
-            f.flush()
-            os.fsync(f.fileno())
+def write_datatypes_py(output_tree: StagedOutputTree, node: PlotlyNode,
+                       extra_nodes: Dict[str, 'PlotlyNode']={},
+                       formatted_sources=None):
+
+    # Generate source code
+    # --------------------
+    if formatted_sources is None:
+        formatted_sources = format_datatypes_py(node, extra_nodes)
+
+    # Write files
+    # -----------
+    for module_name, formatted_source in formatted_sources.items():
+        relpath = '/'.join(['datatypes', *node.dir_path, module_name + '.py'])
+        output_tree.append_source(formatted_source, relpath)
 
 
 def build_figure_py(trace_node, base_package, base_classname, fig_classname):
@@ -262,45 +258,34 @@ def build_figure_py(trace_node, base_package, base_classname, fig_classname):
 
     # Imports
     # -------
+    # Trace classes are imported by the add_* methods, so that only the trace types that are
+    # used get imported
     buffer.write(f'from ipyplotly.{base_package} import {base_classname}\n')
-
-    trace_types_csv = ', '.join([n.name_pascal_case for n in trace_nodes])
-    buffer.write(f'from ipyplotly.datatypes.trace import ({trace_types_csv})\n')
+    buffer.write('from ipyplotly.lazydocs import lazy_class_doc\n')
 
     buffer.write(f"""
 
 class {fig_classname}({base_classname}):\n""")
 
-    # Reload validators and datatypes modules since we're appending
-    # Classes to them as we go
-    validators_module = importlib.import_module('ipyplotly.validators')
-    importlib.reload(validators_module)
-    datatypes_module = importlib.import_module('ipyplotly.datatypes')
-    importlib.reload(datatypes_module)
-
-    # Build constructor description strings
-    data_validator = validators_module.DataValidator()
-    data_description = reindent_validator_description(data_validator, 8)
-
-    layout_validator = validators_module.LayoutValidator()
-    layout_description = reindent_validator_description(layout_validator, 8)
-
-    frames_validator = validators_module.FramesValidator()
-    frames_description = reindent_validator_description(frames_validator, 8)
-
+    # The class docstring is built from the validators of the figure on first use. The methods
+    # have short docstrings that refer to it, and to the (lazily documented) trace classes
     buffer.write(f"""
+    __doc__ = lazy_class_doc
+
     def __init__(self, data=None, layout=None, frames=None):
         \"\"\"
         Create a new {fig_classname} instance
-        
+
         Parameters
         ----------
         data
-            {data_description}
+            Tuple of trace instances, or list of dicts of trace properties
         layout
-            {layout_description}
+            Layout instance, or dict of layout properties
         frames
-            {frames_description}
+            Tuple of frame instances, or list of dicts of frame properties
+
+        See help({fig_classname}) for the full descriptions of the parameters
         \"\"\"
         super().__init__(data, layout, frames)
     """)
@@ -314,11 +299,23 @@ class {fig_classname}({base_classname}):\n""")
     def add_{trace_node.plotly_name}(self""")
 
         add_constructor_params(buffer, trace_node.child_datatypes)
-        add_docstring(buffer, trace_node)
+
+        buffer.write(f"""
+        \"\"\"
+        Add a new {trace_node.name_pascal_case} trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.{trace_node.name_pascal_case}) for their descriptions
+
+        Returns
+        -------
+        {trace_node.name_pascal_case}
+        \"\"\"""")
 
         # Function body
         # -------------
         buffer.write(f"""
+        from ipyplotly.datatypes.trace import {trace_node.name_pascal_case}
         new_trace = {trace_node.name_pascal_case}(
         """)
 
@@ -337,24 +334,50 @@ class {fig_classname}({base_classname}):\n""")
     return buffer.getvalue()
 
 
-def append_figure_class(outdir, trace_node):
+# (base module, base class name, figure class name) of each generated figure class
+figure_classes = [('basewidget', 'BaseFigureWidget', 'FigureWidget'),
+                  ('basedatatypes', 'BaseFigure', 'Figure')]
 
+
+def format_figure_py(trace_node, base_package, base_classname, fig_classname):
+    with profile_phase('build'):
+        figure_source = build_figure_py(trace_node, base_package, base_classname, fig_classname)
+    return format_source(figure_source)
+
+
+def append_figure_class(output_tree: StagedOutputTree, trace_node, formatted_sources={}):
+    """
+    Add the figure classes to the datatypes package
+
+    Parameters
+    ----------
+    output_tree : StagedOutputTree
+        Output tree of the codegen run
+    trace_node : TraceNode
+        Root trace node
+    formatted_sources : dict
+        Previously formatted source code of the figure classes, keyed by figure class name.
+        Figure classes that are not present are built and formatted
+
+    Returns
+    -------
+    dict
+        Formatted source code of the figure classes, keyed by figure class name
+    """
     if trace_node.node_path:
         raise ValueError('Expected root trace node. Received node with path "%s"' % trace_node.dir_str)
 
-    base_figures = [('basewidget', 'BaseFigureWidget', 'FigureWidget'),
-                    ('basedatatypes', 'BaseFigure', 'Figure')]
+    res = {}
+    for base_package, base_classname, fig_classname in figure_classes:
+        formatted_source = formatted_sources.get(fig_classname, None)
+        if formatted_source is None:
+            with profile_node(f'datatypes/figure/{fig_classname}'):
+                formatted_source = format_figure_py(trace_node, base_package, base_classname, fig_classname)
 
-    for base_package, base_classname, fig_classname in base_figures:
-        figure_source = build_figure_py(trace_node, base_package, base_classname, fig_classname)
-        formatted_source = format_source(figure_source)
+        # Write file
+        # ----------
+        output_tree.append_source(formatted_source, f'datatypes/_{fig_classname.lower()}.py')
 
-        # Append to file
-        # --------------
-        filepath = opath.join(outdir, '__init__.py')
+        res[fig_classname] = formatted_source
 
-        with open(filepath, 'a') as f:
-            f.write('\n\n')
-            f.write(formatted_source)
-            f.flush()
-            os.fsync(f.fileno())
+    return res
@@ -0,0 +1,65 @@
+import json
+import textwrap
+from collections import OrderedDict
+from typing import Dict, List
+
+from codegen.profiler import profile_phase
+from codegen.staging import StagedOutputTree
+from codegen.utils import PlotlyNode
+from ipyplotly.lazydocs import get_docs_group
+
+
+def build_datatype_docs(compound_node: PlotlyNode, extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the docs of the datatype class of compound_node
+
+    Returns
+    -------
+    OrderedDict
+        Dict from property name to property description, in constructor parameter order.
+        Descriptions are wrapped to 68 characters (the width they had as indented docstrings)
+    """
+    extra_subtype_nodes = [node for node_name, node in
+                           extra_nodes.items() if
+                           node_name.startswith(compound_node.dir_str)]
+
+    return OrderedDict([(subtype_node.name_property, '\n'.join(textwrap.wrap(subtype_node.description, width=68)))
+                        for subtype_node in compound_node.child_datatypes + extra_subtype_nodes])
+
+
+def build_docs_resources(parent_nodes: List[PlotlyNode], extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the docs resources of the datatype classes of the compound children of parent_nodes
+
+    Returns
+    -------
+    OrderedDict
+        Dict from docs group (see ipyplotly.lazydocs.get_docs_group) to the docs of the classes
+        of the group, keyed by docs key (e.g. 'trace.scatter.marker')
+    """
+    resources = OrderedDict()
+    for parent_node in parent_nodes:
+        for compound_node in parent_node.child_compound_datatypes:
+            docs_key = compound_node.dir_str
+            group_docs = resources.setdefault(get_docs_group(docs_key), OrderedDict())
+            group_docs[docs_key] = build_datatype_docs(compound_node, extra_nodes)
+
+    return resources
+
+
+def write_docs_resources(output_tree: StagedOutputTree, codegen_nodes):
+    """
+    Add the docs resources of all datatype classes to the datatypes package, as compact JSON
+    files in datatypes/_docs
+    """
+    with profile_phase('build'):
+        resources = OrderedDict()
+        for group, extra_nodes in [('layout', codegen_nodes['extra_layout']), ('trace', {}), ('frame', {}),
+                                   ('transform_types', {}), ('transform', {})]:
+            # Groups may span several codegen groups (e.g. transform_types and transform)
+            for docs_group, group_docs in build_docs_resources(codegen_nodes[group], extra_nodes).items():
+                resources.setdefault(docs_group, OrderedDict()).update(group_docs)
+
+    for group, group_docs in resources.items():
+        output_tree.append_source(json.dumps(group_docs, separators=(',', ':')),
+                                  f'datatypes/_docs/{group}.json')
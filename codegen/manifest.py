@@ -0,0 +1,136 @@
+import glob
+import hashlib
+import json
+import os
+import os.path as opath
+from collections import OrderedDict
+
+import yapf
+
+from codegen.utils import PlotlyNode
+
+
+def compute_hash(*parts):
+    """
+    Compute a hex digest of the JSON serialization of parts
+    """
+    parts_json = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(parts_json.encode('utf-8')).hexdigest()
+
+
+def compute_generator_hash():
+    """
+    Compute a hash of everything, other than the schema, that influences the generated source code:
+    the codegen package, the base validators (whose descriptions are embedded in docstrings), and
+    the version of yapf used to format the output
+    """
+    hasher = hashlib.sha1(yapf.__version__.encode('utf-8'))
+    source_paths = sorted(glob.glob('codegen/*.py')) + ['ipyplotly/basevalidators.py']
+    for source_path in source_paths:
+        with open(source_path, 'rb') as f:
+            hasher.update(source_path.encode('utf-8'))
+            hasher.update(f.read())
+
+    return hasher.hexdigest()
+
+
+def compute_node_hash(node: PlotlyNode, extra_nodes={}):
+    """
+    Compute a hash of the schema subtree of node, along with any extra (trace-specific layout)
+    nodes that are merged into it.
+
+    The source code generated for a node is a function of its path, its schema subtree and the
+    generator sources only, so an unchanged hash means the node doesn't need to be regenerated
+    """
+    extra_data = {name: extra_node.node_data
+                  for name, extra_node in extra_nodes.items()
+                  if name.startswith(node.dir_str)}
+
+    return compute_hash(type(node).__name__, node.node_path, node.node_data, extra_data)
+
+
+class CodegenManifest:
+    """
+    Manifest of the content hashes of the nodes processed by the last codegen run, along with a
+    cache of the formatted source code that was generated for each of them
+    """
+    def __init__(self, cache_dir, generator_hash, reuse=True):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Directory that holds the manifest and the cached source code
+        generator_hash : str
+            Hash of the generator sources (see compute_generator_hash)
+        reuse : bool
+            If False, ignore the previous manifest so that all sources are regenerated
+        """
+        self.cache_dir = cache_dir
+        self.generator_hash = generator_hash
+
+        self._prev_hashes = {}
+        if reuse and opath.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+
+            # Any change to the generator invalidates every cached source
+            if manifest.get('generator_hash') == generator_hash:
+                self._prev_hashes = manifest.get('hashes', {})
+
+        self._hashes = {}
+
+    @property
+    def manifest_path(self):
+        return opath.join(self.cache_dir, 'manifest.json')
+
+    def _source_path(self, key, content_hash):
+        return opath.join(self.cache_dir, 'sources', compute_hash(key, content_hash) + '.json')
+
+    def get_source(self, key, content_hash):
+        """
+        Get the cached source code for key
+
+        Returns
+        -------
+        str, dict or None
+            The cached source code ('' if the key generated no source code), or None if the
+            content hash of key changed since the last run. Dicts of module sources are
+            returned as dicts with the same key order
+        """
+        source_path = self._source_path(key, content_hash)
+        if self._prev_hashes.get(key) != content_hash or not opath.exists(source_path):
+            return None
+
+        self._hashes[key] = content_hash
+        with open(source_path, 'r') as f:
+            return json.load(f, object_pairs_hook=OrderedDict)
+
+    def set_source(self, key, content_hash, source):
+        """
+        Store the source code generated for key
+
+        Parameters
+        ----------
+        source : str, dict or None
+            Source code, or dict from module name to source code
+        """
+        source_path = self._source_path(key, content_hash)
+        os.makedirs(opath.dirname(source_path), exist_ok=True)
+        with open(source_path, 'w') as f:
+            json.dump(source if source is not None else '', f)
+
+        self._hashes[key] = content_hash
+
+    def save(self):
+        """
+        Write out the manifest and remove cached source code that is no longer referenced
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.manifest_path, 'w') as f:
+            json.dump({'generator_hash': self.generator_hash, 'hashes': self._hashes},
+                      f, indent=1, sort_keys=True)
+
+        referenced_paths = {self._source_path(key, h) for key, h in self._hashes.items()}
+        for source_path in glob.glob(opath.join(self.cache_dir, 'sources', '*')):
+            if source_path not in referenced_paths:
+                os.remove(source_path)
@@ -0,0 +1,112 @@
+import ast
+import re
+from collections import OrderedDict
+from io import StringIO
+
+from codegen.staging import StagedOutputTree
+
+
+def build_package_init_py(subpackage_names, class_imports):
+    """
+    Build the source code of the __init__.py of a generated package
+
+    On Python 3.7+ the subpackages and classes of the package are imported lazily on first
+    attribute access (see ipyplotly.importers.relative_import). Older versions import them
+    eagerly.
+
+    Parameters
+    ----------
+    subpackage_names : list of str
+        Names of the subpackages of the package (e.g. ['marker'])
+    class_imports : list of (str, str)
+        (module name, class name) pairs of the classes of the package (e.g. [('_marker', 'Marker')])
+
+    Returns
+    -------
+    str
+    """
+    buffer = StringIO()
+    buffer.write('import sys\n\nif sys.version_info < (3, 7):\n')
+
+    for module_name, class_name in class_imports:
+        buffer.write(f'    from .{module_name} import {class_name}\n')
+
+    for subpackage_name in subpackage_names:
+        buffer.write(f'    from . import {subpackage_name}\n')
+
+    buffer.write('else:\n'
+                 '    from ipyplotly.importers import relative_import\n'
+                 '    __all__, __getattr__, __dir__ = relative_import(\n'
+                 '        __name__,\n'
+                 '        [')
+
+    buffer.write(''.join(f"\n            '.{subpackage_name}',"
+                         for subpackage_name in subpackage_names))
+    buffer.write(('\n        ' if subpackage_names else '') + '],\n        [')
+
+    buffer.write(''.join(f"\n            '.{module_name}.{class_name}',"
+                         for module_name, class_name in class_imports))
+    buffer.write(('\n        ' if class_imports else '') + ']\n    )\n')
+
+    return buffer.getvalue()
+
+
+def get_module_class_names(module_source):
+    """
+    Get the names of the classes of a generated class module
+
+    Class modules either define a single class, or build their classes dynamically and list
+    them in __all__ (e.g. validator table modules)
+
+    Returns
+    -------
+    list of str
+    """
+    all_match = re.search(r'^__all__ = (\[.*?\])$', module_source, re.MULTILINE | re.DOTALL)
+    if all_match:
+        return ast.literal_eval(all_match.group(1))
+
+    class_match = re.search(r'^class (\w+)[(:]', module_source, re.MULTILINE)
+    return [class_match.group(1)] if class_match else []
+
+
+def write_package_init_pys(output_tree: StagedOutputTree, package_names=('validators', 'datatypes')):
+    """
+    Add an __init__.py to every package of the output tree, exposing the subpackages of the
+    package and the class defined in each of its class modules
+
+    Generated class modules (e.g. _marker.py) define a single class, or list the classes they
+    build in __all__ (see get_module_class_names). Other private modules (e.g. _property_paths.py)
+    are left to be imported explicitly
+    """
+    # Collect package contents
+    # ------------------------
+    # Dict from package path (e.g. ('validators', 'trace')) to subpackage names and class imports
+    subpackages = OrderedDict()
+    class_imports = OrderedDict()
+
+    for relpath in output_tree.relpaths:
+        path = tuple(relpath.split('/'))
+        if path[0] not in package_names or not relpath.endswith('.py'):
+            # Resource files (e.g. datatypes/_docs/layout.json) aren't part of the packages
+            continue
+
+        # Register package and its parents
+        for i in range(1, len(path)):
+            package_path = path[:i]
+            subpackages.setdefault(package_path, [])
+            class_imports.setdefault(package_path, [])
+            if i > 1 and package_path[-1] not in subpackages[package_path[:-1]]:
+                subpackages[package_path[:-1]].append(package_path[-1])
+
+        # Register class module. Modules without a class (e.g. _property_paths.py) aren't exposed
+        module_filename = path[-1]
+        if module_filename.startswith('_') and module_filename != '__init__.py':
+            for class_name in get_module_class_names(output_tree.get_source(relpath)):
+                class_imports[path[:-1]].append((module_filename[:-3], class_name))
+
+    # Write package init modules
+    # --------------------------
+    for package_path in subpackages:
+        init_source = build_package_init_py(subpackages[package_path], class_imports[package_path])
+        output_tree.append_source(init_source, '/'.join(package_path + ('__init__.py',)))
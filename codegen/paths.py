@@ -0,0 +1,80 @@
+from io import StringIO
+from typing import Dict
+
+from codegen.profiler import profile_phase
+from codegen.staging import StagedOutputTree
+from codegen.utils import PlotlyNode, TraceNode
+
+
+def get_property_path_entries(root_node: PlotlyNode, extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Get the property path table entries of a trace type or layout node
+
+    Returns
+    -------
+    list of (str, (str, str, str))
+        (dotted property path, (relative validator package, validator class name, container kind))
+        pairs for every property below root_node, in depth first order.
+        e.g. ('marker.line.width', ('.marker.line', 'WidthValidator', 'simple'))
+    """
+    entries = []
+    root_depth = len(root_node.dir_path)
+
+    def add_entries(parent_node, path_prefix, datatype_nodes):
+        # Validators of the children of parent_node are in its validators package
+        rel_package = ''.join('.' + p for p in parent_node.dir_path[root_depth:])
+
+        for node in datatype_nodes:
+            if node.is_array_element or node.datatype == 'transforms':
+                kind = 'compound_array'
+            elif node.is_compound:
+                kind = 'compound'
+            else:
+                kind = 'simple'
+
+            path = path_prefix + node.name_property
+            entries.append((path, (rel_package, node.name_validator, kind)))
+
+            if node.is_compound:
+                add_entries(node, path + '.', node.child_datatypes)
+
+    extra_subtype_nodes = [node for node_name, node in extra_nodes.items()
+                           if node.parent_dir_str == root_node.dir_str]
+    add_entries(root_node, '', root_node.child_datatypes + extra_subtype_nodes)
+
+    return entries
+
+
+def build_property_paths_py(root_node: PlotlyNode, extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the source code of the _property_paths module of a trace type or layout node (see
+    ipyplotly.propertypaths.PropertyPathTable)
+
+    The table is written one entry per line, so it isn't passed through yapf
+    """
+    buffer = StringIO()
+    buffer.write(f'# Property paths of {root_node.dir_str}\n'
+                 f'# (dotted path: (relative validator package, validator class name, container kind))\n'
+                 f'property_paths = {{\n')
+
+    for path, entry in get_property_path_entries(root_node, extra_nodes):
+        buffer.write(f'    {path!r}: {entry!r},\n')
+
+    buffer.write('}\n')
+    return buffer.getvalue()
+
+
+def append_property_paths_pys(output_tree: StagedOutputTree,
+                              base_trace_node: TraceNode,
+                              layout_node: PlotlyNode,
+                              extra_layout_nodes: Dict[str, 'PlotlyNode']):
+    """
+    Add the property path tables of every trace type and of the layout to the validators package
+    """
+    with profile_phase('build'):
+        root_nodes = [(node, {}) for node in base_trace_node.child_compound_datatypes]
+        root_nodes.append((layout_node, extra_layout_nodes))
+
+        for root_node, extra_nodes in root_nodes:
+            relpath = '/'.join(['validators', *root_node.dir_path, '_property_paths.py'])
+            output_tree.append_source(build_property_paths_py(root_node, extra_nodes), relpath)
@@ -0,0 +1,181 @@
+import json
+import os
+import os.path as opath
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class CodegenProfiler:
+    """
+    Accumulates the wall time spent in each phase of a codegen run, in total and per node
+
+    Phases may be nested (e.g. 'format' runs inside 'build'), so phase times are not
+    expected to add up to the total run time. Times merged from worker processes are summed, so
+    with multiple workers they may also exceed it.
+    """
+    def __init__(self):
+        self.phase_seconds = OrderedDict()
+        self.phase_counts = OrderedDict()
+        self.node_seconds = OrderedDict()
+        self._node_key = None
+        self._start_time = time.perf_counter()
+        self.total_seconds = None
+
+    def add_time(self, phase, seconds, node_key=None):
+        """
+        Add seconds to the time spent in phase, attributing it to node_key (or the current node)
+        """
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+        self.phase_counts[phase] = self.phase_counts.get(phase, 0) + 1
+
+        node_key = node_key or self._node_key
+        if node_key:
+            node_times = self.node_seconds.setdefault(node_key, OrderedDict())
+            node_times[phase] = node_times.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start_time)
+
+    @contextmanager
+    def node(self, node_key):
+        """
+        Attribute the phases run within the context to node_key, and record the node's total time
+        """
+        prev_node_key = self._node_key
+        self._node_key = node_key
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            node_times = self.node_seconds.setdefault(node_key, OrderedDict())
+            node_times['total'] = node_times.get('total', 0.0) + time.perf_counter() - start_time
+            self._node_key = prev_node_key
+
+    def merge(self, other: 'CodegenProfiler'):
+        """
+        Merge the times recorded by another profiler (e.g. one from a worker process) into this one
+        """
+        for phase, seconds in other.phase_seconds.items():
+            self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+            self.phase_counts[phase] = self.phase_counts.get(phase, 0) + other.phase_counts[phase]
+
+        for node_key, other_times in other.node_seconds.items():
+            node_times = self.node_seconds.setdefault(node_key, OrderedDict())
+            for phase, seconds in other_times.items():
+                node_times[phase] = node_times.get(phase, 0.0) + seconds
+
+    def stop(self):
+        self.total_seconds = time.perf_counter() - self._start_time
+
+    # Reports
+    # -------
+    def hot_spots(self, top=10):
+        """
+        The top nodes by total time, as a list of (node_key, phase times) tuples
+        """
+        node_items = sorted(self.node_seconds.items(),
+                            key=lambda item: item[1].get('total', 0.0),
+                            reverse=True)
+        return node_items[:top]
+
+    def to_dict(self, top=10, **extra_info):
+        """
+        Machine readable report of the recorded times
+        """
+        total_seconds = self.total_seconds
+        if total_seconds is None:
+            total_seconds = time.perf_counter() - self._start_time
+
+        return OrderedDict([
+            ('total_seconds', total_seconds),
+            *extra_info.items(),
+            ('phases', OrderedDict([(phase, {'seconds': seconds, 'count': self.phase_counts[phase]})
+                                    for phase, seconds in self.phase_seconds.items()])),
+            ('hot_spots', [OrderedDict([('node', node_key), *node_times.items()])
+                           for node_key, node_times in self.hot_spots(top)]),
+            ('nodes', self.node_seconds)])
+
+    def format_report(self, top=10):
+        """
+        Human readable report of the recorded times
+        """
+        report = self.to_dict(top)
+        lines = ['Codegen profile',
+                 '===============',
+                 f"{'phase':<24}{'seconds':>10}{'count':>8}"]
+        for phase, phase_info in report['phases'].items():
+            lines.append(f"{phase:<24}{phase_info['seconds']:>10.3f}{phase_info['count']:>8}")
+
+        lines.append(f"{'total (wall)':<24}{report['total_seconds']:>10.3f}")
+
+        if report['hot_spots']:
+            lines.extend(['', f'Top {len(report["hot_spots"])} nodes by total time'])
+            for node_info in report['hot_spots']:
+                phases_str = ', '.join(f'{phase} {seconds:.3f}' for phase, seconds in node_info.items()
+                                       if phase not in ('node', 'total'))
+                lines.append(f"{node_info.get('total', 0.0):>8.3f}  {node_info['node']}  ({phases_str})")
+
+        return '\n'.join(lines)
+
+    def write_json(self, filepath, top=10, **extra_info):
+        dirname = opath.dirname(filepath)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        with open(filepath, 'w') as f:
+            json.dump(self.to_dict(top, **extra_info), f, indent=2)
+
+
+# Active profiler
+# ---------------
+# Codegen functions report their phases to the active profiler of the current process, if any,
+# so that profiling doesn't need to be threaded through every codegen function
+_active_profiler = None
+
+
+def start_profiler() -> CodegenProfiler:
+    global _active_profiler
+    _active_profiler = CodegenProfiler()
+    return _active_profiler
+
+
+def stop_profiler() -> CodegenProfiler:
+    global _active_profiler
+    profiler, _active_profiler = _active_profiler, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def get_active_profiler():
+    return _active_profiler
+
+
+@contextmanager
+def profile_phase(name):
+    """
+    Record the time spent in the context as phase name of the active profiler (no-op if none)
+    """
+    if _active_profiler is None:
+        yield
+    else:
+        with _active_profiler.phase(name):
+            yield
+
+
+@contextmanager
+def profile_node(node_key):
+    """
+    Attribute the time spent in the context to node_key of the active profiler (no-op if none)
+    """
+    if _active_profiler is None:
+        yield
+    else:
+        with _active_profiler.node(node_key):
+            yield
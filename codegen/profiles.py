@@ -0,0 +1,48 @@
+from collections import OrderedDict
+
+# Trace type of traces that don't specify one. Always generated
+DEFAULT_TRACE_TYPE = 'scatter'
+
+
+def select_trace_types(plotly_schema, trace_types=None):
+    """
+    Restrict a plotly schema to a subset of its trace types
+
+    Everything that codegen generates per trace type (the trace datatypes and validators, the
+    trace-specific layout properties, the trace classes of the DataValidator and the add_*
+    methods of the figure classes) is derived from the traces section of the schema, so
+    generating from the restricted schema yields a package that only supports trace_types.
+
+    Parameters
+    ----------
+    plotly_schema : dict
+        Plotly schema, as loaded from plot-schema.json
+    trace_types : list of str or None
+        Trace types to keep (e.g. ['scatter', 'bar']). The default 'scatter' trace type is always
+        kept. If None, plotly_schema is returned unchanged
+
+    Returns
+    -------
+    dict
+        Shallow copy of plotly_schema with only the selected traces
+
+    Raises
+    ------
+    ValueError
+        If trace_types includes trace types that aren't in the schema
+    """
+    if trace_types is None:
+        return plotly_schema
+
+    trace_types = set(trace_types) | {DEFAULT_TRACE_TYPE}
+    unknown_types = trace_types - set(plotly_schema['traces'])
+    if unknown_types:
+        raise ValueError('Unknown trace types: {unknown}\n'
+                         '    Valid trace types: {valid}'.format(unknown=sorted(unknown_types),
+                                                                 valid=sorted(plotly_schema['traces'])))
+
+    selected_schema = dict(plotly_schema)
+    selected_schema['traces'] = OrderedDict([(trace_type, trace_schema)
+                                             for trace_type, trace_schema in plotly_schema['traces'].items()
+                                             if trace_type in trace_types])
+    return selected_schema
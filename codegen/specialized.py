@@ -0,0 +1,189 @@
+from io import StringIO
+
+import numpy as np
+
+
+# Specialized validate_coerce methods
+# -----------------------------------
+# Generated validators override validate_coerce with a method that is specialized for the schema
+# options of their property. The options are baked into the method as constants, so the common
+# case of a valid scalar (or None) is accepted with a couple of type and range checks. Everything
+# else (arrays, other types, invalid values) is passed on to the generic validate_coerce of the
+# base validator, which coerces the value or raises the usual error.
+#
+# The specialized methods must return exactly what the generic validate_coerce returns for the
+# values they accept.
+
+_SUPER_CALL = """
+        return super().validate_coerce(v)
+"""
+
+
+def _set_literal(values):
+    """
+    Set display of values, in a deterministic order so that the generated source is reproducible
+    (v in {...} tests against set displays of constants are compiled to frozenset constants)
+    """
+    return '{' + ', '.join(sorted(repr(v) for v in values)) + '}'
+
+
+def _range_condition(min_val, max_val):
+    """
+    Condition that a number v lies in the interval [min_val, max_val], or None if there are no
+    bounds
+    """
+    if min_val is not None and max_val is not None:
+        return f'{min_val!r} <= v <= {max_val!r}'
+    elif min_val is not None:
+        return f'v >= {min_val!r}'
+    elif max_val is not None:
+        return f'v <= {max_val!r}'
+    else:
+        return None
+
+
+def _build_accept_py(type_check, condition=None, accepted='v'):
+    """
+    Build the body of a specialized validate_coerce that accepts values that pass type_check and
+    condition, and passes None through
+    """
+    if condition is None:
+        accept_branch = f"""
+            return {accepted}"""
+    else:
+        accept_branch = f"""
+            if {condition}:
+                return {accepted}"""
+
+    return f"""
+        if {type_check}:{accept_branch}
+        elif v is None:
+            return v""" + _SUPER_CALL
+
+
+def _build_number_py(options):
+    # NumberValidator extends one sided intervals with -inf/inf, which doesn't change the check
+    condition = _range_condition(options.get('min'), options.get('max'))
+    return _build_accept_py('v.__class__ is int or v.__class__ is float', condition)
+
+
+def _build_integer_py(options):
+    # IntegerValidator extends one sided intervals to the int32 range
+    min_val, max_val = options.get('min'), options.get('max')
+    if min_val is None and max_val is not None:
+        min_val = int(np.iinfo(np.int32).min)
+    elif max_val is None and min_val is not None:
+        max_val = int(np.iinfo(np.int32).max)
+
+    return _build_accept_py('v.__class__ is int', _range_condition(min_val, max_val))
+
+
+def _build_string_py(options):
+    conditions = []
+    if options.get('no_blank'):
+        conditions.append('v')
+    if options.get('values'):
+        conditions.append(f'v in {_set_literal(options["values"])}')
+
+    return _build_accept_py('v.__class__ is str', ' and '.join(conditions) or None)
+
+
+def _build_boolean_py(options):
+    return """
+        if v is True or v is False or v is None:
+            return v""" + _SUPER_CALL
+
+
+def _build_enumerated_py(options):
+    # Values that are /regexes/ are matched by the generic validate_coerce
+    exact_values = {v for v in options['values']
+                    if not (v and isinstance(v, str) and v[0] == '/' and v[-1] == '/')}
+    if not exact_values:
+        return None
+
+    return _build_accept_py('v.__class__ in (str, int, float, bool)', f'v in {_set_literal(exact_values)}')
+
+
+def _build_color_py(options):
+    # Valid named colors are already normalized (lower case without spaces)
+    if options.get('colorscale_path'):
+        return """
+        if v.__class__ is str:
+            if v in self.named_colors_set:
+                return v
+        elif v.__class__ is int or v.__class__ is float or v is None:
+            return v""" + _SUPER_CALL
+    else:
+        return _build_accept_py('v.__class__ is str', 'v in self.named_colors_set')
+
+
+def _build_angle_py(options):
+    return _build_accept_py('v.__class__ is int or v.__class__ is float', accepted='(v + 180) % 360 - 180')
+
+
+def _build_subplotid_py(options):
+    dflt = options['dflt']
+    return f"""
+        if v is None or (v.__class__ is str and v == {dflt!r}):
+            return {dflt!r}""" + _SUPER_CALL
+
+
+def _build_flaglist_py(options):
+    # A single flag, or a single extra, is returned as is
+    single_flags = set(options['flags']) | set(options.get('extras') or [])
+    return _build_accept_py('v.__class__ is str', f'v in {_set_literal(single_flags)}')
+
+
+def _build_any_py(options):
+    if options.get('array_ok'):
+        return None
+
+    # Without arrayOk, any value is returned as is
+    return """
+        return v
+"""
+
+
+_builders = {
+    'ipyplotly.basevalidators.NumberValidator': _build_number_py,
+    'ipyplotly.basevalidators.IntegerValidator': _build_integer_py,
+    'ipyplotly.basevalidators.StringValidator': _build_string_py,
+    'ipyplotly.basevalidators.BooleanValidator': _build_boolean_py,
+    'ipyplotly.basevalidators.EnumeratedValidator': _build_enumerated_py,
+    'ipyplotly.basevalidators.ColorValidator': _build_color_py,
+    'ipyplotly.basevalidators.AngleValidator': _build_angle_py,
+    'ipyplotly.basevalidators.SubplotidValidator': _build_subplotid_py,
+    'ipyplotly.basevalidators.FlaglistValidator': _build_flaglist_py,
+    'ipyplotly.basevalidators.AnyValidator': _build_any_py,
+}
+
+
+def build_validate_coerce_py(base_validator, options):
+    """
+    Build the source code of the specialized validate_coerce method of a generated validator
+    class
+
+    Parameters
+    ----------
+    base_validator : str
+        Full name of the base validator class (e.g. 'ipyplotly.basevalidators.NumberValidator')
+    options : dict
+        Validator constructor options, other than plotly_name and parent_name (e.g.
+        {'min': 0, 'array_ok': True})
+
+    Returns
+    -------
+    str
+        Source code of the method, indented for a class body. Empty if there is no specialized
+        method for base_validator and options
+    """
+    builder = _builders.get(base_validator)
+    body = builder(options) if builder else None
+    if not body:
+        return ''
+
+    buffer = StringIO()
+    buffer.write("""
+    def validate_coerce(self, v):""")
+    buffer.write(body)
+    return buffer.getvalue()
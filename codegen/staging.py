@@ -0,0 +1,98 @@
+import os
+import os.path as opath
+import shutil
+import tempfile
+from collections import OrderedDict
+
+
+class StagedOutputTree:
+    """
+    In-memory tree of generated source files that is written to disk in a single pass.
+
+    Sources are appended to files by relative path. Nothing touches the output directory until
+    commit is called, which writes the whole tree to a temporary directory and then swaps each
+    top-level package into place with a rename. A codegen run that fails before committing
+    leaves the existing packages untouched.
+    """
+    def __init__(self):
+        self._files = OrderedDict()  # type: OrderedDict[str, list]
+
+    def append_source(self, py_source, relpath):
+        """
+        Append python source code to the file at relpath, creating the file if needed.
+
+        Multiple sources appended to the same file are separated by two blank lines
+        """
+        if py_source:
+            self._files.setdefault(relpath, []).append(py_source)
+
+    def get_source(self, relpath):
+        """
+        Get the full source code of the file at relpath, or None if no source was appended to it
+        """
+        if relpath in self._files:
+            return '\n\n'.join(self._files[relpath])
+        else:
+            return None
+
+    @property
+    def relpaths(self):
+        return list(self._files.keys())
+
+    @property
+    def package_names(self):
+        """
+        Names of the top-level packages in the tree (e.g. ['validators', 'datatypes'])
+        """
+        res = []
+        for relpath in self._files:
+            package_name = relpath.split('/')[0]
+            if package_name not in res:
+                res.append(package_name)
+        return res
+
+    def commit(self, outdir):
+        """
+        Write the tree to outdir, replacing any existing top-level packages it contains.
+
+        The packages are swapped in together. If any swap fails, the packages already swapped are
+        moved out again and the previous packages are restored, so a failed commit never leaves a mix
+        of old and new packages
+        """
+        staging_dir = tempfile.mkdtemp(prefix='.codegen-', dir=outdir)
+        swaps = []  # (package dir, staged new package dir, moved previous package dir or None)
+        try:
+            # Write all files to the staging directory
+            # ----------------------------------------
+            for relpath in self._files:
+                filepath = opath.join(staging_dir, *relpath.split('/'))
+                os.makedirs(opath.dirname(filepath), exist_ok=True)
+                with open(filepath, 'wt') as f:
+                    f.write(self.get_source(relpath))
+
+            # Swap packages into place
+            # ------------------------
+            for package_name in self.package_names:
+                package_dir = opath.join(outdir, package_name)
+                new_dir = opath.join(staging_dir, package_name)
+                old_dir = None
+                if opath.exists(package_dir):
+                    old_dir = opath.join(staging_dir, package_name + '.old')
+                    os.rename(package_dir, old_dir)
+
+                swaps.append((package_dir, new_dir, old_dir))
+                os.rename(new_dir, package_dir)
+        except BaseException:
+            # Move the new packages out and the previous packages back. If that fails too, the
+            # staging directory is kept so that the previous packages aren't lost
+            for package_dir, new_dir, old_dir in reversed(swaps):
+                if not opath.exists(new_dir):
+                    os.rename(package_dir, new_dir)
+                if old_dir is not None:
+                    os.rename(old_dir, package_dir)
+
+            shutil.rmtree(staging_dir)
+            raise
+
+        # Every package is in place, delete the previous packages
+        shutil.rmtree(staging_dir)
@@ -0,0 +1,32 @@
+from collections import OrderedDict
+
+# Transforms property
+# -------------------
+# The plotly schema describes the transform types (filter, groupby, aggregate, sort) in its
+# transforms section, but doesn't list the transforms property of traces. Codegen adds it to every
+# trace type, as a property validated by the generated TransformsValidator
+TRANSFORMS_ATTRIBUTE = {
+    'valType': 'transforms',
+    'role': 'object',
+    'description': 'An array of operations that manipulate the trace data, for example filtering or '
+                   'sorting the data arrays. Transforms are applied by plotly.js, so that changing a '
+                   'transform (e.g. the value of a filter) doesn\'t require sending the data again.'
+}
+
+
+def add_trace_transforms(plotly_schema):
+    """
+    Add the transforms property to the attributes of every trace type of plotly_schema
+
+    Returns
+    -------
+    dict
+        Shallow copy of plotly_schema. The input schema is unchanged
+    """
+    traces = OrderedDict()
+    for trace_name, trace_schema in plotly_schema['traces'].items():
+        attributes = dict(trace_schema['attributes'])
+        attributes.setdefault('transforms', TRANSFORMS_ATTRIBUTE)
+        traces[trace_name] = dict(trace_schema, attributes=attributes)
+
+    return dict(plotly_schema, traces=traces)
@@ -1,28 +1,49 @@
-import importlib
-import inspect
 import textwrap
 from typing import List, Dict
 
 from io import StringIO
 from yapf.yapflib.yapf_api import FormatCode
 
-from ipyplotly.basevalidators import BaseValidator, CompoundValidator, CompoundArrayValidator
+from codegen.profiler import profile_phase
 
 
 def format_source(validator_source):
-    formatted_source, _ = FormatCode(validator_source,
-                                     style_config={'based_on_style': 'google',
-                                                   'DEDENT_CLOSING_BRACKETS': True,
-                                                   'COLUMN_LIMIT': 119})
+    with profile_phase('format'):
+        formatted_source, _ = FormatCode(validator_source,
+                                         style_config={'based_on_style': 'google',
+                                                       'DEDENT_CLOSING_BRACKETS': True,
+                                                       'COLUMN_LIMIT': 119})
     return formatted_source
 
 
+class memoized_property:
+    """
+    Read-only property whose value is computed on first access and then stored on the instance
+
+    Schema nodes are immutable once built, so the properties that are derived from them only
+    need to be computed once
+    """
+    def __init__(self, fget):
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+        self.name = fget.__name__
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        val = self.fget(obj)
+        obj.__dict__[self.name] = val
+        return val
+
+
 custom_validator_datatypes = {
     'layout.image.source': 'ipyplotly.basevalidators.ImageUriValidator',
     'frame.data': 'ipyplotly.validators.DataValidator',
     'frame.layout': 'ipyplotly.validators.LayoutValidator'
 }
 
+
 class PlotlyNode:
 
     # Constructor
@@ -33,18 +54,12 @@ class PlotlyNode:
             node_path = (node_path,)
         self.node_path = node_path
 
-        # Compute children
-        if isinstance(self.node_data, dict):
-            self._children = [self.__class__(self.plotly_schema,
-                                             node_path=self.node_path + (c,),
-                                             parent=self)
-                              for c in self.node_data if c and c[0] != '_']
-        else:
-            self._children = []
-
         # Parent
         self._parent = parent
 
+    def _build_child(self, name):
+        return self.__class__(self.plotly_schema, node_path=self.node_path + (name,), parent=self)
+
     def __repr__(self):
         return self.dir_str
 
@@ -107,6 +122,9 @@ class PlotlyNode:
     def name_base_validator(self) -> str:
         if self.dir_str in custom_validator_datatypes:
             validator_base = f"{custom_validator_datatypes[self.dir_str]}"
+        elif self.datatype == 'transforms':
+            # The transforms of every trace type share the generated validator of all transform types
+            validator_base = 'ipyplotly.validators.TransformsValidator'
         else:
             validator_base = f"ipyplotly.basevalidators.{self.datatype_pascal_case}Validator"
 
@@ -129,52 +147,13 @@ class PlotlyNode:
 
         return buffer.getvalue()
 
-    @property
-    def validator_instance(self) -> BaseValidator:
-
-        module_parts = self.name_base_validator.split('.')
-        module_path = '.'.join(module_parts[:-1])
-        cls_name = module_parts[-1]
-
-        validators_module = importlib.import_module(module_path)
-
-        validator_class_list = [cls
-                                for _, cls in inspect.getmembers(validators_module, inspect.isclass)
-                                if cls.__name__ == cls_name]
-        if not validator_class_list:
-            raise ValueError(f"Unknown base validator '{self.name_base_validator}'")
-
-        validator_class = validator_class_list[0]
-
-        args = dict(plotly_name=self.name_property, parent_name=self.parent_dir_str)
-
-        if validator_class == CompoundValidator:
-            data_class_str = f"<class ipyplotly.datatypes.{self.parent_dir_str}.{self.name_class}>"
-            extra_args = {'data_class': data_class_str, 'data_docs': self.get_constructor_params_docstring()}
-        elif validator_class == CompoundArrayValidator:
-            element_class_str = f"<class ipyplotly.datatypes.{self.parent_dir_str}.{self.name_class}>"
-            extra_args = {'element_class': element_class_str, 'element_docs': self.get_constructor_params_docstring()}
-        else:
-            extra_args = {n.name_undercase: n.node_data for n in self.simple_attrs}
-
-            # Add extra properties
-            if self.datatype == 'color':
-                # Check for colorscale sibling
-                colorscale_node_list = [node for node in self.parent.child_datatypes
-                                        if node.datatype == 'colorscale']
-                if colorscale_node_list:
-                    colorscale_path = colorscale_node_list[0].dir_str
-                    extra_args['colorscale_path'] = repr(colorscale_path)
-
-        return validator_class(**args, **extra_args)
-
     @property
     def name_class(self) -> str:
         return self.name_pascal_case
 
     # Datatypes
     # ---------
-    @property
+    @memoized_property
     def datatype(self) -> str:
         if self.is_array_element:
             return 'compound_array'
@@ -223,7 +202,7 @@ class PlotlyNode:
     def tidy_dir_path(self, p):
         return p
 
-    @property
+    @memoized_property
     def dir_path(self) -> List[str]:
         res = [self.base_name] if self.base_name else []
         for i, p in enumerate(self.node_path):
@@ -237,7 +216,7 @@ class PlotlyNode:
 
     # Node path strings
     # -----------------
-    @property
+    @memoized_property
     def dir_str(self) -> str:
         return '.'.join(self.dir_path)
 
@@ -254,9 +233,27 @@ class PlotlyNode:
 
     # Children
     # --------
-    @property
+    @memoized_property
     def children(self) -> List['PlotlyNode']:
-        return self._children
+        if isinstance(self.node_data, dict):
+            return [self._build_child(c) for c in self.node_data if c and c[0] != '_']
+        else:
+            return []
+
+    @memoized_property
+    def _children_by_name(self) -> Dict[str, 'PlotlyNode']:
+        return {n.node_path[-1]: n for n in self.children}
+
+    def get_child(self, name) -> 'PlotlyNode':
+        """
+        Get the child node with the schema key name
+
+        Raises
+        ------
+        KeyError
+            If this node has no child named name
+        """
+        return self._children_by_name[name]
 
     @property
     def simple_attrs(self) -> List['PlotlyNode']:
@@ -269,7 +266,7 @@ class PlotlyNode:
     def parent(self) -> 'PlotlyNode':
         return self._parent
 
-    @property
+    @memoized_property
     def child_datatypes(self) -> List['PlotlyNode']:
         """
         Returns
@@ -289,24 +286,27 @@ class PlotlyNode:
 
         return nodes
 
-    @property
+    @memoized_property
     def child_compound_datatypes(self) -> List['PlotlyNode']:
         return [n for n in self.child_datatypes if n.is_compound]
 
-    @property
+    @memoized_property
     def child_simple_datatypes(self) -> List['PlotlyNode']:
         return [n for n in self.child_datatypes if n.is_simple]
 
-    @property
+    @memoized_property
     def child_literals(self) -> List['PlotlyNode']:
         return [n for n in self.children if n.is_literal]
 
     # Static helpers
     # --------------
     @staticmethod
-    def get_all_compound_datatype_nodes(plotly_schema, node_class) -> List['PlotlyNode']:
+    def get_all_compound_datatype_nodes(plotly_schema, node_class,
+                                        schema_index=None) -> List['PlotlyNode']:
+        schema_index = schema_index or PlotlySchemaIndex(plotly_schema)
+
         nodes = []
-        nodes_to_process = [node_class(plotly_schema)]
+        nodes_to_process = [schema_index.get_node(node_class)]
 
         while nodes_to_process:
             node = nodes_to_process.pop()
@@ -319,11 +319,12 @@ class PlotlyNode:
         return nodes
 
     @staticmethod
-    def get_all_trace_layout_nodes(plotly_schema) -> Dict[str, 'LayoutNode']:
+    def get_all_trace_layout_nodes(plotly_schema, schema_index=None) -> Dict[str, 'LayoutNode']:
+        schema_index = schema_index or PlotlySchemaIndex(plotly_schema)
         trace_names = plotly_schema['traces'].keys()
 
         datatype_nodes = {}
-        nodes_to_process = [TraceLayoutNode(plotly_schema, trace_name)
+        nodes_to_process = [schema_index.get_node(TraceLayoutNode, trace_name=trace_name)
                             for trace_name in trace_names]
 
         while nodes_to_process:
@@ -354,7 +355,7 @@ class TraceNode(PlotlyNode):
 
     # Raw data
     # --------
-    @property
+    @memoized_property
     def node_data(self) -> dict:
         if not self.node_path:
             node_data = self.plotly_schema['traces']
@@ -423,7 +424,7 @@ class LayoutNode(PlotlyNode):
 
     # Raw data
     # --------
-    @property
+    @memoized_property
     def node_data(self) -> dict:
         node_data = self.plotly_schema['layout']
         for prop_name in self.node_path:
@@ -459,7 +460,7 @@ class TraceLayoutNode(LayoutNode):
 
     # Raw data
     # --------
-    @property
+    @memoized_property
     def node_data(self) -> dict:
         try:
             node_data = (self.plotly_schema['traces']
@@ -512,10 +513,121 @@ class FrameNode(PlotlyNode):
 
     # Raw data
     # --------
-    @property
+    @memoized_property
     def node_data(self) -> dict:
         node_data = self.plotly_schema['frames']
         for prop_name in self.node_path:
             node_data = node_data[prop_name]
 
         return node_data
+
+
+class TransformNode(PlotlyNode):
+
+    # Constructor
+    # -----------
+    def __init__(self, plotly_schema, node_path=(), parent=None):
+        super().__init__(plotly_schema, node_path, parent)
+
+    @property
+    def base_datatype_class(self):
+        # Transforms are properties of traces, and are restyled through them
+        return 'BaseTraceHierarchyType'
+
+    @property
+    def base_name(self):
+        return 'transform'
+
+    @property
+    def name_property(self) -> str:
+        # Transform objects are the elements of the transforms property of traces
+        if len(self.node_path) == 1:
+            return 'transforms'
+        else:
+            return super().name_property
+
+    # Raw data
+    # --------
+    @memoized_property
+    def node_data(self) -> dict:
+        if not self.node_path:
+            # Transforms without attributes (e.g. ohlc) are internal to plotly.js
+            node_data = {transform_name: transform for transform_name, transform
+                         in self.plotly_schema['transforms'].items() if transform['attributes']}
+        else:
+            # Transforms are identified by a read-only type literal, like traces
+            node_data = dict(self.plotly_schema['transforms'][self.node_path[0]]['attributes'],
+                             type=self.node_path[0])
+            for prop_name in self.node_path[1:]:
+                node_data = node_data[prop_name]
+
+        return node_data
+
+    # Description
+    # -----------
+    @property
+    def description(self) -> str:
+        if len(self.node_path) < 2:
+            desc = ''
+        else:
+            desc = self.node_data.get('description', '')
+
+        if isinstance(desc, list):
+            desc = ''.join(desc)
+
+        return desc
+
+
+class PlotlySchemaIndex:
+    """
+    Index of the nodes of a plotly schema
+
+    Nodes are built lazily, the first time they (or one of their descendants) are looked up, and
+    are then cached by path. Each node is built once, so repeated lookups are O(1) and share the
+    properties memoized on the node.
+    """
+    def __init__(self, plotly_schema):
+        self.plotly_schema = plotly_schema
+        self._nodes = {}  # type: Dict[tuple, PlotlyNode]
+
+    def get_node(self, node_class, node_path=(), trace_name=None) -> PlotlyNode:
+        """
+        Get the node of type node_class at node_path
+
+        Parameters
+        ----------
+        node_class : type
+            PlotlyNode subclass (e.g. TraceNode or LayoutNode)
+        node_path : tuple of str
+            Path of the node below the root node of node_class
+        trace_name : str or None
+            Name of the trace (TraceLayoutNode only)
+
+        Returns
+        -------
+        PlotlyNode
+
+        Raises
+        ------
+        KeyError
+            If there is no node at node_path
+        """
+        if isinstance(node_path, str):
+            node_path = (node_path,)
+        node_path = tuple(node_path)
+
+        key = (node_class, trace_name, node_path)
+        node = self._nodes.get(key, None)
+        if node is None:
+            if not node_path:
+                if node_class is TraceLayoutNode:
+                    node = TraceLayoutNode(self.plotly_schema, trace_name)
+                else:
+                    node = node_class(self.plotly_schema)
+            else:
+                parent = self.get_node(node_class, node_path[:-1], trace_name)
+                node = parent.get_child(node_path[-1])
+
+            self._nodes[key] = node
+
+        return node
@@ -1,35 +1,118 @@
-import os
-import os.path as opath
-import shutil
+from collections import OrderedDict
 from io import StringIO
 from typing import Dict
 
-from codegen.utils import format_source, PlotlyNode, TraceNode
+from codegen.profiler import profile_phase
+from codegen.specialized import build_validate_coerce_py
+from codegen.staging import StagedOutputTree
+from codegen.utils import format_source, PlotlyNode, TraceNode, TransformNode
 
-def build_validators_py(parent_node: PlotlyNode,
-                        extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+def get_validator_module_name(datatype_node: PlotlyNode):
+    """
+    Name of the module of the validator class of datatype_node (e.g. '_marker')
+    """
+    return '_' + datatype_node.name_property
 
-    extra_subtype_nodes = [node for node_name, node in
-                           extra_nodes.items() if
-                           parent_node.dir_str and node_name.startswith(parent_node.dir_str)]
 
-    datatype_nodes = parent_node.child_datatypes + extra_subtype_nodes
+def get_validator_options(datatype_node: PlotlyNode, colorscale_path=None):
+    """
+    Get the options of the validator of a simple property, other than plotly_name and parent_name
 
-    if not datatype_nodes:
-        return None
+    Returns
+    -------
+    dict
+        Dict from validator constructor parameter name to value (e.g. {'min': 0, 'array_ok': True})
+    """
+    assert datatype_node.is_simple
+
+    # Exclude general properties
+    excluded_props = ['valType', 'description', 'role', 'dflt']
+    if datatype_node.datatype == 'subplotid':
+        # Default is required for subplotid validator
+        excluded_props.remove('dflt')
+
+    attr_nodes = [n for n in datatype_node.simple_attrs
+                  if n.plotly_name not in excluded_props]
+
+    attr_dict = {node.name_undercase: node.node_data for node in attr_nodes}
+
+    # Add special properties
+    if datatype_node.datatype == 'color' and colorscale_path:
+        attr_dict['colorscale_path'] = colorscale_path
 
+    return attr_dict
+
+
+def build_validator_py(datatype_node: PlotlyNode, colorscale_path=None):
+    """
+    Build the source code of the module of a single validator class
+
+    Validators of simple properties override validate_coerce with a method that is specialized for
+    the schema options of the property (see codegen/specialized.py)
+    """
     buffer = StringIO()
+    validate_coerce_py = ''
 
     # Imports
     # -------
-    # Compute needed imports
-    import_strs = set()
-    for datatype_node in datatype_nodes:
-        module_str = '.'.join(datatype_node.name_base_validator.split('.')[:-1])
-        import_strs.add(module_str)
+    module_str = '.'.join(datatype_node.name_base_validator.split('.')[:-1])
+    buffer.write(f'import {module_str}\n')
+
+    # Class definition
+    # ----------------
+    parent_dir_str = datatype_node.parent_dir_str if datatype_node.parent_dir_str else 'figure'
+    buffer.write(f"""
+
+class {datatype_node.name_validator}({datatype_node.name_base_validator}):
+    def __init__(self, plotly_name='{datatype_node.name_property}', parent_name='{parent_dir_str}'):""")
+
+    # Add import
+    if datatype_node.is_compound:
+        datatypes_pkg_str = ''.join('.' + p for p in datatype_node.dir_path[:-1])
+        buffer.write(f"""
+        from ipyplotly.datatypes{datatypes_pkg_str} import {datatype_node.name_pascal_case}""")
+
+    buffer.write(f"""
+        super().__init__(plotly_name=plotly_name,
+                         parent_name=parent_name""")
+
+    # The docs of compound validators are loaded from the docs resources on first use
+    if datatype_node.is_array_element:
+        buffer.write(f""",
+                         element_class={datatype_node.name_class}""")
+    elif datatype_node.is_compound:
+        buffer.write(f""",
+                         data_class={datatype_node.name_class}""")
+    else:
+        attr_dict = get_validator_options(datatype_node, colorscale_path)
+
+        for attr_name, attr_val in attr_dict.items():
+            buffer.write(f""",
+                         {attr_name}={attr_val!r}""")
+
+        validate_coerce_py = build_validate_coerce_py(datatype_node.name_base_validator, attr_dict)
+
+    buffer.write(')\n')
+    buffer.write(validate_coerce_py)
+
+    return buffer.getvalue()
 
-    for import_str in import_strs:
-        buffer.write(f'import {import_str}\n')
+
+def get_validator_nodes(parent_node: PlotlyNode, extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Get the nodes of the validators of the children of parent_node
+
+    Returns
+    -------
+    (list of PlotlyNode, str or None)
+        The child datatype nodes, and the path of the colorscale among them, if any (used by
+        color validators)
+    """
+    extra_subtype_nodes = [node for node_name, node in
+                           extra_nodes.items() if
+                           parent_node.dir_str and node_name.startswith(parent_node.dir_str)]
+
+    datatype_nodes = parent_node.child_datatypes + extra_subtype_nodes
 
     # Check for colorscale node
     # -------------------------
@@ -39,131 +122,238 @@ def build_validators_py(parent_node: PlotlyNode,
     else:
         colorscale_path = None
 
-        # Compound datatypes loop
-    # -----------------------
-    for datatype_node in datatype_nodes:
-
-        parent_dir_str = datatype_node.parent_dir_str if datatype_node.parent_dir_str else 'figure'
-        buffer.write(f"""
-        
-class {datatype_node.name_validator}({datatype_node.name_base_validator}):
-    def __init__(self, plotly_name='{datatype_node.name_property}', parent_name='{parent_dir_str}'):""")
+    return datatype_nodes, colorscale_path
 
-        # Add import
-        if datatype_node.is_compound:
-            buffer.write(f"""
-        from ipyplotly.datatypes{parent_node.pkg_str} import {datatype_node.name_pascal_case}""")
 
-        buffer.write(f"""
-        super().__init__(plotly_name=plotly_name,
-                         parent_name=parent_name""")
+def build_validators_py(parent_node: PlotlyNode,
+                        extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the source code of the validator modules of the children of parent_node
+
+    Returns
+    -------
+    OrderedDict
+        Dict from module name (e.g. '_marker') to module source code. Empty if parent_node
+        has no child datatypes
+    """
+    datatype_nodes, colorscale_path = get_validator_nodes(parent_node, extra_nodes)
+
+    # Validator modules loop
+    # ----------------------
+    return OrderedDict([(get_validator_module_name(datatype_node),
+                         build_validator_py(datatype_node, colorscale_path))
+                        for datatype_node in datatype_nodes])
+
+
+def format_validators_py(node: PlotlyNode,
+                         extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build and format the source code of the validator modules of the children of node
+
+    Returns
+    -------
+    OrderedDict
+        Dict from module name to formatted module source code
+    """
+    # Generate source code
+    # --------------------
+    with profile_phase('build'):
+        validator_sources = build_validators_py(node, extra_nodes)
+
+    return OrderedDict([(module_name, format_source(validator_source))
+                        for module_name, validator_source in validator_sources.items()])
+
+
+# Validator tables
+# ----------------
+# Alternative to generating one module and class per validator: the validators of the children
+# of a node are described by a single table module, and their classes are built from the table
+# on first use (see ipyplotly.importers.validator_table)
+VALIDATOR_TABLE_MODULE = '_validators'
+
+
+def get_validator_table_entry(datatype_node: PlotlyNode, colorscale_path=None):
+    """
+    Get the validator table entry of datatype_node
+
+    Returns
+    -------
+    (str, (str, str, str, dict))
+        (validator class name, (plotly name, parent name, base validator, options)). Base
+        validators from ipyplotly.basevalidators are referred to by class name, others by full
+        name. The datatype classes of compound validators are referred to by full name
+    """
+    parent_dir_str = datatype_node.parent_dir_str if datatype_node.parent_dir_str else 'figure'
+
+    base_validator = datatype_node.name_base_validator
+    if base_validator.startswith('ipyplotly.basevalidators.'):
+        base_validator = base_validator.rsplit('.', 1)[1]
+
+    if datatype_node.is_compound:
+        datatype_class = '.'.join(['ipyplotly.datatypes'] + datatype_node.dir_path[:-1] + [datatype_node.name_class])
+        class_option = 'element_class' if datatype_node.is_array_element else 'data_class'
+        options = {class_option: datatype_class}
+    else:
+        options = get_validator_options(datatype_node, colorscale_path)
 
-        if datatype_node.is_array_element:
-            buffer.write(f""",
-                         element_class={datatype_node.name_class},
-                         element_docs=\"\"\"{datatype_node.get_constructor_params_docstring()}\"\"\"""")
-        elif datatype_node.is_compound:
-            buffer.write(f""",
-                         data_class={datatype_node.name_class},
-                         data_docs=\"\"\"{datatype_node.get_constructor_params_docstring()}\"\"\"""")
-        else:
-            assert datatype_node.is_simple
+    return (datatype_node.name_validator,
+            (datatype_node.name_property, parent_dir_str, base_validator, options))
 
-            # Exclude general properties
-            excluded_props = ['valType', 'description', 'role', 'dflt']
-            if datatype_node.datatype == 'subplotid':
-                # Default is required for subplotid validator
-                excluded_props.remove('dflt')
 
-            attr_nodes = [n for n in datatype_node.simple_attrs
-                          if n.plotly_name not in excluded_props]
+def build_validator_table_py(parent_node: PlotlyNode,
+                             extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the source code of the validator table module of the children of parent_node
 
-            attr_dict = {node.name_undercase: repr(node.node_data) for node in attr_nodes}
+    The table is written one entry per line, so it isn't passed through yapf
 
-            # Add special properties
-            if datatype_node.datatype == 'color' and colorscale_path:
-                attr_dict['colorscale_path'] = repr(colorscale_path)
+    Returns
+    -------
+    str
+        Module source code. Empty if parent_node has no child datatypes
+    """
+    datatype_nodes, colorscale_path = get_validator_nodes(parent_node, extra_nodes)
+    if not datatype_nodes:
+        return ''
 
-            for attr_name, attr_val in attr_dict.items():
-                buffer.write(f""",
-                         {attr_name}={attr_val}""")
+    entries = [get_validator_table_entry(datatype_node, colorscale_path) for datatype_node in datatype_nodes]
 
-        buffer.write(')')
+    buffer = StringIO()
+    buffer.write('from ipyplotly.importers import validator_table\n\n'
+                 '# Classes are built from the table on first access\n'
+                 '__all__ = [\n')
+    buffer.write(''.join(f'    {class_name!r},\n' for class_name, _ in entries))
+    buffer.write(']\n\n'
+                 '# (class name: (plotly name, parent name, base validator, options))\n'
+                 '__getattr__, __dir__ = validator_table(__name__, {\n')
+    buffer.write(''.join(f'    {class_name!r}: {entry!r},\n' for class_name, entry in entries))
+    buffer.write('})\n')
 
     return buffer.getvalue()
 
 
-def write_validator_py(outdir,
+def format_validator_tables_py(node: PlotlyNode,
+                               extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+    """
+    Build the source code of the validator table module of the children of node
+
+    The figure-level validators (layout and frames) are written by separate codegen tasks into
+    the same package, so they keep their class modules
+
+    Returns
+    -------
+    OrderedDict
+        Dict from module name to module source code, with at most one entry
+    """
+    if not node.dir_path:
+        return format_validators_py(node, extra_nodes)
+
+    with profile_phase('build'):
+        table_source = build_validator_table_py(node, extra_nodes)
+
+    return OrderedDict([(VALIDATOR_TABLE_MODULE, table_source)] if table_source else [])
+
+
+def write_validator_py(output_tree: StagedOutputTree,
                        node: PlotlyNode,
-                       extra_nodes: Dict[str, 'PlotlyNode'] = {}):
+                       extra_nodes: Dict[str, 'PlotlyNode'] = {},
+                       formatted_sources=None):
 
     # Generate source code
     # --------------------
-    validator_source = build_validators_py(node, extra_nodes)
-    if validator_source:
-        try:
-            formatted_source = format_source(validator_source)
-        except Exception as e:
-            print(validator_source)
-            raise e
-
-        # Write file
-        # ----------
-        filedir = opath.join(outdir, 'validators', *node.dir_path)
-        os.makedirs(filedir, exist_ok=True)
-        filepath = opath.join(filedir, '__init__.py')
-
-        mode = 'at' if os.path.exists(filepath) else 'wt'
-        with open(filepath, mode) as f:
-            if mode == 'at':
-                f.write("\n\n")
-            f.write(formatted_source)
-            f.flush()
-            os.fsync(f.fileno())
+    if formatted_sources is None:
+        formatted_sources = format_validators_py(node, extra_nodes)
+
+    # Write files
+    # -----------
+    for module_name, formatted_source in formatted_sources.items():
+        relpath = '/'.join(['validators', *node.dir_path, module_name + '.py'])
+        output_tree.append_source(formatted_source, relpath)
 
 
 def build_traces_validator_py(base_node: TraceNode):
     tracetype_nodes = base_node.child_compound_datatypes
     buffer = StringIO()
 
-    import_csv = ', '.join([tracetype_node.name_class for tracetype_node in tracetype_nodes])
+    buffer.write(f"""import ipyplotly.basevalidators
+
 
-    buffer.write(f"""
 class DataValidator(ipyplotly.basevalidators.BaseDataValidator):
 
     def __init__(self, plotly_name='data', parent_name='figure'):
-        from ipyplotly.datatypes.trace import ({import_csv})
-        super().__init__(class_map={{
+        super().__init__(class_strs_map={{
     """)
 
     for i, tracetype_node in enumerate(tracetype_nodes):
         sfx = ',' if i < len(tracetype_nodes) else ''
 
         buffer.write(f"""
-            '{tracetype_node.name_property}': {tracetype_node.name_class}{sfx}""")
+            '{tracetype_node.name_property}': '{tracetype_node.name_class}'{sfx}""")
 
     buffer.write("""
         },
         plotly_name=plotly_name,
-        parent_name=parent_name)""")
+        parent_name=parent_name)
+""")
 
     return buffer.getvalue()
 
 
-def append_traces_validator_py(outdir, base_node: TraceNode):
+def append_traces_validator_py(output_tree: StagedOutputTree, base_node: TraceNode, formatted_source=None):
 
     if base_node.node_path:
         raise ValueError('Expected root trace node. Received node with path "%s"' % base_node.dir_str)
 
-    source = build_traces_validator_py(base_node)
-    formatted_source = format_source(source)
+    if formatted_source is None:
+        with profile_phase('build'):
+            source = build_traces_validator_py(base_node)
+        formatted_source = format_source(source)
+
+    # Write file
+    # ----------
+    output_tree.append_source(formatted_source, 'validators/_data.py')
+
+    return formatted_source
+
+
+def build_transforms_validator_py(base_node: TransformNode):
+    transform_nodes = base_node.child_compound_datatypes
+    buffer = StringIO()
+
+    buffer.write(f"""import ipyplotly.basevalidators
+
+
+class TransformsValidator(ipyplotly.basevalidators.BaseTransformsValidator):
+
+    def __init__(self, plotly_name='transforms', parent_name='trace'):
+        super().__init__(class_strs_map={{
+    """)
+
+    for transform_node in transform_nodes:
+        buffer.write(f"""
+            '{transform_node.plotly_name}': '{transform_node.name_class}',""")
+
+    buffer.write("""
+        },
+        plotly_name=plotly_name,
+        parent_name=parent_name)
+""")
+
+    return buffer.getvalue()
+
+
+def append_transforms_validator_py(output_tree: StagedOutputTree, base_node: TransformNode, formatted_source=None):
+
+    if base_node.node_path:
+        raise ValueError('Expected root transform node. Received node with path "%s"' % base_node.dir_str)
+
+    if formatted_source is None:
+        with profile_phase('build'):
+            source = build_transforms_validator_py(base_node)
+        formatted_source = format_source(source)
 
-    # Append to file
-    # --------------
-    filepath = opath.join(outdir, '__init__.py')
+    # Write file
+    # ----------
+    output_tree.append_source(formatted_source, 'validators/_transforms.py')
 
-    with open(filepath, 'a') as f:
-        f.write('\n\n')
-        f.write(formatted_source)
-        f.flush()
-        os.fsync(f.fileno())
+    return formatted_source
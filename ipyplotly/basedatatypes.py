@@ -2,10 +2,12 @@ import collections
 import numbers
 import os
 import re
+import textwrap
 import typing as typ
 import uuid
 from contextlib import contextmanager
 from copy import deepcopy
+from types import MappingProxyType
 from importlib import import_module
 from pprint import pprint
 from urllib import parse
@@ -15,14 +17,34 @@ from plotly.offline import plot as plotlypy_plot
 from traitlets import Undefined
 
 from ipyplotly import animation
-from ipyplotly.basevalidators import CompoundValidator, CompoundArrayValidator, BaseDataValidator
+from ipyplotly.basevalidators import (CompoundValidator, CompoundArrayValidator, BaseTypedArrayValidator,
+                                      BaseDataValidator, deepcopy_props, is_arrow_table)
 from ipyplotly.callbacks import Points, BoxSelector, LassoSelector, InputState
+from ipyplotly.lazydocs import get_constructor_doc, get_prop_descriptions, load_docs, doc_property
+from ipyplotly.propertypaths import get_property_path_table, PropertyPathTable, COMPOUND, COMPOUND_ARRAY
 from ipyplotly.validators.layout import (XaxisValidator, YaxisValidator, GeoValidator,
                                          TernaryValidator, SceneValidator)
 
 
 class BaseFigure:
 
+    # Docstrings
+    # ----------
+    @classmethod
+    def _build_docstring(cls):
+        from ipyplotly.validators import DataValidator, LayoutValidator, FramesValidator
+
+        param_docs = []
+        for param, validator in [('data', DataValidator()),
+                                 ('layout', LayoutValidator()),
+                                 ('frames', FramesValidator())]:
+            validator_description = textwrap.dedent(validator.description()).strip()
+            param_docs.append(param + '\n' + textwrap.indent(validator_description, ' ' * 4))
+
+        return (f'Create a new {cls.__name__} instance\n\n'
+                f'Parameters\n'
+                f'----------\n' + '\n'.join(param_docs))
+
     # Constructor
     # -----------
     def __init__(self, data=None, layout_plotly=None, frames=None):
@@ -44,7 +66,7 @@ class BaseFigure:
 
             self._data_objs = data
             self._data_defaults = [{} for trace in data]
-            self._data = [deepcopy(trace._props) for trace in data]
+            self._data = [deepcopy_props(trace._props) for trace in data]
             for trace in data:
                 trace._orphan_props.clear()
                 trace._parent = self
@@ -260,15 +282,28 @@ class BaseFigure:
         if not isinstance(trace_indexes, list):
             trace_indexes = [trace_indexes]
 
-        restyle_data = {}  # Resytyle data to send to JS side as Plotly.restylePlot()
+        validated_style = self._validate_restyle_dict(style, trace_indexes)
+        return self._apply_restyle_dict(validated_style, trace_indexes)
 
+    def _validate_restyle_dict(self, style, trace_indexes):
+        """
+        Validate every value of a restyle operation before any of them is applied, so that an
+        invalid value leaves the figure unchanged
+
+        Returns
+        -------
+        dict
+            Dict from key to the list of validated values of the traces in trace_indexes.
+            Keys with leading underscores are passed through as-is
+        """
+        validated_style = {}
         for raw_key, v in style.items():
             # kstr may have periods. e.g. foo.bar
             key_path = self._str_to_dict_path(raw_key)
 
             # Properties with leading underscores passed through as-is
             if raw_key.startswith('_'):
-                restyle_data[raw_key] = v
+                validated_style[raw_key] = v
                 continue
 
             if not isinstance(v, list):
@@ -278,48 +313,76 @@ class BaseFigure:
                 raise ValueError('Restyling objects not supported, only individual properties\n'
                                  '    Received: {{k}: {v}}'.format(k=raw_key, v=v))
             else:
-                restyle_msg_vs = []
-                any_vals_changed = False
+                trace_vs = []
                 for i, trace_ind in enumerate(trace_indexes):
                     if trace_ind >= len(self._data):
                         raise ValueError('Trace index {trace_ind} out of range'.format(trace_ind=trace_ind))
-                    val_parent = self._data[trace_ind]
-                    for kp, key_path_el in enumerate(key_path[:-1]):
+                    path_table = get_property_path_table(
+                        'ipyplotly.validators.trace.' + self.data[trace_ind].plotly_name)
 
-                        # Extend val_parent list if needed
-                        if isinstance(val_parent, list) and isinstance(key_path_el, int):
-                            while len(val_parent) <= key_path_el:
-                                val_parent.append(None)
+                    trace_v = v[i % len(v)]
+                    if key_path[0] == 'transforms' and len(key_path) > 2:
+                        # Property of a single transform (e.g. transforms[0].value)
+                        trace_v = self._validate_transform_path_value(
+                            path_table, raw_key, key_path, trace_v, self._data[trace_ind])
+                    else:
+                        trace_v = self._validate_path_value(path_table, raw_key, key_path, trace_v)
 
-                        elif isinstance(val_parent, dict) and key_path_el not in val_parent:
-                            if isinstance(key_path[kp + 1], int):
-                                val_parent[key_path_el] = []
-                            else:
-                                val_parent[key_path_el] = {}
+                    trace_vs.append(trace_v)
 
-                        val_parent = val_parent[key_path_el]
+                validated_style[raw_key] = trace_vs
 
-                    last_key = key_path[-1]
+        return validated_style
 
-                    trace_v = v[i % len(v)]
+    def _apply_restyle_dict(self, validated_style, trace_indexes):
+        restyle_data = {}  # Resytyle data to send to JS side as Plotly.restylePlot()
+
+        for raw_key, trace_vs in validated_style.items():
+            # Properties with leading underscores passed through as-is
+            if raw_key.startswith('_'):
+                restyle_data[raw_key] = trace_vs
+                continue
+
+            key_path = self._str_to_dict_path(raw_key)
+
+            restyle_msg_vs = []
+            any_vals_changed = False
+            for trace_ind, trace_v in zip(trace_indexes, trace_vs):
+                val_parent = self._data[trace_ind]
+                for kp, key_path_el in enumerate(key_path[:-1]):
+
+                    # Extend val_parent list if needed
+                    if isinstance(val_parent, list) and isinstance(key_path_el, int):
+                        while len(val_parent) <= key_path_el:
+                            val_parent.append({})
+
+                    elif isinstance(val_parent, dict) and key_path_el not in val_parent:
+                        if isinstance(key_path[kp + 1], int):
+                            val_parent[key_path_el] = []
+                        else:
+                            val_parent[key_path_el] = {}
 
-                    restyle_msg_vs.append(trace_v)
+                    val_parent = val_parent[key_path_el]
 
-                    if BasePlotlyType._vals_equal(trace_v, Undefined):
-                        # Do nothing
-                        pass
-                    elif trace_v is None:
-                        if isinstance(val_parent, dict) and last_key in val_parent:
-                            val_parent.pop(last_key)
-                            any_vals_changed = True
-                    elif isinstance(val_parent, dict):
-                        if last_key not in val_parent or not BasePlotlyType._vals_equal(val_parent[last_key], trace_v):
-                            val_parent[last_key] = trace_v
-                            any_vals_changed = True
+                last_key = key_path[-1]
 
-                if any_vals_changed:
-                    # At lease one of the values for one of the traces has changed. Update them all
-                    restyle_data[raw_key] = restyle_msg_vs
+                restyle_msg_vs.append(trace_v)
+
+                if BasePlotlyType._vals_equal(trace_v, Undefined):
+                    # Do nothing
+                    pass
+                elif trace_v is None:
+                    if isinstance(val_parent, dict) and last_key in val_parent:
+                        val_parent.pop(last_key)
+                        any_vals_changed = True
+                elif isinstance(val_parent, dict):
+                    if last_key not in val_parent or not BasePlotlyType._vals_equal(val_parent[last_key], trace_v):
+                        val_parent[last_key] = trace_v
+                        any_vals_changed = True
+
+            if any_vals_changed:
+                # At lease one of the values for one of the traces has changed. Update them all
+                restyle_data[raw_key] = restyle_msg_vs
 
         return restyle_data
 
@@ -427,7 +490,7 @@ class BaseFigure:
         data = self._data_validator.validate_coerce(data)
 
         # Make deep copy of trace data (Optimize later if needed)
-        new_traces_data = [deepcopy(trace._props) for trace in data]
+        new_traces_data = [deepcopy_props(trace._props) for trace in data]
 
         # Update trace parent
         for trace in data:
@@ -464,6 +527,59 @@ class BaseFigure:
 
         return data
 
+    def add_traces_from_dataframe(self, df, x=None, y=None, trace_type='scatter', **kwargs):
+        """
+        Add one trace per column of the pandas DataFrame or pyarrow Table df
+
+        Columns are validated as pandas or Arrow arrays, without a round trip through lists (see
+        ipyplotly.basevalidators.to_numpy_array)
+
+        Parameters
+        ----------
+        df : pandas.DataFrame or pyarrow.Table
+        x : str or None
+            Name of the column with the x coordinates of the traces, or None to use the index of df
+            (Arrow tables have no index, their traces get the default x coordinates)
+        y : str, list of str, or None
+            Names of the columns with the y coordinates of the traces, one trace per column. If
+            None, all columns other than x
+        trace_type : str
+            Type of the traces (e.g. 'scatter' or 'bar')
+        **kwargs
+            Properties of every trace (e.g. mode='lines'). Traces are named after their y column
+            unless a name is given
+
+        Returns
+        -------
+        tuple of BaseTraceType
+            The new traces
+        """
+        if trace_type not in self._data_validator.class_strs_map:
+            raise ValueError('Invalid trace type: {trace_type!r}'.format(trace_type=trace_type))
+
+        trace_class = self._data_validator.get_class(trace_type)
+
+        if is_arrow_table(df):
+            columns = df.column_names
+            x_values = None if x is None else df.column(x)
+        else:
+            columns = df.columns
+            x_values = df.index if x is None else df[x]
+
+        if y is None:
+            y = [column for column in columns if column != x]
+        elif isinstance(y, str):
+            y = [y]
+
+        traces = []
+        for column in y:
+            trace_kwargs = {'name': str(column)}
+            trace_kwargs.update(kwargs)
+            y_values = df.column(column) if is_arrow_table(df) else df[column]
+            traces.append(trace_class(x=x_values, y=y_values, **trace_kwargs))
+
+        return self.add_traces(traces)
+
     def _get_child_props(self, child):
         try:
             trace_index = self.data.index(child)
@@ -552,22 +668,50 @@ class BaseFigure:
             self._send_relayout_msg(relayout_msg)
 
     def _perform_relayout_dict(self, relayout_data):
+        validated_data = self._validate_relayout_dict(relayout_data)
+        return self._apply_relayout_dict(validated_data)
+
+    def _validate_relayout_dict(self, relayout_data):
+        """
+        Validate every value of a relayout operation before any of them is applied, so that an
+        invalid value leaves the figure unchanged
+
+        Returns
+        -------
+        dict
+            Dict from key to validated value. Keys with leading underscores are passed through as-is
+        """
+        path_table = get_property_path_table('ipyplotly.validators.layout')
+
+        validated_data = {}
+        for raw_key, v in relayout_data.items():
+            # Properties with leading underscores passed through as-is
+            if not (isinstance(raw_key, str) and raw_key.startswith('_')):
+                # kstr may have periods. e.g. foo.bar
+                key_path = self._str_to_dict_path(raw_key)
+                v = self._validate_path_value(path_table, raw_key, key_path, v)
+
+            validated_data[raw_key] = v
+
+        return validated_data
+
+    def _apply_relayout_dict(self, validated_data):
         relayout_msg = {}  # relayout data to send to JS side as Plotly.relayout()
 
         # Update layout_data
         # print('_perform_relayout')
-        for raw_key, v in relayout_data.items():
+        for raw_key, v in validated_data.items():
             # kstr may have periods. e.g. foo.bar
             key_path = self._str_to_dict_path(raw_key)
 
             val_parent = self._layout
             for kp, key_path_el in enumerate(key_path[:-1]):
-                if key_path_el not in val_parent:
+                if isinstance(val_parent, list) or key_path_el not in val_parent:
 
                     # Extend val_parent list if needed
                     if isinstance(val_parent, list) and isinstance(key_path_el, int):
                         while len(val_parent) <= key_path_el:
-                            val_parent.append(None)
+                            val_parent.append({})
 
                     elif isinstance(val_parent, dict) and key_path_el not in val_parent:
                         if isinstance(key_path[kp+1], int):
@@ -696,8 +840,13 @@ class BaseFigure:
         if not isinstance(trace_indexes, (list, tuple)):
             trace_indexes = [trace_indexes]
 
-        relayout_msg = self._perform_relayout_dict(layout)
-        restyle_msg = self._perform_restyle_dict(style, trace_indexes)
+        # Validate both portions before applying either, so that an invalid value leaves the
+        # figure unchanged
+        validated_layout = self._validate_relayout_dict(layout)
+        validated_style = self._validate_restyle_dict(style, list(trace_indexes))
+
+        relayout_msg = self._apply_relayout_dict(validated_layout)
+        restyle_msg = self._apply_restyle_dict(validated_style, list(trace_indexes))
         # print(style, trace_indexes, restyle_msg)
         # pprint(self._traces_data)
         return restyle_msg, relayout_msg, trace_indexes
@@ -782,10 +931,13 @@ class BaseFigure:
         return style, layout, trace_indexes
 
     def _send_batch_update(self):
-        style, layout, trace_indexes = self._build_update_params_from_batch()
-        self.update(style=style, layout=layout, trace_indexes=trace_indexes)
-        self._batch_layout_commands.clear()
-        self._batch_style_commands.clear()
+        try:
+            style, layout, trace_indexes = self._build_update_params_from_batch()
+            self.update(style=style, layout=layout, trace_indexes=trace_indexes)
+        finally:
+            # Clear batched commands, even if they are invalid, so that they don't fail later batches
+            self._batch_layout_commands.clear()
+            self._batch_style_commands.clear()
 
     @contextmanager
     def batch_animate(self, duration=500, easing="cubic-in-out"):
@@ -856,38 +1008,37 @@ class BaseFigure:
                      'frame': {'duration': duration}})
 
     def _send_batch_animate(self, animation_opts):
+        try:
+            # Apply commands to internal dictionaries as an update
+            # ----------------------------------------------------
+            style, layout, trace_indexes = self._build_update_params_from_batch()
+            restyle_msg, relayout_msg, trace_indexes = self._perform_update_dict(style, layout, trace_indexes)
+
+            # ### Perform restyle portion of animate ###
+            if restyle_msg:
+                self._dispatch_change_callbacks_restyle(restyle_msg, trace_indexes)
+
+            # ### Perform relayout portion of update ###
+            if relayout_msg:
+                self._dispatch_change_callbacks_relayout(relayout_msg)
+
+            # Convert style / trace_indexes into animate form
+            # -----------------------------------------------
+            if self._batch_style_commands:
+                animate_styles, animate_trace_indexes = zip(*[
+                    (trace_style, trace_index) for trace_index, trace_style in self._batch_style_commands.items()])
+            else:
+                animate_styles, animate_trace_indexes = {}, []
 
-        # Apply commands to internal dictionaries as an update
-        # ----------------------------------------------------
-        style, layout, trace_indexes = self._build_update_params_from_batch()
-        restyle_msg, relayout_msg, trace_indexes = self._perform_update_dict(style, layout, trace_indexes)
-
-        # ### Perform restyle portion of animate ###
-        if restyle_msg:
-            self._dispatch_change_callbacks_restyle(restyle_msg, trace_indexes)
-
-        # ### Perform relayout portion of update ###
-        if relayout_msg:
-            self._dispatch_change_callbacks_relayout(relayout_msg)
-
-        # Convert style / trace_indexes into animate form
-        # -----------------------------------------------
-        if self._batch_style_commands:
-            animate_styles, animate_trace_indexes = zip(*[
-                (trace_style, trace_index) for trace_index, trace_style in self._batch_style_commands.items()])
-        else:
-            animate_styles, animate_trace_indexes = {}, []
-
-        animate_layout = self._batch_layout_commands
-
-        # Send animate message to JS
-        # --------------------------
-        self._send_animate_msg(list(animate_styles), animate_layout, list(animate_trace_indexes), animation_opts)
+            animate_layout = self._batch_layout_commands
 
-        # Clear batched commands
-        # ----------------------
-        self._batch_layout_commands.clear()
-        self._batch_style_commands.clear()
+            # Send animate message to JS
+            # --------------------------
+            self._send_animate_msg(list(animate_styles), animate_layout, list(animate_trace_indexes), animation_opts)
+        finally:
+            # Clear batched commands, even if they are invalid, so that they don't fail later batches
+            self._batch_layout_commands.clear()
+            self._batch_style_commands.clear()
 
     def _send_animate_msg(self, styles, layout, trace_indexes, animation_opts):
         # print(styles, layout, trace_indexes, animation_opts)
@@ -1093,6 +1244,142 @@ class BaseFigure:
 
             return tuple(key_path2)
 
+    @staticmethod
+    def _validate_path_value(path_table, raw_key, key_path, val):
+        """
+        Validate the value of a dotted path restyle or relayout operation (e.g. 'marker.line.width')
+
+        Parameters
+        ----------
+        path_table : PropertyPathTable
+            Property path table of the trace type or of the layout
+        raw_key : str or tuple
+            Key of the operation, used in error messages
+        key_path : tuple
+            Key path of the operation, as returned by _str_to_dict_path
+        val
+            Value to validate. None and Undefined are returned as-is
+
+        Returns
+        -------
+        Validated value. Compound values are converted to dicts (or lists of dicts) of properties
+
+        Raises
+        ------
+        ValueError
+            If key_path isn't a property path, or val isn't a valid value of the property
+        """
+        # Subplot properties share the paths of their base subplot (e.g. xaxis2.range -> xaxis.range)
+        subplot_match = BaseLayoutType._subplotid_prop_re.fullmatch(str(key_path[0]))
+        if subplot_match:
+            key_path = (subplot_match.group(1),) + key_path[1:]
+
+        path = PropertyPathTable.path_str(key_path)
+        kind = path_table.get_kind(path)
+        if kind is None:
+            raise ValueError('Invalid property path {key!r} for {package_name}'
+                             .format(key=raw_key, package_name=path_table.package_name))
+
+        if val is None or val is Undefined:
+            return val
+
+        validator = path_table.get_validator(path)
+        if isinstance(key_path[-1], int):
+            if kind == COMPOUND_ARRAY:
+                # Single element of a compound array (e.g. annotations[1])
+                return validator.validate_coerce([val])[0]._props
+            else:
+                # Element of an info array (e.g. range[1]), not validated individually
+                return val
+
+        val = validator.validate_coerce(val)
+        if kind == COMPOUND:
+            return val._props
+        elif kind == COMPOUND_ARRAY:
+            return [v._props for v in val]
+        else:
+            return val
+
+    @staticmethod
+    def _validate_transform_path_value(path_table, raw_key, key_path, val, trace_data):
+        """
+        Validate the value of a restyle operation on a property of a single transform
+        (e.g. 'transforms[0].value')
+
+        The validators of transform properties depend on the transform type, so they aren't in the
+        property path tables. Instead the value is set on a copy of the transform, which is then
+        validated by the transforms validator of the trace
+
+        Parameters
+        ----------
+        path_table : PropertyPathTable
+            Property path table of the trace type
+        raw_key : str or tuple
+            Key of the operation, used in error messages
+        key_path : tuple
+            Key path of the operation, as returned by _str_to_dict_path
+        val
+            Value to validate. None and Undefined are returned as-is
+        trace_data : dict
+            Properties of the trace
+
+        Returns
+        -------
+        Validated value
+
+        Raises
+        ------
+        ValueError
+            If key_path isn't a path into a transform, or val isn't a valid value of the property
+        """
+        transform_index = key_path[1]
+        if not isinstance(transform_index, int):
+            raise ValueError('Invalid property path {key!r} for {package_name}'
+                             .format(key=raw_key, package_name=path_table.package_name))
+
+        if val is None or val is Undefined:
+            return val
+
+        transforms = trace_data.get('transforms', [])
+        transform = deepcopy(transforms[transform_index]) if transform_index < len(transforms) else {}
+
+        # Set val on the copy of the transform
+        sub_path = key_path[2:]
+        val_parent = transform
+        for kp, key_path_el in enumerate(sub_path[:-1]):
+
+            # Extend val_parent list if needed
+            if isinstance(val_parent, list) and isinstance(key_path_el, int):
+                while len(val_parent) <= key_path_el:
+                    val_parent.append({})
+
+            elif isinstance(val_parent, dict) and key_path_el not in val_parent:
+                if isinstance(sub_path[kp + 1], int):
+                    val_parent[key_path_el] = []
+                else:
+                    val_parent[key_path_el] = {}
+
+            val_parent = val_parent[key_path_el]
+
+        last_key = sub_path[-1]
+        if isinstance(val_parent, list) and isinstance(last_key, int):
+            while len(val_parent) <= last_key:
+                val_parent.append(None)
+            val_parent[last_key] = val
+        elif isinstance(val_parent, dict):
+            val_parent[last_key] = val
+        else:
+            raise ValueError('Invalid property path {key!r} for {package_name}'
+                             .format(key=raw_key, package_name=path_table.package_name))
+
+        # Validate the whole transform, and return the coerced value of the property
+        validator = path_table.get_validator('transforms')
+        val = validator.validate_coerce([transform])[0]._props
+        for key_path_el in sub_path:
+            val = val[key_path_el]
+
+        return val
+
     @staticmethod
     def _is_object_list(v):
         return isinstance(v, list) and len(v) > 0 and isinstance(v[0], dict)
@@ -1217,19 +1504,207 @@ class BaseFigure:
         return relayout_terms
 
 
+# Shared read-only placeholder for containers that most objects never populate (compound properties,
+# change callbacks, subplots). Replaced by a dict on first write
+_EMPTY_MAPPING = MappingProxyType({})
+
+
+# Property descriptors
+# --------------------
+# Generated datatype classes declare each of their properties with the descriptor of its kind
+# (e.g. `size: Number = SimpleProperty()`). The kind is known when the class is defined, so reads
+# and writes go straight to the props dict or to the setter of the kind, rather than through the
+# checks and validator dispatch of __getitem__ and __setitem__
+class SimpleProperty(doc_property):
+    """
+    Property whose value is stored as-is in the props dict of its object
+    """
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        name = self._name
+        parent = obj._parent
+        if parent is None:
+            return obj._orphan_props.get(name, None)
+
+        props = parent._get_child_props(obj)
+        if props is not None and name in props:
+            return props[name]
+
+        prop_defaults = parent._get_child_prop_defaults(obj)
+        return prop_defaults.get(name, None) if prop_defaults is not None else None
+
+    def __set__(self, obj, val):
+        obj._set_prop(self._name, val)
+
+
+class CompoundProperty(doc_property):
+    """
+    Property whose value is a datatype object
+    """
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        val = obj._compound_props.get(self._name, None)
+        return val if val is not None else obj[self._name]
+
+    def __set__(self, obj, val):
+        obj._set_compound_prop(self._name, val)
+
+
+class CompoundArrayProperty(CompoundProperty):
+    """
+    Property whose value is a tuple of datatype objects
+    """
+    __slots__ = ()
+
+    def __set__(self, obj, val):
+        obj._set_array_prop(self._name, val)
+
+
+class ItemProperty(doc_property):
+    """
+    Property that is read and written through __getitem__ and __setitem__ (e.g. properties with
+    custom validators)
+    """
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        return obj[self._name]
+
+    def __set__(self, obj, val):
+        obj[self._name] = val
+
+
 class BasePlotlyType:
-    _validators = None
+    # Generated datatype classes declare empty __slots__ too, so that instances don't carry a __dict__.
+    # Subclasses without __slots__ (e.g. in tests) get a __dict__ as usual
+    __slots__ = ('_plotly_name', '_validators', '_compound_props', '_orphan_props', '_parent',
+                 '_change_callbacks')
+
+    # Key of the docs of the class in the docs resources (e.g. 'trace.scatter.marker')
+    _docs_key = None
 
     # Defaults to help mocking
     def __init__(self, plotly_name, **kwargs):
 
         self._plotly_name = plotly_name
         self._raise_on_invalid_property_error(**kwargs)
-        self._validators = {}
-        self._compound_props = {}
+
+        # Validators are stateless, so all instances of a class share a single registry of them.
+        # Classes without a registry (e.g. in tests) get a private dict of validators
+        class_validators = self._get_class_validators()
+        self._validators = class_validators if class_validators is not None else {}
+        self._compound_props = _EMPTY_MAPPING
         self._orphan_props = {}  # properties dict for use while object has no parent
         self._parent = None
-        self._change_callbacks = {}  # type: typ.Dict[typ.Tuple, typ.Callable]
+        self._change_callbacks = _EMPTY_MAPPING  # type: typ.Dict[typ.Tuple, typ.Callable]
+
+    @classmethod
+    def _from_validated_props(cls, plotly_name, props):
+        """
+        Construct an instance that adopts props, a dict of property values that are already
+        known to be valid (e.g. a copy of the _props of another instance of cls), without
+        re-validating them
+
+        Parameters
+        ----------
+        plotly_name : str
+            Name of the new instance (e.g. 'xaxis2')
+        props : dict
+            Validated property values. The new instance takes ownership of props, callers
+            pass a copy
+
+        Returns
+        -------
+        BasePlotlyType
+        """
+        obj = cls.__new__(cls)
+        obj._init_from_validated_props(plotly_name, props)
+        return obj
+
+    def _init_from_validated_props(self, plotly_name, props):
+        self._plotly_name = plotly_name
+
+        class_validators = self._get_class_validators()
+        self._validators = class_validators if class_validators is not None else {}
+        self._compound_props = _EMPTY_MAPPING
+        self._orphan_props = props
+        self._parent = None
+        self._change_callbacks = _EMPTY_MAPPING
+
+        # Build the objects of the compound properties. Their props stay in props
+        for prop, validator in self._validators.items():
+            if isinstance(validator, (CompoundValidator, CompoundArrayValidator, BaseTypedArrayValidator)):
+                self._adopt_validated_child_props(prop, validator, props.get(prop, None))
+
+    def _adopt_validated_child_props(self, prop, validator, child_props):
+        """
+        Set compound property prop to the object(s) built from its validated props, without
+        re-validation (see _from_validated_props)
+        """
+        if isinstance(validator, CompoundValidator):
+            val = validator.data_class._from_validated_props(prop, child_props or {})
+            children = (val,)
+        else:
+            children = []
+            for el_props in child_props or ():
+                if isinstance(validator, BaseDataValidator):
+                    # Traces are named after their type, a read-only property that's always set
+                    trace_type = el_props['type']
+                    children.append(validator.get_class(trace_type)._from_validated_props(trace_type, el_props))
+                elif isinstance(validator, BaseTypedArrayValidator):
+                    element_class = validator.get_class(el_props[validator.type_key])
+                    children.append(element_class._from_validated_props(prop, el_props))
+                else:
+                    children.append(validator.data_class._from_validated_props(prop, el_props))
+
+            val = tuple(children)
+
+        # Children read their props from self from now on
+        for child in children:
+            child._orphan_props = {}
+            child._parent = self
+
+        if self._compound_props is _EMPTY_MAPPING:
+            self._compound_props = {}
+        self._compound_props[prop] = val
+        return val
+
+    @staticmethod
+    def _build_validators():
+        """
+        Build the validators of the properties of the class, as a dict from property name to
+        validator instance. Overridden by generated datatype classes
+
+        Returns
+        -------
+        dict or None
+        """
+        return None
+
+    @classmethod
+    def _get_class_validators(cls):
+        """
+        Get the read-only validator registry shared by all instances of cls, building it on
+        first use
+        """
+        # Check cls.__dict__ rather than using getattr so that subclasses don't pick up the
+        # registry of their parent class
+        if '_class_validators' not in cls.__dict__:
+            validators = cls._build_validators()
+            cls._class_validators = MappingProxyType(validators) if validators is not None else None
+
+        return cls._class_validators
 
     @property
     def plotly_name(self):
@@ -1241,10 +1716,32 @@ class BasePlotlyType:
 
     @property
     def _prop_descriptions(self) -> str:
-        raise NotImplementedError
+        if self._docs_key is None:
+            raise NotImplementedError
+
+        return get_prop_descriptions(self._docs_key)
+
+    # Docstrings
+    # ----------
+    # Generated classes load their docstrings from the docs resources on first use
+    # (see ipyplotly.lazydocs)
+    @classmethod
+    def _build_docstring(cls):
+        return get_constructor_doc(cls._docs_key, cls.__name__)
+
+    @classmethod
+    def _build_property_docstring(cls, prop):
+        description = load_docs(cls._docs_key)[prop]
+        validator_description = textwrap.dedent(cls._get_class_validators()[prop].description()).strip()
+
+        if description.strip():
+            return description + '\n\n' + validator_description
+        else:
+            return validator_description
 
     def __setattr__(self, prop, value):
-        if prop.startswith('_') or hasattr(self, prop):
+        # Look the property up on the class, hasattr(self, prop) would read its value
+        if prop.startswith('_') or hasattr(type(self), prop):
             # Let known properties and private properties through
             super().__setattr__(prop, value)
         else:
@@ -1376,12 +1873,14 @@ class BasePlotlyType:
 
             if prop in self._compound_props:
                 return self._compound_props[prop]
-            elif self._props is not None and prop in self._props:
-                return self._props[prop]
-            elif self._prop_defaults is not None:
-                return self._prop_defaults.get(prop, None)
-            else:
-                return None
+
+            # props and defaults are resolved through the chain of parents, look them up once
+            props = self._props
+            if props is not None and prop in props:
+                return props[prop]
+
+            prop_defaults = self._prop_defaults
+            return prop_defaults.get(prop, None) if prop_defaults is not None else None
 
     def __contains__(self, prop):
         return prop in self._validators
@@ -1394,7 +1893,7 @@ class BasePlotlyType:
 
         if isinstance(validator, CompoundValidator):
             self._set_compound_prop(key, value)
-        elif isinstance(validator, (CompoundArrayValidator, BaseDataValidator)):
+        elif isinstance(validator, (CompoundArrayValidator, BaseTypedArrayValidator)):
             self._set_array_prop(key, value)
         else:
             # Simple property
@@ -1419,17 +1918,22 @@ class BasePlotlyType:
         validator = self._validators.get(prop)
         val = validator.validate_coerce(val)
 
+        # Look up the props dict once, it's resolved through the chain of parents
+        props = self._props
         if val is None:
             # Check if we should send null update
-            if self._props and prop in self._props:
+            if props and prop in props:
                 if not self._in_batch_mode:
-                    self._props.pop(prop)
+                    props.pop(prop)
                 self._send_update(prop, val)
         else:
-            self._init_props()
-            if prop not in self._props or not BasePlotlyType._vals_equal(self._props[prop], val):
+            if props is None:
+                self._init_props()
+                props = self._props
+
+            if prop not in props or not BasePlotlyType._vals_equal(props[prop], val):
                 if not self._in_batch_mode:
-                    self._props[prop] = val
+                    props[prop] = val
                 self._send_update(prop, val)
 
     def _set_compound_prop(self, prop, val):
@@ -1476,6 +1980,8 @@ class BasePlotlyType:
                 curr_val._orphan_props.update(curr_dict_val)
             curr_val._parent = None
 
+        if self._compound_props is _EMPTY_MAPPING:
+            self._compound_props = {}
         self._compound_props[prop] = val
         return val
 
@@ -1525,6 +2031,8 @@ class BasePlotlyType:
                 if cv_dict is not None:
                     cv._orphan_props.update(cv_dict)
                 cv._parent = None
+        if self._compound_props is _EMPTY_MAPPING:
+            self._compound_props = {}
         self._compound_props[prop] = val
         return val
 
@@ -1590,10 +2098,13 @@ class BasePlotlyType:
         validated_args = tuple([a if isinstance(a, tuple) else (a,) for a in args])
 
         # TODO: add append arg and store list of callbacks
+        if self._change_callbacks is _EMPTY_MAPPING:
+            self._change_callbacks = {}
         self._change_callbacks[validated_args] = callback
 
 
 class BaseLayoutHierarchyType(BasePlotlyType):
+    __slots__ = ()
 
     # _send_relayout analogous to _send_restyle above
     def __init__(self, plotly_name, **kwargs):
@@ -1605,6 +2116,8 @@ class BaseLayoutHierarchyType(BasePlotlyType):
 
 
 class BaseLayoutType(BaseLayoutHierarchyType):
+    __slots__ = ('_subplotid_props',)
+
     _subplotid_prop_names = ['xaxis', 'yaxis', 'geo', 'ternary', 'scene']
     _subplotid_validators = {'xaxis': XaxisValidator,
                              'yaxis': YaxisValidator,
@@ -1612,6 +2125,9 @@ class BaseLayoutType(BaseLayoutHierarchyType):
                              'ternary': TernaryValidator,
                              'scene': SceneValidator}
 
+    # Validators of the subplot properties that have been used (e.g. xaxis2), shared by all layouts
+    _subplotid_prop_validators = {}
+
     _subplotid_prop_re = re.compile('(' + '|'.join(_subplotid_prop_names) + ')(\d+)')
 
     def __init__(self, plotly_name, **kwargs):
@@ -1619,7 +2135,7 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         invalid_kwargs = {k: v for k, v in kwargs.items()
                           if not self._subplotid_prop_re.fullmatch(k)}
         super().__init__(plotly_name, **invalid_kwargs)
-        self._subplotid_props = {}
+        self._subplotid_props = _EMPTY_MAPPING
         for prop, value in kwargs.items():
             self._set_subplotid_prop(prop, value)
 
@@ -1633,12 +2149,41 @@ class BaseLayoutType(BaseLayoutHierarchyType):
                             'Received {k}'.format(k=prop))
 
         # Add validator
+        self._add_subplotid_validator(prop, subplot_prop)
+
+        # Import value
+        subplot_obj = self._set_compound_prop(prop, value)
+        if subplot_obj is not None:
+            if self._subplotid_props is _EMPTY_MAPPING:
+                self._subplotid_props = {}
+            self._subplotid_props[prop] = subplot_obj
+
+    def _add_subplotid_validator(self, prop, subplot_prop):
         if prop not in self._validators:
-            validator = self._subplotid_validators[subplot_prop](prop_name=prop)
+            validator = self._subplotid_prop_validators.get(prop, None)
+            if validator is None:
+                validator = self._subplotid_validators[subplot_prop](plotly_name=prop)
+                self._subplotid_prop_validators[prop] = validator
+
+            if isinstance(self._validators, MappingProxyType):
+                # Layer a per-instance dict of subplot validators over the shared registry
+                self._validators = collections.ChainMap({}, self._validators)
+
             self._validators[prop] = validator
 
-        # Import value
-        self._subplotid_props[prop] = self._set_compound_prop(prop, value)
+    def _init_from_validated_props(self, plotly_name, props):
+        self._subplotid_props = _EMPTY_MAPPING
+        super()._init_from_validated_props(plotly_name, props)
+
+        # Subplot properties (e.g. xaxis2) aren't in the class validators
+        for prop, prop_props in props.items():
+            match = self._subplotid_prop_re.fullmatch(prop)
+            if match is not None:
+                self._add_subplotid_validator(prop, match.group(1))
+                subplot_obj = self._adopt_validated_child_props(prop, self._validators[prop], prop_props)
+                if self._subplotid_props is _EMPTY_MAPPING:
+                    self._subplotid_props = {}
+                self._subplotid_props[prop] = subplot_obj
 
     def __getattr__(self, item):
         # Check for subplot access (e.g. xaxis2)
@@ -1664,6 +2209,7 @@ class BaseLayoutType(BaseLayoutHierarchyType):
 
 
 class BaseTraceHierarchyType(BasePlotlyType):
+    __slots__ = ()
 
     def __init__(self, plotly_name, **kwargs):
         super().__init__(plotly_name, **kwargs)
@@ -1674,13 +2220,24 @@ class BaseTraceHierarchyType(BasePlotlyType):
 
 
 class BaseTraceType(BaseTraceHierarchyType):
+    __slots__ = ('_hover_callbacks', '_unhover_callbacks', '_click_callbacks', '_select_callbacks')
+
     def __init__(self, plotly_name, **kwargs):
         super().__init__(plotly_name, **kwargs)
 
-        self._hover_callbacks = []
-        self._unhover_callbacks = []
-        self._click_callbacks = []
-        self._select_callbacks = []
+        # Callbacks are kept in tuples so that traces without callbacks share the empty tuple
+        self._hover_callbacks = ()
+        self._unhover_callbacks = ()
+        self._click_callbacks = ()
+        self._select_callbacks = ()
+
+    def _init_from_validated_props(self, plotly_name, props):
+        super()._init_from_validated_props(plotly_name, props)
+
+        self._hover_callbacks = ()
+        self._unhover_callbacks = ()
+        self._click_callbacks = ()
+        self._select_callbacks = ()
 
     # uid
     # ---
@@ -1716,10 +2273,10 @@ class BaseTraceType(BaseTraceHierarchyType):
         None
         """
         if not append:
-            self._hover_callbacks.clear()
+            self._hover_callbacks = ()
 
         if callback:
-            self._hover_callbacks.append(callback)
+            self._hover_callbacks = self._hover_callbacks + (callback,)
 
     def _dispatch_on_hover(self, points: Points, state: InputState):
         for callback in self._hover_callbacks:
@@ -1729,10 +2286,10 @@ class BaseTraceType(BaseTraceHierarchyType):
     # -------
     def on_unhover(self, callback: typ.Callable[['BaseTraceType', Points, InputState], None], append=False):
         if not append:
-            self._unhover_callbacks.clear()
+            self._unhover_callbacks = ()
 
         if callback:
-            self._unhover_callbacks.append(callback)
+            self._unhover_callbacks = self._unhover_callbacks + (callback,)
 
     def _dispatch_on_unhover(self, points: Points, state: InputState):
         for callback in self._unhover_callbacks:
@@ -1742,9 +2299,9 @@ class BaseTraceType(BaseTraceHierarchyType):
     # -----
     def on_click(self, callback: typ.Callable[['BaseTraceType', Points, InputState], None], append=False):
         if not append:
-            self._click_callbacks.clear()
+            self._click_callbacks = ()
         if callback:
-            self._click_callbacks.append(callback)
+            self._click_callbacks = self._click_callbacks + (callback,)
 
     def _dispatch_on_click(self, points: Points, state: InputState):
         for callback in self._click_callbacks:
@@ -1756,10 +2313,10 @@ class BaseTraceType(BaseTraceHierarchyType):
                     callback: typ.Callable[['BaseTraceType', Points, typ.Union[BoxSelector, LassoSelector]], None],
                     append=False):
         if not append:
-            self._select_callbacks.clear()
+            self._select_callbacks = ()
 
         if callback:
-            self._select_callbacks.append(callback)
+            self._select_callbacks = self._select_callbacks + (callback,)
 
     def _dispatch_on_selected(self, points: Points, selector: typ.Union[BoxSelector, LassoSelector]):
         for callback in self._select_callbacks:
@@ -1767,6 +2324,7 @@ class BaseTraceType(BaseTraceHierarchyType):
 
 
 class BaseFrameHierarchyType(BasePlotlyType):
+    __slots__ = ()
 
     def __init__(self, plotly_name, **kwargs):
         super().__init__(plotly_name, **kwargs)
@@ -1,9 +1,13 @@
 import base64
 import numbers
+import sys
 import textwrap
 import uuid
 from importlib import import_module
 
+from ipyplotly.lazydocs import get_prop_descriptions
+from ipyplotly.validationmemo import memoized
+
 import io
 from copy import deepcopy
 
@@ -43,9 +47,13 @@ def copy_to_contiguous_readonly_numpy_array(v, dtype=None, force_numeric=False):
 
     # Convert int64 arrays to int32
     # -----------------------------
-    # JavaScript doesn't support int64 typed arrays
+    # JavaScript doesn't support int64 typed arrays. Arrays with values outside of the int32 range
+    # stay int64 rather than wrapping around, the dtype transport policy narrows them for the frontend
+    # (see ipyplotly.serializers.DtypePolicy)
     if new_v.dtype == 'int64':
-        new_v = new_v.astype('int32')
+        int32_info = np.iinfo('int32')
+        if new_v.size == 0 or (int32_info.min <= new_v.min() and new_v.max() <= int32_info.max):
+            new_v = new_v.astype('int32')
 
     # Set new array to be read-only
     # -----------------------------
@@ -55,7 +63,304 @@ def copy_to_contiguous_readonly_numpy_array(v, dtype=None, force_numeric=False):
 
 
 def is_array(v):
-    return isinstance(v, (list, tuple)) or (isinstance(v, np.ndarray) and v.ndim == 1)
+    return (isinstance(v, (list, tuple)) or
+            (isinstance(v, np.ndarray) and v.ndim == 1) or
+            is_pandas_array(v) or
+            is_arrow_array(v))
+
+
+def to_numpy_array(v):
+    """
+    Convert pandas and Arrow arrays to 1D numpy arrays (see pandas_to_numpy_array and
+    arrow_to_numpy_array). Other values are returned unchanged
+    """
+    if is_pandas_array(v):
+        return pandas_to_numpy_array(v)
+    elif is_arrow_array(v):
+        return arrow_to_numpy_array(v)
+    else:
+        return v
+
+
+def datetime64_to_iso_strings(values):
+    """
+    Convert the numpy datetime64 array values to an object array of ISO 8601 strings, with None
+    for NaT
+    """
+    new_v = np.datetime_as_string(values, unit='auto').astype('object')
+    new_v[np.isnat(values)] = None
+    return new_v
+
+
+# Categorical arrays
+# ------------------
+class CategoricalArray(np.ndarray):
+    """
+    Read-only object array of strings that keeps the codes and categories it was built from (e.g.
+    those of a pandas Categorical or an Arrow dictionary array), so that it's sent to the frontend
+    as its codes rather than factorized again. Missing values have code -1, and are None
+
+    Views and copies of the array (e.g. slices) don't keep the codes, their codes are None
+    """
+    def __new__(cls, codes, categories):
+        # Missing values have code -1, which takes the trailing None
+        lookup = np.empty(len(categories) + 1, dtype='object')
+        lookup[:-1] = categories
+
+        codes = np.asarray(codes).view()
+        codes.flags['WRITEABLE'] = False
+
+        new_v = lookup[codes].view(cls)
+        new_v.codes = codes
+        new_v.categories = lookup[:-1]
+        new_v.flags['WRITEABLE'] = False
+        return new_v
+
+    def __array_finalize__(self, obj):
+        self.codes = None
+        self.categories = None
+
+    def __deepcopy__(self, memo):
+        if self.codes is None:
+            return np.array(self)
+
+        return CategoricalArray(self.codes.copy(), self.categories)
+
+
+def is_str_array(v):
+    """
+    Whether the numpy array v is a unicode array or an object array of str
+    """
+    return v.dtype.kind == 'U' or (v.dtype.kind == 'O' and all(isinstance(e, str) for e in v))
+
+
+# pandas inputs
+# -------------
+# pandas objects can only be passed in if pandas is imported, so pandas is looked up in sys.modules
+# rather than imported by ipyplotly
+def is_pandas_array(v):
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(v, (pd.Series, pd.Index))
+
+
+def pandas_to_numpy_array(v):
+    """
+    Convert a pandas Series or Index to a 1D numpy array, without a round trip through lists:
+      - Numeric columns are returned as views of their buffers
+      - Categorical columns of strings are returned as CategoricalArrays, other categorical columns
+        are built by taking their categories by code
+      - Datetime columns are converted to ISO 8601 strings
+      - Missing values of other columns become nan (numeric columns) or None
+
+    Other values are returned unchanged
+    """
+    if not is_pandas_array(v):
+        return v
+
+    pd = sys.modules['pandas']
+    dtype = v.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categorical = v.array
+        categories = pandas_to_numpy_array(categorical.categories)
+        if is_str_array(categories):
+            return CategoricalArray(categorical.codes, categories)
+
+        # Missing values have code -1, which takes the trailing None
+        lookup = np.empty(len(categories) + 1, dtype='object')
+        lookup[:-1] = categories
+        return lookup[categorical.codes]
+    elif pd.api.types.is_datetime64_any_dtype(dtype):
+        datetimes = pd.DatetimeIndex(v)
+        if datetimes.tz is not None:
+            # Wall time in the time zone of the column
+            datetimes = datetimes.tz_localize(None)
+
+        return datetime64_to_iso_strings(datetimes.values)
+    elif isinstance(dtype, np.dtype):
+        return v.to_numpy()
+    elif dtype.kind in ('u', 'i', 'f'):
+        # Nullable extension dtype (e.g. Int64)
+        return v.to_numpy(dtype='float64', na_value=np.nan)
+    else:
+        return v.to_numpy(dtype='object', na_value=None)
+
+
+# Arrow inputs
+# ------------
+# Like pandas, pyarrow is looked up in sys.modules
+def is_arrow_array(v):
+    pa = sys.modules.get('pyarrow')
+    return pa is not None and isinstance(v, (pa.Array, pa.ChunkedArray))
+
+
+def is_arrow_table(v):
+    pa = sys.modules.get('pyarrow')
+    return pa is not None and isinstance(v, pa.Table)
+
+
+def is_arrow_string_array(v):
+    return is_arrow_array(v) and _is_arrow_string_type(v.type)
+
+
+def _is_arrow_string_type(arrow_type):
+    pa = sys.modules['pyarrow']
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+def arrow_to_numpy_array(v):
+    """
+    Convert a pyarrow Array or ChunkedArray to a 1D numpy array:
+      - Numeric arrays without nulls are returned as (read-only) views of their buffers, as long
+        as they have a single chunk
+      - Dictionary arrays of strings are returned as CategoricalArrays, other dictionary arrays are
+        built by taking their dictionary by index
+      - Timestamp and date arrays are converted to ISO 8601 strings. Like pandas datetimes,
+        timestamps with a time zone are converted to wall time in their time zone
+      - Nulls become nan (numeric arrays) or None
+    """
+    pa = sys.modules['pyarrow']
+    if isinstance(v, pa.ChunkedArray):
+        if v.num_chunks == 1:
+            return arrow_to_numpy_array(v.chunk(0))
+
+        chunks = [arrow_to_numpy_array(chunk) for chunk in v.chunks]
+        return np.concatenate(chunks) if chunks else np.array([], dtype='object')
+
+    arrow_type = v.type
+    if pa.types.is_dictionary(arrow_type) and _is_arrow_string_type(arrow_type.value_type):
+        # Null indices become code -1
+        codes = v.indices.cast(pa.int64()).fill_null(-1).to_numpy()
+        return CategoricalArray(codes, arrow_to_numpy_array(v.dictionary))
+    elif pa.types.is_dictionary(arrow_type) and v.indices.null_count == 0:
+        return arrow_to_numpy_array(v.dictionary).astype('object')[v.indices.to_numpy(zero_copy_only=False)]
+    elif pa.types.is_dictionary(arrow_type):
+        return arrow_to_numpy_array(v.dictionary_decode())
+    elif (pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)) and v.null_count == 0:
+        return v.to_numpy(zero_copy_only=True)
+    elif pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+        return v.to_numpy(zero_copy_only=False).astype('float64')
+    elif pa.types.is_timestamp(arrow_type) and arrow_type.tz is not None:
+        wall_times = import_module('pyarrow.compute').local_timestamp(v)
+        return datetime64_to_iso_strings(wall_times.to_numpy(zero_copy_only=False).astype('datetime64'))
+    elif pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+        return datetime64_to_iso_strings(v.to_numpy(zero_copy_only=False).astype('datetime64'))
+    else:
+        return v.to_numpy(zero_copy_only=False)
+
+
+# Zero-copy mode
+# --------------
+# By default, data arrays are copied when they're validated, so that figures never share memory
+# with the caller. In zero-copy mode, numeric arrays that need no conversion are adopted instead:
+# the figure keeps a read-only view of the array, and the caller's array is made read-only as well
+_zero_copy = False
+
+
+def set_zero_copy(zero_copy=True):
+    """
+    Enable or disable zero-copy mode, in which data arrays are adopted without copying them.
+    See adopt_contiguous_readonly_numpy_array
+    """
+    global _zero_copy
+    _zero_copy = zero_copy
+
+
+def is_zero_copy():
+    return _zero_copy
+
+
+def adopt_contiguous_readonly_numpy_array(v, dtype=None):
+    """
+    Adopt the numpy array v without copying it, if it's a C-contiguous numeric array (of any
+    number of dimensions) that copy_to_contiguous_readonly_numpy_array would not need to convert
+
+    v is made read-only, so that the adopted data can't change behind the figure's back. Note
+    that other arrays that share the memory of v (e.g. the array v is a view of) stay writeable
+
+    Returns
+    -------
+    np.ndarray or None
+        Read-only view of v, or None if v can't be adopted
+    """
+    if (not isinstance(v, np.ndarray) or
+            v.ndim == 0 or
+            not v.flags['C_CONTIGUOUS'] or
+            v.dtype.kind not in ('u', 'i', 'f') or
+            v.dtype != np.dtype(dtype) or
+            v.dtype == 'int64'):
+        return None
+
+    v.flags['WRITEABLE'] = False
+    return v.view()
+
+
+def deepcopy_props(v):
+    """
+    Deep copy of v, a (possibly nested) dict or list of property values. In zero-copy mode numpy
+    and Arrow arrays are shared rather than copied
+    """
+    if not _zero_copy:
+        return deepcopy(v)
+    elif isinstance(v, np.ndarray) or is_arrow_array(v):
+        return v
+    elif isinstance(v, dict):
+        return v.__class__((k, deepcopy_props(e)) for k, e in v.items())
+    elif isinstance(v, (list, tuple)) and v.__class__ in (list, tuple):
+        return v.__class__(deepcopy_props(e) for e in v)
+    else:
+        return deepcopy(v)
+
+
+# Validation of distinct elements
+# -------------------------------
+# Categorical arrays (symbols, modes, colors, ...) have few distinct elements, so array validators
+# factorize arrays, validate each distinct element once, and build the coerced array from the codes
+def factorize_array(v):
+    """
+    Encode a list, tuple, or 1D numpy array as integer codes into its distinct elements.
+    Elements that compare equal (e.g. 1, 1.0, and True) share a code
+
+    Returns
+    -------
+    (np.ndarray, list) or None
+        Codes of the elements of v, and the distinct elements. None if v has unhashable elements
+    """
+    if isinstance(v, np.ndarray) and v.dtype.kind in ('b', 'u', 'i', 'f'):
+        uniques, codes = np.unique(v, return_inverse=True)
+        return codes, uniques.tolist()
+    elif isinstance(v, np.ndarray):
+        v = v.tolist()
+
+    # Hashing is cheaper than sorting (as np.unique does) for strings and objects
+    codes_by_el = {}
+    try:
+        codes = [codes_by_el.setdefault(e, len(codes_by_el)) for e in v]
+    except TypeError:
+        # Unhashable element
+        return None
+
+    return np.array(codes, dtype=np.intp), list(codes_by_el)
+
+
+def get_invalid_elements(v, codes, invalid_uniques):
+    """
+    First (up to 10) elements of v whose distinct element is flagged by invalid_uniques
+    """
+    invalid_uniques = np.array(invalid_uniques, dtype=bool)
+    if not invalid_uniques.any():
+        return []
+
+    invalid_inds = np.flatnonzero(invalid_uniques[codes])[:10]
+    return [v[i] for i in invalid_inds]
+
+
+def take_uniques(uniques, codes, dtype):
+    """
+    Build a read-only array of the elements with codes codes from the (coerced) distinct elements
+    """
+    new_v = np.array(uniques, dtype=dtype)[codes]
+    new_v.flags['WRITEABLE'] = False
+    return new_v
 
 
 def type_str(v):
@@ -130,7 +435,8 @@ class DataArrayValidator(BaseValidator):
 
     def description(self):
         return ("""\
-    The '{plotly_name}' property is an array that may be specified as a tuple, list, or one-dimensional numpy array"""
+    The '{plotly_name}' property is an array that may be specified as a tuple, list, or numpy array
+    (e.g. a two-dimensional numpy array for the z values of a heatmap)"""
                 .format(plotly_name=self.plotly_name))
 
     def validate_coerce(self, v):
@@ -138,8 +444,21 @@ class DataArrayValidator(BaseValidator):
         if v is None:
             # Pass None through
             pass
-        elif is_array(v):
-            v = copy_to_contiguous_readonly_numpy_array(v)
+        elif is_arrow_string_array(v):
+            # Arrow string arrays are immutable, so they're kept as they are, and sent to the frontend
+            # from their own offsets and data buffers (see ipyplotly.serializers)
+            if isinstance(v, sys.modules['pyarrow'].ChunkedArray):
+                v = v.combine_chunks()
+        elif is_array(v) or (isinstance(v, np.ndarray) and v.ndim > 1):
+            # Arrow buffers are immutable, so they're always adopted
+            zero_copy = _zero_copy or is_arrow_array(v)
+            v = to_numpy_array(v)
+            if isinstance(v, CategoricalArray) and v.codes is not None:
+                # Built from the input, and read-only. Keeps the codes it's sent to the frontend as
+                return v
+
+            adopted_v = adopt_contiguous_readonly_numpy_array(v) if zero_copy else None
+            v = adopted_v if adopted_v is not None else copy_to_contiguous_readonly_numpy_array(v)
         else:
             self.raise_invalid_val(v)
         return v
@@ -175,6 +494,20 @@ class EnumeratedValidator(BaseValidator):
             else:
                 self.val_regexs.append(None)
 
+        # Literal values, as a set for hashable values
+        self._literals = [v for v, regex in zip(self.values, self.val_regexs) if regex is None]
+        try:
+            self._literal_set = frozenset(self._literals)
+        except TypeError:
+            self._literal_set = None
+
+        # Numeric literal values, for arrays of numbers
+        self._number_literals = [v for v in self._literals if isinstance(v, numbers.Number)]
+
+        # Strings are matched against a single alternation of the regexes
+        patterns = ['(?:{pattern})'.format(pattern=regex.pattern) for regex in self.val_regexs if regex is not None]
+        self._combined_regex = re.compile('|'.join(patterns)) if patterns else None
+
         self.array_ok = array_ok
 
     def description(self):
@@ -217,24 +550,38 @@ class EnumeratedValidator(BaseValidator):
         return desc
 
     def in_values(self, e):
-        is_str = isinstance(e, str)
-        for v, regex in zip(self.values, self.val_regexs):
-            if is_str and regex:
-                in_values = regex.fullmatch(e) is not None
-            else:
-                in_values = e == v
-
-            if in_values:
+        if self._literal_set is None:
+            if any(e == v for v in self._literals):
                 return True
+        else:
+            try:
+                if e in self._literal_set:
+                    return True
+            except TypeError:
+                # Unhashable value
+                pass
 
-        return False
+        return (self._combined_regex is not None and
+                isinstance(e, str) and
+                self._combined_regex.fullmatch(e) is not None)
 
     def validate_coerce(self, v):
         if v is None:
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
-            invalid_els = [e for e in v if (not self.in_values(e))]
+            v = to_numpy_array(v)
+            if isinstance(v, np.ndarray) and v.dtype.kind in ('u', 'i', 'f'):
+                # Numeric arrays can only match the numeric literal values
+                invalid_els = v[np.logical_not(np.isin(v, self._number_literals))][:10].tolist()
+            else:
+                factorized = factorize_array(v)
+                if factorized is not None:
+                    codes, uniques = factorized
+                    invalid_els = get_invalid_elements(v, codes, [not self.in_values(e) for e in uniques])
+                else:
+                    invalid_els = [e for e in v if (not self.in_values(e))]
+
             if invalid_els:
                 self.raise_invalid_elements(invalid_els)
 
@@ -330,6 +677,7 @@ class NumberValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
+            v = to_numpy_array(v)
 
             try:
                 v_array = copy_to_contiguous_readonly_numpy_array(v, force_numeric=True)
@@ -417,6 +765,7 @@ class IntegerValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
+            v = to_numpy_array(v)
 
             try:
                 v_array = copy_to_contiguous_readonly_numpy_array(v, dtype='int32')
@@ -506,6 +855,27 @@ class StringValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
+            v = to_numpy_array(v)
+            factorized = factorize_array(v)
+            if factorized is not None:
+                codes, uniques = factorized
+
+                # Make sure all elements are strings
+                invalid_els = get_invalid_elements(v, codes, [not isinstance(e, str) for e in uniques])
+                if invalid_els:
+                    self.raise_invalid_elements(invalid_els)
+
+                if self.no_blank:
+                    invalid_els = get_invalid_elements(v, codes, [e == '' for e in uniques])
+                    if invalid_els:
+                        self.raise_invalid_elements(invalid_els)
+
+                if self.values:
+                    invalid_els = get_invalid_elements(v, codes, [e not in self.values for e in uniques])
+                    if invalid_els:
+                        self.raise_invalid_elements(invalid_els)
+
+                return take_uniques(uniques, codes, dtype='unicode')
 
             # Make sure all elements are strings. Is there a more efficient way to do this in numpy?
             invalid_els = [e for e in v if not isinstance(e, str)]
@@ -569,6 +939,7 @@ class ColorValidator(BaseValidator):
         "royalblue", "saddlebrown", "salmon", "sandybrown", "seagreen", "seashell", "sienna", "silver", "skyblue",
         "slateblue", "slategray", "slategrey", "snow", "springgreen", "steelblue", "tan", "teal", "thistle", "tomato",
         "turquoise", "violet", "wheat", "white", "whitesmoke", "yellow", "yellowgreen"]
+    named_colors_set = frozenset(named_colors)
 
     def __init__(self, plotly_name, parent_name, array_ok=False, colorscale_path=None, **_):
         super().__init__(plotly_name=plotly_name, parent_name=parent_name)
@@ -609,6 +980,12 @@ class ColorValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
+            v = to_numpy_array(v)
+            factorized = ColorValidator.factorize_strs(v)
+            if factorized is not None:
+                # Arrays of strings are validated once per distinct string
+                return self.validate_coerce_strs(v, *factorized)
+
             v_array = copy_to_contiguous_readonly_numpy_array(v)
             if self.numbers_allowed() and v_array.dtype.kind in ['u', 'i', 'f']:  # (un)signed int or float
                 # All good
@@ -638,6 +1015,45 @@ class ColorValidator(BaseValidator):
         return v
 
     @staticmethod
+    def factorize_strs(v):
+        """
+        Encode a list, tuple, or 1D array of strings as integer codes into its distinct strings
+
+        Returns
+        -------
+        (np.ndarray, list of str) or None
+            Codes of the elements of v, and the distinct strings in order of first occurrence.
+            None if v is empty or has elements that aren't strings
+        """
+        if isinstance(v, np.ndarray) and v.dtype.kind not in ('U', 'O'):
+            return None
+
+        if len(v) == 0 or not isinstance(v[0], str):
+            return None
+
+        factorized = factorize_array(v)
+        if factorized is None or not all(isinstance(u, str) for u in factorized[1]):
+            return None
+
+        return factorized
+
+    def validate_coerce_strs(self, v, codes, uniques):
+        """
+        Validate and coerce an array of color strings, factorized by factorize_strs. Equivalent
+        to validating each element of v, but each distinct color is only validated once
+        """
+        validated_uniques = [ColorValidator.perform_validate_coerce(u, allow_number=self.numbers_allowed())
+                             for u in uniques]
+
+        invalid_els = get_invalid_elements(v, codes, [u is None for u in validated_uniques])
+        if invalid_els:
+            self.raise_invalid_elements(invalid_els)
+
+        # Same dtypes as elementwise validation
+        return take_uniques(validated_uniques, codes, dtype='object' if self.numbers_allowed() else 'unicode')
+
+    @staticmethod
+    @memoized('color')
     def perform_validate_coerce(v, allow_number=None):
 
         if isinstance(v, numbers.Number) and allow_number:
@@ -656,7 +1072,7 @@ class ColorValidator(BaseValidator):
             elif ColorValidator.re_rgb_etc.fullmatch(v):
                 # Valid rgb(a), hsl(a), hsv(a) color (e.g. rgba(10, 234, 200, 50%)
                 return v
-            elif v in ColorValidator.named_colors:
+            elif v in ColorValidator.named_colors_set:
                 # Valid named color (e.g. 'coral')
                 return v
             else:
@@ -688,6 +1104,7 @@ class ColorlistValidator(BaseValidator):
             # Pass None through
             pass
         elif is_array(v):
+            v = to_numpy_array(v)
             validated_v = [ColorValidator.perform_validate_coerce(e, allow_number=False) for e in v]
 
             invalid_els = [el for el, validated_el in zip(v, validated_v) if validated_el is None]
@@ -730,6 +1147,15 @@ class ColorscaleValidator(BaseValidator):
 
         return desc
 
+    @staticmethod
+    @memoized('colorscale')
+    def find_named_colorscale(v):
+        """
+        Named colorscale that matches the string v (ignoring case), or None
+        """
+        v_match = [el for el in ColorscaleValidator.named_colorscales if el.lower() == v.lower()]
+        return v_match[0] if v_match else None
+
     def validate_coerce(self, v):
         v_valid = False
 
@@ -739,10 +1165,10 @@ class ColorscaleValidator(BaseValidator):
         if v is None:
             v_valid = True
         elif isinstance(v, str):
-            v_match = [el for el in ColorscaleValidator.named_colorscales if el.lower() == v.lower()]
-            if v_match:
+            v_match = ColorscaleValidator.find_named_colorscale(v)
+            if v_match is not None:
                 v_valid = True
-                v = v_match[0]
+                v = v_match
 
         elif is_array(v) and len(v) > 0:
             invalid_els = [e for e in v
@@ -863,6 +1289,9 @@ class FlaglistValidator(BaseValidator):
 
         self.all_flags = self.flags + self.extras
 
+        # Hashable flags, for the memo of perform_validate_coerce
+        self._flags_key = (tuple(self.all_flags), tuple(self.extras))
+
     def description(self):
 
         desc = ("""\
@@ -889,13 +1318,19 @@ class FlaglistValidator(BaseValidator):
         return desc
 
     def perform_validate_coerce(self, v):
+        all_flags, extras = self._flags_key
+        return FlaglistValidator.perform_validate_coerce_flags(all_flags, extras, v)
+
+    @staticmethod
+    @memoized('flaglist')
+    def perform_validate_coerce_flags(all_flags, extras, v):
         if not isinstance(v, str):
             return None
 
         split_vals = [e.strip() for e in re.split('[,+]', v)]
 
-        all_flags_valid = [f for f in split_vals if f not in self.all_flags] == []
-        has_extras = [f for f in split_vals if f in self.extras] != []
+        all_flags_valid = [f for f in split_vals if f not in all_flags] == []
+        has_extras = [f for f in split_vals if f in extras] != []
 
         is_valid = all_flags_valid and (not has_extras or len(split_vals) == 1)
         if is_valid:
@@ -908,6 +1343,18 @@ class FlaglistValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
+            v = to_numpy_array(v)
+            factorized = factorize_array(v)
+            if factorized is not None:
+                # Coerce distinct strings
+                codes, uniques = factorized
+                validated_uniques = [self.perform_validate_coerce(e) for e in uniques]
+
+                invalid_els = get_invalid_elements(v, codes, [e is None for e in validated_uniques])
+                if invalid_els:
+                    self.raise_invalid_elements(invalid_els)
+
+                return take_uniques(validated_uniques, codes, dtype='unicode')
 
             validated_v = [self.perform_validate_coerce(e) for e in v]  # Coerce individual strings
 
@@ -956,6 +1403,7 @@ class AnyValidator(BaseValidator):
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
+            v = to_numpy_array(v)
             v = copy_to_contiguous_readonly_numpy_array(v, dtype='object')
 
         return v
@@ -1079,10 +1527,17 @@ class ImageUriValidator(BaseValidator):
 
 
 class CompoundValidator(BaseValidator):
-    def __init__(self, plotly_name, parent_name, data_class, data_docs):
+    def __init__(self, plotly_name, parent_name, data_class, data_docs=None):
         super().__init__(plotly_name=plotly_name, parent_name=parent_name)
         self.data_class = data_class
-        self.data_docs = data_docs
+        self._data_docs = data_docs
+
+    @property
+    def data_docs(self):
+        # Generated validators load the docs of their data class on first use
+        if self._data_docs is None:
+            self._data_docs = get_prop_descriptions(self.data_class._docs_key, indent=12)
+        return self._data_docs
 
     @staticmethod
     def get_constructor_params_str(data_class):
@@ -1130,19 +1585,33 @@ class CompoundValidator(BaseValidator):
 
         elif isinstance(v, self.data_class):
             # Copy object
-            v = self.data_class(**v._props)
+            from ipyplotly.basedatatypes import BasePlotlyType
+
+            if isinstance(v, BasePlotlyType):
+                # Properties of datatype objects are already valid, adopt a copy of them
+                v = self.data_class._from_validated_props(self.plotly_name, deepcopy(v._props or {}))
+            else:
+                v = self.data_class(**v._props)
         else:
             self.raise_invalid_val(v)
 
-        v._prop_name = self.plotly_name
+        # Name the object after this property (e.g. 'xaxis2' rather than the class default 'xaxis')
+        v._plotly_name = self.plotly_name
         return v
 
 
 class CompoundArrayValidator(BaseValidator):
-    def __init__(self, plotly_name, parent_name, element_class, element_docs):
+    def __init__(self, plotly_name, parent_name, element_class, element_docs=None):
         super().__init__(plotly_name=plotly_name, parent_name=parent_name)
         self.data_class = element_class
-        self.data_docs = element_docs
+        self._data_docs = element_docs
+
+    @property
+    def data_docs(self):
+        # Generated validators load the docs of their element class on first use
+        if self._data_docs is None:
+            self._data_docs = get_prop_descriptions(self.data_class._docs_key, indent=12)
+        return self._data_docs
 
     def description(self):
 
@@ -1191,60 +1660,103 @@ class CompoundArrayValidator(BaseValidator):
         return v
 
 
-class BaseDataValidator(BaseValidator):
-    def __init__(self, class_map, plotly_name, parent_name):
+class BaseTypedArrayValidator(BaseValidator):
+    """
+    Base class of validators of tuples of objects whose class is selected by the value of their
+    type_key property (e.g. the traces of a figure, or the transforms of a trace)
+    """
+    def __init__(self, class_strs_map, plotly_name, parent_name, datatypes_module, element_name,
+                 example_types, type_key='type', default_type=None):
+        """
+        Parameters
+        ----------
+        class_strs_map : dict
+            Dict from type to the name of its class in datatypes_module
+        datatypes_module : str
+            Name of the module of the element classes (e.g. 'ipyplotly.datatypes.trace')
+        element_name : str
+            Name of the elements in descriptions (e.g. 'trace')
+        example_types : tuple of str
+            Two types used as examples in descriptions
+        type_key : str
+            Property of dict elements that specifies their type
+        default_type : str or None
+            Type of dict elements without a type_key property. None if type_key is required
+        """
         super().__init__(plotly_name=plotly_name, parent_name=parent_name)
-        self.class_map = class_map
+        self.class_strs_map = class_strs_map
+        self.datatypes_module = datatypes_module
+        self.element_name = element_name
+        self.example_types = example_types
+        self.type_key = type_key
+        self.default_type = default_type
+        self._class_map = {}
 
     def description(self):
 
-        trace_types = str(list(self.class_map.keys()))
+        element_types = str(list(self.class_strs_map.keys()))
 
-        trace_types_wrapped = '\n'.join(textwrap.wrap(trace_types,
-                                                      subsequent_indent=' ' * 21,
-                                                      width=80 - 8))
+        element_types_wrapped = '\n'.join(textwrap.wrap(element_types,
+                                                        subsequent_indent=' ' * 21,
+                                                        width=80 - 8))
 
+        type1, type2 = self.example_types
         desc = ("""\
-    The '{plotly_name}' property is a tuple of trace instances that may be specified as:
-      - A list or tuple of trace instances 
-        (e.g. [Scatter(...), Bar(...)])
+    The '{plotly_name}' property is a tuple of {element_name} instances that may be specified as:
+      - A list or tuple of {element_name} instances
+        (e.g. [{class1}(...), {class2}(...)])
       - A list or tuple of dicts of string/value properties where:
-        - The 'type' property specifies the trace type
-            One of: {trace_types}
-                     
-        - All remaining properties are passed to the constructor of the specified trace type
+        - The '{type_key}' property specifies the {element_name} type
+            One of: {element_types}
 
-        (e.g. [{{'type': 'scatter', ...}}, {{'type': 'bar, ...}}])"""
-                ).format(plotly_name=self.plotly_name, trace_types=trace_types_wrapped)
+        - All remaining properties are passed to the constructor of the specified {element_name} type
+
+        (e.g. [{{'{type_key}': '{type1}', ...}}, {{'{type_key}': '{type2}', ...}}])"""
+                ).format(plotly_name=self.plotly_name,
+                         element_name=self.element_name,
+                         element_types=element_types_wrapped,
+                         type_key=self.type_key,
+                         type1=type1,
+                         type2=type2,
+                         class1=self.class_strs_map.get(type1, type1),
+                         class2=self.class_strs_map.get(type2, type2))
 
         return desc
 
+    def get_class(self, element_type):
+        """
+        Get the class of element_type, importing it on first use so that only the types that are
+        used get imported
+        """
+        if element_type not in self._class_map:
+            datatypes_module = import_module(self.datatypes_module)
+            self._class_map[element_type] = getattr(datatypes_module, self.class_strs_map[element_type])
+
+        return self._class_map[element_type]
+
     def validate_coerce(self, v):
 
         if v is None:
             v = ()
         elif isinstance(v, (list, tuple)):
-            trace_classes = tuple(self.class_map.values())
+            from ipyplotly.basedatatypes import BasePlotlyType
 
             res = []
             invalid_els = []
             for v_el in v:
-                if isinstance(v_el, trace_classes):
-                    res.append(v_el)
-                elif isinstance(v_el, dict):
-                    v_copy = deepcopy(v_el)
-
-                    if 'type' in v_copy:
-                        trace_type = v_copy.pop('type')
-                    else:
-                        trace_type = 'scatter'
+                if isinstance(v_el, dict):
+                    v_copy = deepcopy_props(v_el)
+                    element_type = v_copy.pop(self.type_key, self.default_type)
 
-                    if trace_type not in self.class_map:
+                    if element_type not in self.class_strs_map:
                         res.append(None)
                         invalid_els.append(v_el)
                     else:
-                        trace = self.class_map[trace_type](**v_copy)
-                        res.append(trace)
+                        res.append(self.get_class(element_type)(**v_copy))
+                elif (isinstance(v_el, BasePlotlyType) and
+                      getattr(v_el, self.type_key, None) in self.class_strs_map and
+                      isinstance(v_el, self.get_class(getattr(v_el, self.type_key)))):
+                    res.append(v_el)
                 else:
                     res.append(None)
                     invalid_els.append(v_el)
@@ -1253,14 +1765,39 @@ class BaseDataValidator(BaseValidator):
                 self.raise_invalid_elements(invalid_els)
 
             v = tuple(res)
-
-            # Add UIDs if not set.
-            # If UID is set then it's the users responsibility to make sure UIDs are unique
-            for trace in v:
-                if trace.uid is None:
-                    trace.uid = str(uuid.uuid1())
-
         else:
             self.raise_invalid_val(v)
 
         return v
+
+
+class BaseTransformsValidator(BaseTypedArrayValidator):
+    def __init__(self, class_strs_map, plotly_name, parent_name):
+        super().__init__(class_strs_map=class_strs_map,
+                         plotly_name=plotly_name,
+                         parent_name=parent_name,
+                         datatypes_module='ipyplotly.datatypes.transform',
+                         element_name='transform',
+                         example_types=('filter', 'sort'))
+
+
+class BaseDataValidator(BaseTypedArrayValidator):
+    def __init__(self, class_strs_map, plotly_name, parent_name):
+        super().__init__(class_strs_map=class_strs_map,
+                         plotly_name=plotly_name,
+                         parent_name=parent_name,
+                         datatypes_module='ipyplotly.datatypes.trace',
+                         element_name='trace',
+                         example_types=('scatter', 'bar'),
+                         default_type='scatter')
+
+    def validate_coerce(self, v):
+        v = super().validate_coerce(v)
+
+        # Add UIDs if not set.
+        # If UID is set then it's the users responsibility to make sure UIDs are unique
+        for trace in v:
+            if trace.uid is None:
+                trace.uid = str(uuid.uuid1())
+
+        return v
@@ -2,7 +2,7 @@ import ipywidgets as widgets
 from traitlets import List, Unicode, Dict, observe, Integer, Undefined
 from ipyplotly.basedatatypes import BaseFigure
 from ipyplotly.callbacks import BoxSelector, LassoSelector, InputState, Points
-from ipyplotly.serializers import custom_serializers
+from ipyplotly.serializers import custom_serializers, DtypePolicy
 
 
 @widgets.register
@@ -263,6 +263,30 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
             svg_uri = content['svg_uri']
             self._do_save_image(req_id, svg_uri)
 
+    # Dtype transport policy
+    # ----------------------
+    _dtype_policy = None
+
+    @property
+    def dtype_policy(self):
+        """
+        Dtype transport policy of the figure (see ipyplotly.serializers.DtypePolicy), or None to
+        use the global policy. Applies to the arrays sent to the frontend after it's set
+
+        Returns
+        -------
+        DtypePolicy or None
+        """
+        return self._dtype_policy
+
+    @dtype_policy.setter
+    def dtype_policy(self, policy):
+        if policy is not None and not isinstance(policy, DtypePolicy):
+            raise ValueError('dtype_policy must be a DtypePolicy instance or None. Received: {policy!r}'
+                             .format(policy=policy))
+
+        self._dtype_policy = policy
+
     # Validate No Frames
     # ------------------
     @property
@@ -0,0 +1,26 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._layout import Layout
+    from ._frame import Frame
+    from ._figurewidget import FigureWidget
+    from ._figure import Figure
+    from . import layout
+    from . import trace
+    from . import transform
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.layout',
+            '.trace',
+            '.transform',
+        ],
+        [
+            '._layout.Layout',
+            '._frame.Frame',
+            '._figurewidget.FigureWidget',
+            '._figure.Figure',
+        ]
+    )
@@ -0,0 +1,2962 @@
+from ipyplotly.basewidget import BaseFigureWidget
+from ipyplotly.lazydocs import lazy_class_doc
+
+
+class FigureWidget(BaseFigureWidget):
+
+    __doc__ = lazy_class_doc
+
+    def __init__(self, data=None, layout=None, frames=None):
+        """
+        Create a new FigureWidget instance
+
+        Parameters
+        ----------
+        data
+            Tuple of trace instances, or list of dicts of trace properties
+        layout
+            Layout instance, or dict of layout properties
+        frames
+            Tuple of frame instances, or list of dicts of frame properties
+
+        See help(FigureWidget) for the full descriptions of the parameters
+        """
+        super().__init__(data, layout, frames)
+
+    def add_scatter(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        hovertext=None,
+        mode=None,
+        hoveron=None,
+        line=None,
+        connectgaps=None,
+        cliponaxis=None,
+        fill=None,
+        fillcolor=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        textposition=None,
+        textfont=None,
+        r=None,
+        t=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        rsrc=None,
+        tsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Scatter trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Scatter) for their descriptions
+
+        Returns
+        -------
+        Scatter
+        """
+        from ipyplotly.datatypes.trace import Scatter
+        new_trace = Scatter(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            x0=x0,
+            dx=dx,
+            y=y,
+            y0=y0,
+            dy=dy,
+            text=text,
+            hovertext=hovertext,
+            mode=mode,
+            hoveron=hoveron,
+            line=line,
+            connectgaps=connectgaps,
+            cliponaxis=cliponaxis,
+            fill=fill,
+            fillcolor=fillcolor,
+            marker=marker,
+            selected=selected,
+            unselected=unselected,
+            textposition=textposition,
+            textfont=textfont,
+            r=r,
+            t=t,
+            error_y=error_y,
+            error_x=error_x,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            hovertextsrc=hovertextsrc,
+            textpositionsrc=textpositionsrc,
+            rsrc=rsrc,
+            tsrc=tsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_box(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        y=None,
+        x=None,
+        x0=None,
+        y0=None,
+        text=None,
+        whiskerwidth=None,
+        boxpoints=None,
+        boxmean=None,
+        jitter=None,
+        pointpos=None,
+        orientation=None,
+        marker=None,
+        line=None,
+        fillcolor=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        ysrc=None,
+        xsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Box trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Box) for their descriptions
+
+        Returns
+        -------
+        Box
+        """
+        from ipyplotly.datatypes.trace import Box
+        new_trace = Box(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            y=y,
+            x=x,
+            x0=x0,
+            y0=y0,
+            text=text,
+            whiskerwidth=whiskerwidth,
+            boxpoints=boxpoints,
+            boxmean=boxmean,
+            jitter=jitter,
+            pointpos=pointpos,
+            orientation=orientation,
+            marker=marker,
+            line=line,
+            fillcolor=fillcolor,
+            selected=selected,
+            unselected=unselected,
+            hoveron=hoveron,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            ysrc=ysrc,
+            xsrc=xsrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_bar(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        hovertext=None,
+        textposition=None,
+        textfont=None,
+        insidetextfont=None,
+        outsidetextfont=None,
+        constraintext=None,
+        orientation=None,
+        base=None,
+        offset=None,
+        width=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        r=None,
+        t=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        basesrc=None,
+        offsetsrc=None,
+        widthsrc=None,
+        rsrc=None,
+        tsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Bar trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Bar) for their descriptions
+
+        Returns
+        -------
+        Bar
+        """
+        from ipyplotly.datatypes.trace import Bar
+        new_trace = Bar(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            x0=x0,
+            dx=dx,
+            y=y,
+            y0=y0,
+            dy=dy,
+            text=text,
+            hovertext=hovertext,
+            textposition=textposition,
+            textfont=textfont,
+            insidetextfont=insidetextfont,
+            outsidetextfont=outsidetextfont,
+            constraintext=constraintext,
+            orientation=orientation,
+            base=base,
+            offset=offset,
+            width=width,
+            marker=marker,
+            selected=selected,
+            unselected=unselected,
+            r=r,
+            t=t,
+            error_y=error_y,
+            error_x=error_x,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            hovertextsrc=hovertextsrc,
+            textpositionsrc=textpositionsrc,
+            basesrc=basesrc,
+            offsetsrc=offsetsrc,
+            widthsrc=widthsrc,
+            rsrc=rsrc,
+            tsrc=tsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_heatmap(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        transpose=None,
+        xtype=None,
+        ytype=None,
+        zsmooth=None,
+        connectgaps=None,
+        xgap=None,
+        ygap=None,
+        zhoverformat=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Heatmap trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Heatmap) for their descriptions
+
+        Returns
+        -------
+        Heatmap
+        """
+        from ipyplotly.datatypes.trace import Heatmap
+        new_trace = Heatmap(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            z=z,
+            x=x,
+            x0=x0,
+            dx=dx,
+            y=y,
+            y0=y0,
+            dy=dy,
+            text=text,
+            transpose=transpose,
+            xtype=xtype,
+            ytype=ytype,
+            zsmooth=zsmooth,
+            connectgaps=connectgaps,
+            xgap=xgap,
+            ygap=ygap,
+            zhoverformat=zhoverformat,
+            zauto=zauto,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            zsrc=zsrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_histogram(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        text=None,
+        orientation=None,
+        histfunc=None,
+        histnorm=None,
+        cumulative=None,
+        autobinx=None,
+        nbinsx=None,
+        xbins=None,
+        autobiny=None,
+        nbinsy=None,
+        ybins=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Histogram trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Histogram) for their descriptions
+
+        Returns
+        -------
+        Histogram
+        """
+        from ipyplotly.datatypes.trace import Histogram
+        new_trace = Histogram(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            y=y,
+            text=text,
+            orientation=orientation,
+            histfunc=histfunc,
+            histnorm=histnorm,
+            cumulative=cumulative,
+            autobinx=autobinx,
+            nbinsx=nbinsx,
+            xbins=xbins,
+            autobiny=autobiny,
+            nbinsy=nbinsy,
+            ybins=ybins,
+            marker=marker,
+            selected=selected,
+            unselected=unselected,
+            error_y=error_y,
+            error_x=error_x,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_histogram2d(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        z=None,
+        marker=None,
+        histnorm=None,
+        histfunc=None,
+        autobinx=None,
+        nbinsx=None,
+        xbins=None,
+        autobiny=None,
+        nbinsy=None,
+        ybins=None,
+        xgap=None,
+        ygap=None,
+        zsmooth=None,
+        zhoverformat=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Histogram2D trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Histogram2D) for their descriptions
+
+        Returns
+        -------
+        Histogram2D
+        """
+        from ipyplotly.datatypes.trace import Histogram2D
+        new_trace = Histogram2D(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            y=y,
+            z=z,
+            marker=marker,
+            histnorm=histnorm,
+            histfunc=histfunc,
+            autobinx=autobinx,
+            nbinsx=nbinsx,
+            xbins=xbins,
+            autobiny=autobiny,
+            nbinsy=nbinsy,
+            ybins=ybins,
+            xgap=xgap,
+            ygap=ygap,
+            zsmooth=zsmooth,
+            zhoverformat=zhoverformat,
+            zauto=zauto,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            zsrc=zsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_histogram2dcontour(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        z=None,
+        marker=None,
+        histnorm=None,
+        histfunc=None,
+        autobinx=None,
+        nbinsx=None,
+        xbins=None,
+        autobiny=None,
+        nbinsy=None,
+        ybins=None,
+        autocontour=None,
+        ncontours=None,
+        contours=None,
+        line=None,
+        zhoverformat=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Histogram2Dcontour trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Histogram2Dcontour) for their descriptions
+
+        Returns
+        -------
+        Histogram2Dcontour
+        """
+        from ipyplotly.datatypes.trace import Histogram2Dcontour
+        new_trace = Histogram2Dcontour(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            y=y,
+            z=z,
+            marker=marker,
+            histnorm=histnorm,
+            histfunc=histfunc,
+            autobinx=autobinx,
+            nbinsx=nbinsx,
+            xbins=xbins,
+            autobiny=autobiny,
+            nbinsy=nbinsy,
+            ybins=ybins,
+            autocontour=autocontour,
+            ncontours=ncontours,
+            contours=contours,
+            line=line,
+            zhoverformat=zhoverformat,
+            zauto=zauto,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            zsrc=zsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_pie(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        labels=None,
+        label0=None,
+        dlabel=None,
+        values=None,
+        marker=None,
+        text=None,
+        hovertext=None,
+        scalegroup=None,
+        textinfo=None,
+        textposition=None,
+        textfont=None,
+        insidetextfont=None,
+        outsidetextfont=None,
+        domain=None,
+        hole=None,
+        sort=None,
+        direction=None,
+        rotation=None,
+        pull=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        labelssrc=None,
+        valuessrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        pullsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Pie trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Pie) for their descriptions
+
+        Returns
+        -------
+        Pie
+        """
+        from ipyplotly.datatypes.trace import Pie
+        new_trace = Pie(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            labels=labels,
+            label0=label0,
+            dlabel=dlabel,
+            values=values,
+            marker=marker,
+            text=text,
+            hovertext=hovertext,
+            scalegroup=scalegroup,
+            textinfo=textinfo,
+            textposition=textposition,
+            textfont=textfont,
+            insidetextfont=insidetextfont,
+            outsidetextfont=outsidetextfont,
+            domain=domain,
+            hole=hole,
+            sort=sort,
+            direction=direction,
+            rotation=rotation,
+            pull=pull,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            labelssrc=labelssrc,
+            valuessrc=valuessrc,
+            textsrc=textsrc,
+            hovertextsrc=hovertextsrc,
+            textpositionsrc=textpositionsrc,
+            pullsrc=pullsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_contour(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        transpose=None,
+        xtype=None,
+        ytype=None,
+        zhoverformat=None,
+        connectgaps=None,
+        autocontour=None,
+        ncontours=None,
+        contours=None,
+        line=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Contour trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Contour) for their descriptions
+
+        Returns
+        -------
+        Contour
+        """
+        from ipyplotly.datatypes.trace import Contour
+        new_trace = Contour(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            z=z,
+            x=x,
+            x0=x0,
+            dx=dx,
+            y=y,
+            y0=y0,
+            dy=dy,
+            text=text,
+            transpose=transpose,
+            xtype=xtype,
+            ytype=ytype,
+            zhoverformat=zhoverformat,
+            connectgaps=connectgaps,
+            autocontour=autocontour,
+            ncontours=ncontours,
+            contours=contours,
+            line=line,
+            zauto=zauto,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            zsrc=zsrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_scatterternary(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        a=None,
+        b=None,
+        c=None,
+        sum=None,
+        mode=None,
+        text=None,
+        hovertext=None,
+        line=None,
+        connectgaps=None,
+        cliponaxis=None,
+        fill=None,
+        fillcolor=None,
+        marker=None,
+        textfont=None,
+        textposition=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        subplot=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        asrc=None,
+        bsrc=None,
+        csrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Scatterternary trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Scatterternary) for their descriptions
+
+        Returns
+        -------
+        Scatterternary
+        """
+        from ipyplotly.datatypes.trace import Scatterternary
+        new_trace = Scatterternary(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            a=a,
+            b=b,
+            c=c,
+            sum=sum,
+            mode=mode,
+            text=text,
+            hovertext=hovertext,
+            line=line,
+            connectgaps=connectgaps,
+            cliponaxis=cliponaxis,
+            fill=fill,
+            fillcolor=fillcolor,
+            marker=marker,
+            textfont=textfont,
+            textposition=textposition,
+            selected=selected,
+            unselected=unselected,
+            hoveron=hoveron,
+            subplot=subplot,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            asrc=asrc,
+            bsrc=bsrc,
+            csrc=csrc,
+            textsrc=textsrc,
+            hovertextsrc=hovertextsrc,
+            textpositionsrc=textpositionsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_violin(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        y=None,
+        x=None,
+        x0=None,
+        y0=None,
+        orientation=None,
+        bandwidth=None,
+        scalegroup=None,
+        scalemode=None,
+        spanmode=None,
+        span=None,
+        line=None,
+        fillcolor=None,
+        points=None,
+        jitter=None,
+        pointpos=None,
+        marker=None,
+        text=None,
+        box=None,
+        meanline=None,
+        side=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        ysrc=None,
+        xsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Violin trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Violin) for their descriptions
+
+        Returns
+        -------
+        Violin
+        """
+        from ipyplotly.datatypes.trace import Violin
+        new_trace = Violin(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            y=y,
+            x=x,
+            x0=x0,
+            y0=y0,
+            orientation=orientation,
+            bandwidth=bandwidth,
+            scalegroup=scalegroup,
+            scalemode=scalemode,
+            spanmode=spanmode,
+            span=span,
+            line=line,
+            fillcolor=fillcolor,
+            points=points,
+            jitter=jitter,
+            pointpos=pointpos,
+            marker=marker,
+            text=text,
+            box=box,
+            meanline=meanline,
+            side=side,
+            selected=selected,
+            unselected=unselected,
+            hoveron=hoveron,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            ysrc=ysrc,
+            xsrc=xsrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_scatter3d(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        z=None,
+        text=None,
+        hovertext=None,
+        mode=None,
+        surfaceaxis=None,
+        surfacecolor=None,
+        projection=None,
+        connectgaps=None,
+        line=None,
+        marker=None,
+        textposition=None,
+        textfont=None,
+        error_x=None,
+        error_y=None,
+        error_z=None,
+        xcalendar=None,
+        ycalendar=None,
+        zcalendar=None,
+        scene=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Scatter3D trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Scatter3D) for their descriptions
+
+        Returns
+        -------
+        Scatter3D
+        """
+        from ipyplotly.datatypes.trace import Scatter3D
+        new_trace = Scatter3D(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            y=y,
+            z=z,
+            text=text,
+            hovertext=hovertext,
+            mode=mode,
+            surfaceaxis=surfaceaxis,
+            surfacecolor=surfacecolor,
+            projection=projection,
+            connectgaps=connectgaps,
+            line=line,
+            marker=marker,
+            textposition=textposition,
+            textfont=textfont,
+            error_x=error_x,
+            error_y=error_y,
+            error_z=error_z,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            zcalendar=zcalendar,
+            scene=scene,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            zsrc=zsrc,
+            textsrc=textsrc,
+            hovertextsrc=hovertextsrc,
+            textpositionsrc=textpositionsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_surface(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        y=None,
+        text=None,
+        surfacecolor=None,
+        cauto=None,
+        cmin=None,
+        cmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        contours=None,
+        hidesurface=None,
+        lightposition=None,
+        lighting=None,
+        xcalendar=None,
+        ycalendar=None,
+        zcalendar=None,
+        scene=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        surfacecolorsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Surface trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Surface) for their descriptions
+
+        Returns
+        -------
+        Surface
+        """
+        from ipyplotly.datatypes.trace import Surface
+        new_trace = Surface(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            z=z,
+            x=x,
+            y=y,
+            text=text,
+            surfacecolor=surfacecolor,
+            cauto=cauto,
+            cmin=cmin,
+            cmax=cmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            contours=contours,
+            hidesurface=hidesurface,
+            lightposition=lightposition,
+            lighting=lighting,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            zcalendar=zcalendar,
+            scene=scene,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            zsrc=zsrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            surfacecolorsrc=surfacecolorsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_mesh3d(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        color=None,
+        colorscale=None,
+        cauto=None,
+        cmax=None,
+        cmin=None,
+        autocolorscale=None,
+        reversescale=None,
+        x=None,
+        y=None,
+        z=None,
+        i=None,
+        j=None,
+        k=None,
+        delaunayaxis=None,
+        alphahull=None,
+        intensity=None,
+        vertexcolor=None,
+        facecolor=None,
+        flatshading=None,
+        contour=None,
+        showscale=None,
+        colorbar=None,
+        lightposition=None,
+        lighting=None,
+        xcalendar=None,
+        ycalendar=None,
+        zcalendar=None,
+        scene=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        isrc=None,
+        jsrc=None,
+        ksrc=None,
+        intensitysrc=None,
+        vertexcolorsrc=None,
+        facecolorsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Mesh3D trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Mesh3D) for their descriptions
+
+        Returns
+        -------
+        Mesh3D
+        """
+        from ipyplotly.datatypes.trace import Mesh3D
+        new_trace = Mesh3D(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            color=color,
+            colorscale=colorscale,
+            cauto=cauto,
+            cmax=cmax,
+            cmin=cmin,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            x=x,
+            y=y,
+            z=z,
+            i=i,
+            j=j,
+            k=k,
+            delaunayaxis=delaunayaxis,
+            alphahull=alphahull,
+            intensity=intensity,
+            vertexcolor=vertexcolor,
+            facecolor=facecolor,
+            flatshading=flatshading,
+            contour=contour,
+            showscale=showscale,
+            colorbar=colorbar,
+            lightposition=lightposition,
+            lighting=lighting,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            zcalendar=zcalendar,
+            scene=scene,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            zsrc=zsrc,
+            isrc=isrc,
+            jsrc=jsrc,
+            ksrc=ksrc,
+            intensitysrc=intensitysrc,
+            vertexcolorsrc=vertexcolorsrc,
+            facecolorsrc=facecolorsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_scattergeo(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        lon=None,
+        lat=None,
+        locations=None,
+        locationmode=None,
+        mode=None,
+        text=None,
+        hovertext=None,
+        textfont=None,
+        textposition=None,
+        line=None,
+        connectgaps=None,
+        marker=None,
+        fill=None,
+        fillcolor=None,
+        selected=None,
+        unselected=None,
+        geo=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        lonsrc=None,
+        latsrc=None,
+        locationssrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Scattergeo trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Scattergeo) for their descriptions
+
+        Returns
+        -------
+        Scattergeo
+        """
+        from ipyplotly.datatypes.trace import Scattergeo
+        new_trace = Scattergeo(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            lon=lon,
+            lat=lat,
+            locations=locations,
+            locationmode=locationmode,
+            mode=mode,
+            text=text,
+            hovertext=hovertext,
+            textfont=textfont,
+            textposition=textposition,
+            line=line,
+            connectgaps=connectgaps,
+            marker=marker,
+            fill=fill,
+            fillcolor=fillcolor,
+            selected=selected,
+            unselected=unselected,
+            geo=geo,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            lonsrc=lonsrc,
+            latsrc=latsrc,
+            locationssrc=locationssrc,
+            textsrc=textsrc,
+            hovertextsrc=hovertextsrc,
+            textpositionsrc=textpositionsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_choropleth(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        locations=None,
+        locationmode=None,
+        z=None,
+        text=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        geo=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        locationssrc=None,
+        zsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Choropleth trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Choropleth) for their descriptions
+
+        Returns
+        -------
+        Choropleth
+        """
+        from ipyplotly.datatypes.trace import Choropleth
+        new_trace = Choropleth(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            locations=locations,
+            locationmode=locationmode,
+            z=z,
+            text=text,
+            marker=marker,
+            selected=selected,
+            unselected=unselected,
+            zauto=zauto,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            geo=geo,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            locationssrc=locationssrc,
+            zsrc=zsrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_scattergl(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        mode=None,
+        line=None,
+        marker=None,
+        connectgaps=None,
+        fill=None,
+        fillcolor=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Scattergl trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Scattergl) for their descriptions
+
+        Returns
+        -------
+        Scattergl
+        """
+        from ipyplotly.datatypes.trace import Scattergl
+        new_trace = Scattergl(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            x0=x0,
+            dx=dx,
+            y=y,
+            y0=y0,
+            dy=dy,
+            text=text,
+            mode=mode,
+            line=line,
+            marker=marker,
+            connectgaps=connectgaps,
+            fill=fill,
+            fillcolor=fillcolor,
+            error_y=error_y,
+            error_x=error_x,
+            xcalendar=xcalendar,
+            ycalendar=ycalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_pointcloud(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        xy=None,
+        indices=None,
+        xbounds=None,
+        ybounds=None,
+        text=None,
+        marker=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        xysrc=None,
+        indicessrc=None,
+        xboundssrc=None,
+        yboundssrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Pointcloud trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Pointcloud) for their descriptions
+
+        Returns
+        -------
+        Pointcloud
+        """
+        from ipyplotly.datatypes.trace import Pointcloud
+        new_trace = Pointcloud(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            y=y,
+            xy=xy,
+            indices=indices,
+            xbounds=xbounds,
+            ybounds=ybounds,
+            text=text,
+            marker=marker,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            xysrc=xysrc,
+            indicessrc=indicessrc,
+            xboundssrc=xboundssrc,
+            yboundssrc=yboundssrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_heatmapgl(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        transpose=None,
+        xtype=None,
+        ytype=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Heatmapgl trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Heatmapgl) for their descriptions
+
+        Returns
+        -------
+        Heatmapgl
+        """
+        from ipyplotly.datatypes.trace import Heatmapgl
+        new_trace = Heatmapgl(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            z=z,
+            x=x,
+            x0=x0,
+            dx=dx,
+            y=y,
+            y0=y0,
+            dy=dy,
+            text=text,
+            transpose=transpose,
+            xtype=xtype,
+            ytype=ytype,
+            zauto=zauto,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            zsrc=zsrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_parcoords(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        labelfont=None,
+        tickfont=None,
+        rangefont=None,
+        dimensions=None,
+        line=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Parcoords trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Parcoords) for their descriptions
+
+        Returns
+        -------
+        Parcoords
+        """
+        from ipyplotly.datatypes.trace import Parcoords
+        new_trace = Parcoords(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            domain=domain,
+            labelfont=labelfont,
+            tickfont=tickfont,
+            rangefont=rangefont,
+            dimensions=dimensions,
+            line=line,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_parcats(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        tooltip=None,
+        hovermode=None,
+        bundlecolors=None,
+        dimensions=None,
+        marker=None,
+        counts=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        countssrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Parcats trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Parcats) for their descriptions
+
+        Returns
+        -------
+        Parcats
+        """
+        from ipyplotly.datatypes.trace import Parcats
+        new_trace = Parcats(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            domain=domain,
+            tooltip=tooltip,
+            hovermode=hovermode,
+            bundlecolors=bundlecolors,
+            dimensions=dimensions,
+            marker=marker,
+            counts=counts,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            countssrc=countssrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_scattermapbox(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        lon=None,
+        lat=None,
+        mode=None,
+        text=None,
+        hovertext=None,
+        line=None,
+        connectgaps=None,
+        marker=None,
+        fill=None,
+        fillcolor=None,
+        textfont=None,
+        textposition=None,
+        selected=None,
+        unselected=None,
+        subplot=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        lonsrc=None,
+        latsrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Scattermapbox trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Scattermapbox) for their descriptions
+
+        Returns
+        -------
+        Scattermapbox
+        """
+        from ipyplotly.datatypes.trace import Scattermapbox
+        new_trace = Scattermapbox(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            lon=lon,
+            lat=lat,
+            mode=mode,
+            text=text,
+            hovertext=hovertext,
+            line=line,
+            connectgaps=connectgaps,
+            marker=marker,
+            fill=fill,
+            fillcolor=fillcolor,
+            textfont=textfont,
+            textposition=textposition,
+            selected=selected,
+            unselected=unselected,
+            subplot=subplot,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            lonsrc=lonsrc,
+            latsrc=latsrc,
+            textsrc=textsrc,
+            hovertextsrc=hovertextsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_sankey(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        orientation=None,
+        valueformat=None,
+        valuesuffix=None,
+        arrangement=None,
+        textfont=None,
+        node=None,
+        link=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Sankey trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Sankey) for their descriptions
+
+        Returns
+        -------
+        Sankey
+        """
+        from ipyplotly.datatypes.trace import Sankey
+        new_trace = Sankey(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            domain=domain,
+            orientation=orientation,
+            valueformat=valueformat,
+            valuesuffix=valuesuffix,
+            arrangement=arrangement,
+            textfont=textfont,
+            node=node,
+            link=link,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_table(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        columnwidth=None,
+        columnorder=None,
+        header=None,
+        cells=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        columnwidthsrc=None,
+        columnordersrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Table trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Table) for their descriptions
+
+        Returns
+        -------
+        Table
+        """
+        from ipyplotly.datatypes.trace import Table
+        new_trace = Table(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            domain=domain,
+            columnwidth=columnwidth,
+            columnorder=columnorder,
+            header=header,
+            cells=cells,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            columnwidthsrc=columnwidthsrc,
+            columnordersrc=columnordersrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_carpet(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        carpet=None,
+        x=None,
+        y=None,
+        a=None,
+        a0=None,
+        da=None,
+        b=None,
+        b0=None,
+        db=None,
+        cheaterslope=None,
+        aaxis=None,
+        baxis=None,
+        font=None,
+        color=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        asrc=None,
+        bsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Carpet trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Carpet) for their descriptions
+
+        Returns
+        -------
+        Carpet
+        """
+        from ipyplotly.datatypes.trace import Carpet
+        new_trace = Carpet(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            carpet=carpet,
+            x=x,
+            y=y,
+            a=a,
+            a0=a0,
+            da=da,
+            b=b,
+            b0=b0,
+            db=db,
+            cheaterslope=cheaterslope,
+            aaxis=aaxis,
+            baxis=baxis,
+            font=font,
+            color=color,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            ysrc=ysrc,
+            asrc=asrc,
+            bsrc=bsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_scattercarpet(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        carpet=None,
+        a=None,
+        b=None,
+        mode=None,
+        text=None,
+        line=None,
+        connectgaps=None,
+        fill=None,
+        fillcolor=None,
+        marker=None,
+        textfont=None,
+        textposition=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        asrc=None,
+        bsrc=None,
+        textsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Scattercarpet trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Scattercarpet) for their descriptions
+
+        Returns
+        -------
+        Scattercarpet
+        """
+        from ipyplotly.datatypes.trace import Scattercarpet
+        new_trace = Scattercarpet(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            carpet=carpet,
+            a=a,
+            b=b,
+            mode=mode,
+            text=text,
+            line=line,
+            connectgaps=connectgaps,
+            fill=fill,
+            fillcolor=fillcolor,
+            marker=marker,
+            textfont=textfont,
+            textposition=textposition,
+            selected=selected,
+            unselected=unselected,
+            hoveron=hoveron,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            asrc=asrc,
+            bsrc=bsrc,
+            textsrc=textsrc,
+            textpositionsrc=textpositionsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_contourcarpet(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        carpet=None,
+        z=None,
+        a=None,
+        a0=None,
+        da=None,
+        b=None,
+        b0=None,
+        db=None,
+        text=None,
+        transpose=None,
+        atype=None,
+        btype=None,
+        mode=None,
+        connectgaps=None,
+        fillcolor=None,
+        autocontour=None,
+        ncontours=None,
+        contours=None,
+        line=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        asrc=None,
+        bsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Contourcarpet trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Contourcarpet) for their descriptions
+
+        Returns
+        -------
+        Contourcarpet
+        """
+        from ipyplotly.datatypes.trace import Contourcarpet
+        new_trace = Contourcarpet(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            carpet=carpet,
+            z=z,
+            a=a,
+            a0=a0,
+            da=da,
+            b=b,
+            b0=b0,
+            db=db,
+            text=text,
+            transpose=transpose,
+            atype=atype,
+            btype=btype,
+            mode=mode,
+            connectgaps=connectgaps,
+            fillcolor=fillcolor,
+            autocontour=autocontour,
+            ncontours=ncontours,
+            contours=contours,
+            line=line,
+            zauto=zauto,
+            zmin=zmin,
+            zmax=zmax,
+            colorscale=colorscale,
+            autocolorscale=autocolorscale,
+            reversescale=reversescale,
+            showscale=showscale,
+            colorbar=colorbar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            zsrc=zsrc,
+            asrc=asrc,
+            bsrc=bsrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_ohlc(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        open=None,
+        high=None,
+        low=None,
+        close=None,
+        line=None,
+        increasing=None,
+        decreasing=None,
+        text=None,
+        tickwidth=None,
+        xcalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        opensrc=None,
+        highsrc=None,
+        lowsrc=None,
+        closesrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Ohlc trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Ohlc) for their descriptions
+
+        Returns
+        -------
+        Ohlc
+        """
+        from ipyplotly.datatypes.trace import Ohlc
+        new_trace = Ohlc(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            open=open,
+            high=high,
+            low=low,
+            close=close,
+            line=line,
+            increasing=increasing,
+            decreasing=decreasing,
+            text=text,
+            tickwidth=tickwidth,
+            xcalendar=xcalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            opensrc=opensrc,
+            highsrc=highsrc,
+            lowsrc=lowsrc,
+            closesrc=closesrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_candlestick(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        open=None,
+        high=None,
+        low=None,
+        close=None,
+        line=None,
+        increasing=None,
+        decreasing=None,
+        text=None,
+        whiskerwidth=None,
+        xcalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        opensrc=None,
+        highsrc=None,
+        lowsrc=None,
+        closesrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Candlestick trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Candlestick) for their descriptions
+
+        Returns
+        -------
+        Candlestick
+        """
+        from ipyplotly.datatypes.trace import Candlestick
+        new_trace = Candlestick(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            x=x,
+            open=open,
+            high=high,
+            low=low,
+            close=close,
+            line=line,
+            increasing=increasing,
+            decreasing=decreasing,
+            text=text,
+            whiskerwidth=whiskerwidth,
+            xcalendar=xcalendar,
+            xaxis=xaxis,
+            yaxis=yaxis,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            xsrc=xsrc,
+            opensrc=opensrc,
+            highsrc=highsrc,
+            lowsrc=lowsrc,
+            closesrc=closesrc,
+            textsrc=textsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
+
+    def add_area(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        r=None,
+        t=None,
+        marker=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        rsrc=None,
+        tsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        """
+        Add a new Area trace
+
+        The parameters are the properties of the trace, see
+        help(ipyplotly.datatypes.trace.Area) for their descriptions
+
+        Returns
+        -------
+        Area
+        """
+        from ipyplotly.datatypes.trace import Area
+        new_trace = Area(
+            visible=visible,
+            showlegend=showlegend,
+            legendgroup=legendgroup,
+            opacity=opacity,
+            name=name,
+            uid=uid,
+            ids=ids,
+            customdata=customdata,
+            selectedpoints=selectedpoints,
+            hoverinfo=hoverinfo,
+            hoverlabel=hoverlabel,
+            stream=stream,
+            r=r,
+            t=t,
+            marker=marker,
+            idssrc=idssrc,
+            customdatasrc=customdatasrc,
+            hoverinfosrc=hoverinfosrc,
+            rsrc=rsrc,
+            tsrc=tsrc,
+            transforms=transforms,
+            **kwargs
+        )
+        return self.add_traces(new_trace)[0]
@@ -0,0 +1,70 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseFrameHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators import (frame as v_frame)
+
+
+class Frame(BaseFrameHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'frame'
+
+    # group
+    # -----
+    group: str = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # traces
+    # ------
+    traces: Any = SimpleProperty()
+
+    # baseframe
+    # ---------
+    baseframe: str = SimpleProperty()
+
+    # data
+    # ----
+    data: Any = ItemProperty()
+
+    # layout
+    # ------
+    layout: Any = ItemProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return ''
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'group': v_frame.GroupValidator(),
+            'name': v_frame.NameValidator(),
+            'traces': v_frame.TracesValidator(),
+            'baseframe': v_frame.BaseframeValidator(),
+            'data': v_frame.DataValidator(),
+            'layout': v_frame.LayoutValidator(),
+        }
+
+    def __init__(self, group=None, name=None, traces=None, baseframe=None, data=None, layout=None, **kwargs):
+        super().__init__('frames', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.group = group
+        self.name = name
+        self.traces = traces
+        self.baseframe = baseframe
+        self.data = data
+        self.layout = layout
@@ -0,0 +1,353 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators import (layout as v_layout)
+from ipyplotly.datatypes import (layout as d_layout)
+
+
+class Layout(BaseLayoutType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout'
+
+    # font
+    # ----
+    font: 'd_layout.Font' = CompoundProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_layout.Titlefont' = CompoundProperty()
+
+    # autosize
+    # --------
+    autosize: bool = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # height
+    # ------
+    height: Number = SimpleProperty()
+
+    # margin
+    # ------
+    margin: 'd_layout.Margin' = CompoundProperty()
+
+    # paper_bgcolor
+    # -------------
+    paper_bgcolor: str = SimpleProperty()
+
+    # plot_bgcolor
+    # ------------
+    plot_bgcolor: str = SimpleProperty()
+
+    # separators
+    # ----------
+    separators: str = SimpleProperty()
+
+    # hidesources
+    # -----------
+    hidesources: bool = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # colorway
+    # --------
+    colorway: List = SimpleProperty()
+
+    # dragmode
+    # --------
+    dragmode: Any = SimpleProperty()
+
+    # hovermode
+    # ---------
+    hovermode: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_layout.Hoverlabel' = CompoundProperty()
+
+    # calendar
+    # --------
+    calendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: 'd_layout.Xaxis' = CompoundProperty()
+
+    # yaxis
+    # -----
+    yaxis: 'd_layout.Yaxis' = CompoundProperty()
+
+    # ternary
+    # -------
+    ternary: 'd_layout.Ternary' = CompoundProperty()
+
+    # scene
+    # -----
+    scene: 'd_layout.Scene' = CompoundProperty()
+
+    # geo
+    # ---
+    geo: 'd_layout.Geo' = CompoundProperty()
+
+    # mapbox
+    # ------
+    mapbox: 'd_layout.Mapbox' = CompoundProperty()
+
+    # radialaxis
+    # ----------
+    radialaxis: 'd_layout.Radialaxis' = CompoundProperty()
+
+    # angularaxis
+    # -----------
+    angularaxis: 'd_layout.Angularaxis' = CompoundProperty()
+
+    # direction
+    # ---------
+    direction: Any = SimpleProperty()
+
+    # orientation
+    # -----------
+    orientation: Number = SimpleProperty()
+
+    # legend
+    # ------
+    legend: 'd_layout.Legend' = CompoundProperty()
+
+    # annotations
+    # -----------
+    annotations: 'Tuple[d_layout.Annotation]' = CompoundArrayProperty()
+
+    # shapes
+    # ------
+    shapes: 'Tuple[d_layout.Shape]' = CompoundArrayProperty()
+
+    # images
+    # ------
+    images: 'Tuple[d_layout.Image]' = CompoundArrayProperty()
+
+    # updatemenus
+    # -----------
+    updatemenus: 'Tuple[d_layout.Updatemenu]' = CompoundArrayProperty()
+
+    # sliders
+    # -------
+    sliders: 'Tuple[d_layout.Slider]' = CompoundArrayProperty()
+
+    # violinmode
+    # ----------
+    violinmode: Any = SimpleProperty()
+
+    # violingap
+    # ---------
+    violingap: Number = SimpleProperty()
+
+    # violingroupgap
+    # --------------
+    violingroupgap: Number = SimpleProperty()
+
+    # hiddenlabels
+    # ------------
+    hiddenlabels: List = SimpleProperty()
+
+    # hiddenlabelssrc
+    # ---------------
+    hiddenlabelssrc: str = SimpleProperty()
+
+    # barmode
+    # -------
+    barmode: Any = SimpleProperty()
+
+    # barnorm
+    # -------
+    barnorm: Any = SimpleProperty()
+
+    # bargap
+    # ------
+    bargap: Number = SimpleProperty()
+
+    # bargroupgap
+    # -----------
+    bargroupgap: Number = SimpleProperty()
+
+    # boxmode
+    # -------
+    boxmode: Any = SimpleProperty()
+
+    # boxgap
+    # ------
+    boxgap: Number = SimpleProperty()
+
+    # boxgroupgap
+    # -----------
+    boxgroupgap: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return ''
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'font': v_layout.FontValidator(),
+            'title': v_layout.TitleValidator(),
+            'titlefont': v_layout.TitlefontValidator(),
+            'autosize': v_layout.AutosizeValidator(),
+            'width': v_layout.WidthValidator(),
+            'height': v_layout.HeightValidator(),
+            'margin': v_layout.MarginValidator(),
+            'paper_bgcolor': v_layout.PaperBgcolorValidator(),
+            'plot_bgcolor': v_layout.PlotBgcolorValidator(),
+            'separators': v_layout.SeparatorsValidator(),
+            'hidesources': v_layout.HidesourcesValidator(),
+            'showlegend': v_layout.ShowlegendValidator(),
+            'colorway': v_layout.ColorwayValidator(),
+            'dragmode': v_layout.DragmodeValidator(),
+            'hovermode': v_layout.HovermodeValidator(),
+            'hoverlabel': v_layout.HoverlabelValidator(),
+            'calendar': v_layout.CalendarValidator(),
+            'xaxis': v_layout.XaxisValidator(),
+            'yaxis': v_layout.YaxisValidator(),
+            'ternary': v_layout.TernaryValidator(),
+            'scene': v_layout.SceneValidator(),
+            'geo': v_layout.GeoValidator(),
+            'mapbox': v_layout.MapboxValidator(),
+            'radialaxis': v_layout.RadialaxisValidator(),
+            'angularaxis': v_layout.AngularaxisValidator(),
+            'direction': v_layout.DirectionValidator(),
+            'orientation': v_layout.OrientationValidator(),
+            'legend': v_layout.LegendValidator(),
+            'annotations': v_layout.AnnotationsValidator(),
+            'shapes': v_layout.ShapesValidator(),
+            'images': v_layout.ImagesValidator(),
+            'updatemenus': v_layout.UpdatemenusValidator(),
+            'sliders': v_layout.SlidersValidator(),
+            'violinmode': v_layout.ViolinmodeValidator(),
+            'violingap': v_layout.ViolingapValidator(),
+            'violingroupgap': v_layout.ViolingroupgapValidator(),
+            'hiddenlabels': v_layout.HiddenlabelsValidator(),
+            'hiddenlabelssrc': v_layout.HiddenlabelssrcValidator(),
+            'barmode': v_layout.BarmodeValidator(),
+            'barnorm': v_layout.BarnormValidator(),
+            'bargap': v_layout.BargapValidator(),
+            'bargroupgap': v_layout.BargroupgapValidator(),
+            'boxmode': v_layout.BoxmodeValidator(),
+            'boxgap': v_layout.BoxgapValidator(),
+            'boxgroupgap': v_layout.BoxgroupgapValidator(),
+        }
+
+    def __init__(
+        self,
+        font=None,
+        title=None,
+        titlefont=None,
+        autosize=None,
+        width=None,
+        height=None,
+        margin=None,
+        paper_bgcolor=None,
+        plot_bgcolor=None,
+        separators=None,
+        hidesources=None,
+        showlegend=None,
+        colorway=None,
+        dragmode=None,
+        hovermode=None,
+        hoverlabel=None,
+        calendar=None,
+        xaxis=None,
+        yaxis=None,
+        ternary=None,
+        scene=None,
+        geo=None,
+        mapbox=None,
+        radialaxis=None,
+        angularaxis=None,
+        direction=None,
+        orientation=None,
+        legend=None,
+        annotations=None,
+        shapes=None,
+        images=None,
+        updatemenus=None,
+        sliders=None,
+        violinmode=None,
+        violingap=None,
+        violingroupgap=None,
+        hiddenlabels=None,
+        hiddenlabelssrc=None,
+        barmode=None,
+        barnorm=None,
+        bargap=None,
+        bargroupgap=None,
+        boxmode=None,
+        boxgap=None,
+        boxgroupgap=None,
+        **kwargs
+    ):
+        super().__init__('layout', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.font = font
+        self.title = title
+        self.titlefont = titlefont
+        self.autosize = autosize
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.paper_bgcolor = paper_bgcolor
+        self.plot_bgcolor = plot_bgcolor
+        self.separators = separators
+        self.hidesources = hidesources
+        self.showlegend = showlegend
+        self.colorway = colorway
+        self.dragmode = dragmode
+        self.hovermode = hovermode
+        self.hoverlabel = hoverlabel
+        self.calendar = calendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.ternary = ternary
+        self.scene = scene
+        self.geo = geo
+        self.mapbox = mapbox
+        self.radialaxis = radialaxis
+        self.angularaxis = angularaxis
+        self.direction = direction
+        self.orientation = orientation
+        self.legend = legend
+        self.annotations = annotations
+        self.shapes = shapes
+        self.images = images
+        self.updatemenus = updatemenus
+        self.sliders = sliders
+        self.violinmode = violinmode
+        self.violingap = violingap
+        self.violingroupgap = violingroupgap
+        self.hiddenlabels = hiddenlabels
+        self.hiddenlabelssrc = hiddenlabelssrc
+        self.barmode = barmode
+        self.barnorm = barnorm
+        self.bargap = bargap
+        self.bargroupgap = bargroupgap
+        self.boxmode = boxmode
+        self.boxgap = boxgap
+        self.boxgroupgap = boxgroupgap
@@ -0,0 +1,72 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._font import Font
+    from ._titlefont import Titlefont
+    from ._margin import Margin
+    from ._hoverlabel import Hoverlabel
+    from ._xaxis import Xaxis
+    from ._yaxis import Yaxis
+    from ._ternary import Ternary
+    from ._scene import Scene
+    from ._geo import Geo
+    from ._mapbox import Mapbox
+    from ._radialaxis import Radialaxis
+    from ._angularaxis import Angularaxis
+    from ._legend import Legend
+    from ._annotation import Annotation
+    from ._shape import Shape
+    from ._image import Image
+    from ._updatemenu import Updatemenu
+    from ._slider import Slider
+    from . import slider
+    from . import updatemenu
+    from . import shape
+    from . import annotation
+    from . import legend
+    from . import mapbox
+    from . import geo
+    from . import scene
+    from . import ternary
+    from . import yaxis
+    from . import xaxis
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.slider',
+            '.updatemenu',
+            '.shape',
+            '.annotation',
+            '.legend',
+            '.mapbox',
+            '.geo',
+            '.scene',
+            '.ternary',
+            '.yaxis',
+            '.xaxis',
+            '.hoverlabel',
+        ],
+        [
+            '._font.Font',
+            '._titlefont.Titlefont',
+            '._margin.Margin',
+            '._hoverlabel.Hoverlabel',
+            '._xaxis.Xaxis',
+            '._yaxis.Yaxis',
+            '._ternary.Ternary',
+            '._scene.Scene',
+            '._geo.Geo',
+            '._mapbox.Mapbox',
+            '._radialaxis.Radialaxis',
+            '._angularaxis.Angularaxis',
+            '._legend.Legend',
+            '._annotation.Annotation',
+            '._shape.Shape',
+            '._image.Image',
+            '._updatemenu.Updatemenu',
+            '._slider.Slider',
+        ]
+    )
@@ -0,0 +1,107 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (angularaxis as v_angularaxis)
+
+
+class Angularaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.angularaxis'
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # domain
+    # ------
+    domain: List = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # tickorientation
+    # ---------------
+    tickorientation: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # endpadding
+    # ----------
+    endpadding: Number = SimpleProperty()
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'range': v_angularaxis.RangeValidator(),
+            'domain': v_angularaxis.DomainValidator(),
+            'showline': v_angularaxis.ShowlineValidator(),
+            'showticklabels': v_angularaxis.ShowticklabelsValidator(),
+            'tickorientation': v_angularaxis.TickorientationValidator(),
+            'ticklen': v_angularaxis.TicklenValidator(),
+            'tickcolor': v_angularaxis.TickcolorValidator(),
+            'ticksuffix': v_angularaxis.TicksuffixValidator(),
+            'endpadding': v_angularaxis.EndpaddingValidator(),
+            'visible': v_angularaxis.VisibleValidator(),
+        }
+
+    def __init__(
+        self,
+        range=None,
+        domain=None,
+        showline=None,
+        showticklabels=None,
+        tickorientation=None,
+        ticklen=None,
+        tickcolor=None,
+        ticksuffix=None,
+        endpadding=None,
+        visible=None,
+        **kwargs
+    ):
+        super().__init__('angularaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.range = range
+        self.domain = domain
+        self.showline = showline
+        self.showticklabels = showticklabels
+        self.tickorientation = tickorientation
+        self.ticklen = ticklen
+        self.tickcolor = tickcolor
+        self.ticksuffix = ticksuffix
+        self.endpadding = endpadding
+        self.visible = visible
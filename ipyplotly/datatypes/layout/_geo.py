@@ -0,0 +1,241 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (geo as v_geo)
+from ipyplotly.datatypes.layout import (geo as d_geo)
+
+
+class Geo(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.geo'
+
+    # domain
+    # ------
+    domain: 'd_geo.Domain' = CompoundProperty()
+
+    # resolution
+    # ----------
+    resolution: Any = SimpleProperty()
+
+    # scope
+    # -----
+    scope: Any = SimpleProperty()
+
+    # projection
+    # ----------
+    projection: 'd_geo.Projection' = CompoundProperty()
+
+    # center
+    # ------
+    center: 'd_geo.Center' = CompoundProperty()
+
+    # showcoastlines
+    # --------------
+    showcoastlines: bool = SimpleProperty()
+
+    # coastlinecolor
+    # --------------
+    coastlinecolor: str = SimpleProperty()
+
+    # coastlinewidth
+    # --------------
+    coastlinewidth: Number = SimpleProperty()
+
+    # showland
+    # --------
+    showland: bool = SimpleProperty()
+
+    # landcolor
+    # ---------
+    landcolor: str = SimpleProperty()
+
+    # showocean
+    # ---------
+    showocean: bool = SimpleProperty()
+
+    # oceancolor
+    # ----------
+    oceancolor: str = SimpleProperty()
+
+    # showlakes
+    # ---------
+    showlakes: bool = SimpleProperty()
+
+    # lakecolor
+    # ---------
+    lakecolor: str = SimpleProperty()
+
+    # showrivers
+    # ----------
+    showrivers: bool = SimpleProperty()
+
+    # rivercolor
+    # ----------
+    rivercolor: str = SimpleProperty()
+
+    # riverwidth
+    # ----------
+    riverwidth: Number = SimpleProperty()
+
+    # showcountries
+    # -------------
+    showcountries: bool = SimpleProperty()
+
+    # countrycolor
+    # ------------
+    countrycolor: str = SimpleProperty()
+
+    # countrywidth
+    # ------------
+    countrywidth: Number = SimpleProperty()
+
+    # showsubunits
+    # ------------
+    showsubunits: bool = SimpleProperty()
+
+    # subunitcolor
+    # ------------
+    subunitcolor: str = SimpleProperty()
+
+    # subunitwidth
+    # ------------
+    subunitwidth: Number = SimpleProperty()
+
+    # showframe
+    # ---------
+    showframe: bool = SimpleProperty()
+
+    # framecolor
+    # ----------
+    framecolor: str = SimpleProperty()
+
+    # framewidth
+    # ----------
+    framewidth: Number = SimpleProperty()
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # lonaxis
+    # -------
+    lonaxis: 'd_geo.Lonaxis' = CompoundProperty()
+
+    # lataxis
+    # -------
+    lataxis: 'd_geo.Lataxis' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'domain': v_geo.DomainValidator(),
+            'resolution': v_geo.ResolutionValidator(),
+            'scope': v_geo.ScopeValidator(),
+            'projection': v_geo.ProjectionValidator(),
+            'center': v_geo.CenterValidator(),
+            'showcoastlines': v_geo.ShowcoastlinesValidator(),
+            'coastlinecolor': v_geo.CoastlinecolorValidator(),
+            'coastlinewidth': v_geo.CoastlinewidthValidator(),
+            'showland': v_geo.ShowlandValidator(),
+            'landcolor': v_geo.LandcolorValidator(),
+            'showocean': v_geo.ShowoceanValidator(),
+            'oceancolor': v_geo.OceancolorValidator(),
+            'showlakes': v_geo.ShowlakesValidator(),
+            'lakecolor': v_geo.LakecolorValidator(),
+            'showrivers': v_geo.ShowriversValidator(),
+            'rivercolor': v_geo.RivercolorValidator(),
+            'riverwidth': v_geo.RiverwidthValidator(),
+            'showcountries': v_geo.ShowcountriesValidator(),
+            'countrycolor': v_geo.CountrycolorValidator(),
+            'countrywidth': v_geo.CountrywidthValidator(),
+            'showsubunits': v_geo.ShowsubunitsValidator(),
+            'subunitcolor': v_geo.SubunitcolorValidator(),
+            'subunitwidth': v_geo.SubunitwidthValidator(),
+            'showframe': v_geo.ShowframeValidator(),
+            'framecolor': v_geo.FramecolorValidator(),
+            'framewidth': v_geo.FramewidthValidator(),
+            'bgcolor': v_geo.BgcolorValidator(),
+            'lonaxis': v_geo.LonaxisValidator(),
+            'lataxis': v_geo.LataxisValidator(),
+        }
+
+    def __init__(
+        self,
+        domain=None,
+        resolution=None,
+        scope=None,
+        projection=None,
+        center=None,
+        showcoastlines=None,
+        coastlinecolor=None,
+        coastlinewidth=None,
+        showland=None,
+        landcolor=None,
+        showocean=None,
+        oceancolor=None,
+        showlakes=None,
+        lakecolor=None,
+        showrivers=None,
+        rivercolor=None,
+        riverwidth=None,
+        showcountries=None,
+        countrycolor=None,
+        countrywidth=None,
+        showsubunits=None,
+        subunitcolor=None,
+        subunitwidth=None,
+        showframe=None,
+        framecolor=None,
+        framewidth=None,
+        bgcolor=None,
+        lonaxis=None,
+        lataxis=None,
+        **kwargs
+    ):
+        super().__init__('geo', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.domain = domain
+        self.resolution = resolution
+        self.scope = scope
+        self.projection = projection
+        self.center = center
+        self.showcoastlines = showcoastlines
+        self.coastlinecolor = coastlinecolor
+        self.coastlinewidth = coastlinewidth
+        self.showland = showland
+        self.landcolor = landcolor
+        self.showocean = showocean
+        self.oceancolor = oceancolor
+        self.showlakes = showlakes
+        self.lakecolor = lakecolor
+        self.showrivers = showrivers
+        self.rivercolor = rivercolor
+        self.riverwidth = riverwidth
+        self.showcountries = showcountries
+        self.countrycolor = countrycolor
+        self.countrywidth = countrywidth
+        self.showsubunits = showsubunits
+        self.subunitcolor = subunitcolor
+        self.subunitwidth = subunitwidth
+        self.showframe = showframe
+        self.framecolor = framecolor
+        self.framewidth = framewidth
+        self.bgcolor = bgcolor
+        self.lonaxis = lonaxis
+        self.lataxis = lataxis
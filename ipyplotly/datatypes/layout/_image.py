@@ -0,0 +1,128 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (image as v_image)
+
+
+class Image(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.image'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # source
+    # ------
+    source: str = ItemProperty()
+
+    # layer
+    # -----
+    layer: Any = SimpleProperty()
+
+    # sizex
+    # -----
+    sizex: Number = SimpleProperty()
+
+    # sizey
+    # -----
+    sizey: Number = SimpleProperty()
+
+    # sizing
+    # ------
+    sizing: Any = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # x
+    # -
+    x: Any = SimpleProperty()
+
+    # y
+    # -
+    y: Any = SimpleProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # yanchor
+    # -------
+    yanchor: Any = SimpleProperty()
+
+    # xref
+    # ----
+    xref: Any = SimpleProperty()
+
+    # yref
+    # ----
+    yref: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_image.VisibleValidator(),
+            'source': v_image.SourceValidator(),
+            'layer': v_image.LayerValidator(),
+            'sizex': v_image.SizexValidator(),
+            'sizey': v_image.SizeyValidator(),
+            'sizing': v_image.SizingValidator(),
+            'opacity': v_image.OpacityValidator(),
+            'x': v_image.XValidator(),
+            'y': v_image.YValidator(),
+            'xanchor': v_image.XanchorValidator(),
+            'yanchor': v_image.YanchorValidator(),
+            'xref': v_image.XrefValidator(),
+            'yref': v_image.YrefValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        source=None,
+        layer=None,
+        sizex=None,
+        sizey=None,
+        sizing=None,
+        opacity=None,
+        x=None,
+        y=None,
+        xanchor=None,
+        yanchor=None,
+        xref=None,
+        yref=None,
+        **kwargs
+    ):
+        super().__init__('images', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.source = source
+        self.layer = layer
+        self.sizex = sizex
+        self.sizey = sizey
+        self.sizing = sizing
+        self.opacity = opacity
+        self.x = x
+        self.y = y
+        self.xanchor = xanchor
+        self.yanchor = yanchor
+        self.xref = xref
+        self.yref = yref
@@ -0,0 +1,115 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (legend as v_legend)
+from ipyplotly.datatypes.layout import (legend as d_legend)
+
+
+class Legend(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.legend'
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # borderwidth
+    # -----------
+    borderwidth: Number = SimpleProperty()
+
+    # font
+    # ----
+    font: 'd_legend.Font' = CompoundProperty()
+
+    # orientation
+    # -----------
+    orientation: Any = SimpleProperty()
+
+    # traceorder
+    # ----------
+    traceorder: Any = SimpleProperty()
+
+    # tracegroupgap
+    # -------------
+    tracegroupgap: Number = SimpleProperty()
+
+    # x
+    # -
+    x: Number = SimpleProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # y
+    # -
+    y: Number = SimpleProperty()
+
+    # yanchor
+    # -------
+    yanchor: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'bgcolor': v_legend.BgcolorValidator(),
+            'bordercolor': v_legend.BordercolorValidator(),
+            'borderwidth': v_legend.BorderwidthValidator(),
+            'font': v_legend.FontValidator(),
+            'orientation': v_legend.OrientationValidator(),
+            'traceorder': v_legend.TraceorderValidator(),
+            'tracegroupgap': v_legend.TracegroupgapValidator(),
+            'x': v_legend.XValidator(),
+            'xanchor': v_legend.XanchorValidator(),
+            'y': v_legend.YValidator(),
+            'yanchor': v_legend.YanchorValidator(),
+        }
+
+    def __init__(
+        self,
+        bgcolor=None,
+        bordercolor=None,
+        borderwidth=None,
+        font=None,
+        orientation=None,
+        traceorder=None,
+        tracegroupgap=None,
+        x=None,
+        xanchor=None,
+        y=None,
+        yanchor=None,
+        **kwargs
+    ):
+        super().__init__('legend', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.bgcolor = bgcolor
+        self.bordercolor = bordercolor
+        self.borderwidth = borderwidth
+        self.font = font
+        self.orientation = orientation
+        self.traceorder = traceorder
+        self.tracegroupgap = tracegroupgap
+        self.x = x
+        self.xanchor = xanchor
+        self.y = y
+        self.yanchor = yanchor
@@ -0,0 +1,94 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (mapbox as v_mapbox)
+from ipyplotly.datatypes.layout import (mapbox as d_mapbox)
+
+
+class Mapbox(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.mapbox'
+
+    # domain
+    # ------
+    domain: 'd_mapbox.Domain' = CompoundProperty()
+
+    # accesstoken
+    # -----------
+    accesstoken: str = SimpleProperty()
+
+    # style
+    # -----
+    style: Any = SimpleProperty()
+
+    # center
+    # ------
+    center: 'd_mapbox.Center' = CompoundProperty()
+
+    # zoom
+    # ----
+    zoom: Number = SimpleProperty()
+
+    # bearing
+    # -------
+    bearing: Number = SimpleProperty()
+
+    # pitch
+    # -----
+    pitch: Number = SimpleProperty()
+
+    # layers
+    # ------
+    layers: 'Tuple[d_mapbox.Layer]' = CompoundArrayProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'domain': v_mapbox.DomainValidator(),
+            'accesstoken': v_mapbox.AccesstokenValidator(),
+            'style': v_mapbox.StyleValidator(),
+            'center': v_mapbox.CenterValidator(),
+            'zoom': v_mapbox.ZoomValidator(),
+            'bearing': v_mapbox.BearingValidator(),
+            'pitch': v_mapbox.PitchValidator(),
+            'layers': v_mapbox.LayersValidator(),
+        }
+
+    def __init__(
+        self,
+        domain=None,
+        accesstoken=None,
+        style=None,
+        center=None,
+        zoom=None,
+        bearing=None,
+        pitch=None,
+        layers=None,
+        **kwargs
+    ):
+        super().__init__('mapbox', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.domain = domain
+        self.accesstoken = accesstoken
+        self.style = style
+        self.center = center
+        self.zoom = zoom
+        self.bearing = bearing
+        self.pitch = pitch
+        self.layers = layers
@@ -0,0 +1,70 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (margin as v_margin)
+
+
+class Margin(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.margin'
+
+    # l
+    # -
+    l: Number = SimpleProperty()
+
+    # r
+    # -
+    r: Number = SimpleProperty()
+
+    # t
+    # -
+    t: Number = SimpleProperty()
+
+    # b
+    # -
+    b: Number = SimpleProperty()
+
+    # pad
+    # ---
+    pad: Number = SimpleProperty()
+
+    # autoexpand
+    # ----------
+    autoexpand: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'l': v_margin.LValidator(),
+            'r': v_margin.RValidator(),
+            't': v_margin.TValidator(),
+            'b': v_margin.BValidator(),
+            'pad': v_margin.PadValidator(),
+            'autoexpand': v_margin.AutoexpandValidator(),
+        }
+
+    def __init__(self, l=None, r=None, t=None, b=None, pad=None, autoexpand=None, **kwargs):
+        super().__init__('margin', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.l = l
+        self.r = r
+        self.t = t
+        self.b = b
+        self.pad = pad
+        self.autoexpand = autoexpand
@@ -0,0 +1,114 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (radialaxis as v_radialaxis)
+
+
+class Radialaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.radialaxis'
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # domain
+    # ------
+    domain: List = SimpleProperty()
+
+    # orientation
+    # -----------
+    orientation: Number = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # tickorientation
+    # ---------------
+    tickorientation: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # endpadding
+    # ----------
+    endpadding: Number = SimpleProperty()
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'range': v_radialaxis.RangeValidator(),
+            'domain': v_radialaxis.DomainValidator(),
+            'orientation': v_radialaxis.OrientationValidator(),
+            'showline': v_radialaxis.ShowlineValidator(),
+            'showticklabels': v_radialaxis.ShowticklabelsValidator(),
+            'tickorientation': v_radialaxis.TickorientationValidator(),
+            'ticklen': v_radialaxis.TicklenValidator(),
+            'tickcolor': v_radialaxis.TickcolorValidator(),
+            'ticksuffix': v_radialaxis.TicksuffixValidator(),
+            'endpadding': v_radialaxis.EndpaddingValidator(),
+            'visible': v_radialaxis.VisibleValidator(),
+        }
+
+    def __init__(
+        self,
+        range=None,
+        domain=None,
+        orientation=None,
+        showline=None,
+        showticklabels=None,
+        tickorientation=None,
+        ticklen=None,
+        tickcolor=None,
+        ticksuffix=None,
+        endpadding=None,
+        visible=None,
+        **kwargs
+    ):
+        super().__init__('radialaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.range = range
+        self.domain = domain
+        self.orientation = orientation
+        self.showline = showline
+        self.showticklabels = showticklabels
+        self.tickorientation = tickorientation
+        self.ticklen = ticklen
+        self.tickcolor = tickcolor
+        self.ticksuffix = ticksuffix
+        self.endpadding = endpadding
+        self.visible = visible
@@ -0,0 +1,115 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (scene as v_scene)
+from ipyplotly.datatypes.layout import (scene as d_scene)
+
+
+class Scene(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene'
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # camera
+    # ------
+    camera: 'd_scene.Camera' = CompoundProperty()
+
+    # domain
+    # ------
+    domain: 'd_scene.Domain' = CompoundProperty()
+
+    # aspectmode
+    # ----------
+    aspectmode: Any = SimpleProperty()
+
+    # aspectratio
+    # -----------
+    aspectratio: 'd_scene.Aspectratio' = CompoundProperty()
+
+    # xaxis
+    # -----
+    xaxis: 'd_scene.Xaxis' = CompoundProperty()
+
+    # yaxis
+    # -----
+    yaxis: 'd_scene.Yaxis' = CompoundProperty()
+
+    # zaxis
+    # -----
+    zaxis: 'd_scene.Zaxis' = CompoundProperty()
+
+    # dragmode
+    # --------
+    dragmode: Any = SimpleProperty()
+
+    # hovermode
+    # ---------
+    hovermode: Any = SimpleProperty()
+
+    # annotations
+    # -----------
+    annotations: 'Tuple[d_scene.Annotation]' = CompoundArrayProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'bgcolor': v_scene.BgcolorValidator(),
+            'camera': v_scene.CameraValidator(),
+            'domain': v_scene.DomainValidator(),
+            'aspectmode': v_scene.AspectmodeValidator(),
+            'aspectratio': v_scene.AspectratioValidator(),
+            'xaxis': v_scene.XaxisValidator(),
+            'yaxis': v_scene.YaxisValidator(),
+            'zaxis': v_scene.ZaxisValidator(),
+            'dragmode': v_scene.DragmodeValidator(),
+            'hovermode': v_scene.HovermodeValidator(),
+            'annotations': v_scene.AnnotationsValidator(),
+        }
+
+    def __init__(
+        self,
+        bgcolor=None,
+        camera=None,
+        domain=None,
+        aspectmode=None,
+        aspectratio=None,
+        xaxis=None,
+        yaxis=None,
+        zaxis=None,
+        dragmode=None,
+        hovermode=None,
+        annotations=None,
+        **kwargs
+    ):
+        super().__init__('scene', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.bgcolor = bgcolor
+        self.camera = camera
+        self.domain = domain
+        self.aspectmode = aspectmode
+        self.aspectratio = aspectratio
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.zaxis = zaxis
+        self.dragmode = dragmode
+        self.hovermode = hovermode
+        self.annotations = annotations
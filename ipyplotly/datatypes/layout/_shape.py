@@ -0,0 +1,129 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (shape as v_shape)
+from ipyplotly.datatypes.layout import (shape as d_shape)
+
+
+class Shape(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.shape'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # layer
+    # -----
+    layer: Any = SimpleProperty()
+
+    # xref
+    # ----
+    xref: Any = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # x1
+    # --
+    x1: Any = SimpleProperty()
+
+    # yref
+    # ----
+    yref: Any = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # y1
+    # --
+    y1: Any = SimpleProperty()
+
+    # path
+    # ----
+    path: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_shape.Line' = CompoundProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_shape.VisibleValidator(),
+            'type': v_shape.TypeValidator(),
+            'layer': v_shape.LayerValidator(),
+            'xref': v_shape.XrefValidator(),
+            'x0': v_shape.X0Validator(),
+            'x1': v_shape.X1Validator(),
+            'yref': v_shape.YrefValidator(),
+            'y0': v_shape.Y0Validator(),
+            'y1': v_shape.Y1Validator(),
+            'path': v_shape.PathValidator(),
+            'opacity': v_shape.OpacityValidator(),
+            'line': v_shape.LineValidator(),
+            'fillcolor': v_shape.FillcolorValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        type=None,
+        layer=None,
+        xref=None,
+        x0=None,
+        x1=None,
+        yref=None,
+        y0=None,
+        y1=None,
+        path=None,
+        opacity=None,
+        line=None,
+        fillcolor=None,
+        **kwargs
+    ):
+        super().__init__('shapes', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.type = type
+        self.layer = layer
+        self.xref = xref
+        self.x0 = x0
+        self.x1 = x1
+        self.yref = yref
+        self.y0 = y0
+        self.y1 = y1
+        self.path = path
+        self.opacity = opacity
+        self.line = line
+        self.fillcolor = fillcolor
@@ -0,0 +1,185 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (slider as v_slider)
+from ipyplotly.datatypes.layout import (slider as d_slider)
+
+
+class Slider(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.slider'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # active
+    # ------
+    active: Number = SimpleProperty()
+
+    # steps
+    # -----
+    steps: 'Tuple[d_slider.Step]' = CompoundArrayProperty()
+
+    # lenmode
+    # -------
+    lenmode: Any = SimpleProperty()
+
+    # len
+    # ---
+    len: Number = SimpleProperty()
+
+    # x
+    # -
+    x: Number = SimpleProperty()
+
+    # pad
+    # ---
+    pad: 'd_slider.Pad' = CompoundProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # y
+    # -
+    y: Number = SimpleProperty()
+
+    # yanchor
+    # -------
+    yanchor: Any = SimpleProperty()
+
+    # transition
+    # ----------
+    transition: 'd_slider.Transition' = CompoundProperty()
+
+    # currentvalue
+    # ------------
+    currentvalue: 'd_slider.Currentvalue' = CompoundProperty()
+
+    # font
+    # ----
+    font: 'd_slider.Font' = CompoundProperty()
+
+    # activebgcolor
+    # -------------
+    activebgcolor: str = SimpleProperty()
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # borderwidth
+    # -----------
+    borderwidth: Number = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # minorticklen
+    # ------------
+    minorticklen: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_slider.VisibleValidator(),
+            'active': v_slider.ActiveValidator(),
+            'steps': v_slider.StepsValidator(),
+            'lenmode': v_slider.LenmodeValidator(),
+            'len': v_slider.LenValidator(),
+            'x': v_slider.XValidator(),
+            'pad': v_slider.PadValidator(),
+            'xanchor': v_slider.XanchorValidator(),
+            'y': v_slider.YValidator(),
+            'yanchor': v_slider.YanchorValidator(),
+            'transition': v_slider.TransitionValidator(),
+            'currentvalue': v_slider.CurrentvalueValidator(),
+            'font': v_slider.FontValidator(),
+            'activebgcolor': v_slider.ActivebgcolorValidator(),
+            'bgcolor': v_slider.BgcolorValidator(),
+            'bordercolor': v_slider.BordercolorValidator(),
+            'borderwidth': v_slider.BorderwidthValidator(),
+            'ticklen': v_slider.TicklenValidator(),
+            'tickcolor': v_slider.TickcolorValidator(),
+            'tickwidth': v_slider.TickwidthValidator(),
+            'minorticklen': v_slider.MinorticklenValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        active=None,
+        steps=None,
+        lenmode=None,
+        len=None,
+        x=None,
+        pad=None,
+        xanchor=None,
+        y=None,
+        yanchor=None,
+        transition=None,
+        currentvalue=None,
+        font=None,
+        activebgcolor=None,
+        bgcolor=None,
+        bordercolor=None,
+        borderwidth=None,
+        ticklen=None,
+        tickcolor=None,
+        tickwidth=None,
+        minorticklen=None,
+        **kwargs
+    ):
+        super().__init__('sliders', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.active = active
+        self.steps = steps
+        self.lenmode = lenmode
+        self.len = len
+        self.x = x
+        self.pad = pad
+        self.xanchor = xanchor
+        self.y = y
+        self.yanchor = yanchor
+        self.transition = transition
+        self.currentvalue = currentvalue
+        self.font = font
+        self.activebgcolor = activebgcolor
+        self.bgcolor = bgcolor
+        self.bordercolor = bordercolor
+        self.borderwidth = borderwidth
+        self.ticklen = ticklen
+        self.tickcolor = tickcolor
+        self.tickwidth = tickwidth
+        self.minorticklen = minorticklen
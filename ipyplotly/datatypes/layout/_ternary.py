@@ -0,0 +1,71 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (ternary as v_ternary)
+from ipyplotly.datatypes.layout import (ternary as d_ternary)
+
+
+class Ternary(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.ternary'
+
+    # domain
+    # ------
+    domain: 'd_ternary.Domain' = CompoundProperty()
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # sum
+    # ---
+    sum: Number = SimpleProperty()
+
+    # aaxis
+    # -----
+    aaxis: 'd_ternary.Aaxis' = CompoundProperty()
+
+    # baxis
+    # -----
+    baxis: 'd_ternary.Baxis' = CompoundProperty()
+
+    # caxis
+    # -----
+    caxis: 'd_ternary.Caxis' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'domain': v_ternary.DomainValidator(),
+            'bgcolor': v_ternary.BgcolorValidator(),
+            'sum': v_ternary.SumValidator(),
+            'aaxis': v_ternary.AaxisValidator(),
+            'baxis': v_ternary.BaxisValidator(),
+            'caxis': v_ternary.CaxisValidator(),
+        }
+
+    def __init__(self, domain=None, bgcolor=None, sum=None, aaxis=None, baxis=None, caxis=None, **kwargs):
+        super().__init__('ternary', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.domain = domain
+        self.bgcolor = bgcolor
+        self.sum = sum
+        self.aaxis = aaxis
+        self.baxis = baxis
+        self.caxis = caxis
@@ -0,0 +1,143 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (updatemenu as v_updatemenu)
+from ipyplotly.datatypes.layout import (updatemenu as d_updatemenu)
+
+
+class Updatemenu(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.updatemenu'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # direction
+    # ---------
+    direction: Any = SimpleProperty()
+
+    # active
+    # ------
+    active: int = SimpleProperty()
+
+    # showactive
+    # ----------
+    showactive: bool = SimpleProperty()
+
+    # buttons
+    # -------
+    buttons: 'Tuple[d_updatemenu.Button]' = CompoundArrayProperty()
+
+    # x
+    # -
+    x: Number = SimpleProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # y
+    # -
+    y: Number = SimpleProperty()
+
+    # yanchor
+    # -------
+    yanchor: Any = SimpleProperty()
+
+    # pad
+    # ---
+    pad: 'd_updatemenu.Pad' = CompoundProperty()
+
+    # font
+    # ----
+    font: 'd_updatemenu.Font' = CompoundProperty()
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # borderwidth
+    # -----------
+    borderwidth: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_updatemenu.VisibleValidator(),
+            'type': v_updatemenu.TypeValidator(),
+            'direction': v_updatemenu.DirectionValidator(),
+            'active': v_updatemenu.ActiveValidator(),
+            'showactive': v_updatemenu.ShowactiveValidator(),
+            'buttons': v_updatemenu.ButtonsValidator(),
+            'x': v_updatemenu.XValidator(),
+            'xanchor': v_updatemenu.XanchorValidator(),
+            'y': v_updatemenu.YValidator(),
+            'yanchor': v_updatemenu.YanchorValidator(),
+            'pad': v_updatemenu.PadValidator(),
+            'font': v_updatemenu.FontValidator(),
+            'bgcolor': v_updatemenu.BgcolorValidator(),
+            'bordercolor': v_updatemenu.BordercolorValidator(),
+            'borderwidth': v_updatemenu.BorderwidthValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        type=None,
+        direction=None,
+        active=None,
+        showactive=None,
+        buttons=None,
+        x=None,
+        xanchor=None,
+        y=None,
+        yanchor=None,
+        pad=None,
+        font=None,
+        bgcolor=None,
+        bordercolor=None,
+        borderwidth=None,
+        **kwargs
+    ):
+        super().__init__('updatemenus', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.type = type
+        self.direction = direction
+        self.active = active
+        self.showactive = showactive
+        self.buttons = buttons
+        self.x = x
+        self.xanchor = xanchor
+        self.y = y
+        self.yanchor = yanchor
+        self.pad = pad
+        self.font = font
+        self.bgcolor = bgcolor
+        self.bordercolor = bordercolor
+        self.borderwidth = borderwidth
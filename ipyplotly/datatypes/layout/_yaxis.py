@@ -0,0 +1,479 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout import (yaxis as v_yaxis)
+from ipyplotly.datatypes.layout import (yaxis as d_yaxis)
+
+
+class Yaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.yaxis'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_yaxis.Titlefont' = CompoundProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # autorange
+    # ---------
+    autorange: Any = SimpleProperty()
+
+    # rangemode
+    # ---------
+    rangemode: Any = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # fixedrange
+    # ----------
+    fixedrange: bool = SimpleProperty()
+
+    # scaleanchor
+    # -----------
+    scaleanchor: Any = SimpleProperty()
+
+    # scaleratio
+    # ----------
+    scaleratio: Number = SimpleProperty()
+
+    # constrain
+    # ---------
+    constrain: Any = SimpleProperty()
+
+    # constraintoward
+    # ---------------
+    constraintoward: Any = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # mirror
+    # ------
+    mirror: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # showspikes
+    # ----------
+    showspikes: bool = SimpleProperty()
+
+    # spikecolor
+    # ----------
+    spikecolor: str = SimpleProperty()
+
+    # spikethickness
+    # --------------
+    spikethickness: Number = SimpleProperty()
+
+    # spikedash
+    # ---------
+    spikedash: str = SimpleProperty()
+
+    # spikemode
+    # ---------
+    spikemode: Any = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_yaxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_yaxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # hoverformat
+    # -----------
+    hoverformat: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # zeroline
+    # --------
+    zeroline: bool = SimpleProperty()
+
+    # zerolinecolor
+    # -------------
+    zerolinecolor: str = SimpleProperty()
+
+    # zerolinewidth
+    # -------------
+    zerolinewidth: Number = SimpleProperty()
+
+    # anchor
+    # ------
+    anchor: Any = SimpleProperty()
+
+    # side
+    # ----
+    side: Any = SimpleProperty()
+
+    # overlaying
+    # ----------
+    overlaying: Any = SimpleProperty()
+
+    # layer
+    # -----
+    layer: Any = SimpleProperty()
+
+    # domain
+    # ------
+    domain: List = SimpleProperty()
+
+    # position
+    # --------
+    position: Number = SimpleProperty()
+
+    # categoryorder
+    # -------------
+    categoryorder: Any = SimpleProperty()
+
+    # categoryarray
+    # -------------
+    categoryarray: List = SimpleProperty()
+
+    # calendar
+    # --------
+    calendar: Any = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # categoryarraysrc
+    # ----------------
+    categoryarraysrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_yaxis.VisibleValidator(),
+            'color': v_yaxis.ColorValidator(),
+            'title': v_yaxis.TitleValidator(),
+            'titlefont': v_yaxis.TitlefontValidator(),
+            'type': v_yaxis.TypeValidator(),
+            'autorange': v_yaxis.AutorangeValidator(),
+            'rangemode': v_yaxis.RangemodeValidator(),
+            'range': v_yaxis.RangeValidator(),
+            'fixedrange': v_yaxis.FixedrangeValidator(),
+            'scaleanchor': v_yaxis.ScaleanchorValidator(),
+            'scaleratio': v_yaxis.ScaleratioValidator(),
+            'constrain': v_yaxis.ConstrainValidator(),
+            'constraintoward': v_yaxis.ConstraintowardValidator(),
+            'tickmode': v_yaxis.TickmodeValidator(),
+            'nticks': v_yaxis.NticksValidator(),
+            'tick0': v_yaxis.Tick0Validator(),
+            'dtick': v_yaxis.DtickValidator(),
+            'tickvals': v_yaxis.TickvalsValidator(),
+            'ticktext': v_yaxis.TicktextValidator(),
+            'ticks': v_yaxis.TicksValidator(),
+            'mirror': v_yaxis.MirrorValidator(),
+            'ticklen': v_yaxis.TicklenValidator(),
+            'tickwidth': v_yaxis.TickwidthValidator(),
+            'tickcolor': v_yaxis.TickcolorValidator(),
+            'showticklabels': v_yaxis.ShowticklabelsValidator(),
+            'showspikes': v_yaxis.ShowspikesValidator(),
+            'spikecolor': v_yaxis.SpikecolorValidator(),
+            'spikethickness': v_yaxis.SpikethicknessValidator(),
+            'spikedash': v_yaxis.SpikedashValidator(),
+            'spikemode': v_yaxis.SpikemodeValidator(),
+            'tickfont': v_yaxis.TickfontValidator(),
+            'tickangle': v_yaxis.TickangleValidator(),
+            'tickprefix': v_yaxis.TickprefixValidator(),
+            'showtickprefix': v_yaxis.ShowtickprefixValidator(),
+            'ticksuffix': v_yaxis.TicksuffixValidator(),
+            'showticksuffix': v_yaxis.ShowticksuffixValidator(),
+            'showexponent': v_yaxis.ShowexponentValidator(),
+            'exponentformat': v_yaxis.ExponentformatValidator(),
+            'separatethousands': v_yaxis.SeparatethousandsValidator(),
+            'tickformat': v_yaxis.TickformatValidator(),
+            'tickformatstops': v_yaxis.TickformatstopsValidator(),
+            'hoverformat': v_yaxis.HoverformatValidator(),
+            'showline': v_yaxis.ShowlineValidator(),
+            'linecolor': v_yaxis.LinecolorValidator(),
+            'linewidth': v_yaxis.LinewidthValidator(),
+            'showgrid': v_yaxis.ShowgridValidator(),
+            'gridcolor': v_yaxis.GridcolorValidator(),
+            'gridwidth': v_yaxis.GridwidthValidator(),
+            'zeroline': v_yaxis.ZerolineValidator(),
+            'zerolinecolor': v_yaxis.ZerolinecolorValidator(),
+            'zerolinewidth': v_yaxis.ZerolinewidthValidator(),
+            'anchor': v_yaxis.AnchorValidator(),
+            'side': v_yaxis.SideValidator(),
+            'overlaying': v_yaxis.OverlayingValidator(),
+            'layer': v_yaxis.LayerValidator(),
+            'domain': v_yaxis.DomainValidator(),
+            'position': v_yaxis.PositionValidator(),
+            'categoryorder': v_yaxis.CategoryorderValidator(),
+            'categoryarray': v_yaxis.CategoryarrayValidator(),
+            'calendar': v_yaxis.CalendarValidator(),
+            'tickvalssrc': v_yaxis.TickvalssrcValidator(),
+            'ticktextsrc': v_yaxis.TicktextsrcValidator(),
+            'categoryarraysrc': v_yaxis.CategoryarraysrcValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        color=None,
+        title=None,
+        titlefont=None,
+        type=None,
+        autorange=None,
+        rangemode=None,
+        range=None,
+        fixedrange=None,
+        scaleanchor=None,
+        scaleratio=None,
+        constrain=None,
+        constraintoward=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        mirror=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        showspikes=None,
+        spikecolor=None,
+        spikethickness=None,
+        spikedash=None,
+        spikemode=None,
+        tickfont=None,
+        tickangle=None,
+        tickprefix=None,
+        showtickprefix=None,
+        ticksuffix=None,
+        showticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickformat=None,
+        tickformatstops=None,
+        hoverformat=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        showgrid=None,
+        gridcolor=None,
+        gridwidth=None,
+        zeroline=None,
+        zerolinecolor=None,
+        zerolinewidth=None,
+        anchor=None,
+        side=None,
+        overlaying=None,
+        layer=None,
+        domain=None,
+        position=None,
+        categoryorder=None,
+        categoryarray=None,
+        calendar=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        categoryarraysrc=None,
+        **kwargs
+    ):
+        super().__init__('yaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.color = color
+        self.title = title
+        self.titlefont = titlefont
+        self.type = type
+        self.autorange = autorange
+        self.rangemode = rangemode
+        self.range = range
+        self.fixedrange = fixedrange
+        self.scaleanchor = scaleanchor
+        self.scaleratio = scaleratio
+        self.constrain = constrain
+        self.constraintoward = constraintoward
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.mirror = mirror
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.showspikes = showspikes
+        self.spikecolor = spikecolor
+        self.spikethickness = spikethickness
+        self.spikedash = spikedash
+        self.spikemode = spikemode
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickprefix = tickprefix
+        self.showtickprefix = showtickprefix
+        self.ticksuffix = ticksuffix
+        self.showticksuffix = showticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.hoverformat = hoverformat
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.showgrid = showgrid
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.zeroline = zeroline
+        self.zerolinecolor = zerolinecolor
+        self.zerolinewidth = zerolinewidth
+        self.anchor = anchor
+        self.side = side
+        self.overlaying = overlaying
+        self.layer = layer
+        self.domain = domain
+        self.position = position
+        self.categoryorder = categoryorder
+        self.categoryarray = categoryarray
+        self.calendar = calendar
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
+        self.categoryarraysrc = categoryarraysrc
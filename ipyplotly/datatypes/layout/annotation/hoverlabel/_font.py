@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.annotation.hoverlabel import (font as v_font)
+
+
+class Font(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.annotation.hoverlabel.font'
+
+    # family
+    # ------
+    family: str = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.annotation.hoverlabel'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'family': v_font.FamilyValidator(),
+            'size': v_font.SizeValidator(),
+            'color': v_font.ColorValidator(),
+        }
+
+    def __init__(self, family=None, size=None, color=None, **kwargs):
+        super().__init__('font', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.family = family
+        self.size = size
+        self.color = color
@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._domain import Domain
+    from ._projection import Projection
+    from ._center import Center
+    from ._lonaxis import Lonaxis
+    from ._lataxis import Lataxis
+    from . import projection
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.projection',
+        ],
+        [
+            '._domain.Domain',
+            '._projection.Projection',
+            '._center.Center',
+            '._lonaxis.Lonaxis',
+            '._lataxis.Lataxis',
+        ]
+    )
@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.geo import (domain as v_domain)
+
+
+class Domain(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.geo.domain'
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.geo'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'x': v_domain.XValidator(),
+            'y': v_domain.YValidator(),
+        }
+
+    def __init__(self, x=None, y=None, **kwargs):
+        super().__init__('domain', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.x = x
+        self.y = y
@@ -0,0 +1,70 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.geo import (lataxis as v_lataxis)
+
+
+class Lataxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.geo.lataxis'
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Number = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Number = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.geo'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'range': v_lataxis.RangeValidator(),
+            'showgrid': v_lataxis.ShowgridValidator(),
+            'tick0': v_lataxis.Tick0Validator(),
+            'dtick': v_lataxis.DtickValidator(),
+            'gridcolor': v_lataxis.GridcolorValidator(),
+            'gridwidth': v_lataxis.GridwidthValidator(),
+        }
+
+    def __init__(self, range=None, showgrid=None, tick0=None, dtick=None, gridcolor=None, gridwidth=None, **kwargs):
+        super().__init__('lataxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.range = range
+        self.showgrid = showgrid
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
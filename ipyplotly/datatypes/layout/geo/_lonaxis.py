@@ -0,0 +1,70 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.geo import (lonaxis as v_lonaxis)
+
+
+class Lonaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.geo.lonaxis'
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Number = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Number = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.geo'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'range': v_lonaxis.RangeValidator(),
+            'showgrid': v_lonaxis.ShowgridValidator(),
+            'tick0': v_lonaxis.Tick0Validator(),
+            'dtick': v_lonaxis.DtickValidator(),
+            'gridcolor': v_lonaxis.GridcolorValidator(),
+            'gridwidth': v_lonaxis.GridwidthValidator(),
+        }
+
+    def __init__(self, range=None, showgrid=None, tick0=None, dtick=None, gridcolor=None, gridwidth=None, **kwargs):
+        super().__init__('lonaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.range = range
+        self.showgrid = showgrid
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
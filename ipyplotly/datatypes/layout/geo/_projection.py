@@ -0,0 +1,59 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.geo import (projection as v_projection)
+from ipyplotly.datatypes.layout.geo import (projection as d_projection)
+
+
+class Projection(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.geo.projection'
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # rotation
+    # --------
+    rotation: 'd_projection.Rotation' = CompoundProperty()
+
+    # parallels
+    # ---------
+    parallels: List = SimpleProperty()
+
+    # scale
+    # -----
+    scale: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.geo'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'type': v_projection.TypeValidator(),
+            'rotation': v_projection.RotationValidator(),
+            'parallels': v_projection.ParallelsValidator(),
+            'scale': v_projection.ScaleValidator(),
+        }
+
+    def __init__(self, type=None, rotation=None, parallels=None, scale=None, **kwargs):
+        super().__init__('projection', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.type = type
+        self.rotation = rotation
+        self.parallels = parallels
+        self.scale = scale
@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.geo.projection import (rotation as v_rotation)
+
+
+class Rotation(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.geo.projection.rotation'
+
+    # lon
+    # ---
+    lon: Number = SimpleProperty()
+
+    # lat
+    # ---
+    lat: Number = SimpleProperty()
+
+    # roll
+    # ----
+    roll: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.geo.projection'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'lon': v_rotation.LonValidator(),
+            'lat': v_rotation.LatValidator(),
+            'roll': v_rotation.RollValidator(),
+        }
+
+    def __init__(self, lon=None, lat=None, roll=None, **kwargs):
+        super().__init__('rotation', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.lon = lon
+        self.lat = lat
+        self.roll = roll
@@ -0,0 +1,20 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._domain import Domain
+    from ._center import Center
+    from ._layer import Layer
+    from . import layer
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.layer',
+        ],
+        [
+            '._domain.Domain',
+            '._center.Center',
+            '._layer.Layer',
+        ]
+    )
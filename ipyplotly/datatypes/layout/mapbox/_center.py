@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.mapbox import (center as v_center)
+
+
+class Center(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.mapbox.center'
+
+    # lon
+    # ---
+    lon: Number = SimpleProperty()
+
+    # lat
+    # ---
+    lat: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.mapbox'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'lon': v_center.LonValidator(),
+            'lat': v_center.LatValidator(),
+        }
+
+    def __init__(self, lon=None, lat=None, **kwargs):
+        super().__init__('center', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.lon = lon
+        self.lat = lat
@@ -0,0 +1,115 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.mapbox import (layer as v_layer)
+from ipyplotly.datatypes.layout.mapbox import (layer as d_layer)
+
+
+class Layer(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.mapbox.layer'
+
+    # sourcetype
+    # ----------
+    sourcetype: Any = SimpleProperty()
+
+    # source
+    # ------
+    source: Any = SimpleProperty()
+
+    # sourcelayer
+    # -----------
+    sourcelayer: str = SimpleProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # below
+    # -----
+    below: str = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # circle
+    # ------
+    circle: 'd_layer.Circle' = CompoundProperty()
+
+    # line
+    # ----
+    line: 'd_layer.Line' = CompoundProperty()
+
+    # fill
+    # ----
+    fill: 'd_layer.Fill' = CompoundProperty()
+
+    # symbol
+    # ------
+    symbol: 'd_layer.Symbol' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.mapbox'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'sourcetype': v_layer.SourcetypeValidator(),
+            'source': v_layer.SourceValidator(),
+            'sourcelayer': v_layer.SourcelayerValidator(),
+            'type': v_layer.TypeValidator(),
+            'below': v_layer.BelowValidator(),
+            'color': v_layer.ColorValidator(),
+            'opacity': v_layer.OpacityValidator(),
+            'circle': v_layer.CircleValidator(),
+            'line': v_layer.LineValidator(),
+            'fill': v_layer.FillValidator(),
+            'symbol': v_layer.SymbolValidator(),
+        }
+
+    def __init__(
+        self,
+        sourcetype=None,
+        source=None,
+        sourcelayer=None,
+        type=None,
+        below=None,
+        color=None,
+        opacity=None,
+        circle=None,
+        line=None,
+        fill=None,
+        symbol=None,
+        **kwargs
+    ):
+        super().__init__('layers', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.sourcetype = sourcetype
+        self.source = source
+        self.sourcelayer = sourcelayer
+        self.type = type
+        self.below = below
+        self.color = color
+        self.opacity = opacity
+        self.circle = circle
+        self.line = line
+        self.fill = fill
+        self.symbol = symbol
@@ -0,0 +1,22 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._circle import Circle
+    from ._line import Line
+    from ._fill import Fill
+    from ._symbol import Symbol
+    from . import symbol
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.symbol',
+        ],
+        [
+            '._circle.Circle',
+            '._line.Line',
+            '._fill.Fill',
+            '._symbol.Symbol',
+        ]
+    )
@@ -0,0 +1,40 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.mapbox.layer import (circle as v_circle)
+
+
+class Circle(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.mapbox.layer.circle'
+
+    # radius
+    # ------
+    radius: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.mapbox.layer'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'radius': v_circle.RadiusValidator(),
+        }
+
+    def __init__(self, radius=None, **kwargs):
+        super().__init__('circle', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.radius = radius
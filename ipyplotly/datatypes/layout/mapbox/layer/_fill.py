@@ -0,0 +1,40 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.mapbox.layer import (fill as v_fill)
+
+
+class Fill(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.mapbox.layer.fill'
+
+    # outlinecolor
+    # ------------
+    outlinecolor: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.mapbox.layer'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'outlinecolor': v_fill.OutlinecolorValidator(),
+        }
+
+    def __init__(self, outlinecolor=None, **kwargs):
+        super().__init__('fill', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.outlinecolor = outlinecolor
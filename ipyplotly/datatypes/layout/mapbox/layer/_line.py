@@ -0,0 +1,40 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.mapbox.layer import (line as v_line)
+
+
+class Line(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.mapbox.layer.line'
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.mapbox.layer'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'width': v_line.WidthValidator(),
+        }
+
+    def __init__(self, width=None, **kwargs):
+        super().__init__('line', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.width = width
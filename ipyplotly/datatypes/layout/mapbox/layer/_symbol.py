@@ -0,0 +1,65 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.mapbox.layer import (symbol as v_symbol)
+from ipyplotly.datatypes.layout.mapbox.layer import (symbol as d_symbol)
+
+
+class Symbol(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.mapbox.layer.symbol'
+
+    # icon
+    # ----
+    icon: str = SimpleProperty()
+
+    # iconsize
+    # --------
+    iconsize: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_symbol.Textfont' = CompoundProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.mapbox.layer'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'icon': v_symbol.IconValidator(),
+            'iconsize': v_symbol.IconsizeValidator(),
+            'text': v_symbol.TextValidator(),
+            'textfont': v_symbol.TextfontValidator(),
+            'textposition': v_symbol.TextpositionValidator(),
+        }
+
+    def __init__(self, icon=None, iconsize=None, text=None, textfont=None, textposition=None, **kwargs):
+        super().__init__('symbol', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.icon = icon
+        self.iconsize = iconsize
+        self.text = text
+        self.textfont = textfont
+        self.textposition = textposition
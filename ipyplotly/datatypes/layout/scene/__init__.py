@@ -0,0 +1,36 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._camera import Camera
+    from ._domain import Domain
+    from ._aspectratio import Aspectratio
+    from ._xaxis import Xaxis
+    from ._yaxis import Yaxis
+    from ._zaxis import Zaxis
+    from ._annotation import Annotation
+    from . import annotation
+    from . import zaxis
+    from . import yaxis
+    from . import xaxis
+    from . import camera
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.annotation',
+            '.zaxis',
+            '.yaxis',
+            '.xaxis',
+            '.camera',
+        ],
+        [
+            '._camera.Camera',
+            '._domain.Domain',
+            '._aspectratio.Aspectratio',
+            '._xaxis.Xaxis',
+            '._yaxis.Yaxis',
+            '._zaxis.Zaxis',
+            '._annotation.Annotation',
+        ]
+    )
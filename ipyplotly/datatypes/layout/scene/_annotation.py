@@ -0,0 +1,255 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene import (annotation as v_annotation)
+from ipyplotly.datatypes.layout.scene import (annotation as d_annotation)
+
+
+class Annotation(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.annotation'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # x
+    # -
+    x: Any = SimpleProperty()
+
+    # y
+    # -
+    y: Any = SimpleProperty()
+
+    # z
+    # -
+    z: Any = SimpleProperty()
+
+    # ax
+    # --
+    ax: Number = SimpleProperty()
+
+    # ay
+    # --
+    ay: Number = SimpleProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # xshift
+    # ------
+    xshift: Number = SimpleProperty()
+
+    # yanchor
+    # -------
+    yanchor: Any = SimpleProperty()
+
+    # yshift
+    # ------
+    yshift: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # textangle
+    # ---------
+    textangle: Number = SimpleProperty()
+
+    # font
+    # ----
+    font: 'd_annotation.Font' = CompoundProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # height
+    # ------
+    height: Number = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # align
+    # -----
+    align: Any = SimpleProperty()
+
+    # valign
+    # ------
+    valign: Any = SimpleProperty()
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # borderpad
+    # ---------
+    borderpad: Number = SimpleProperty()
+
+    # borderwidth
+    # -----------
+    borderwidth: Number = SimpleProperty()
+
+    # showarrow
+    # ---------
+    showarrow: bool = SimpleProperty()
+
+    # arrowcolor
+    # ----------
+    arrowcolor: str = SimpleProperty()
+
+    # arrowhead
+    # ---------
+    arrowhead: int = SimpleProperty()
+
+    # arrowsize
+    # ---------
+    arrowsize: Number = SimpleProperty()
+
+    # arrowwidth
+    # ----------
+    arrowwidth: Number = SimpleProperty()
+
+    # standoff
+    # --------
+    standoff: Number = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_annotation.Hoverlabel' = CompoundProperty()
+
+    # captureevents
+    # -------------
+    captureevents: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_annotation.VisibleValidator(),
+            'x': v_annotation.XValidator(),
+            'y': v_annotation.YValidator(),
+            'z': v_annotation.ZValidator(),
+            'ax': v_annotation.AxValidator(),
+            'ay': v_annotation.AyValidator(),
+            'xanchor': v_annotation.XanchorValidator(),
+            'xshift': v_annotation.XshiftValidator(),
+            'yanchor': v_annotation.YanchorValidator(),
+            'yshift': v_annotation.YshiftValidator(),
+            'text': v_annotation.TextValidator(),
+            'textangle': v_annotation.TextangleValidator(),
+            'font': v_annotation.FontValidator(),
+            'width': v_annotation.WidthValidator(),
+            'height': v_annotation.HeightValidator(),
+            'opacity': v_annotation.OpacityValidator(),
+            'align': v_annotation.AlignValidator(),
+            'valign': v_annotation.ValignValidator(),
+            'bgcolor': v_annotation.BgcolorValidator(),
+            'bordercolor': v_annotation.BordercolorValidator(),
+            'borderpad': v_annotation.BorderpadValidator(),
+            'borderwidth': v_annotation.BorderwidthValidator(),
+            'showarrow': v_annotation.ShowarrowValidator(),
+            'arrowcolor': v_annotation.ArrowcolorValidator(),
+            'arrowhead': v_annotation.ArrowheadValidator(),
+            'arrowsize': v_annotation.ArrowsizeValidator(),
+            'arrowwidth': v_annotation.ArrowwidthValidator(),
+            'standoff': v_annotation.StandoffValidator(),
+            'hovertext': v_annotation.HovertextValidator(),
+            'hoverlabel': v_annotation.HoverlabelValidator(),
+            'captureevents': v_annotation.CaptureeventsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        x=None,
+        y=None,
+        z=None,
+        ax=None,
+        ay=None,
+        xanchor=None,
+        xshift=None,
+        yanchor=None,
+        yshift=None,
+        text=None,
+        textangle=None,
+        font=None,
+        width=None,
+        height=None,
+        opacity=None,
+        align=None,
+        valign=None,
+        bgcolor=None,
+        bordercolor=None,
+        borderpad=None,
+        borderwidth=None,
+        showarrow=None,
+        arrowcolor=None,
+        arrowhead=None,
+        arrowsize=None,
+        arrowwidth=None,
+        standoff=None,
+        hovertext=None,
+        hoverlabel=None,
+        captureevents=None,
+        **kwargs
+    ):
+        super().__init__('annotations', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.x = x
+        self.y = y
+        self.z = z
+        self.ax = ax
+        self.ay = ay
+        self.xanchor = xanchor
+        self.xshift = xshift
+        self.yanchor = yanchor
+        self.yshift = yshift
+        self.text = text
+        self.textangle = textangle
+        self.font = font
+        self.width = width
+        self.height = height
+        self.opacity = opacity
+        self.align = align
+        self.valign = valign
+        self.bgcolor = bgcolor
+        self.bordercolor = bordercolor
+        self.borderpad = borderpad
+        self.borderwidth = borderwidth
+        self.showarrow = showarrow
+        self.arrowcolor = arrowcolor
+        self.arrowhead = arrowhead
+        self.arrowsize = arrowsize
+        self.arrowwidth = arrowwidth
+        self.standoff = standoff
+        self.hovertext = hovertext
+        self.hoverlabel = hoverlabel
+        self.captureevents = captureevents
@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene import (aspectratio as v_aspectratio)
+
+
+class Aspectratio(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.aspectratio'
+
+    # x
+    # -
+    x: Number = SimpleProperty()
+
+    # y
+    # -
+    y: Number = SimpleProperty()
+
+    # z
+    # -
+    z: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'x': v_aspectratio.XValidator(),
+            'y': v_aspectratio.YValidator(),
+            'z': v_aspectratio.ZValidator(),
+        }
+
+    def __init__(self, x=None, y=None, z=None, **kwargs):
+        super().__init__('aspectratio', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.x = x
+        self.y = y
+        self.z = z
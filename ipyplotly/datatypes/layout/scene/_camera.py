@@ -0,0 +1,53 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene import (camera as v_camera)
+from ipyplotly.datatypes.layout.scene import (camera as d_camera)
+
+
+class Camera(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.camera'
+
+    # up
+    # --
+    up: 'd_camera.Up' = CompoundProperty()
+
+    # center
+    # ------
+    center: 'd_camera.Center' = CompoundProperty()
+
+    # eye
+    # ---
+    eye: 'd_camera.Eye' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'up': v_camera.UpValidator(),
+            'center': v_camera.CenterValidator(),
+            'eye': v_camera.EyeValidator(),
+        }
+
+    def __init__(self, up=None, center=None, eye=None, **kwargs):
+        super().__init__('camera', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.up = up
+        self.center = center
+        self.eye = eye
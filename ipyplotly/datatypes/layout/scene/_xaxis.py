@@ -0,0 +1,416 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene import (xaxis as v_xaxis)
+from ipyplotly.datatypes.layout.scene import (xaxis as d_xaxis)
+
+
+class Xaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.xaxis'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # showspikes
+    # ----------
+    showspikes: bool = SimpleProperty()
+
+    # spikesides
+    # ----------
+    spikesides: bool = SimpleProperty()
+
+    # spikethickness
+    # --------------
+    spikethickness: Number = SimpleProperty()
+
+    # spikecolor
+    # ----------
+    spikecolor: str = SimpleProperty()
+
+    # showbackground
+    # --------------
+    showbackground: bool = SimpleProperty()
+
+    # backgroundcolor
+    # ---------------
+    backgroundcolor: str = SimpleProperty()
+
+    # showaxeslabels
+    # --------------
+    showaxeslabels: bool = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # categoryorder
+    # -------------
+    categoryorder: Any = SimpleProperty()
+
+    # categoryarray
+    # -------------
+    categoryarray: List = SimpleProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_xaxis.Titlefont' = CompoundProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # autorange
+    # ---------
+    autorange: Any = SimpleProperty()
+
+    # rangemode
+    # ---------
+    rangemode: Any = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # mirror
+    # ------
+    mirror: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_xaxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_xaxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # hoverformat
+    # -----------
+    hoverformat: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # zeroline
+    # --------
+    zeroline: bool = SimpleProperty()
+
+    # zerolinecolor
+    # -------------
+    zerolinecolor: str = SimpleProperty()
+
+    # zerolinewidth
+    # -------------
+    zerolinewidth: Number = SimpleProperty()
+
+    # calendar
+    # --------
+    calendar: Any = SimpleProperty()
+
+    # categoryarraysrc
+    # ----------------
+    categoryarraysrc: str = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_xaxis.VisibleValidator(),
+            'showspikes': v_xaxis.ShowspikesValidator(),
+            'spikesides': v_xaxis.SpikesidesValidator(),
+            'spikethickness': v_xaxis.SpikethicknessValidator(),
+            'spikecolor': v_xaxis.SpikecolorValidator(),
+            'showbackground': v_xaxis.ShowbackgroundValidator(),
+            'backgroundcolor': v_xaxis.BackgroundcolorValidator(),
+            'showaxeslabels': v_xaxis.ShowaxeslabelsValidator(),
+            'color': v_xaxis.ColorValidator(),
+            'categoryorder': v_xaxis.CategoryorderValidator(),
+            'categoryarray': v_xaxis.CategoryarrayValidator(),
+            'title': v_xaxis.TitleValidator(),
+            'titlefont': v_xaxis.TitlefontValidator(),
+            'type': v_xaxis.TypeValidator(),
+            'autorange': v_xaxis.AutorangeValidator(),
+            'rangemode': v_xaxis.RangemodeValidator(),
+            'range': v_xaxis.RangeValidator(),
+            'tickmode': v_xaxis.TickmodeValidator(),
+            'nticks': v_xaxis.NticksValidator(),
+            'tick0': v_xaxis.Tick0Validator(),
+            'dtick': v_xaxis.DtickValidator(),
+            'tickvals': v_xaxis.TickvalsValidator(),
+            'ticktext': v_xaxis.TicktextValidator(),
+            'ticks': v_xaxis.TicksValidator(),
+            'mirror': v_xaxis.MirrorValidator(),
+            'ticklen': v_xaxis.TicklenValidator(),
+            'tickwidth': v_xaxis.TickwidthValidator(),
+            'tickcolor': v_xaxis.TickcolorValidator(),
+            'showticklabels': v_xaxis.ShowticklabelsValidator(),
+            'tickfont': v_xaxis.TickfontValidator(),
+            'tickangle': v_xaxis.TickangleValidator(),
+            'tickprefix': v_xaxis.TickprefixValidator(),
+            'showtickprefix': v_xaxis.ShowtickprefixValidator(),
+            'ticksuffix': v_xaxis.TicksuffixValidator(),
+            'showticksuffix': v_xaxis.ShowticksuffixValidator(),
+            'showexponent': v_xaxis.ShowexponentValidator(),
+            'exponentformat': v_xaxis.ExponentformatValidator(),
+            'separatethousands': v_xaxis.SeparatethousandsValidator(),
+            'tickformat': v_xaxis.TickformatValidator(),
+            'tickformatstops': v_xaxis.TickformatstopsValidator(),
+            'hoverformat': v_xaxis.HoverformatValidator(),
+            'showline': v_xaxis.ShowlineValidator(),
+            'linecolor': v_xaxis.LinecolorValidator(),
+            'linewidth': v_xaxis.LinewidthValidator(),
+            'showgrid': v_xaxis.ShowgridValidator(),
+            'gridcolor': v_xaxis.GridcolorValidator(),
+            'gridwidth': v_xaxis.GridwidthValidator(),
+            'zeroline': v_xaxis.ZerolineValidator(),
+            'zerolinecolor': v_xaxis.ZerolinecolorValidator(),
+            'zerolinewidth': v_xaxis.ZerolinewidthValidator(),
+            'calendar': v_xaxis.CalendarValidator(),
+            'categoryarraysrc': v_xaxis.CategoryarraysrcValidator(),
+            'tickvalssrc': v_xaxis.TickvalssrcValidator(),
+            'ticktextsrc': v_xaxis.TicktextsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showspikes=None,
+        spikesides=None,
+        spikethickness=None,
+        spikecolor=None,
+        showbackground=None,
+        backgroundcolor=None,
+        showaxeslabels=None,
+        color=None,
+        categoryorder=None,
+        categoryarray=None,
+        title=None,
+        titlefont=None,
+        type=None,
+        autorange=None,
+        rangemode=None,
+        range=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        mirror=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        tickfont=None,
+        tickangle=None,
+        tickprefix=None,
+        showtickprefix=None,
+        ticksuffix=None,
+        showticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickformat=None,
+        tickformatstops=None,
+        hoverformat=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        showgrid=None,
+        gridcolor=None,
+        gridwidth=None,
+        zeroline=None,
+        zerolinecolor=None,
+        zerolinewidth=None,
+        calendar=None,
+        categoryarraysrc=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        **kwargs
+    ):
+        super().__init__('xaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showspikes = showspikes
+        self.spikesides = spikesides
+        self.spikethickness = spikethickness
+        self.spikecolor = spikecolor
+        self.showbackground = showbackground
+        self.backgroundcolor = backgroundcolor
+        self.showaxeslabels = showaxeslabels
+        self.color = color
+        self.categoryorder = categoryorder
+        self.categoryarray = categoryarray
+        self.title = title
+        self.titlefont = titlefont
+        self.type = type
+        self.autorange = autorange
+        self.rangemode = rangemode
+        self.range = range
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.mirror = mirror
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickprefix = tickprefix
+        self.showtickprefix = showtickprefix
+        self.ticksuffix = ticksuffix
+        self.showticksuffix = showticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.hoverformat = hoverformat
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.showgrid = showgrid
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.zeroline = zeroline
+        self.zerolinecolor = zerolinecolor
+        self.zerolinewidth = zerolinewidth
+        self.calendar = calendar
+        self.categoryarraysrc = categoryarraysrc
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
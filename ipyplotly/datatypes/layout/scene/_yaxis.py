@@ -0,0 +1,416 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene import (yaxis as v_yaxis)
+from ipyplotly.datatypes.layout.scene import (yaxis as d_yaxis)
+
+
+class Yaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.yaxis'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # showspikes
+    # ----------
+    showspikes: bool = SimpleProperty()
+
+    # spikesides
+    # ----------
+    spikesides: bool = SimpleProperty()
+
+    # spikethickness
+    # --------------
+    spikethickness: Number = SimpleProperty()
+
+    # spikecolor
+    # ----------
+    spikecolor: str = SimpleProperty()
+
+    # showbackground
+    # --------------
+    showbackground: bool = SimpleProperty()
+
+    # backgroundcolor
+    # ---------------
+    backgroundcolor: str = SimpleProperty()
+
+    # showaxeslabels
+    # --------------
+    showaxeslabels: bool = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # categoryorder
+    # -------------
+    categoryorder: Any = SimpleProperty()
+
+    # categoryarray
+    # -------------
+    categoryarray: List = SimpleProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_yaxis.Titlefont' = CompoundProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # autorange
+    # ---------
+    autorange: Any = SimpleProperty()
+
+    # rangemode
+    # ---------
+    rangemode: Any = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # mirror
+    # ------
+    mirror: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_yaxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_yaxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # hoverformat
+    # -----------
+    hoverformat: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # zeroline
+    # --------
+    zeroline: bool = SimpleProperty()
+
+    # zerolinecolor
+    # -------------
+    zerolinecolor: str = SimpleProperty()
+
+    # zerolinewidth
+    # -------------
+    zerolinewidth: Number = SimpleProperty()
+
+    # calendar
+    # --------
+    calendar: Any = SimpleProperty()
+
+    # categoryarraysrc
+    # ----------------
+    categoryarraysrc: str = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_yaxis.VisibleValidator(),
+            'showspikes': v_yaxis.ShowspikesValidator(),
+            'spikesides': v_yaxis.SpikesidesValidator(),
+            'spikethickness': v_yaxis.SpikethicknessValidator(),
+            'spikecolor': v_yaxis.SpikecolorValidator(),
+            'showbackground': v_yaxis.ShowbackgroundValidator(),
+            'backgroundcolor': v_yaxis.BackgroundcolorValidator(),
+            'showaxeslabels': v_yaxis.ShowaxeslabelsValidator(),
+            'color': v_yaxis.ColorValidator(),
+            'categoryorder': v_yaxis.CategoryorderValidator(),
+            'categoryarray': v_yaxis.CategoryarrayValidator(),
+            'title': v_yaxis.TitleValidator(),
+            'titlefont': v_yaxis.TitlefontValidator(),
+            'type': v_yaxis.TypeValidator(),
+            'autorange': v_yaxis.AutorangeValidator(),
+            'rangemode': v_yaxis.RangemodeValidator(),
+            'range': v_yaxis.RangeValidator(),
+            'tickmode': v_yaxis.TickmodeValidator(),
+            'nticks': v_yaxis.NticksValidator(),
+            'tick0': v_yaxis.Tick0Validator(),
+            'dtick': v_yaxis.DtickValidator(),
+            'tickvals': v_yaxis.TickvalsValidator(),
+            'ticktext': v_yaxis.TicktextValidator(),
+            'ticks': v_yaxis.TicksValidator(),
+            'mirror': v_yaxis.MirrorValidator(),
+            'ticklen': v_yaxis.TicklenValidator(),
+            'tickwidth': v_yaxis.TickwidthValidator(),
+            'tickcolor': v_yaxis.TickcolorValidator(),
+            'showticklabels': v_yaxis.ShowticklabelsValidator(),
+            'tickfont': v_yaxis.TickfontValidator(),
+            'tickangle': v_yaxis.TickangleValidator(),
+            'tickprefix': v_yaxis.TickprefixValidator(),
+            'showtickprefix': v_yaxis.ShowtickprefixValidator(),
+            'ticksuffix': v_yaxis.TicksuffixValidator(),
+            'showticksuffix': v_yaxis.ShowticksuffixValidator(),
+            'showexponent': v_yaxis.ShowexponentValidator(),
+            'exponentformat': v_yaxis.ExponentformatValidator(),
+            'separatethousands': v_yaxis.SeparatethousandsValidator(),
+            'tickformat': v_yaxis.TickformatValidator(),
+            'tickformatstops': v_yaxis.TickformatstopsValidator(),
+            'hoverformat': v_yaxis.HoverformatValidator(),
+            'showline': v_yaxis.ShowlineValidator(),
+            'linecolor': v_yaxis.LinecolorValidator(),
+            'linewidth': v_yaxis.LinewidthValidator(),
+            'showgrid': v_yaxis.ShowgridValidator(),
+            'gridcolor': v_yaxis.GridcolorValidator(),
+            'gridwidth': v_yaxis.GridwidthValidator(),
+            'zeroline': v_yaxis.ZerolineValidator(),
+            'zerolinecolor': v_yaxis.ZerolinecolorValidator(),
+            'zerolinewidth': v_yaxis.ZerolinewidthValidator(),
+            'calendar': v_yaxis.CalendarValidator(),
+            'categoryarraysrc': v_yaxis.CategoryarraysrcValidator(),
+            'tickvalssrc': v_yaxis.TickvalssrcValidator(),
+            'ticktextsrc': v_yaxis.TicktextsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showspikes=None,
+        spikesides=None,
+        spikethickness=None,
+        spikecolor=None,
+        showbackground=None,
+        backgroundcolor=None,
+        showaxeslabels=None,
+        color=None,
+        categoryorder=None,
+        categoryarray=None,
+        title=None,
+        titlefont=None,
+        type=None,
+        autorange=None,
+        rangemode=None,
+        range=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        mirror=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        tickfont=None,
+        tickangle=None,
+        tickprefix=None,
+        showtickprefix=None,
+        ticksuffix=None,
+        showticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickformat=None,
+        tickformatstops=None,
+        hoverformat=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        showgrid=None,
+        gridcolor=None,
+        gridwidth=None,
+        zeroline=None,
+        zerolinecolor=None,
+        zerolinewidth=None,
+        calendar=None,
+        categoryarraysrc=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        **kwargs
+    ):
+        super().__init__('yaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showspikes = showspikes
+        self.spikesides = spikesides
+        self.spikethickness = spikethickness
+        self.spikecolor = spikecolor
+        self.showbackground = showbackground
+        self.backgroundcolor = backgroundcolor
+        self.showaxeslabels = showaxeslabels
+        self.color = color
+        self.categoryorder = categoryorder
+        self.categoryarray = categoryarray
+        self.title = title
+        self.titlefont = titlefont
+        self.type = type
+        self.autorange = autorange
+        self.rangemode = rangemode
+        self.range = range
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.mirror = mirror
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickprefix = tickprefix
+        self.showtickprefix = showtickprefix
+        self.ticksuffix = ticksuffix
+        self.showticksuffix = showticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.hoverformat = hoverformat
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.showgrid = showgrid
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.zeroline = zeroline
+        self.zerolinecolor = zerolinecolor
+        self.zerolinewidth = zerolinewidth
+        self.calendar = calendar
+        self.categoryarraysrc = categoryarraysrc
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
@@ -0,0 +1,416 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene import (zaxis as v_zaxis)
+from ipyplotly.datatypes.layout.scene import (zaxis as d_zaxis)
+
+
+class Zaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.zaxis'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # showspikes
+    # ----------
+    showspikes: bool = SimpleProperty()
+
+    # spikesides
+    # ----------
+    spikesides: bool = SimpleProperty()
+
+    # spikethickness
+    # --------------
+    spikethickness: Number = SimpleProperty()
+
+    # spikecolor
+    # ----------
+    spikecolor: str = SimpleProperty()
+
+    # showbackground
+    # --------------
+    showbackground: bool = SimpleProperty()
+
+    # backgroundcolor
+    # ---------------
+    backgroundcolor: str = SimpleProperty()
+
+    # showaxeslabels
+    # --------------
+    showaxeslabels: bool = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # categoryorder
+    # -------------
+    categoryorder: Any = SimpleProperty()
+
+    # categoryarray
+    # -------------
+    categoryarray: List = SimpleProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_zaxis.Titlefont' = CompoundProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # autorange
+    # ---------
+    autorange: Any = SimpleProperty()
+
+    # rangemode
+    # ---------
+    rangemode: Any = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # mirror
+    # ------
+    mirror: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_zaxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_zaxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # hoverformat
+    # -----------
+    hoverformat: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # zeroline
+    # --------
+    zeroline: bool = SimpleProperty()
+
+    # zerolinecolor
+    # -------------
+    zerolinecolor: str = SimpleProperty()
+
+    # zerolinewidth
+    # -------------
+    zerolinewidth: Number = SimpleProperty()
+
+    # calendar
+    # --------
+    calendar: Any = SimpleProperty()
+
+    # categoryarraysrc
+    # ----------------
+    categoryarraysrc: str = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_zaxis.VisibleValidator(),
+            'showspikes': v_zaxis.ShowspikesValidator(),
+            'spikesides': v_zaxis.SpikesidesValidator(),
+            'spikethickness': v_zaxis.SpikethicknessValidator(),
+            'spikecolor': v_zaxis.SpikecolorValidator(),
+            'showbackground': v_zaxis.ShowbackgroundValidator(),
+            'backgroundcolor': v_zaxis.BackgroundcolorValidator(),
+            'showaxeslabels': v_zaxis.ShowaxeslabelsValidator(),
+            'color': v_zaxis.ColorValidator(),
+            'categoryorder': v_zaxis.CategoryorderValidator(),
+            'categoryarray': v_zaxis.CategoryarrayValidator(),
+            'title': v_zaxis.TitleValidator(),
+            'titlefont': v_zaxis.TitlefontValidator(),
+            'type': v_zaxis.TypeValidator(),
+            'autorange': v_zaxis.AutorangeValidator(),
+            'rangemode': v_zaxis.RangemodeValidator(),
+            'range': v_zaxis.RangeValidator(),
+            'tickmode': v_zaxis.TickmodeValidator(),
+            'nticks': v_zaxis.NticksValidator(),
+            'tick0': v_zaxis.Tick0Validator(),
+            'dtick': v_zaxis.DtickValidator(),
+            'tickvals': v_zaxis.TickvalsValidator(),
+            'ticktext': v_zaxis.TicktextValidator(),
+            'ticks': v_zaxis.TicksValidator(),
+            'mirror': v_zaxis.MirrorValidator(),
+            'ticklen': v_zaxis.TicklenValidator(),
+            'tickwidth': v_zaxis.TickwidthValidator(),
+            'tickcolor': v_zaxis.TickcolorValidator(),
+            'showticklabels': v_zaxis.ShowticklabelsValidator(),
+            'tickfont': v_zaxis.TickfontValidator(),
+            'tickangle': v_zaxis.TickangleValidator(),
+            'tickprefix': v_zaxis.TickprefixValidator(),
+            'showtickprefix': v_zaxis.ShowtickprefixValidator(),
+            'ticksuffix': v_zaxis.TicksuffixValidator(),
+            'showticksuffix': v_zaxis.ShowticksuffixValidator(),
+            'showexponent': v_zaxis.ShowexponentValidator(),
+            'exponentformat': v_zaxis.ExponentformatValidator(),
+            'separatethousands': v_zaxis.SeparatethousandsValidator(),
+            'tickformat': v_zaxis.TickformatValidator(),
+            'tickformatstops': v_zaxis.TickformatstopsValidator(),
+            'hoverformat': v_zaxis.HoverformatValidator(),
+            'showline': v_zaxis.ShowlineValidator(),
+            'linecolor': v_zaxis.LinecolorValidator(),
+            'linewidth': v_zaxis.LinewidthValidator(),
+            'showgrid': v_zaxis.ShowgridValidator(),
+            'gridcolor': v_zaxis.GridcolorValidator(),
+            'gridwidth': v_zaxis.GridwidthValidator(),
+            'zeroline': v_zaxis.ZerolineValidator(),
+            'zerolinecolor': v_zaxis.ZerolinecolorValidator(),
+            'zerolinewidth': v_zaxis.ZerolinewidthValidator(),
+            'calendar': v_zaxis.CalendarValidator(),
+            'categoryarraysrc': v_zaxis.CategoryarraysrcValidator(),
+            'tickvalssrc': v_zaxis.TickvalssrcValidator(),
+            'ticktextsrc': v_zaxis.TicktextsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showspikes=None,
+        spikesides=None,
+        spikethickness=None,
+        spikecolor=None,
+        showbackground=None,
+        backgroundcolor=None,
+        showaxeslabels=None,
+        color=None,
+        categoryorder=None,
+        categoryarray=None,
+        title=None,
+        titlefont=None,
+        type=None,
+        autorange=None,
+        rangemode=None,
+        range=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        mirror=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        tickfont=None,
+        tickangle=None,
+        tickprefix=None,
+        showtickprefix=None,
+        ticksuffix=None,
+        showticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickformat=None,
+        tickformatstops=None,
+        hoverformat=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        showgrid=None,
+        gridcolor=None,
+        gridwidth=None,
+        zeroline=None,
+        zerolinecolor=None,
+        zerolinewidth=None,
+        calendar=None,
+        categoryarraysrc=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        **kwargs
+    ):
+        super().__init__('zaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showspikes = showspikes
+        self.spikesides = spikesides
+        self.spikethickness = spikethickness
+        self.spikecolor = spikecolor
+        self.showbackground = showbackground
+        self.backgroundcolor = backgroundcolor
+        self.showaxeslabels = showaxeslabels
+        self.color = color
+        self.categoryorder = categoryorder
+        self.categoryarray = categoryarray
+        self.title = title
+        self.titlefont = titlefont
+        self.type = type
+        self.autorange = autorange
+        self.rangemode = rangemode
+        self.range = range
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.mirror = mirror
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickprefix = tickprefix
+        self.showtickprefix = showtickprefix
+        self.ticksuffix = ticksuffix
+        self.showticksuffix = showticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.hoverformat = hoverformat
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.showgrid = showgrid
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.zeroline = zeroline
+        self.zerolinecolor = zerolinecolor
+        self.zerolinewidth = zerolinewidth
+        self.calendar = calendar
+        self.categoryarraysrc = categoryarraysrc
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
@@ -0,0 +1,53 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene.annotation import (hoverlabel as v_hoverlabel)
+from ipyplotly.datatypes.layout.scene.annotation import (hoverlabel as d_hoverlabel)
+
+
+class Hoverlabel(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.annotation.hoverlabel'
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # font
+    # ----
+    font: 'd_hoverlabel.Font' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene.annotation'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'bgcolor': v_hoverlabel.BgcolorValidator(),
+            'bordercolor': v_hoverlabel.BordercolorValidator(),
+            'font': v_hoverlabel.FontValidator(),
+        }
+
+    def __init__(self, bgcolor=None, bordercolor=None, font=None, **kwargs):
+        super().__init__('hoverlabel', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.bgcolor = bgcolor
+        self.bordercolor = bordercolor
+        self.font = font
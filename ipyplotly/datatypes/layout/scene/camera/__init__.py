@@ -0,0 +1,17 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._up import Up
+    from ._center import Center
+    from ._eye import Eye
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._up.Up',
+            '._center.Center',
+            '._eye.Eye',
+        ]
+    )
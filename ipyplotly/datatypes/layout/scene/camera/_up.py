@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.scene.camera import (up as v_up)
+
+
+class Up(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.scene.camera.up'
+
+    # x
+    # -
+    x: Number = SimpleProperty()
+
+    # y
+    # -
+    y: Number = SimpleProperty()
+
+    # z
+    # -
+    z: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.scene.camera'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'x': v_up.XValidator(),
+            'y': v_up.YValidator(),
+            'z': v_up.ZValidator(),
+        }
+
+    def __init__(self, x=None, y=None, z=None, **kwargs):
+        super().__init__('up', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.x = x
+        self.y = y
+        self.z = z
@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.shape import (line as v_line)
+
+
+class Line(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.shape.line'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # dash
+    # ----
+    dash: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.shape'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_line.ColorValidator(),
+            'width': v_line.WidthValidator(),
+            'dash': v_line.DashValidator(),
+        }
+
+    def __init__(self, color=None, width=None, dash=None, **kwargs):
+        super().__init__('line', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.width = width
+        self.dash = dash
@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._step import Step
+    from ._pad import Pad
+    from ._transition import Transition
+    from ._currentvalue import Currentvalue
+    from ._font import Font
+    from . import currentvalue
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.currentvalue',
+        ],
+        [
+            '._step.Step',
+            '._pad.Pad',
+            '._transition.Transition',
+            '._currentvalue.Currentvalue',
+            '._font.Font',
+        ]
+    )
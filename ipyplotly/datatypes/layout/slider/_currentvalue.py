@@ -0,0 +1,71 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.slider import (currentvalue as v_currentvalue)
+from ipyplotly.datatypes.layout.slider import (currentvalue as d_currentvalue)
+
+
+class Currentvalue(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.slider.currentvalue'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # offset
+    # ------
+    offset: Number = SimpleProperty()
+
+    # prefix
+    # ------
+    prefix: str = SimpleProperty()
+
+    # suffix
+    # ------
+    suffix: str = SimpleProperty()
+
+    # font
+    # ----
+    font: 'd_currentvalue.Font' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.slider'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_currentvalue.VisibleValidator(),
+            'xanchor': v_currentvalue.XanchorValidator(),
+            'offset': v_currentvalue.OffsetValidator(),
+            'prefix': v_currentvalue.PrefixValidator(),
+            'suffix': v_currentvalue.SuffixValidator(),
+            'font': v_currentvalue.FontValidator(),
+        }
+
+    def __init__(self, visible=None, xanchor=None, offset=None, prefix=None, suffix=None, font=None, **kwargs):
+        super().__init__('currentvalue', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.xanchor = xanchor
+        self.offset = offset
+        self.prefix = prefix
+        self.suffix = suffix
+        self.font = font
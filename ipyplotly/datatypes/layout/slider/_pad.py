@@ -0,0 +1,58 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.slider import (pad as v_pad)
+
+
+class Pad(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.slider.pad'
+
+    # t
+    # -
+    t: Number = SimpleProperty()
+
+    # r
+    # -
+    r: Number = SimpleProperty()
+
+    # b
+    # -
+    b: Number = SimpleProperty()
+
+    # l
+    # -
+    l: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.slider'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            't': v_pad.TValidator(),
+            'r': v_pad.RValidator(),
+            'b': v_pad.BValidator(),
+            'l': v_pad.LValidator(),
+        }
+
+    def __init__(self, t=None, r=None, b=None, l=None, **kwargs):
+        super().__init__('pad', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.t = t
+        self.r = r
+        self.b = b
+        self.l = l
@@ -0,0 +1,64 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.slider import (step as v_step)
+
+
+class Step(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.slider.step'
+
+    # method
+    # ------
+    method: Any = SimpleProperty()
+
+    # args
+    # ----
+    args: List = SimpleProperty()
+
+    # label
+    # -----
+    label: str = SimpleProperty()
+
+    # value
+    # -----
+    value: str = SimpleProperty()
+
+    # execute
+    # -------
+    execute: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.slider'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'method': v_step.MethodValidator(),
+            'args': v_step.ArgsValidator(),
+            'label': v_step.LabelValidator(),
+            'value': v_step.ValueValidator(),
+            'execute': v_step.ExecuteValidator(),
+        }
+
+    def __init__(self, method=None, args=None, label=None, value=None, execute=None, **kwargs):
+        super().__init__('steps', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.method = method
+        self.args = args
+        self.label = label
+        self.value = value
+        self.execute = execute
@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.slider import (transition as v_transition)
+
+
+class Transition(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.slider.transition'
+
+    # duration
+    # --------
+    duration: Number = SimpleProperty()
+
+    # easing
+    # ------
+    easing: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.slider'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'duration': v_transition.DurationValidator(),
+            'easing': v_transition.EasingValidator(),
+        }
+
+    def __init__(self, duration=None, easing=None, **kwargs):
+        super().__init__('transition', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.duration = duration
+        self.easing = easing
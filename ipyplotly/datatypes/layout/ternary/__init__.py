@@ -0,0 +1,26 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._domain import Domain
+    from ._aaxis import Aaxis
+    from ._baxis import Baxis
+    from ._caxis import Caxis
+    from . import caxis
+    from . import baxis
+    from . import aaxis
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.caxis',
+            '.baxis',
+            '.aaxis',
+        ],
+        [
+            '._domain.Domain',
+            '._aaxis.Aaxis',
+            '._baxis.Baxis',
+            '._caxis.Caxis',
+        ]
+    )
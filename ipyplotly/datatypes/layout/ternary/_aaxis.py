@@ -0,0 +1,290 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.ternary import (aaxis as v_aaxis)
+from ipyplotly.datatypes.layout.ternary import (aaxis as d_aaxis)
+
+
+class Aaxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.ternary.aaxis'
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_aaxis.Titlefont' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_aaxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_aaxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # hoverformat
+    # -----------
+    hoverformat: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # layer
+    # -----
+    layer: Any = SimpleProperty()
+
+    # min
+    # ---
+    min: Number = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.ternary'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'title': v_aaxis.TitleValidator(),
+            'titlefont': v_aaxis.TitlefontValidator(),
+            'color': v_aaxis.ColorValidator(),
+            'tickmode': v_aaxis.TickmodeValidator(),
+            'nticks': v_aaxis.NticksValidator(),
+            'tick0': v_aaxis.Tick0Validator(),
+            'dtick': v_aaxis.DtickValidator(),
+            'tickvals': v_aaxis.TickvalsValidator(),
+            'ticktext': v_aaxis.TicktextValidator(),
+            'ticks': v_aaxis.TicksValidator(),
+            'ticklen': v_aaxis.TicklenValidator(),
+            'tickwidth': v_aaxis.TickwidthValidator(),
+            'tickcolor': v_aaxis.TickcolorValidator(),
+            'showticklabels': v_aaxis.ShowticklabelsValidator(),
+            'showtickprefix': v_aaxis.ShowtickprefixValidator(),
+            'tickprefix': v_aaxis.TickprefixValidator(),
+            'showticksuffix': v_aaxis.ShowticksuffixValidator(),
+            'ticksuffix': v_aaxis.TicksuffixValidator(),
+            'showexponent': v_aaxis.ShowexponentValidator(),
+            'exponentformat': v_aaxis.ExponentformatValidator(),
+            'separatethousands': v_aaxis.SeparatethousandsValidator(),
+            'tickfont': v_aaxis.TickfontValidator(),
+            'tickangle': v_aaxis.TickangleValidator(),
+            'tickformat': v_aaxis.TickformatValidator(),
+            'tickformatstops': v_aaxis.TickformatstopsValidator(),
+            'hoverformat': v_aaxis.HoverformatValidator(),
+            'showline': v_aaxis.ShowlineValidator(),
+            'linecolor': v_aaxis.LinecolorValidator(),
+            'linewidth': v_aaxis.LinewidthValidator(),
+            'showgrid': v_aaxis.ShowgridValidator(),
+            'gridcolor': v_aaxis.GridcolorValidator(),
+            'gridwidth': v_aaxis.GridwidthValidator(),
+            'layer': v_aaxis.LayerValidator(),
+            'min': v_aaxis.MinValidator(),
+            'tickvalssrc': v_aaxis.TickvalssrcValidator(),
+            'ticktextsrc': v_aaxis.TicktextsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        title=None,
+        titlefont=None,
+        color=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        showtickprefix=None,
+        tickprefix=None,
+        showticksuffix=None,
+        ticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickfont=None,
+        tickangle=None,
+        tickformat=None,
+        tickformatstops=None,
+        hoverformat=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        showgrid=None,
+        gridcolor=None,
+        gridwidth=None,
+        layer=None,
+        min=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        **kwargs
+    ):
+        super().__init__('aaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.title = title
+        self.titlefont = titlefont
+        self.color = color
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.showtickprefix = showtickprefix
+        self.tickprefix = tickprefix
+        self.showticksuffix = showticksuffix
+        self.ticksuffix = ticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.hoverformat = hoverformat
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.showgrid = showgrid
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.layer = layer
+        self.min = min
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
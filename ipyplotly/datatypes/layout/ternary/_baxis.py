@@ -0,0 +1,290 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.ternary import (baxis as v_baxis)
+from ipyplotly.datatypes.layout.ternary import (baxis as d_baxis)
+
+
+class Baxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.ternary.baxis'
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_baxis.Titlefont' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_baxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_baxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # hoverformat
+    # -----------
+    hoverformat: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # layer
+    # -----
+    layer: Any = SimpleProperty()
+
+    # min
+    # ---
+    min: Number = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.ternary'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'title': v_baxis.TitleValidator(),
+            'titlefont': v_baxis.TitlefontValidator(),
+            'color': v_baxis.ColorValidator(),
+            'tickmode': v_baxis.TickmodeValidator(),
+            'nticks': v_baxis.NticksValidator(),
+            'tick0': v_baxis.Tick0Validator(),
+            'dtick': v_baxis.DtickValidator(),
+            'tickvals': v_baxis.TickvalsValidator(),
+            'ticktext': v_baxis.TicktextValidator(),
+            'ticks': v_baxis.TicksValidator(),
+            'ticklen': v_baxis.TicklenValidator(),
+            'tickwidth': v_baxis.TickwidthValidator(),
+            'tickcolor': v_baxis.TickcolorValidator(),
+            'showticklabels': v_baxis.ShowticklabelsValidator(),
+            'showtickprefix': v_baxis.ShowtickprefixValidator(),
+            'tickprefix': v_baxis.TickprefixValidator(),
+            'showticksuffix': v_baxis.ShowticksuffixValidator(),
+            'ticksuffix': v_baxis.TicksuffixValidator(),
+            'showexponent': v_baxis.ShowexponentValidator(),
+            'exponentformat': v_baxis.ExponentformatValidator(),
+            'separatethousands': v_baxis.SeparatethousandsValidator(),
+            'tickfont': v_baxis.TickfontValidator(),
+            'tickangle': v_baxis.TickangleValidator(),
+            'tickformat': v_baxis.TickformatValidator(),
+            'tickformatstops': v_baxis.TickformatstopsValidator(),
+            'hoverformat': v_baxis.HoverformatValidator(),
+            'showline': v_baxis.ShowlineValidator(),
+            'linecolor': v_baxis.LinecolorValidator(),
+            'linewidth': v_baxis.LinewidthValidator(),
+            'showgrid': v_baxis.ShowgridValidator(),
+            'gridcolor': v_baxis.GridcolorValidator(),
+            'gridwidth': v_baxis.GridwidthValidator(),
+            'layer': v_baxis.LayerValidator(),
+            'min': v_baxis.MinValidator(),
+            'tickvalssrc': v_baxis.TickvalssrcValidator(),
+            'ticktextsrc': v_baxis.TicktextsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        title=None,
+        titlefont=None,
+        color=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        showtickprefix=None,
+        tickprefix=None,
+        showticksuffix=None,
+        ticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickfont=None,
+        tickangle=None,
+        tickformat=None,
+        tickformatstops=None,
+        hoverformat=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        showgrid=None,
+        gridcolor=None,
+        gridwidth=None,
+        layer=None,
+        min=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        **kwargs
+    ):
+        super().__init__('baxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.title = title
+        self.titlefont = titlefont
+        self.color = color
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.showtickprefix = showtickprefix
+        self.tickprefix = tickprefix
+        self.showticksuffix = showticksuffix
+        self.ticksuffix = ticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.hoverformat = hoverformat
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.showgrid = showgrid
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.layer = layer
+        self.min = min
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
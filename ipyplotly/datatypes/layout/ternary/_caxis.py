@@ -0,0 +1,290 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.ternary import (caxis as v_caxis)
+from ipyplotly.datatypes.layout.ternary import (caxis as d_caxis)
+
+
+class Caxis(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.ternary.caxis'
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_caxis.Titlefont' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_caxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_caxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # hoverformat
+    # -----------
+    hoverformat: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # layer
+    # -----
+    layer: Any = SimpleProperty()
+
+    # min
+    # ---
+    min: Number = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.ternary'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'title': v_caxis.TitleValidator(),
+            'titlefont': v_caxis.TitlefontValidator(),
+            'color': v_caxis.ColorValidator(),
+            'tickmode': v_caxis.TickmodeValidator(),
+            'nticks': v_caxis.NticksValidator(),
+            'tick0': v_caxis.Tick0Validator(),
+            'dtick': v_caxis.DtickValidator(),
+            'tickvals': v_caxis.TickvalsValidator(),
+            'ticktext': v_caxis.TicktextValidator(),
+            'ticks': v_caxis.TicksValidator(),
+            'ticklen': v_caxis.TicklenValidator(),
+            'tickwidth': v_caxis.TickwidthValidator(),
+            'tickcolor': v_caxis.TickcolorValidator(),
+            'showticklabels': v_caxis.ShowticklabelsValidator(),
+            'showtickprefix': v_caxis.ShowtickprefixValidator(),
+            'tickprefix': v_caxis.TickprefixValidator(),
+            'showticksuffix': v_caxis.ShowticksuffixValidator(),
+            'ticksuffix': v_caxis.TicksuffixValidator(),
+            'showexponent': v_caxis.ShowexponentValidator(),
+            'exponentformat': v_caxis.ExponentformatValidator(),
+            'separatethousands': v_caxis.SeparatethousandsValidator(),
+            'tickfont': v_caxis.TickfontValidator(),
+            'tickangle': v_caxis.TickangleValidator(),
+            'tickformat': v_caxis.TickformatValidator(),
+            'tickformatstops': v_caxis.TickformatstopsValidator(),
+            'hoverformat': v_caxis.HoverformatValidator(),
+            'showline': v_caxis.ShowlineValidator(),
+            'linecolor': v_caxis.LinecolorValidator(),
+            'linewidth': v_caxis.LinewidthValidator(),
+            'showgrid': v_caxis.ShowgridValidator(),
+            'gridcolor': v_caxis.GridcolorValidator(),
+            'gridwidth': v_caxis.GridwidthValidator(),
+            'layer': v_caxis.LayerValidator(),
+            'min': v_caxis.MinValidator(),
+            'tickvalssrc': v_caxis.TickvalssrcValidator(),
+            'ticktextsrc': v_caxis.TicktextsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        title=None,
+        titlefont=None,
+        color=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        showtickprefix=None,
+        tickprefix=None,
+        showticksuffix=None,
+        ticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickfont=None,
+        tickangle=None,
+        tickformat=None,
+        tickformatstops=None,
+        hoverformat=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        showgrid=None,
+        gridcolor=None,
+        gridwidth=None,
+        layer=None,
+        min=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        **kwargs
+    ):
+        super().__init__('caxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.title = title
+        self.titlefont = titlefont
+        self.color = color
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.showtickprefix = showtickprefix
+        self.tickprefix = tickprefix
+        self.showticksuffix = showticksuffix
+        self.ticksuffix = ticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.hoverformat = hoverformat
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.showgrid = showgrid
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.layer = layer
+        self.min = min
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.ternary.aaxis import (tickformatstop as v_tickformatstop)
+
+
+class Tickformatstop(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.ternary.aaxis.tickformatstop'
+
+    # dtickrange
+    # ----------
+    dtickrange: List = SimpleProperty()
+
+    # value
+    # -----
+    value: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.ternary.aaxis'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'dtickrange': v_tickformatstop.DtickrangeValidator(),
+            'value': v_tickformatstop.ValueValidator(),
+        }
+
+    def __init__(self, dtickrange=None, value=None, **kwargs):
+        super().__init__('tickformatstops', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.dtickrange = dtickrange
+        self.value = value
@@ -0,0 +1,58 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.updatemenu import (button as v_button)
+
+
+class Button(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.updatemenu.button'
+
+    # method
+    # ------
+    method: Any = SimpleProperty()
+
+    # args
+    # ----
+    args: List = SimpleProperty()
+
+    # label
+    # -----
+    label: str = SimpleProperty()
+
+    # execute
+    # -------
+    execute: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.updatemenu'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'method': v_button.MethodValidator(),
+            'args': v_button.ArgsValidator(),
+            'label': v_button.LabelValidator(),
+            'execute': v_button.ExecuteValidator(),
+        }
+
+    def __init__(self, method=None, args=None, label=None, execute=None, **kwargs):
+        super().__init__('buttons', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.method = method
+        self.args = args
+        self.label = label
+        self.execute = execute
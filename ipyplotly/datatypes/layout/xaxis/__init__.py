@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._titlefont import Titlefont
+    from ._tickfont import Tickfont
+    from ._tickformatstop import Tickformatstop
+    from ._rangeslider import Rangeslider
+    from ._rangeselector import Rangeselector
+    from . import rangeselector
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.rangeselector',
+        ],
+        [
+            '._titlefont.Titlefont',
+            '._tickfont.Tickfont',
+            '._tickformatstop.Tickformatstop',
+            '._rangeslider.Rangeslider',
+            '._rangeselector.Rangeselector',
+        ]
+    )
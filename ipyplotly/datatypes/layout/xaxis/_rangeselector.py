@@ -0,0 +1,115 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.xaxis import (rangeselector as v_rangeselector)
+from ipyplotly.datatypes.layout.xaxis import (rangeselector as d_rangeselector)
+
+
+class Rangeselector(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.xaxis.rangeselector'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # buttons
+    # -------
+    buttons: 'Tuple[d_rangeselector.Button]' = CompoundArrayProperty()
+
+    # x
+    # -
+    x: Number = SimpleProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # y
+    # -
+    y: Number = SimpleProperty()
+
+    # yanchor
+    # -------
+    yanchor: Any = SimpleProperty()
+
+    # font
+    # ----
+    font: 'd_rangeselector.Font' = CompoundProperty()
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # activecolor
+    # -----------
+    activecolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # borderwidth
+    # -----------
+    borderwidth: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.xaxis'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_rangeselector.VisibleValidator(),
+            'buttons': v_rangeselector.ButtonsValidator(),
+            'x': v_rangeselector.XValidator(),
+            'xanchor': v_rangeselector.XanchorValidator(),
+            'y': v_rangeselector.YValidator(),
+            'yanchor': v_rangeselector.YanchorValidator(),
+            'font': v_rangeselector.FontValidator(),
+            'bgcolor': v_rangeselector.BgcolorValidator(),
+            'activecolor': v_rangeselector.ActivecolorValidator(),
+            'bordercolor': v_rangeselector.BordercolorValidator(),
+            'borderwidth': v_rangeselector.BorderwidthValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        buttons=None,
+        x=None,
+        xanchor=None,
+        y=None,
+        yanchor=None,
+        font=None,
+        bgcolor=None,
+        activecolor=None,
+        bordercolor=None,
+        borderwidth=None,
+        **kwargs
+    ):
+        super().__init__('rangeselector', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.buttons = buttons
+        self.x = x
+        self.xanchor = xanchor
+        self.y = y
+        self.yanchor = yanchor
+        self.font = font
+        self.bgcolor = bgcolor
+        self.activecolor = activecolor
+        self.bordercolor = bordercolor
+        self.borderwidth = borderwidth
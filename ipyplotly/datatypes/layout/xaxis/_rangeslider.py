@@ -0,0 +1,86 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.xaxis import (rangeslider as v_rangeslider)
+
+
+class Rangeslider(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.xaxis.rangeslider'
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # borderwidth
+    # -----------
+    borderwidth: int = SimpleProperty()
+
+    # autorange
+    # ---------
+    autorange: bool = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # thickness
+    # ---------
+    thickness: Number = SimpleProperty()
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.xaxis'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'bgcolor': v_rangeslider.BgcolorValidator(),
+            'bordercolor': v_rangeslider.BordercolorValidator(),
+            'borderwidth': v_rangeslider.BorderwidthValidator(),
+            'autorange': v_rangeslider.AutorangeValidator(),
+            'range': v_rangeslider.RangeValidator(),
+            'thickness': v_rangeslider.ThicknessValidator(),
+            'visible': v_rangeslider.VisibleValidator(),
+        }
+
+    def __init__(
+        self,
+        bgcolor=None,
+        bordercolor=None,
+        borderwidth=None,
+        autorange=None,
+        range=None,
+        thickness=None,
+        visible=None,
+        **kwargs
+    ):
+        super().__init__('rangeslider', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.bgcolor = bgcolor
+        self.bordercolor = bordercolor
+        self.borderwidth = borderwidth
+        self.autorange = autorange
+        self.range = range
+        self.thickness = thickness
+        self.visible = visible
@@ -0,0 +1,15 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._button import Button
+    from ._font import Font
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._button.Button',
+            '._font.Font',
+        ]
+    )
@@ -0,0 +1,58 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseLayoutHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.layout.xaxis.rangeselector import (button as v_button)
+
+
+class Button(BaseLayoutHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'layout.xaxis.rangeselector.button'
+
+    # step
+    # ----
+    step: Any = SimpleProperty()
+
+    # stepmode
+    # --------
+    stepmode: Any = SimpleProperty()
+
+    # count
+    # -----
+    count: Number = SimpleProperty()
+
+    # label
+    # -----
+    label: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'layout.xaxis.rangeselector'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'step': v_button.StepValidator(),
+            'stepmode': v_button.StepmodeValidator(),
+            'count': v_button.CountValidator(),
+            'label': v_button.LabelValidator(),
+        }
+
+    def __init__(self, step=None, stepmode=None, count=None, label=None, **kwargs):
+        super().__init__('buttons', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.step = step
+        self.stepmode = stepmode
+        self.count = count
+        self.label = label
@@ -0,0 +1,132 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._scatter import Scatter
+    from ._box import Box
+    from ._bar import Bar
+    from ._heatmap import Heatmap
+    from ._histogram import Histogram
+    from ._histogram2d import Histogram2D
+    from ._histogram2dcontour import Histogram2Dcontour
+    from ._pie import Pie
+    from ._contour import Contour
+    from ._scatterternary import Scatterternary
+    from ._violin import Violin
+    from ._scatter3d import Scatter3D
+    from ._surface import Surface
+    from ._mesh3d import Mesh3D
+    from ._scattergeo import Scattergeo
+    from ._choropleth import Choropleth
+    from ._scattergl import Scattergl
+    from ._pointcloud import Pointcloud
+    from ._heatmapgl import Heatmapgl
+    from ._parcoords import Parcoords
+    from ._parcats import Parcats
+    from ._scattermapbox import Scattermapbox
+    from ._sankey import Sankey
+    from ._table import Table
+    from ._carpet import Carpet
+    from ._scattercarpet import Scattercarpet
+    from ._contourcarpet import Contourcarpet
+    from ._ohlc import Ohlc
+    from ._candlestick import Candlestick
+    from ._area import Area
+    from . import area
+    from . import candlestick
+    from . import ohlc
+    from . import contourcarpet
+    from . import scattercarpet
+    from . import carpet
+    from . import table
+    from . import sankey
+    from . import scattermapbox
+    from . import parcats
+    from . import parcoords
+    from . import heatmapgl
+    from . import pointcloud
+    from . import scattergl
+    from . import choropleth
+    from . import scattergeo
+    from . import mesh3d
+    from . import surface
+    from . import scatter3d
+    from . import violin
+    from . import scatterternary
+    from . import contour
+    from . import pie
+    from . import histogram2dcontour
+    from . import histogram2d
+    from . import histogram
+    from . import heatmap
+    from . import bar
+    from . import box
+    from . import scatter
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.area',
+            '.candlestick',
+            '.ohlc',
+            '.contourcarpet',
+            '.scattercarpet',
+            '.carpet',
+            '.table',
+            '.sankey',
+            '.scattermapbox',
+            '.parcats',
+            '.parcoords',
+            '.heatmapgl',
+            '.pointcloud',
+            '.scattergl',
+            '.choropleth',
+            '.scattergeo',
+            '.mesh3d',
+            '.surface',
+            '.scatter3d',
+            '.violin',
+            '.scatterternary',
+            '.contour',
+            '.pie',
+            '.histogram2dcontour',
+            '.histogram2d',
+            '.histogram',
+            '.heatmap',
+            '.bar',
+            '.box',
+            '.scatter',
+        ],
+        [
+            '._scatter.Scatter',
+            '._box.Box',
+            '._bar.Bar',
+            '._heatmap.Heatmap',
+            '._histogram.Histogram',
+            '._histogram2d.Histogram2D',
+            '._histogram2dcontour.Histogram2Dcontour',
+            '._pie.Pie',
+            '._contour.Contour',
+            '._scatterternary.Scatterternary',
+            '._violin.Violin',
+            '._scatter3d.Scatter3D',
+            '._surface.Surface',
+            '._mesh3d.Mesh3D',
+            '._scattergeo.Scattergeo',
+            '._choropleth.Choropleth',
+            '._scattergl.Scattergl',
+            '._pointcloud.Pointcloud',
+            '._heatmapgl.Heatmapgl',
+            '._parcoords.Parcoords',
+            '._parcats.Parcats',
+            '._scattermapbox.Scattermapbox',
+            '._sankey.Sankey',
+            '._table.Table',
+            '._carpet.Carpet',
+            '._scattercarpet.Scattercarpet',
+            '._contourcarpet.Contourcarpet',
+            '._ohlc.Ohlc',
+            '._candlestick.Candlestick',
+            '._area.Area',
+        ]
+    )
@@ -0,0 +1,195 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (area as v_area)
+from ipyplotly.datatypes.trace import (area as d_area)
+
+
+class Area(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.area'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_area.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_area.Stream' = CompoundProperty()
+
+    # r
+    # -
+    r: List = SimpleProperty()
+
+    # t
+    # -
+    t: List = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_area.Marker' = CompoundProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # rsrc
+    # ----
+    rsrc: str = SimpleProperty()
+
+    # tsrc
+    # ----
+    tsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_area.VisibleValidator(),
+            'showlegend': v_area.ShowlegendValidator(),
+            'legendgroup': v_area.LegendgroupValidator(),
+            'opacity': v_area.OpacityValidator(),
+            'name': v_area.NameValidator(),
+            'uid': v_area.UidValidator(),
+            'ids': v_area.IdsValidator(),
+            'customdata': v_area.CustomdataValidator(),
+            'selectedpoints': v_area.SelectedpointsValidator(),
+            'hoverinfo': v_area.HoverinfoValidator(),
+            'hoverlabel': v_area.HoverlabelValidator(),
+            'stream': v_area.StreamValidator(),
+            'r': v_area.RValidator(),
+            't': v_area.TValidator(),
+            'marker': v_area.MarkerValidator(),
+            'idssrc': v_area.IdssrcValidator(),
+            'customdatasrc': v_area.CustomdatasrcValidator(),
+            'hoverinfosrc': v_area.HoverinfosrcValidator(),
+            'rsrc': v_area.RsrcValidator(),
+            'tsrc': v_area.TsrcValidator(),
+            'transforms': v_area.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        r=None,
+        t=None,
+        marker=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        rsrc=None,
+        tsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('area', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.r = r
+        self.t = t
+        self.marker = marker
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.rsrc = rsrc
+        self.tsrc = tsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'area'
@@ -0,0 +1,426 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (bar as v_bar)
+from ipyplotly.datatypes.trace import (bar as d_bar)
+
+
+class Bar(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_bar.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_bar.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # dx
+    # --
+    dx: Number = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # dy
+    # --
+    dy: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_bar.Textfont' = CompoundProperty()
+
+    # insidetextfont
+    # --------------
+    insidetextfont: 'd_bar.Insidetextfont' = CompoundProperty()
+
+    # outsidetextfont
+    # ---------------
+    outsidetextfont: 'd_bar.Outsidetextfont' = CompoundProperty()
+
+    # constraintext
+    # -------------
+    constraintext: Any = SimpleProperty()
+
+    # orientation
+    # -----------
+    orientation: Any = SimpleProperty()
+
+    # base
+    # ----
+    base: Any = SimpleProperty()
+
+    # offset
+    # ------
+    offset: Number = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_bar.Marker' = CompoundProperty()
+
+    # selected
+    # --------
+    selected: 'd_bar.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_bar.Unselected' = CompoundProperty()
+
+    # r
+    # -
+    r: List = SimpleProperty()
+
+    # t
+    # -
+    t: List = SimpleProperty()
+
+    # error_y
+    # -------
+    error_y: 'd_bar.ErrorY' = CompoundProperty()
+
+    # error_x
+    # -------
+    error_x: 'd_bar.ErrorX' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # hovertextsrc
+    # ------------
+    hovertextsrc: str = SimpleProperty()
+
+    # textpositionsrc
+    # ---------------
+    textpositionsrc: str = SimpleProperty()
+
+    # basesrc
+    # -------
+    basesrc: str = SimpleProperty()
+
+    # offsetsrc
+    # ---------
+    offsetsrc: str = SimpleProperty()
+
+    # widthsrc
+    # --------
+    widthsrc: str = SimpleProperty()
+
+    # rsrc
+    # ----
+    rsrc: str = SimpleProperty()
+
+    # tsrc
+    # ----
+    tsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_bar.VisibleValidator(),
+            'showlegend': v_bar.ShowlegendValidator(),
+            'legendgroup': v_bar.LegendgroupValidator(),
+            'opacity': v_bar.OpacityValidator(),
+            'name': v_bar.NameValidator(),
+            'uid': v_bar.UidValidator(),
+            'ids': v_bar.IdsValidator(),
+            'customdata': v_bar.CustomdataValidator(),
+            'selectedpoints': v_bar.SelectedpointsValidator(),
+            'hoverinfo': v_bar.HoverinfoValidator(),
+            'hoverlabel': v_bar.HoverlabelValidator(),
+            'stream': v_bar.StreamValidator(),
+            'x': v_bar.XValidator(),
+            'x0': v_bar.X0Validator(),
+            'dx': v_bar.DxValidator(),
+            'y': v_bar.YValidator(),
+            'y0': v_bar.Y0Validator(),
+            'dy': v_bar.DyValidator(),
+            'text': v_bar.TextValidator(),
+            'hovertext': v_bar.HovertextValidator(),
+            'textposition': v_bar.TextpositionValidator(),
+            'textfont': v_bar.TextfontValidator(),
+            'insidetextfont': v_bar.InsidetextfontValidator(),
+            'outsidetextfont': v_bar.OutsidetextfontValidator(),
+            'constraintext': v_bar.ConstraintextValidator(),
+            'orientation': v_bar.OrientationValidator(),
+            'base': v_bar.BaseValidator(),
+            'offset': v_bar.OffsetValidator(),
+            'width': v_bar.WidthValidator(),
+            'marker': v_bar.MarkerValidator(),
+            'selected': v_bar.SelectedValidator(),
+            'unselected': v_bar.UnselectedValidator(),
+            'r': v_bar.RValidator(),
+            't': v_bar.TValidator(),
+            'error_y': v_bar.ErrorYValidator(),
+            'error_x': v_bar.ErrorXValidator(),
+            'xcalendar': v_bar.XcalendarValidator(),
+            'ycalendar': v_bar.YcalendarValidator(),
+            'xaxis': v_bar.XaxisValidator(),
+            'yaxis': v_bar.YaxisValidator(),
+            'idssrc': v_bar.IdssrcValidator(),
+            'customdatasrc': v_bar.CustomdatasrcValidator(),
+            'hoverinfosrc': v_bar.HoverinfosrcValidator(),
+            'xsrc': v_bar.XsrcValidator(),
+            'ysrc': v_bar.YsrcValidator(),
+            'textsrc': v_bar.TextsrcValidator(),
+            'hovertextsrc': v_bar.HovertextsrcValidator(),
+            'textpositionsrc': v_bar.TextpositionsrcValidator(),
+            'basesrc': v_bar.BasesrcValidator(),
+            'offsetsrc': v_bar.OffsetsrcValidator(),
+            'widthsrc': v_bar.WidthsrcValidator(),
+            'rsrc': v_bar.RsrcValidator(),
+            'tsrc': v_bar.TsrcValidator(),
+            'transforms': v_bar.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        hovertext=None,
+        textposition=None,
+        textfont=None,
+        insidetextfont=None,
+        outsidetextfont=None,
+        constraintext=None,
+        orientation=None,
+        base=None,
+        offset=None,
+        width=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        r=None,
+        t=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        basesrc=None,
+        offsetsrc=None,
+        widthsrc=None,
+        rsrc=None,
+        tsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('bar', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.x0 = x0
+        self.dx = dx
+        self.y = y
+        self.y0 = y0
+        self.dy = dy
+        self.text = text
+        self.hovertext = hovertext
+        self.textposition = textposition
+        self.textfont = textfont
+        self.insidetextfont = insidetextfont
+        self.outsidetextfont = outsidetextfont
+        self.constraintext = constraintext
+        self.orientation = orientation
+        self.base = base
+        self.offset = offset
+        self.width = width
+        self.marker = marker
+        self.selected = selected
+        self.unselected = unselected
+        self.r = r
+        self.t = t
+        self.error_y = error_y
+        self.error_x = error_x
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.hovertextsrc = hovertextsrc
+        self.textpositionsrc = textpositionsrc
+        self.basesrc = basesrc
+        self.offsetsrc = offsetsrc
+        self.widthsrc = widthsrc
+        self.rsrc = rsrc
+        self.tsrc = tsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'bar'
@@ -0,0 +1,328 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (box as v_box)
+from ipyplotly.datatypes.trace import (box as d_box)
+
+
+class Box(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.box'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_box.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_box.Stream' = CompoundProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # whiskerwidth
+    # ------------
+    whiskerwidth: Number = SimpleProperty()
+
+    # boxpoints
+    # ---------
+    boxpoints: Any = SimpleProperty()
+
+    # boxmean
+    # -------
+    boxmean: Any = SimpleProperty()
+
+    # jitter
+    # ------
+    jitter: Number = SimpleProperty()
+
+    # pointpos
+    # --------
+    pointpos: Number = SimpleProperty()
+
+    # orientation
+    # -----------
+    orientation: Any = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_box.Marker' = CompoundProperty()
+
+    # line
+    # ----
+    line: 'd_box.Line' = CompoundProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # selected
+    # --------
+    selected: 'd_box.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_box.Unselected' = CompoundProperty()
+
+    # hoveron
+    # -------
+    hoveron: Any = SimpleProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_box.VisibleValidator(),
+            'showlegend': v_box.ShowlegendValidator(),
+            'legendgroup': v_box.LegendgroupValidator(),
+            'opacity': v_box.OpacityValidator(),
+            'name': v_box.NameValidator(),
+            'uid': v_box.UidValidator(),
+            'ids': v_box.IdsValidator(),
+            'customdata': v_box.CustomdataValidator(),
+            'selectedpoints': v_box.SelectedpointsValidator(),
+            'hoverinfo': v_box.HoverinfoValidator(),
+            'hoverlabel': v_box.HoverlabelValidator(),
+            'stream': v_box.StreamValidator(),
+            'y': v_box.YValidator(),
+            'x': v_box.XValidator(),
+            'x0': v_box.X0Validator(),
+            'y0': v_box.Y0Validator(),
+            'text': v_box.TextValidator(),
+            'whiskerwidth': v_box.WhiskerwidthValidator(),
+            'boxpoints': v_box.BoxpointsValidator(),
+            'boxmean': v_box.BoxmeanValidator(),
+            'jitter': v_box.JitterValidator(),
+            'pointpos': v_box.PointposValidator(),
+            'orientation': v_box.OrientationValidator(),
+            'marker': v_box.MarkerValidator(),
+            'line': v_box.LineValidator(),
+            'fillcolor': v_box.FillcolorValidator(),
+            'selected': v_box.SelectedValidator(),
+            'unselected': v_box.UnselectedValidator(),
+            'hoveron': v_box.HoveronValidator(),
+            'xcalendar': v_box.XcalendarValidator(),
+            'ycalendar': v_box.YcalendarValidator(),
+            'xaxis': v_box.XaxisValidator(),
+            'yaxis': v_box.YaxisValidator(),
+            'idssrc': v_box.IdssrcValidator(),
+            'customdatasrc': v_box.CustomdatasrcValidator(),
+            'hoverinfosrc': v_box.HoverinfosrcValidator(),
+            'ysrc': v_box.YsrcValidator(),
+            'xsrc': v_box.XsrcValidator(),
+            'textsrc': v_box.TextsrcValidator(),
+            'transforms': v_box.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        y=None,
+        x=None,
+        x0=None,
+        y0=None,
+        text=None,
+        whiskerwidth=None,
+        boxpoints=None,
+        boxmean=None,
+        jitter=None,
+        pointpos=None,
+        orientation=None,
+        marker=None,
+        line=None,
+        fillcolor=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        ysrc=None,
+        xsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('box', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.y = y
+        self.x = x
+        self.x0 = x0
+        self.y0 = y0
+        self.text = text
+        self.whiskerwidth = whiskerwidth
+        self.boxpoints = boxpoints
+        self.boxmean = boxmean
+        self.jitter = jitter
+        self.pointpos = pointpos
+        self.orientation = orientation
+        self.marker = marker
+        self.line = line
+        self.fillcolor = fillcolor
+        self.selected = selected
+        self.unselected = unselected
+        self.hoveron = hoveron
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.ysrc = ysrc
+        self.xsrc = xsrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'box'
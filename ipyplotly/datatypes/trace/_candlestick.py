@@ -0,0 +1,293 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (candlestick as v_candlestick)
+from ipyplotly.datatypes.trace import (candlestick as d_candlestick)
+
+
+class Candlestick(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.candlestick'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_candlestick.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_candlestick.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # open
+    # ----
+    open: List = SimpleProperty()
+
+    # high
+    # ----
+    high: List = SimpleProperty()
+
+    # low
+    # ---
+    low: List = SimpleProperty()
+
+    # close
+    # -----
+    close: List = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_candlestick.Line' = CompoundProperty()
+
+    # increasing
+    # ----------
+    increasing: 'd_candlestick.Increasing' = CompoundProperty()
+
+    # decreasing
+    # ----------
+    decreasing: 'd_candlestick.Decreasing' = CompoundProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # whiskerwidth
+    # ------------
+    whiskerwidth: Number = SimpleProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # opensrc
+    # -------
+    opensrc: str = SimpleProperty()
+
+    # highsrc
+    # -------
+    highsrc: str = SimpleProperty()
+
+    # lowsrc
+    # ------
+    lowsrc: str = SimpleProperty()
+
+    # closesrc
+    # --------
+    closesrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_candlestick.VisibleValidator(),
+            'showlegend': v_candlestick.ShowlegendValidator(),
+            'legendgroup': v_candlestick.LegendgroupValidator(),
+            'opacity': v_candlestick.OpacityValidator(),
+            'name': v_candlestick.NameValidator(),
+            'uid': v_candlestick.UidValidator(),
+            'ids': v_candlestick.IdsValidator(),
+            'customdata': v_candlestick.CustomdataValidator(),
+            'selectedpoints': v_candlestick.SelectedpointsValidator(),
+            'hoverinfo': v_candlestick.HoverinfoValidator(),
+            'hoverlabel': v_candlestick.HoverlabelValidator(),
+            'stream': v_candlestick.StreamValidator(),
+            'x': v_candlestick.XValidator(),
+            'open': v_candlestick.OpenValidator(),
+            'high': v_candlestick.HighValidator(),
+            'low': v_candlestick.LowValidator(),
+            'close': v_candlestick.CloseValidator(),
+            'line': v_candlestick.LineValidator(),
+            'increasing': v_candlestick.IncreasingValidator(),
+            'decreasing': v_candlestick.DecreasingValidator(),
+            'text': v_candlestick.TextValidator(),
+            'whiskerwidth': v_candlestick.WhiskerwidthValidator(),
+            'xcalendar': v_candlestick.XcalendarValidator(),
+            'xaxis': v_candlestick.XaxisValidator(),
+            'yaxis': v_candlestick.YaxisValidator(),
+            'idssrc': v_candlestick.IdssrcValidator(),
+            'customdatasrc': v_candlestick.CustomdatasrcValidator(),
+            'hoverinfosrc': v_candlestick.HoverinfosrcValidator(),
+            'xsrc': v_candlestick.XsrcValidator(),
+            'opensrc': v_candlestick.OpensrcValidator(),
+            'highsrc': v_candlestick.HighsrcValidator(),
+            'lowsrc': v_candlestick.LowsrcValidator(),
+            'closesrc': v_candlestick.ClosesrcValidator(),
+            'textsrc': v_candlestick.TextsrcValidator(),
+            'transforms': v_candlestick.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        open=None,
+        high=None,
+        low=None,
+        close=None,
+        line=None,
+        increasing=None,
+        decreasing=None,
+        text=None,
+        whiskerwidth=None,
+        xcalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        opensrc=None,
+        highsrc=None,
+        lowsrc=None,
+        closesrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('candlestick', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.line = line
+        self.increasing = increasing
+        self.decreasing = decreasing
+        self.text = text
+        self.whiskerwidth = whiskerwidth
+        self.xcalendar = xcalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.opensrc = opensrc
+        self.highsrc = highsrc
+        self.lowsrc = lowsrc
+        self.closesrc = closesrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'candlestick'
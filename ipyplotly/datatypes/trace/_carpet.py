@@ -0,0 +1,300 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (carpet as v_carpet)
+from ipyplotly.datatypes.trace import (carpet as d_carpet)
+
+
+class Carpet(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.carpet'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_carpet.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_carpet.Stream' = CompoundProperty()
+
+    # carpet
+    # ------
+    carpet: str = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # a
+    # -
+    a: List = SimpleProperty()
+
+    # a0
+    # --
+    a0: Number = SimpleProperty()
+
+    # da
+    # --
+    da: Number = SimpleProperty()
+
+    # b
+    # -
+    b: List = SimpleProperty()
+
+    # b0
+    # --
+    b0: Number = SimpleProperty()
+
+    # db
+    # --
+    db: Number = SimpleProperty()
+
+    # cheaterslope
+    # ------------
+    cheaterslope: Number = SimpleProperty()
+
+    # aaxis
+    # -----
+    aaxis: 'd_carpet.Aaxis' = CompoundProperty()
+
+    # baxis
+    # -----
+    baxis: 'd_carpet.Baxis' = CompoundProperty()
+
+    # font
+    # ----
+    font: 'd_carpet.Font' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # asrc
+    # ----
+    asrc: str = SimpleProperty()
+
+    # bsrc
+    # ----
+    bsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_carpet.VisibleValidator(),
+            'showlegend': v_carpet.ShowlegendValidator(),
+            'legendgroup': v_carpet.LegendgroupValidator(),
+            'opacity': v_carpet.OpacityValidator(),
+            'name': v_carpet.NameValidator(),
+            'uid': v_carpet.UidValidator(),
+            'ids': v_carpet.IdsValidator(),
+            'customdata': v_carpet.CustomdataValidator(),
+            'selectedpoints': v_carpet.SelectedpointsValidator(),
+            'hoverinfo': v_carpet.HoverinfoValidator(),
+            'hoverlabel': v_carpet.HoverlabelValidator(),
+            'stream': v_carpet.StreamValidator(),
+            'carpet': v_carpet.CarpetValidator(),
+            'x': v_carpet.XValidator(),
+            'y': v_carpet.YValidator(),
+            'a': v_carpet.AValidator(),
+            'a0': v_carpet.A0Validator(),
+            'da': v_carpet.DaValidator(),
+            'b': v_carpet.BValidator(),
+            'b0': v_carpet.B0Validator(),
+            'db': v_carpet.DbValidator(),
+            'cheaterslope': v_carpet.CheaterslopeValidator(),
+            'aaxis': v_carpet.AaxisValidator(),
+            'baxis': v_carpet.BaxisValidator(),
+            'font': v_carpet.FontValidator(),
+            'color': v_carpet.ColorValidator(),
+            'xaxis': v_carpet.XaxisValidator(),
+            'yaxis': v_carpet.YaxisValidator(),
+            'idssrc': v_carpet.IdssrcValidator(),
+            'customdatasrc': v_carpet.CustomdatasrcValidator(),
+            'hoverinfosrc': v_carpet.HoverinfosrcValidator(),
+            'xsrc': v_carpet.XsrcValidator(),
+            'ysrc': v_carpet.YsrcValidator(),
+            'asrc': v_carpet.AsrcValidator(),
+            'bsrc': v_carpet.BsrcValidator(),
+            'transforms': v_carpet.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        carpet=None,
+        x=None,
+        y=None,
+        a=None,
+        a0=None,
+        da=None,
+        b=None,
+        b0=None,
+        db=None,
+        cheaterslope=None,
+        aaxis=None,
+        baxis=None,
+        font=None,
+        color=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        asrc=None,
+        bsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('carpet', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.carpet = carpet
+        self.x = x
+        self.y = y
+        self.a = a
+        self.a0 = a0
+        self.da = da
+        self.b = b
+        self.b0 = b0
+        self.db = db
+        self.cheaterslope = cheaterslope
+        self.aaxis = aaxis
+        self.baxis = baxis
+        self.font = font
+        self.color = color
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.asrc = asrc
+        self.bsrc = bsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'carpet'
@@ -0,0 +1,293 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (choropleth as v_choropleth)
+from ipyplotly.datatypes.trace import (choropleth as d_choropleth)
+
+
+class Choropleth(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.choropleth'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_choropleth.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_choropleth.Stream' = CompoundProperty()
+
+    # locations
+    # ---------
+    locations: List = SimpleProperty()
+
+    # locationmode
+    # ------------
+    locationmode: Any = SimpleProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_choropleth.Marker' = CompoundProperty()
+
+    # selected
+    # --------
+    selected: 'd_choropleth.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_choropleth.Unselected' = CompoundProperty()
+
+    # zauto
+    # -----
+    zauto: bool = SimpleProperty()
+
+    # zmin
+    # ----
+    zmin: Number = SimpleProperty()
+
+    # zmax
+    # ----
+    zmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_choropleth.Colorbar' = CompoundProperty()
+
+    # geo
+    # ---
+    geo: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # locationssrc
+    # ------------
+    locationssrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_choropleth.VisibleValidator(),
+            'showlegend': v_choropleth.ShowlegendValidator(),
+            'legendgroup': v_choropleth.LegendgroupValidator(),
+            'opacity': v_choropleth.OpacityValidator(),
+            'name': v_choropleth.NameValidator(),
+            'uid': v_choropleth.UidValidator(),
+            'ids': v_choropleth.IdsValidator(),
+            'customdata': v_choropleth.CustomdataValidator(),
+            'selectedpoints': v_choropleth.SelectedpointsValidator(),
+            'hoverinfo': v_choropleth.HoverinfoValidator(),
+            'hoverlabel': v_choropleth.HoverlabelValidator(),
+            'stream': v_choropleth.StreamValidator(),
+            'locations': v_choropleth.LocationsValidator(),
+            'locationmode': v_choropleth.LocationmodeValidator(),
+            'z': v_choropleth.ZValidator(),
+            'text': v_choropleth.TextValidator(),
+            'marker': v_choropleth.MarkerValidator(),
+            'selected': v_choropleth.SelectedValidator(),
+            'unselected': v_choropleth.UnselectedValidator(),
+            'zauto': v_choropleth.ZautoValidator(),
+            'zmin': v_choropleth.ZminValidator(),
+            'zmax': v_choropleth.ZmaxValidator(),
+            'colorscale': v_choropleth.ColorscaleValidator(),
+            'autocolorscale': v_choropleth.AutocolorscaleValidator(),
+            'reversescale': v_choropleth.ReversescaleValidator(),
+            'showscale': v_choropleth.ShowscaleValidator(),
+            'colorbar': v_choropleth.ColorbarValidator(),
+            'geo': v_choropleth.GeoValidator(),
+            'idssrc': v_choropleth.IdssrcValidator(),
+            'customdatasrc': v_choropleth.CustomdatasrcValidator(),
+            'hoverinfosrc': v_choropleth.HoverinfosrcValidator(),
+            'locationssrc': v_choropleth.LocationssrcValidator(),
+            'zsrc': v_choropleth.ZsrcValidator(),
+            'textsrc': v_choropleth.TextsrcValidator(),
+            'transforms': v_choropleth.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        locations=None,
+        locationmode=None,
+        z=None,
+        text=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        geo=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        locationssrc=None,
+        zsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('choropleth', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.locations = locations
+        self.locationmode = locationmode
+        self.z = z
+        self.text = text
+        self.marker = marker
+        self.selected = selected
+        self.unselected = unselected
+        self.zauto = zauto
+        self.zmin = zmin
+        self.zmax = zmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.geo = geo
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.locationssrc = locationssrc
+        self.zsrc = zsrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'choropleth'
@@ -0,0 +1,391 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (contour as v_contour)
+from ipyplotly.datatypes.trace import (contour as d_contour)
+
+
+class Contour(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.contour'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_contour.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_contour.Stream' = CompoundProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # dx
+    # --
+    dx: Number = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # dy
+    # --
+    dy: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: List = SimpleProperty()
+
+    # transpose
+    # ---------
+    transpose: bool = SimpleProperty()
+
+    # xtype
+    # -----
+    xtype: Any = SimpleProperty()
+
+    # ytype
+    # -----
+    ytype: Any = SimpleProperty()
+
+    # zhoverformat
+    # ------------
+    zhoverformat: str = SimpleProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # autocontour
+    # -----------
+    autocontour: bool = SimpleProperty()
+
+    # ncontours
+    # ---------
+    ncontours: int = SimpleProperty()
+
+    # contours
+    # --------
+    contours: 'd_contour.Contours' = CompoundProperty()
+
+    # line
+    # ----
+    line: 'd_contour.Line' = CompoundProperty()
+
+    # zauto
+    # -----
+    zauto: bool = SimpleProperty()
+
+    # zmin
+    # ----
+    zmin: Number = SimpleProperty()
+
+    # zmax
+    # ----
+    zmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_contour.Colorbar' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_contour.VisibleValidator(),
+            'showlegend': v_contour.ShowlegendValidator(),
+            'legendgroup': v_contour.LegendgroupValidator(),
+            'opacity': v_contour.OpacityValidator(),
+            'name': v_contour.NameValidator(),
+            'uid': v_contour.UidValidator(),
+            'ids': v_contour.IdsValidator(),
+            'customdata': v_contour.CustomdataValidator(),
+            'selectedpoints': v_contour.SelectedpointsValidator(),
+            'hoverinfo': v_contour.HoverinfoValidator(),
+            'hoverlabel': v_contour.HoverlabelValidator(),
+            'stream': v_contour.StreamValidator(),
+            'z': v_contour.ZValidator(),
+            'x': v_contour.XValidator(),
+            'x0': v_contour.X0Validator(),
+            'dx': v_contour.DxValidator(),
+            'y': v_contour.YValidator(),
+            'y0': v_contour.Y0Validator(),
+            'dy': v_contour.DyValidator(),
+            'text': v_contour.TextValidator(),
+            'transpose': v_contour.TransposeValidator(),
+            'xtype': v_contour.XtypeValidator(),
+            'ytype': v_contour.YtypeValidator(),
+            'zhoverformat': v_contour.ZhoverformatValidator(),
+            'connectgaps': v_contour.ConnectgapsValidator(),
+            'autocontour': v_contour.AutocontourValidator(),
+            'ncontours': v_contour.NcontoursValidator(),
+            'contours': v_contour.ContoursValidator(),
+            'line': v_contour.LineValidator(),
+            'zauto': v_contour.ZautoValidator(),
+            'zmin': v_contour.ZminValidator(),
+            'zmax': v_contour.ZmaxValidator(),
+            'colorscale': v_contour.ColorscaleValidator(),
+            'autocolorscale': v_contour.AutocolorscaleValidator(),
+            'reversescale': v_contour.ReversescaleValidator(),
+            'showscale': v_contour.ShowscaleValidator(),
+            'colorbar': v_contour.ColorbarValidator(),
+            'xcalendar': v_contour.XcalendarValidator(),
+            'ycalendar': v_contour.YcalendarValidator(),
+            'xaxis': v_contour.XaxisValidator(),
+            'yaxis': v_contour.YaxisValidator(),
+            'idssrc': v_contour.IdssrcValidator(),
+            'customdatasrc': v_contour.CustomdatasrcValidator(),
+            'hoverinfosrc': v_contour.HoverinfosrcValidator(),
+            'zsrc': v_contour.ZsrcValidator(),
+            'xsrc': v_contour.XsrcValidator(),
+            'ysrc': v_contour.YsrcValidator(),
+            'textsrc': v_contour.TextsrcValidator(),
+            'transforms': v_contour.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        transpose=None,
+        xtype=None,
+        ytype=None,
+        zhoverformat=None,
+        connectgaps=None,
+        autocontour=None,
+        ncontours=None,
+        contours=None,
+        line=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('contour', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.z = z
+        self.x = x
+        self.x0 = x0
+        self.dx = dx
+        self.y = y
+        self.y0 = y0
+        self.dy = dy
+        self.text = text
+        self.transpose = transpose
+        self.xtype = xtype
+        self.ytype = ytype
+        self.zhoverformat = zhoverformat
+        self.connectgaps = connectgaps
+        self.autocontour = autocontour
+        self.ncontours = ncontours
+        self.contours = contours
+        self.line = line
+        self.zauto = zauto
+        self.zmin = zmin
+        self.zmax = zmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.zsrc = zsrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'contour'
@@ -0,0 +1,391 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (contourcarpet as v_contourcarpet)
+from ipyplotly.datatypes.trace import (contourcarpet as d_contourcarpet)
+
+
+class Contourcarpet(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.contourcarpet'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_contourcarpet.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_contourcarpet.Stream' = CompoundProperty()
+
+    # carpet
+    # ------
+    carpet: str = SimpleProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # a
+    # -
+    a: List = SimpleProperty()
+
+    # a0
+    # --
+    a0: Any = SimpleProperty()
+
+    # da
+    # --
+    da: Number = SimpleProperty()
+
+    # b
+    # -
+    b: List = SimpleProperty()
+
+    # b0
+    # --
+    b0: Any = SimpleProperty()
+
+    # db
+    # --
+    db: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: List = SimpleProperty()
+
+    # transpose
+    # ---------
+    transpose: bool = SimpleProperty()
+
+    # atype
+    # -----
+    atype: Any = SimpleProperty()
+
+    # btype
+    # -----
+    btype: Any = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # autocontour
+    # -----------
+    autocontour: bool = SimpleProperty()
+
+    # ncontours
+    # ---------
+    ncontours: int = SimpleProperty()
+
+    # contours
+    # --------
+    contours: 'd_contourcarpet.Contours' = CompoundProperty()
+
+    # line
+    # ----
+    line: 'd_contourcarpet.Line' = CompoundProperty()
+
+    # zauto
+    # -----
+    zauto: bool = SimpleProperty()
+
+    # zmin
+    # ----
+    zmin: Number = SimpleProperty()
+
+    # zmax
+    # ----
+    zmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_contourcarpet.Colorbar' = CompoundProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # asrc
+    # ----
+    asrc: str = SimpleProperty()
+
+    # bsrc
+    # ----
+    bsrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_contourcarpet.VisibleValidator(),
+            'showlegend': v_contourcarpet.ShowlegendValidator(),
+            'legendgroup': v_contourcarpet.LegendgroupValidator(),
+            'opacity': v_contourcarpet.OpacityValidator(),
+            'name': v_contourcarpet.NameValidator(),
+            'uid': v_contourcarpet.UidValidator(),
+            'ids': v_contourcarpet.IdsValidator(),
+            'customdata': v_contourcarpet.CustomdataValidator(),
+            'selectedpoints': v_contourcarpet.SelectedpointsValidator(),
+            'hoverinfo': v_contourcarpet.HoverinfoValidator(),
+            'hoverlabel': v_contourcarpet.HoverlabelValidator(),
+            'stream': v_contourcarpet.StreamValidator(),
+            'carpet': v_contourcarpet.CarpetValidator(),
+            'z': v_contourcarpet.ZValidator(),
+            'a': v_contourcarpet.AValidator(),
+            'a0': v_contourcarpet.A0Validator(),
+            'da': v_contourcarpet.DaValidator(),
+            'b': v_contourcarpet.BValidator(),
+            'b0': v_contourcarpet.B0Validator(),
+            'db': v_contourcarpet.DbValidator(),
+            'text': v_contourcarpet.TextValidator(),
+            'transpose': v_contourcarpet.TransposeValidator(),
+            'atype': v_contourcarpet.AtypeValidator(),
+            'btype': v_contourcarpet.BtypeValidator(),
+            'mode': v_contourcarpet.ModeValidator(),
+            'connectgaps': v_contourcarpet.ConnectgapsValidator(),
+            'fillcolor': v_contourcarpet.FillcolorValidator(),
+            'autocontour': v_contourcarpet.AutocontourValidator(),
+            'ncontours': v_contourcarpet.NcontoursValidator(),
+            'contours': v_contourcarpet.ContoursValidator(),
+            'line': v_contourcarpet.LineValidator(),
+            'zauto': v_contourcarpet.ZautoValidator(),
+            'zmin': v_contourcarpet.ZminValidator(),
+            'zmax': v_contourcarpet.ZmaxValidator(),
+            'colorscale': v_contourcarpet.ColorscaleValidator(),
+            'autocolorscale': v_contourcarpet.AutocolorscaleValidator(),
+            'reversescale': v_contourcarpet.ReversescaleValidator(),
+            'showscale': v_contourcarpet.ShowscaleValidator(),
+            'colorbar': v_contourcarpet.ColorbarValidator(),
+            'xaxis': v_contourcarpet.XaxisValidator(),
+            'yaxis': v_contourcarpet.YaxisValidator(),
+            'idssrc': v_contourcarpet.IdssrcValidator(),
+            'customdatasrc': v_contourcarpet.CustomdatasrcValidator(),
+            'hoverinfosrc': v_contourcarpet.HoverinfosrcValidator(),
+            'zsrc': v_contourcarpet.ZsrcValidator(),
+            'asrc': v_contourcarpet.AsrcValidator(),
+            'bsrc': v_contourcarpet.BsrcValidator(),
+            'textsrc': v_contourcarpet.TextsrcValidator(),
+            'transforms': v_contourcarpet.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        carpet=None,
+        z=None,
+        a=None,
+        a0=None,
+        da=None,
+        b=None,
+        b0=None,
+        db=None,
+        text=None,
+        transpose=None,
+        atype=None,
+        btype=None,
+        mode=None,
+        connectgaps=None,
+        fillcolor=None,
+        autocontour=None,
+        ncontours=None,
+        contours=None,
+        line=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        asrc=None,
+        bsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('contourcarpet', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.carpet = carpet
+        self.z = z
+        self.a = a
+        self.a0 = a0
+        self.da = da
+        self.b = b
+        self.b0 = b0
+        self.db = db
+        self.text = text
+        self.transpose = transpose
+        self.atype = atype
+        self.btype = btype
+        self.mode = mode
+        self.connectgaps = connectgaps
+        self.fillcolor = fillcolor
+        self.autocontour = autocontour
+        self.ncontours = ncontours
+        self.contours = contours
+        self.line = line
+        self.zauto = zauto
+        self.zmin = zmin
+        self.zmax = zmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.zsrc = zsrc
+        self.asrc = asrc
+        self.bsrc = bsrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'contourcarpet'
@@ -0,0 +1,384 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (heatmap as v_heatmap)
+from ipyplotly.datatypes.trace import (heatmap as d_heatmap)
+
+
+class Heatmap(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.heatmap'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_heatmap.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_heatmap.Stream' = CompoundProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # dx
+    # --
+    dx: Number = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # dy
+    # --
+    dy: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: List = SimpleProperty()
+
+    # transpose
+    # ---------
+    transpose: bool = SimpleProperty()
+
+    # xtype
+    # -----
+    xtype: Any = SimpleProperty()
+
+    # ytype
+    # -----
+    ytype: Any = SimpleProperty()
+
+    # zsmooth
+    # -------
+    zsmooth: Any = SimpleProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # xgap
+    # ----
+    xgap: Number = SimpleProperty()
+
+    # ygap
+    # ----
+    ygap: Number = SimpleProperty()
+
+    # zhoverformat
+    # ------------
+    zhoverformat: str = SimpleProperty()
+
+    # zauto
+    # -----
+    zauto: bool = SimpleProperty()
+
+    # zmin
+    # ----
+    zmin: Number = SimpleProperty()
+
+    # zmax
+    # ----
+    zmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_heatmap.Colorbar' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_heatmap.VisibleValidator(),
+            'showlegend': v_heatmap.ShowlegendValidator(),
+            'legendgroup': v_heatmap.LegendgroupValidator(),
+            'opacity': v_heatmap.OpacityValidator(),
+            'name': v_heatmap.NameValidator(),
+            'uid': v_heatmap.UidValidator(),
+            'ids': v_heatmap.IdsValidator(),
+            'customdata': v_heatmap.CustomdataValidator(),
+            'selectedpoints': v_heatmap.SelectedpointsValidator(),
+            'hoverinfo': v_heatmap.HoverinfoValidator(),
+            'hoverlabel': v_heatmap.HoverlabelValidator(),
+            'stream': v_heatmap.StreamValidator(),
+            'z': v_heatmap.ZValidator(),
+            'x': v_heatmap.XValidator(),
+            'x0': v_heatmap.X0Validator(),
+            'dx': v_heatmap.DxValidator(),
+            'y': v_heatmap.YValidator(),
+            'y0': v_heatmap.Y0Validator(),
+            'dy': v_heatmap.DyValidator(),
+            'text': v_heatmap.TextValidator(),
+            'transpose': v_heatmap.TransposeValidator(),
+            'xtype': v_heatmap.XtypeValidator(),
+            'ytype': v_heatmap.YtypeValidator(),
+            'zsmooth': v_heatmap.ZsmoothValidator(),
+            'connectgaps': v_heatmap.ConnectgapsValidator(),
+            'xgap': v_heatmap.XgapValidator(),
+            'ygap': v_heatmap.YgapValidator(),
+            'zhoverformat': v_heatmap.ZhoverformatValidator(),
+            'zauto': v_heatmap.ZautoValidator(),
+            'zmin': v_heatmap.ZminValidator(),
+            'zmax': v_heatmap.ZmaxValidator(),
+            'colorscale': v_heatmap.ColorscaleValidator(),
+            'autocolorscale': v_heatmap.AutocolorscaleValidator(),
+            'reversescale': v_heatmap.ReversescaleValidator(),
+            'showscale': v_heatmap.ShowscaleValidator(),
+            'colorbar': v_heatmap.ColorbarValidator(),
+            'xcalendar': v_heatmap.XcalendarValidator(),
+            'ycalendar': v_heatmap.YcalendarValidator(),
+            'xaxis': v_heatmap.XaxisValidator(),
+            'yaxis': v_heatmap.YaxisValidator(),
+            'idssrc': v_heatmap.IdssrcValidator(),
+            'customdatasrc': v_heatmap.CustomdatasrcValidator(),
+            'hoverinfosrc': v_heatmap.HoverinfosrcValidator(),
+            'zsrc': v_heatmap.ZsrcValidator(),
+            'xsrc': v_heatmap.XsrcValidator(),
+            'ysrc': v_heatmap.YsrcValidator(),
+            'textsrc': v_heatmap.TextsrcValidator(),
+            'transforms': v_heatmap.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        transpose=None,
+        xtype=None,
+        ytype=None,
+        zsmooth=None,
+        connectgaps=None,
+        xgap=None,
+        ygap=None,
+        zhoverformat=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('heatmap', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.z = z
+        self.x = x
+        self.x0 = x0
+        self.dx = dx
+        self.y = y
+        self.y0 = y0
+        self.dy = dy
+        self.text = text
+        self.transpose = transpose
+        self.xtype = xtype
+        self.ytype = ytype
+        self.zsmooth = zsmooth
+        self.connectgaps = connectgaps
+        self.xgap = xgap
+        self.ygap = ygap
+        self.zhoverformat = zhoverformat
+        self.zauto = zauto
+        self.zmin = zmin
+        self.zmax = zmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.zsrc = zsrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'heatmap'
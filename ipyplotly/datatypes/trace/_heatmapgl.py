@@ -0,0 +1,335 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (heatmapgl as v_heatmapgl)
+from ipyplotly.datatypes.trace import (heatmapgl as d_heatmapgl)
+
+
+class Heatmapgl(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.heatmapgl'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_heatmapgl.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_heatmapgl.Stream' = CompoundProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # dx
+    # --
+    dx: Number = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # dy
+    # --
+    dy: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: List = SimpleProperty()
+
+    # transpose
+    # ---------
+    transpose: bool = SimpleProperty()
+
+    # xtype
+    # -----
+    xtype: Any = SimpleProperty()
+
+    # ytype
+    # -----
+    ytype: Any = SimpleProperty()
+
+    # zauto
+    # -----
+    zauto: bool = SimpleProperty()
+
+    # zmin
+    # ----
+    zmin: Number = SimpleProperty()
+
+    # zmax
+    # ----
+    zmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_heatmapgl.Colorbar' = CompoundProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_heatmapgl.VisibleValidator(),
+            'showlegend': v_heatmapgl.ShowlegendValidator(),
+            'legendgroup': v_heatmapgl.LegendgroupValidator(),
+            'opacity': v_heatmapgl.OpacityValidator(),
+            'name': v_heatmapgl.NameValidator(),
+            'uid': v_heatmapgl.UidValidator(),
+            'ids': v_heatmapgl.IdsValidator(),
+            'customdata': v_heatmapgl.CustomdataValidator(),
+            'selectedpoints': v_heatmapgl.SelectedpointsValidator(),
+            'hoverinfo': v_heatmapgl.HoverinfoValidator(),
+            'hoverlabel': v_heatmapgl.HoverlabelValidator(),
+            'stream': v_heatmapgl.StreamValidator(),
+            'z': v_heatmapgl.ZValidator(),
+            'x': v_heatmapgl.XValidator(),
+            'x0': v_heatmapgl.X0Validator(),
+            'dx': v_heatmapgl.DxValidator(),
+            'y': v_heatmapgl.YValidator(),
+            'y0': v_heatmapgl.Y0Validator(),
+            'dy': v_heatmapgl.DyValidator(),
+            'text': v_heatmapgl.TextValidator(),
+            'transpose': v_heatmapgl.TransposeValidator(),
+            'xtype': v_heatmapgl.XtypeValidator(),
+            'ytype': v_heatmapgl.YtypeValidator(),
+            'zauto': v_heatmapgl.ZautoValidator(),
+            'zmin': v_heatmapgl.ZminValidator(),
+            'zmax': v_heatmapgl.ZmaxValidator(),
+            'colorscale': v_heatmapgl.ColorscaleValidator(),
+            'autocolorscale': v_heatmapgl.AutocolorscaleValidator(),
+            'reversescale': v_heatmapgl.ReversescaleValidator(),
+            'showscale': v_heatmapgl.ShowscaleValidator(),
+            'colorbar': v_heatmapgl.ColorbarValidator(),
+            'xaxis': v_heatmapgl.XaxisValidator(),
+            'yaxis': v_heatmapgl.YaxisValidator(),
+            'idssrc': v_heatmapgl.IdssrcValidator(),
+            'customdatasrc': v_heatmapgl.CustomdatasrcValidator(),
+            'hoverinfosrc': v_heatmapgl.HoverinfosrcValidator(),
+            'zsrc': v_heatmapgl.ZsrcValidator(),
+            'xsrc': v_heatmapgl.XsrcValidator(),
+            'ysrc': v_heatmapgl.YsrcValidator(),
+            'textsrc': v_heatmapgl.TextsrcValidator(),
+            'transforms': v_heatmapgl.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        transpose=None,
+        xtype=None,
+        ytype=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('heatmapgl', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.z = z
+        self.x = x
+        self.x0 = x0
+        self.dx = dx
+        self.y = y
+        self.y0 = y0
+        self.dy = dy
+        self.text = text
+        self.transpose = transpose
+        self.xtype = xtype
+        self.ytype = ytype
+        self.zauto = zauto
+        self.zmin = zmin
+        self.zmax = zmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.zsrc = zsrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'heatmapgl'
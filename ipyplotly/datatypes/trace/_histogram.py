@@ -0,0 +1,335 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (histogram as v_histogram)
+from ipyplotly.datatypes.trace import (histogram as d_histogram)
+
+
+class Histogram(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.histogram'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_histogram.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_histogram.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # orientation
+    # -----------
+    orientation: Any = SimpleProperty()
+
+    # histfunc
+    # --------
+    histfunc: Any = SimpleProperty()
+
+    # histnorm
+    # --------
+    histnorm: Any = SimpleProperty()
+
+    # cumulative
+    # ----------
+    cumulative: 'd_histogram.Cumulative' = CompoundProperty()
+
+    # autobinx
+    # --------
+    autobinx: bool = SimpleProperty()
+
+    # nbinsx
+    # ------
+    nbinsx: int = SimpleProperty()
+
+    # xbins
+    # -----
+    xbins: 'd_histogram.Xbins' = CompoundProperty()
+
+    # autobiny
+    # --------
+    autobiny: bool = SimpleProperty()
+
+    # nbinsy
+    # ------
+    nbinsy: int = SimpleProperty()
+
+    # ybins
+    # -----
+    ybins: 'd_histogram.Ybins' = CompoundProperty()
+
+    # marker
+    # ------
+    marker: 'd_histogram.Marker' = CompoundProperty()
+
+    # selected
+    # --------
+    selected: 'd_histogram.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_histogram.Unselected' = CompoundProperty()
+
+    # error_y
+    # -------
+    error_y: 'd_histogram.ErrorY' = CompoundProperty()
+
+    # error_x
+    # -------
+    error_x: 'd_histogram.ErrorX' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_histogram.VisibleValidator(),
+            'showlegend': v_histogram.ShowlegendValidator(),
+            'legendgroup': v_histogram.LegendgroupValidator(),
+            'opacity': v_histogram.OpacityValidator(),
+            'name': v_histogram.NameValidator(),
+            'uid': v_histogram.UidValidator(),
+            'ids': v_histogram.IdsValidator(),
+            'customdata': v_histogram.CustomdataValidator(),
+            'selectedpoints': v_histogram.SelectedpointsValidator(),
+            'hoverinfo': v_histogram.HoverinfoValidator(),
+            'hoverlabel': v_histogram.HoverlabelValidator(),
+            'stream': v_histogram.StreamValidator(),
+            'x': v_histogram.XValidator(),
+            'y': v_histogram.YValidator(),
+            'text': v_histogram.TextValidator(),
+            'orientation': v_histogram.OrientationValidator(),
+            'histfunc': v_histogram.HistfuncValidator(),
+            'histnorm': v_histogram.HistnormValidator(),
+            'cumulative': v_histogram.CumulativeValidator(),
+            'autobinx': v_histogram.AutobinxValidator(),
+            'nbinsx': v_histogram.NbinsxValidator(),
+            'xbins': v_histogram.XbinsValidator(),
+            'autobiny': v_histogram.AutobinyValidator(),
+            'nbinsy': v_histogram.NbinsyValidator(),
+            'ybins': v_histogram.YbinsValidator(),
+            'marker': v_histogram.MarkerValidator(),
+            'selected': v_histogram.SelectedValidator(),
+            'unselected': v_histogram.UnselectedValidator(),
+            'error_y': v_histogram.ErrorYValidator(),
+            'error_x': v_histogram.ErrorXValidator(),
+            'xcalendar': v_histogram.XcalendarValidator(),
+            'ycalendar': v_histogram.YcalendarValidator(),
+            'xaxis': v_histogram.XaxisValidator(),
+            'yaxis': v_histogram.YaxisValidator(),
+            'idssrc': v_histogram.IdssrcValidator(),
+            'customdatasrc': v_histogram.CustomdatasrcValidator(),
+            'hoverinfosrc': v_histogram.HoverinfosrcValidator(),
+            'xsrc': v_histogram.XsrcValidator(),
+            'ysrc': v_histogram.YsrcValidator(),
+            'textsrc': v_histogram.TextsrcValidator(),
+            'transforms': v_histogram.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        text=None,
+        orientation=None,
+        histfunc=None,
+        histnorm=None,
+        cumulative=None,
+        autobinx=None,
+        nbinsx=None,
+        xbins=None,
+        autobiny=None,
+        nbinsy=None,
+        ybins=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('histogram', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.y = y
+        self.text = text
+        self.orientation = orientation
+        self.histfunc = histfunc
+        self.histnorm = histnorm
+        self.cumulative = cumulative
+        self.autobinx = autobinx
+        self.nbinsx = nbinsx
+        self.xbins = xbins
+        self.autobiny = autobiny
+        self.nbinsy = nbinsy
+        self.ybins = ybins
+        self.marker = marker
+        self.selected = selected
+        self.unselected = unselected
+        self.error_y = error_y
+        self.error_x = error_x
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'histogram'
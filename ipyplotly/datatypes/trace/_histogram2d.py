@@ -0,0 +1,377 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (histogram2d as v_histogram2d)
+from ipyplotly.datatypes.trace import (histogram2d as d_histogram2d)
+
+
+class Histogram2D(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.histogram2d'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_histogram2d.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_histogram2d.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_histogram2d.Marker' = CompoundProperty()
+
+    # histnorm
+    # --------
+    histnorm: Any = SimpleProperty()
+
+    # histfunc
+    # --------
+    histfunc: Any = SimpleProperty()
+
+    # autobinx
+    # --------
+    autobinx: bool = SimpleProperty()
+
+    # nbinsx
+    # ------
+    nbinsx: int = SimpleProperty()
+
+    # xbins
+    # -----
+    xbins: 'd_histogram2d.Xbins' = CompoundProperty()
+
+    # autobiny
+    # --------
+    autobiny: bool = SimpleProperty()
+
+    # nbinsy
+    # ------
+    nbinsy: int = SimpleProperty()
+
+    # ybins
+    # -----
+    ybins: 'd_histogram2d.Ybins' = CompoundProperty()
+
+    # xgap
+    # ----
+    xgap: Number = SimpleProperty()
+
+    # ygap
+    # ----
+    ygap: Number = SimpleProperty()
+
+    # zsmooth
+    # -------
+    zsmooth: Any = SimpleProperty()
+
+    # zhoverformat
+    # ------------
+    zhoverformat: str = SimpleProperty()
+
+    # zauto
+    # -----
+    zauto: bool = SimpleProperty()
+
+    # zmin
+    # ----
+    zmin: Number = SimpleProperty()
+
+    # zmax
+    # ----
+    zmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_histogram2d.Colorbar' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_histogram2d.VisibleValidator(),
+            'showlegend': v_histogram2d.ShowlegendValidator(),
+            'legendgroup': v_histogram2d.LegendgroupValidator(),
+            'opacity': v_histogram2d.OpacityValidator(),
+            'name': v_histogram2d.NameValidator(),
+            'uid': v_histogram2d.UidValidator(),
+            'ids': v_histogram2d.IdsValidator(),
+            'customdata': v_histogram2d.CustomdataValidator(),
+            'selectedpoints': v_histogram2d.SelectedpointsValidator(),
+            'hoverinfo': v_histogram2d.HoverinfoValidator(),
+            'hoverlabel': v_histogram2d.HoverlabelValidator(),
+            'stream': v_histogram2d.StreamValidator(),
+            'x': v_histogram2d.XValidator(),
+            'y': v_histogram2d.YValidator(),
+            'z': v_histogram2d.ZValidator(),
+            'marker': v_histogram2d.MarkerValidator(),
+            'histnorm': v_histogram2d.HistnormValidator(),
+            'histfunc': v_histogram2d.HistfuncValidator(),
+            'autobinx': v_histogram2d.AutobinxValidator(),
+            'nbinsx': v_histogram2d.NbinsxValidator(),
+            'xbins': v_histogram2d.XbinsValidator(),
+            'autobiny': v_histogram2d.AutobinyValidator(),
+            'nbinsy': v_histogram2d.NbinsyValidator(),
+            'ybins': v_histogram2d.YbinsValidator(),
+            'xgap': v_histogram2d.XgapValidator(),
+            'ygap': v_histogram2d.YgapValidator(),
+            'zsmooth': v_histogram2d.ZsmoothValidator(),
+            'zhoverformat': v_histogram2d.ZhoverformatValidator(),
+            'zauto': v_histogram2d.ZautoValidator(),
+            'zmin': v_histogram2d.ZminValidator(),
+            'zmax': v_histogram2d.ZmaxValidator(),
+            'colorscale': v_histogram2d.ColorscaleValidator(),
+            'autocolorscale': v_histogram2d.AutocolorscaleValidator(),
+            'reversescale': v_histogram2d.ReversescaleValidator(),
+            'showscale': v_histogram2d.ShowscaleValidator(),
+            'colorbar': v_histogram2d.ColorbarValidator(),
+            'xcalendar': v_histogram2d.XcalendarValidator(),
+            'ycalendar': v_histogram2d.YcalendarValidator(),
+            'xaxis': v_histogram2d.XaxisValidator(),
+            'yaxis': v_histogram2d.YaxisValidator(),
+            'idssrc': v_histogram2d.IdssrcValidator(),
+            'customdatasrc': v_histogram2d.CustomdatasrcValidator(),
+            'hoverinfosrc': v_histogram2d.HoverinfosrcValidator(),
+            'xsrc': v_histogram2d.XsrcValidator(),
+            'ysrc': v_histogram2d.YsrcValidator(),
+            'zsrc': v_histogram2d.ZsrcValidator(),
+            'transforms': v_histogram2d.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        z=None,
+        marker=None,
+        histnorm=None,
+        histfunc=None,
+        autobinx=None,
+        nbinsx=None,
+        xbins=None,
+        autobiny=None,
+        nbinsy=None,
+        ybins=None,
+        xgap=None,
+        ygap=None,
+        zsmooth=None,
+        zhoverformat=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('histogram2d', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.y = y
+        self.z = z
+        self.marker = marker
+        self.histnorm = histnorm
+        self.histfunc = histfunc
+        self.autobinx = autobinx
+        self.nbinsx = nbinsx
+        self.xbins = xbins
+        self.autobiny = autobiny
+        self.nbinsy = nbinsy
+        self.ybins = ybins
+        self.xgap = xgap
+        self.ygap = ygap
+        self.zsmooth = zsmooth
+        self.zhoverformat = zhoverformat
+        self.zauto = zauto
+        self.zmin = zmin
+        self.zmax = zmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.zsrc = zsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'histogram2d'
@@ -0,0 +1,384 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (histogram2dcontour as v_histogram2dcontour)
+from ipyplotly.datatypes.trace import (histogram2dcontour as d_histogram2dcontour)
+
+
+class Histogram2Dcontour(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.histogram2dcontour'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_histogram2dcontour.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_histogram2dcontour.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_histogram2dcontour.Marker' = CompoundProperty()
+
+    # histnorm
+    # --------
+    histnorm: Any = SimpleProperty()
+
+    # histfunc
+    # --------
+    histfunc: Any = SimpleProperty()
+
+    # autobinx
+    # --------
+    autobinx: bool = SimpleProperty()
+
+    # nbinsx
+    # ------
+    nbinsx: int = SimpleProperty()
+
+    # xbins
+    # -----
+    xbins: 'd_histogram2dcontour.Xbins' = CompoundProperty()
+
+    # autobiny
+    # --------
+    autobiny: bool = SimpleProperty()
+
+    # nbinsy
+    # ------
+    nbinsy: int = SimpleProperty()
+
+    # ybins
+    # -----
+    ybins: 'd_histogram2dcontour.Ybins' = CompoundProperty()
+
+    # autocontour
+    # -----------
+    autocontour: bool = SimpleProperty()
+
+    # ncontours
+    # ---------
+    ncontours: int = SimpleProperty()
+
+    # contours
+    # --------
+    contours: 'd_histogram2dcontour.Contours' = CompoundProperty()
+
+    # line
+    # ----
+    line: 'd_histogram2dcontour.Line' = CompoundProperty()
+
+    # zhoverformat
+    # ------------
+    zhoverformat: str = SimpleProperty()
+
+    # zauto
+    # -----
+    zauto: bool = SimpleProperty()
+
+    # zmin
+    # ----
+    zmin: Number = SimpleProperty()
+
+    # zmax
+    # ----
+    zmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_histogram2dcontour.Colorbar' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_histogram2dcontour.VisibleValidator(),
+            'showlegend': v_histogram2dcontour.ShowlegendValidator(),
+            'legendgroup': v_histogram2dcontour.LegendgroupValidator(),
+            'opacity': v_histogram2dcontour.OpacityValidator(),
+            'name': v_histogram2dcontour.NameValidator(),
+            'uid': v_histogram2dcontour.UidValidator(),
+            'ids': v_histogram2dcontour.IdsValidator(),
+            'customdata': v_histogram2dcontour.CustomdataValidator(),
+            'selectedpoints': v_histogram2dcontour.SelectedpointsValidator(),
+            'hoverinfo': v_histogram2dcontour.HoverinfoValidator(),
+            'hoverlabel': v_histogram2dcontour.HoverlabelValidator(),
+            'stream': v_histogram2dcontour.StreamValidator(),
+            'x': v_histogram2dcontour.XValidator(),
+            'y': v_histogram2dcontour.YValidator(),
+            'z': v_histogram2dcontour.ZValidator(),
+            'marker': v_histogram2dcontour.MarkerValidator(),
+            'histnorm': v_histogram2dcontour.HistnormValidator(),
+            'histfunc': v_histogram2dcontour.HistfuncValidator(),
+            'autobinx': v_histogram2dcontour.AutobinxValidator(),
+            'nbinsx': v_histogram2dcontour.NbinsxValidator(),
+            'xbins': v_histogram2dcontour.XbinsValidator(),
+            'autobiny': v_histogram2dcontour.AutobinyValidator(),
+            'nbinsy': v_histogram2dcontour.NbinsyValidator(),
+            'ybins': v_histogram2dcontour.YbinsValidator(),
+            'autocontour': v_histogram2dcontour.AutocontourValidator(),
+            'ncontours': v_histogram2dcontour.NcontoursValidator(),
+            'contours': v_histogram2dcontour.ContoursValidator(),
+            'line': v_histogram2dcontour.LineValidator(),
+            'zhoverformat': v_histogram2dcontour.ZhoverformatValidator(),
+            'zauto': v_histogram2dcontour.ZautoValidator(),
+            'zmin': v_histogram2dcontour.ZminValidator(),
+            'zmax': v_histogram2dcontour.ZmaxValidator(),
+            'colorscale': v_histogram2dcontour.ColorscaleValidator(),
+            'autocolorscale': v_histogram2dcontour.AutocolorscaleValidator(),
+            'reversescale': v_histogram2dcontour.ReversescaleValidator(),
+            'showscale': v_histogram2dcontour.ShowscaleValidator(),
+            'colorbar': v_histogram2dcontour.ColorbarValidator(),
+            'xcalendar': v_histogram2dcontour.XcalendarValidator(),
+            'ycalendar': v_histogram2dcontour.YcalendarValidator(),
+            'xaxis': v_histogram2dcontour.XaxisValidator(),
+            'yaxis': v_histogram2dcontour.YaxisValidator(),
+            'idssrc': v_histogram2dcontour.IdssrcValidator(),
+            'customdatasrc': v_histogram2dcontour.CustomdatasrcValidator(),
+            'hoverinfosrc': v_histogram2dcontour.HoverinfosrcValidator(),
+            'xsrc': v_histogram2dcontour.XsrcValidator(),
+            'ysrc': v_histogram2dcontour.YsrcValidator(),
+            'zsrc': v_histogram2dcontour.ZsrcValidator(),
+            'transforms': v_histogram2dcontour.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        z=None,
+        marker=None,
+        histnorm=None,
+        histfunc=None,
+        autobinx=None,
+        nbinsx=None,
+        xbins=None,
+        autobiny=None,
+        nbinsy=None,
+        ybins=None,
+        autocontour=None,
+        ncontours=None,
+        contours=None,
+        line=None,
+        zhoverformat=None,
+        zauto=None,
+        zmin=None,
+        zmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('histogram2dcontour', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.y = y
+        self.z = z
+        self.marker = marker
+        self.histnorm = histnorm
+        self.histfunc = histfunc
+        self.autobinx = autobinx
+        self.nbinsx = nbinsx
+        self.xbins = xbins
+        self.autobiny = autobiny
+        self.nbinsy = nbinsy
+        self.ybins = ybins
+        self.autocontour = autocontour
+        self.ncontours = ncontours
+        self.contours = contours
+        self.line = line
+        self.zhoverformat = zhoverformat
+        self.zauto = zauto
+        self.zmin = zmin
+        self.zmax = zmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.zsrc = zsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'histogram2dcontour'
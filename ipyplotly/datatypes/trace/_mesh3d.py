@@ -0,0 +1,419 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (mesh3d as v_mesh3d)
+from ipyplotly.datatypes.trace import (mesh3d as d_mesh3d)
+
+
+class Mesh3D(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.mesh3d'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_mesh3d.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_mesh3d.Stream' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # cauto
+    # -----
+    cauto: bool = SimpleProperty()
+
+    # cmax
+    # ----
+    cmax: Number = SimpleProperty()
+
+    # cmin
+    # ----
+    cmin: Number = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # i
+    # -
+    i: List = SimpleProperty()
+
+    # j
+    # -
+    j: List = SimpleProperty()
+
+    # k
+    # -
+    k: List = SimpleProperty()
+
+    # delaunayaxis
+    # ------------
+    delaunayaxis: Any = SimpleProperty()
+
+    # alphahull
+    # ---------
+    alphahull: Number = SimpleProperty()
+
+    # intensity
+    # ---------
+    intensity: List = SimpleProperty()
+
+    # vertexcolor
+    # -----------
+    vertexcolor: List = SimpleProperty()
+
+    # facecolor
+    # ---------
+    facecolor: List = SimpleProperty()
+
+    # flatshading
+    # -----------
+    flatshading: bool = SimpleProperty()
+
+    # contour
+    # -------
+    contour: 'd_mesh3d.Contour' = CompoundProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_mesh3d.Colorbar' = CompoundProperty()
+
+    # lightposition
+    # -------------
+    lightposition: 'd_mesh3d.Lightposition' = CompoundProperty()
+
+    # lighting
+    # --------
+    lighting: 'd_mesh3d.Lighting' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # zcalendar
+    # ---------
+    zcalendar: Any = SimpleProperty()
+
+    # scene
+    # -----
+    scene: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # isrc
+    # ----
+    isrc: str = SimpleProperty()
+
+    # jsrc
+    # ----
+    jsrc: str = SimpleProperty()
+
+    # ksrc
+    # ----
+    ksrc: str = SimpleProperty()
+
+    # intensitysrc
+    # ------------
+    intensitysrc: str = SimpleProperty()
+
+    # vertexcolorsrc
+    # --------------
+    vertexcolorsrc: str = SimpleProperty()
+
+    # facecolorsrc
+    # ------------
+    facecolorsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_mesh3d.VisibleValidator(),
+            'showlegend': v_mesh3d.ShowlegendValidator(),
+            'legendgroup': v_mesh3d.LegendgroupValidator(),
+            'opacity': v_mesh3d.OpacityValidator(),
+            'name': v_mesh3d.NameValidator(),
+            'uid': v_mesh3d.UidValidator(),
+            'ids': v_mesh3d.IdsValidator(),
+            'customdata': v_mesh3d.CustomdataValidator(),
+            'selectedpoints': v_mesh3d.SelectedpointsValidator(),
+            'hoverinfo': v_mesh3d.HoverinfoValidator(),
+            'hoverlabel': v_mesh3d.HoverlabelValidator(),
+            'stream': v_mesh3d.StreamValidator(),
+            'color': v_mesh3d.ColorValidator(),
+            'colorscale': v_mesh3d.ColorscaleValidator(),
+            'cauto': v_mesh3d.CautoValidator(),
+            'cmax': v_mesh3d.CmaxValidator(),
+            'cmin': v_mesh3d.CminValidator(),
+            'autocolorscale': v_mesh3d.AutocolorscaleValidator(),
+            'reversescale': v_mesh3d.ReversescaleValidator(),
+            'x': v_mesh3d.XValidator(),
+            'y': v_mesh3d.YValidator(),
+            'z': v_mesh3d.ZValidator(),
+            'i': v_mesh3d.IValidator(),
+            'j': v_mesh3d.JValidator(),
+            'k': v_mesh3d.KValidator(),
+            'delaunayaxis': v_mesh3d.DelaunayaxisValidator(),
+            'alphahull': v_mesh3d.AlphahullValidator(),
+            'intensity': v_mesh3d.IntensityValidator(),
+            'vertexcolor': v_mesh3d.VertexcolorValidator(),
+            'facecolor': v_mesh3d.FacecolorValidator(),
+            'flatshading': v_mesh3d.FlatshadingValidator(),
+            'contour': v_mesh3d.ContourValidator(),
+            'showscale': v_mesh3d.ShowscaleValidator(),
+            'colorbar': v_mesh3d.ColorbarValidator(),
+            'lightposition': v_mesh3d.LightpositionValidator(),
+            'lighting': v_mesh3d.LightingValidator(),
+            'xcalendar': v_mesh3d.XcalendarValidator(),
+            'ycalendar': v_mesh3d.YcalendarValidator(),
+            'zcalendar': v_mesh3d.ZcalendarValidator(),
+            'scene': v_mesh3d.SceneValidator(),
+            'idssrc': v_mesh3d.IdssrcValidator(),
+            'customdatasrc': v_mesh3d.CustomdatasrcValidator(),
+            'hoverinfosrc': v_mesh3d.HoverinfosrcValidator(),
+            'xsrc': v_mesh3d.XsrcValidator(),
+            'ysrc': v_mesh3d.YsrcValidator(),
+            'zsrc': v_mesh3d.ZsrcValidator(),
+            'isrc': v_mesh3d.IsrcValidator(),
+            'jsrc': v_mesh3d.JsrcValidator(),
+            'ksrc': v_mesh3d.KsrcValidator(),
+            'intensitysrc': v_mesh3d.IntensitysrcValidator(),
+            'vertexcolorsrc': v_mesh3d.VertexcolorsrcValidator(),
+            'facecolorsrc': v_mesh3d.FacecolorsrcValidator(),
+            'transforms': v_mesh3d.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        color=None,
+        colorscale=None,
+        cauto=None,
+        cmax=None,
+        cmin=None,
+        autocolorscale=None,
+        reversescale=None,
+        x=None,
+        y=None,
+        z=None,
+        i=None,
+        j=None,
+        k=None,
+        delaunayaxis=None,
+        alphahull=None,
+        intensity=None,
+        vertexcolor=None,
+        facecolor=None,
+        flatshading=None,
+        contour=None,
+        showscale=None,
+        colorbar=None,
+        lightposition=None,
+        lighting=None,
+        xcalendar=None,
+        ycalendar=None,
+        zcalendar=None,
+        scene=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        isrc=None,
+        jsrc=None,
+        ksrc=None,
+        intensitysrc=None,
+        vertexcolorsrc=None,
+        facecolorsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('mesh3d', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.color = color
+        self.colorscale = colorscale
+        self.cauto = cauto
+        self.cmax = cmax
+        self.cmin = cmin
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.x = x
+        self.y = y
+        self.z = z
+        self.i = i
+        self.j = j
+        self.k = k
+        self.delaunayaxis = delaunayaxis
+        self.alphahull = alphahull
+        self.intensity = intensity
+        self.vertexcolor = vertexcolor
+        self.facecolor = facecolor
+        self.flatshading = flatshading
+        self.contour = contour
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.lightposition = lightposition
+        self.lighting = lighting
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.zcalendar = zcalendar
+        self.scene = scene
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.zsrc = zsrc
+        self.isrc = isrc
+        self.jsrc = jsrc
+        self.ksrc = ksrc
+        self.intensitysrc = intensitysrc
+        self.vertexcolorsrc = vertexcolorsrc
+        self.facecolorsrc = facecolorsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'mesh3d'
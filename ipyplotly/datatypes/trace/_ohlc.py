@@ -0,0 +1,293 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (ohlc as v_ohlc)
+from ipyplotly.datatypes.trace import (ohlc as d_ohlc)
+
+
+class Ohlc(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.ohlc'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_ohlc.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_ohlc.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # open
+    # ----
+    open: List = SimpleProperty()
+
+    # high
+    # ----
+    high: List = SimpleProperty()
+
+    # low
+    # ---
+    low: List = SimpleProperty()
+
+    # close
+    # -----
+    close: List = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_ohlc.Line' = CompoundProperty()
+
+    # increasing
+    # ----------
+    increasing: 'd_ohlc.Increasing' = CompoundProperty()
+
+    # decreasing
+    # ----------
+    decreasing: 'd_ohlc.Decreasing' = CompoundProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # opensrc
+    # -------
+    opensrc: str = SimpleProperty()
+
+    # highsrc
+    # -------
+    highsrc: str = SimpleProperty()
+
+    # lowsrc
+    # ------
+    lowsrc: str = SimpleProperty()
+
+    # closesrc
+    # --------
+    closesrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_ohlc.VisibleValidator(),
+            'showlegend': v_ohlc.ShowlegendValidator(),
+            'legendgroup': v_ohlc.LegendgroupValidator(),
+            'opacity': v_ohlc.OpacityValidator(),
+            'name': v_ohlc.NameValidator(),
+            'uid': v_ohlc.UidValidator(),
+            'ids': v_ohlc.IdsValidator(),
+            'customdata': v_ohlc.CustomdataValidator(),
+            'selectedpoints': v_ohlc.SelectedpointsValidator(),
+            'hoverinfo': v_ohlc.HoverinfoValidator(),
+            'hoverlabel': v_ohlc.HoverlabelValidator(),
+            'stream': v_ohlc.StreamValidator(),
+            'x': v_ohlc.XValidator(),
+            'open': v_ohlc.OpenValidator(),
+            'high': v_ohlc.HighValidator(),
+            'low': v_ohlc.LowValidator(),
+            'close': v_ohlc.CloseValidator(),
+            'line': v_ohlc.LineValidator(),
+            'increasing': v_ohlc.IncreasingValidator(),
+            'decreasing': v_ohlc.DecreasingValidator(),
+            'text': v_ohlc.TextValidator(),
+            'tickwidth': v_ohlc.TickwidthValidator(),
+            'xcalendar': v_ohlc.XcalendarValidator(),
+            'xaxis': v_ohlc.XaxisValidator(),
+            'yaxis': v_ohlc.YaxisValidator(),
+            'idssrc': v_ohlc.IdssrcValidator(),
+            'customdatasrc': v_ohlc.CustomdatasrcValidator(),
+            'hoverinfosrc': v_ohlc.HoverinfosrcValidator(),
+            'xsrc': v_ohlc.XsrcValidator(),
+            'opensrc': v_ohlc.OpensrcValidator(),
+            'highsrc': v_ohlc.HighsrcValidator(),
+            'lowsrc': v_ohlc.LowsrcValidator(),
+            'closesrc': v_ohlc.ClosesrcValidator(),
+            'textsrc': v_ohlc.TextsrcValidator(),
+            'transforms': v_ohlc.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        open=None,
+        high=None,
+        low=None,
+        close=None,
+        line=None,
+        increasing=None,
+        decreasing=None,
+        text=None,
+        tickwidth=None,
+        xcalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        opensrc=None,
+        highsrc=None,
+        lowsrc=None,
+        closesrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('ohlc', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.line = line
+        self.increasing = increasing
+        self.decreasing = decreasing
+        self.text = text
+        self.tickwidth = tickwidth
+        self.xcalendar = xcalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.opensrc = opensrc
+        self.highsrc = highsrc
+        self.lowsrc = lowsrc
+        self.closesrc = closesrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'ohlc'
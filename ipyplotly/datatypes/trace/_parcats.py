@@ -0,0 +1,216 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (parcats as v_parcats)
+from ipyplotly.datatypes.trace import (parcats as d_parcats)
+
+
+class Parcats(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.parcats'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_parcats.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_parcats.Stream' = CompoundProperty()
+
+    # domain
+    # ------
+    domain: 'd_parcats.Domain' = CompoundProperty()
+
+    # tooltip
+    # -------
+    tooltip: bool = SimpleProperty()
+
+    # hovermode
+    # ---------
+    hovermode: Any = SimpleProperty()
+
+    # bundlecolors
+    # ------------
+    bundlecolors: bool = SimpleProperty()
+
+    # dimensions
+    # ----------
+    dimensions: 'Tuple[d_parcats.Dimension]' = CompoundArrayProperty()
+
+    # marker
+    # ------
+    marker: 'd_parcats.Marker' = CompoundProperty()
+
+    # counts
+    # ------
+    counts: Number = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # countssrc
+    # ---------
+    countssrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_parcats.VisibleValidator(),
+            'showlegend': v_parcats.ShowlegendValidator(),
+            'legendgroup': v_parcats.LegendgroupValidator(),
+            'opacity': v_parcats.OpacityValidator(),
+            'name': v_parcats.NameValidator(),
+            'uid': v_parcats.UidValidator(),
+            'ids': v_parcats.IdsValidator(),
+            'customdata': v_parcats.CustomdataValidator(),
+            'selectedpoints': v_parcats.SelectedpointsValidator(),
+            'hoverinfo': v_parcats.HoverinfoValidator(),
+            'hoverlabel': v_parcats.HoverlabelValidator(),
+            'stream': v_parcats.StreamValidator(),
+            'domain': v_parcats.DomainValidator(),
+            'tooltip': v_parcats.TooltipValidator(),
+            'hovermode': v_parcats.HovermodeValidator(),
+            'bundlecolors': v_parcats.BundlecolorsValidator(),
+            'dimensions': v_parcats.DimensionsValidator(),
+            'marker': v_parcats.MarkerValidator(),
+            'counts': v_parcats.CountsValidator(),
+            'idssrc': v_parcats.IdssrcValidator(),
+            'customdatasrc': v_parcats.CustomdatasrcValidator(),
+            'hoverinfosrc': v_parcats.HoverinfosrcValidator(),
+            'countssrc': v_parcats.CountssrcValidator(),
+            'transforms': v_parcats.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        tooltip=None,
+        hovermode=None,
+        bundlecolors=None,
+        dimensions=None,
+        marker=None,
+        counts=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        countssrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('parcats', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.domain = domain
+        self.tooltip = tooltip
+        self.hovermode = hovermode
+        self.bundlecolors = bundlecolors
+        self.dimensions = dimensions
+        self.marker = marker
+        self.counts = counts
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.countssrc = countssrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'parcats'
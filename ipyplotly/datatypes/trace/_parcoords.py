@@ -0,0 +1,202 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (parcoords as v_parcoords)
+from ipyplotly.datatypes.trace import (parcoords as d_parcoords)
+
+
+class Parcoords(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.parcoords'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_parcoords.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_parcoords.Stream' = CompoundProperty()
+
+    # domain
+    # ------
+    domain: 'd_parcoords.Domain' = CompoundProperty()
+
+    # labelfont
+    # ---------
+    labelfont: 'd_parcoords.Labelfont' = CompoundProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_parcoords.Tickfont' = CompoundProperty()
+
+    # rangefont
+    # ---------
+    rangefont: 'd_parcoords.Rangefont' = CompoundProperty()
+
+    # dimensions
+    # ----------
+    dimensions: 'Tuple[d_parcoords.Dimension]' = CompoundArrayProperty()
+
+    # line
+    # ----
+    line: 'd_parcoords.Line' = CompoundProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_parcoords.VisibleValidator(),
+            'showlegend': v_parcoords.ShowlegendValidator(),
+            'legendgroup': v_parcoords.LegendgroupValidator(),
+            'opacity': v_parcoords.OpacityValidator(),
+            'name': v_parcoords.NameValidator(),
+            'uid': v_parcoords.UidValidator(),
+            'ids': v_parcoords.IdsValidator(),
+            'customdata': v_parcoords.CustomdataValidator(),
+            'selectedpoints': v_parcoords.SelectedpointsValidator(),
+            'hoverinfo': v_parcoords.HoverinfoValidator(),
+            'hoverlabel': v_parcoords.HoverlabelValidator(),
+            'stream': v_parcoords.StreamValidator(),
+            'domain': v_parcoords.DomainValidator(),
+            'labelfont': v_parcoords.LabelfontValidator(),
+            'tickfont': v_parcoords.TickfontValidator(),
+            'rangefont': v_parcoords.RangefontValidator(),
+            'dimensions': v_parcoords.DimensionsValidator(),
+            'line': v_parcoords.LineValidator(),
+            'idssrc': v_parcoords.IdssrcValidator(),
+            'customdatasrc': v_parcoords.CustomdatasrcValidator(),
+            'hoverinfosrc': v_parcoords.HoverinfosrcValidator(),
+            'transforms': v_parcoords.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        labelfont=None,
+        tickfont=None,
+        rangefont=None,
+        dimensions=None,
+        line=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('parcoords', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.domain = domain
+        self.labelfont = labelfont
+        self.tickfont = tickfont
+        self.rangefont = rangefont
+        self.dimensions = dimensions
+        self.line = line
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'parcoords'
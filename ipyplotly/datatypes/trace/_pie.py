@@ -0,0 +1,335 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (pie as v_pie)
+from ipyplotly.datatypes.trace import (pie as d_pie)
+
+
+class Pie(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.pie'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_pie.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_pie.Stream' = CompoundProperty()
+
+    # labels
+    # ------
+    labels: List = SimpleProperty()
+
+    # label0
+    # ------
+    label0: Number = SimpleProperty()
+
+    # dlabel
+    # ------
+    dlabel: Number = SimpleProperty()
+
+    # values
+    # ------
+    values: List = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_pie.Marker' = CompoundProperty()
+
+    # text
+    # ----
+    text: List = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # scalegroup
+    # ----------
+    scalegroup: str = SimpleProperty()
+
+    # textinfo
+    # --------
+    textinfo: Any = SimpleProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_pie.Textfont' = CompoundProperty()
+
+    # insidetextfont
+    # --------------
+    insidetextfont: 'd_pie.Insidetextfont' = CompoundProperty()
+
+    # outsidetextfont
+    # ---------------
+    outsidetextfont: 'd_pie.Outsidetextfont' = CompoundProperty()
+
+    # domain
+    # ------
+    domain: 'd_pie.Domain' = CompoundProperty()
+
+    # hole
+    # ----
+    hole: Number = SimpleProperty()
+
+    # sort
+    # ----
+    sort: bool = SimpleProperty()
+
+    # direction
+    # ---------
+    direction: Any = SimpleProperty()
+
+    # rotation
+    # --------
+    rotation: Number = SimpleProperty()
+
+    # pull
+    # ----
+    pull: Number = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # labelssrc
+    # ---------
+    labelssrc: str = SimpleProperty()
+
+    # valuessrc
+    # ---------
+    valuessrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # hovertextsrc
+    # ------------
+    hovertextsrc: str = SimpleProperty()
+
+    # textpositionsrc
+    # ---------------
+    textpositionsrc: str = SimpleProperty()
+
+    # pullsrc
+    # -------
+    pullsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_pie.VisibleValidator(),
+            'showlegend': v_pie.ShowlegendValidator(),
+            'legendgroup': v_pie.LegendgroupValidator(),
+            'opacity': v_pie.OpacityValidator(),
+            'name': v_pie.NameValidator(),
+            'uid': v_pie.UidValidator(),
+            'ids': v_pie.IdsValidator(),
+            'customdata': v_pie.CustomdataValidator(),
+            'selectedpoints': v_pie.SelectedpointsValidator(),
+            'hoverinfo': v_pie.HoverinfoValidator(),
+            'hoverlabel': v_pie.HoverlabelValidator(),
+            'stream': v_pie.StreamValidator(),
+            'labels': v_pie.LabelsValidator(),
+            'label0': v_pie.Label0Validator(),
+            'dlabel': v_pie.DlabelValidator(),
+            'values': v_pie.ValuesValidator(),
+            'marker': v_pie.MarkerValidator(),
+            'text': v_pie.TextValidator(),
+            'hovertext': v_pie.HovertextValidator(),
+            'scalegroup': v_pie.ScalegroupValidator(),
+            'textinfo': v_pie.TextinfoValidator(),
+            'textposition': v_pie.TextpositionValidator(),
+            'textfont': v_pie.TextfontValidator(),
+            'insidetextfont': v_pie.InsidetextfontValidator(),
+            'outsidetextfont': v_pie.OutsidetextfontValidator(),
+            'domain': v_pie.DomainValidator(),
+            'hole': v_pie.HoleValidator(),
+            'sort': v_pie.SortValidator(),
+            'direction': v_pie.DirectionValidator(),
+            'rotation': v_pie.RotationValidator(),
+            'pull': v_pie.PullValidator(),
+            'idssrc': v_pie.IdssrcValidator(),
+            'customdatasrc': v_pie.CustomdatasrcValidator(),
+            'hoverinfosrc': v_pie.HoverinfosrcValidator(),
+            'labelssrc': v_pie.LabelssrcValidator(),
+            'valuessrc': v_pie.ValuessrcValidator(),
+            'textsrc': v_pie.TextsrcValidator(),
+            'hovertextsrc': v_pie.HovertextsrcValidator(),
+            'textpositionsrc': v_pie.TextpositionsrcValidator(),
+            'pullsrc': v_pie.PullsrcValidator(),
+            'transforms': v_pie.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        labels=None,
+        label0=None,
+        dlabel=None,
+        values=None,
+        marker=None,
+        text=None,
+        hovertext=None,
+        scalegroup=None,
+        textinfo=None,
+        textposition=None,
+        textfont=None,
+        insidetextfont=None,
+        outsidetextfont=None,
+        domain=None,
+        hole=None,
+        sort=None,
+        direction=None,
+        rotation=None,
+        pull=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        labelssrc=None,
+        valuessrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        pullsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('pie', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.labels = labels
+        self.label0 = label0
+        self.dlabel = dlabel
+        self.values = values
+        self.marker = marker
+        self.text = text
+        self.hovertext = hovertext
+        self.scalegroup = scalegroup
+        self.textinfo = textinfo
+        self.textposition = textposition
+        self.textfont = textfont
+        self.insidetextfont = insidetextfont
+        self.outsidetextfont = outsidetextfont
+        self.domain = domain
+        self.hole = hole
+        self.sort = sort
+        self.direction = direction
+        self.rotation = rotation
+        self.pull = pull
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.labelssrc = labelssrc
+        self.valuessrc = valuessrc
+        self.textsrc = textsrc
+        self.hovertextsrc = hovertextsrc
+        self.textpositionsrc = textpositionsrc
+        self.pullsrc = pullsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'pie'
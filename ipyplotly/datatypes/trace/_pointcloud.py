@@ -0,0 +1,279 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (pointcloud as v_pointcloud)
+from ipyplotly.datatypes.trace import (pointcloud as d_pointcloud)
+
+
+class Pointcloud(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.pointcloud'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_pointcloud.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_pointcloud.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # xy
+    # --
+    xy: List = SimpleProperty()
+
+    # indices
+    # -------
+    indices: List = SimpleProperty()
+
+    # xbounds
+    # -------
+    xbounds: List = SimpleProperty()
+
+    # ybounds
+    # -------
+    ybounds: List = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_pointcloud.Marker' = CompoundProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # xysrc
+    # -----
+    xysrc: str = SimpleProperty()
+
+    # indicessrc
+    # ----------
+    indicessrc: str = SimpleProperty()
+
+    # xboundssrc
+    # ----------
+    xboundssrc: str = SimpleProperty()
+
+    # yboundssrc
+    # ----------
+    yboundssrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_pointcloud.VisibleValidator(),
+            'showlegend': v_pointcloud.ShowlegendValidator(),
+            'legendgroup': v_pointcloud.LegendgroupValidator(),
+            'opacity': v_pointcloud.OpacityValidator(),
+            'name': v_pointcloud.NameValidator(),
+            'uid': v_pointcloud.UidValidator(),
+            'ids': v_pointcloud.IdsValidator(),
+            'customdata': v_pointcloud.CustomdataValidator(),
+            'selectedpoints': v_pointcloud.SelectedpointsValidator(),
+            'hoverinfo': v_pointcloud.HoverinfoValidator(),
+            'hoverlabel': v_pointcloud.HoverlabelValidator(),
+            'stream': v_pointcloud.StreamValidator(),
+            'x': v_pointcloud.XValidator(),
+            'y': v_pointcloud.YValidator(),
+            'xy': v_pointcloud.XyValidator(),
+            'indices': v_pointcloud.IndicesValidator(),
+            'xbounds': v_pointcloud.XboundsValidator(),
+            'ybounds': v_pointcloud.YboundsValidator(),
+            'text': v_pointcloud.TextValidator(),
+            'marker': v_pointcloud.MarkerValidator(),
+            'xaxis': v_pointcloud.XaxisValidator(),
+            'yaxis': v_pointcloud.YaxisValidator(),
+            'idssrc': v_pointcloud.IdssrcValidator(),
+            'customdatasrc': v_pointcloud.CustomdatasrcValidator(),
+            'hoverinfosrc': v_pointcloud.HoverinfosrcValidator(),
+            'xsrc': v_pointcloud.XsrcValidator(),
+            'ysrc': v_pointcloud.YsrcValidator(),
+            'xysrc': v_pointcloud.XysrcValidator(),
+            'indicessrc': v_pointcloud.IndicessrcValidator(),
+            'xboundssrc': v_pointcloud.XboundssrcValidator(),
+            'yboundssrc': v_pointcloud.YboundssrcValidator(),
+            'textsrc': v_pointcloud.TextsrcValidator(),
+            'transforms': v_pointcloud.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        xy=None,
+        indices=None,
+        xbounds=None,
+        ybounds=None,
+        text=None,
+        marker=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        xysrc=None,
+        indicessrc=None,
+        xboundssrc=None,
+        yboundssrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('pointcloud', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.y = y
+        self.xy = xy
+        self.indices = indices
+        self.xbounds = xbounds
+        self.ybounds = ybounds
+        self.text = text
+        self.marker = marker
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.xysrc = xysrc
+        self.indicessrc = indicessrc
+        self.xboundssrc = xboundssrc
+        self.yboundssrc = yboundssrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'pointcloud'
@@ -0,0 +1,216 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (sankey as v_sankey)
+from ipyplotly.datatypes.trace import (sankey as d_sankey)
+
+
+class Sankey(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.sankey'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_sankey.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_sankey.Stream' = CompoundProperty()
+
+    # domain
+    # ------
+    domain: 'd_sankey.Domain' = CompoundProperty()
+
+    # orientation
+    # -----------
+    orientation: Any = SimpleProperty()
+
+    # valueformat
+    # -----------
+    valueformat: str = SimpleProperty()
+
+    # valuesuffix
+    # -----------
+    valuesuffix: str = SimpleProperty()
+
+    # arrangement
+    # -----------
+    arrangement: Any = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_sankey.Textfont' = CompoundProperty()
+
+    # node
+    # ----
+    node: 'd_sankey.Node' = CompoundProperty()
+
+    # link
+    # ----
+    link: 'd_sankey.Link' = CompoundProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_sankey.VisibleValidator(),
+            'showlegend': v_sankey.ShowlegendValidator(),
+            'legendgroup': v_sankey.LegendgroupValidator(),
+            'opacity': v_sankey.OpacityValidator(),
+            'name': v_sankey.NameValidator(),
+            'uid': v_sankey.UidValidator(),
+            'ids': v_sankey.IdsValidator(),
+            'customdata': v_sankey.CustomdataValidator(),
+            'selectedpoints': v_sankey.SelectedpointsValidator(),
+            'hoverinfo': v_sankey.HoverinfoValidator(),
+            'hoverlabel': v_sankey.HoverlabelValidator(),
+            'stream': v_sankey.StreamValidator(),
+            'domain': v_sankey.DomainValidator(),
+            'orientation': v_sankey.OrientationValidator(),
+            'valueformat': v_sankey.ValueformatValidator(),
+            'valuesuffix': v_sankey.ValuesuffixValidator(),
+            'arrangement': v_sankey.ArrangementValidator(),
+            'textfont': v_sankey.TextfontValidator(),
+            'node': v_sankey.NodeValidator(),
+            'link': v_sankey.LinkValidator(),
+            'idssrc': v_sankey.IdssrcValidator(),
+            'customdatasrc': v_sankey.CustomdatasrcValidator(),
+            'hoverinfosrc': v_sankey.HoverinfosrcValidator(),
+            'transforms': v_sankey.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        orientation=None,
+        valueformat=None,
+        valuesuffix=None,
+        arrangement=None,
+        textfont=None,
+        node=None,
+        link=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('sankey', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.domain = domain
+        self.orientation = orientation
+        self.valueformat = valueformat
+        self.valuesuffix = valuesuffix
+        self.arrangement = arrangement
+        self.textfont = textfont
+        self.node = node
+        self.link = link
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'sankey'
@@ -0,0 +1,405 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (scatter as v_scatter)
+from ipyplotly.datatypes.trace import (scatter as d_scatter)
+
+
+class Scatter(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scatter'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_scatter.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_scatter.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # dx
+    # --
+    dx: Number = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # dy
+    # --
+    dy: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # hoveron
+    # -------
+    hoveron: Any = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_scatter.Line' = CompoundProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # cliponaxis
+    # ----------
+    cliponaxis: bool = SimpleProperty()
+
+    # fill
+    # ----
+    fill: Any = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_scatter.Marker' = CompoundProperty()
+
+    # selected
+    # --------
+    selected: 'd_scatter.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_scatter.Unselected' = CompoundProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_scatter.Textfont' = CompoundProperty()
+
+    # r
+    # -
+    r: List = SimpleProperty()
+
+    # t
+    # -
+    t: List = SimpleProperty()
+
+    # error_y
+    # -------
+    error_y: 'd_scatter.ErrorY' = CompoundProperty()
+
+    # error_x
+    # -------
+    error_x: 'd_scatter.ErrorX' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # hovertextsrc
+    # ------------
+    hovertextsrc: str = SimpleProperty()
+
+    # textpositionsrc
+    # ---------------
+    textpositionsrc: str = SimpleProperty()
+
+    # rsrc
+    # ----
+    rsrc: str = SimpleProperty()
+
+    # tsrc
+    # ----
+    tsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_scatter.VisibleValidator(),
+            'showlegend': v_scatter.ShowlegendValidator(),
+            'legendgroup': v_scatter.LegendgroupValidator(),
+            'opacity': v_scatter.OpacityValidator(),
+            'name': v_scatter.NameValidator(),
+            'uid': v_scatter.UidValidator(),
+            'ids': v_scatter.IdsValidator(),
+            'customdata': v_scatter.CustomdataValidator(),
+            'selectedpoints': v_scatter.SelectedpointsValidator(),
+            'hoverinfo': v_scatter.HoverinfoValidator(),
+            'hoverlabel': v_scatter.HoverlabelValidator(),
+            'stream': v_scatter.StreamValidator(),
+            'x': v_scatter.XValidator(),
+            'x0': v_scatter.X0Validator(),
+            'dx': v_scatter.DxValidator(),
+            'y': v_scatter.YValidator(),
+            'y0': v_scatter.Y0Validator(),
+            'dy': v_scatter.DyValidator(),
+            'text': v_scatter.TextValidator(),
+            'hovertext': v_scatter.HovertextValidator(),
+            'mode': v_scatter.ModeValidator(),
+            'hoveron': v_scatter.HoveronValidator(),
+            'line': v_scatter.LineValidator(),
+            'connectgaps': v_scatter.ConnectgapsValidator(),
+            'cliponaxis': v_scatter.CliponaxisValidator(),
+            'fill': v_scatter.FillValidator(),
+            'fillcolor': v_scatter.FillcolorValidator(),
+            'marker': v_scatter.MarkerValidator(),
+            'selected': v_scatter.SelectedValidator(),
+            'unselected': v_scatter.UnselectedValidator(),
+            'textposition': v_scatter.TextpositionValidator(),
+            'textfont': v_scatter.TextfontValidator(),
+            'r': v_scatter.RValidator(),
+            't': v_scatter.TValidator(),
+            'error_y': v_scatter.ErrorYValidator(),
+            'error_x': v_scatter.ErrorXValidator(),
+            'xcalendar': v_scatter.XcalendarValidator(),
+            'ycalendar': v_scatter.YcalendarValidator(),
+            'xaxis': v_scatter.XaxisValidator(),
+            'yaxis': v_scatter.YaxisValidator(),
+            'idssrc': v_scatter.IdssrcValidator(),
+            'customdatasrc': v_scatter.CustomdatasrcValidator(),
+            'hoverinfosrc': v_scatter.HoverinfosrcValidator(),
+            'xsrc': v_scatter.XsrcValidator(),
+            'ysrc': v_scatter.YsrcValidator(),
+            'textsrc': v_scatter.TextsrcValidator(),
+            'hovertextsrc': v_scatter.HovertextsrcValidator(),
+            'textpositionsrc': v_scatter.TextpositionsrcValidator(),
+            'rsrc': v_scatter.RsrcValidator(),
+            'tsrc': v_scatter.TsrcValidator(),
+            'transforms': v_scatter.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        hovertext=None,
+        mode=None,
+        hoveron=None,
+        line=None,
+        connectgaps=None,
+        cliponaxis=None,
+        fill=None,
+        fillcolor=None,
+        marker=None,
+        selected=None,
+        unselected=None,
+        textposition=None,
+        textfont=None,
+        r=None,
+        t=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        rsrc=None,
+        tsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('scatter', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.x0 = x0
+        self.dx = dx
+        self.y = y
+        self.y0 = y0
+        self.dy = dy
+        self.text = text
+        self.hovertext = hovertext
+        self.mode = mode
+        self.hoveron = hoveron
+        self.line = line
+        self.connectgaps = connectgaps
+        self.cliponaxis = cliponaxis
+        self.fill = fill
+        self.fillcolor = fillcolor
+        self.marker = marker
+        self.selected = selected
+        self.unselected = unselected
+        self.textposition = textposition
+        self.textfont = textfont
+        self.r = r
+        self.t = t
+        self.error_y = error_y
+        self.error_x = error_x
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.hovertextsrc = hovertextsrc
+        self.textpositionsrc = textpositionsrc
+        self.rsrc = rsrc
+        self.tsrc = tsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'scatter'
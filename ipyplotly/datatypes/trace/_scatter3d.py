@@ -0,0 +1,349 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (scatter3d as v_scatter3d)
+from ipyplotly.datatypes.trace import (scatter3d as d_scatter3d)
+
+
+class Scatter3D(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scatter3d'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_scatter3d.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_scatter3d.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # surfaceaxis
+    # -----------
+    surfaceaxis: Any = SimpleProperty()
+
+    # surfacecolor
+    # ------------
+    surfacecolor: str = SimpleProperty()
+
+    # projection
+    # ----------
+    projection: 'd_scatter3d.Projection' = CompoundProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_scatter3d.Line' = CompoundProperty()
+
+    # marker
+    # ------
+    marker: 'd_scatter3d.Marker' = CompoundProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_scatter3d.Textfont' = CompoundProperty()
+
+    # error_x
+    # -------
+    error_x: 'd_scatter3d.ErrorX' = CompoundProperty()
+
+    # error_y
+    # -------
+    error_y: 'd_scatter3d.ErrorY' = CompoundProperty()
+
+    # error_z
+    # -------
+    error_z: 'd_scatter3d.ErrorZ' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # zcalendar
+    # ---------
+    zcalendar: Any = SimpleProperty()
+
+    # scene
+    # -----
+    scene: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # hovertextsrc
+    # ------------
+    hovertextsrc: str = SimpleProperty()
+
+    # textpositionsrc
+    # ---------------
+    textpositionsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_scatter3d.VisibleValidator(),
+            'showlegend': v_scatter3d.ShowlegendValidator(),
+            'legendgroup': v_scatter3d.LegendgroupValidator(),
+            'opacity': v_scatter3d.OpacityValidator(),
+            'name': v_scatter3d.NameValidator(),
+            'uid': v_scatter3d.UidValidator(),
+            'ids': v_scatter3d.IdsValidator(),
+            'customdata': v_scatter3d.CustomdataValidator(),
+            'selectedpoints': v_scatter3d.SelectedpointsValidator(),
+            'hoverinfo': v_scatter3d.HoverinfoValidator(),
+            'hoverlabel': v_scatter3d.HoverlabelValidator(),
+            'stream': v_scatter3d.StreamValidator(),
+            'x': v_scatter3d.XValidator(),
+            'y': v_scatter3d.YValidator(),
+            'z': v_scatter3d.ZValidator(),
+            'text': v_scatter3d.TextValidator(),
+            'hovertext': v_scatter3d.HovertextValidator(),
+            'mode': v_scatter3d.ModeValidator(),
+            'surfaceaxis': v_scatter3d.SurfaceaxisValidator(),
+            'surfacecolor': v_scatter3d.SurfacecolorValidator(),
+            'projection': v_scatter3d.ProjectionValidator(),
+            'connectgaps': v_scatter3d.ConnectgapsValidator(),
+            'line': v_scatter3d.LineValidator(),
+            'marker': v_scatter3d.MarkerValidator(),
+            'textposition': v_scatter3d.TextpositionValidator(),
+            'textfont': v_scatter3d.TextfontValidator(),
+            'error_x': v_scatter3d.ErrorXValidator(),
+            'error_y': v_scatter3d.ErrorYValidator(),
+            'error_z': v_scatter3d.ErrorZValidator(),
+            'xcalendar': v_scatter3d.XcalendarValidator(),
+            'ycalendar': v_scatter3d.YcalendarValidator(),
+            'zcalendar': v_scatter3d.ZcalendarValidator(),
+            'scene': v_scatter3d.SceneValidator(),
+            'idssrc': v_scatter3d.IdssrcValidator(),
+            'customdatasrc': v_scatter3d.CustomdatasrcValidator(),
+            'hoverinfosrc': v_scatter3d.HoverinfosrcValidator(),
+            'xsrc': v_scatter3d.XsrcValidator(),
+            'ysrc': v_scatter3d.YsrcValidator(),
+            'zsrc': v_scatter3d.ZsrcValidator(),
+            'textsrc': v_scatter3d.TextsrcValidator(),
+            'hovertextsrc': v_scatter3d.HovertextsrcValidator(),
+            'textpositionsrc': v_scatter3d.TextpositionsrcValidator(),
+            'transforms': v_scatter3d.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        y=None,
+        z=None,
+        text=None,
+        hovertext=None,
+        mode=None,
+        surfaceaxis=None,
+        surfacecolor=None,
+        projection=None,
+        connectgaps=None,
+        line=None,
+        marker=None,
+        textposition=None,
+        textfont=None,
+        error_x=None,
+        error_y=None,
+        error_z=None,
+        xcalendar=None,
+        ycalendar=None,
+        zcalendar=None,
+        scene=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        zsrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('scatter3d', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.y = y
+        self.z = z
+        self.text = text
+        self.hovertext = hovertext
+        self.mode = mode
+        self.surfaceaxis = surfaceaxis
+        self.surfacecolor = surfacecolor
+        self.projection = projection
+        self.connectgaps = connectgaps
+        self.line = line
+        self.marker = marker
+        self.textposition = textposition
+        self.textfont = textfont
+        self.error_x = error_x
+        self.error_y = error_y
+        self.error_z = error_z
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.zcalendar = zcalendar
+        self.scene = scene
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.zsrc = zsrc
+        self.textsrc = textsrc
+        self.hovertextsrc = hovertextsrc
+        self.textpositionsrc = textpositionsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'scatter3d'
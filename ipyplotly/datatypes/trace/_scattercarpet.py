@@ -0,0 +1,307 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (scattercarpet as v_scattercarpet)
+from ipyplotly.datatypes.trace import (scattercarpet as d_scattercarpet)
+
+
+class Scattercarpet(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scattercarpet'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_scattercarpet.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_scattercarpet.Stream' = CompoundProperty()
+
+    # carpet
+    # ------
+    carpet: str = SimpleProperty()
+
+    # a
+    # -
+    a: List = SimpleProperty()
+
+    # b
+    # -
+    b: List = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_scattercarpet.Line' = CompoundProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # fill
+    # ----
+    fill: Any = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_scattercarpet.Marker' = CompoundProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_scattercarpet.Textfont' = CompoundProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # selected
+    # --------
+    selected: 'd_scattercarpet.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_scattercarpet.Unselected' = CompoundProperty()
+
+    # hoveron
+    # -------
+    hoveron: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # asrc
+    # ----
+    asrc: str = SimpleProperty()
+
+    # bsrc
+    # ----
+    bsrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # textpositionsrc
+    # ---------------
+    textpositionsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_scattercarpet.VisibleValidator(),
+            'showlegend': v_scattercarpet.ShowlegendValidator(),
+            'legendgroup': v_scattercarpet.LegendgroupValidator(),
+            'opacity': v_scattercarpet.OpacityValidator(),
+            'name': v_scattercarpet.NameValidator(),
+            'uid': v_scattercarpet.UidValidator(),
+            'ids': v_scattercarpet.IdsValidator(),
+            'customdata': v_scattercarpet.CustomdataValidator(),
+            'selectedpoints': v_scattercarpet.SelectedpointsValidator(),
+            'hoverinfo': v_scattercarpet.HoverinfoValidator(),
+            'hoverlabel': v_scattercarpet.HoverlabelValidator(),
+            'stream': v_scattercarpet.StreamValidator(),
+            'carpet': v_scattercarpet.CarpetValidator(),
+            'a': v_scattercarpet.AValidator(),
+            'b': v_scattercarpet.BValidator(),
+            'mode': v_scattercarpet.ModeValidator(),
+            'text': v_scattercarpet.TextValidator(),
+            'line': v_scattercarpet.LineValidator(),
+            'connectgaps': v_scattercarpet.ConnectgapsValidator(),
+            'fill': v_scattercarpet.FillValidator(),
+            'fillcolor': v_scattercarpet.FillcolorValidator(),
+            'marker': v_scattercarpet.MarkerValidator(),
+            'textfont': v_scattercarpet.TextfontValidator(),
+            'textposition': v_scattercarpet.TextpositionValidator(),
+            'selected': v_scattercarpet.SelectedValidator(),
+            'unselected': v_scattercarpet.UnselectedValidator(),
+            'hoveron': v_scattercarpet.HoveronValidator(),
+            'xaxis': v_scattercarpet.XaxisValidator(),
+            'yaxis': v_scattercarpet.YaxisValidator(),
+            'idssrc': v_scattercarpet.IdssrcValidator(),
+            'customdatasrc': v_scattercarpet.CustomdatasrcValidator(),
+            'hoverinfosrc': v_scattercarpet.HoverinfosrcValidator(),
+            'asrc': v_scattercarpet.AsrcValidator(),
+            'bsrc': v_scattercarpet.BsrcValidator(),
+            'textsrc': v_scattercarpet.TextsrcValidator(),
+            'textpositionsrc': v_scattercarpet.TextpositionsrcValidator(),
+            'transforms': v_scattercarpet.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        carpet=None,
+        a=None,
+        b=None,
+        mode=None,
+        text=None,
+        line=None,
+        connectgaps=None,
+        fill=None,
+        fillcolor=None,
+        marker=None,
+        textfont=None,
+        textposition=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        asrc=None,
+        bsrc=None,
+        textsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('scattercarpet', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.carpet = carpet
+        self.a = a
+        self.b = b
+        self.mode = mode
+        self.text = text
+        self.line = line
+        self.connectgaps = connectgaps
+        self.fill = fill
+        self.fillcolor = fillcolor
+        self.marker = marker
+        self.textfont = textfont
+        self.textposition = textposition
+        self.selected = selected
+        self.unselected = unselected
+        self.hoveron = hoveron
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.asrc = asrc
+        self.bsrc = bsrc
+        self.textsrc = textsrc
+        self.textpositionsrc = textpositionsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'scattercarpet'
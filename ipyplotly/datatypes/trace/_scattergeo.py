@@ -0,0 +1,321 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (scattergeo as v_scattergeo)
+from ipyplotly.datatypes.trace import (scattergeo as d_scattergeo)
+
+
+class Scattergeo(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scattergeo'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_scattergeo.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_scattergeo.Stream' = CompoundProperty()
+
+    # lon
+    # ---
+    lon: List = SimpleProperty()
+
+    # lat
+    # ---
+    lat: List = SimpleProperty()
+
+    # locations
+    # ---------
+    locations: List = SimpleProperty()
+
+    # locationmode
+    # ------------
+    locationmode: Any = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_scattergeo.Textfont' = CompoundProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_scattergeo.Line' = CompoundProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_scattergeo.Marker' = CompoundProperty()
+
+    # fill
+    # ----
+    fill: Any = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # selected
+    # --------
+    selected: 'd_scattergeo.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_scattergeo.Unselected' = CompoundProperty()
+
+    # geo
+    # ---
+    geo: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # lonsrc
+    # ------
+    lonsrc: str = SimpleProperty()
+
+    # latsrc
+    # ------
+    latsrc: str = SimpleProperty()
+
+    # locationssrc
+    # ------------
+    locationssrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # hovertextsrc
+    # ------------
+    hovertextsrc: str = SimpleProperty()
+
+    # textpositionsrc
+    # ---------------
+    textpositionsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_scattergeo.VisibleValidator(),
+            'showlegend': v_scattergeo.ShowlegendValidator(),
+            'legendgroup': v_scattergeo.LegendgroupValidator(),
+            'opacity': v_scattergeo.OpacityValidator(),
+            'name': v_scattergeo.NameValidator(),
+            'uid': v_scattergeo.UidValidator(),
+            'ids': v_scattergeo.IdsValidator(),
+            'customdata': v_scattergeo.CustomdataValidator(),
+            'selectedpoints': v_scattergeo.SelectedpointsValidator(),
+            'hoverinfo': v_scattergeo.HoverinfoValidator(),
+            'hoverlabel': v_scattergeo.HoverlabelValidator(),
+            'stream': v_scattergeo.StreamValidator(),
+            'lon': v_scattergeo.LonValidator(),
+            'lat': v_scattergeo.LatValidator(),
+            'locations': v_scattergeo.LocationsValidator(),
+            'locationmode': v_scattergeo.LocationmodeValidator(),
+            'mode': v_scattergeo.ModeValidator(),
+            'text': v_scattergeo.TextValidator(),
+            'hovertext': v_scattergeo.HovertextValidator(),
+            'textfont': v_scattergeo.TextfontValidator(),
+            'textposition': v_scattergeo.TextpositionValidator(),
+            'line': v_scattergeo.LineValidator(),
+            'connectgaps': v_scattergeo.ConnectgapsValidator(),
+            'marker': v_scattergeo.MarkerValidator(),
+            'fill': v_scattergeo.FillValidator(),
+            'fillcolor': v_scattergeo.FillcolorValidator(),
+            'selected': v_scattergeo.SelectedValidator(),
+            'unselected': v_scattergeo.UnselectedValidator(),
+            'geo': v_scattergeo.GeoValidator(),
+            'idssrc': v_scattergeo.IdssrcValidator(),
+            'customdatasrc': v_scattergeo.CustomdatasrcValidator(),
+            'hoverinfosrc': v_scattergeo.HoverinfosrcValidator(),
+            'lonsrc': v_scattergeo.LonsrcValidator(),
+            'latsrc': v_scattergeo.LatsrcValidator(),
+            'locationssrc': v_scattergeo.LocationssrcValidator(),
+            'textsrc': v_scattergeo.TextsrcValidator(),
+            'hovertextsrc': v_scattergeo.HovertextsrcValidator(),
+            'textpositionsrc': v_scattergeo.TextpositionsrcValidator(),
+            'transforms': v_scattergeo.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        lon=None,
+        lat=None,
+        locations=None,
+        locationmode=None,
+        mode=None,
+        text=None,
+        hovertext=None,
+        textfont=None,
+        textposition=None,
+        line=None,
+        connectgaps=None,
+        marker=None,
+        fill=None,
+        fillcolor=None,
+        selected=None,
+        unselected=None,
+        geo=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        lonsrc=None,
+        latsrc=None,
+        locationssrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('scattergeo', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.lon = lon
+        self.lat = lat
+        self.locations = locations
+        self.locationmode = locationmode
+        self.mode = mode
+        self.text = text
+        self.hovertext = hovertext
+        self.textfont = textfont
+        self.textposition = textposition
+        self.line = line
+        self.connectgaps = connectgaps
+        self.marker = marker
+        self.fill = fill
+        self.fillcolor = fillcolor
+        self.selected = selected
+        self.unselected = unselected
+        self.geo = geo
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.lonsrc = lonsrc
+        self.latsrc = latsrc
+        self.locationssrc = locationssrc
+        self.textsrc = textsrc
+        self.hovertextsrc = hovertextsrc
+        self.textpositionsrc = textpositionsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'scattergeo'
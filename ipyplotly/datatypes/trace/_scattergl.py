@@ -0,0 +1,314 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (scattergl as v_scattergl)
+from ipyplotly.datatypes.trace import (scattergl as d_scattergl)
+
+
+class Scattergl(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scattergl'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_scattergl.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_scattergl.Stream' = CompoundProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # dx
+    # --
+    dx: Number = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # dy
+    # --
+    dy: Number = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_scattergl.Line' = CompoundProperty()
+
+    # marker
+    # ------
+    marker: 'd_scattergl.Marker' = CompoundProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # fill
+    # ----
+    fill: Any = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # error_y
+    # -------
+    error_y: 'd_scattergl.ErrorY' = CompoundProperty()
+
+    # error_x
+    # -------
+    error_x: 'd_scattergl.ErrorX' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_scattergl.VisibleValidator(),
+            'showlegend': v_scattergl.ShowlegendValidator(),
+            'legendgroup': v_scattergl.LegendgroupValidator(),
+            'opacity': v_scattergl.OpacityValidator(),
+            'name': v_scattergl.NameValidator(),
+            'uid': v_scattergl.UidValidator(),
+            'ids': v_scattergl.IdsValidator(),
+            'customdata': v_scattergl.CustomdataValidator(),
+            'selectedpoints': v_scattergl.SelectedpointsValidator(),
+            'hoverinfo': v_scattergl.HoverinfoValidator(),
+            'hoverlabel': v_scattergl.HoverlabelValidator(),
+            'stream': v_scattergl.StreamValidator(),
+            'x': v_scattergl.XValidator(),
+            'x0': v_scattergl.X0Validator(),
+            'dx': v_scattergl.DxValidator(),
+            'y': v_scattergl.YValidator(),
+            'y0': v_scattergl.Y0Validator(),
+            'dy': v_scattergl.DyValidator(),
+            'text': v_scattergl.TextValidator(),
+            'mode': v_scattergl.ModeValidator(),
+            'line': v_scattergl.LineValidator(),
+            'marker': v_scattergl.MarkerValidator(),
+            'connectgaps': v_scattergl.ConnectgapsValidator(),
+            'fill': v_scattergl.FillValidator(),
+            'fillcolor': v_scattergl.FillcolorValidator(),
+            'error_y': v_scattergl.ErrorYValidator(),
+            'error_x': v_scattergl.ErrorXValidator(),
+            'xcalendar': v_scattergl.XcalendarValidator(),
+            'ycalendar': v_scattergl.YcalendarValidator(),
+            'xaxis': v_scattergl.XaxisValidator(),
+            'yaxis': v_scattergl.YaxisValidator(),
+            'idssrc': v_scattergl.IdssrcValidator(),
+            'customdatasrc': v_scattergl.CustomdatasrcValidator(),
+            'hoverinfosrc': v_scattergl.HoverinfosrcValidator(),
+            'xsrc': v_scattergl.XsrcValidator(),
+            'ysrc': v_scattergl.YsrcValidator(),
+            'textsrc': v_scattergl.TextsrcValidator(),
+            'transforms': v_scattergl.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        x=None,
+        x0=None,
+        dx=None,
+        y=None,
+        y0=None,
+        dy=None,
+        text=None,
+        mode=None,
+        line=None,
+        marker=None,
+        connectgaps=None,
+        fill=None,
+        fillcolor=None,
+        error_y=None,
+        error_x=None,
+        xcalendar=None,
+        ycalendar=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('scattergl', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.x = x
+        self.x0 = x0
+        self.dx = dx
+        self.y = y
+        self.y0 = y0
+        self.dy = dy
+        self.text = text
+        self.mode = mode
+        self.line = line
+        self.marker = marker
+        self.connectgaps = connectgaps
+        self.fill = fill
+        self.fillcolor = fillcolor
+        self.error_y = error_y
+        self.error_x = error_x
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'scattergl'
@@ -0,0 +1,293 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (scattermapbox as v_scattermapbox)
+from ipyplotly.datatypes.trace import (scattermapbox as d_scattermapbox)
+
+
+class Scattermapbox(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scattermapbox'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_scattermapbox.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_scattermapbox.Stream' = CompoundProperty()
+
+    # lon
+    # ---
+    lon: List = SimpleProperty()
+
+    # lat
+    # ---
+    lat: List = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_scattermapbox.Line' = CompoundProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_scattermapbox.Marker' = CompoundProperty()
+
+    # fill
+    # ----
+    fill: Any = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_scattermapbox.Textfont' = CompoundProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # selected
+    # --------
+    selected: 'd_scattermapbox.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_scattermapbox.Unselected' = CompoundProperty()
+
+    # subplot
+    # -------
+    subplot: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # lonsrc
+    # ------
+    lonsrc: str = SimpleProperty()
+
+    # latsrc
+    # ------
+    latsrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # hovertextsrc
+    # ------------
+    hovertextsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_scattermapbox.VisibleValidator(),
+            'showlegend': v_scattermapbox.ShowlegendValidator(),
+            'legendgroup': v_scattermapbox.LegendgroupValidator(),
+            'opacity': v_scattermapbox.OpacityValidator(),
+            'name': v_scattermapbox.NameValidator(),
+            'uid': v_scattermapbox.UidValidator(),
+            'ids': v_scattermapbox.IdsValidator(),
+            'customdata': v_scattermapbox.CustomdataValidator(),
+            'selectedpoints': v_scattermapbox.SelectedpointsValidator(),
+            'hoverinfo': v_scattermapbox.HoverinfoValidator(),
+            'hoverlabel': v_scattermapbox.HoverlabelValidator(),
+            'stream': v_scattermapbox.StreamValidator(),
+            'lon': v_scattermapbox.LonValidator(),
+            'lat': v_scattermapbox.LatValidator(),
+            'mode': v_scattermapbox.ModeValidator(),
+            'text': v_scattermapbox.TextValidator(),
+            'hovertext': v_scattermapbox.HovertextValidator(),
+            'line': v_scattermapbox.LineValidator(),
+            'connectgaps': v_scattermapbox.ConnectgapsValidator(),
+            'marker': v_scattermapbox.MarkerValidator(),
+            'fill': v_scattermapbox.FillValidator(),
+            'fillcolor': v_scattermapbox.FillcolorValidator(),
+            'textfont': v_scattermapbox.TextfontValidator(),
+            'textposition': v_scattermapbox.TextpositionValidator(),
+            'selected': v_scattermapbox.SelectedValidator(),
+            'unselected': v_scattermapbox.UnselectedValidator(),
+            'subplot': v_scattermapbox.SubplotValidator(),
+            'idssrc': v_scattermapbox.IdssrcValidator(),
+            'customdatasrc': v_scattermapbox.CustomdatasrcValidator(),
+            'hoverinfosrc': v_scattermapbox.HoverinfosrcValidator(),
+            'lonsrc': v_scattermapbox.LonsrcValidator(),
+            'latsrc': v_scattermapbox.LatsrcValidator(),
+            'textsrc': v_scattermapbox.TextsrcValidator(),
+            'hovertextsrc': v_scattermapbox.HovertextsrcValidator(),
+            'transforms': v_scattermapbox.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        lon=None,
+        lat=None,
+        mode=None,
+        text=None,
+        hovertext=None,
+        line=None,
+        connectgaps=None,
+        marker=None,
+        fill=None,
+        fillcolor=None,
+        textfont=None,
+        textposition=None,
+        selected=None,
+        unselected=None,
+        subplot=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        lonsrc=None,
+        latsrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('scattermapbox', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.lon = lon
+        self.lat = lat
+        self.mode = mode
+        self.text = text
+        self.hovertext = hovertext
+        self.line = line
+        self.connectgaps = connectgaps
+        self.marker = marker
+        self.fill = fill
+        self.fillcolor = fillcolor
+        self.textfont = textfont
+        self.textposition = textposition
+        self.selected = selected
+        self.unselected = unselected
+        self.subplot = subplot
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.lonsrc = lonsrc
+        self.latsrc = latsrc
+        self.textsrc = textsrc
+        self.hovertextsrc = hovertextsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'scattermapbox'
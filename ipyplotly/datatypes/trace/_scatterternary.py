@@ -0,0 +1,335 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (scatterternary as v_scatterternary)
+from ipyplotly.datatypes.trace import (scatterternary as d_scatterternary)
+
+
+class Scatterternary(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scatterternary'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_scatterternary.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_scatterternary.Stream' = CompoundProperty()
+
+    # a
+    # -
+    a: List = SimpleProperty()
+
+    # b
+    # -
+    b: List = SimpleProperty()
+
+    # c
+    # -
+    c: List = SimpleProperty()
+
+    # sum
+    # ---
+    sum: Number = SimpleProperty()
+
+    # mode
+    # ----
+    mode: Any = SimpleProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # hovertext
+    # ---------
+    hovertext: str = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_scatterternary.Line' = CompoundProperty()
+
+    # connectgaps
+    # -----------
+    connectgaps: bool = SimpleProperty()
+
+    # cliponaxis
+    # ----------
+    cliponaxis: bool = SimpleProperty()
+
+    # fill
+    # ----
+    fill: Any = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_scatterternary.Marker' = CompoundProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_scatterternary.Textfont' = CompoundProperty()
+
+    # textposition
+    # ------------
+    textposition: Any = SimpleProperty()
+
+    # selected
+    # --------
+    selected: 'd_scatterternary.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_scatterternary.Unselected' = CompoundProperty()
+
+    # hoveron
+    # -------
+    hoveron: Any = SimpleProperty()
+
+    # subplot
+    # -------
+    subplot: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # asrc
+    # ----
+    asrc: str = SimpleProperty()
+
+    # bsrc
+    # ----
+    bsrc: str = SimpleProperty()
+
+    # csrc
+    # ----
+    csrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # hovertextsrc
+    # ------------
+    hovertextsrc: str = SimpleProperty()
+
+    # textpositionsrc
+    # ---------------
+    textpositionsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_scatterternary.VisibleValidator(),
+            'showlegend': v_scatterternary.ShowlegendValidator(),
+            'legendgroup': v_scatterternary.LegendgroupValidator(),
+            'opacity': v_scatterternary.OpacityValidator(),
+            'name': v_scatterternary.NameValidator(),
+            'uid': v_scatterternary.UidValidator(),
+            'ids': v_scatterternary.IdsValidator(),
+            'customdata': v_scatterternary.CustomdataValidator(),
+            'selectedpoints': v_scatterternary.SelectedpointsValidator(),
+            'hoverinfo': v_scatterternary.HoverinfoValidator(),
+            'hoverlabel': v_scatterternary.HoverlabelValidator(),
+            'stream': v_scatterternary.StreamValidator(),
+            'a': v_scatterternary.AValidator(),
+            'b': v_scatterternary.BValidator(),
+            'c': v_scatterternary.CValidator(),
+            'sum': v_scatterternary.SumValidator(),
+            'mode': v_scatterternary.ModeValidator(),
+            'text': v_scatterternary.TextValidator(),
+            'hovertext': v_scatterternary.HovertextValidator(),
+            'line': v_scatterternary.LineValidator(),
+            'connectgaps': v_scatterternary.ConnectgapsValidator(),
+            'cliponaxis': v_scatterternary.CliponaxisValidator(),
+            'fill': v_scatterternary.FillValidator(),
+            'fillcolor': v_scatterternary.FillcolorValidator(),
+            'marker': v_scatterternary.MarkerValidator(),
+            'textfont': v_scatterternary.TextfontValidator(),
+            'textposition': v_scatterternary.TextpositionValidator(),
+            'selected': v_scatterternary.SelectedValidator(),
+            'unselected': v_scatterternary.UnselectedValidator(),
+            'hoveron': v_scatterternary.HoveronValidator(),
+            'subplot': v_scatterternary.SubplotValidator(),
+            'idssrc': v_scatterternary.IdssrcValidator(),
+            'customdatasrc': v_scatterternary.CustomdatasrcValidator(),
+            'hoverinfosrc': v_scatterternary.HoverinfosrcValidator(),
+            'asrc': v_scatterternary.AsrcValidator(),
+            'bsrc': v_scatterternary.BsrcValidator(),
+            'csrc': v_scatterternary.CsrcValidator(),
+            'textsrc': v_scatterternary.TextsrcValidator(),
+            'hovertextsrc': v_scatterternary.HovertextsrcValidator(),
+            'textpositionsrc': v_scatterternary.TextpositionsrcValidator(),
+            'transforms': v_scatterternary.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        a=None,
+        b=None,
+        c=None,
+        sum=None,
+        mode=None,
+        text=None,
+        hovertext=None,
+        line=None,
+        connectgaps=None,
+        cliponaxis=None,
+        fill=None,
+        fillcolor=None,
+        marker=None,
+        textfont=None,
+        textposition=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        subplot=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        asrc=None,
+        bsrc=None,
+        csrc=None,
+        textsrc=None,
+        hovertextsrc=None,
+        textpositionsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('scatterternary', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.a = a
+        self.b = b
+        self.c = c
+        self.sum = sum
+        self.mode = mode
+        self.text = text
+        self.hovertext = hovertext
+        self.line = line
+        self.connectgaps = connectgaps
+        self.cliponaxis = cliponaxis
+        self.fill = fill
+        self.fillcolor = fillcolor
+        self.marker = marker
+        self.textfont = textfont
+        self.textposition = textposition
+        self.selected = selected
+        self.unselected = unselected
+        self.hoveron = hoveron
+        self.subplot = subplot
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.asrc = asrc
+        self.bsrc = bsrc
+        self.csrc = csrc
+        self.textsrc = textsrc
+        self.hovertextsrc = hovertextsrc
+        self.textpositionsrc = textpositionsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'scatterternary'
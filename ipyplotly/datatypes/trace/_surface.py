@@ -0,0 +1,342 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (surface as v_surface)
+from ipyplotly.datatypes.trace import (surface as d_surface)
+
+
+class Surface(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.surface'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_surface.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_surface.Stream' = CompoundProperty()
+
+    # z
+    # -
+    z: List = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # text
+    # ----
+    text: List = SimpleProperty()
+
+    # surfacecolor
+    # ------------
+    surfacecolor: List = SimpleProperty()
+
+    # cauto
+    # -----
+    cauto: bool = SimpleProperty()
+
+    # cmin
+    # ----
+    cmin: Number = SimpleProperty()
+
+    # cmax
+    # ----
+    cmax: Number = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_surface.Colorbar' = CompoundProperty()
+
+    # contours
+    # --------
+    contours: 'd_surface.Contours' = CompoundProperty()
+
+    # hidesurface
+    # -----------
+    hidesurface: bool = SimpleProperty()
+
+    # lightposition
+    # -------------
+    lightposition: 'd_surface.Lightposition' = CompoundProperty()
+
+    # lighting
+    # --------
+    lighting: 'd_surface.Lighting' = CompoundProperty()
+
+    # xcalendar
+    # ---------
+    xcalendar: Any = SimpleProperty()
+
+    # ycalendar
+    # ---------
+    ycalendar: Any = SimpleProperty()
+
+    # zcalendar
+    # ---------
+    zcalendar: Any = SimpleProperty()
+
+    # scene
+    # -----
+    scene: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # zsrc
+    # ----
+    zsrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # surfacecolorsrc
+    # ---------------
+    surfacecolorsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_surface.VisibleValidator(),
+            'showlegend': v_surface.ShowlegendValidator(),
+            'legendgroup': v_surface.LegendgroupValidator(),
+            'opacity': v_surface.OpacityValidator(),
+            'name': v_surface.NameValidator(),
+            'uid': v_surface.UidValidator(),
+            'ids': v_surface.IdsValidator(),
+            'customdata': v_surface.CustomdataValidator(),
+            'selectedpoints': v_surface.SelectedpointsValidator(),
+            'hoverinfo': v_surface.HoverinfoValidator(),
+            'hoverlabel': v_surface.HoverlabelValidator(),
+            'stream': v_surface.StreamValidator(),
+            'z': v_surface.ZValidator(),
+            'x': v_surface.XValidator(),
+            'y': v_surface.YValidator(),
+            'text': v_surface.TextValidator(),
+            'surfacecolor': v_surface.SurfacecolorValidator(),
+            'cauto': v_surface.CautoValidator(),
+            'cmin': v_surface.CminValidator(),
+            'cmax': v_surface.CmaxValidator(),
+            'colorscale': v_surface.ColorscaleValidator(),
+            'autocolorscale': v_surface.AutocolorscaleValidator(),
+            'reversescale': v_surface.ReversescaleValidator(),
+            'showscale': v_surface.ShowscaleValidator(),
+            'colorbar': v_surface.ColorbarValidator(),
+            'contours': v_surface.ContoursValidator(),
+            'hidesurface': v_surface.HidesurfaceValidator(),
+            'lightposition': v_surface.LightpositionValidator(),
+            'lighting': v_surface.LightingValidator(),
+            'xcalendar': v_surface.XcalendarValidator(),
+            'ycalendar': v_surface.YcalendarValidator(),
+            'zcalendar': v_surface.ZcalendarValidator(),
+            'scene': v_surface.SceneValidator(),
+            'idssrc': v_surface.IdssrcValidator(),
+            'customdatasrc': v_surface.CustomdatasrcValidator(),
+            'hoverinfosrc': v_surface.HoverinfosrcValidator(),
+            'zsrc': v_surface.ZsrcValidator(),
+            'xsrc': v_surface.XsrcValidator(),
+            'ysrc': v_surface.YsrcValidator(),
+            'textsrc': v_surface.TextsrcValidator(),
+            'surfacecolorsrc': v_surface.SurfacecolorsrcValidator(),
+            'transforms': v_surface.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        z=None,
+        x=None,
+        y=None,
+        text=None,
+        surfacecolor=None,
+        cauto=None,
+        cmin=None,
+        cmax=None,
+        colorscale=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        contours=None,
+        hidesurface=None,
+        lightposition=None,
+        lighting=None,
+        xcalendar=None,
+        ycalendar=None,
+        zcalendar=None,
+        scene=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        zsrc=None,
+        xsrc=None,
+        ysrc=None,
+        textsrc=None,
+        surfacecolorsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('surface', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.z = z
+        self.x = x
+        self.y = y
+        self.text = text
+        self.surfacecolor = surfacecolor
+        self.cauto = cauto
+        self.cmin = cmin
+        self.cmax = cmax
+        self.colorscale = colorscale
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.contours = contours
+        self.hidesurface = hidesurface
+        self.lightposition = lightposition
+        self.lighting = lighting
+        self.xcalendar = xcalendar
+        self.ycalendar = ycalendar
+        self.zcalendar = zcalendar
+        self.scene = scene
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.zsrc = zsrc
+        self.xsrc = xsrc
+        self.ysrc = ysrc
+        self.textsrc = textsrc
+        self.surfacecolorsrc = surfacecolorsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'surface'
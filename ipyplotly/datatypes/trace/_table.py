@@ -0,0 +1,209 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (table as v_table)
+from ipyplotly.datatypes.trace import (table as d_table)
+
+
+class Table(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.table'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_table.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_table.Stream' = CompoundProperty()
+
+    # domain
+    # ------
+    domain: 'd_table.Domain' = CompoundProperty()
+
+    # columnwidth
+    # -----------
+    columnwidth: Number = SimpleProperty()
+
+    # columnorder
+    # -----------
+    columnorder: List = SimpleProperty()
+
+    # header
+    # ------
+    header: 'd_table.Header' = CompoundProperty()
+
+    # cells
+    # -----
+    cells: 'd_table.Cells' = CompoundProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # columnwidthsrc
+    # --------------
+    columnwidthsrc: str = SimpleProperty()
+
+    # columnordersrc
+    # --------------
+    columnordersrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_table.VisibleValidator(),
+            'showlegend': v_table.ShowlegendValidator(),
+            'legendgroup': v_table.LegendgroupValidator(),
+            'opacity': v_table.OpacityValidator(),
+            'name': v_table.NameValidator(),
+            'uid': v_table.UidValidator(),
+            'ids': v_table.IdsValidator(),
+            'customdata': v_table.CustomdataValidator(),
+            'selectedpoints': v_table.SelectedpointsValidator(),
+            'hoverinfo': v_table.HoverinfoValidator(),
+            'hoverlabel': v_table.HoverlabelValidator(),
+            'stream': v_table.StreamValidator(),
+            'domain': v_table.DomainValidator(),
+            'columnwidth': v_table.ColumnwidthValidator(),
+            'columnorder': v_table.ColumnorderValidator(),
+            'header': v_table.HeaderValidator(),
+            'cells': v_table.CellsValidator(),
+            'idssrc': v_table.IdssrcValidator(),
+            'customdatasrc': v_table.CustomdatasrcValidator(),
+            'hoverinfosrc': v_table.HoverinfosrcValidator(),
+            'columnwidthsrc': v_table.ColumnwidthsrcValidator(),
+            'columnordersrc': v_table.ColumnordersrcValidator(),
+            'transforms': v_table.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        domain=None,
+        columnwidth=None,
+        columnorder=None,
+        header=None,
+        cells=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        columnwidthsrc=None,
+        columnordersrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('table', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.domain = domain
+        self.columnwidth = columnwidth
+        self.columnorder = columnorder
+        self.header = header
+        self.cells = cells
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.columnwidthsrc = columnwidthsrc
+        self.columnordersrc = columnordersrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'table'
@@ -0,0 +1,356 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace import (violin as v_violin)
+from ipyplotly.datatypes.trace import (violin as d_violin)
+
+
+class Violin(BaseTraceType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.violin'
+
+    # visible
+    # -------
+    visible: Any = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # legendgroup
+    # -----------
+    legendgroup: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # uid
+    # ---
+    uid: str = SimpleProperty()
+
+    # ids
+    # ---
+    ids: List = SimpleProperty()
+
+    # customdata
+    # ----------
+    customdata: List = SimpleProperty()
+
+    # selectedpoints
+    # --------------
+    selectedpoints: Any = SimpleProperty()
+
+    # hoverinfo
+    # ---------
+    hoverinfo: Any = SimpleProperty()
+
+    # hoverlabel
+    # ----------
+    hoverlabel: 'd_violin.Hoverlabel' = CompoundProperty()
+
+    # stream
+    # ------
+    stream: 'd_violin.Stream' = CompoundProperty()
+
+    # y
+    # -
+    y: List = SimpleProperty()
+
+    # x
+    # -
+    x: List = SimpleProperty()
+
+    # x0
+    # --
+    x0: Any = SimpleProperty()
+
+    # y0
+    # --
+    y0: Any = SimpleProperty()
+
+    # orientation
+    # -----------
+    orientation: Any = SimpleProperty()
+
+    # bandwidth
+    # ---------
+    bandwidth: Number = SimpleProperty()
+
+    # scalegroup
+    # ----------
+    scalegroup: str = SimpleProperty()
+
+    # scalemode
+    # ---------
+    scalemode: Any = SimpleProperty()
+
+    # spanmode
+    # --------
+    spanmode: Any = SimpleProperty()
+
+    # span
+    # ----
+    span: List = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_violin.Line' = CompoundProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # points
+    # ------
+    points: Any = SimpleProperty()
+
+    # jitter
+    # ------
+    jitter: Number = SimpleProperty()
+
+    # pointpos
+    # --------
+    pointpos: Number = SimpleProperty()
+
+    # marker
+    # ------
+    marker: 'd_violin.Marker' = CompoundProperty()
+
+    # text
+    # ----
+    text: str = SimpleProperty()
+
+    # box
+    # ---
+    box: 'd_violin.Box' = CompoundProperty()
+
+    # meanline
+    # --------
+    meanline: 'd_violin.Meanline' = CompoundProperty()
+
+    # side
+    # ----
+    side: Any = SimpleProperty()
+
+    # selected
+    # --------
+    selected: 'd_violin.Selected' = CompoundProperty()
+
+    # unselected
+    # ----------
+    unselected: 'd_violin.Unselected' = CompoundProperty()
+
+    # hoveron
+    # -------
+    hoveron: Any = SimpleProperty()
+
+    # xaxis
+    # -----
+    xaxis: str = SimpleProperty()
+
+    # yaxis
+    # -----
+    yaxis: str = SimpleProperty()
+
+    # idssrc
+    # ------
+    idssrc: str = SimpleProperty()
+
+    # customdatasrc
+    # -------------
+    customdatasrc: str = SimpleProperty()
+
+    # hoverinfosrc
+    # ------------
+    hoverinfosrc: str = SimpleProperty()
+
+    # ysrc
+    # ----
+    ysrc: str = SimpleProperty()
+
+    # xsrc
+    # ----
+    xsrc: str = SimpleProperty()
+
+    # textsrc
+    # -------
+    textsrc: str = SimpleProperty()
+
+    # transforms
+    # ----------
+    transforms: Tuple = CompoundArrayProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> Tuple:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_violin.VisibleValidator(),
+            'showlegend': v_violin.ShowlegendValidator(),
+            'legendgroup': v_violin.LegendgroupValidator(),
+            'opacity': v_violin.OpacityValidator(),
+            'name': v_violin.NameValidator(),
+            'uid': v_violin.UidValidator(),
+            'ids': v_violin.IdsValidator(),
+            'customdata': v_violin.CustomdataValidator(),
+            'selectedpoints': v_violin.SelectedpointsValidator(),
+            'hoverinfo': v_violin.HoverinfoValidator(),
+            'hoverlabel': v_violin.HoverlabelValidator(),
+            'stream': v_violin.StreamValidator(),
+            'y': v_violin.YValidator(),
+            'x': v_violin.XValidator(),
+            'x0': v_violin.X0Validator(),
+            'y0': v_violin.Y0Validator(),
+            'orientation': v_violin.OrientationValidator(),
+            'bandwidth': v_violin.BandwidthValidator(),
+            'scalegroup': v_violin.ScalegroupValidator(),
+            'scalemode': v_violin.ScalemodeValidator(),
+            'spanmode': v_violin.SpanmodeValidator(),
+            'span': v_violin.SpanValidator(),
+            'line': v_violin.LineValidator(),
+            'fillcolor': v_violin.FillcolorValidator(),
+            'points': v_violin.PointsValidator(),
+            'jitter': v_violin.JitterValidator(),
+            'pointpos': v_violin.PointposValidator(),
+            'marker': v_violin.MarkerValidator(),
+            'text': v_violin.TextValidator(),
+            'box': v_violin.BoxValidator(),
+            'meanline': v_violin.MeanlineValidator(),
+            'side': v_violin.SideValidator(),
+            'selected': v_violin.SelectedValidator(),
+            'unselected': v_violin.UnselectedValidator(),
+            'hoveron': v_violin.HoveronValidator(),
+            'xaxis': v_violin.XaxisValidator(),
+            'yaxis': v_violin.YaxisValidator(),
+            'idssrc': v_violin.IdssrcValidator(),
+            'customdatasrc': v_violin.CustomdatasrcValidator(),
+            'hoverinfosrc': v_violin.HoverinfosrcValidator(),
+            'ysrc': v_violin.YsrcValidator(),
+            'xsrc': v_violin.XsrcValidator(),
+            'textsrc': v_violin.TextsrcValidator(),
+            'transforms': v_violin.TransformsValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        showlegend=None,
+        legendgroup=None,
+        opacity=None,
+        name=None,
+        uid=None,
+        ids=None,
+        customdata=None,
+        selectedpoints=None,
+        hoverinfo=None,
+        hoverlabel=None,
+        stream=None,
+        y=None,
+        x=None,
+        x0=None,
+        y0=None,
+        orientation=None,
+        bandwidth=None,
+        scalegroup=None,
+        scalemode=None,
+        spanmode=None,
+        span=None,
+        line=None,
+        fillcolor=None,
+        points=None,
+        jitter=None,
+        pointpos=None,
+        marker=None,
+        text=None,
+        box=None,
+        meanline=None,
+        side=None,
+        selected=None,
+        unselected=None,
+        hoveron=None,
+        xaxis=None,
+        yaxis=None,
+        idssrc=None,
+        customdatasrc=None,
+        hoverinfosrc=None,
+        ysrc=None,
+        xsrc=None,
+        textsrc=None,
+        transforms=None,
+        **kwargs
+    ):
+        super().__init__('violin', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.showlegend = showlegend
+        self.legendgroup = legendgroup
+        self.opacity = opacity
+        self.name = name
+        self.uid = uid
+        self.ids = ids
+        self.customdata = customdata
+        self.selectedpoints = selectedpoints
+        self.hoverinfo = hoverinfo
+        self.hoverlabel = hoverlabel
+        self.stream = stream
+        self.y = y
+        self.x = x
+        self.x0 = x0
+        self.y0 = y0
+        self.orientation = orientation
+        self.bandwidth = bandwidth
+        self.scalegroup = scalegroup
+        self.scalemode = scalemode
+        self.spanmode = spanmode
+        self.span = span
+        self.line = line
+        self.fillcolor = fillcolor
+        self.points = points
+        self.jitter = jitter
+        self.pointpos = pointpos
+        self.marker = marker
+        self.text = text
+        self.box = box
+        self.meanline = meanline
+        self.side = side
+        self.selected = selected
+        self.unselected = unselected
+        self.hoveron = hoveron
+        self.xaxis = xaxis
+        self.yaxis = yaxis
+        self.idssrc = idssrc
+        self.customdatasrc = customdatasrc
+        self.hoverinfosrc = hoverinfosrc
+        self.ysrc = ysrc
+        self.xsrc = xsrc
+        self.textsrc = textsrc
+        self.transforms = transforms
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'violin'
@@ -0,0 +1,20 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._marker import Marker
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._marker.Marker',
+        ]
+    )
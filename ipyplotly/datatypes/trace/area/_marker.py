@@ -0,0 +1,93 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.area import (marker as v_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.area.marker'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # symbol
+    # ------
+    symbol: Any = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # sizesrc
+    # -------
+    sizesrc: str = SimpleProperty()
+
+    # symbolsrc
+    # ---------
+    symbolsrc: str = SimpleProperty()
+
+    # opacitysrc
+    # ----------
+    opacitysrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.area'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_marker.ColorValidator(),
+            'size': v_marker.SizeValidator(),
+            'symbol': v_marker.SymbolValidator(),
+            'opacity': v_marker.OpacityValidator(),
+            'colorsrc': v_marker.ColorsrcValidator(),
+            'sizesrc': v_marker.SizesrcValidator(),
+            'symbolsrc': v_marker.SymbolsrcValidator(),
+            'opacitysrc': v_marker.OpacitysrcValidator(),
+        }
+
+    def __init__(
+        self,
+        color=None,
+        size=None,
+        symbol=None,
+        opacity=None,
+        colorsrc=None,
+        sizesrc=None,
+        symbolsrc=None,
+        opacitysrc=None,
+        **kwargs
+    ):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.size = size
+        self.symbol = symbol
+        self.opacity = opacity
+        self.colorsrc = colorsrc
+        self.sizesrc = sizesrc
+        self.symbolsrc = symbolsrc
+        self.opacitysrc = opacitysrc
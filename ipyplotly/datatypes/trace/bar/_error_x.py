@@ -0,0 +1,149 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar import (error_x as v_error_x)
+
+
+class ErrorX(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.error_x'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # symmetric
+    # ---------
+    symmetric: bool = SimpleProperty()
+
+    # array
+    # -----
+    array: List = SimpleProperty()
+
+    # arrayminus
+    # ----------
+    arrayminus: List = SimpleProperty()
+
+    # value
+    # -----
+    value: Number = SimpleProperty()
+
+    # valueminus
+    # ----------
+    valueminus: Number = SimpleProperty()
+
+    # traceref
+    # --------
+    traceref: int = SimpleProperty()
+
+    # tracerefminus
+    # -------------
+    tracerefminus: int = SimpleProperty()
+
+    # copy_ystyle
+    # -----------
+    copy_ystyle: bool = SimpleProperty()
+
+    # copy_zstyle
+    # -----------
+    copy_zstyle: bool = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # thickness
+    # ---------
+    thickness: Number = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # arraysrc
+    # --------
+    arraysrc: str = SimpleProperty()
+
+    # arrayminussrc
+    # -------------
+    arrayminussrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_error_x.VisibleValidator(),
+            'type': v_error_x.TypeValidator(),
+            'symmetric': v_error_x.SymmetricValidator(),
+            'array': v_error_x.ArrayValidator(),
+            'arrayminus': v_error_x.ArrayminusValidator(),
+            'value': v_error_x.ValueValidator(),
+            'valueminus': v_error_x.ValueminusValidator(),
+            'traceref': v_error_x.TracerefValidator(),
+            'tracerefminus': v_error_x.TracerefminusValidator(),
+            'copy_ystyle': v_error_x.CopyYstyleValidator(),
+            'copy_zstyle': v_error_x.CopyZstyleValidator(),
+            'color': v_error_x.ColorValidator(),
+            'thickness': v_error_x.ThicknessValidator(),
+            'width': v_error_x.WidthValidator(),
+            'arraysrc': v_error_x.ArraysrcValidator(),
+            'arrayminussrc': v_error_x.ArrayminussrcValidator(),
+        }
+
+    def __init__(
+        self,
+        visible=None,
+        type=None,
+        symmetric=None,
+        array=None,
+        arrayminus=None,
+        value=None,
+        valueminus=None,
+        traceref=None,
+        tracerefminus=None,
+        copy_ystyle=None,
+        copy_zstyle=None,
+        color=None,
+        thickness=None,
+        width=None,
+        arraysrc=None,
+        arrayminussrc=None,
+        **kwargs
+    ):
+        super().__init__('error_x', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.type = type
+        self.symmetric = symmetric
+        self.array = array
+        self.arrayminus = arrayminus
+        self.value = value
+        self.valueminus = valueminus
+        self.traceref = traceref
+        self.tracerefminus = tracerefminus
+        self.copy_ystyle = copy_ystyle
+        self.copy_zstyle = copy_zstyle
+        self.color = color
+        self.thickness = thickness
+        self.width = width
+        self.arraysrc = arraysrc
+        self.arrayminussrc = arrayminussrc
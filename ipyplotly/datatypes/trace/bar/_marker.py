@@ -0,0 +1,129 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar import (marker as v_marker)
+from ipyplotly.datatypes.trace.bar import (marker as d_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.marker'
+
+    # line
+    # ----
+    line: 'd_marker.Line' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # cauto
+    # -----
+    cauto: bool = SimpleProperty()
+
+    # cmax
+    # ----
+    cmax: Number = SimpleProperty()
+
+    # cmin
+    # ----
+    cmin: Number = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_marker.Colorbar' = CompoundProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # opacitysrc
+    # ----------
+    opacitysrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'line': v_marker.LineValidator(),
+            'color': v_marker.ColorValidator(),
+            'colorscale': v_marker.ColorscaleValidator(),
+            'cauto': v_marker.CautoValidator(),
+            'cmax': v_marker.CmaxValidator(),
+            'cmin': v_marker.CminValidator(),
+            'autocolorscale': v_marker.AutocolorscaleValidator(),
+            'reversescale': v_marker.ReversescaleValidator(),
+            'showscale': v_marker.ShowscaleValidator(),
+            'colorbar': v_marker.ColorbarValidator(),
+            'opacity': v_marker.OpacityValidator(),
+            'colorsrc': v_marker.ColorsrcValidator(),
+            'opacitysrc': v_marker.OpacitysrcValidator(),
+        }
+
+    def __init__(
+        self,
+        line=None,
+        color=None,
+        colorscale=None,
+        cauto=None,
+        cmax=None,
+        cmin=None,
+        autocolorscale=None,
+        reversescale=None,
+        showscale=None,
+        colorbar=None,
+        opacity=None,
+        colorsrc=None,
+        opacitysrc=None,
+        **kwargs
+    ):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.line = line
+        self.color = color
+        self.colorscale = colorscale
+        self.cauto = cauto
+        self.cmax = cmax
+        self.cmin = cmin
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.opacity = opacity
+        self.colorsrc = colorsrc
+        self.opacitysrc = opacitysrc
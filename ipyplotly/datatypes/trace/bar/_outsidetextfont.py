@@ -0,0 +1,70 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar import (outsidetextfont as v_outsidetextfont)
+
+
+class Outsidetextfont(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.outsidetextfont'
+
+    # family
+    # ------
+    family: str = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # familysrc
+    # ---------
+    familysrc: str = SimpleProperty()
+
+    # sizesrc
+    # -------
+    sizesrc: str = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'family': v_outsidetextfont.FamilyValidator(),
+            'size': v_outsidetextfont.SizeValidator(),
+            'color': v_outsidetextfont.ColorValidator(),
+            'familysrc': v_outsidetextfont.FamilysrcValidator(),
+            'sizesrc': v_outsidetextfont.SizesrcValidator(),
+            'colorsrc': v_outsidetextfont.ColorsrcValidator(),
+        }
+
+    def __init__(self, family=None, size=None, color=None, familysrc=None, sizesrc=None, colorsrc=None, **kwargs):
+        super().__init__('outsidetextfont', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.family = family
+        self.size = size
+        self.color = color
+        self.familysrc = familysrc
+        self.sizesrc = sizesrc
+        self.colorsrc = colorsrc
@@ -0,0 +1,47 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar import (selected as v_selected)
+from ipyplotly.datatypes.trace.bar import (selected as d_selected)
+
+
+class Selected(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.selected'
+
+    # marker
+    # ------
+    marker: 'd_selected.Marker' = CompoundProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_selected.Textfont' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'marker': v_selected.MarkerValidator(),
+            'textfont': v_selected.TextfontValidator(),
+        }
+
+    def __init__(self, marker=None, textfont=None, **kwargs):
+        super().__init__('selected', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.marker = marker
+        self.textfont = textfont
@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar import (stream as v_stream)
+
+
+class Stream(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.stream'
+
+    # token
+    # -----
+    token: str = SimpleProperty()
+
+    # maxpoints
+    # ---------
+    maxpoints: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'token': v_stream.TokenValidator(),
+            'maxpoints': v_stream.MaxpointsValidator(),
+        }
+
+    def __init__(self, token=None, maxpoints=None, **kwargs):
+        super().__init__('stream', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.token = token
+        self.maxpoints = maxpoints
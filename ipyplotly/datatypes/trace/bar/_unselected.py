@@ -0,0 +1,47 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar import (unselected as v_unselected)
+from ipyplotly.datatypes.trace.bar import (unselected as d_unselected)
+
+
+class Unselected(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.unselected'
+
+    # marker
+    # ------
+    marker: 'd_unselected.Marker' = CompoundProperty()
+
+    # textfont
+    # --------
+    textfont: 'd_unselected.Textfont' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'marker': v_unselected.MarkerValidator(),
+            'textfont': v_unselected.TextfontValidator(),
+        }
+
+    def __init__(self, marker=None, textfont=None, **kwargs):
+        super().__init__('unselected', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.marker = marker
+        self.textfont = textfont
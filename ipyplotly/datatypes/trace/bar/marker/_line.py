@@ -0,0 +1,107 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar.marker import (line as v_line)
+
+
+class Line(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.marker.line'
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # cauto
+    # -----
+    cauto: bool = SimpleProperty()
+
+    # cmax
+    # ----
+    cmax: Number = SimpleProperty()
+
+    # cmin
+    # ----
+    cmin: Number = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # widthsrc
+    # --------
+    widthsrc: str = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar.marker'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'width': v_line.WidthValidator(),
+            'color': v_line.ColorValidator(),
+            'colorscale': v_line.ColorscaleValidator(),
+            'cauto': v_line.CautoValidator(),
+            'cmax': v_line.CmaxValidator(),
+            'cmin': v_line.CminValidator(),
+            'autocolorscale': v_line.AutocolorscaleValidator(),
+            'reversescale': v_line.ReversescaleValidator(),
+            'widthsrc': v_line.WidthsrcValidator(),
+            'colorsrc': v_line.ColorsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        width=None,
+        color=None,
+        colorscale=None,
+        cauto=None,
+        cmax=None,
+        cmin=None,
+        autocolorscale=None,
+        reversescale=None,
+        widthsrc=None,
+        colorsrc=None,
+        **kwargs
+    ):
+        super().__init__('line', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.width = width
+        self.color = color
+        self.colorscale = colorscale
+        self.cauto = cauto
+        self.cmax = cmax
+        self.cmin = cmin
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.widthsrc = widthsrc
+        self.colorsrc = colorsrc
@@ -0,0 +1,40 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar.selected import (textfont as v_textfont)
+
+
+class Textfont(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.selected.textfont'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar.selected'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_textfont.ColorValidator(),
+        }
+
+    def __init__(self, color=None, **kwargs):
+        super().__init__('textfont', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
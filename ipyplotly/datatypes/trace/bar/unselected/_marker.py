@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.bar.unselected import (marker as v_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.bar.unselected.marker'
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.bar.unselected'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'opacity': v_marker.OpacityValidator(),
+            'color': v_marker.ColorValidator(),
+        }
+
+    def __init__(self, opacity=None, color=None, **kwargs):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.opacity = opacity
+        self.color = color
@@ -0,0 +1,32 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._marker import Marker
+    from ._line import Line
+    from ._selected import Selected
+    from ._unselected import Unselected
+    from . import unselected
+    from . import selected
+    from . import marker
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.unselected',
+            '.selected',
+            '.marker',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._marker.Marker',
+            '._line.Line',
+            '._selected.Selected',
+            '._unselected.Unselected',
+        ]
+    )
@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.box import (line as v_line)
+
+
+class Line(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.box.line'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.box'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_line.ColorValidator(),
+            'width': v_line.WidthValidator(),
+        }
+
+    def __init__(self, color=None, width=None, **kwargs):
+        super().__init__('line', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.width = width
@@ -0,0 +1,71 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.box import (marker as v_marker)
+from ipyplotly.datatypes.trace.box import (marker as d_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.box.marker'
+
+    # outliercolor
+    # ------------
+    outliercolor: str = SimpleProperty()
+
+    # symbol
+    # ------
+    symbol: Any = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_marker.Line' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.box'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'outliercolor': v_marker.OutliercolorValidator(),
+            'symbol': v_marker.SymbolValidator(),
+            'opacity': v_marker.OpacityValidator(),
+            'size': v_marker.SizeValidator(),
+            'color': v_marker.ColorValidator(),
+            'line': v_marker.LineValidator(),
+        }
+
+    def __init__(self, outliercolor=None, symbol=None, opacity=None, size=None, color=None, line=None, **kwargs):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.outliercolor = outliercolor
+        self.symbol = symbol
+        self.opacity = opacity
+        self.size = size
+        self.color = color
+        self.line = line
@@ -0,0 +1,59 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.candlestick import (decreasing as v_decreasing)
+from ipyplotly.datatypes.trace.candlestick import (decreasing as d_decreasing)
+
+
+class Decreasing(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.candlestick.decreasing'
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_decreasing.Line' = CompoundProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.candlestick'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'name': v_decreasing.NameValidator(),
+            'showlegend': v_decreasing.ShowlegendValidator(),
+            'line': v_decreasing.LineValidator(),
+            'fillcolor': v_decreasing.FillcolorValidator(),
+        }
+
+    def __init__(self, name=None, showlegend=None, line=None, fillcolor=None, **kwargs):
+        super().__init__('decreasing', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.name = name
+        self.showlegend = showlegend
+        self.line = line
+        self.fillcolor = fillcolor
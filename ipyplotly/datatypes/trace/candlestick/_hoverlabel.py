@@ -0,0 +1,87 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.candlestick import (hoverlabel as v_hoverlabel)
+from ipyplotly.datatypes.trace.candlestick import (hoverlabel as d_hoverlabel)
+
+
+class Hoverlabel(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.candlestick.hoverlabel'
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # font
+    # ----
+    font: 'd_hoverlabel.Font' = CompoundProperty()
+
+    # namelength
+    # ----------
+    namelength: int = SimpleProperty()
+
+    # bgcolorsrc
+    # ----------
+    bgcolorsrc: str = SimpleProperty()
+
+    # bordercolorsrc
+    # --------------
+    bordercolorsrc: str = SimpleProperty()
+
+    # namelengthsrc
+    # -------------
+    namelengthsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.candlestick'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'bgcolor': v_hoverlabel.BgcolorValidator(),
+            'bordercolor': v_hoverlabel.BordercolorValidator(),
+            'font': v_hoverlabel.FontValidator(),
+            'namelength': v_hoverlabel.NamelengthValidator(),
+            'bgcolorsrc': v_hoverlabel.BgcolorsrcValidator(),
+            'bordercolorsrc': v_hoverlabel.BordercolorsrcValidator(),
+            'namelengthsrc': v_hoverlabel.NamelengthsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        bgcolor=None,
+        bordercolor=None,
+        font=None,
+        namelength=None,
+        bgcolorsrc=None,
+        bordercolorsrc=None,
+        namelengthsrc=None,
+        **kwargs
+    ):
+        super().__init__('hoverlabel', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.bgcolor = bgcolor
+        self.bordercolor = bordercolor
+        self.font = font
+        self.namelength = namelength
+        self.bgcolorsrc = bgcolorsrc
+        self.bordercolorsrc = bordercolorsrc
+        self.namelengthsrc = namelengthsrc
@@ -0,0 +1,59 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.candlestick import (increasing as v_increasing)
+from ipyplotly.datatypes.trace.candlestick import (increasing as d_increasing)
+
+
+class Increasing(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.candlestick.increasing'
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_increasing.Line' = CompoundProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.candlestick'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'name': v_increasing.NameValidator(),
+            'showlegend': v_increasing.ShowlegendValidator(),
+            'line': v_increasing.LineValidator(),
+            'fillcolor': v_increasing.FillcolorValidator(),
+        }
+
+    def __init__(self, name=None, showlegend=None, line=None, fillcolor=None, **kwargs):
+        super().__init__('increasing', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.name = name
+        self.showlegend = showlegend
+        self.line = line
+        self.fillcolor = fillcolor
@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._aaxis import Aaxis
+    from ._baxis import Baxis
+    from ._font import Font
+    from . import baxis
+    from . import aaxis
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.baxis',
+            '.aaxis',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._aaxis.Aaxis',
+            '._baxis.Baxis',
+            '._font.Font',
+        ]
+    )
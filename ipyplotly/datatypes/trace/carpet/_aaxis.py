@@ -0,0 +1,416 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.carpet import (aaxis as v_aaxis)
+from ipyplotly.datatypes.trace.carpet import (aaxis as d_aaxis)
+
+
+class Aaxis(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.carpet.aaxis'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # smoothing
+    # ---------
+    smoothing: Number = SimpleProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_aaxis.Titlefont' = CompoundProperty()
+
+    # titleoffset
+    # -----------
+    titleoffset: Number = SimpleProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # autorange
+    # ---------
+    autorange: Any = SimpleProperty()
+
+    # rangemode
+    # ---------
+    rangemode: Any = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # fixedrange
+    # ----------
+    fixedrange: bool = SimpleProperty()
+
+    # cheatertype
+    # -----------
+    cheatertype: Any = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: Any = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_aaxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_aaxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # categoryorder
+    # -------------
+    categoryorder: Any = SimpleProperty()
+
+    # categoryarray
+    # -------------
+    categoryarray: List = SimpleProperty()
+
+    # labelpadding
+    # ------------
+    labelpadding: int = SimpleProperty()
+
+    # labelprefix
+    # -----------
+    labelprefix: str = SimpleProperty()
+
+    # labelsuffix
+    # -----------
+    labelsuffix: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # minorgridcount
+    # --------------
+    minorgridcount: int = SimpleProperty()
+
+    # minorgridwidth
+    # --------------
+    minorgridwidth: Number = SimpleProperty()
+
+    # minorgridcolor
+    # --------------
+    minorgridcolor: str = SimpleProperty()
+
+    # startline
+    # ---------
+    startline: bool = SimpleProperty()
+
+    # startlinecolor
+    # --------------
+    startlinecolor: str = SimpleProperty()
+
+    # startlinewidth
+    # --------------
+    startlinewidth: Number = SimpleProperty()
+
+    # endline
+    # -------
+    endline: bool = SimpleProperty()
+
+    # endlinewidth
+    # ------------
+    endlinewidth: Number = SimpleProperty()
+
+    # endlinecolor
+    # ------------
+    endlinecolor: str = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Number = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Number = SimpleProperty()
+
+    # arraytick0
+    # ----------
+    arraytick0: int = SimpleProperty()
+
+    # arraydtick
+    # ----------
+    arraydtick: int = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # categoryarraysrc
+    # ----------------
+    categoryarraysrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.carpet'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_aaxis.ColorValidator(),
+            'smoothing': v_aaxis.SmoothingValidator(),
+            'title': v_aaxis.TitleValidator(),
+            'titlefont': v_aaxis.TitlefontValidator(),
+            'titleoffset': v_aaxis.TitleoffsetValidator(),
+            'type': v_aaxis.TypeValidator(),
+            'autorange': v_aaxis.AutorangeValidator(),
+            'rangemode': v_aaxis.RangemodeValidator(),
+            'range': v_aaxis.RangeValidator(),
+            'fixedrange': v_aaxis.FixedrangeValidator(),
+            'cheatertype': v_aaxis.CheatertypeValidator(),
+            'tickmode': v_aaxis.TickmodeValidator(),
+            'nticks': v_aaxis.NticksValidator(),
+            'tickvals': v_aaxis.TickvalsValidator(),
+            'ticktext': v_aaxis.TicktextValidator(),
+            'showticklabels': v_aaxis.ShowticklabelsValidator(),
+            'tickfont': v_aaxis.TickfontValidator(),
+            'tickangle': v_aaxis.TickangleValidator(),
+            'tickprefix': v_aaxis.TickprefixValidator(),
+            'showtickprefix': v_aaxis.ShowtickprefixValidator(),
+            'ticksuffix': v_aaxis.TicksuffixValidator(),
+            'showticksuffix': v_aaxis.ShowticksuffixValidator(),
+            'showexponent': v_aaxis.ShowexponentValidator(),
+            'exponentformat': v_aaxis.ExponentformatValidator(),
+            'separatethousands': v_aaxis.SeparatethousandsValidator(),
+            'tickformat': v_aaxis.TickformatValidator(),
+            'tickformatstops': v_aaxis.TickformatstopsValidator(),
+            'categoryorder': v_aaxis.CategoryorderValidator(),
+            'categoryarray': v_aaxis.CategoryarrayValidator(),
+            'labelpadding': v_aaxis.LabelpaddingValidator(),
+            'labelprefix': v_aaxis.LabelprefixValidator(),
+            'labelsuffix': v_aaxis.LabelsuffixValidator(),
+            'showline': v_aaxis.ShowlineValidator(),
+            'linecolor': v_aaxis.LinecolorValidator(),
+            'linewidth': v_aaxis.LinewidthValidator(),
+            'gridcolor': v_aaxis.GridcolorValidator(),
+            'gridwidth': v_aaxis.GridwidthValidator(),
+            'showgrid': v_aaxis.ShowgridValidator(),
+            'minorgridcount': v_aaxis.MinorgridcountValidator(),
+            'minorgridwidth': v_aaxis.MinorgridwidthValidator(),
+            'minorgridcolor': v_aaxis.MinorgridcolorValidator(),
+            'startline': v_aaxis.StartlineValidator(),
+            'startlinecolor': v_aaxis.StartlinecolorValidator(),
+            'startlinewidth': v_aaxis.StartlinewidthValidator(),
+            'endline': v_aaxis.EndlineValidator(),
+            'endlinewidth': v_aaxis.EndlinewidthValidator(),
+            'endlinecolor': v_aaxis.EndlinecolorValidator(),
+            'tick0': v_aaxis.Tick0Validator(),
+            'dtick': v_aaxis.DtickValidator(),
+            'arraytick0': v_aaxis.Arraytick0Validator(),
+            'arraydtick': v_aaxis.ArraydtickValidator(),
+            'tickvalssrc': v_aaxis.TickvalssrcValidator(),
+            'ticktextsrc': v_aaxis.TicktextsrcValidator(),
+            'categoryarraysrc': v_aaxis.CategoryarraysrcValidator(),
+        }
+
+    def __init__(
+        self,
+        color=None,
+        smoothing=None,
+        title=None,
+        titlefont=None,
+        titleoffset=None,
+        type=None,
+        autorange=None,
+        rangemode=None,
+        range=None,
+        fixedrange=None,
+        cheatertype=None,
+        tickmode=None,
+        nticks=None,
+        tickvals=None,
+        ticktext=None,
+        showticklabels=None,
+        tickfont=None,
+        tickangle=None,
+        tickprefix=None,
+        showtickprefix=None,
+        ticksuffix=None,
+        showticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickformat=None,
+        tickformatstops=None,
+        categoryorder=None,
+        categoryarray=None,
+        labelpadding=None,
+        labelprefix=None,
+        labelsuffix=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        gridcolor=None,
+        gridwidth=None,
+        showgrid=None,
+        minorgridcount=None,
+        minorgridwidth=None,
+        minorgridcolor=None,
+        startline=None,
+        startlinecolor=None,
+        startlinewidth=None,
+        endline=None,
+        endlinewidth=None,
+        endlinecolor=None,
+        tick0=None,
+        dtick=None,
+        arraytick0=None,
+        arraydtick=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        categoryarraysrc=None,
+        **kwargs
+    ):
+        super().__init__('aaxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.smoothing = smoothing
+        self.title = title
+        self.titlefont = titlefont
+        self.titleoffset = titleoffset
+        self.type = type
+        self.autorange = autorange
+        self.rangemode = rangemode
+        self.range = range
+        self.fixedrange = fixedrange
+        self.cheatertype = cheatertype
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.showticklabels = showticklabels
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickprefix = tickprefix
+        self.showtickprefix = showtickprefix
+        self.ticksuffix = ticksuffix
+        self.showticksuffix = showticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.categoryorder = categoryorder
+        self.categoryarray = categoryarray
+        self.labelpadding = labelpadding
+        self.labelprefix = labelprefix
+        self.labelsuffix = labelsuffix
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.showgrid = showgrid
+        self.minorgridcount = minorgridcount
+        self.minorgridwidth = minorgridwidth
+        self.minorgridcolor = minorgridcolor
+        self.startline = startline
+        self.startlinecolor = startlinecolor
+        self.startlinewidth = startlinewidth
+        self.endline = endline
+        self.endlinewidth = endlinewidth
+        self.endlinecolor = endlinecolor
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.arraytick0 = arraytick0
+        self.arraydtick = arraydtick
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
+        self.categoryarraysrc = categoryarraysrc
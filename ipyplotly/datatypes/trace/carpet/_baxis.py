@@ -0,0 +1,416 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.carpet import (baxis as v_baxis)
+from ipyplotly.datatypes.trace.carpet import (baxis as d_baxis)
+
+
+class Baxis(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.carpet.baxis'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # smoothing
+    # ---------
+    smoothing: Number = SimpleProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_baxis.Titlefont' = CompoundProperty()
+
+    # titleoffset
+    # -----------
+    titleoffset: Number = SimpleProperty()
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # autorange
+    # ---------
+    autorange: Any = SimpleProperty()
+
+    # rangemode
+    # ---------
+    rangemode: Any = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # fixedrange
+    # ----------
+    fixedrange: bool = SimpleProperty()
+
+    # cheatertype
+    # -----------
+    cheatertype: Any = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: Any = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_baxis.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_baxis.Tickformatstop]' = CompoundArrayProperty()
+
+    # categoryorder
+    # -------------
+    categoryorder: Any = SimpleProperty()
+
+    # categoryarray
+    # -------------
+    categoryarray: List = SimpleProperty()
+
+    # labelpadding
+    # ------------
+    labelpadding: int = SimpleProperty()
+
+    # labelprefix
+    # -----------
+    labelprefix: str = SimpleProperty()
+
+    # labelsuffix
+    # -----------
+    labelsuffix: str = SimpleProperty()
+
+    # showline
+    # --------
+    showline: bool = SimpleProperty()
+
+    # linecolor
+    # ---------
+    linecolor: str = SimpleProperty()
+
+    # linewidth
+    # ---------
+    linewidth: Number = SimpleProperty()
+
+    # gridcolor
+    # ---------
+    gridcolor: str = SimpleProperty()
+
+    # gridwidth
+    # ---------
+    gridwidth: Number = SimpleProperty()
+
+    # showgrid
+    # --------
+    showgrid: bool = SimpleProperty()
+
+    # minorgridcount
+    # --------------
+    minorgridcount: int = SimpleProperty()
+
+    # minorgridwidth
+    # --------------
+    minorgridwidth: Number = SimpleProperty()
+
+    # minorgridcolor
+    # --------------
+    minorgridcolor: str = SimpleProperty()
+
+    # startline
+    # ---------
+    startline: bool = SimpleProperty()
+
+    # startlinecolor
+    # --------------
+    startlinecolor: str = SimpleProperty()
+
+    # startlinewidth
+    # --------------
+    startlinewidth: Number = SimpleProperty()
+
+    # endline
+    # -------
+    endline: bool = SimpleProperty()
+
+    # endlinewidth
+    # ------------
+    endlinewidth: Number = SimpleProperty()
+
+    # endlinecolor
+    # ------------
+    endlinecolor: str = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Number = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Number = SimpleProperty()
+
+    # arraytick0
+    # ----------
+    arraytick0: int = SimpleProperty()
+
+    # arraydtick
+    # ----------
+    arraydtick: int = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # categoryarraysrc
+    # ----------------
+    categoryarraysrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.carpet'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_baxis.ColorValidator(),
+            'smoothing': v_baxis.SmoothingValidator(),
+            'title': v_baxis.TitleValidator(),
+            'titlefont': v_baxis.TitlefontValidator(),
+            'titleoffset': v_baxis.TitleoffsetValidator(),
+            'type': v_baxis.TypeValidator(),
+            'autorange': v_baxis.AutorangeValidator(),
+            'rangemode': v_baxis.RangemodeValidator(),
+            'range': v_baxis.RangeValidator(),
+            'fixedrange': v_baxis.FixedrangeValidator(),
+            'cheatertype': v_baxis.CheatertypeValidator(),
+            'tickmode': v_baxis.TickmodeValidator(),
+            'nticks': v_baxis.NticksValidator(),
+            'tickvals': v_baxis.TickvalsValidator(),
+            'ticktext': v_baxis.TicktextValidator(),
+            'showticklabels': v_baxis.ShowticklabelsValidator(),
+            'tickfont': v_baxis.TickfontValidator(),
+            'tickangle': v_baxis.TickangleValidator(),
+            'tickprefix': v_baxis.TickprefixValidator(),
+            'showtickprefix': v_baxis.ShowtickprefixValidator(),
+            'ticksuffix': v_baxis.TicksuffixValidator(),
+            'showticksuffix': v_baxis.ShowticksuffixValidator(),
+            'showexponent': v_baxis.ShowexponentValidator(),
+            'exponentformat': v_baxis.ExponentformatValidator(),
+            'separatethousands': v_baxis.SeparatethousandsValidator(),
+            'tickformat': v_baxis.TickformatValidator(),
+            'tickformatstops': v_baxis.TickformatstopsValidator(),
+            'categoryorder': v_baxis.CategoryorderValidator(),
+            'categoryarray': v_baxis.CategoryarrayValidator(),
+            'labelpadding': v_baxis.LabelpaddingValidator(),
+            'labelprefix': v_baxis.LabelprefixValidator(),
+            'labelsuffix': v_baxis.LabelsuffixValidator(),
+            'showline': v_baxis.ShowlineValidator(),
+            'linecolor': v_baxis.LinecolorValidator(),
+            'linewidth': v_baxis.LinewidthValidator(),
+            'gridcolor': v_baxis.GridcolorValidator(),
+            'gridwidth': v_baxis.GridwidthValidator(),
+            'showgrid': v_baxis.ShowgridValidator(),
+            'minorgridcount': v_baxis.MinorgridcountValidator(),
+            'minorgridwidth': v_baxis.MinorgridwidthValidator(),
+            'minorgridcolor': v_baxis.MinorgridcolorValidator(),
+            'startline': v_baxis.StartlineValidator(),
+            'startlinecolor': v_baxis.StartlinecolorValidator(),
+            'startlinewidth': v_baxis.StartlinewidthValidator(),
+            'endline': v_baxis.EndlineValidator(),
+            'endlinewidth': v_baxis.EndlinewidthValidator(),
+            'endlinecolor': v_baxis.EndlinecolorValidator(),
+            'tick0': v_baxis.Tick0Validator(),
+            'dtick': v_baxis.DtickValidator(),
+            'arraytick0': v_baxis.Arraytick0Validator(),
+            'arraydtick': v_baxis.ArraydtickValidator(),
+            'tickvalssrc': v_baxis.TickvalssrcValidator(),
+            'ticktextsrc': v_baxis.TicktextsrcValidator(),
+            'categoryarraysrc': v_baxis.CategoryarraysrcValidator(),
+        }
+
+    def __init__(
+        self,
+        color=None,
+        smoothing=None,
+        title=None,
+        titlefont=None,
+        titleoffset=None,
+        type=None,
+        autorange=None,
+        rangemode=None,
+        range=None,
+        fixedrange=None,
+        cheatertype=None,
+        tickmode=None,
+        nticks=None,
+        tickvals=None,
+        ticktext=None,
+        showticklabels=None,
+        tickfont=None,
+        tickangle=None,
+        tickprefix=None,
+        showtickprefix=None,
+        ticksuffix=None,
+        showticksuffix=None,
+        showexponent=None,
+        exponentformat=None,
+        separatethousands=None,
+        tickformat=None,
+        tickformatstops=None,
+        categoryorder=None,
+        categoryarray=None,
+        labelpadding=None,
+        labelprefix=None,
+        labelsuffix=None,
+        showline=None,
+        linecolor=None,
+        linewidth=None,
+        gridcolor=None,
+        gridwidth=None,
+        showgrid=None,
+        minorgridcount=None,
+        minorgridwidth=None,
+        minorgridcolor=None,
+        startline=None,
+        startlinecolor=None,
+        startlinewidth=None,
+        endline=None,
+        endlinewidth=None,
+        endlinecolor=None,
+        tick0=None,
+        dtick=None,
+        arraytick0=None,
+        arraydtick=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        categoryarraysrc=None,
+        **kwargs
+    ):
+        super().__init__('baxis', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.smoothing = smoothing
+        self.title = title
+        self.titlefont = titlefont
+        self.titleoffset = titleoffset
+        self.type = type
+        self.autorange = autorange
+        self.rangemode = rangemode
+        self.range = range
+        self.fixedrange = fixedrange
+        self.cheatertype = cheatertype
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.showticklabels = showticklabels
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickprefix = tickprefix
+        self.showtickprefix = showtickprefix
+        self.ticksuffix = ticksuffix
+        self.showticksuffix = showticksuffix
+        self.showexponent = showexponent
+        self.exponentformat = exponentformat
+        self.separatethousands = separatethousands
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.categoryorder = categoryorder
+        self.categoryarray = categoryarray
+        self.labelpadding = labelpadding
+        self.labelprefix = labelprefix
+        self.labelsuffix = labelsuffix
+        self.showline = showline
+        self.linecolor = linecolor
+        self.linewidth = linewidth
+        self.gridcolor = gridcolor
+        self.gridwidth = gridwidth
+        self.showgrid = showgrid
+        self.minorgridcount = minorgridcount
+        self.minorgridwidth = minorgridwidth
+        self.minorgridcolor = minorgridcolor
+        self.startline = startline
+        self.startlinecolor = startlinecolor
+        self.startlinewidth = startlinewidth
+        self.endline = endline
+        self.endlinewidth = endlinewidth
+        self.endlinecolor = endlinecolor
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.arraytick0 = arraytick0
+        self.arraydtick = arraydtick
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
+        self.categoryarraysrc = categoryarraysrc
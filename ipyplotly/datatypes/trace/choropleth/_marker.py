@@ -0,0 +1,53 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.choropleth import (marker as v_marker)
+from ipyplotly.datatypes.trace.choropleth import (marker as d_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.choropleth.marker'
+
+    # line
+    # ----
+    line: 'd_marker.Line' = CompoundProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # opacitysrc
+    # ----------
+    opacitysrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.choropleth'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'line': v_marker.LineValidator(),
+            'opacity': v_marker.OpacityValidator(),
+            'opacitysrc': v_marker.OpacitysrcValidator(),
+        }
+
+    def __init__(self, line=None, opacity=None, opacitysrc=None, **kwargs):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.line = line
+        self.opacity = opacity
+        self.opacitysrc = opacitysrc
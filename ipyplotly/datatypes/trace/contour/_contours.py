@@ -0,0 +1,94 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.contour import (contours as v_contours)
+from ipyplotly.datatypes.trace.contour import (contours as d_contours)
+
+
+class Contours(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.contour.contours'
+
+    # start
+    # -----
+    start: Number = SimpleProperty()
+
+    # end
+    # ---
+    end: Number = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # coloring
+    # --------
+    coloring: Any = SimpleProperty()
+
+    # showlines
+    # ---------
+    showlines: bool = SimpleProperty()
+
+    # showlabels
+    # ----------
+    showlabels: bool = SimpleProperty()
+
+    # labelfont
+    # ---------
+    labelfont: 'd_contours.Labelfont' = CompoundProperty()
+
+    # labelformat
+    # -----------
+    labelformat: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.contour'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'start': v_contours.StartValidator(),
+            'end': v_contours.EndValidator(),
+            'size': v_contours.SizeValidator(),
+            'coloring': v_contours.ColoringValidator(),
+            'showlines': v_contours.ShowlinesValidator(),
+            'showlabels': v_contours.ShowlabelsValidator(),
+            'labelfont': v_contours.LabelfontValidator(),
+            'labelformat': v_contours.LabelformatValidator(),
+        }
+
+    def __init__(
+        self,
+        start=None,
+        end=None,
+        size=None,
+        coloring=None,
+        showlines=None,
+        showlabels=None,
+        labelfont=None,
+        labelformat=None,
+        **kwargs
+    ):
+        super().__init__('contours', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.start = start
+        self.end = end
+        self.size = size
+        self.coloring = coloring
+        self.showlines = showlines
+        self.showlabels = showlabels
+        self.labelfont = labelfont
+        self.labelformat = labelformat
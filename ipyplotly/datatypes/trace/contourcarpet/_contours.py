@@ -0,0 +1,115 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.contourcarpet import (contours as v_contours)
+from ipyplotly.datatypes.trace.contourcarpet import (contours as d_contours)
+
+
+class Contours(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.contourcarpet.contours'
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # start
+    # -----
+    start: Number = SimpleProperty()
+
+    # end
+    # ---
+    end: Number = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # coloring
+    # --------
+    coloring: Any = SimpleProperty()
+
+    # showlines
+    # ---------
+    showlines: bool = SimpleProperty()
+
+    # showlabels
+    # ----------
+    showlabels: bool = SimpleProperty()
+
+    # labelfont
+    # ---------
+    labelfont: 'd_contours.Labelfont' = CompoundProperty()
+
+    # labelformat
+    # -----------
+    labelformat: str = SimpleProperty()
+
+    # operation
+    # ---------
+    operation: Any = SimpleProperty()
+
+    # value
+    # -----
+    value: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.contourcarpet'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'type': v_contours.TypeValidator(),
+            'start': v_contours.StartValidator(),
+            'end': v_contours.EndValidator(),
+            'size': v_contours.SizeValidator(),
+            'coloring': v_contours.ColoringValidator(),
+            'showlines': v_contours.ShowlinesValidator(),
+            'showlabels': v_contours.ShowlabelsValidator(),
+            'labelfont': v_contours.LabelfontValidator(),
+            'labelformat': v_contours.LabelformatValidator(),
+            'operation': v_contours.OperationValidator(),
+            'value': v_contours.ValueValidator(),
+        }
+
+    def __init__(
+        self,
+        type=None,
+        start=None,
+        end=None,
+        size=None,
+        coloring=None,
+        showlines=None,
+        showlabels=None,
+        labelfont=None,
+        labelformat=None,
+        operation=None,
+        value=None,
+        **kwargs
+    ):
+        super().__init__('contours', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.type = type
+        self.start = start
+        self.end = end
+        self.size = size
+        self.coloring = coloring
+        self.showlines = showlines
+        self.showlabels = showlabels
+        self.labelfont = labelfont
+        self.labelformat = labelformat
+        self.operation = operation
+        self.value = value
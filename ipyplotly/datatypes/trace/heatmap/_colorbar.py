@@ -0,0 +1,332 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.heatmap import (colorbar as v_colorbar)
+from ipyplotly.datatypes.trace.heatmap import (colorbar as d_colorbar)
+
+
+class Colorbar(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.heatmap.colorbar'
+
+    # thicknessmode
+    # -------------
+    thicknessmode: Any = SimpleProperty()
+
+    # thickness
+    # ---------
+    thickness: Number = SimpleProperty()
+
+    # lenmode
+    # -------
+    lenmode: Any = SimpleProperty()
+
+    # len
+    # ---
+    len: Number = SimpleProperty()
+
+    # x
+    # -
+    x: Number = SimpleProperty()
+
+    # xanchor
+    # -------
+    xanchor: Any = SimpleProperty()
+
+    # xpad
+    # ----
+    xpad: Number = SimpleProperty()
+
+    # y
+    # -
+    y: Number = SimpleProperty()
+
+    # yanchor
+    # -------
+    yanchor: Any = SimpleProperty()
+
+    # ypad
+    # ----
+    ypad: Number = SimpleProperty()
+
+    # outlinecolor
+    # ------------
+    outlinecolor: str = SimpleProperty()
+
+    # outlinewidth
+    # ------------
+    outlinewidth: Number = SimpleProperty()
+
+    # bordercolor
+    # -----------
+    bordercolor: str = SimpleProperty()
+
+    # borderwidth
+    # -----------
+    borderwidth: Number = SimpleProperty()
+
+    # bgcolor
+    # -------
+    bgcolor: str = SimpleProperty()
+
+    # tickmode
+    # --------
+    tickmode: Any = SimpleProperty()
+
+    # nticks
+    # ------
+    nticks: int = SimpleProperty()
+
+    # tick0
+    # -----
+    tick0: Any = SimpleProperty()
+
+    # dtick
+    # -----
+    dtick: Any = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # ticks
+    # -----
+    ticks: Any = SimpleProperty()
+
+    # ticklen
+    # -------
+    ticklen: Number = SimpleProperty()
+
+    # tickwidth
+    # ---------
+    tickwidth: Number = SimpleProperty()
+
+    # tickcolor
+    # ---------
+    tickcolor: str = SimpleProperty()
+
+    # showticklabels
+    # --------------
+    showticklabels: bool = SimpleProperty()
+
+    # tickfont
+    # --------
+    tickfont: 'd_colorbar.Tickfont' = CompoundProperty()
+
+    # tickangle
+    # ---------
+    tickangle: Number = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # tickformatstops
+    # ---------------
+    tickformatstops: 'Tuple[d_colorbar.Tickformatstop]' = CompoundArrayProperty()
+
+    # tickprefix
+    # ----------
+    tickprefix: str = SimpleProperty()
+
+    # showtickprefix
+    # --------------
+    showtickprefix: Any = SimpleProperty()
+
+    # ticksuffix
+    # ----------
+    ticksuffix: str = SimpleProperty()
+
+    # showticksuffix
+    # --------------
+    showticksuffix: Any = SimpleProperty()
+
+    # separatethousands
+    # -----------------
+    separatethousands: bool = SimpleProperty()
+
+    # exponentformat
+    # --------------
+    exponentformat: Any = SimpleProperty()
+
+    # showexponent
+    # ------------
+    showexponent: Any = SimpleProperty()
+
+    # title
+    # -----
+    title: str = SimpleProperty()
+
+    # titlefont
+    # ---------
+    titlefont: 'd_colorbar.Titlefont' = CompoundProperty()
+
+    # titleside
+    # ---------
+    titleside: Any = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.heatmap'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'thicknessmode': v_colorbar.ThicknessmodeValidator(),
+            'thickness': v_colorbar.ThicknessValidator(),
+            'lenmode': v_colorbar.LenmodeValidator(),
+            'len': v_colorbar.LenValidator(),
+            'x': v_colorbar.XValidator(),
+            'xanchor': v_colorbar.XanchorValidator(),
+            'xpad': v_colorbar.XpadValidator(),
+            'y': v_colorbar.YValidator(),
+            'yanchor': v_colorbar.YanchorValidator(),
+            'ypad': v_colorbar.YpadValidator(),
+            'outlinecolor': v_colorbar.OutlinecolorValidator(),
+            'outlinewidth': v_colorbar.OutlinewidthValidator(),
+            'bordercolor': v_colorbar.BordercolorValidator(),
+            'borderwidth': v_colorbar.BorderwidthValidator(),
+            'bgcolor': v_colorbar.BgcolorValidator(),
+            'tickmode': v_colorbar.TickmodeValidator(),
+            'nticks': v_colorbar.NticksValidator(),
+            'tick0': v_colorbar.Tick0Validator(),
+            'dtick': v_colorbar.DtickValidator(),
+            'tickvals': v_colorbar.TickvalsValidator(),
+            'ticktext': v_colorbar.TicktextValidator(),
+            'ticks': v_colorbar.TicksValidator(),
+            'ticklen': v_colorbar.TicklenValidator(),
+            'tickwidth': v_colorbar.TickwidthValidator(),
+            'tickcolor': v_colorbar.TickcolorValidator(),
+            'showticklabels': v_colorbar.ShowticklabelsValidator(),
+            'tickfont': v_colorbar.TickfontValidator(),
+            'tickangle': v_colorbar.TickangleValidator(),
+            'tickformat': v_colorbar.TickformatValidator(),
+            'tickformatstops': v_colorbar.TickformatstopsValidator(),
+            'tickprefix': v_colorbar.TickprefixValidator(),
+            'showtickprefix': v_colorbar.ShowtickprefixValidator(),
+            'ticksuffix': v_colorbar.TicksuffixValidator(),
+            'showticksuffix': v_colorbar.ShowticksuffixValidator(),
+            'separatethousands': v_colorbar.SeparatethousandsValidator(),
+            'exponentformat': v_colorbar.ExponentformatValidator(),
+            'showexponent': v_colorbar.ShowexponentValidator(),
+            'title': v_colorbar.TitleValidator(),
+            'titlefont': v_colorbar.TitlefontValidator(),
+            'titleside': v_colorbar.TitlesideValidator(),
+            'tickvalssrc': v_colorbar.TickvalssrcValidator(),
+            'ticktextsrc': v_colorbar.TicktextsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        thicknessmode=None,
+        thickness=None,
+        lenmode=None,
+        len=None,
+        x=None,
+        xanchor=None,
+        xpad=None,
+        y=None,
+        yanchor=None,
+        ypad=None,
+        outlinecolor=None,
+        outlinewidth=None,
+        bordercolor=None,
+        borderwidth=None,
+        bgcolor=None,
+        tickmode=None,
+        nticks=None,
+        tick0=None,
+        dtick=None,
+        tickvals=None,
+        ticktext=None,
+        ticks=None,
+        ticklen=None,
+        tickwidth=None,
+        tickcolor=None,
+        showticklabels=None,
+        tickfont=None,
+        tickangle=None,
+        tickformat=None,
+        tickformatstops=None,
+        tickprefix=None,
+        showtickprefix=None,
+        ticksuffix=None,
+        showticksuffix=None,
+        separatethousands=None,
+        exponentformat=None,
+        showexponent=None,
+        title=None,
+        titlefont=None,
+        titleside=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        **kwargs
+    ):
+        super().__init__('colorbar', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.thicknessmode = thicknessmode
+        self.thickness = thickness
+        self.lenmode = lenmode
+        self.len = len
+        self.x = x
+        self.xanchor = xanchor
+        self.xpad = xpad
+        self.y = y
+        self.yanchor = yanchor
+        self.ypad = ypad
+        self.outlinecolor = outlinecolor
+        self.outlinewidth = outlinewidth
+        self.bordercolor = bordercolor
+        self.borderwidth = borderwidth
+        self.bgcolor = bgcolor
+        self.tickmode = tickmode
+        self.nticks = nticks
+        self.tick0 = tick0
+        self.dtick = dtick
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.ticks = ticks
+        self.ticklen = ticklen
+        self.tickwidth = tickwidth
+        self.tickcolor = tickcolor
+        self.showticklabels = showticklabels
+        self.tickfont = tickfont
+        self.tickangle = tickangle
+        self.tickformat = tickformat
+        self.tickformatstops = tickformatstops
+        self.tickprefix = tickprefix
+        self.showtickprefix = showtickprefix
+        self.ticksuffix = ticksuffix
+        self.showticksuffix = showticksuffix
+        self.separatethousands = separatethousands
+        self.exponentformat = exponentformat
+        self.showexponent = showexponent
+        self.title = title
+        self.titlefont = titlefont
+        self.titleside = titleside
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
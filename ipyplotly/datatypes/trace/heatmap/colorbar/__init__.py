@@ -0,0 +1,17 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._tickfont import Tickfont
+    from ._tickformatstop import Tickformatstop
+    from ._titlefont import Titlefont
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._tickfont.Tickfont',
+            '._tickformatstop.Tickformatstop',
+            '._titlefont.Titlefont',
+        ]
+    )
@@ -0,0 +1,40 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._cumulative import Cumulative
+    from ._xbins import Xbins
+    from ._ybins import Ybins
+    from ._marker import Marker
+    from ._selected import Selected
+    from ._unselected import Unselected
+    from ._error_y import ErrorY
+    from ._error_x import ErrorX
+    from . import unselected
+    from . import selected
+    from . import marker
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.unselected',
+            '.selected',
+            '.marker',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._cumulative.Cumulative',
+            '._xbins.Xbins',
+            '._ybins.Ybins',
+            '._marker.Marker',
+            '._selected.Selected',
+            '._unselected.Unselected',
+            '._error_y.ErrorY',
+            '._error_x.ErrorX',
+        ]
+    )
@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.histogram import (cumulative as v_cumulative)
+
+
+class Cumulative(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.histogram.cumulative'
+
+    # enabled
+    # -------
+    enabled: bool = SimpleProperty()
+
+    # direction
+    # ---------
+    direction: Any = SimpleProperty()
+
+    # currentbin
+    # ----------
+    currentbin: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.histogram'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'enabled': v_cumulative.EnabledValidator(),
+            'direction': v_cumulative.DirectionValidator(),
+            'currentbin': v_cumulative.CurrentbinValidator(),
+        }
+
+    def __init__(self, enabled=None, direction=None, currentbin=None, **kwargs):
+        super().__init__('cumulative', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.enabled = enabled
+        self.direction = direction
+        self.currentbin = currentbin
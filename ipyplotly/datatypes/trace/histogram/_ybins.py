@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.histogram import (ybins as v_ybins)
+
+
+class Ybins(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.histogram.ybins'
+
+    # start
+    # -----
+    start: Any = SimpleProperty()
+
+    # end
+    # ---
+    end: Any = SimpleProperty()
+
+    # size
+    # ----
+    size: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.histogram'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'start': v_ybins.StartValidator(),
+            'end': v_ybins.EndValidator(),
+            'size': v_ybins.SizeValidator(),
+        }
+
+    def __init__(self, start=None, end=None, size=None, **kwargs):
+        super().__init__('ybins', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.start = start
+        self.end = end
+        self.size = size
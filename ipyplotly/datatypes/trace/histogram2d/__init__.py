@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._marker import Marker
+    from ._xbins import Xbins
+    from ._ybins import Ybins
+    from ._colorbar import Colorbar
+    from . import colorbar
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._marker.Marker',
+            '._xbins.Xbins',
+            '._ybins.Ybins',
+            '._colorbar.Colorbar',
+        ]
+    )
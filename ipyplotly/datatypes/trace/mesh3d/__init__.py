@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._contour import Contour
+    from ._colorbar import Colorbar
+    from ._lightposition import Lightposition
+    from ._lighting import Lighting
+    from . import colorbar
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._contour.Contour',
+            '._colorbar.Colorbar',
+            '._lightposition.Lightposition',
+            '._lighting.Lighting',
+        ]
+    )
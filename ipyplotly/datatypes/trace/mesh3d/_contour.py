@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.mesh3d import (contour as v_contour)
+
+
+class Contour(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.mesh3d.contour'
+
+    # show
+    # ----
+    show: bool = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.mesh3d'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'show': v_contour.ShowValidator(),
+            'color': v_contour.ColorValidator(),
+            'width': v_contour.WidthValidator(),
+        }
+
+    def __init__(self, show=None, color=None, width=None, **kwargs):
+        super().__init__('contour', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.show = show
+        self.color = color
+        self.width = width
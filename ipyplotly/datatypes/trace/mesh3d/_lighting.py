@@ -0,0 +1,86 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.mesh3d import (lighting as v_lighting)
+
+
+class Lighting(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.mesh3d.lighting'
+
+    # vertexnormalsepsilon
+    # --------------------
+    vertexnormalsepsilon: Number = SimpleProperty()
+
+    # facenormalsepsilon
+    # ------------------
+    facenormalsepsilon: Number = SimpleProperty()
+
+    # ambient
+    # -------
+    ambient: Number = SimpleProperty()
+
+    # diffuse
+    # -------
+    diffuse: Number = SimpleProperty()
+
+    # specular
+    # --------
+    specular: Number = SimpleProperty()
+
+    # roughness
+    # ---------
+    roughness: Number = SimpleProperty()
+
+    # fresnel
+    # -------
+    fresnel: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.mesh3d'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'vertexnormalsepsilon': v_lighting.VertexnormalsepsilonValidator(),
+            'facenormalsepsilon': v_lighting.FacenormalsepsilonValidator(),
+            'ambient': v_lighting.AmbientValidator(),
+            'diffuse': v_lighting.DiffuseValidator(),
+            'specular': v_lighting.SpecularValidator(),
+            'roughness': v_lighting.RoughnessValidator(),
+            'fresnel': v_lighting.FresnelValidator(),
+        }
+
+    def __init__(
+        self,
+        vertexnormalsepsilon=None,
+        facenormalsepsilon=None,
+        ambient=None,
+        diffuse=None,
+        specular=None,
+        roughness=None,
+        fresnel=None,
+        **kwargs
+    ):
+        super().__init__('lighting', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.vertexnormalsepsilon = vertexnormalsepsilon
+        self.facenormalsepsilon = facenormalsepsilon
+        self.ambient = ambient
+        self.diffuse = diffuse
+        self.specular = specular
+        self.roughness = roughness
+        self.fresnel = fresnel
@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._line import Line
+    from ._increasing import Increasing
+    from ._decreasing import Decreasing
+    from . import decreasing
+    from . import increasing
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.decreasing',
+            '.increasing',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._line.Line',
+            '._increasing.Increasing',
+            '._decreasing.Decreasing',
+        ]
+    )
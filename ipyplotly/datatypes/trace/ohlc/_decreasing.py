@@ -0,0 +1,53 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.ohlc import (decreasing as v_decreasing)
+from ipyplotly.datatypes.trace.ohlc import (decreasing as d_decreasing)
+
+
+class Decreasing(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.ohlc.decreasing'
+
+    # name
+    # ----
+    name: str = SimpleProperty()
+
+    # showlegend
+    # ----------
+    showlegend: bool = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_decreasing.Line' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.ohlc'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'name': v_decreasing.NameValidator(),
+            'showlegend': v_decreasing.ShowlegendValidator(),
+            'line': v_decreasing.LineValidator(),
+        }
+
+    def __init__(self, name=None, showlegend=None, line=None, **kwargs):
+        super().__init__('decreasing', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.name = name
+        self.showlegend = showlegend
+        self.line = line
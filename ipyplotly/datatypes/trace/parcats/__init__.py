@@ -0,0 +1,26 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._domain import Domain
+    from ._dimension import Dimension
+    from ._marker import Marker
+    from . import marker
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.marker',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._domain.Domain',
+            '._dimension.Dimension',
+            '._marker.Marker',
+        ]
+    )
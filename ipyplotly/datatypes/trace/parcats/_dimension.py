@@ -0,0 +1,114 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.parcats import (dimension as v_dimension)
+
+
+class Dimension(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.parcats.dimension'
+
+    # label
+    # -----
+    label: str = SimpleProperty()
+
+    # catDisplayInds
+    # --------------
+    catDisplayInds: List = SimpleProperty()
+
+    # catValues
+    # ---------
+    catValues: List = SimpleProperty()
+
+    # catLabels
+    # ---------
+    catLabels: List = SimpleProperty()
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # values
+    # ------
+    values: List = SimpleProperty()
+
+    # displayInd
+    # ----------
+    displayInd: int = SimpleProperty()
+
+    # catDisplayIndssrc
+    # -----------------
+    catDisplayIndssrc: str = SimpleProperty()
+
+    # catValuessrc
+    # ------------
+    catValuessrc: str = SimpleProperty()
+
+    # catLabelssrc
+    # ------------
+    catLabelssrc: str = SimpleProperty()
+
+    # valuessrc
+    # ---------
+    valuessrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.parcats'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'label': v_dimension.LabelValidator(),
+            'catDisplayInds': v_dimension.CatdisplayindsValidator(),
+            'catValues': v_dimension.CatvaluesValidator(),
+            'catLabels': v_dimension.CatlabelsValidator(),
+            'visible': v_dimension.VisibleValidator(),
+            'values': v_dimension.ValuesValidator(),
+            'displayInd': v_dimension.DisplayindValidator(),
+            'catDisplayIndssrc': v_dimension.CatdisplayindssrcValidator(),
+            'catValuessrc': v_dimension.CatvaluessrcValidator(),
+            'catLabelssrc': v_dimension.CatlabelssrcValidator(),
+            'valuessrc': v_dimension.ValuessrcValidator(),
+        }
+
+    def __init__(
+        self,
+        label=None,
+        catDisplayInds=None,
+        catValues=None,
+        catLabels=None,
+        visible=None,
+        values=None,
+        displayInd=None,
+        catDisplayIndssrc=None,
+        catValuessrc=None,
+        catLabelssrc=None,
+        valuessrc=None,
+        **kwargs
+    ):
+        super().__init__('dimensions', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.label = label
+        self.catDisplayInds = catDisplayInds
+        self.catValues = catValues
+        self.catLabels = catLabels
+        self.visible = visible
+        self.values = values
+        self.displayInd = displayInd
+        self.catDisplayIndssrc = catDisplayIndssrc
+        self.catValuessrc = catValuessrc
+        self.catLabelssrc = catLabelssrc
+        self.valuessrc = valuessrc
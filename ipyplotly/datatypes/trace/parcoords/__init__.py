@@ -0,0 +1,32 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._domain import Domain
+    from ._labelfont import Labelfont
+    from ._tickfont import Tickfont
+    from ._rangefont import Rangefont
+    from ._dimension import Dimension
+    from ._line import Line
+    from . import line
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._domain.Domain',
+            '._labelfont.Labelfont',
+            '._tickfont.Tickfont',
+            '._rangefont.Rangefont',
+            '._dimension.Dimension',
+            '._line.Line',
+        ]
+    )
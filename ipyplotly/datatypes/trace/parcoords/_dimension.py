@@ -0,0 +1,114 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.parcoords import (dimension as v_dimension)
+
+
+class Dimension(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.parcoords.dimension'
+
+    # label
+    # -----
+    label: str = SimpleProperty()
+
+    # tickvals
+    # --------
+    tickvals: List = SimpleProperty()
+
+    # ticktext
+    # --------
+    ticktext: List = SimpleProperty()
+
+    # tickformat
+    # ----------
+    tickformat: str = SimpleProperty()
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # range
+    # -----
+    range: List = SimpleProperty()
+
+    # constraintrange
+    # ---------------
+    constraintrange: List = SimpleProperty()
+
+    # values
+    # ------
+    values: List = SimpleProperty()
+
+    # tickvalssrc
+    # -----------
+    tickvalssrc: str = SimpleProperty()
+
+    # ticktextsrc
+    # -----------
+    ticktextsrc: str = SimpleProperty()
+
+    # valuessrc
+    # ---------
+    valuessrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.parcoords'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'label': v_dimension.LabelValidator(),
+            'tickvals': v_dimension.TickvalsValidator(),
+            'ticktext': v_dimension.TicktextValidator(),
+            'tickformat': v_dimension.TickformatValidator(),
+            'visible': v_dimension.VisibleValidator(),
+            'range': v_dimension.RangeValidator(),
+            'constraintrange': v_dimension.ConstraintrangeValidator(),
+            'values': v_dimension.ValuesValidator(),
+            'tickvalssrc': v_dimension.TickvalssrcValidator(),
+            'ticktextsrc': v_dimension.TicktextsrcValidator(),
+            'valuessrc': v_dimension.ValuessrcValidator(),
+        }
+
+    def __init__(
+        self,
+        label=None,
+        tickvals=None,
+        ticktext=None,
+        tickformat=None,
+        visible=None,
+        range=None,
+        constraintrange=None,
+        values=None,
+        tickvalssrc=None,
+        ticktextsrc=None,
+        valuessrc=None,
+        **kwargs
+    ):
+        super().__init__('dimensions', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.label = label
+        self.tickvals = tickvals
+        self.ticktext = ticktext
+        self.tickformat = tickformat
+        self.visible = visible
+        self.range = range
+        self.constraintrange = constraintrange
+        self.values = values
+        self.tickvalssrc = tickvalssrc
+        self.ticktextsrc = ticktextsrc
+        self.valuessrc = valuessrc
@@ -0,0 +1,30 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._marker import Marker
+    from ._textfont import Textfont
+    from ._insidetextfont import Insidetextfont
+    from ._outsidetextfont import Outsidetextfont
+    from ._domain import Domain
+    from . import marker
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.marker',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._marker.Marker',
+            '._textfont.Textfont',
+            '._insidetextfont.Insidetextfont',
+            '._outsidetextfont.Outsidetextfont',
+            '._domain.Domain',
+        ]
+    )
@@ -0,0 +1,53 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.pie import (marker as v_marker)
+from ipyplotly.datatypes.trace.pie import (marker as d_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.pie.marker'
+
+    # colors
+    # ------
+    colors: List = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_marker.Line' = CompoundProperty()
+
+    # colorssrc
+    # ---------
+    colorssrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.pie'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'colors': v_marker.ColorsValidator(),
+            'line': v_marker.LineValidator(),
+            'colorssrc': v_marker.ColorssrcValidator(),
+        }
+
+    def __init__(self, colors=None, line=None, colorssrc=None, **kwargs):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.colors = colors
+        self.line = line
+        self.colorssrc = colorssrc
@@ -0,0 +1,71 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.pointcloud import (marker as v_marker)
+from ipyplotly.datatypes.trace.pointcloud import (marker as d_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.pointcloud.marker'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # blend
+    # -----
+    blend: bool = SimpleProperty()
+
+    # sizemin
+    # -------
+    sizemin: Number = SimpleProperty()
+
+    # sizemax
+    # -------
+    sizemax: Number = SimpleProperty()
+
+    # border
+    # ------
+    border: 'd_marker.Border' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.pointcloud'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_marker.ColorValidator(),
+            'opacity': v_marker.OpacityValidator(),
+            'blend': v_marker.BlendValidator(),
+            'sizemin': v_marker.SizeminValidator(),
+            'sizemax': v_marker.SizemaxValidator(),
+            'border': v_marker.BorderValidator(),
+        }
+
+    def __init__(self, color=None, opacity=None, blend=None, sizemin=None, sizemax=None, border=None, **kwargs):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.opacity = opacity
+        self.blend = blend
+        self.sizemin = sizemin
+        self.sizemax = sizemax
+        self.border = border
@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.pointcloud.marker import (border as v_border)
+
+
+class Border(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.pointcloud.marker.border'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # arearatio
+    # ---------
+    arearatio: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.pointcloud.marker'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_border.ColorValidator(),
+            'arearatio': v_border.ArearatioValidator(),
+        }
+
+    def __init__(self, color=None, arearatio=None, **kwargs):
+        super().__init__('border', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.arearatio = arearatio
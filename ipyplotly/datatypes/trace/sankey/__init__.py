@@ -0,0 +1,30 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._domain import Domain
+    from ._textfont import Textfont
+    from ._node import Node
+    from ._link import Link
+    from . import link
+    from . import node
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.link',
+            '.node',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._domain.Domain',
+            '._textfont.Textfont',
+            '._node.Node',
+            '._link.Link',
+        ]
+    )
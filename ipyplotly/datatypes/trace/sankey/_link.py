@@ -0,0 +1,115 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.sankey import (link as v_link)
+from ipyplotly.datatypes.trace.sankey import (link as d_link)
+
+
+class Link(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.sankey.link'
+
+    # label
+    # -----
+    label: List = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_link.Line' = CompoundProperty()
+
+    # source
+    # ------
+    source: List = SimpleProperty()
+
+    # target
+    # ------
+    target: List = SimpleProperty()
+
+    # value
+    # -----
+    value: List = SimpleProperty()
+
+    # labelsrc
+    # --------
+    labelsrc: str = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # sourcesrc
+    # ---------
+    sourcesrc: str = SimpleProperty()
+
+    # targetsrc
+    # ---------
+    targetsrc: str = SimpleProperty()
+
+    # valuesrc
+    # --------
+    valuesrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.sankey'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'label': v_link.LabelValidator(),
+            'color': v_link.ColorValidator(),
+            'line': v_link.LineValidator(),
+            'source': v_link.SourceValidator(),
+            'target': v_link.TargetValidator(),
+            'value': v_link.ValueValidator(),
+            'labelsrc': v_link.LabelsrcValidator(),
+            'colorsrc': v_link.ColorsrcValidator(),
+            'sourcesrc': v_link.SourcesrcValidator(),
+            'targetsrc': v_link.TargetsrcValidator(),
+            'valuesrc': v_link.ValuesrcValidator(),
+        }
+
+    def __init__(
+        self,
+        label=None,
+        color=None,
+        line=None,
+        source=None,
+        target=None,
+        value=None,
+        labelsrc=None,
+        colorsrc=None,
+        sourcesrc=None,
+        targetsrc=None,
+        valuesrc=None,
+        **kwargs
+    ):
+        super().__init__('link', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.label = label
+        self.color = color
+        self.line = line
+        self.source = source
+        self.target = target
+        self.value = value
+        self.labelsrc = labelsrc
+        self.colorsrc = colorsrc
+        self.sourcesrc = sourcesrc
+        self.targetsrc = targetsrc
+        self.valuesrc = valuesrc
@@ -0,0 +1,79 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.sankey import (node as v_node)
+from ipyplotly.datatypes.trace.sankey import (node as d_node)
+
+
+class Node(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.sankey.node'
+
+    # label
+    # -----
+    label: List = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_node.Line' = CompoundProperty()
+
+    # pad
+    # ---
+    pad: Number = SimpleProperty()
+
+    # thickness
+    # ---------
+    thickness: Number = SimpleProperty()
+
+    # labelsrc
+    # --------
+    labelsrc: str = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.sankey'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'label': v_node.LabelValidator(),
+            'color': v_node.ColorValidator(),
+            'line': v_node.LineValidator(),
+            'pad': v_node.PadValidator(),
+            'thickness': v_node.ThicknessValidator(),
+            'labelsrc': v_node.LabelsrcValidator(),
+            'colorsrc': v_node.ColorsrcValidator(),
+        }
+
+    def __init__(
+        self, label=None, color=None, line=None, pad=None, thickness=None, labelsrc=None, colorsrc=None, **kwargs
+    ):
+        super().__init__('node', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.label = label
+        self.color = color
+        self.line = line
+        self.pad = pad
+        self.thickness = thickness
+        self.labelsrc = labelsrc
+        self.colorsrc = colorsrc
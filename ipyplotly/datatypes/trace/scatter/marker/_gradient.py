@@ -0,0 +1,58 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.scatter.marker import (gradient as v_gradient)
+
+
+class Gradient(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scatter.marker.gradient'
+
+    # type
+    # ----
+    type: Any = SimpleProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # typesrc
+    # -------
+    typesrc: str = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.scatter.marker'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'type': v_gradient.TypeValidator(),
+            'color': v_gradient.ColorValidator(),
+            'typesrc': v_gradient.TypesrcValidator(),
+            'colorsrc': v_gradient.ColorsrcValidator(),
+        }
+
+    def __init__(self, type=None, color=None, typesrc=None, colorsrc=None, **kwargs):
+        super().__init__('gradient', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.type = type
+        self.color = color
+        self.typesrc = typesrc
+        self.colorsrc = colorsrc
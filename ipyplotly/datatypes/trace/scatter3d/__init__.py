@@ -0,0 +1,36 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._projection import Projection
+    from ._line import Line
+    from ._marker import Marker
+    from ._textfont import Textfont
+    from ._error_x import ErrorX
+    from ._error_y import ErrorY
+    from ._error_z import ErrorZ
+    from . import marker
+    from . import projection
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.marker',
+            '.projection',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._projection.Projection',
+            '._line.Line',
+            '._marker.Marker',
+            '._textfont.Textfont',
+            '._error_x.ErrorX',
+            '._error_y.ErrorY',
+            '._error_z.ErrorZ',
+        ]
+    )
@@ -0,0 +1,53 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.scatter3d import (projection as v_projection)
+from ipyplotly.datatypes.trace.scatter3d import (projection as d_projection)
+
+
+class Projection(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scatter3d.projection'
+
+    # x
+    # -
+    x: 'd_projection.X' = CompoundProperty()
+
+    # y
+    # -
+    y: 'd_projection.Y' = CompoundProperty()
+
+    # z
+    # -
+    z: 'd_projection.Z' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.scatter3d'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'x': v_projection.XValidator(),
+            'y': v_projection.YValidator(),
+            'z': v_projection.ZValidator(),
+        }
+
+    def __init__(self, x=None, y=None, z=None, **kwargs):
+        super().__init__('projection', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.x = x
+        self.y = y
+        self.z = z
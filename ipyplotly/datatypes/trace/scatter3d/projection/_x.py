@@ -0,0 +1,52 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.scatter3d.projection import (x as v_x)
+
+
+class X(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scatter3d.projection.x'
+
+    # show
+    # ----
+    show: bool = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # scale
+    # -----
+    scale: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.scatter3d.projection'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'show': v_x.ShowValidator(),
+            'opacity': v_x.OpacityValidator(),
+            'scale': v_x.ScaleValidator(),
+        }
+
+    def __init__(self, show=None, opacity=None, scale=None, **kwargs):
+        super().__init__('x', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.show = show
+        self.opacity = opacity
+        self.scale = scale
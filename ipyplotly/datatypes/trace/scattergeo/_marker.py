@@ -0,0 +1,185 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.scattergeo import (marker as v_marker)
+from ipyplotly.datatypes.trace.scattergeo import (marker as d_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scattergeo.marker'
+
+    # symbol
+    # ------
+    symbol: Any = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # sizeref
+    # -------
+    sizeref: Number = SimpleProperty()
+
+    # sizemin
+    # -------
+    sizemin: Number = SimpleProperty()
+
+    # sizemode
+    # --------
+    sizemode: Any = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_marker.Colorbar' = CompoundProperty()
+
+    # line
+    # ----
+    line: 'd_marker.Line' = CompoundProperty()
+
+    # gradient
+    # --------
+    gradient: 'd_marker.Gradient' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # cauto
+    # -----
+    cauto: bool = SimpleProperty()
+
+    # cmax
+    # ----
+    cmax: Number = SimpleProperty()
+
+    # cmin
+    # ----
+    cmin: Number = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # symbolsrc
+    # ---------
+    symbolsrc: str = SimpleProperty()
+
+    # opacitysrc
+    # ----------
+    opacitysrc: str = SimpleProperty()
+
+    # sizesrc
+    # -------
+    sizesrc: str = SimpleProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.scattergeo'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'symbol': v_marker.SymbolValidator(),
+            'opacity': v_marker.OpacityValidator(),
+            'size': v_marker.SizeValidator(),
+            'sizeref': v_marker.SizerefValidator(),
+            'sizemin': v_marker.SizeminValidator(),
+            'sizemode': v_marker.SizemodeValidator(),
+            'showscale': v_marker.ShowscaleValidator(),
+            'colorbar': v_marker.ColorbarValidator(),
+            'line': v_marker.LineValidator(),
+            'gradient': v_marker.GradientValidator(),
+            'color': v_marker.ColorValidator(),
+            'colorscale': v_marker.ColorscaleValidator(),
+            'cauto': v_marker.CautoValidator(),
+            'cmax': v_marker.CmaxValidator(),
+            'cmin': v_marker.CminValidator(),
+            'autocolorscale': v_marker.AutocolorscaleValidator(),
+            'reversescale': v_marker.ReversescaleValidator(),
+            'symbolsrc': v_marker.SymbolsrcValidator(),
+            'opacitysrc': v_marker.OpacitysrcValidator(),
+            'sizesrc': v_marker.SizesrcValidator(),
+            'colorsrc': v_marker.ColorsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        symbol=None,
+        opacity=None,
+        size=None,
+        sizeref=None,
+        sizemin=None,
+        sizemode=None,
+        showscale=None,
+        colorbar=None,
+        line=None,
+        gradient=None,
+        color=None,
+        colorscale=None,
+        cauto=None,
+        cmax=None,
+        cmin=None,
+        autocolorscale=None,
+        reversescale=None,
+        symbolsrc=None,
+        opacitysrc=None,
+        sizesrc=None,
+        colorsrc=None,
+        **kwargs
+    ):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.symbol = symbol
+        self.opacity = opacity
+        self.size = size
+        self.sizeref = sizeref
+        self.sizemin = sizemin
+        self.sizemode = sizemode
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.line = line
+        self.gradient = gradient
+        self.color = color
+        self.colorscale = colorscale
+        self.cauto = cauto
+        self.cmax = cmax
+        self.cmin = cmin
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.symbolsrc = symbolsrc
+        self.opacitysrc = opacitysrc
+        self.sizesrc = sizesrc
+        self.colorsrc = colorsrc
@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._line import Line
+    from ._marker import Marker
+    from ._error_y import ErrorY
+    from ._error_x import ErrorX
+    from . import marker
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.marker',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._line.Line',
+            '._marker.Marker',
+            '._error_y.ErrorY',
+            '._error_x.ErrorX',
+        ]
+    )
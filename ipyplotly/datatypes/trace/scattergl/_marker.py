@@ -0,0 +1,178 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.scattergl import (marker as v_marker)
+from ipyplotly.datatypes.trace.scattergl import (marker as d_marker)
+
+
+class Marker(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.scattergl.marker'
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # colorscale
+    # ----------
+    colorscale: str = SimpleProperty()
+
+    # cauto
+    # -----
+    cauto: bool = SimpleProperty()
+
+    # cmax
+    # ----
+    cmax: Number = SimpleProperty()
+
+    # cmin
+    # ----
+    cmin: Number = SimpleProperty()
+
+    # autocolorscale
+    # --------------
+    autocolorscale: bool = SimpleProperty()
+
+    # reversescale
+    # ------------
+    reversescale: bool = SimpleProperty()
+
+    # symbol
+    # ------
+    symbol: Any = SimpleProperty()
+
+    # size
+    # ----
+    size: Number = SimpleProperty()
+
+    # sizeref
+    # -------
+    sizeref: Number = SimpleProperty()
+
+    # sizemin
+    # -------
+    sizemin: Number = SimpleProperty()
+
+    # sizemode
+    # --------
+    sizemode: Any = SimpleProperty()
+
+    # opacity
+    # -------
+    opacity: Number = SimpleProperty()
+
+    # showscale
+    # ---------
+    showscale: bool = SimpleProperty()
+
+    # colorbar
+    # --------
+    colorbar: 'd_marker.Colorbar' = CompoundProperty()
+
+    # line
+    # ----
+    line: 'd_marker.Line' = CompoundProperty()
+
+    # colorsrc
+    # --------
+    colorsrc: str = SimpleProperty()
+
+    # symbolsrc
+    # ---------
+    symbolsrc: str = SimpleProperty()
+
+    # sizesrc
+    # -------
+    sizesrc: str = SimpleProperty()
+
+    # opacitysrc
+    # ----------
+    opacitysrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.scattergl'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'color': v_marker.ColorValidator(),
+            'colorscale': v_marker.ColorscaleValidator(),
+            'cauto': v_marker.CautoValidator(),
+            'cmax': v_marker.CmaxValidator(),
+            'cmin': v_marker.CminValidator(),
+            'autocolorscale': v_marker.AutocolorscaleValidator(),
+            'reversescale': v_marker.ReversescaleValidator(),
+            'symbol': v_marker.SymbolValidator(),
+            'size': v_marker.SizeValidator(),
+            'sizeref': v_marker.SizerefValidator(),
+            'sizemin': v_marker.SizeminValidator(),
+            'sizemode': v_marker.SizemodeValidator(),
+            'opacity': v_marker.OpacityValidator(),
+            'showscale': v_marker.ShowscaleValidator(),
+            'colorbar': v_marker.ColorbarValidator(),
+            'line': v_marker.LineValidator(),
+            'colorsrc': v_marker.ColorsrcValidator(),
+            'symbolsrc': v_marker.SymbolsrcValidator(),
+            'sizesrc': v_marker.SizesrcValidator(),
+            'opacitysrc': v_marker.OpacitysrcValidator(),
+        }
+
+    def __init__(
+        self,
+        color=None,
+        colorscale=None,
+        cauto=None,
+        cmax=None,
+        cmin=None,
+        autocolorscale=None,
+        reversescale=None,
+        symbol=None,
+        size=None,
+        sizeref=None,
+        sizemin=None,
+        sizemode=None,
+        opacity=None,
+        showscale=None,
+        colorbar=None,
+        line=None,
+        colorsrc=None,
+        symbolsrc=None,
+        sizesrc=None,
+        opacitysrc=None,
+        **kwargs
+    ):
+        super().__init__('marker', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.color = color
+        self.colorscale = colorscale
+        self.cauto = cauto
+        self.cmax = cmax
+        self.cmin = cmin
+        self.autocolorscale = autocolorscale
+        self.reversescale = reversescale
+        self.symbol = symbol
+        self.size = size
+        self.sizeref = sizeref
+        self.sizemin = sizemin
+        self.sizemode = sizemode
+        self.opacity = opacity
+        self.showscale = showscale
+        self.colorbar = colorbar
+        self.line = line
+        self.colorsrc = colorsrc
+        self.symbolsrc = symbolsrc
+        self.sizesrc = sizesrc
+        self.opacitysrc = opacitysrc
@@ -0,0 +1,16 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._colorbar import Colorbar
+    from . import colorbar
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+        ],
+        [
+            '._colorbar.Colorbar',
+        ]
+    )
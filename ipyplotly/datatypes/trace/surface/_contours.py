@@ -0,0 +1,53 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.surface import (contours as v_contours)
+from ipyplotly.datatypes.trace.surface import (contours as d_contours)
+
+
+class Contours(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.surface.contours'
+
+    # x
+    # -
+    x: 'd_contours.X' = CompoundProperty()
+
+    # y
+    # -
+    y: 'd_contours.Y' = CompoundProperty()
+
+    # z
+    # -
+    z: 'd_contours.Z' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.surface'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'x': v_contours.XValidator(),
+            'y': v_contours.YValidator(),
+            'z': v_contours.ZValidator(),
+        }
+
+    def __init__(self, x=None, y=None, z=None, **kwargs):
+        super().__init__('contours', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.x = x
+        self.y = y
+        self.z = z
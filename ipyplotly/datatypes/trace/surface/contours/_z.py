@@ -0,0 +1,94 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.surface.contours import (z as v_z)
+from ipyplotly.datatypes.trace.surface.contours import (z as d_z)
+
+
+class Z(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.surface.contours.z'
+
+    # show
+    # ----
+    show: bool = SimpleProperty()
+
+    # project
+    # -------
+    project: 'd_z.Project' = CompoundProperty()
+
+    # color
+    # -----
+    color: str = SimpleProperty()
+
+    # usecolormap
+    # -----------
+    usecolormap: bool = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # highlight
+    # ---------
+    highlight: bool = SimpleProperty()
+
+    # highlightcolor
+    # --------------
+    highlightcolor: str = SimpleProperty()
+
+    # highlightwidth
+    # --------------
+    highlightwidth: Number = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.surface.contours'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'show': v_z.ShowValidator(),
+            'project': v_z.ProjectValidator(),
+            'color': v_z.ColorValidator(),
+            'usecolormap': v_z.UsecolormapValidator(),
+            'width': v_z.WidthValidator(),
+            'highlight': v_z.HighlightValidator(),
+            'highlightcolor': v_z.HighlightcolorValidator(),
+            'highlightwidth': v_z.HighlightwidthValidator(),
+        }
+
+    def __init__(
+        self,
+        show=None,
+        project=None,
+        color=None,
+        usecolormap=None,
+        width=None,
+        highlight=None,
+        highlightcolor=None,
+        highlightwidth=None,
+        **kwargs
+    ):
+        super().__init__('z', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.show = show
+        self.project = project
+        self.color = color
+        self.usecolormap = usecolormap
+        self.width = width
+        self.highlight = highlight
+        self.highlightcolor = highlightcolor
+        self.highlightwidth = highlightwidth
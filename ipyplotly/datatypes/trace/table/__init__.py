@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._domain import Domain
+    from ._header import Header
+    from ._cells import Cells
+    from . import cells
+    from . import header
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.cells',
+            '.header',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._domain.Domain',
+            '._header.Header',
+            '._cells.Cells',
+        ]
+    )
@@ -0,0 +1,136 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.table import (cells as v_cells)
+from ipyplotly.datatypes.trace.table import (cells as d_cells)
+
+
+class Cells(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.table.cells'
+
+    # values
+    # ------
+    values: List = SimpleProperty()
+
+    # format
+    # ------
+    format: List = SimpleProperty()
+
+    # prefix
+    # ------
+    prefix: str = SimpleProperty()
+
+    # suffix
+    # ------
+    suffix: str = SimpleProperty()
+
+    # height
+    # ------
+    height: Number = SimpleProperty()
+
+    # align
+    # -----
+    align: Any = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_cells.Line' = CompoundProperty()
+
+    # fill
+    # ----
+    fill: 'd_cells.Fill' = CompoundProperty()
+
+    # font
+    # ----
+    font: 'd_cells.Font' = CompoundProperty()
+
+    # valuessrc
+    # ---------
+    valuessrc: str = SimpleProperty()
+
+    # formatsrc
+    # ---------
+    formatsrc: str = SimpleProperty()
+
+    # prefixsrc
+    # ---------
+    prefixsrc: str = SimpleProperty()
+
+    # suffixsrc
+    # ---------
+    suffixsrc: str = SimpleProperty()
+
+    # alignsrc
+    # --------
+    alignsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.table'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'values': v_cells.ValuesValidator(),
+            'format': v_cells.FormatValidator(),
+            'prefix': v_cells.PrefixValidator(),
+            'suffix': v_cells.SuffixValidator(),
+            'height': v_cells.HeightValidator(),
+            'align': v_cells.AlignValidator(),
+            'line': v_cells.LineValidator(),
+            'fill': v_cells.FillValidator(),
+            'font': v_cells.FontValidator(),
+            'valuessrc': v_cells.ValuessrcValidator(),
+            'formatsrc': v_cells.FormatsrcValidator(),
+            'prefixsrc': v_cells.PrefixsrcValidator(),
+            'suffixsrc': v_cells.SuffixsrcValidator(),
+            'alignsrc': v_cells.AlignsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        values=None,
+        format=None,
+        prefix=None,
+        suffix=None,
+        height=None,
+        align=None,
+        line=None,
+        fill=None,
+        font=None,
+        valuessrc=None,
+        formatsrc=None,
+        prefixsrc=None,
+        suffixsrc=None,
+        alignsrc=None,
+        **kwargs
+    ):
+        super().__init__('cells', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.values = values
+        self.format = format
+        self.prefix = prefix
+        self.suffix = suffix
+        self.height = height
+        self.align = align
+        self.line = line
+        self.fill = fill
+        self.font = font
+        self.valuessrc = valuessrc
+        self.formatsrc = formatsrc
+        self.prefixsrc = prefixsrc
+        self.suffixsrc = suffixsrc
+        self.alignsrc = alignsrc
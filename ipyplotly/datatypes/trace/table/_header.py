@@ -0,0 +1,136 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.table import (header as v_header)
+from ipyplotly.datatypes.trace.table import (header as d_header)
+
+
+class Header(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.table.header'
+
+    # values
+    # ------
+    values: List = SimpleProperty()
+
+    # format
+    # ------
+    format: List = SimpleProperty()
+
+    # prefix
+    # ------
+    prefix: str = SimpleProperty()
+
+    # suffix
+    # ------
+    suffix: str = SimpleProperty()
+
+    # height
+    # ------
+    height: Number = SimpleProperty()
+
+    # align
+    # -----
+    align: Any = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_header.Line' = CompoundProperty()
+
+    # fill
+    # ----
+    fill: 'd_header.Fill' = CompoundProperty()
+
+    # font
+    # ----
+    font: 'd_header.Font' = CompoundProperty()
+
+    # valuessrc
+    # ---------
+    valuessrc: str = SimpleProperty()
+
+    # formatsrc
+    # ---------
+    formatsrc: str = SimpleProperty()
+
+    # prefixsrc
+    # ---------
+    prefixsrc: str = SimpleProperty()
+
+    # suffixsrc
+    # ---------
+    suffixsrc: str = SimpleProperty()
+
+    # alignsrc
+    # --------
+    alignsrc: str = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.table'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'values': v_header.ValuesValidator(),
+            'format': v_header.FormatValidator(),
+            'prefix': v_header.PrefixValidator(),
+            'suffix': v_header.SuffixValidator(),
+            'height': v_header.HeightValidator(),
+            'align': v_header.AlignValidator(),
+            'line': v_header.LineValidator(),
+            'fill': v_header.FillValidator(),
+            'font': v_header.FontValidator(),
+            'valuessrc': v_header.ValuessrcValidator(),
+            'formatsrc': v_header.FormatsrcValidator(),
+            'prefixsrc': v_header.PrefixsrcValidator(),
+            'suffixsrc': v_header.SuffixsrcValidator(),
+            'alignsrc': v_header.AlignsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        values=None,
+        format=None,
+        prefix=None,
+        suffix=None,
+        height=None,
+        align=None,
+        line=None,
+        fill=None,
+        font=None,
+        valuessrc=None,
+        formatsrc=None,
+        prefixsrc=None,
+        suffixsrc=None,
+        alignsrc=None,
+        **kwargs
+    ):
+        super().__init__('header', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.values = values
+        self.format = format
+        self.prefix = prefix
+        self.suffix = suffix
+        self.height = height
+        self.align = align
+        self.line = line
+        self.fill = fill
+        self.font = font
+        self.valuessrc = valuessrc
+        self.formatsrc = formatsrc
+        self.prefixsrc = prefixsrc
+        self.suffixsrc = suffixsrc
+        self.alignsrc = alignsrc
@@ -0,0 +1,17 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._line import Line
+    from ._fill import Fill
+    from ._font import Font
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._line.Line',
+            '._fill.Fill',
+            '._font.Font',
+        ]
+    )
@@ -0,0 +1,38 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._hoverlabel import Hoverlabel
+    from ._stream import Stream
+    from ._line import Line
+    from ._marker import Marker
+    from ._box import Box
+    from ._meanline import Meanline
+    from ._selected import Selected
+    from ._unselected import Unselected
+    from . import unselected
+    from . import selected
+    from . import box
+    from . import marker
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.unselected',
+            '.selected',
+            '.box',
+            '.marker',
+            '.hoverlabel',
+        ],
+        [
+            '._hoverlabel.Hoverlabel',
+            '._stream.Stream',
+            '._line.Line',
+            '._marker.Marker',
+            '._box.Box',
+            '._meanline.Meanline',
+            '._selected.Selected',
+            '._unselected.Unselected',
+        ]
+    )
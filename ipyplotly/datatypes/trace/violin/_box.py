@@ -0,0 +1,59 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.trace.violin import (box as v_box)
+from ipyplotly.datatypes.trace.violin import (box as d_box)
+
+
+class Box(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'trace.violin.box'
+
+    # visible
+    # -------
+    visible: bool = SimpleProperty()
+
+    # width
+    # -----
+    width: Number = SimpleProperty()
+
+    # fillcolor
+    # ---------
+    fillcolor: str = SimpleProperty()
+
+    # line
+    # ----
+    line: 'd_box.Line' = CompoundProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'trace.violin'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'visible': v_box.VisibleValidator(),
+            'width': v_box.WidthValidator(),
+            'fillcolor': v_box.FillcolorValidator(),
+            'line': v_box.LineValidator(),
+        }
+
+    def __init__(self, visible=None, width=None, fillcolor=None, line=None, **kwargs):
+        super().__init__('box', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.visible = visible
+        self.width = width
+        self.fillcolor = fillcolor
+        self.line = line
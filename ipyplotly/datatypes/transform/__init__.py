@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._aggregate import Aggregate
+    from ._filter import Filter
+    from ._groupby import Groupby
+    from ._sort import Sort
+    from . import groupby
+    from . import aggregate
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.groupby',
+            '.aggregate',
+        ],
+        [
+            '._aggregate.Aggregate',
+            '._filter.Filter',
+            '._groupby.Groupby',
+            '._sort.Sort',
+        ]
+    )
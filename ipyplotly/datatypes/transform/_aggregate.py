@@ -0,0 +1,69 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.transform import (aggregate as v_aggregate)
+from ipyplotly.datatypes.transform import (aggregate as d_aggregate)
+
+
+class Aggregate(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'transform.aggregate'
+
+    # enabled
+    # -------
+    enabled: bool = SimpleProperty()
+
+    # groups
+    # ------
+    groups: str = SimpleProperty()
+
+    # aggregations
+    # ------------
+    aggregations: 'Tuple[d_aggregate.Aggregation]' = CompoundArrayProperty()
+
+    # groupssrc
+    # ---------
+    groupssrc: str = SimpleProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> str:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'transform'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'enabled': v_aggregate.EnabledValidator(),
+            'groups': v_aggregate.GroupsValidator(),
+            'aggregations': v_aggregate.AggregationsValidator(),
+            'groupssrc': v_aggregate.GroupssrcValidator(),
+        }
+
+    def __init__(self, enabled=None, groups=None, aggregations=None, groupssrc=None, **kwargs):
+        super().__init__('transforms', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.enabled = enabled
+        self.groups = groups
+        self.aggregations = aggregations
+        self.groupssrc = groupssrc
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'aggregate'
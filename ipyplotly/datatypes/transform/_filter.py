@@ -0,0 +1,103 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.transform import (filter as v_filter)
+
+
+class Filter(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'transform.filter'
+
+    # enabled
+    # -------
+    enabled: bool = SimpleProperty()
+
+    # target
+    # ------
+    target: str = SimpleProperty()
+
+    # operation
+    # ---------
+    operation: Any = SimpleProperty()
+
+    # value
+    # -----
+    value: Any = SimpleProperty()
+
+    # preservegaps
+    # ------------
+    preservegaps: bool = SimpleProperty()
+
+    # valuecalendar
+    # -------------
+    valuecalendar: Any = SimpleProperty()
+
+    # targetcalendar
+    # --------------
+    targetcalendar: Any = SimpleProperty()
+
+    # targetsrc
+    # ---------
+    targetsrc: str = SimpleProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> str:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'transform'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'enabled': v_filter.EnabledValidator(),
+            'target': v_filter.TargetValidator(),
+            'operation': v_filter.OperationValidator(),
+            'value': v_filter.ValueValidator(),
+            'preservegaps': v_filter.PreservegapsValidator(),
+            'valuecalendar': v_filter.ValuecalendarValidator(),
+            'targetcalendar': v_filter.TargetcalendarValidator(),
+            'targetsrc': v_filter.TargetsrcValidator(),
+        }
+
+    def __init__(
+        self,
+        enabled=None,
+        target=None,
+        operation=None,
+        value=None,
+        preservegaps=None,
+        valuecalendar=None,
+        targetcalendar=None,
+        targetsrc=None,
+        **kwargs
+    ):
+        super().__init__('transforms', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.enabled = enabled
+        self.target = target
+        self.operation = operation
+        self.value = value
+        self.preservegaps = preservegaps
+        self.valuecalendar = valuecalendar
+        self.targetcalendar = targetcalendar
+        self.targetsrc = targetsrc
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'filter'
@@ -0,0 +1,75 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.transform import (groupby as v_groupby)
+from ipyplotly.datatypes.transform import (groupby as d_groupby)
+
+
+class Groupby(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'transform.groupby'
+
+    # enabled
+    # -------
+    enabled: bool = SimpleProperty()
+
+    # groups
+    # ------
+    groups: List = SimpleProperty()
+
+    # nameformat
+    # ----------
+    nameformat: str = SimpleProperty()
+
+    # styles
+    # ------
+    styles: 'Tuple[d_groupby.Style]' = CompoundArrayProperty()
+
+    # groupssrc
+    # ---------
+    groupssrc: str = SimpleProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> str:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'transform'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'enabled': v_groupby.EnabledValidator(),
+            'groups': v_groupby.GroupsValidator(),
+            'nameformat': v_groupby.NameformatValidator(),
+            'styles': v_groupby.StylesValidator(),
+            'groupssrc': v_groupby.GroupssrcValidator(),
+        }
+
+    def __init__(self, enabled=None, groups=None, nameformat=None, styles=None, groupssrc=None, **kwargs):
+        super().__init__('transforms', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.enabled = enabled
+        self.groups = groups
+        self.nameformat = nameformat
+        self.styles = styles
+        self.groupssrc = groupssrc
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'groupby'
@@ -0,0 +1,68 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.transform import (sort as v_sort)
+
+
+class Sort(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'transform.sort'
+
+    # enabled
+    # -------
+    enabled: bool = SimpleProperty()
+
+    # target
+    # ------
+    target: str = SimpleProperty()
+
+    # order
+    # -----
+    order: Any = SimpleProperty()
+
+    # targetsrc
+    # ---------
+    targetsrc: str = SimpleProperty()
+
+    # type
+    # ----
+    @property
+    def type(self) -> str:
+        return self._props['type']
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'transform'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'enabled': v_sort.EnabledValidator(),
+            'target': v_sort.TargetValidator(),
+            'order': v_sort.OrderValidator(),
+            'targetsrc': v_sort.TargetsrcValidator(),
+        }
+
+    def __init__(self, enabled=None, target=None, order=None, targetsrc=None, **kwargs):
+        super().__init__('transforms', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.enabled = enabled
+        self.target = target
+        self.order = order
+        self.targetsrc = targetsrc
+
+        # Read-only literals
+        # ------------------
+        self._props['type'] = 'sort'
@@ -0,0 +1,58 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.transform.aggregate import (aggregation as v_aggregation)
+
+
+class Aggregation(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'transform.aggregate.aggregation'
+
+    # target
+    # ------
+    target: str = SimpleProperty()
+
+    # func
+    # ----
+    func: Any = SimpleProperty()
+
+    # funcmode
+    # --------
+    funcmode: Any = SimpleProperty()
+
+    # enabled
+    # -------
+    enabled: bool = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'transform.aggregate'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'target': v_aggregation.TargetValidator(),
+            'func': v_aggregation.FuncValidator(),
+            'funcmode': v_aggregation.FuncmodeValidator(),
+            'enabled': v_aggregation.EnabledValidator(),
+        }
+
+    def __init__(self, target=None, func=None, funcmode=None, enabled=None, **kwargs):
+        super().__init__('aggregations', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.target = target
+        self.func = func
+        self.funcmode = funcmode
+        self.enabled = enabled
@@ -0,0 +1,46 @@
+from typing import *
+from numbers import Number
+from ipyplotly.basedatatypes import (
+    BaseTraceHierarchyType, SimpleProperty, CompoundProperty, CompoundArrayProperty, ItemProperty
+)
+from ipyplotly.lazydocs import lazy_class_doc
+from ipyplotly.validators.transform.groupby import (style as v_style)
+
+
+class Style(BaseTraceHierarchyType):
+
+    __slots__ = ()
+
+    __doc__ = lazy_class_doc
+    _docs_key = 'transform.groupby.style'
+
+    # target
+    # ------
+    target: str = SimpleProperty()
+
+    # value
+    # -----
+    value: Any = SimpleProperty()
+
+    # property parent name
+    # --------------------
+    @property
+    def _parent_path(self) -> str:
+        return 'transform.groupby'
+
+    # Validators
+    # ----------
+    @staticmethod
+    def _build_validators():
+        return {
+            'target': v_style.TargetValidator(),
+            'value': v_style.ValueValidator(),
+        }
+
+    def __init__(self, target=None, value=None, **kwargs):
+        super().__init__('styles', **kwargs)
+
+        # Populate data dict with properties
+        # ----------------------------------
+        self.target = target
+        self.value = value
@@ -0,0 +1,128 @@
+import importlib
+import sys
+
+
+def relative_import(parent_name, rel_modules=(), rel_classes=()):
+    """
+    Helper to lazily import the submodules and classes of a package on first attribute access,
+    using module level __getattr__ and __dir__ functions (PEP 562, Python 3.7+)
+
+    Usage (in the __init__.py of a package):
+
+        __all__, __getattr__, __dir__ = relative_import(
+            __name__, ['.marker'], ['._marker.Marker'])
+
+    Parameters
+    ----------
+    parent_name : str
+        Name of the package (i.e. __name__)
+    rel_modules : list of str
+        Relative paths of the submodules of the package (e.g. ['.marker'])
+    rel_classes : list of str
+        Relative paths of the classes of the package (e.g. ['._marker.Marker'])
+
+    Returns
+    -------
+    (list of str, function, function)
+        The __all__ list, and the __getattr__ and __dir__ functions of the package
+    """
+    module_names = {rel_module.split('.')[-1]: rel_module for rel_module in rel_modules}
+    class_names = {rel_class.split('.')[-1]: rel_class for rel_class in rel_classes}
+
+    def __getattr__(import_name):
+        # Submodule
+        if import_name in module_names:
+            return importlib.import_module(module_names[import_name], parent_name)
+
+        # Class defined in a submodule
+        if import_name in class_names:
+            rel_module = class_names[import_name].rsplit('.', 1)[0]
+            class_module = importlib.import_module(rel_module, parent_name)
+            cls = getattr(class_module, import_name)
+
+            # Cache the class on the package so that __getattr__ is only called once per class
+            setattr(sys.modules[parent_name], import_name, cls)
+            return cls
+
+        raise AttributeError(f'module {parent_name!r} has no attribute {import_name!r}')
+
+    __all__ = list(module_names) + list(class_names)
+
+    def __dir__():
+        return __all__
+
+    return __all__, __getattr__, __dir__
+
+
+def validator_table(module_name, table):
+    """
+    Helper to build the validator classes of a validator table module on first attribute
+    access, using module level __getattr__ and __dir__ functions (PEP 562, Python 3.7+). Older
+    versions build all of the classes eagerly.
+
+    Usage (in a validator table module):
+
+        __getattr__, __dir__ = validator_table(__name__, {
+            'SizeValidator': ('size', 'trace.scatter.marker', 'NumberValidator', {'min': 0}),
+        })
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the table module (i.e. __name__)
+    table : dict
+        Dict from validator class name to (plotly name, parent name, base validator, options)
+        tuples. base validator is the name of a class in ipyplotly.basevalidators, or the full name
+        of another validator class. options are passed to the base validator constructor, with
+        data_class and element_class given as the full names of datatype classes
+
+    Returns
+    -------
+    (function, function)
+        The __getattr__ and __dir__ functions of the module
+    """
+    def __getattr__(class_name):
+        if class_name not in table:
+            raise AttributeError(f'module {module_name!r} has no attribute {class_name!r}')
+
+        cls = _build_validator_class(module_name, class_name, *table[class_name])
+
+        # Cache the class on the module so that __getattr__ is only called once per class
+        setattr(sys.modules[module_name], class_name, cls)
+        return cls
+
+    def __dir__():
+        return list(table)
+
+    if sys.version_info < (3, 7):
+        for class_name in table:
+            __getattr__(class_name)
+
+    return __getattr__, __dir__
+
+
+def _import_name(full_name):
+    module_name, _, name = full_name.rpartition('.')
+    return getattr(importlib.import_module(module_name), name)
+
+
+def _build_validator_class(module_name, class_name, plotly_name, parent_name, base_validator, options):
+    if '.' not in base_validator:
+        base_validator = 'ipyplotly.basevalidators.' + base_validator
+    base_class = _import_name(base_validator)
+
+    # Like the __init__ of generated validator classes, the datatype classes of compound
+    # validators are imported when the validator is constructed
+    class_options = {option: value for option, value in options.items()
+                     if option in ('data_class', 'element_class')}
+
+    def __init__(self, plotly_name=plotly_name, parent_name=parent_name):
+        kwargs = dict(options)
+        for option, datatype_class in class_options.items():
+            kwargs[option] = _import_name(datatype_class)
+
+        base_class.__init__(self, plotly_name=plotly_name, parent_name=parent_name, **kwargs)
+
+    return type(class_name, (base_class,), {'__init__': __init__,
+                                            '__module__': module_name,
+                                            '__qualname__': class_name})
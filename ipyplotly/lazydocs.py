@@ -0,0 +1,149 @@
+"""
+Lazily loaded documentation of the generated datatype classes
+
+Rather than embedding docstrings in the generated modules, codegen writes the description of every
+property to compact JSON resources in the ipyplotly.datatypes._docs package data (one resource per
+trace type, plus one for the layout and one for frames). The resources are loaded on first use, and
+docstrings, _prop_descriptions and the data_docs of compound validators are built from them.
+
+In slim mode (enabled when running under python -OO) no docstrings are built, but validation
+error messages, which include property descriptions, are unaffected.
+"""
+import json
+import pkgutil
+import sys
+import textwrap
+from collections import OrderedDict
+from functools import lru_cache
+
+# Slim mode
+# ---------
+_slim = sys.flags.optimize >= 2
+
+
+def set_slim(slim=True):
+    """
+    Enable or disable slim mode, in which the generated classes have no docstrings
+    """
+    global _slim
+    _slim = slim
+
+
+def is_slim():
+    return _slim
+
+
+# Resources
+# ---------
+def get_docs_group(docs_key):
+    """
+    Name of the resource that holds the docs of the class with docs key docs_key (the dotted
+    path of the class, e.g. 'trace.scatter.marker' -> 'trace.scatter', 'layout.xaxis' -> 'layout')
+    """
+    path = docs_key.split('.')
+    return '.'.join(path[:2] if path[0] == 'trace' else path[:1])
+
+
+@lru_cache(maxsize=None)
+def _load_docs_group(group):
+    data = pkgutil.get_data('ipyplotly.datatypes', '_docs/' + group + '.json')
+    return json.loads(data.decode('utf-8'), object_pairs_hook=OrderedDict)
+
+
+def load_docs(docs_key):
+    """
+    Load the descriptions of the properties of the class with docs key docs_key
+
+    Returns
+    -------
+    OrderedDict
+        Dict from property name to description, in constructor parameter order. Descriptions are
+        wrapped to 68 characters and have no indentation
+    """
+    return _load_docs_group(get_docs_group(docs_key))[docs_key]
+
+
+def get_prop_descriptions(docs_key, indent=8):
+    """
+    Build the description of the properties of the class with docs key docs_key, as used in
+    constructor docstrings and validation error messages
+    """
+    buffer = []
+    for prop_name, description in load_docs(docs_key).items():
+        buffer.append('\n' + ' ' * indent + prop_name)
+        buffer.append('\n' + textwrap.indent(description, ' ' * (indent + 4)))
+
+    return ''.join(buffer)
+
+
+def get_constructor_doc(docs_key, class_name):
+    """
+    Build the constructor docstring of the class with docs key docs_key
+    """
+    return (f'Construct a new {class_name} object\n\n'
+            f'Parameters\n'
+            f'----------'
+            f'{get_prop_descriptions(docs_key, indent=0)}\n\n'
+            f'Returns\n'
+            f'-------\n'
+            f'{class_name}')
+
+
+# Descriptors
+# -----------
+class LazyClassDoc:
+    """
+    Class docstring that is built on first access, by calling the _build_docstring classmethod of
+    the class
+
+    Usage (in the body of a class):
+
+        __doc__ = lazy_class_doc
+    """
+    def __get__(self, obj, owner):
+        if _slim:
+            return None
+
+        # type.__doc__ only looks at the class's own dict, cache the docstring there
+        docstring = owner._build_docstring()
+        owner.__doc__ = docstring
+        return docstring
+
+
+lazy_class_doc = LazyClassDoc()
+
+
+class _LazyPropertyDoc:
+    # Data descriptor, so that it takes precedence over the __doc__ of property instances.
+    # property.__init__ assigns the getter docstring (None for generated properties), ignore it
+    def __get__(self, prop, owner):
+        if prop is None:
+            return owner.__dict__['_class_docstring']
+        elif _slim or not hasattr(prop, '_owner'):
+            return None
+
+        return prop._owner._build_property_docstring(prop._name)
+
+    def __set__(self, prop, value):
+        pass
+
+
+class doc_property(property):
+    """
+    Property whose docstring is built on first access by the _build_property_docstring
+    classmethod of the class that defines it
+    """
+    _class_docstring = __doc__
+    __doc__ = _LazyPropertyDoc()
+    __slots__ = ('_owner', '_name')
+
+    def __init_subclass__(cls, **kwargs):
+        # The docstring of a subclass would shadow the docstrings of its properties
+        super().__init_subclass__(**kwargs)
+        cls._class_docstring = cls.__dict__.get('__doc__')
+        cls.__doc__ = _LazyPropertyDoc()
+
+    def __set_name__(self, owner, name):
+        super().__set_name__(owner, name)
+        self._owner = owner
+        self._name = name
@@ -0,0 +1,90 @@
+import importlib
+from functools import lru_cache
+
+# Container kinds
+# ---------------
+# Value is stored as-is in its parent dict
+SIMPLE = 'simple'
+# Value is a dict of properties
+COMPOUND = 'compound'
+# Value is a list of dicts of properties
+COMPOUND_ARRAY = 'compound_array'
+
+
+class PropertyPathTable:
+    """
+    Table from the dotted property paths of a trace type or of the layout (e.g. 'marker.line.width')
+    to the validator of the property and the kind of container that holds its value
+
+    The tables are generated by codegen (see codegen/paths.py) as _property_paths modules of the
+    validators packages. Validators are instantiated on first lookup of their path
+    """
+    def __init__(self, package_name, paths):
+        """
+        Parameters
+        ----------
+        package_name : str
+            Name of the validators package of the trace type or layout
+            (e.g. 'ipyplotly.validators.trace.scatter')
+        paths : dict
+            Dict from dotted property path to (relative validator package, validator class name,
+            container kind) tuples, e.g. {'marker.line.width': ('.marker.line', 'WidthValidator', 'simple')}
+        """
+        self.package_name = package_name
+        self._paths = paths
+        self._validators = {}
+
+    @staticmethod
+    def path_str(key_path):
+        """
+        Dotted property path of a key path, without the indexes into compound arrays
+        (e.g. ('annotations', 0, 'text') -> 'annotations.text')
+        """
+        return '.'.join([key for key in key_path if not isinstance(key, int)])
+
+    def __contains__(self, path):
+        return path in self._paths
+
+    def __len__(self):
+        return len(self._paths)
+
+    def get_kind(self, path):
+        """
+        Container kind of the property at dotted path, or None if path isn't a property path
+        """
+        entry = self._paths.get(path)
+        return entry[2] if entry is not None else None
+
+    def get_validator(self, path):
+        """
+        Validator of the property at dotted path
+
+        Raises
+        ------
+        KeyError
+            If path isn't a property path
+        """
+        validator = self._validators.get(path)
+        if validator is None:
+            # Validator classes are looked up through their package, which imports them from
+            # their class module or validator table
+            rel_package, validator_class_name, _ = self._paths[path]
+            validator_package = importlib.import_module(self.package_name + rel_package)
+            validator = getattr(validator_package, validator_class_name)()
+            self._validators[path] = validator
+
+        return validator
+
+
+@lru_cache(maxsize=None)
+def get_property_path_table(package_name):
+    """
+    Get the property path table of the validators package package_name
+    (e.g. 'ipyplotly.validators.layout')
+
+    Returns
+    -------
+    PropertyPathTable
+    """
+    paths_module = importlib.import_module(package_name + '._property_paths')
+    return PropertyPathTable(package_name, paths_module.property_paths)
@@ -1,20 +1,166 @@
-
 # Create sentinal Undefined object
+import sys
+import warnings
+
 from traitlets import Undefined
 import numpy as np
 
-def _py_to_js(v, widget_manager):
+from ipyplotly.basevalidators import factorize_array, is_str_array, is_arrow_string_array, CategoricalArray
+
+
+# Dtype transport policy
+# ----------------------
+class DtypePolicy:
+    """
+    Policy that determines the dtypes of the binary buffers that numeric arrays are sent to the
+    frontend with. The arrays of the figure are unaffected
+
+    int64 and uint64 arrays, which have no JavaScript typed array, are always narrowed to a
+    32-bit integer type if their values fit, and sent as float64 otherwise. A warning is issued if
+    their values are beyond +/-2**53, which float64 doesn't represent exactly
+
+    Parameters
+    ----------
+    float32_rtol : float or None
+        Send float64 arrays as float32 if the conversion error of every element is within
+        float32_rtol times the resolution of the array, the smallest nonzero difference between
+        its values (0 for lossless conversions only). Tolerances below 0.5 keep distinct values
+        distinct and in order. None to never downcast
+    smallest_int : bool
+        Send integer arrays with the smallest integer dtype that holds their values, rather
+        than at their native width
+    """
+    def __init__(self, float32_rtol=None, smallest_int=False):
+        self.float32_rtol = float32_rtol
+        self.smallest_int = smallest_int
+
+    def __repr__(self):
+        return 'DtypePolicy(float32_rtol={float32_rtol!r}, smallest_int={smallest_int!r})'.format(
+            float32_rtol=self.float32_rtol, smallest_int=self.smallest_int)
+
+    def get_transport_array(self, v):
+        """
+        Convert the numeric array v to the dtype it's sent to the frontend with
+        """
+        if v.dtype.kind == 'f':
+            if v.dtype.itemsize == 8 and self.float32_rtol is not None:
+                with np.errstate(over='ignore'):
+                    # Values out of the float32 range become inf, and fail the check
+                    v32 = v.astype('float32')
+
+                if _float32_within_resolution(v, v32, self.float32_rtol):
+                    v = v32
+        elif v.dtype.itemsize == 8 or self.smallest_int:
+            # (un)signed integer
+            v = v.astype(_get_int_transport_dtype(v, self.smallest_int))
+
+        # JavaScript typed arrays use the platform byte order, which is little-endian in practice
+        return v.astype(v.dtype.newbyteorder('<'), copy=False)
+
+
+def _float32_within_resolution(v, v32, rtol):
+    # The error of each finite element must be within rtol of the resolution of v, so that close
+    # values (e.g. the epoch millisecond timestamps of a dense time series) don't collapse, and within
+    # float32 precision of the element, so that values that underflow (e.g. on log axes) aren't lost
+    finite = np.isfinite(v)
+    v_finite = v[finite]
+    error = np.abs(v32[finite].astype('float64') - v_finite)
+    if not error.any():
+        # Lossless
+        return True
+    elif rtol == 0 or np.any(error > np.finfo('float32').eps * np.abs(v_finite)):
+        return False
+
+    steps = np.diff(np.unique(v_finite))
+    resolution = steps.min() if steps.size else np.abs(v_finite).max()
+    return error.max() <= rtol * resolution
+
+
+# Integer dtypes that have JavaScript typed arrays, in order of preference
+_int_transport_dtypes = [np.dtype(dtype) for dtype in ['uint8', 'int8', 'uint16', 'int16', 'int32', 'uint32']]
+
+
+def _get_int_transport_dtype(v, smallest_int):
+    if v.size == 0:
+        return np.dtype('int32') if v.dtype.itemsize == 8 else v.dtype
+
+    v_min, v_max = v.min(), v.max()
+    for dtype in _int_transport_dtypes:
+        if (smallest_int or dtype.itemsize == 4) and np.iinfo(dtype).min <= v_min and v_max <= np.iinfo(dtype).max:
+            return dtype
+
+    # Too large for 32 bits. JavaScript numbers are float64, which hold integers exactly up to 2**53
+    if v_min < -_max_exact_int or v_max > _max_exact_int:
+        warnings.warn('Integer array with values beyond +/-2**53 (min {v_min}, max {v_max}) sent to the '
+                      'frontend as float64, which doesn\'t represent them exactly'
+                      .format(v_min=v_min, v_max=v_max),
+                      stacklevel=2)
+
+    return np.dtype('float64')
+
+
+# Largest integer that float64 represents exactly, along with all smaller integers
+_max_exact_int = 2 ** 53
+
+
+NATIVE_DTYPES = DtypePolicy()
+COMPACT_DTYPES = DtypePolicy(float32_rtol=0.01, smallest_int=True)
+
+_dtype_policy = NATIVE_DTYPES
+
+
+def set_dtype_policy(policy=NATIVE_DTYPES):
+    """
+    Set the global dtype transport policy, used by figures that don't have a policy of their own
+    """
+    global _dtype_policy
+    _dtype_policy = policy
+
+
+def get_dtype_policy(widget=None):
+    """
+    Get the dtype transport policy of widget, falling back to the global policy
+    """
+    return getattr(widget, '_dtype_policy', None) or _dtype_policy
+
+
+# Serializers
+# -----------
+def _py_to_js(v, widget_manager, policy=None):
     # print('_py_to_js')
     # print(v)
+    if policy is None:
+        policy = get_dtype_policy(widget_manager)
+
     if isinstance(v, dict):
-        return {k: _py_to_js(v, widget_manager) for k, v in v.items()}
+        return {k: _py_to_js(v, widget_manager, policy) for k, v in v.items()}
     elif isinstance(v, (list, tuple)):
-        return [_py_to_js(v, widget_manager) for v in v]
+        return [_py_to_js(v, widget_manager, policy) for v in v]
     elif isinstance(v, np.ndarray):
-        if v.ndim == 1 and v.dtype.kind in ['u', 'i', 'f']:  # (un)signed integer or float
-            return {'buffer': memoryview(v), 'dtype': str(v.dtype), 'shape': v.shape}
-        else:
-            return v.tolist()
+        if v.ndim >= 1 and v.dtype.kind in ['u', 'i', 'f']:  # (un)signed integer or float
+            # N-dimensional arrays (e.g. the z matrix of a heatmap) are sent as one buffer in C order,
+            # the frontend rebuilds the rows from the shape
+            v = policy.get_transport_array(v)
+            return {'buffer': memoryview(np.ascontiguousarray(v).reshape(-1)), 'dtype': str(v.dtype), 'shape': v.shape}
+        elif isinstance(v, CategoricalArray) and v.codes is not None:
+            # Categorical columns are sent as the codes and categories of their source
+            return {'codes': _py_to_js(v.codes, widget_manager, policy),
+                    'categories': _py_to_js(v.categories, widget_manager, policy)}
+        elif v.ndim == 1 and is_str_array(v):  # strings
+            factorized = factorize_array(v) if _has_repeated_values(v) else None
+            if factorized is not None and 2 * len(factorized[1]) <= len(v):
+                # Arrays of repeated strings (e.g. categorical columns) are sent as codes into their
+                # distinct values. Other object arrays aren't, because factorizing merges values of
+                # different types that compare equal (e.g. True, 1, and 1.0)
+                codes, categories = factorized
+                return {'codes': _py_to_js(codes, widget_manager, policy),
+                        'categories': _py_to_js(categories, widget_manager, policy)}
+            else:
+                return _strs_to_js(v, widget_manager, policy)
+
+        return v.tolist()
+    elif is_arrow_string_array(v):
+        return _arrow_strs_to_js(v, widget_manager, policy)
     else:
         if v is Undefined:
             return '_undefined_'
@@ -22,6 +168,56 @@ def _py_to_js(v, widget_manager):
             return v
 
 
+def _has_repeated_values(v, sample_size=1000):
+    # Factorizing arrays of distinct values is wasted work, check a sample first
+    sample = v[:sample_size].tolist()
+    try:
+        return 2 * len(set(sample)) <= len(sample)
+    except TypeError:
+        # Unhashable element
+        return False
+
+
+def _strs_to_js(v, widget_manager, policy):
+    # Arrays of strings are sent as binary buffers of UTF-8 data and of the offsets of the strings
+    # in the data (Arrow's layout for string arrays), rather than as JSON
+    strs = v.tolist()
+    joined = ''.join(strs)
+    data = joined.encode('utf-8')
+    if len(data) == len(joined):
+        # ASCII, the encoded lengths are the string lengths
+        lengths = [len(e) for e in strs]
+    else:
+        lengths = [len(e.encode('utf-8')) for e in strs]
+
+    offsets = np.zeros(len(strs) + 1, dtype='int64')
+    np.cumsum(lengths, out=offsets[1:])
+    return {'offsets': _py_to_js(offsets, widget_manager, policy), 'data': memoryview(data)}
+
+
+def _arrow_strs_to_js(v, widget_manager, policy):
+    # Arrow string arrays are sent from their own offsets and data buffers, without converting
+    # their elements to Python strings. Sliced arrays start at element v.offset of the offsets
+    # buffer, and their data doesn't necessarily start at the start of the data buffer
+    _, offsets_buffer, data_buffer = v.buffers()
+    if len(v) == 0:
+        return {'offsets': _py_to_js(np.zeros(1, dtype='int32'), widget_manager, policy), 'data': memoryview(b'')}
+
+    # large_string arrays have 64-bit offsets
+    offsets_dtype = 'int64' if v.type == sys.modules['pyarrow'].large_string() else 'int32'
+    offsets = np.frombuffer(offsets_buffer, dtype=offsets_dtype)[v.offset:v.offset + len(v) + 1]
+    start, stop = int(offsets[0]), int(offsets[-1])
+    data = memoryview(data_buffer)[start:stop] if data_buffer is not None else memoryview(b'')
+
+    res = {'offsets': _py_to_js(offsets - offsets[0], widget_manager, policy), 'data': data}
+    if v.null_count:
+        # Null elements are flagged with 1
+        nulls = v.is_null().to_numpy(zero_copy_only=False).view('uint8')
+        res['nulls'] = _py_to_js(nulls, widget_manager, policy)
+
+    return res
+
+
 def _js_to_py(v, widget_manager):
     # print('_js_to_py')
     # print(v)
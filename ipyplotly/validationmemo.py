@@ -0,0 +1,108 @@
+"""
+Memo of the results of scalar validation
+
+Figures tend to be updated with the same scalar values over and over (e.g. 'lines+markers',
+'#1f77b4', 'Viridis'). The functions that parse these values are memoized by validator kind with
+bounded LRU caches, so that each distinct value is only parsed once. The memoized functions
+are pure functions of their (hashable) arguments, so all validators of a kind share a cache.
+Unhashable values are validated without the memo.
+
+Usage:
+
+    >>> from ipyplotly import validationmemo
+    >>> validationmemo.get_stats()['color']
+    {'hits': 12, 'misses': 3, 'size': 3, 'maxsize': 1024}
+    >>> validationmemo.set_enabled(False)
+"""
+from functools import lru_cache, wraps
+
+DEFAULT_MAXSIZE = 1024
+
+_enabled = True
+_maxsize = DEFAULT_MAXSIZE
+
+# Dict from validator kind (e.g. 'color') to the memoized function of the kind
+_memos = {}
+
+
+def memoized(kind):
+    """
+    Decorator for pure validation functions, that memoizes them in the memo of the validator
+    kind kind
+
+    Usage:
+
+        @memoized('color')
+        def perform_validate_coerce(v, allow_number=None):
+    """
+    def decorator(func):
+        if kind in _memos:
+            raise ValueError('Validator kind {kind!r} already has a memo'.format(kind=kind))
+
+        _memos[kind] = lru_cache(maxsize=_maxsize, typed=True)(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _enabled:
+                try:
+                    hash((args, tuple(kwargs.values())))
+                except TypeError:
+                    # Unhashable argument, validated without the memo
+                    pass
+                else:
+                    return _memos[kind](*args, **kwargs)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_enabled(enabled=True):
+    """
+    Enable or disable the validation memos. Disabling the memos clears them
+    """
+    global _enabled
+    _enabled = enabled
+    if not enabled:
+        clear()
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_maxsize(maxsize=DEFAULT_MAXSIZE):
+    """
+    Set the maximum number of results held by the memo of each validator kind. Clears the memos
+    """
+    global _maxsize
+    _maxsize = maxsize
+    for kind, memo in list(_memos.items()):
+        _memos[kind] = lru_cache(maxsize=maxsize, typed=True)(memo.__wrapped__)
+
+
+def clear():
+    """
+    Clear the memos and their statistics
+    """
+    for memo in _memos.values():
+        memo.cache_clear()
+
+
+def get_stats():
+    """
+    Get the hit/miss statistics of the memo of each validator kind
+
+    Returns
+    -------
+    dict
+        Dict from validator kind to a dict with keys 'hits', 'misses', 'size', and 'maxsize'
+    """
+    stats = {}
+    for kind, memo in _memos.items():
+        info = memo.cache_info()
+        stats[kind] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+
+    return stats
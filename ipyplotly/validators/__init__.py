@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._layout import LayoutValidator
+    from ._data import DataValidator
+    from ._frames import FramesValidator
+    from ._transforms import TransformsValidator
+    from . import layout
+    from . import trace
+    from . import frame
+    from . import transform
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.layout',
+            '.trace',
+            '.frame',
+            '.transform',
+        ],
+        [
+            '._layout.LayoutValidator',
+            '._data.DataValidator',
+            '._frames.FramesValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
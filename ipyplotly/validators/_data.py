@@ -0,0 +1,42 @@
+import ipyplotly.basevalidators
+
+
+class DataValidator(ipyplotly.basevalidators.BaseDataValidator):
+
+    def __init__(self, plotly_name='data', parent_name='figure'):
+        super().__init__(
+            class_strs_map={
+                'scatter': 'Scatter',
+                'box': 'Box',
+                'bar': 'Bar',
+                'heatmap': 'Heatmap',
+                'histogram': 'Histogram',
+                'histogram2d': 'Histogram2D',
+                'histogram2dcontour': 'Histogram2Dcontour',
+                'pie': 'Pie',
+                'contour': 'Contour',
+                'scatterternary': 'Scatterternary',
+                'violin': 'Violin',
+                'scatter3d': 'Scatter3D',
+                'surface': 'Surface',
+                'mesh3d': 'Mesh3D',
+                'scattergeo': 'Scattergeo',
+                'choropleth': 'Choropleth',
+                'scattergl': 'Scattergl',
+                'pointcloud': 'Pointcloud',
+                'heatmapgl': 'Heatmapgl',
+                'parcoords': 'Parcoords',
+                'parcats': 'Parcats',
+                'scattermapbox': 'Scattermapbox',
+                'sankey': 'Sankey',
+                'table': 'Table',
+                'carpet': 'Carpet',
+                'scattercarpet': 'Scattercarpet',
+                'contourcarpet': 'Contourcarpet',
+                'ohlc': 'Ohlc',
+                'candlestick': 'Candlestick',
+                'area': 'Area',
+            },
+            plotly_name=plotly_name,
+            parent_name=parent_name
+        )
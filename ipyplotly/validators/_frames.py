@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class FramesValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='frames', parent_name='figure'):
+        from ipyplotly.datatypes import Frame
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Frame)
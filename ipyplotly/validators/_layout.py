@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LayoutValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='layout', parent_name='figure'):
+        from ipyplotly.datatypes import Layout
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Layout)
@@ -0,0 +1,16 @@
+import ipyplotly.basevalidators
+
+
+class TransformsValidator(ipyplotly.basevalidators.BaseTransformsValidator):
+
+    def __init__(self, plotly_name='transforms', parent_name='trace'):
+        super().__init__(
+            class_strs_map={
+                'aggregate': 'Aggregate',
+                'filter': 'Filter',
+                'groupby': 'Groupby',
+                'sort': 'Sort',
+            },
+            plotly_name=plotly_name,
+            parent_name=parent_name
+        )
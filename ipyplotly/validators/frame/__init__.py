@@ -0,0 +1,23 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._group import GroupValidator
+    from ._name import NameValidator
+    from ._traces import TracesValidator
+    from ._baseframe import BaseframeValidator
+    from ._data import DataValidator
+    from ._layout import LayoutValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._group.GroupValidator',
+            '._name.NameValidator',
+            '._traces.TracesValidator',
+            '._baseframe.BaseframeValidator',
+            '._data.DataValidator',
+            '._layout.LayoutValidator',
+        ]
+    )
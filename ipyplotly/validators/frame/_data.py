@@ -0,0 +1,7 @@
+import ipyplotly.validators
+
+
+class DataValidator(ipyplotly.validators.DataValidator):
+
+    def __init__(self, plotly_name='data', parent_name='frame'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name)
@@ -0,0 +1,7 @@
+import ipyplotly.validators
+
+
+class LayoutValidator(ipyplotly.validators.LayoutValidator):
+
+    def __init__(self, plotly_name='layout', parent_name='frame'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name)
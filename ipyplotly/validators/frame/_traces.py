@@ -0,0 +1,10 @@
+import ipyplotly.basevalidators
+
+
+class TracesValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='traces', parent_name='frame'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name)
+
+    def validate_coerce(self, v):
+        return v
@@ -0,0 +1,138 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._font import FontValidator
+    from ._title import TitleValidator
+    from ._titlefont import TitlefontValidator
+    from ._autosize import AutosizeValidator
+    from ._width import WidthValidator
+    from ._height import HeightValidator
+    from ._margin import MarginValidator
+    from ._paper_bgcolor import PaperBgcolorValidator
+    from ._plot_bgcolor import PlotBgcolorValidator
+    from ._separators import SeparatorsValidator
+    from ._hidesources import HidesourcesValidator
+    from ._showlegend import ShowlegendValidator
+    from ._colorway import ColorwayValidator
+    from ._dragmode import DragmodeValidator
+    from ._hovermode import HovermodeValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._calendar import CalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._ternary import TernaryValidator
+    from ._scene import SceneValidator
+    from ._geo import GeoValidator
+    from ._mapbox import MapboxValidator
+    from ._radialaxis import RadialaxisValidator
+    from ._angularaxis import AngularaxisValidator
+    from ._direction import DirectionValidator
+    from ._orientation import OrientationValidator
+    from ._legend import LegendValidator
+    from ._annotations import AnnotationsValidator
+    from ._shapes import ShapesValidator
+    from ._images import ImagesValidator
+    from ._updatemenus import UpdatemenusValidator
+    from ._sliders import SlidersValidator
+    from ._violinmode import ViolinmodeValidator
+    from ._violingap import ViolingapValidator
+    from ._violingroupgap import ViolingroupgapValidator
+    from ._hiddenlabels import HiddenlabelsValidator
+    from ._hiddenlabelssrc import HiddenlabelssrcValidator
+    from ._barmode import BarmodeValidator
+    from ._barnorm import BarnormValidator
+    from ._bargap import BargapValidator
+    from ._bargroupgap import BargroupgapValidator
+    from ._boxmode import BoxmodeValidator
+    from ._boxgap import BoxgapValidator
+    from ._boxgroupgap import BoxgroupgapValidator
+    from . import slider
+    from . import updatemenu
+    from . import image
+    from . import shape
+    from . import annotation
+    from . import legend
+    from . import angularaxis
+    from . import radialaxis
+    from . import mapbox
+    from . import geo
+    from . import scene
+    from . import ternary
+    from . import yaxis
+    from . import xaxis
+    from . import hoverlabel
+    from . import margin
+    from . import titlefont
+    from . import font
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.slider',
+            '.updatemenu',
+            '.image',
+            '.shape',
+            '.annotation',
+            '.legend',
+            '.angularaxis',
+            '.radialaxis',
+            '.mapbox',
+            '.geo',
+            '.scene',
+            '.ternary',
+            '.yaxis',
+            '.xaxis',
+            '.hoverlabel',
+            '.margin',
+            '.titlefont',
+            '.font',
+        ],
+        [
+            '._font.FontValidator',
+            '._title.TitleValidator',
+            '._titlefont.TitlefontValidator',
+            '._autosize.AutosizeValidator',
+            '._width.WidthValidator',
+            '._height.HeightValidator',
+            '._margin.MarginValidator',
+            '._paper_bgcolor.PaperBgcolorValidator',
+            '._plot_bgcolor.PlotBgcolorValidator',
+            '._separators.SeparatorsValidator',
+            '._hidesources.HidesourcesValidator',
+            '._showlegend.ShowlegendValidator',
+            '._colorway.ColorwayValidator',
+            '._dragmode.DragmodeValidator',
+            '._hovermode.HovermodeValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._calendar.CalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._ternary.TernaryValidator',
+            '._scene.SceneValidator',
+            '._geo.GeoValidator',
+            '._mapbox.MapboxValidator',
+            '._radialaxis.RadialaxisValidator',
+            '._angularaxis.AngularaxisValidator',
+            '._direction.DirectionValidator',
+            '._orientation.OrientationValidator',
+            '._legend.LegendValidator',
+            '._annotations.AnnotationsValidator',
+            '._shapes.ShapesValidator',
+            '._images.ImagesValidator',
+            '._updatemenus.UpdatemenusValidator',
+            '._sliders.SlidersValidator',
+            '._violinmode.ViolinmodeValidator',
+            '._violingap.ViolingapValidator',
+            '._violingroupgap.ViolingroupgapValidator',
+            '._hiddenlabels.HiddenlabelsValidator',
+            '._hiddenlabelssrc.HiddenlabelssrcValidator',
+            '._barmode.BarmodeValidator',
+            '._barnorm.BarnormValidator',
+            '._bargap.BargapValidator',
+            '._bargroupgap.BargroupgapValidator',
+            '._boxmode.BoxmodeValidator',
+            '._boxgap.BoxgapValidator',
+            '._boxgroupgap.BoxgroupgapValidator',
+        ]
+    )
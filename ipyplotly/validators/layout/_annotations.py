@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class AnnotationsValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='annotations', parent_name='layout'):
+        from ipyplotly.datatypes.layout import Annotation
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Annotation)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class BarmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='barmode', parent_name='layout'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['stack', 'group', 'overlay', 'relative'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'group', 'overlay', 'relative', 'stack'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
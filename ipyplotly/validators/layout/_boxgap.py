@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class BoxgapValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='boxgap', parent_name='layout'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=0, max=1, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if 0 <= v <= 1:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
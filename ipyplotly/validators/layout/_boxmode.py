@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class BoxmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='boxmode', parent_name='layout'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['group', 'overlay'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'group', 'overlay'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,26 @@
+import ipyplotly.basevalidators
+
+
+class CalendarValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='calendar', parent_name='layout'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[
+                'gregorian', 'chinese', 'coptic', 'discworld', 'ethiopian', 'hebrew', 'islamic', 'julian', 'mayan',
+                'nanakshahi', 'nepali', 'persian', 'jalali', 'taiwan', 'thai', 'ummalqura'
+            ],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {
+                'chinese', 'coptic', 'discworld', 'ethiopian', 'gregorian', 'hebrew', 'islamic', 'jalali', 'julian',
+                'mayan', 'nanakshahi', 'nepali', 'persian', 'taiwan', 'thai', 'ummalqura'
+            }:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
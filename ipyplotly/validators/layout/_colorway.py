@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ColorwayValidator(ipyplotly.basevalidators.ColorlistValidator):
+
+    def __init__(self, plotly_name='colorway', parent_name='layout'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
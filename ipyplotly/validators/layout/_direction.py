@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class DirectionValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='direction', parent_name='layout'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['clockwise', 'counterclockwise'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'clockwise', 'counterclockwise'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class DragmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='dragmode', parent_name='layout'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['zoom', 'pan', 'select', 'lasso', 'orbit', 'turntable'],
+            edit_type='modebar'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'lasso', 'orbit', 'pan', 'select', 'turntable', 'zoom'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class GeoValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='geo', parent_name='layout'):
+        from ipyplotly.datatypes.layout import Geo
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Geo)
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class HiddenlabelsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='hiddenlabels', parent_name='layout'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
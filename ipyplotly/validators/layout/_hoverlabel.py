@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class HoverlabelValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='hoverlabel', parent_name='layout'):
+        from ipyplotly.datatypes.layout import Hoverlabel
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Hoverlabel)
@@ -0,0 +1,897 @@
+# Property paths of layout
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'font': ('', 'FontValidator', 'compound'),
+    'font.family': ('.font', 'FamilyValidator', 'simple'),
+    'font.size': ('.font', 'SizeValidator', 'simple'),
+    'font.color': ('.font', 'ColorValidator', 'simple'),
+    'title': ('', 'TitleValidator', 'simple'),
+    'titlefont': ('', 'TitlefontValidator', 'compound'),
+    'titlefont.family': ('.titlefont', 'FamilyValidator', 'simple'),
+    'titlefont.size': ('.titlefont', 'SizeValidator', 'simple'),
+    'titlefont.color': ('.titlefont', 'ColorValidator', 'simple'),
+    'autosize': ('', 'AutosizeValidator', 'simple'),
+    'width': ('', 'WidthValidator', 'simple'),
+    'height': ('', 'HeightValidator', 'simple'),
+    'margin': ('', 'MarginValidator', 'compound'),
+    'margin.l': ('.margin', 'LValidator', 'simple'),
+    'margin.r': ('.margin', 'RValidator', 'simple'),
+    'margin.t': ('.margin', 'TValidator', 'simple'),
+    'margin.b': ('.margin', 'BValidator', 'simple'),
+    'margin.pad': ('.margin', 'PadValidator', 'simple'),
+    'margin.autoexpand': ('.margin', 'AutoexpandValidator', 'simple'),
+    'paper_bgcolor': ('', 'PaperBgcolorValidator', 'simple'),
+    'plot_bgcolor': ('', 'PlotBgcolorValidator', 'simple'),
+    'separators': ('', 'SeparatorsValidator', 'simple'),
+    'hidesources': ('', 'HidesourcesValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'colorway': ('', 'ColorwayValidator', 'simple'),
+    'dragmode': ('', 'DragmodeValidator', 'simple'),
+    'hovermode': ('', 'HovermodeValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'calendar': ('', 'CalendarValidator', 'simple'),
+    'xaxis': ('', 'XaxisValidator', 'compound'),
+    'xaxis.visible': ('.xaxis', 'VisibleValidator', 'simple'),
+    'xaxis.color': ('.xaxis', 'ColorValidator', 'simple'),
+    'xaxis.title': ('.xaxis', 'TitleValidator', 'simple'),
+    'xaxis.titlefont': ('.xaxis', 'TitlefontValidator', 'compound'),
+    'xaxis.titlefont.family': ('.xaxis.titlefont', 'FamilyValidator', 'simple'),
+    'xaxis.titlefont.size': ('.xaxis.titlefont', 'SizeValidator', 'simple'),
+    'xaxis.titlefont.color': ('.xaxis.titlefont', 'ColorValidator', 'simple'),
+    'xaxis.type': ('.xaxis', 'TypeValidator', 'simple'),
+    'xaxis.autorange': ('.xaxis', 'AutorangeValidator', 'simple'),
+    'xaxis.rangemode': ('.xaxis', 'RangemodeValidator', 'simple'),
+    'xaxis.range': ('.xaxis', 'RangeValidator', 'simple'),
+    'xaxis.fixedrange': ('.xaxis', 'FixedrangeValidator', 'simple'),
+    'xaxis.scaleanchor': ('.xaxis', 'ScaleanchorValidator', 'simple'),
+    'xaxis.scaleratio': ('.xaxis', 'ScaleratioValidator', 'simple'),
+    'xaxis.constrain': ('.xaxis', 'ConstrainValidator', 'simple'),
+    'xaxis.constraintoward': ('.xaxis', 'ConstraintowardValidator', 'simple'),
+    'xaxis.tickmode': ('.xaxis', 'TickmodeValidator', 'simple'),
+    'xaxis.nticks': ('.xaxis', 'NticksValidator', 'simple'),
+    'xaxis.tick0': ('.xaxis', 'Tick0Validator', 'simple'),
+    'xaxis.dtick': ('.xaxis', 'DtickValidator', 'simple'),
+    'xaxis.tickvals': ('.xaxis', 'TickvalsValidator', 'simple'),
+    'xaxis.ticktext': ('.xaxis', 'TicktextValidator', 'simple'),
+    'xaxis.ticks': ('.xaxis', 'TicksValidator', 'simple'),
+    'xaxis.mirror': ('.xaxis', 'MirrorValidator', 'simple'),
+    'xaxis.ticklen': ('.xaxis', 'TicklenValidator', 'simple'),
+    'xaxis.tickwidth': ('.xaxis', 'TickwidthValidator', 'simple'),
+    'xaxis.tickcolor': ('.xaxis', 'TickcolorValidator', 'simple'),
+    'xaxis.showticklabels': ('.xaxis', 'ShowticklabelsValidator', 'simple'),
+    'xaxis.showspikes': ('.xaxis', 'ShowspikesValidator', 'simple'),
+    'xaxis.spikecolor': ('.xaxis', 'SpikecolorValidator', 'simple'),
+    'xaxis.spikethickness': ('.xaxis', 'SpikethicknessValidator', 'simple'),
+    'xaxis.spikedash': ('.xaxis', 'SpikedashValidator', 'simple'),
+    'xaxis.spikemode': ('.xaxis', 'SpikemodeValidator', 'simple'),
+    'xaxis.tickfont': ('.xaxis', 'TickfontValidator', 'compound'),
+    'xaxis.tickfont.family': ('.xaxis.tickfont', 'FamilyValidator', 'simple'),
+    'xaxis.tickfont.size': ('.xaxis.tickfont', 'SizeValidator', 'simple'),
+    'xaxis.tickfont.color': ('.xaxis.tickfont', 'ColorValidator', 'simple'),
+    'xaxis.tickangle': ('.xaxis', 'TickangleValidator', 'simple'),
+    'xaxis.tickprefix': ('.xaxis', 'TickprefixValidator', 'simple'),
+    'xaxis.showtickprefix': ('.xaxis', 'ShowtickprefixValidator', 'simple'),
+    'xaxis.ticksuffix': ('.xaxis', 'TicksuffixValidator', 'simple'),
+    'xaxis.showticksuffix': ('.xaxis', 'ShowticksuffixValidator', 'simple'),
+    'xaxis.showexponent': ('.xaxis', 'ShowexponentValidator', 'simple'),
+    'xaxis.exponentformat': ('.xaxis', 'ExponentformatValidator', 'simple'),
+    'xaxis.separatethousands': ('.xaxis', 'SeparatethousandsValidator', 'simple'),
+    'xaxis.tickformat': ('.xaxis', 'TickformatValidator', 'simple'),
+    'xaxis.tickformatstops': ('.xaxis', 'TickformatstopsValidator', 'compound_array'),
+    'xaxis.tickformatstops.dtickrange': ('.xaxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'xaxis.tickformatstops.value': ('.xaxis.tickformatstop', 'ValueValidator', 'simple'),
+    'xaxis.hoverformat': ('.xaxis', 'HoverformatValidator', 'simple'),
+    'xaxis.showline': ('.xaxis', 'ShowlineValidator', 'simple'),
+    'xaxis.linecolor': ('.xaxis', 'LinecolorValidator', 'simple'),
+    'xaxis.linewidth': ('.xaxis', 'LinewidthValidator', 'simple'),
+    'xaxis.showgrid': ('.xaxis', 'ShowgridValidator', 'simple'),
+    'xaxis.gridcolor': ('.xaxis', 'GridcolorValidator', 'simple'),
+    'xaxis.gridwidth': ('.xaxis', 'GridwidthValidator', 'simple'),
+    'xaxis.zeroline': ('.xaxis', 'ZerolineValidator', 'simple'),
+    'xaxis.zerolinecolor': ('.xaxis', 'ZerolinecolorValidator', 'simple'),
+    'xaxis.zerolinewidth': ('.xaxis', 'ZerolinewidthValidator', 'simple'),
+    'xaxis.anchor': ('.xaxis', 'AnchorValidator', 'simple'),
+    'xaxis.side': ('.xaxis', 'SideValidator', 'simple'),
+    'xaxis.overlaying': ('.xaxis', 'OverlayingValidator', 'simple'),
+    'xaxis.layer': ('.xaxis', 'LayerValidator', 'simple'),
+    'xaxis.domain': ('.xaxis', 'DomainValidator', 'simple'),
+    'xaxis.position': ('.xaxis', 'PositionValidator', 'simple'),
+    'xaxis.categoryorder': ('.xaxis', 'CategoryorderValidator', 'simple'),
+    'xaxis.categoryarray': ('.xaxis', 'CategoryarrayValidator', 'simple'),
+    'xaxis.rangeslider': ('.xaxis', 'RangesliderValidator', 'compound'),
+    'xaxis.rangeslider.bgcolor': ('.xaxis.rangeslider', 'BgcolorValidator', 'simple'),
+    'xaxis.rangeslider.bordercolor': ('.xaxis.rangeslider', 'BordercolorValidator', 'simple'),
+    'xaxis.rangeslider.borderwidth': ('.xaxis.rangeslider', 'BorderwidthValidator', 'simple'),
+    'xaxis.rangeslider.autorange': ('.xaxis.rangeslider', 'AutorangeValidator', 'simple'),
+    'xaxis.rangeslider.range': ('.xaxis.rangeslider', 'RangeValidator', 'simple'),
+    'xaxis.rangeslider.thickness': ('.xaxis.rangeslider', 'ThicknessValidator', 'simple'),
+    'xaxis.rangeslider.visible': ('.xaxis.rangeslider', 'VisibleValidator', 'simple'),
+    'xaxis.rangeselector': ('.xaxis', 'RangeselectorValidator', 'compound'),
+    'xaxis.rangeselector.visible': ('.xaxis.rangeselector', 'VisibleValidator', 'simple'),
+    'xaxis.rangeselector.buttons': ('.xaxis.rangeselector', 'ButtonsValidator', 'compound_array'),
+    'xaxis.rangeselector.buttons.step': ('.xaxis.rangeselector.button', 'StepValidator', 'simple'),
+    'xaxis.rangeselector.buttons.stepmode': ('.xaxis.rangeselector.button', 'StepmodeValidator', 'simple'),
+    'xaxis.rangeselector.buttons.count': ('.xaxis.rangeselector.button', 'CountValidator', 'simple'),
+    'xaxis.rangeselector.buttons.label': ('.xaxis.rangeselector.button', 'LabelValidator', 'simple'),
+    'xaxis.rangeselector.x': ('.xaxis.rangeselector', 'XValidator', 'simple'),
+    'xaxis.rangeselector.xanchor': ('.xaxis.rangeselector', 'XanchorValidator', 'simple'),
+    'xaxis.rangeselector.y': ('.xaxis.rangeselector', 'YValidator', 'simple'),
+    'xaxis.rangeselector.yanchor': ('.xaxis.rangeselector', 'YanchorValidator', 'simple'),
+    'xaxis.rangeselector.font': ('.xaxis.rangeselector', 'FontValidator', 'compound'),
+    'xaxis.rangeselector.font.family': ('.xaxis.rangeselector.font', 'FamilyValidator', 'simple'),
+    'xaxis.rangeselector.font.size': ('.xaxis.rangeselector.font', 'SizeValidator', 'simple'),
+    'xaxis.rangeselector.font.color': ('.xaxis.rangeselector.font', 'ColorValidator', 'simple'),
+    'xaxis.rangeselector.bgcolor': ('.xaxis.rangeselector', 'BgcolorValidator', 'simple'),
+    'xaxis.rangeselector.activecolor': ('.xaxis.rangeselector', 'ActivecolorValidator', 'simple'),
+    'xaxis.rangeselector.bordercolor': ('.xaxis.rangeselector', 'BordercolorValidator', 'simple'),
+    'xaxis.rangeselector.borderwidth': ('.xaxis.rangeselector', 'BorderwidthValidator', 'simple'),
+    'xaxis.calendar': ('.xaxis', 'CalendarValidator', 'simple'),
+    'xaxis.tickvalssrc': ('.xaxis', 'TickvalssrcValidator', 'simple'),
+    'xaxis.ticktextsrc': ('.xaxis', 'TicktextsrcValidator', 'simple'),
+    'xaxis.categoryarraysrc': ('.xaxis', 'CategoryarraysrcValidator', 'simple'),
+    'yaxis': ('', 'YaxisValidator', 'compound'),
+    'yaxis.visible': ('.yaxis', 'VisibleValidator', 'simple'),
+    'yaxis.color': ('.yaxis', 'ColorValidator', 'simple'),
+    'yaxis.title': ('.yaxis', 'TitleValidator', 'simple'),
+    'yaxis.titlefont': ('.yaxis', 'TitlefontValidator', 'compound'),
+    'yaxis.titlefont.family': ('.yaxis.titlefont', 'FamilyValidator', 'simple'),
+    'yaxis.titlefont.size': ('.yaxis.titlefont', 'SizeValidator', 'simple'),
+    'yaxis.titlefont.color': ('.yaxis.titlefont', 'ColorValidator', 'simple'),
+    'yaxis.type': ('.yaxis', 'TypeValidator', 'simple'),
+    'yaxis.autorange': ('.yaxis', 'AutorangeValidator', 'simple'),
+    'yaxis.rangemode': ('.yaxis', 'RangemodeValidator', 'simple'),
+    'yaxis.range': ('.yaxis', 'RangeValidator', 'simple'),
+    'yaxis.fixedrange': ('.yaxis', 'FixedrangeValidator', 'simple'),
+    'yaxis.scaleanchor': ('.yaxis', 'ScaleanchorValidator', 'simple'),
+    'yaxis.scaleratio': ('.yaxis', 'ScaleratioValidator', 'simple'),
+    'yaxis.constrain': ('.yaxis', 'ConstrainValidator', 'simple'),
+    'yaxis.constraintoward': ('.yaxis', 'ConstraintowardValidator', 'simple'),
+    'yaxis.tickmode': ('.yaxis', 'TickmodeValidator', 'simple'),
+    'yaxis.nticks': ('.yaxis', 'NticksValidator', 'simple'),
+    'yaxis.tick0': ('.yaxis', 'Tick0Validator', 'simple'),
+    'yaxis.dtick': ('.yaxis', 'DtickValidator', 'simple'),
+    'yaxis.tickvals': ('.yaxis', 'TickvalsValidator', 'simple'),
+    'yaxis.ticktext': ('.yaxis', 'TicktextValidator', 'simple'),
+    'yaxis.ticks': ('.yaxis', 'TicksValidator', 'simple'),
+    'yaxis.mirror': ('.yaxis', 'MirrorValidator', 'simple'),
+    'yaxis.ticklen': ('.yaxis', 'TicklenValidator', 'simple'),
+    'yaxis.tickwidth': ('.yaxis', 'TickwidthValidator', 'simple'),
+    'yaxis.tickcolor': ('.yaxis', 'TickcolorValidator', 'simple'),
+    'yaxis.showticklabels': ('.yaxis', 'ShowticklabelsValidator', 'simple'),
+    'yaxis.showspikes': ('.yaxis', 'ShowspikesValidator', 'simple'),
+    'yaxis.spikecolor': ('.yaxis', 'SpikecolorValidator', 'simple'),
+    'yaxis.spikethickness': ('.yaxis', 'SpikethicknessValidator', 'simple'),
+    'yaxis.spikedash': ('.yaxis', 'SpikedashValidator', 'simple'),
+    'yaxis.spikemode': ('.yaxis', 'SpikemodeValidator', 'simple'),
+    'yaxis.tickfont': ('.yaxis', 'TickfontValidator', 'compound'),
+    'yaxis.tickfont.family': ('.yaxis.tickfont', 'FamilyValidator', 'simple'),
+    'yaxis.tickfont.size': ('.yaxis.tickfont', 'SizeValidator', 'simple'),
+    'yaxis.tickfont.color': ('.yaxis.tickfont', 'ColorValidator', 'simple'),
+    'yaxis.tickangle': ('.yaxis', 'TickangleValidator', 'simple'),
+    'yaxis.tickprefix': ('.yaxis', 'TickprefixValidator', 'simple'),
+    'yaxis.showtickprefix': ('.yaxis', 'ShowtickprefixValidator', 'simple'),
+    'yaxis.ticksuffix': ('.yaxis', 'TicksuffixValidator', 'simple'),
+    'yaxis.showticksuffix': ('.yaxis', 'ShowticksuffixValidator', 'simple'),
+    'yaxis.showexponent': ('.yaxis', 'ShowexponentValidator', 'simple'),
+    'yaxis.exponentformat': ('.yaxis', 'ExponentformatValidator', 'simple'),
+    'yaxis.separatethousands': ('.yaxis', 'SeparatethousandsValidator', 'simple'),
+    'yaxis.tickformat': ('.yaxis', 'TickformatValidator', 'simple'),
+    'yaxis.tickformatstops': ('.yaxis', 'TickformatstopsValidator', 'compound_array'),
+    'yaxis.tickformatstops.dtickrange': ('.yaxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'yaxis.tickformatstops.value': ('.yaxis.tickformatstop', 'ValueValidator', 'simple'),
+    'yaxis.hoverformat': ('.yaxis', 'HoverformatValidator', 'simple'),
+    'yaxis.showline': ('.yaxis', 'ShowlineValidator', 'simple'),
+    'yaxis.linecolor': ('.yaxis', 'LinecolorValidator', 'simple'),
+    'yaxis.linewidth': ('.yaxis', 'LinewidthValidator', 'simple'),
+    'yaxis.showgrid': ('.yaxis', 'ShowgridValidator', 'simple'),
+    'yaxis.gridcolor': ('.yaxis', 'GridcolorValidator', 'simple'),
+    'yaxis.gridwidth': ('.yaxis', 'GridwidthValidator', 'simple'),
+    'yaxis.zeroline': ('.yaxis', 'ZerolineValidator', 'simple'),
+    'yaxis.zerolinecolor': ('.yaxis', 'ZerolinecolorValidator', 'simple'),
+    'yaxis.zerolinewidth': ('.yaxis', 'ZerolinewidthValidator', 'simple'),
+    'yaxis.anchor': ('.yaxis', 'AnchorValidator', 'simple'),
+    'yaxis.side': ('.yaxis', 'SideValidator', 'simple'),
+    'yaxis.overlaying': ('.yaxis', 'OverlayingValidator', 'simple'),
+    'yaxis.layer': ('.yaxis', 'LayerValidator', 'simple'),
+    'yaxis.domain': ('.yaxis', 'DomainValidator', 'simple'),
+    'yaxis.position': ('.yaxis', 'PositionValidator', 'simple'),
+    'yaxis.categoryorder': ('.yaxis', 'CategoryorderValidator', 'simple'),
+    'yaxis.categoryarray': ('.yaxis', 'CategoryarrayValidator', 'simple'),
+    'yaxis.calendar': ('.yaxis', 'CalendarValidator', 'simple'),
+    'yaxis.tickvalssrc': ('.yaxis', 'TickvalssrcValidator', 'simple'),
+    'yaxis.ticktextsrc': ('.yaxis', 'TicktextsrcValidator', 'simple'),
+    'yaxis.categoryarraysrc': ('.yaxis', 'CategoryarraysrcValidator', 'simple'),
+    'ternary': ('', 'TernaryValidator', 'compound'),
+    'ternary.domain': ('.ternary', 'DomainValidator', 'compound'),
+    'ternary.domain.x': ('.ternary.domain', 'XValidator', 'simple'),
+    'ternary.domain.y': ('.ternary.domain', 'YValidator', 'simple'),
+    'ternary.bgcolor': ('.ternary', 'BgcolorValidator', 'simple'),
+    'ternary.sum': ('.ternary', 'SumValidator', 'simple'),
+    'ternary.aaxis': ('.ternary', 'AaxisValidator', 'compound'),
+    'ternary.aaxis.title': ('.ternary.aaxis', 'TitleValidator', 'simple'),
+    'ternary.aaxis.titlefont': ('.ternary.aaxis', 'TitlefontValidator', 'compound'),
+    'ternary.aaxis.titlefont.family': ('.ternary.aaxis.titlefont', 'FamilyValidator', 'simple'),
+    'ternary.aaxis.titlefont.size': ('.ternary.aaxis.titlefont', 'SizeValidator', 'simple'),
+    'ternary.aaxis.titlefont.color': ('.ternary.aaxis.titlefont', 'ColorValidator', 'simple'),
+    'ternary.aaxis.color': ('.ternary.aaxis', 'ColorValidator', 'simple'),
+    'ternary.aaxis.tickmode': ('.ternary.aaxis', 'TickmodeValidator', 'simple'),
+    'ternary.aaxis.nticks': ('.ternary.aaxis', 'NticksValidator', 'simple'),
+    'ternary.aaxis.tick0': ('.ternary.aaxis', 'Tick0Validator', 'simple'),
+    'ternary.aaxis.dtick': ('.ternary.aaxis', 'DtickValidator', 'simple'),
+    'ternary.aaxis.tickvals': ('.ternary.aaxis', 'TickvalsValidator', 'simple'),
+    'ternary.aaxis.ticktext': ('.ternary.aaxis', 'TicktextValidator', 'simple'),
+    'ternary.aaxis.ticks': ('.ternary.aaxis', 'TicksValidator', 'simple'),
+    'ternary.aaxis.ticklen': ('.ternary.aaxis', 'TicklenValidator', 'simple'),
+    'ternary.aaxis.tickwidth': ('.ternary.aaxis', 'TickwidthValidator', 'simple'),
+    'ternary.aaxis.tickcolor': ('.ternary.aaxis', 'TickcolorValidator', 'simple'),
+    'ternary.aaxis.showticklabels': ('.ternary.aaxis', 'ShowticklabelsValidator', 'simple'),
+    'ternary.aaxis.showtickprefix': ('.ternary.aaxis', 'ShowtickprefixValidator', 'simple'),
+    'ternary.aaxis.tickprefix': ('.ternary.aaxis', 'TickprefixValidator', 'simple'),
+    'ternary.aaxis.showticksuffix': ('.ternary.aaxis', 'ShowticksuffixValidator', 'simple'),
+    'ternary.aaxis.ticksuffix': ('.ternary.aaxis', 'TicksuffixValidator', 'simple'),
+    'ternary.aaxis.showexponent': ('.ternary.aaxis', 'ShowexponentValidator', 'simple'),
+    'ternary.aaxis.exponentformat': ('.ternary.aaxis', 'ExponentformatValidator', 'simple'),
+    'ternary.aaxis.separatethousands': ('.ternary.aaxis', 'SeparatethousandsValidator', 'simple'),
+    'ternary.aaxis.tickfont': ('.ternary.aaxis', 'TickfontValidator', 'compound'),
+    'ternary.aaxis.tickfont.family': ('.ternary.aaxis.tickfont', 'FamilyValidator', 'simple'),
+    'ternary.aaxis.tickfont.size': ('.ternary.aaxis.tickfont', 'SizeValidator', 'simple'),
+    'ternary.aaxis.tickfont.color': ('.ternary.aaxis.tickfont', 'ColorValidator', 'simple'),
+    'ternary.aaxis.tickangle': ('.ternary.aaxis', 'TickangleValidator', 'simple'),
+    'ternary.aaxis.tickformat': ('.ternary.aaxis', 'TickformatValidator', 'simple'),
+    'ternary.aaxis.tickformatstops': ('.ternary.aaxis', 'TickformatstopsValidator', 'compound_array'),
+    'ternary.aaxis.tickformatstops.dtickrange': ('.ternary.aaxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'ternary.aaxis.tickformatstops.value': ('.ternary.aaxis.tickformatstop', 'ValueValidator', 'simple'),
+    'ternary.aaxis.hoverformat': ('.ternary.aaxis', 'HoverformatValidator', 'simple'),
+    'ternary.aaxis.showline': ('.ternary.aaxis', 'ShowlineValidator', 'simple'),
+    'ternary.aaxis.linecolor': ('.ternary.aaxis', 'LinecolorValidator', 'simple'),
+    'ternary.aaxis.linewidth': ('.ternary.aaxis', 'LinewidthValidator', 'simple'),
+    'ternary.aaxis.showgrid': ('.ternary.aaxis', 'ShowgridValidator', 'simple'),
+    'ternary.aaxis.gridcolor': ('.ternary.aaxis', 'GridcolorValidator', 'simple'),
+    'ternary.aaxis.gridwidth': ('.ternary.aaxis', 'GridwidthValidator', 'simple'),
+    'ternary.aaxis.layer': ('.ternary.aaxis', 'LayerValidator', 'simple'),
+    'ternary.aaxis.min': ('.ternary.aaxis', 'MinValidator', 'simple'),
+    'ternary.aaxis.tickvalssrc': ('.ternary.aaxis', 'TickvalssrcValidator', 'simple'),
+    'ternary.aaxis.ticktextsrc': ('.ternary.aaxis', 'TicktextsrcValidator', 'simple'),
+    'ternary.baxis': ('.ternary', 'BaxisValidator', 'compound'),
+    'ternary.baxis.title': ('.ternary.baxis', 'TitleValidator', 'simple'),
+    'ternary.baxis.titlefont': ('.ternary.baxis', 'TitlefontValidator', 'compound'),
+    'ternary.baxis.titlefont.family': ('.ternary.baxis.titlefont', 'FamilyValidator', 'simple'),
+    'ternary.baxis.titlefont.size': ('.ternary.baxis.titlefont', 'SizeValidator', 'simple'),
+    'ternary.baxis.titlefont.color': ('.ternary.baxis.titlefont', 'ColorValidator', 'simple'),
+    'ternary.baxis.color': ('.ternary.baxis', 'ColorValidator', 'simple'),
+    'ternary.baxis.tickmode': ('.ternary.baxis', 'TickmodeValidator', 'simple'),
+    'ternary.baxis.nticks': ('.ternary.baxis', 'NticksValidator', 'simple'),
+    'ternary.baxis.tick0': ('.ternary.baxis', 'Tick0Validator', 'simple'),
+    'ternary.baxis.dtick': ('.ternary.baxis', 'DtickValidator', 'simple'),
+    'ternary.baxis.tickvals': ('.ternary.baxis', 'TickvalsValidator', 'simple'),
+    'ternary.baxis.ticktext': ('.ternary.baxis', 'TicktextValidator', 'simple'),
+    'ternary.baxis.ticks': ('.ternary.baxis', 'TicksValidator', 'simple'),
+    'ternary.baxis.ticklen': ('.ternary.baxis', 'TicklenValidator', 'simple'),
+    'ternary.baxis.tickwidth': ('.ternary.baxis', 'TickwidthValidator', 'simple'),
+    'ternary.baxis.tickcolor': ('.ternary.baxis', 'TickcolorValidator', 'simple'),
+    'ternary.baxis.showticklabels': ('.ternary.baxis', 'ShowticklabelsValidator', 'simple'),
+    'ternary.baxis.showtickprefix': ('.ternary.baxis', 'ShowtickprefixValidator', 'simple'),
+    'ternary.baxis.tickprefix': ('.ternary.baxis', 'TickprefixValidator', 'simple'),
+    'ternary.baxis.showticksuffix': ('.ternary.baxis', 'ShowticksuffixValidator', 'simple'),
+    'ternary.baxis.ticksuffix': ('.ternary.baxis', 'TicksuffixValidator', 'simple'),
+    'ternary.baxis.showexponent': ('.ternary.baxis', 'ShowexponentValidator', 'simple'),
+    'ternary.baxis.exponentformat': ('.ternary.baxis', 'ExponentformatValidator', 'simple'),
+    'ternary.baxis.separatethousands': ('.ternary.baxis', 'SeparatethousandsValidator', 'simple'),
+    'ternary.baxis.tickfont': ('.ternary.baxis', 'TickfontValidator', 'compound'),
+    'ternary.baxis.tickfont.family': ('.ternary.baxis.tickfont', 'FamilyValidator', 'simple'),
+    'ternary.baxis.tickfont.size': ('.ternary.baxis.tickfont', 'SizeValidator', 'simple'),
+    'ternary.baxis.tickfont.color': ('.ternary.baxis.tickfont', 'ColorValidator', 'simple'),
+    'ternary.baxis.tickangle': ('.ternary.baxis', 'TickangleValidator', 'simple'),
+    'ternary.baxis.tickformat': ('.ternary.baxis', 'TickformatValidator', 'simple'),
+    'ternary.baxis.tickformatstops': ('.ternary.baxis', 'TickformatstopsValidator', 'compound_array'),
+    'ternary.baxis.tickformatstops.dtickrange': ('.ternary.baxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'ternary.baxis.tickformatstops.value': ('.ternary.baxis.tickformatstop', 'ValueValidator', 'simple'),
+    'ternary.baxis.hoverformat': ('.ternary.baxis', 'HoverformatValidator', 'simple'),
+    'ternary.baxis.showline': ('.ternary.baxis', 'ShowlineValidator', 'simple'),
+    'ternary.baxis.linecolor': ('.ternary.baxis', 'LinecolorValidator', 'simple'),
+    'ternary.baxis.linewidth': ('.ternary.baxis', 'LinewidthValidator', 'simple'),
+    'ternary.baxis.showgrid': ('.ternary.baxis', 'ShowgridValidator', 'simple'),
+    'ternary.baxis.gridcolor': ('.ternary.baxis', 'GridcolorValidator', 'simple'),
+    'ternary.baxis.gridwidth': ('.ternary.baxis', 'GridwidthValidator', 'simple'),
+    'ternary.baxis.layer': ('.ternary.baxis', 'LayerValidator', 'simple'),
+    'ternary.baxis.min': ('.ternary.baxis', 'MinValidator', 'simple'),
+    'ternary.baxis.tickvalssrc': ('.ternary.baxis', 'TickvalssrcValidator', 'simple'),
+    'ternary.baxis.ticktextsrc': ('.ternary.baxis', 'TicktextsrcValidator', 'simple'),
+    'ternary.caxis': ('.ternary', 'CaxisValidator', 'compound'),
+    'ternary.caxis.title': ('.ternary.caxis', 'TitleValidator', 'simple'),
+    'ternary.caxis.titlefont': ('.ternary.caxis', 'TitlefontValidator', 'compound'),
+    'ternary.caxis.titlefont.family': ('.ternary.caxis.titlefont', 'FamilyValidator', 'simple'),
+    'ternary.caxis.titlefont.size': ('.ternary.caxis.titlefont', 'SizeValidator', 'simple'),
+    'ternary.caxis.titlefont.color': ('.ternary.caxis.titlefont', 'ColorValidator', 'simple'),
+    'ternary.caxis.color': ('.ternary.caxis', 'ColorValidator', 'simple'),
+    'ternary.caxis.tickmode': ('.ternary.caxis', 'TickmodeValidator', 'simple'),
+    'ternary.caxis.nticks': ('.ternary.caxis', 'NticksValidator', 'simple'),
+    'ternary.caxis.tick0': ('.ternary.caxis', 'Tick0Validator', 'simple'),
+    'ternary.caxis.dtick': ('.ternary.caxis', 'DtickValidator', 'simple'),
+    'ternary.caxis.tickvals': ('.ternary.caxis', 'TickvalsValidator', 'simple'),
+    'ternary.caxis.ticktext': ('.ternary.caxis', 'TicktextValidator', 'simple'),
+    'ternary.caxis.ticks': ('.ternary.caxis', 'TicksValidator', 'simple'),
+    'ternary.caxis.ticklen': ('.ternary.caxis', 'TicklenValidator', 'simple'),
+    'ternary.caxis.tickwidth': ('.ternary.caxis', 'TickwidthValidator', 'simple'),
+    'ternary.caxis.tickcolor': ('.ternary.caxis', 'TickcolorValidator', 'simple'),
+    'ternary.caxis.showticklabels': ('.ternary.caxis', 'ShowticklabelsValidator', 'simple'),
+    'ternary.caxis.showtickprefix': ('.ternary.caxis', 'ShowtickprefixValidator', 'simple'),
+    'ternary.caxis.tickprefix': ('.ternary.caxis', 'TickprefixValidator', 'simple'),
+    'ternary.caxis.showticksuffix': ('.ternary.caxis', 'ShowticksuffixValidator', 'simple'),
+    'ternary.caxis.ticksuffix': ('.ternary.caxis', 'TicksuffixValidator', 'simple'),
+    'ternary.caxis.showexponent': ('.ternary.caxis', 'ShowexponentValidator', 'simple'),
+    'ternary.caxis.exponentformat': ('.ternary.caxis', 'ExponentformatValidator', 'simple'),
+    'ternary.caxis.separatethousands': ('.ternary.caxis', 'SeparatethousandsValidator', 'simple'),
+    'ternary.caxis.tickfont': ('.ternary.caxis', 'TickfontValidator', 'compound'),
+    'ternary.caxis.tickfont.family': ('.ternary.caxis.tickfont', 'FamilyValidator', 'simple'),
+    'ternary.caxis.tickfont.size': ('.ternary.caxis.tickfont', 'SizeValidator', 'simple'),
+    'ternary.caxis.tickfont.color': ('.ternary.caxis.tickfont', 'ColorValidator', 'simple'),
+    'ternary.caxis.tickangle': ('.ternary.caxis', 'TickangleValidator', 'simple'),
+    'ternary.caxis.tickformat': ('.ternary.caxis', 'TickformatValidator', 'simple'),
+    'ternary.caxis.tickformatstops': ('.ternary.caxis', 'TickformatstopsValidator', 'compound_array'),
+    'ternary.caxis.tickformatstops.dtickrange': ('.ternary.caxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'ternary.caxis.tickformatstops.value': ('.ternary.caxis.tickformatstop', 'ValueValidator', 'simple'),
+    'ternary.caxis.hoverformat': ('.ternary.caxis', 'HoverformatValidator', 'simple'),
+    'ternary.caxis.showline': ('.ternary.caxis', 'ShowlineValidator', 'simple'),
+    'ternary.caxis.linecolor': ('.ternary.caxis', 'LinecolorValidator', 'simple'),
+    'ternary.caxis.linewidth': ('.ternary.caxis', 'LinewidthValidator', 'simple'),
+    'ternary.caxis.showgrid': ('.ternary.caxis', 'ShowgridValidator', 'simple'),
+    'ternary.caxis.gridcolor': ('.ternary.caxis', 'GridcolorValidator', 'simple'),
+    'ternary.caxis.gridwidth': ('.ternary.caxis', 'GridwidthValidator', 'simple'),
+    'ternary.caxis.layer': ('.ternary.caxis', 'LayerValidator', 'simple'),
+    'ternary.caxis.min': ('.ternary.caxis', 'MinValidator', 'simple'),
+    'ternary.caxis.tickvalssrc': ('.ternary.caxis', 'TickvalssrcValidator', 'simple'),
+    'ternary.caxis.ticktextsrc': ('.ternary.caxis', 'TicktextsrcValidator', 'simple'),
+    'scene': ('', 'SceneValidator', 'compound'),
+    'scene.bgcolor': ('.scene', 'BgcolorValidator', 'simple'),
+    'scene.camera': ('.scene', 'CameraValidator', 'compound'),
+    'scene.camera.up': ('.scene.camera', 'UpValidator', 'compound'),
+    'scene.camera.up.x': ('.scene.camera.up', 'XValidator', 'simple'),
+    'scene.camera.up.y': ('.scene.camera.up', 'YValidator', 'simple'),
+    'scene.camera.up.z': ('.scene.camera.up', 'ZValidator', 'simple'),
+    'scene.camera.center': ('.scene.camera', 'CenterValidator', 'compound'),
+    'scene.camera.center.x': ('.scene.camera.center', 'XValidator', 'simple'),
+    'scene.camera.center.y': ('.scene.camera.center', 'YValidator', 'simple'),
+    'scene.camera.center.z': ('.scene.camera.center', 'ZValidator', 'simple'),
+    'scene.camera.eye': ('.scene.camera', 'EyeValidator', 'compound'),
+    'scene.camera.eye.x': ('.scene.camera.eye', 'XValidator', 'simple'),
+    'scene.camera.eye.y': ('.scene.camera.eye', 'YValidator', 'simple'),
+    'scene.camera.eye.z': ('.scene.camera.eye', 'ZValidator', 'simple'),
+    'scene.domain': ('.scene', 'DomainValidator', 'compound'),
+    'scene.domain.x': ('.scene.domain', 'XValidator', 'simple'),
+    'scene.domain.y': ('.scene.domain', 'YValidator', 'simple'),
+    'scene.aspectmode': ('.scene', 'AspectmodeValidator', 'simple'),
+    'scene.aspectratio': ('.scene', 'AspectratioValidator', 'compound'),
+    'scene.aspectratio.x': ('.scene.aspectratio', 'XValidator', 'simple'),
+    'scene.aspectratio.y': ('.scene.aspectratio', 'YValidator', 'simple'),
+    'scene.aspectratio.z': ('.scene.aspectratio', 'ZValidator', 'simple'),
+    'scene.xaxis': ('.scene', 'XaxisValidator', 'compound'),
+    'scene.xaxis.visible': ('.scene.xaxis', 'VisibleValidator', 'simple'),
+    'scene.xaxis.showspikes': ('.scene.xaxis', 'ShowspikesValidator', 'simple'),
+    'scene.xaxis.spikesides': ('.scene.xaxis', 'SpikesidesValidator', 'simple'),
+    'scene.xaxis.spikethickness': ('.scene.xaxis', 'SpikethicknessValidator', 'simple'),
+    'scene.xaxis.spikecolor': ('.scene.xaxis', 'SpikecolorValidator', 'simple'),
+    'scene.xaxis.showbackground': ('.scene.xaxis', 'ShowbackgroundValidator', 'simple'),
+    'scene.xaxis.backgroundcolor': ('.scene.xaxis', 'BackgroundcolorValidator', 'simple'),
+    'scene.xaxis.showaxeslabels': ('.scene.xaxis', 'ShowaxeslabelsValidator', 'simple'),
+    'scene.xaxis.color': ('.scene.xaxis', 'ColorValidator', 'simple'),
+    'scene.xaxis.categoryorder': ('.scene.xaxis', 'CategoryorderValidator', 'simple'),
+    'scene.xaxis.categoryarray': ('.scene.xaxis', 'CategoryarrayValidator', 'simple'),
+    'scene.xaxis.title': ('.scene.xaxis', 'TitleValidator', 'simple'),
+    'scene.xaxis.titlefont': ('.scene.xaxis', 'TitlefontValidator', 'compound'),
+    'scene.xaxis.titlefont.family': ('.scene.xaxis.titlefont', 'FamilyValidator', 'simple'),
+    'scene.xaxis.titlefont.size': ('.scene.xaxis.titlefont', 'SizeValidator', 'simple'),
+    'scene.xaxis.titlefont.color': ('.scene.xaxis.titlefont', 'ColorValidator', 'simple'),
+    'scene.xaxis.type': ('.scene.xaxis', 'TypeValidator', 'simple'),
+    'scene.xaxis.autorange': ('.scene.xaxis', 'AutorangeValidator', 'simple'),
+    'scene.xaxis.rangemode': ('.scene.xaxis', 'RangemodeValidator', 'simple'),
+    'scene.xaxis.range': ('.scene.xaxis', 'RangeValidator', 'simple'),
+    'scene.xaxis.tickmode': ('.scene.xaxis', 'TickmodeValidator', 'simple'),
+    'scene.xaxis.nticks': ('.scene.xaxis', 'NticksValidator', 'simple'),
+    'scene.xaxis.tick0': ('.scene.xaxis', 'Tick0Validator', 'simple'),
+    'scene.xaxis.dtick': ('.scene.xaxis', 'DtickValidator', 'simple'),
+    'scene.xaxis.tickvals': ('.scene.xaxis', 'TickvalsValidator', 'simple'),
+    'scene.xaxis.ticktext': ('.scene.xaxis', 'TicktextValidator', 'simple'),
+    'scene.xaxis.ticks': ('.scene.xaxis', 'TicksValidator', 'simple'),
+    'scene.xaxis.mirror': ('.scene.xaxis', 'MirrorValidator', 'simple'),
+    'scene.xaxis.ticklen': ('.scene.xaxis', 'TicklenValidator', 'simple'),
+    'scene.xaxis.tickwidth': ('.scene.xaxis', 'TickwidthValidator', 'simple'),
+    'scene.xaxis.tickcolor': ('.scene.xaxis', 'TickcolorValidator', 'simple'),
+    'scene.xaxis.showticklabels': ('.scene.xaxis', 'ShowticklabelsValidator', 'simple'),
+    'scene.xaxis.tickfont': ('.scene.xaxis', 'TickfontValidator', 'compound'),
+    'scene.xaxis.tickfont.family': ('.scene.xaxis.tickfont', 'FamilyValidator', 'simple'),
+    'scene.xaxis.tickfont.size': ('.scene.xaxis.tickfont', 'SizeValidator', 'simple'),
+    'scene.xaxis.tickfont.color': ('.scene.xaxis.tickfont', 'ColorValidator', 'simple'),
+    'scene.xaxis.tickangle': ('.scene.xaxis', 'TickangleValidator', 'simple'),
+    'scene.xaxis.tickprefix': ('.scene.xaxis', 'TickprefixValidator', 'simple'),
+    'scene.xaxis.showtickprefix': ('.scene.xaxis', 'ShowtickprefixValidator', 'simple'),
+    'scene.xaxis.ticksuffix': ('.scene.xaxis', 'TicksuffixValidator', 'simple'),
+    'scene.xaxis.showticksuffix': ('.scene.xaxis', 'ShowticksuffixValidator', 'simple'),
+    'scene.xaxis.showexponent': ('.scene.xaxis', 'ShowexponentValidator', 'simple'),
+    'scene.xaxis.exponentformat': ('.scene.xaxis', 'ExponentformatValidator', 'simple'),
+    'scene.xaxis.separatethousands': ('.scene.xaxis', 'SeparatethousandsValidator', 'simple'),
+    'scene.xaxis.tickformat': ('.scene.xaxis', 'TickformatValidator', 'simple'),
+    'scene.xaxis.tickformatstops': ('.scene.xaxis', 'TickformatstopsValidator', 'compound_array'),
+    'scene.xaxis.tickformatstops.dtickrange': ('.scene.xaxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'scene.xaxis.tickformatstops.value': ('.scene.xaxis.tickformatstop', 'ValueValidator', 'simple'),
+    'scene.xaxis.hoverformat': ('.scene.xaxis', 'HoverformatValidator', 'simple'),
+    'scene.xaxis.showline': ('.scene.xaxis', 'ShowlineValidator', 'simple'),
+    'scene.xaxis.linecolor': ('.scene.xaxis', 'LinecolorValidator', 'simple'),
+    'scene.xaxis.linewidth': ('.scene.xaxis', 'LinewidthValidator', 'simple'),
+    'scene.xaxis.showgrid': ('.scene.xaxis', 'ShowgridValidator', 'simple'),
+    'scene.xaxis.gridcolor': ('.scene.xaxis', 'GridcolorValidator', 'simple'),
+    'scene.xaxis.gridwidth': ('.scene.xaxis', 'GridwidthValidator', 'simple'),
+    'scene.xaxis.zeroline': ('.scene.xaxis', 'ZerolineValidator', 'simple'),
+    'scene.xaxis.zerolinecolor': ('.scene.xaxis', 'ZerolinecolorValidator', 'simple'),
+    'scene.xaxis.zerolinewidth': ('.scene.xaxis', 'ZerolinewidthValidator', 'simple'),
+    'scene.xaxis.calendar': ('.scene.xaxis', 'CalendarValidator', 'simple'),
+    'scene.xaxis.categoryarraysrc': ('.scene.xaxis', 'CategoryarraysrcValidator', 'simple'),
+    'scene.xaxis.tickvalssrc': ('.scene.xaxis', 'TickvalssrcValidator', 'simple'),
+    'scene.xaxis.ticktextsrc': ('.scene.xaxis', 'TicktextsrcValidator', 'simple'),
+    'scene.yaxis': ('.scene', 'YaxisValidator', 'compound'),
+    'scene.yaxis.visible': ('.scene.yaxis', 'VisibleValidator', 'simple'),
+    'scene.yaxis.showspikes': ('.scene.yaxis', 'ShowspikesValidator', 'simple'),
+    'scene.yaxis.spikesides': ('.scene.yaxis', 'SpikesidesValidator', 'simple'),
+    'scene.yaxis.spikethickness': ('.scene.yaxis', 'SpikethicknessValidator', 'simple'),
+    'scene.yaxis.spikecolor': ('.scene.yaxis', 'SpikecolorValidator', 'simple'),
+    'scene.yaxis.showbackground': ('.scene.yaxis', 'ShowbackgroundValidator', 'simple'),
+    'scene.yaxis.backgroundcolor': ('.scene.yaxis', 'BackgroundcolorValidator', 'simple'),
+    'scene.yaxis.showaxeslabels': ('.scene.yaxis', 'ShowaxeslabelsValidator', 'simple'),
+    'scene.yaxis.color': ('.scene.yaxis', 'ColorValidator', 'simple'),
+    'scene.yaxis.categoryorder': ('.scene.yaxis', 'CategoryorderValidator', 'simple'),
+    'scene.yaxis.categoryarray': ('.scene.yaxis', 'CategoryarrayValidator', 'simple'),
+    'scene.yaxis.title': ('.scene.yaxis', 'TitleValidator', 'simple'),
+    'scene.yaxis.titlefont': ('.scene.yaxis', 'TitlefontValidator', 'compound'),
+    'scene.yaxis.titlefont.family': ('.scene.yaxis.titlefont', 'FamilyValidator', 'simple'),
+    'scene.yaxis.titlefont.size': ('.scene.yaxis.titlefont', 'SizeValidator', 'simple'),
+    'scene.yaxis.titlefont.color': ('.scene.yaxis.titlefont', 'ColorValidator', 'simple'),
+    'scene.yaxis.type': ('.scene.yaxis', 'TypeValidator', 'simple'),
+    'scene.yaxis.autorange': ('.scene.yaxis', 'AutorangeValidator', 'simple'),
+    'scene.yaxis.rangemode': ('.scene.yaxis', 'RangemodeValidator', 'simple'),
+    'scene.yaxis.range': ('.scene.yaxis', 'RangeValidator', 'simple'),
+    'scene.yaxis.tickmode': ('.scene.yaxis', 'TickmodeValidator', 'simple'),
+    'scene.yaxis.nticks': ('.scene.yaxis', 'NticksValidator', 'simple'),
+    'scene.yaxis.tick0': ('.scene.yaxis', 'Tick0Validator', 'simple'),
+    'scene.yaxis.dtick': ('.scene.yaxis', 'DtickValidator', 'simple'),
+    'scene.yaxis.tickvals': ('.scene.yaxis', 'TickvalsValidator', 'simple'),
+    'scene.yaxis.ticktext': ('.scene.yaxis', 'TicktextValidator', 'simple'),
+    'scene.yaxis.ticks': ('.scene.yaxis', 'TicksValidator', 'simple'),
+    'scene.yaxis.mirror': ('.scene.yaxis', 'MirrorValidator', 'simple'),
+    'scene.yaxis.ticklen': ('.scene.yaxis', 'TicklenValidator', 'simple'),
+    'scene.yaxis.tickwidth': ('.scene.yaxis', 'TickwidthValidator', 'simple'),
+    'scene.yaxis.tickcolor': ('.scene.yaxis', 'TickcolorValidator', 'simple'),
+    'scene.yaxis.showticklabels': ('.scene.yaxis', 'ShowticklabelsValidator', 'simple'),
+    'scene.yaxis.tickfont': ('.scene.yaxis', 'TickfontValidator', 'compound'),
+    'scene.yaxis.tickfont.family': ('.scene.yaxis.tickfont', 'FamilyValidator', 'simple'),
+    'scene.yaxis.tickfont.size': ('.scene.yaxis.tickfont', 'SizeValidator', 'simple'),
+    'scene.yaxis.tickfont.color': ('.scene.yaxis.tickfont', 'ColorValidator', 'simple'),
+    'scene.yaxis.tickangle': ('.scene.yaxis', 'TickangleValidator', 'simple'),
+    'scene.yaxis.tickprefix': ('.scene.yaxis', 'TickprefixValidator', 'simple'),
+    'scene.yaxis.showtickprefix': ('.scene.yaxis', 'ShowtickprefixValidator', 'simple'),
+    'scene.yaxis.ticksuffix': ('.scene.yaxis', 'TicksuffixValidator', 'simple'),
+    'scene.yaxis.showticksuffix': ('.scene.yaxis', 'ShowticksuffixValidator', 'simple'),
+    'scene.yaxis.showexponent': ('.scene.yaxis', 'ShowexponentValidator', 'simple'),
+    'scene.yaxis.exponentformat': ('.scene.yaxis', 'ExponentformatValidator', 'simple'),
+    'scene.yaxis.separatethousands': ('.scene.yaxis', 'SeparatethousandsValidator', 'simple'),
+    'scene.yaxis.tickformat': ('.scene.yaxis', 'TickformatValidator', 'simple'),
+    'scene.yaxis.tickformatstops': ('.scene.yaxis', 'TickformatstopsValidator', 'compound_array'),
+    'scene.yaxis.tickformatstops.dtickrange': ('.scene.yaxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'scene.yaxis.tickformatstops.value': ('.scene.yaxis.tickformatstop', 'ValueValidator', 'simple'),
+    'scene.yaxis.hoverformat': ('.scene.yaxis', 'HoverformatValidator', 'simple'),
+    'scene.yaxis.showline': ('.scene.yaxis', 'ShowlineValidator', 'simple'),
+    'scene.yaxis.linecolor': ('.scene.yaxis', 'LinecolorValidator', 'simple'),
+    'scene.yaxis.linewidth': ('.scene.yaxis', 'LinewidthValidator', 'simple'),
+    'scene.yaxis.showgrid': ('.scene.yaxis', 'ShowgridValidator', 'simple'),
+    'scene.yaxis.gridcolor': ('.scene.yaxis', 'GridcolorValidator', 'simple'),
+    'scene.yaxis.gridwidth': ('.scene.yaxis', 'GridwidthValidator', 'simple'),
+    'scene.yaxis.zeroline': ('.scene.yaxis', 'ZerolineValidator', 'simple'),
+    'scene.yaxis.zerolinecolor': ('.scene.yaxis', 'ZerolinecolorValidator', 'simple'),
+    'scene.yaxis.zerolinewidth': ('.scene.yaxis', 'ZerolinewidthValidator', 'simple'),
+    'scene.yaxis.calendar': ('.scene.yaxis', 'CalendarValidator', 'simple'),
+    'scene.yaxis.categoryarraysrc': ('.scene.yaxis', 'CategoryarraysrcValidator', 'simple'),
+    'scene.yaxis.tickvalssrc': ('.scene.yaxis', 'TickvalssrcValidator', 'simple'),
+    'scene.yaxis.ticktextsrc': ('.scene.yaxis', 'TicktextsrcValidator', 'simple'),
+    'scene.zaxis': ('.scene', 'ZaxisValidator', 'compound'),
+    'scene.zaxis.visible': ('.scene.zaxis', 'VisibleValidator', 'simple'),
+    'scene.zaxis.showspikes': ('.scene.zaxis', 'ShowspikesValidator', 'simple'),
+    'scene.zaxis.spikesides': ('.scene.zaxis', 'SpikesidesValidator', 'simple'),
+    'scene.zaxis.spikethickness': ('.scene.zaxis', 'SpikethicknessValidator', 'simple'),
+    'scene.zaxis.spikecolor': ('.scene.zaxis', 'SpikecolorValidator', 'simple'),
+    'scene.zaxis.showbackground': ('.scene.zaxis', 'ShowbackgroundValidator', 'simple'),
+    'scene.zaxis.backgroundcolor': ('.scene.zaxis', 'BackgroundcolorValidator', 'simple'),
+    'scene.zaxis.showaxeslabels': ('.scene.zaxis', 'ShowaxeslabelsValidator', 'simple'),
+    'scene.zaxis.color': ('.scene.zaxis', 'ColorValidator', 'simple'),
+    'scene.zaxis.categoryorder': ('.scene.zaxis', 'CategoryorderValidator', 'simple'),
+    'scene.zaxis.categoryarray': ('.scene.zaxis', 'CategoryarrayValidator', 'simple'),
+    'scene.zaxis.title': ('.scene.zaxis', 'TitleValidator', 'simple'),
+    'scene.zaxis.titlefont': ('.scene.zaxis', 'TitlefontValidator', 'compound'),
+    'scene.zaxis.titlefont.family': ('.scene.zaxis.titlefont', 'FamilyValidator', 'simple'),
+    'scene.zaxis.titlefont.size': ('.scene.zaxis.titlefont', 'SizeValidator', 'simple'),
+    'scene.zaxis.titlefont.color': ('.scene.zaxis.titlefont', 'ColorValidator', 'simple'),
+    'scene.zaxis.type': ('.scene.zaxis', 'TypeValidator', 'simple'),
+    'scene.zaxis.autorange': ('.scene.zaxis', 'AutorangeValidator', 'simple'),
+    'scene.zaxis.rangemode': ('.scene.zaxis', 'RangemodeValidator', 'simple'),
+    'scene.zaxis.range': ('.scene.zaxis', 'RangeValidator', 'simple'),
+    'scene.zaxis.tickmode': ('.scene.zaxis', 'TickmodeValidator', 'simple'),
+    'scene.zaxis.nticks': ('.scene.zaxis', 'NticksValidator', 'simple'),
+    'scene.zaxis.tick0': ('.scene.zaxis', 'Tick0Validator', 'simple'),
+    'scene.zaxis.dtick': ('.scene.zaxis', 'DtickValidator', 'simple'),
+    'scene.zaxis.tickvals': ('.scene.zaxis', 'TickvalsValidator', 'simple'),
+    'scene.zaxis.ticktext': ('.scene.zaxis', 'TicktextValidator', 'simple'),
+    'scene.zaxis.ticks': ('.scene.zaxis', 'TicksValidator', 'simple'),
+    'scene.zaxis.mirror': ('.scene.zaxis', 'MirrorValidator', 'simple'),
+    'scene.zaxis.ticklen': ('.scene.zaxis', 'TicklenValidator', 'simple'),
+    'scene.zaxis.tickwidth': ('.scene.zaxis', 'TickwidthValidator', 'simple'),
+    'scene.zaxis.tickcolor': ('.scene.zaxis', 'TickcolorValidator', 'simple'),
+    'scene.zaxis.showticklabels': ('.scene.zaxis', 'ShowticklabelsValidator', 'simple'),
+    'scene.zaxis.tickfont': ('.scene.zaxis', 'TickfontValidator', 'compound'),
+    'scene.zaxis.tickfont.family': ('.scene.zaxis.tickfont', 'FamilyValidator', 'simple'),
+    'scene.zaxis.tickfont.size': ('.scene.zaxis.tickfont', 'SizeValidator', 'simple'),
+    'scene.zaxis.tickfont.color': ('.scene.zaxis.tickfont', 'ColorValidator', 'simple'),
+    'scene.zaxis.tickangle': ('.scene.zaxis', 'TickangleValidator', 'simple'),
+    'scene.zaxis.tickprefix': ('.scene.zaxis', 'TickprefixValidator', 'simple'),
+    'scene.zaxis.showtickprefix': ('.scene.zaxis', 'ShowtickprefixValidator', 'simple'),
+    'scene.zaxis.ticksuffix': ('.scene.zaxis', 'TicksuffixValidator', 'simple'),
+    'scene.zaxis.showticksuffix': ('.scene.zaxis', 'ShowticksuffixValidator', 'simple'),
+    'scene.zaxis.showexponent': ('.scene.zaxis', 'ShowexponentValidator', 'simple'),
+    'scene.zaxis.exponentformat': ('.scene.zaxis', 'ExponentformatValidator', 'simple'),
+    'scene.zaxis.separatethousands': ('.scene.zaxis', 'SeparatethousandsValidator', 'simple'),
+    'scene.zaxis.tickformat': ('.scene.zaxis', 'TickformatValidator', 'simple'),
+    'scene.zaxis.tickformatstops': ('.scene.zaxis', 'TickformatstopsValidator', 'compound_array'),
+    'scene.zaxis.tickformatstops.dtickrange': ('.scene.zaxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'scene.zaxis.tickformatstops.value': ('.scene.zaxis.tickformatstop', 'ValueValidator', 'simple'),
+    'scene.zaxis.hoverformat': ('.scene.zaxis', 'HoverformatValidator', 'simple'),
+    'scene.zaxis.showline': ('.scene.zaxis', 'ShowlineValidator', 'simple'),
+    'scene.zaxis.linecolor': ('.scene.zaxis', 'LinecolorValidator', 'simple'),
+    'scene.zaxis.linewidth': ('.scene.zaxis', 'LinewidthValidator', 'simple'),
+    'scene.zaxis.showgrid': ('.scene.zaxis', 'ShowgridValidator', 'simple'),
+    'scene.zaxis.gridcolor': ('.scene.zaxis', 'GridcolorValidator', 'simple'),
+    'scene.zaxis.gridwidth': ('.scene.zaxis', 'GridwidthValidator', 'simple'),
+    'scene.zaxis.zeroline': ('.scene.zaxis', 'ZerolineValidator', 'simple'),
+    'scene.zaxis.zerolinecolor': ('.scene.zaxis', 'ZerolinecolorValidator', 'simple'),
+    'scene.zaxis.zerolinewidth': ('.scene.zaxis', 'ZerolinewidthValidator', 'simple'),
+    'scene.zaxis.calendar': ('.scene.zaxis', 'CalendarValidator', 'simple'),
+    'scene.zaxis.categoryarraysrc': ('.scene.zaxis', 'CategoryarraysrcValidator', 'simple'),
+    'scene.zaxis.tickvalssrc': ('.scene.zaxis', 'TickvalssrcValidator', 'simple'),
+    'scene.zaxis.ticktextsrc': ('.scene.zaxis', 'TicktextsrcValidator', 'simple'),
+    'scene.dragmode': ('.scene', 'DragmodeValidator', 'simple'),
+    'scene.hovermode': ('.scene', 'HovermodeValidator', 'simple'),
+    'scene.annotations': ('.scene', 'AnnotationsValidator', 'compound_array'),
+    'scene.annotations.visible': ('.scene.annotation', 'VisibleValidator', 'simple'),
+    'scene.annotations.x': ('.scene.annotation', 'XValidator', 'simple'),
+    'scene.annotations.y': ('.scene.annotation', 'YValidator', 'simple'),
+    'scene.annotations.z': ('.scene.annotation', 'ZValidator', 'simple'),
+    'scene.annotations.ax': ('.scene.annotation', 'AxValidator', 'simple'),
+    'scene.annotations.ay': ('.scene.annotation', 'AyValidator', 'simple'),
+    'scene.annotations.xanchor': ('.scene.annotation', 'XanchorValidator', 'simple'),
+    'scene.annotations.xshift': ('.scene.annotation', 'XshiftValidator', 'simple'),
+    'scene.annotations.yanchor': ('.scene.annotation', 'YanchorValidator', 'simple'),
+    'scene.annotations.yshift': ('.scene.annotation', 'YshiftValidator', 'simple'),
+    'scene.annotations.text': ('.scene.annotation', 'TextValidator', 'simple'),
+    'scene.annotations.textangle': ('.scene.annotation', 'TextangleValidator', 'simple'),
+    'scene.annotations.font': ('.scene.annotation', 'FontValidator', 'compound'),
+    'scene.annotations.font.family': ('.scene.annotation.font', 'FamilyValidator', 'simple'),
+    'scene.annotations.font.size': ('.scene.annotation.font', 'SizeValidator', 'simple'),
+    'scene.annotations.font.color': ('.scene.annotation.font', 'ColorValidator', 'simple'),
+    'scene.annotations.width': ('.scene.annotation', 'WidthValidator', 'simple'),
+    'scene.annotations.height': ('.scene.annotation', 'HeightValidator', 'simple'),
+    'scene.annotations.opacity': ('.scene.annotation', 'OpacityValidator', 'simple'),
+    'scene.annotations.align': ('.scene.annotation', 'AlignValidator', 'simple'),
+    'scene.annotations.valign': ('.scene.annotation', 'ValignValidator', 'simple'),
+    'scene.annotations.bgcolor': ('.scene.annotation', 'BgcolorValidator', 'simple'),
+    'scene.annotations.bordercolor': ('.scene.annotation', 'BordercolorValidator', 'simple'),
+    'scene.annotations.borderpad': ('.scene.annotation', 'BorderpadValidator', 'simple'),
+    'scene.annotations.borderwidth': ('.scene.annotation', 'BorderwidthValidator', 'simple'),
+    'scene.annotations.showarrow': ('.scene.annotation', 'ShowarrowValidator', 'simple'),
+    'scene.annotations.arrowcolor': ('.scene.annotation', 'ArrowcolorValidator', 'simple'),
+    'scene.annotations.arrowhead': ('.scene.annotation', 'ArrowheadValidator', 'simple'),
+    'scene.annotations.arrowsize': ('.scene.annotation', 'ArrowsizeValidator', 'simple'),
+    'scene.annotations.arrowwidth': ('.scene.annotation', 'ArrowwidthValidator', 'simple'),
+    'scene.annotations.standoff': ('.scene.annotation', 'StandoffValidator', 'simple'),
+    'scene.annotations.hovertext': ('.scene.annotation', 'HovertextValidator', 'simple'),
+    'scene.annotations.hoverlabel': ('.scene.annotation', 'HoverlabelValidator', 'compound'),
+    'scene.annotations.hoverlabel.bgcolor': ('.scene.annotation.hoverlabel', 'BgcolorValidator', 'simple'),
+    'scene.annotations.hoverlabel.bordercolor': ('.scene.annotation.hoverlabel', 'BordercolorValidator', 'simple'),
+    'scene.annotations.hoverlabel.font': ('.scene.annotation.hoverlabel', 'FontValidator', 'compound'),
+    'scene.annotations.hoverlabel.font.family': ('.scene.annotation.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'scene.annotations.hoverlabel.font.size': ('.scene.annotation.hoverlabel.font', 'SizeValidator', 'simple'),
+    'scene.annotations.hoverlabel.font.color': ('.scene.annotation.hoverlabel.font', 'ColorValidator', 'simple'),
+    'scene.annotations.captureevents': ('.scene.annotation', 'CaptureeventsValidator', 'simple'),
+    'geo': ('', 'GeoValidator', 'compound'),
+    'geo.domain': ('.geo', 'DomainValidator', 'compound'),
+    'geo.domain.x': ('.geo.domain', 'XValidator', 'simple'),
+    'geo.domain.y': ('.geo.domain', 'YValidator', 'simple'),
+    'geo.resolution': ('.geo', 'ResolutionValidator', 'simple'),
+    'geo.scope': ('.geo', 'ScopeValidator', 'simple'),
+    'geo.projection': ('.geo', 'ProjectionValidator', 'compound'),
+    'geo.projection.type': ('.geo.projection', 'TypeValidator', 'simple'),
+    'geo.projection.rotation': ('.geo.projection', 'RotationValidator', 'compound'),
+    'geo.projection.rotation.lon': ('.geo.projection.rotation', 'LonValidator', 'simple'),
+    'geo.projection.rotation.lat': ('.geo.projection.rotation', 'LatValidator', 'simple'),
+    'geo.projection.rotation.roll': ('.geo.projection.rotation', 'RollValidator', 'simple'),
+    'geo.projection.parallels': ('.geo.projection', 'ParallelsValidator', 'simple'),
+    'geo.projection.scale': ('.geo.projection', 'ScaleValidator', 'simple'),
+    'geo.center': ('.geo', 'CenterValidator', 'compound'),
+    'geo.center.lon': ('.geo.center', 'LonValidator', 'simple'),
+    'geo.center.lat': ('.geo.center', 'LatValidator', 'simple'),
+    'geo.showcoastlines': ('.geo', 'ShowcoastlinesValidator', 'simple'),
+    'geo.coastlinecolor': ('.geo', 'CoastlinecolorValidator', 'simple'),
+    'geo.coastlinewidth': ('.geo', 'CoastlinewidthValidator', 'simple'),
+    'geo.showland': ('.geo', 'ShowlandValidator', 'simple'),
+    'geo.landcolor': ('.geo', 'LandcolorValidator', 'simple'),
+    'geo.showocean': ('.geo', 'ShowoceanValidator', 'simple'),
+    'geo.oceancolor': ('.geo', 'OceancolorValidator', 'simple'),
+    'geo.showlakes': ('.geo', 'ShowlakesValidator', 'simple'),
+    'geo.lakecolor': ('.geo', 'LakecolorValidator', 'simple'),
+    'geo.showrivers': ('.geo', 'ShowriversValidator', 'simple'),
+    'geo.rivercolor': ('.geo', 'RivercolorValidator', 'simple'),
+    'geo.riverwidth': ('.geo', 'RiverwidthValidator', 'simple'),
+    'geo.showcountries': ('.geo', 'ShowcountriesValidator', 'simple'),
+    'geo.countrycolor': ('.geo', 'CountrycolorValidator', 'simple'),
+    'geo.countrywidth': ('.geo', 'CountrywidthValidator', 'simple'),
+    'geo.showsubunits': ('.geo', 'ShowsubunitsValidator', 'simple'),
+    'geo.subunitcolor': ('.geo', 'SubunitcolorValidator', 'simple'),
+    'geo.subunitwidth': ('.geo', 'SubunitwidthValidator', 'simple'),
+    'geo.showframe': ('.geo', 'ShowframeValidator', 'simple'),
+    'geo.framecolor': ('.geo', 'FramecolorValidator', 'simple'),
+    'geo.framewidth': ('.geo', 'FramewidthValidator', 'simple'),
+    'geo.bgcolor': ('.geo', 'BgcolorValidator', 'simple'),
+    'geo.lonaxis': ('.geo', 'LonaxisValidator', 'compound'),
+    'geo.lonaxis.range': ('.geo.lonaxis', 'RangeValidator', 'simple'),
+    'geo.lonaxis.showgrid': ('.geo.lonaxis', 'ShowgridValidator', 'simple'),
+    'geo.lonaxis.tick0': ('.geo.lonaxis', 'Tick0Validator', 'simple'),
+    'geo.lonaxis.dtick': ('.geo.lonaxis', 'DtickValidator', 'simple'),
+    'geo.lonaxis.gridcolor': ('.geo.lonaxis', 'GridcolorValidator', 'simple'),
+    'geo.lonaxis.gridwidth': ('.geo.lonaxis', 'GridwidthValidator', 'simple'),
+    'geo.lataxis': ('.geo', 'LataxisValidator', 'compound'),
+    'geo.lataxis.range': ('.geo.lataxis', 'RangeValidator', 'simple'),
+    'geo.lataxis.showgrid': ('.geo.lataxis', 'ShowgridValidator', 'simple'),
+    'geo.lataxis.tick0': ('.geo.lataxis', 'Tick0Validator', 'simple'),
+    'geo.lataxis.dtick': ('.geo.lataxis', 'DtickValidator', 'simple'),
+    'geo.lataxis.gridcolor': ('.geo.lataxis', 'GridcolorValidator', 'simple'),
+    'geo.lataxis.gridwidth': ('.geo.lataxis', 'GridwidthValidator', 'simple'),
+    'mapbox': ('', 'MapboxValidator', 'compound'),
+    'mapbox.domain': ('.mapbox', 'DomainValidator', 'compound'),
+    'mapbox.domain.x': ('.mapbox.domain', 'XValidator', 'simple'),
+    'mapbox.domain.y': ('.mapbox.domain', 'YValidator', 'simple'),
+    'mapbox.accesstoken': ('.mapbox', 'AccesstokenValidator', 'simple'),
+    'mapbox.style': ('.mapbox', 'StyleValidator', 'simple'),
+    'mapbox.center': ('.mapbox', 'CenterValidator', 'compound'),
+    'mapbox.center.lon': ('.mapbox.center', 'LonValidator', 'simple'),
+    'mapbox.center.lat': ('.mapbox.center', 'LatValidator', 'simple'),
+    'mapbox.zoom': ('.mapbox', 'ZoomValidator', 'simple'),
+    'mapbox.bearing': ('.mapbox', 'BearingValidator', 'simple'),
+    'mapbox.pitch': ('.mapbox', 'PitchValidator', 'simple'),
+    'mapbox.layers': ('.mapbox', 'LayersValidator', 'compound_array'),
+    'mapbox.layers.sourcetype': ('.mapbox.layer', 'SourcetypeValidator', 'simple'),
+    'mapbox.layers.source': ('.mapbox.layer', 'SourceValidator', 'simple'),
+    'mapbox.layers.sourcelayer': ('.mapbox.layer', 'SourcelayerValidator', 'simple'),
+    'mapbox.layers.type': ('.mapbox.layer', 'TypeValidator', 'simple'),
+    'mapbox.layers.below': ('.mapbox.layer', 'BelowValidator', 'simple'),
+    'mapbox.layers.color': ('.mapbox.layer', 'ColorValidator', 'simple'),
+    'mapbox.layers.opacity': ('.mapbox.layer', 'OpacityValidator', 'simple'),
+    'mapbox.layers.circle': ('.mapbox.layer', 'CircleValidator', 'compound'),
+    'mapbox.layers.circle.radius': ('.mapbox.layer.circle', 'RadiusValidator', 'simple'),
+    'mapbox.layers.line': ('.mapbox.layer', 'LineValidator', 'compound'),
+    'mapbox.layers.line.width': ('.mapbox.layer.line', 'WidthValidator', 'simple'),
+    'mapbox.layers.fill': ('.mapbox.layer', 'FillValidator', 'compound'),
+    'mapbox.layers.fill.outlinecolor': ('.mapbox.layer.fill', 'OutlinecolorValidator', 'simple'),
+    'mapbox.layers.symbol': ('.mapbox.layer', 'SymbolValidator', 'compound'),
+    'mapbox.layers.symbol.icon': ('.mapbox.layer.symbol', 'IconValidator', 'simple'),
+    'mapbox.layers.symbol.iconsize': ('.mapbox.layer.symbol', 'IconsizeValidator', 'simple'),
+    'mapbox.layers.symbol.text': ('.mapbox.layer.symbol', 'TextValidator', 'simple'),
+    'mapbox.layers.symbol.textfont': ('.mapbox.layer.symbol', 'TextfontValidator', 'compound'),
+    'mapbox.layers.symbol.textfont.family': ('.mapbox.layer.symbol.textfont', 'FamilyValidator', 'simple'),
+    'mapbox.layers.symbol.textfont.size': ('.mapbox.layer.symbol.textfont', 'SizeValidator', 'simple'),
+    'mapbox.layers.symbol.textfont.color': ('.mapbox.layer.symbol.textfont', 'ColorValidator', 'simple'),
+    'mapbox.layers.symbol.textposition': ('.mapbox.layer.symbol', 'TextpositionValidator', 'simple'),
+    'radialaxis': ('', 'RadialaxisValidator', 'compound'),
+    'radialaxis.range': ('.radialaxis', 'RangeValidator', 'simple'),
+    'radialaxis.domain': ('.radialaxis', 'DomainValidator', 'simple'),
+    'radialaxis.orientation': ('.radialaxis', 'OrientationValidator', 'simple'),
+    'radialaxis.showline': ('.radialaxis', 'ShowlineValidator', 'simple'),
+    'radialaxis.showticklabels': ('.radialaxis', 'ShowticklabelsValidator', 'simple'),
+    'radialaxis.tickorientation': ('.radialaxis', 'TickorientationValidator', 'simple'),
+    'radialaxis.ticklen': ('.radialaxis', 'TicklenValidator', 'simple'),
+    'radialaxis.tickcolor': ('.radialaxis', 'TickcolorValidator', 'simple'),
+    'radialaxis.ticksuffix': ('.radialaxis', 'TicksuffixValidator', 'simple'),
+    'radialaxis.endpadding': ('.radialaxis', 'EndpaddingValidator', 'simple'),
+    'radialaxis.visible': ('.radialaxis', 'VisibleValidator', 'simple'),
+    'angularaxis': ('', 'AngularaxisValidator', 'compound'),
+    'angularaxis.range': ('.angularaxis', 'RangeValidator', 'simple'),
+    'angularaxis.domain': ('.angularaxis', 'DomainValidator', 'simple'),
+    'angularaxis.showline': ('.angularaxis', 'ShowlineValidator', 'simple'),
+    'angularaxis.showticklabels': ('.angularaxis', 'ShowticklabelsValidator', 'simple'),
+    'angularaxis.tickorientation': ('.angularaxis', 'TickorientationValidator', 'simple'),
+    'angularaxis.ticklen': ('.angularaxis', 'TicklenValidator', 'simple'),
+    'angularaxis.tickcolor': ('.angularaxis', 'TickcolorValidator', 'simple'),
+    'angularaxis.ticksuffix': ('.angularaxis', 'TicksuffixValidator', 'simple'),
+    'angularaxis.endpadding': ('.angularaxis', 'EndpaddingValidator', 'simple'),
+    'angularaxis.visible': ('.angularaxis', 'VisibleValidator', 'simple'),
+    'direction': ('', 'DirectionValidator', 'simple'),
+    'orientation': ('', 'OrientationValidator', 'simple'),
+    'legend': ('', 'LegendValidator', 'compound'),
+    'legend.bgcolor': ('.legend', 'BgcolorValidator', 'simple'),
+    'legend.bordercolor': ('.legend', 'BordercolorValidator', 'simple'),
+    'legend.borderwidth': ('.legend', 'BorderwidthValidator', 'simple'),
+    'legend.font': ('.legend', 'FontValidator', 'compound'),
+    'legend.font.family': ('.legend.font', 'FamilyValidator', 'simple'),
+    'legend.font.size': ('.legend.font', 'SizeValidator', 'simple'),
+    'legend.font.color': ('.legend.font', 'ColorValidator', 'simple'),
+    'legend.orientation': ('.legend', 'OrientationValidator', 'simple'),
+    'legend.traceorder': ('.legend', 'TraceorderValidator', 'simple'),
+    'legend.tracegroupgap': ('.legend', 'TracegroupgapValidator', 'simple'),
+    'legend.x': ('.legend', 'XValidator', 'simple'),
+    'legend.xanchor': ('.legend', 'XanchorValidator', 'simple'),
+    'legend.y': ('.legend', 'YValidator', 'simple'),
+    'legend.yanchor': ('.legend', 'YanchorValidator', 'simple'),
+    'annotations': ('', 'AnnotationsValidator', 'compound_array'),
+    'annotations.visible': ('.annotation', 'VisibleValidator', 'simple'),
+    'annotations.text': ('.annotation', 'TextValidator', 'simple'),
+    'annotations.textangle': ('.annotation', 'TextangleValidator', 'simple'),
+    'annotations.font': ('.annotation', 'FontValidator', 'compound'),
+    'annotations.font.family': ('.annotation.font', 'FamilyValidator', 'simple'),
+    'annotations.font.size': ('.annotation.font', 'SizeValidator', 'simple'),
+    'annotations.font.color': ('.annotation.font', 'ColorValidator', 'simple'),
+    'annotations.width': ('.annotation', 'WidthValidator', 'simple'),
+    'annotations.height': ('.annotation', 'HeightValidator', 'simple'),
+    'annotations.opacity': ('.annotation', 'OpacityValidator', 'simple'),
+    'annotations.align': ('.annotation', 'AlignValidator', 'simple'),
+    'annotations.valign': ('.annotation', 'ValignValidator', 'simple'),
+    'annotations.bgcolor': ('.annotation', 'BgcolorValidator', 'simple'),
+    'annotations.bordercolor': ('.annotation', 'BordercolorValidator', 'simple'),
+    'annotations.borderpad': ('.annotation', 'BorderpadValidator', 'simple'),
+    'annotations.borderwidth': ('.annotation', 'BorderwidthValidator', 'simple'),
+    'annotations.showarrow': ('.annotation', 'ShowarrowValidator', 'simple'),
+    'annotations.arrowcolor': ('.annotation', 'ArrowcolorValidator', 'simple'),
+    'annotations.arrowhead': ('.annotation', 'ArrowheadValidator', 'simple'),
+    'annotations.arrowsize': ('.annotation', 'ArrowsizeValidator', 'simple'),
+    'annotations.arrowwidth': ('.annotation', 'ArrowwidthValidator', 'simple'),
+    'annotations.standoff': ('.annotation', 'StandoffValidator', 'simple'),
+    'annotations.ax': ('.annotation', 'AxValidator', 'simple'),
+    'annotations.ay': ('.annotation', 'AyValidator', 'simple'),
+    'annotations.axref': ('.annotation', 'AxrefValidator', 'simple'),
+    'annotations.ayref': ('.annotation', 'AyrefValidator', 'simple'),
+    'annotations.xref': ('.annotation', 'XrefValidator', 'simple'),
+    'annotations.x': ('.annotation', 'XValidator', 'simple'),
+    'annotations.xanchor': ('.annotation', 'XanchorValidator', 'simple'),
+    'annotations.xshift': ('.annotation', 'XshiftValidator', 'simple'),
+    'annotations.yref': ('.annotation', 'YrefValidator', 'simple'),
+    'annotations.y': ('.annotation', 'YValidator', 'simple'),
+    'annotations.yanchor': ('.annotation', 'YanchorValidator', 'simple'),
+    'annotations.yshift': ('.annotation', 'YshiftValidator', 'simple'),
+    'annotations.clicktoshow': ('.annotation', 'ClicktoshowValidator', 'simple'),
+    'annotations.xclick': ('.annotation', 'XclickValidator', 'simple'),
+    'annotations.yclick': ('.annotation', 'YclickValidator', 'simple'),
+    'annotations.hovertext': ('.annotation', 'HovertextValidator', 'simple'),
+    'annotations.hoverlabel': ('.annotation', 'HoverlabelValidator', 'compound'),
+    'annotations.hoverlabel.bgcolor': ('.annotation.hoverlabel', 'BgcolorValidator', 'simple'),
+    'annotations.hoverlabel.bordercolor': ('.annotation.hoverlabel', 'BordercolorValidator', 'simple'),
+    'annotations.hoverlabel.font': ('.annotation.hoverlabel', 'FontValidator', 'compound'),
+    'annotations.hoverlabel.font.family': ('.annotation.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'annotations.hoverlabel.font.size': ('.annotation.hoverlabel.font', 'SizeValidator', 'simple'),
+    'annotations.hoverlabel.font.color': ('.annotation.hoverlabel.font', 'ColorValidator', 'simple'),
+    'annotations.captureevents': ('.annotation', 'CaptureeventsValidator', 'simple'),
+    'shapes': ('', 'ShapesValidator', 'compound_array'),
+    'shapes.visible': ('.shape', 'VisibleValidator', 'simple'),
+    'shapes.type': ('.shape', 'TypeValidator', 'simple'),
+    'shapes.layer': ('.shape', 'LayerValidator', 'simple'),
+    'shapes.xref': ('.shape', 'XrefValidator', 'simple'),
+    'shapes.x0': ('.shape', 'X0Validator', 'simple'),
+    'shapes.x1': ('.shape', 'X1Validator', 'simple'),
+    'shapes.yref': ('.shape', 'YrefValidator', 'simple'),
+    'shapes.y0': ('.shape', 'Y0Validator', 'simple'),
+    'shapes.y1': ('.shape', 'Y1Validator', 'simple'),
+    'shapes.path': ('.shape', 'PathValidator', 'simple'),
+    'shapes.opacity': ('.shape', 'OpacityValidator', 'simple'),
+    'shapes.line': ('.shape', 'LineValidator', 'compound'),
+    'shapes.line.color': ('.shape.line', 'ColorValidator', 'simple'),
+    'shapes.line.width': ('.shape.line', 'WidthValidator', 'simple'),
+    'shapes.line.dash': ('.shape.line', 'DashValidator', 'simple'),
+    'shapes.fillcolor': ('.shape', 'FillcolorValidator', 'simple'),
+    'images': ('', 'ImagesValidator', 'compound_array'),
+    'images.visible': ('.image', 'VisibleValidator', 'simple'),
+    'images.source': ('.image', 'SourceValidator', 'simple'),
+    'images.layer': ('.image', 'LayerValidator', 'simple'),
+    'images.sizex': ('.image', 'SizexValidator', 'simple'),
+    'images.sizey': ('.image', 'SizeyValidator', 'simple'),
+    'images.sizing': ('.image', 'SizingValidator', 'simple'),
+    'images.opacity': ('.image', 'OpacityValidator', 'simple'),
+    'images.x': ('.image', 'XValidator', 'simple'),
+    'images.y': ('.image', 'YValidator', 'simple'),
+    'images.xanchor': ('.image', 'XanchorValidator', 'simple'),
+    'images.yanchor': ('.image', 'YanchorValidator', 'simple'),
+    'images.xref': ('.image', 'XrefValidator', 'simple'),
+    'images.yref': ('.image', 'YrefValidator', 'simple'),
+    'updatemenus': ('', 'UpdatemenusValidator', 'compound_array'),
+    'updatemenus.visible': ('.updatemenu', 'VisibleValidator', 'simple'),
+    'updatemenus.type': ('.updatemenu', 'TypeValidator', 'simple'),
+    'updatemenus.direction': ('.updatemenu', 'DirectionValidator', 'simple'),
+    'updatemenus.active': ('.updatemenu', 'ActiveValidator', 'simple'),
+    'updatemenus.showactive': ('.updatemenu', 'ShowactiveValidator', 'simple'),
+    'updatemenus.buttons': ('.updatemenu', 'ButtonsValidator', 'compound_array'),
+    'updatemenus.buttons.method': ('.updatemenu.button', 'MethodValidator', 'simple'),
+    'updatemenus.buttons.args': ('.updatemenu.button', 'ArgsValidator', 'simple'),
+    'updatemenus.buttons.label': ('.updatemenu.button', 'LabelValidator', 'simple'),
+    'updatemenus.buttons.execute': ('.updatemenu.button', 'ExecuteValidator', 'simple'),
+    'updatemenus.x': ('.updatemenu', 'XValidator', 'simple'),
+    'updatemenus.xanchor': ('.updatemenu', 'XanchorValidator', 'simple'),
+    'updatemenus.y': ('.updatemenu', 'YValidator', 'simple'),
+    'updatemenus.yanchor': ('.updatemenu', 'YanchorValidator', 'simple'),
+    'updatemenus.pad': ('.updatemenu', 'PadValidator', 'compound'),
+    'updatemenus.pad.t': ('.updatemenu.pad', 'TValidator', 'simple'),
+    'updatemenus.pad.r': ('.updatemenu.pad', 'RValidator', 'simple'),
+    'updatemenus.pad.b': ('.updatemenu.pad', 'BValidator', 'simple'),
+    'updatemenus.pad.l': ('.updatemenu.pad', 'LValidator', 'simple'),
+    'updatemenus.font': ('.updatemenu', 'FontValidator', 'compound'),
+    'updatemenus.font.family': ('.updatemenu.font', 'FamilyValidator', 'simple'),
+    'updatemenus.font.size': ('.updatemenu.font', 'SizeValidator', 'simple'),
+    'updatemenus.font.color': ('.updatemenu.font', 'ColorValidator', 'simple'),
+    'updatemenus.bgcolor': ('.updatemenu', 'BgcolorValidator', 'simple'),
+    'updatemenus.bordercolor': ('.updatemenu', 'BordercolorValidator', 'simple'),
+    'updatemenus.borderwidth': ('.updatemenu', 'BorderwidthValidator', 'simple'),
+    'sliders': ('', 'SlidersValidator', 'compound_array'),
+    'sliders.visible': ('.slider', 'VisibleValidator', 'simple'),
+    'sliders.active': ('.slider', 'ActiveValidator', 'simple'),
+    'sliders.steps': ('.slider', 'StepsValidator', 'compound_array'),
+    'sliders.steps.method': ('.slider.step', 'MethodValidator', 'simple'),
+    'sliders.steps.args': ('.slider.step', 'ArgsValidator', 'simple'),
+    'sliders.steps.label': ('.slider.step', 'LabelValidator', 'simple'),
+    'sliders.steps.value': ('.slider.step', 'ValueValidator', 'simple'),
+    'sliders.steps.execute': ('.slider.step', 'ExecuteValidator', 'simple'),
+    'sliders.lenmode': ('.slider', 'LenmodeValidator', 'simple'),
+    'sliders.len': ('.slider', 'LenValidator', 'simple'),
+    'sliders.x': ('.slider', 'XValidator', 'simple'),
+    'sliders.pad': ('.slider', 'PadValidator', 'compound'),
+    'sliders.pad.t': ('.slider.pad', 'TValidator', 'simple'),
+    'sliders.pad.r': ('.slider.pad', 'RValidator', 'simple'),
+    'sliders.pad.b': ('.slider.pad', 'BValidator', 'simple'),
+    'sliders.pad.l': ('.slider.pad', 'LValidator', 'simple'),
+    'sliders.xanchor': ('.slider', 'XanchorValidator', 'simple'),
+    'sliders.y': ('.slider', 'YValidator', 'simple'),
+    'sliders.yanchor': ('.slider', 'YanchorValidator', 'simple'),
+    'sliders.transition': ('.slider', 'TransitionValidator', 'compound'),
+    'sliders.transition.duration': ('.slider.transition', 'DurationValidator', 'simple'),
+    'sliders.transition.easing': ('.slider.transition', 'EasingValidator', 'simple'),
+    'sliders.currentvalue': ('.slider', 'CurrentvalueValidator', 'compound'),
+    'sliders.currentvalue.visible': ('.slider.currentvalue', 'VisibleValidator', 'simple'),
+    'sliders.currentvalue.xanchor': ('.slider.currentvalue', 'XanchorValidator', 'simple'),
+    'sliders.currentvalue.offset': ('.slider.currentvalue', 'OffsetValidator', 'simple'),
+    'sliders.currentvalue.prefix': ('.slider.currentvalue', 'PrefixValidator', 'simple'),
+    'sliders.currentvalue.suffix': ('.slider.currentvalue', 'SuffixValidator', 'simple'),
+    'sliders.currentvalue.font': ('.slider.currentvalue', 'FontValidator', 'compound'),
+    'sliders.currentvalue.font.family': ('.slider.currentvalue.font', 'FamilyValidator', 'simple'),
+    'sliders.currentvalue.font.size': ('.slider.currentvalue.font', 'SizeValidator', 'simple'),
+    'sliders.currentvalue.font.color': ('.slider.currentvalue.font', 'ColorValidator', 'simple'),
+    'sliders.font': ('.slider', 'FontValidator', 'compound'),
+    'sliders.font.family': ('.slider.font', 'FamilyValidator', 'simple'),
+    'sliders.font.size': ('.slider.font', 'SizeValidator', 'simple'),
+    'sliders.font.color': ('.slider.font', 'ColorValidator', 'simple'),
+    'sliders.activebgcolor': ('.slider', 'ActivebgcolorValidator', 'simple'),
+    'sliders.bgcolor': ('.slider', 'BgcolorValidator', 'simple'),
+    'sliders.bordercolor': ('.slider', 'BordercolorValidator', 'simple'),
+    'sliders.borderwidth': ('.slider', 'BorderwidthValidator', 'simple'),
+    'sliders.ticklen': ('.slider', 'TicklenValidator', 'simple'),
+    'sliders.tickcolor': ('.slider', 'TickcolorValidator', 'simple'),
+    'sliders.tickwidth': ('.slider', 'TickwidthValidator', 'simple'),
+    'sliders.minorticklen': ('.slider', 'MinorticklenValidator', 'simple'),
+    'violinmode': ('', 'ViolinmodeValidator', 'simple'),
+    'violingap': ('', 'ViolingapValidator', 'simple'),
+    'violingroupgap': ('', 'ViolingroupgapValidator', 'simple'),
+    'hiddenlabels': ('', 'HiddenlabelsValidator', 'simple'),
+    'hiddenlabelssrc': ('', 'HiddenlabelssrcValidator', 'simple'),
+    'barmode': ('', 'BarmodeValidator', 'simple'),
+    'barnorm': ('', 'BarnormValidator', 'simple'),
+    'bargap': ('', 'BargapValidator', 'simple'),
+    'bargroupgap': ('', 'BargroupgapValidator', 'simple'),
+    'boxmode': ('', 'BoxmodeValidator', 'simple'),
+    'boxgap': ('', 'BoxgapValidator', 'simple'),
+    'boxgroupgap': ('', 'BoxgroupgapValidator', 'simple'),
+}
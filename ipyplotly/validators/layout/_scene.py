@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class SceneValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='scene', parent_name='layout'):
+        from ipyplotly.datatypes.layout import Scene
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Scene)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ShapesValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='shapes', parent_name='layout'):
+        from ipyplotly.datatypes.layout import Shape
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Shape)
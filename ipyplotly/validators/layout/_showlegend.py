@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class ShowlegendValidator(ipyplotly.basevalidators.BooleanValidator):
+
+    def __init__(self, plotly_name='showlegend', parent_name='layout'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='legend')
+
+    def validate_coerce(self, v):
+        if v is True or v is False or v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class SlidersValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='sliders', parent_name='layout'):
+        from ipyplotly.datatypes.layout import Slider
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Slider)
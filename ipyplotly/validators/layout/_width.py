@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class WidthValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='width', parent_name='layout'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=10, edit_type='none')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if v >= 10:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
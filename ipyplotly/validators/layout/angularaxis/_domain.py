@@ -0,0 +1,24 @@
+import ipyplotly.basevalidators
+
+
+class DomainValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='domain', parent_name='layout.angularaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            items=[
+                {
+                    'valType': 'number',
+                    'min': 0,
+                    'max': 1,
+                    'editType': 'plot'
+                }, {
+                    'valType': 'number',
+                    'min': 0,
+                    'max': 1,
+                    'editType': 'plot'
+                }
+            ],
+            edit_type='plot'
+        )
@@ -0,0 +1,22 @@
+import ipyplotly.basevalidators
+
+
+class RangeValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='range', parent_name='layout.angularaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            items=[
+                {
+                    'valType': 'number',
+                    'dflt': 0,
+                    'editType': 'plot'
+                }, {
+                    'valType': 'number',
+                    'dflt': 360,
+                    'editType': 'plot'
+                }
+            ],
+            edit_type='plot'
+        )
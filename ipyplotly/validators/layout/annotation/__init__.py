@@ -0,0 +1,90 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._text import TextValidator
+    from ._textangle import TextangleValidator
+    from ._font import FontValidator
+    from ._width import WidthValidator
+    from ._height import HeightValidator
+    from ._opacity import OpacityValidator
+    from ._align import AlignValidator
+    from ._valign import ValignValidator
+    from ._bgcolor import BgcolorValidator
+    from ._bordercolor import BordercolorValidator
+    from ._borderpad import BorderpadValidator
+    from ._borderwidth import BorderwidthValidator
+    from ._showarrow import ShowarrowValidator
+    from ._arrowcolor import ArrowcolorValidator
+    from ._arrowhead import ArrowheadValidator
+    from ._arrowsize import ArrowsizeValidator
+    from ._arrowwidth import ArrowwidthValidator
+    from ._standoff import StandoffValidator
+    from ._ax import AxValidator
+    from ._ay import AyValidator
+    from ._axref import AxrefValidator
+    from ._ayref import AyrefValidator
+    from ._xref import XrefValidator
+    from ._x import XValidator
+    from ._xanchor import XanchorValidator
+    from ._xshift import XshiftValidator
+    from ._yref import YrefValidator
+    from ._y import YValidator
+    from ._yanchor import YanchorValidator
+    from ._yshift import YshiftValidator
+    from ._clicktoshow import ClicktoshowValidator
+    from ._xclick import XclickValidator
+    from ._yclick import YclickValidator
+    from ._hovertext import HovertextValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._captureevents import CaptureeventsValidator
+    from . import hoverlabel
+    from . import font
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.hoverlabel',
+            '.font',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._text.TextValidator',
+            '._textangle.TextangleValidator',
+            '._font.FontValidator',
+            '._width.WidthValidator',
+            '._height.HeightValidator',
+            '._opacity.OpacityValidator',
+            '._align.AlignValidator',
+            '._valign.ValignValidator',
+            '._bgcolor.BgcolorValidator',
+            '._bordercolor.BordercolorValidator',
+            '._borderpad.BorderpadValidator',
+            '._borderwidth.BorderwidthValidator',
+            '._showarrow.ShowarrowValidator',
+            '._arrowcolor.ArrowcolorValidator',
+            '._arrowhead.ArrowheadValidator',
+            '._arrowsize.ArrowsizeValidator',
+            '._arrowwidth.ArrowwidthValidator',
+            '._standoff.StandoffValidator',
+            '._ax.AxValidator',
+            '._ay.AyValidator',
+            '._axref.AxrefValidator',
+            '._ayref.AyrefValidator',
+            '._xref.XrefValidator',
+            '._x.XValidator',
+            '._xanchor.XanchorValidator',
+            '._xshift.XshiftValidator',
+            '._yref.YrefValidator',
+            '._y.YValidator',
+            '._yanchor.YanchorValidator',
+            '._yshift.YshiftValidator',
+            '._clicktoshow.ClicktoshowValidator',
+            '._xclick.XclickValidator',
+            '._yclick.YclickValidator',
+            '._hovertext.HovertextValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._captureevents.CaptureeventsValidator',
+        ]
+    )
@@ -0,0 +1,10 @@
+import ipyplotly.basevalidators
+
+
+class AxValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='ax', parent_name='layout.annotation'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calcIfAutorange')
+
+    def validate_coerce(self, v):
+        return v
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class BorderwidthValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='borderwidth', parent_name='layout.annotation'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=0, edit_type='calcIfAutorange')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if v >= 0:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
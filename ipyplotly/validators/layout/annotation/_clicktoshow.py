@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class ClicktoshowValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='clicktoshow', parent_name='layout.annotation'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=[False, 'onoff', 'onout'], edit_type='arraydraw'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'onoff', 'onout', False}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class XanchorValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='xanchor', parent_name='layout.annotation'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['auto', 'left', 'center', 'right'],
+            edit_type='calcIfAutorange'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'auto', 'center', 'left', 'right'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,10 @@
+import ipyplotly.basevalidators
+
+
+class YclickValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='yclick', parent_name='layout.annotation'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='arraydraw')
+
+    def validate_coerce(self, v):
+        return v
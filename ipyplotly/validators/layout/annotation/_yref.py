@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class YrefValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='yref', parent_name='layout.annotation'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['paper', '/^y([2-9]|[1-9][0-9]+)?$/'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'paper'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,80 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._domain import DomainValidator
+    from ._resolution import ResolutionValidator
+    from ._scope import ScopeValidator
+    from ._projection import ProjectionValidator
+    from ._center import CenterValidator
+    from ._showcoastlines import ShowcoastlinesValidator
+    from ._coastlinecolor import CoastlinecolorValidator
+    from ._coastlinewidth import CoastlinewidthValidator
+    from ._showland import ShowlandValidator
+    from ._landcolor import LandcolorValidator
+    from ._showocean import ShowoceanValidator
+    from ._oceancolor import OceancolorValidator
+    from ._showlakes import ShowlakesValidator
+    from ._lakecolor import LakecolorValidator
+    from ._showrivers import ShowriversValidator
+    from ._rivercolor import RivercolorValidator
+    from ._riverwidth import RiverwidthValidator
+    from ._showcountries import ShowcountriesValidator
+    from ._countrycolor import CountrycolorValidator
+    from ._countrywidth import CountrywidthValidator
+    from ._showsubunits import ShowsubunitsValidator
+    from ._subunitcolor import SubunitcolorValidator
+    from ._subunitwidth import SubunitwidthValidator
+    from ._showframe import ShowframeValidator
+    from ._framecolor import FramecolorValidator
+    from ._framewidth import FramewidthValidator
+    from ._bgcolor import BgcolorValidator
+    from ._lonaxis import LonaxisValidator
+    from ._lataxis import LataxisValidator
+    from . import lataxis
+    from . import lonaxis
+    from . import center
+    from . import projection
+    from . import domain
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.lataxis',
+            '.lonaxis',
+            '.center',
+            '.projection',
+            '.domain',
+        ],
+        [
+            '._domain.DomainValidator',
+            '._resolution.ResolutionValidator',
+            '._scope.ScopeValidator',
+            '._projection.ProjectionValidator',
+            '._center.CenterValidator',
+            '._showcoastlines.ShowcoastlinesValidator',
+            '._coastlinecolor.CoastlinecolorValidator',
+            '._coastlinewidth.CoastlinewidthValidator',
+            '._showland.ShowlandValidator',
+            '._landcolor.LandcolorValidator',
+            '._showocean.ShowoceanValidator',
+            '._oceancolor.OceancolorValidator',
+            '._showlakes.ShowlakesValidator',
+            '._lakecolor.LakecolorValidator',
+            '._showrivers.ShowriversValidator',
+            '._rivercolor.RivercolorValidator',
+            '._riverwidth.RiverwidthValidator',
+            '._showcountries.ShowcountriesValidator',
+            '._countrycolor.CountrycolorValidator',
+            '._countrywidth.CountrywidthValidator',
+            '._showsubunits.ShowsubunitsValidator',
+            '._subunitcolor.SubunitcolorValidator',
+            '._subunitwidth.SubunitwidthValidator',
+            '._showframe.ShowframeValidator',
+            '._framecolor.FramecolorValidator',
+            '._framewidth.FramewidthValidator',
+            '._bgcolor.BgcolorValidator',
+            '._lonaxis.LonaxisValidator',
+            '._lataxis.LataxisValidator',
+        ]
+    )
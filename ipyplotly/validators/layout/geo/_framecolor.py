@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class FramecolorValidator(ipyplotly.basevalidators.ColorValidator):
+
+    def __init__(self, plotly_name='framecolor', parent_name='layout.geo'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='plot')
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in self.named_colors_set:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
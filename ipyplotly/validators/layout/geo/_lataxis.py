@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LataxisValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='lataxis', parent_name='layout.geo'):
+        from ipyplotly.datatypes.layout.geo import Lataxis
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Lataxis)
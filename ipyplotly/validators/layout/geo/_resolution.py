@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class ResolutionValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='resolution', parent_name='layout.geo'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=[110, 50], coerce_number=True, edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {110, 50}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
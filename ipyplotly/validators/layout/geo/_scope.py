@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ScopeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='scope', parent_name='layout.geo'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['world', 'usa', 'europe', 'asia', 'africa', 'north america', 'south america'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'africa', 'asia', 'europe', 'north america', 'south america', 'usa', 'world'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class ShowriversValidator(ipyplotly.basevalidators.BooleanValidator):
+
+    def __init__(self, plotly_name='showrivers', parent_name='layout.geo'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='plot')
+
+    def validate_coerce(self, v):
+        if v is True or v is False or v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,23 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._range import RangeValidator
+    from ._showgrid import ShowgridValidator
+    from ._tick0 import Tick0Validator
+    from ._dtick import DtickValidator
+    from ._gridcolor import GridcolorValidator
+    from ._gridwidth import GridwidthValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._range.RangeValidator',
+            '._showgrid.ShowgridValidator',
+            '._tick0.Tick0Validator',
+            '._dtick.DtickValidator',
+            '._gridcolor.GridcolorValidator',
+            '._gridwidth.GridwidthValidator',
+        ]
+    )
@@ -0,0 +1,22 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._type import TypeValidator
+    from ._rotation import RotationValidator
+    from ._parallels import ParallelsValidator
+    from ._scale import ScaleValidator
+    from . import rotation
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.rotation',
+        ],
+        [
+            '._type.TypeValidator',
+            '._rotation.RotationValidator',
+            '._parallels.ParallelsValidator',
+            '._scale.ScaleValidator',
+        ]
+    )
@@ -0,0 +1,18 @@
+import ipyplotly.basevalidators
+
+
+class ParallelsValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='parallels', parent_name='layout.geo.projection'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            items=[{
+                'valType': 'number',
+                'editType': 'plot'
+            }, {
+                'valType': 'number',
+                'editType': 'plot'
+            }],
+            edit_type='plot'
+        )
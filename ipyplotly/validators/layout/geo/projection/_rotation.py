@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class RotationValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='rotation', parent_name='layout.geo.projection'):
+        from ipyplotly.datatypes.layout.geo.projection import Rotation
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Rotation)
@@ -0,0 +1,30 @@
+import ipyplotly.basevalidators
+
+
+class TypeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='type', parent_name='layout.geo.projection'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[
+                'equirectangular', 'mercator', 'orthographic', 'natural earth', 'kavrayskiy7', 'miller', 'robinson',
+                'eckert4', 'azimuthal equal area', 'azimuthal equidistant', 'conic equal area', 'conic conformal',
+                'conic equidistant', 'gnomonic', 'stereographic', 'mollweide', 'hammer', 'transverse mercator',
+                'albers usa', 'winkel tripel', 'aitoff', 'sinusoidal'
+            ],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {
+                'aitoff', 'albers usa', 'azimuthal equal area', 'azimuthal equidistant', 'conic conformal',
+                'conic equal area', 'conic equidistant', 'eckert4', 'equirectangular', 'gnomonic', 'hammer',
+                'kavrayskiy7', 'mercator', 'miller', 'mollweide', 'natural earth', 'orthographic', 'robinson',
+                'sinusoidal', 'stereographic', 'transverse mercator', 'winkel tripel'
+            }:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
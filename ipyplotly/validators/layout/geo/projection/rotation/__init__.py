@@ -0,0 +1,17 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._lon import LonValidator
+    from ._lat import LatValidator
+    from ._roll import RollValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._lon.LonValidator',
+            '._lat.LatValidator',
+            '._roll.RollValidator',
+        ]
+    )
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class NamelengthValidator(ipyplotly.basevalidators.IntegerValidator):
+
+    def __init__(self, plotly_name='namelength', parent_name='layout.hoverlabel'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=-1, edit_type='none')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int:
+            if -1 <= v <= 2147483647:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
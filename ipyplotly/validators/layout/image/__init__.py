@@ -0,0 +1,37 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._source import SourceValidator
+    from ._layer import LayerValidator
+    from ._sizex import SizexValidator
+    from ._sizey import SizeyValidator
+    from ._sizing import SizingValidator
+    from ._opacity import OpacityValidator
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._xanchor import XanchorValidator
+    from ._yanchor import YanchorValidator
+    from ._xref import XrefValidator
+    from ._yref import YrefValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._visible.VisibleValidator',
+            '._source.SourceValidator',
+            '._layer.LayerValidator',
+            '._sizex.SizexValidator',
+            '._sizey.SizeyValidator',
+            '._sizing.SizingValidator',
+            '._opacity.OpacityValidator',
+            '._x.XValidator',
+            '._y.YValidator',
+            '._xanchor.XanchorValidator',
+            '._yanchor.YanchorValidator',
+            '._xref.XrefValidator',
+            '._yref.YrefValidator',
+        ]
+    )
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class LayerValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='layer', parent_name='layout.image'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['below', 'above'], edit_type='arraydraw'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'above', 'below'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
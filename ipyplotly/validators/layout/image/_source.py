@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class SourceValidator(ipyplotly.basevalidators.ImageUriValidator):
+
+    def __init__(self, plotly_name='source', parent_name='layout.image'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='arraydraw')
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class YanchorValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='yanchor', parent_name='layout.image'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['top', 'middle', 'bottom'],
+            edit_type='arraydraw'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'bottom', 'middle', 'top'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
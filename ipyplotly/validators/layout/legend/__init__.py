@@ -0,0 +1,36 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._bgcolor import BgcolorValidator
+    from ._bordercolor import BordercolorValidator
+    from ._borderwidth import BorderwidthValidator
+    from ._font import FontValidator
+    from ._orientation import OrientationValidator
+    from ._traceorder import TraceorderValidator
+    from ._tracegroupgap import TracegroupgapValidator
+    from ._x import XValidator
+    from ._xanchor import XanchorValidator
+    from ._y import YValidator
+    from ._yanchor import YanchorValidator
+    from . import font
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+        ],
+        [
+            '._bgcolor.BgcolorValidator',
+            '._bordercolor.BordercolorValidator',
+            '._borderwidth.BorderwidthValidator',
+            '._font.FontValidator',
+            '._orientation.OrientationValidator',
+            '._traceorder.TraceorderValidator',
+            '._tracegroupgap.TracegroupgapValidator',
+            '._x.XValidator',
+            '._xanchor.XanchorValidator',
+            '._y.YValidator',
+            '._yanchor.YanchorValidator',
+        ]
+    )
@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class TraceorderValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='traceorder', parent_name='layout.legend'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            flags=['reversed', 'grouped'],
+            extras=['normal'],
+            edit_type='legend'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'grouped', 'normal', 'reversed'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,34 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._domain import DomainValidator
+    from ._accesstoken import AccesstokenValidator
+    from ._style import StyleValidator
+    from ._center import CenterValidator
+    from ._zoom import ZoomValidator
+    from ._bearing import BearingValidator
+    from ._pitch import PitchValidator
+    from ._layers import LayersValidator
+    from . import layer
+    from . import center
+    from . import domain
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.layer',
+            '.center',
+            '.domain',
+        ],
+        [
+            '._domain.DomainValidator',
+            '._accesstoken.AccesstokenValidator',
+            '._style.StyleValidator',
+            '._center.CenterValidator',
+            '._zoom.ZoomValidator',
+            '._bearing.BearingValidator',
+            '._pitch.PitchValidator',
+            '._layers.LayersValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LayersValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='layers', parent_name='layout.mapbox'):
+        from ipyplotly.datatypes.layout.mapbox import Layer
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Layer)
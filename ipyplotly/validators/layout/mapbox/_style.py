@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class StyleValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='style', parent_name='layout.mapbox'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['basic', 'streets', 'outdoors', 'light', 'dark', 'satellite', 'satellite-streets'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        return v
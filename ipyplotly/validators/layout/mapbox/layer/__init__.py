@@ -0,0 +1,42 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._sourcetype import SourcetypeValidator
+    from ._source import SourceValidator
+    from ._sourcelayer import SourcelayerValidator
+    from ._type import TypeValidator
+    from ._below import BelowValidator
+    from ._color import ColorValidator
+    from ._opacity import OpacityValidator
+    from ._circle import CircleValidator
+    from ._line import LineValidator
+    from ._fill import FillValidator
+    from ._symbol import SymbolValidator
+    from . import symbol
+    from . import fill
+    from . import line
+    from . import circle
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.symbol',
+            '.fill',
+            '.line',
+            '.circle',
+        ],
+        [
+            '._sourcetype.SourcetypeValidator',
+            '._source.SourceValidator',
+            '._sourcelayer.SourcelayerValidator',
+            '._type.TypeValidator',
+            '._below.BelowValidator',
+            '._color.ColorValidator',
+            '._opacity.OpacityValidator',
+            '._circle.CircleValidator',
+            '._line.LineValidator',
+            '._fill.FillValidator',
+            '._symbol.SymbolValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class CircleValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='circle', parent_name='layout.mapbox.layer'):
+        from ipyplotly.datatypes.layout.mapbox.layer import Circle
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Circle)
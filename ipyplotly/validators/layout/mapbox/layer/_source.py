@@ -0,0 +1,10 @@
+import ipyplotly.basevalidators
+
+
+class SourceValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='source', parent_name='layout.mapbox.layer'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='plot')
+
+    def validate_coerce(self, v):
+        return v
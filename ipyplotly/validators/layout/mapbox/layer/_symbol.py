@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class SymbolValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='symbol', parent_name='layout.mapbox.layer'):
+        from ipyplotly.datatypes.layout.mapbox.layer import Symbol
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Symbol)
@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._icon import IconValidator
+    from ._iconsize import IconsizeValidator
+    from ._text import TextValidator
+    from ._textfont import TextfontValidator
+    from ._textposition import TextpositionValidator
+    from . import textfont
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.textfont',
+        ],
+        [
+            '._icon.IconValidator',
+            '._iconsize.IconsizeValidator',
+            '._text.TextValidator',
+            '._textfont.TextfontValidator',
+            '._textposition.TextpositionValidator',
+        ]
+    )
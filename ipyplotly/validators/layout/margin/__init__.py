@@ -0,0 +1,23 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._l import LValidator
+    from ._r import RValidator
+    from ._t import TValidator
+    from ._b import BValidator
+    from ._pad import PadValidator
+    from ._autoexpand import AutoexpandValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._l.LValidator',
+            '._r.RValidator',
+            '._t.TValidator',
+            '._b.BValidator',
+            '._pad.PadValidator',
+            '._autoexpand.AutoexpandValidator',
+        ]
+    )
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class TValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='t', parent_name='layout.margin'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=0, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if v >= 0:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
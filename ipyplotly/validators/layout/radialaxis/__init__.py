@@ -0,0 +1,33 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._range import RangeValidator
+    from ._domain import DomainValidator
+    from ._orientation import OrientationValidator
+    from ._showline import ShowlineValidator
+    from ._showticklabels import ShowticklabelsValidator
+    from ._tickorientation import TickorientationValidator
+    from ._ticklen import TicklenValidator
+    from ._tickcolor import TickcolorValidator
+    from ._ticksuffix import TicksuffixValidator
+    from ._endpadding import EndpaddingValidator
+    from ._visible import VisibleValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._range.RangeValidator',
+            '._domain.DomainValidator',
+            '._orientation.OrientationValidator',
+            '._showline.ShowlineValidator',
+            '._showticklabels.ShowticklabelsValidator',
+            '._tickorientation.TickorientationValidator',
+            '._ticklen.TicklenValidator',
+            '._tickcolor.TickcolorValidator',
+            '._ticksuffix.TicksuffixValidator',
+            '._endpadding.EndpaddingValidator',
+            '._visible.VisibleValidator',
+        ]
+    )
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class TickorientationValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='tickorientation', parent_name='layout.radialaxis'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['horizontal', 'vertical'], edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'horizontal', 'vertical'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,48 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._bgcolor import BgcolorValidator
+    from ._camera import CameraValidator
+    from ._domain import DomainValidator
+    from ._aspectmode import AspectmodeValidator
+    from ._aspectratio import AspectratioValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._zaxis import ZaxisValidator
+    from ._dragmode import DragmodeValidator
+    from ._hovermode import HovermodeValidator
+    from ._annotations import AnnotationsValidator
+    from . import annotation
+    from . import zaxis
+    from . import yaxis
+    from . import xaxis
+    from . import aspectratio
+    from . import domain
+    from . import camera
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.annotation',
+            '.zaxis',
+            '.yaxis',
+            '.xaxis',
+            '.aspectratio',
+            '.domain',
+            '.camera',
+        ],
+        [
+            '._bgcolor.BgcolorValidator',
+            '._camera.CameraValidator',
+            '._domain.DomainValidator',
+            '._aspectmode.AspectmodeValidator',
+            '._aspectratio.AspectratioValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._zaxis.ZaxisValidator',
+            '._dragmode.DragmodeValidator',
+            '._hovermode.HovermodeValidator',
+            '._annotations.AnnotationsValidator',
+        ]
+    )
@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class AspectmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='aspectmode', parent_name='layout.scene'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['auto', 'cube', 'data', 'manual'],
+            edit_type='plot',
+            implied_edits={}
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'auto', 'cube', 'data', 'manual'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
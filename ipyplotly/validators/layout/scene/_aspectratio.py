@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class AspectratioValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='aspectratio', parent_name='layout.scene'):
+        from ipyplotly.datatypes.layout.scene import Aspectratio
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Aspectratio)
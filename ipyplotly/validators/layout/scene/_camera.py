@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class CameraValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='camera', parent_name='layout.scene'):
+        from ipyplotly.datatypes.layout.scene import Camera
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Camera)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class DragmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='dragmode', parent_name='layout.scene'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['orbit', 'turntable', 'zoom', 'pan', False],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'orbit', 'pan', 'turntable', 'zoom', False}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
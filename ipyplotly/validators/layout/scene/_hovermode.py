@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class HovermodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='hovermode', parent_name='layout.scene'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['closest', False], edit_type='modebar'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'closest', False}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
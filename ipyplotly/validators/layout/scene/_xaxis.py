@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class XaxisValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='xaxis', parent_name='layout.scene'):
+        from ipyplotly.datatypes.layout.scene import Xaxis
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Xaxis)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ZaxisValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='zaxis', parent_name='layout.scene'):
+        from ipyplotly.datatypes.layout.scene import Zaxis
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Zaxis)
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class AlignValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='align', parent_name='layout.scene.annotation'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['left', 'center', 'right'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'center', 'left', 'right'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class ArrowheadValidator(ipyplotly.basevalidators.IntegerValidator):
+
+    def __init__(self, plotly_name='arrowhead', parent_name='layout.scene.annotation'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=0, max=8, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int:
+            if 0 <= v <= 8:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class HoverlabelValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='hoverlabel', parent_name='layout.scene.annotation'):
+        from ipyplotly.datatypes.layout.scene.annotation import Hoverlabel
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Hoverlabel)
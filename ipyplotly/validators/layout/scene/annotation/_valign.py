@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class ValignValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='valign', parent_name='layout.scene.annotation'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['top', 'middle', 'bottom'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'bottom', 'middle', 'top'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._up import UpValidator
+    from ._center import CenterValidator
+    from ._eye import EyeValidator
+    from . import eye
+    from . import center
+    from . import up
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.eye',
+            '.center',
+            '.up',
+        ],
+        [
+            '._up.UpValidator',
+            '._center.CenterValidator',
+            '._eye.EyeValidator',
+        ]
+    )
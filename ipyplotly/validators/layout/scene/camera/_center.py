@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class CenterValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='center', parent_name='layout.scene.camera'):
+        from ipyplotly.datatypes.layout.scene.camera import Center
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Center)
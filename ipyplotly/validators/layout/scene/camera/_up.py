@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class UpValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='up', parent_name='layout.scene.camera'):
+        from ipyplotly.datatypes.layout.scene.camera import Up
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Up)
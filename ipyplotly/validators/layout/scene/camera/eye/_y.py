@@ -0,0 +1,14 @@
+import ipyplotly.basevalidators
+
+
+class YValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='y', parent_name='layout.scene.camera.eye'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='camera')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
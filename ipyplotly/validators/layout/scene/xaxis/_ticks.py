@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class TicksValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='ticks', parent_name='layout.scene.xaxis'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['outside', 'inside', ''], edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'', 'inside', 'outside'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,18 @@
+import ipyplotly.basevalidators
+
+
+class DtickrangeValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='dtickrange', parent_name='layout.scene.xaxis.tickformatstop'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            items=[{
+                'valType': 'any',
+                'editType': 'plot'
+            }, {
+                'valType': 'any',
+                'editType': 'plot'
+            }],
+            edit_type='plot'
+        )
@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class AutorangeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='autorange', parent_name='layout.scene.yaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[True, False, 'reversed'],
+            edit_type='plot',
+            implied_edits={}
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'reversed', False, True}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
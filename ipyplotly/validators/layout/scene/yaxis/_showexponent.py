@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ShowexponentValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='showexponent', parent_name='layout.scene.yaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['all', 'first', 'last', 'none'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'all', 'first', 'last', 'none'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,14 @@
+import ipyplotly.basevalidators
+
+
+class TickangleValidator(ipyplotly.basevalidators.AngleValidator):
+
+    def __init__(self, plotly_name='tickangle', parent_name='layout.scene.yaxis'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='plot')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            return (v + 180) % 360 - 180
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class TickformatstopsValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='tickformatstops', parent_name='layout.scene.yaxis'):
+        from ipyplotly.datatypes.layout.scene.yaxis import Tickformatstop
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Tickformatstop)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class TypeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='type', parent_name='layout.scene.yaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['-', 'linear', 'log', 'date', 'category'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'-', 'category', 'date', 'linear', 'log'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class MirrorValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='mirror', parent_name='layout.scene.zaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[True, 'ticks', False, 'all', 'allticks'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'all', 'allticks', 'ticks', False, True}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class Tick0Validator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='tick0', parent_name='layout.scene.zaxis'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, edit_type='plot', implied_edits={'tickmode': 'linear'}
+        )
+
+    def validate_coerce(self, v):
+        return v
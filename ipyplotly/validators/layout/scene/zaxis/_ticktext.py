@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class TicktextValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='ticktext', parent_name='layout.scene.zaxis'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='plot')
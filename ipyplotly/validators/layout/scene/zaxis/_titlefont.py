@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class TitlefontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='titlefont', parent_name='layout.scene.zaxis'):
+        from ipyplotly.datatypes.layout.scene.zaxis import Titlefont
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Titlefont)
@@ -0,0 +1,40 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._type import TypeValidator
+    from ._layer import LayerValidator
+    from ._xref import XrefValidator
+    from ._x0 import X0Validator
+    from ._x1 import X1Validator
+    from ._yref import YrefValidator
+    from ._y0 import Y0Validator
+    from ._y1 import Y1Validator
+    from ._path import PathValidator
+    from ._opacity import OpacityValidator
+    from ._line import LineValidator
+    from ._fillcolor import FillcolorValidator
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._type.TypeValidator',
+            '._layer.LayerValidator',
+            '._xref.XrefValidator',
+            '._x0.X0Validator',
+            '._x1.X1Validator',
+            '._yref.YrefValidator',
+            '._y0.Y0Validator',
+            '._y1.Y1Validator',
+            '._path.PathValidator',
+            '._opacity.OpacityValidator',
+            '._line.LineValidator',
+            '._fillcolor.FillcolorValidator',
+        ]
+    )
@@ -0,0 +1,64 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._active import ActiveValidator
+    from ._steps import StepsValidator
+    from ._lenmode import LenmodeValidator
+    from ._len import LenValidator
+    from ._x import XValidator
+    from ._pad import PadValidator
+    from ._xanchor import XanchorValidator
+    from ._y import YValidator
+    from ._yanchor import YanchorValidator
+    from ._transition import TransitionValidator
+    from ._currentvalue import CurrentvalueValidator
+    from ._font import FontValidator
+    from ._activebgcolor import ActivebgcolorValidator
+    from ._bgcolor import BgcolorValidator
+    from ._bordercolor import BordercolorValidator
+    from ._borderwidth import BorderwidthValidator
+    from ._ticklen import TicklenValidator
+    from ._tickcolor import TickcolorValidator
+    from ._tickwidth import TickwidthValidator
+    from ._minorticklen import MinorticklenValidator
+    from . import font
+    from . import currentvalue
+    from . import transition
+    from . import pad
+    from . import step
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+            '.currentvalue',
+            '.transition',
+            '.pad',
+            '.step',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._active.ActiveValidator',
+            '._steps.StepsValidator',
+            '._lenmode.LenmodeValidator',
+            '._len.LenValidator',
+            '._x.XValidator',
+            '._pad.PadValidator',
+            '._xanchor.XanchorValidator',
+            '._y.YValidator',
+            '._yanchor.YanchorValidator',
+            '._transition.TransitionValidator',
+            '._currentvalue.CurrentvalueValidator',
+            '._font.FontValidator',
+            '._activebgcolor.ActivebgcolorValidator',
+            '._bgcolor.BgcolorValidator',
+            '._bordercolor.BordercolorValidator',
+            '._borderwidth.BorderwidthValidator',
+            '._ticklen.TicklenValidator',
+            '._tickcolor.TickcolorValidator',
+            '._tickwidth.TickwidthValidator',
+            '._minorticklen.MinorticklenValidator',
+        ]
+    )
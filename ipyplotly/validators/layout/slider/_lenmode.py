@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class LenmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='lenmode', parent_name='layout.slider'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['fraction', 'pixels'], edit_type='arraydraw'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'fraction', 'pixels'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
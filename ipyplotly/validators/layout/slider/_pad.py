@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class PadValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='pad', parent_name='layout.slider'):
+        from ipyplotly.datatypes.layout.slider import Pad
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Pad)
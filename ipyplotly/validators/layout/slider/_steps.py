@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class StepsValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='steps', parent_name='layout.slider'):
+        from ipyplotly.datatypes.layout.slider import Step
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Step)
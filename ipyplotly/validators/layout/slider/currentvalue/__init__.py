@@ -0,0 +1,26 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._xanchor import XanchorValidator
+    from ._offset import OffsetValidator
+    from ._prefix import PrefixValidator
+    from ._suffix import SuffixValidator
+    from ._font import FontValidator
+    from . import font
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._xanchor.XanchorValidator',
+            '._offset.OffsetValidator',
+            '._prefix.PrefixValidator',
+            '._suffix.SuffixValidator',
+            '._font.FontValidator',
+        ]
+    )
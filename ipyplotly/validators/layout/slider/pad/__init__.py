@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._t import TValidator
+    from ._r import RValidator
+    from ._b import BValidator
+    from ._l import LValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._t.TValidator',
+            '._r.RValidator',
+            '._b.BValidator',
+            '._l.LValidator',
+        ]
+    )
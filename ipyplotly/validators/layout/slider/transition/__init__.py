@@ -0,0 +1,15 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._duration import DurationValidator
+    from ._easing import EasingValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._duration.DurationValidator',
+            '._easing.EasingValidator',
+        ]
+    )
@@ -0,0 +1,32 @@
+import ipyplotly.basevalidators
+
+
+class EasingValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='easing', parent_name='layout.slider.transition'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[
+                'linear', 'quad', 'cubic', 'sin', 'exp', 'circle', 'elastic', 'back', 'bounce', 'linear-in', 'quad-in',
+                'cubic-in', 'sin-in', 'exp-in', 'circle-in', 'elastic-in', 'back-in', 'bounce-in', 'linear-out',
+                'quad-out', 'cubic-out', 'sin-out', 'exp-out', 'circle-out', 'elastic-out', 'back-out', 'bounce-out',
+                'linear-in-out', 'quad-in-out', 'cubic-in-out', 'sin-in-out', 'exp-in-out', 'circle-in-out',
+                'elastic-in-out', 'back-in-out', 'bounce-in-out'
+            ],
+            edit_type='arraydraw'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {
+                'back', 'back-in', 'back-in-out', 'back-out', 'bounce', 'bounce-in', 'bounce-in-out', 'bounce-out',
+                'circle', 'circle-in', 'circle-in-out', 'circle-out', 'cubic', 'cubic-in', 'cubic-in-out', 'cubic-out',
+                'elastic', 'elastic-in', 'elastic-in-out', 'elastic-out', 'exp', 'exp-in', 'exp-in-out', 'exp-out',
+                'linear', 'linear-in', 'linear-in-out', 'linear-out', 'quad', 'quad-in', 'quad-in-out', 'quad-out',
+                'sin', 'sin-in', 'sin-in-out', 'sin-out'
+            }:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
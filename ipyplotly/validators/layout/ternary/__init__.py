@@ -0,0 +1,32 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._domain import DomainValidator
+    from ._bgcolor import BgcolorValidator
+    from ._sum import SumValidator
+    from ._aaxis import AaxisValidator
+    from ._baxis import BaxisValidator
+    from ._caxis import CaxisValidator
+    from . import caxis
+    from . import baxis
+    from . import aaxis
+    from . import domain
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.caxis',
+            '.baxis',
+            '.aaxis',
+            '.domain',
+        ],
+        [
+            '._domain.DomainValidator',
+            '._bgcolor.BgcolorValidator',
+            '._sum.SumValidator',
+            '._aaxis.AaxisValidator',
+            '._baxis.BaxisValidator',
+            '._caxis.CaxisValidator',
+        ]
+    )
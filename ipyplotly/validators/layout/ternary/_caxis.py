@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class CaxisValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='caxis', parent_name='layout.ternary'):
+        from ipyplotly.datatypes.layout.ternary import Caxis
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Caxis)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class LayerValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='layer', parent_name='layout.ternary.aaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['above traces', 'below traces'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'above traces', 'below traces'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,90 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._title import TitleValidator
+    from ._titlefont import TitlefontValidator
+    from ._color import ColorValidator
+    from ._tickmode import TickmodeValidator
+    from ._nticks import NticksValidator
+    from ._tick0 import Tick0Validator
+    from ._dtick import DtickValidator
+    from ._tickvals import TickvalsValidator
+    from ._ticktext import TicktextValidator
+    from ._ticks import TicksValidator
+    from ._ticklen import TicklenValidator
+    from ._tickwidth import TickwidthValidator
+    from ._tickcolor import TickcolorValidator
+    from ._showticklabels import ShowticklabelsValidator
+    from ._showtickprefix import ShowtickprefixValidator
+    from ._tickprefix import TickprefixValidator
+    from ._showticksuffix import ShowticksuffixValidator
+    from ._ticksuffix import TicksuffixValidator
+    from ._showexponent import ShowexponentValidator
+    from ._exponentformat import ExponentformatValidator
+    from ._separatethousands import SeparatethousandsValidator
+    from ._tickfont import TickfontValidator
+    from ._tickangle import TickangleValidator
+    from ._tickformat import TickformatValidator
+    from ._tickformatstops import TickformatstopsValidator
+    from ._hoverformat import HoverformatValidator
+    from ._showline import ShowlineValidator
+    from ._linecolor import LinecolorValidator
+    from ._linewidth import LinewidthValidator
+    from ._showgrid import ShowgridValidator
+    from ._gridcolor import GridcolorValidator
+    from ._gridwidth import GridwidthValidator
+    from ._layer import LayerValidator
+    from ._min import MinValidator
+    from ._tickvalssrc import TickvalssrcValidator
+    from ._ticktextsrc import TicktextsrcValidator
+    from . import tickformatstop
+    from . import tickfont
+    from . import titlefont
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.tickformatstop',
+            '.tickfont',
+            '.titlefont',
+        ],
+        [
+            '._title.TitleValidator',
+            '._titlefont.TitlefontValidator',
+            '._color.ColorValidator',
+            '._tickmode.TickmodeValidator',
+            '._nticks.NticksValidator',
+            '._tick0.Tick0Validator',
+            '._dtick.DtickValidator',
+            '._tickvals.TickvalsValidator',
+            '._ticktext.TicktextValidator',
+            '._ticks.TicksValidator',
+            '._ticklen.TicklenValidator',
+            '._tickwidth.TickwidthValidator',
+            '._tickcolor.TickcolorValidator',
+            '._showticklabels.ShowticklabelsValidator',
+            '._showtickprefix.ShowtickprefixValidator',
+            '._tickprefix.TickprefixValidator',
+            '._showticksuffix.ShowticksuffixValidator',
+            '._ticksuffix.TicksuffixValidator',
+            '._showexponent.ShowexponentValidator',
+            '._exponentformat.ExponentformatValidator',
+            '._separatethousands.SeparatethousandsValidator',
+            '._tickfont.TickfontValidator',
+            '._tickangle.TickangleValidator',
+            '._tickformat.TickformatValidator',
+            '._tickformatstops.TickformatstopsValidator',
+            '._hoverformat.HoverformatValidator',
+            '._showline.ShowlineValidator',
+            '._linecolor.LinecolorValidator',
+            '._linewidth.LinewidthValidator',
+            '._showgrid.ShowgridValidator',
+            '._gridcolor.GridcolorValidator',
+            '._gridwidth.GridwidthValidator',
+            '._layer.LayerValidator',
+            '._min.MinValidator',
+            '._tickvalssrc.TickvalssrcValidator',
+            '._ticktextsrc.TicktextsrcValidator',
+        ]
+    )
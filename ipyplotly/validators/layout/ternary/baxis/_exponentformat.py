@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ExponentformatValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='exponentformat', parent_name='layout.ternary.baxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['none', 'e', 'E', 'power', 'SI', 'B'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'B', 'E', 'SI', 'e', 'none', 'power'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
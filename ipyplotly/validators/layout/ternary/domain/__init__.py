@@ -0,0 +1,15 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._x import XValidator
+    from ._y import YValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._x.XValidator',
+            '._y.YValidator',
+        ]
+    )
@@ -0,0 +1,48 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._type import TypeValidator
+    from ._direction import DirectionValidator
+    from ._active import ActiveValidator
+    from ._showactive import ShowactiveValidator
+    from ._buttons import ButtonsValidator
+    from ._x import XValidator
+    from ._xanchor import XanchorValidator
+    from ._y import YValidator
+    from ._yanchor import YanchorValidator
+    from ._pad import PadValidator
+    from ._font import FontValidator
+    from ._bgcolor import BgcolorValidator
+    from ._bordercolor import BordercolorValidator
+    from ._borderwidth import BorderwidthValidator
+    from . import font
+    from . import pad
+    from . import button
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+            '.pad',
+            '.button',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._type.TypeValidator',
+            '._direction.DirectionValidator',
+            '._active.ActiveValidator',
+            '._showactive.ShowactiveValidator',
+            '._buttons.ButtonsValidator',
+            '._x.XValidator',
+            '._xanchor.XanchorValidator',
+            '._y.YValidator',
+            '._yanchor.YanchorValidator',
+            '._pad.PadValidator',
+            '._font.FontValidator',
+            '._bgcolor.BgcolorValidator',
+            '._bordercolor.BordercolorValidator',
+            '._borderwidth.BorderwidthValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ButtonsValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='buttons', parent_name='layout.updatemenu'):
+        from ipyplotly.datatypes.layout.updatemenu import Button
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Button)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class DirectionValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='direction', parent_name='layout.updatemenu'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['left', 'right', 'up', 'down'],
+            edit_type='arraydraw'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'down', 'left', 'right', 'up'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._method import MethodValidator
+    from ._args import ArgsValidator
+    from ._label import LabelValidator
+    from ._execute import ExecuteValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._method.MethodValidator',
+            '._args.ArgsValidator',
+            '._label.LabelValidator',
+            '._execute.ExecuteValidator',
+        ]
+    )
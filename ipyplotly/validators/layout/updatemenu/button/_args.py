@@ -0,0 +1,24 @@
+import ipyplotly.basevalidators
+
+
+class ArgsValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='args', parent_name='layout.updatemenu.button'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            free_length=True,
+            items=[
+                {
+                    'valType': 'any',
+                    'editType': 'arraydraw'
+                }, {
+                    'valType': 'any',
+                    'editType': 'arraydraw'
+                }, {
+                    'valType': 'any',
+                    'editType': 'arraydraw'
+                }
+            ],
+            edit_type='arraydraw'
+        )
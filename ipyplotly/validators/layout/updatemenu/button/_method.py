@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class MethodValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='method', parent_name='layout.updatemenu.button'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['restyle', 'relayout', 'animate', 'update', 'skip'],
+            edit_type='arraydraw'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'animate', 'relayout', 'restyle', 'skip', 'update'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
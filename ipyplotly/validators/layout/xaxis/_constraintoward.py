@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ConstraintowardValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='constraintoward', parent_name='layout.xaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['left', 'center', 'right', 'top', 'middle', 'bottom'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'bottom', 'center', 'left', 'middle', 'right', 'top'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
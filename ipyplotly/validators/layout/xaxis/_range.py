@@ -0,0 +1,27 @@
+import ipyplotly.basevalidators
+
+
+class RangeValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='range', parent_name='layout.xaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            items=[
+                {
+                    'valType': 'any',
+                    'editType': 'plot',
+                    'impliedEdits': {
+                        '^autorange': False
+                    }
+                }, {
+                    'valType': 'any',
+                    'editType': 'plot',
+                    'impliedEdits': {
+                        '^autorange': False
+                    }
+                }
+            ],
+            edit_type='plot',
+            implied_edits={'autorange': False}
+        )
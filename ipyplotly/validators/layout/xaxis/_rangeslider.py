@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class RangesliderValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='rangeslider', parent_name='layout.xaxis'):
+        from ipyplotly.datatypes.layout.xaxis import Rangeslider
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Rangeslider)
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class SpikemodeValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='spikemode', parent_name='layout.xaxis'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, flags=['toaxis', 'across', 'marker'], edit_type='none'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'across', 'marker', 'toaxis'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
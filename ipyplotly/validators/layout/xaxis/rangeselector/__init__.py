@@ -0,0 +1,38 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._buttons import ButtonsValidator
+    from ._x import XValidator
+    from ._xanchor import XanchorValidator
+    from ._y import YValidator
+    from ._yanchor import YanchorValidator
+    from ._font import FontValidator
+    from ._bgcolor import BgcolorValidator
+    from ._activecolor import ActivecolorValidator
+    from ._bordercolor import BordercolorValidator
+    from ._borderwidth import BorderwidthValidator
+    from . import font
+    from . import button
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+            '.button',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._buttons.ButtonsValidator',
+            '._x.XValidator',
+            '._xanchor.XanchorValidator',
+            '._y.YValidator',
+            '._yanchor.YanchorValidator',
+            '._font.FontValidator',
+            '._bgcolor.BgcolorValidator',
+            '._activecolor.ActivecolorValidator',
+            '._bordercolor.BordercolorValidator',
+            '._borderwidth.BorderwidthValidator',
+        ]
+    )
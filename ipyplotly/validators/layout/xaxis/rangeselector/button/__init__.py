@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._step import StepValidator
+    from ._stepmode import StepmodeValidator
+    from ._count import CountValidator
+    from ._label import LabelValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._step.StepValidator',
+            '._stepmode.StepmodeValidator',
+            '._count.CountValidator',
+            '._label.LabelValidator',
+        ]
+    )
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class StepValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='step', parent_name='layout.xaxis.rangeselector.button'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['month', 'year', 'day', 'hour', 'minute', 'second', 'all'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'all', 'day', 'hour', 'minute', 'month', 'second', 'year'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
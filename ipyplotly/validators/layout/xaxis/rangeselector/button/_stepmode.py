@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class StepmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='stepmode', parent_name='layout.xaxis.rangeselector.button'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['backward', 'todate'], edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'backward', 'todate'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
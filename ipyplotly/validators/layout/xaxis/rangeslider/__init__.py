@@ -0,0 +1,25 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._bgcolor import BgcolorValidator
+    from ._bordercolor import BordercolorValidator
+    from ._borderwidth import BorderwidthValidator
+    from ._autorange import AutorangeValidator
+    from ._range import RangeValidator
+    from ._thickness import ThicknessValidator
+    from ._visible import VisibleValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._bgcolor.BgcolorValidator',
+            '._bordercolor.BordercolorValidator',
+            '._borderwidth.BorderwidthValidator',
+            '._autorange.AutorangeValidator',
+            '._range.RangeValidator',
+            '._thickness.ThicknessValidator',
+            '._visible.VisibleValidator',
+        ]
+    )
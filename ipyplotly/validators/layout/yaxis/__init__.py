@@ -0,0 +1,144 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._color import ColorValidator
+    from ._title import TitleValidator
+    from ._titlefont import TitlefontValidator
+    from ._type import TypeValidator
+    from ._autorange import AutorangeValidator
+    from ._rangemode import RangemodeValidator
+    from ._range import RangeValidator
+    from ._fixedrange import FixedrangeValidator
+    from ._scaleanchor import ScaleanchorValidator
+    from ._scaleratio import ScaleratioValidator
+    from ._constrain import ConstrainValidator
+    from ._constraintoward import ConstraintowardValidator
+    from ._tickmode import TickmodeValidator
+    from ._nticks import NticksValidator
+    from ._tick0 import Tick0Validator
+    from ._dtick import DtickValidator
+    from ._tickvals import TickvalsValidator
+    from ._ticktext import TicktextValidator
+    from ._ticks import TicksValidator
+    from ._mirror import MirrorValidator
+    from ._ticklen import TicklenValidator
+    from ._tickwidth import TickwidthValidator
+    from ._tickcolor import TickcolorValidator
+    from ._showticklabels import ShowticklabelsValidator
+    from ._showspikes import ShowspikesValidator
+    from ._spikecolor import SpikecolorValidator
+    from ._spikethickness import SpikethicknessValidator
+    from ._spikedash import SpikedashValidator
+    from ._spikemode import SpikemodeValidator
+    from ._tickfont import TickfontValidator
+    from ._tickangle import TickangleValidator
+    from ._tickprefix import TickprefixValidator
+    from ._showtickprefix import ShowtickprefixValidator
+    from ._ticksuffix import TicksuffixValidator
+    from ._showticksuffix import ShowticksuffixValidator
+    from ._showexponent import ShowexponentValidator
+    from ._exponentformat import ExponentformatValidator
+    from ._separatethousands import SeparatethousandsValidator
+    from ._tickformat import TickformatValidator
+    from ._tickformatstops import TickformatstopsValidator
+    from ._hoverformat import HoverformatValidator
+    from ._showline import ShowlineValidator
+    from ._linecolor import LinecolorValidator
+    from ._linewidth import LinewidthValidator
+    from ._showgrid import ShowgridValidator
+    from ._gridcolor import GridcolorValidator
+    from ._gridwidth import GridwidthValidator
+    from ._zeroline import ZerolineValidator
+    from ._zerolinecolor import ZerolinecolorValidator
+    from ._zerolinewidth import ZerolinewidthValidator
+    from ._anchor import AnchorValidator
+    from ._side import SideValidator
+    from ._overlaying import OverlayingValidator
+    from ._layer import LayerValidator
+    from ._domain import DomainValidator
+    from ._position import PositionValidator
+    from ._categoryorder import CategoryorderValidator
+    from ._categoryarray import CategoryarrayValidator
+    from ._calendar import CalendarValidator
+    from ._tickvalssrc import TickvalssrcValidator
+    from ._ticktextsrc import TicktextsrcValidator
+    from ._categoryarraysrc import CategoryarraysrcValidator
+    from . import tickformatstop
+    from . import tickfont
+    from . import titlefont
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.tickformatstop',
+            '.tickfont',
+            '.titlefont',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._color.ColorValidator',
+            '._title.TitleValidator',
+            '._titlefont.TitlefontValidator',
+            '._type.TypeValidator',
+            '._autorange.AutorangeValidator',
+            '._rangemode.RangemodeValidator',
+            '._range.RangeValidator',
+            '._fixedrange.FixedrangeValidator',
+            '._scaleanchor.ScaleanchorValidator',
+            '._scaleratio.ScaleratioValidator',
+            '._constrain.ConstrainValidator',
+            '._constraintoward.ConstraintowardValidator',
+            '._tickmode.TickmodeValidator',
+            '._nticks.NticksValidator',
+            '._tick0.Tick0Validator',
+            '._dtick.DtickValidator',
+            '._tickvals.TickvalsValidator',
+            '._ticktext.TicktextValidator',
+            '._ticks.TicksValidator',
+            '._mirror.MirrorValidator',
+            '._ticklen.TicklenValidator',
+            '._tickwidth.TickwidthValidator',
+            '._tickcolor.TickcolorValidator',
+            '._showticklabels.ShowticklabelsValidator',
+            '._showspikes.ShowspikesValidator',
+            '._spikecolor.SpikecolorValidator',
+            '._spikethickness.SpikethicknessValidator',
+            '._spikedash.SpikedashValidator',
+            '._spikemode.SpikemodeValidator',
+            '._tickfont.TickfontValidator',
+            '._tickangle.TickangleValidator',
+            '._tickprefix.TickprefixValidator',
+            '._showtickprefix.ShowtickprefixValidator',
+            '._ticksuffix.TicksuffixValidator',
+            '._showticksuffix.ShowticksuffixValidator',
+            '._showexponent.ShowexponentValidator',
+            '._exponentformat.ExponentformatValidator',
+            '._separatethousands.SeparatethousandsValidator',
+            '._tickformat.TickformatValidator',
+            '._tickformatstops.TickformatstopsValidator',
+            '._hoverformat.HoverformatValidator',
+            '._showline.ShowlineValidator',
+            '._linecolor.LinecolorValidator',
+            '._linewidth.LinewidthValidator',
+            '._showgrid.ShowgridValidator',
+            '._gridcolor.GridcolorValidator',
+            '._gridwidth.GridwidthValidator',
+            '._zeroline.ZerolineValidator',
+            '._zerolinecolor.ZerolinecolorValidator',
+            '._zerolinewidth.ZerolinewidthValidator',
+            '._anchor.AnchorValidator',
+            '._side.SideValidator',
+            '._overlaying.OverlayingValidator',
+            '._layer.LayerValidator',
+            '._domain.DomainValidator',
+            '._position.PositionValidator',
+            '._categoryorder.CategoryorderValidator',
+            '._categoryarray.CategoryarrayValidator',
+            '._calendar.CalendarValidator',
+            '._tickvalssrc.TickvalssrcValidator',
+            '._ticktextsrc.TicktextsrcValidator',
+            '._categoryarraysrc.CategoryarraysrcValidator',
+        ]
+    )
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class AnchorValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='anchor', parent_name='layout.yaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['free', '/^x([2-9]|[1-9][0-9]+)?$/', '/^y([2-9]|[1-9][0-9]+)?$/'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'free'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
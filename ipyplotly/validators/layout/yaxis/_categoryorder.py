@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class CategoryorderValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='categoryorder', parent_name='layout.yaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['trace', 'category ascending', 'category descending', 'array'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'array', 'category ascending', 'category descending', 'trace'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
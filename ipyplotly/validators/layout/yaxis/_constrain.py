@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class ConstrainValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='constrain', parent_name='layout.yaxis'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['range', 'domain'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'domain', 'range'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class SideValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='side', parent_name='layout.yaxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['top', 'bottom', 'left', 'right'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'bottom', 'left', 'right', 'top'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,132 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._scatter import ScatterValidator
+    from ._box import BoxValidator
+    from ._bar import BarValidator
+    from ._heatmap import HeatmapValidator
+    from ._histogram import HistogramValidator
+    from ._histogram2d import Histogram2DValidator
+    from ._histogram2dcontour import Histogram2DcontourValidator
+    from ._pie import PieValidator
+    from ._contour import ContourValidator
+    from ._scatterternary import ScatterternaryValidator
+    from ._violin import ViolinValidator
+    from ._scatter3d import Scatter3DValidator
+    from ._surface import SurfaceValidator
+    from ._mesh3d import Mesh3DValidator
+    from ._scattergeo import ScattergeoValidator
+    from ._choropleth import ChoroplethValidator
+    from ._scattergl import ScatterglValidator
+    from ._pointcloud import PointcloudValidator
+    from ._heatmapgl import HeatmapglValidator
+    from ._parcoords import ParcoordsValidator
+    from ._parcats import ParcatsValidator
+    from ._scattermapbox import ScattermapboxValidator
+    from ._sankey import SankeyValidator
+    from ._table import TableValidator
+    from ._carpet import CarpetValidator
+    from ._scattercarpet import ScattercarpetValidator
+    from ._contourcarpet import ContourcarpetValidator
+    from ._ohlc import OhlcValidator
+    from ._candlestick import CandlestickValidator
+    from ._area import AreaValidator
+    from . import area
+    from . import candlestick
+    from . import ohlc
+    from . import contourcarpet
+    from . import scattercarpet
+    from . import carpet
+    from . import table
+    from . import sankey
+    from . import scattermapbox
+    from . import parcats
+    from . import parcoords
+    from . import heatmapgl
+    from . import pointcloud
+    from . import scattergl
+    from . import choropleth
+    from . import scattergeo
+    from . import mesh3d
+    from . import surface
+    from . import scatter3d
+    from . import violin
+    from . import scatterternary
+    from . import contour
+    from . import pie
+    from . import histogram2dcontour
+    from . import histogram2d
+    from . import histogram
+    from . import heatmap
+    from . import bar
+    from . import box
+    from . import scatter
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.area',
+            '.candlestick',
+            '.ohlc',
+            '.contourcarpet',
+            '.scattercarpet',
+            '.carpet',
+            '.table',
+            '.sankey',
+            '.scattermapbox',
+            '.parcats',
+            '.parcoords',
+            '.heatmapgl',
+            '.pointcloud',
+            '.scattergl',
+            '.choropleth',
+            '.scattergeo',
+            '.mesh3d',
+            '.surface',
+            '.scatter3d',
+            '.violin',
+            '.scatterternary',
+            '.contour',
+            '.pie',
+            '.histogram2dcontour',
+            '.histogram2d',
+            '.histogram',
+            '.heatmap',
+            '.bar',
+            '.box',
+            '.scatter',
+        ],
+        [
+            '._scatter.ScatterValidator',
+            '._box.BoxValidator',
+            '._bar.BarValidator',
+            '._heatmap.HeatmapValidator',
+            '._histogram.HistogramValidator',
+            '._histogram2d.Histogram2DValidator',
+            '._histogram2dcontour.Histogram2DcontourValidator',
+            '._pie.PieValidator',
+            '._contour.ContourValidator',
+            '._scatterternary.ScatterternaryValidator',
+            '._violin.ViolinValidator',
+            '._scatter3d.Scatter3DValidator',
+            '._surface.SurfaceValidator',
+            '._mesh3d.Mesh3DValidator',
+            '._scattergeo.ScattergeoValidator',
+            '._choropleth.ChoroplethValidator',
+            '._scattergl.ScatterglValidator',
+            '._pointcloud.PointcloudValidator',
+            '._heatmapgl.HeatmapglValidator',
+            '._parcoords.ParcoordsValidator',
+            '._parcats.ParcatsValidator',
+            '._scattermapbox.ScattermapboxValidator',
+            '._sankey.SankeyValidator',
+            '._table.TableValidator',
+            '._carpet.CarpetValidator',
+            '._scattercarpet.ScattercarpetValidator',
+            '._contourcarpet.ContourcarpetValidator',
+            '._ohlc.OhlcValidator',
+            '._candlestick.CandlestickValidator',
+            '._area.AreaValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class AreaValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='area', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Area
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Area)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class BarValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='bar', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Bar
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Bar)
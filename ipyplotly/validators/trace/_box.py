@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class BoxValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='box', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Box
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Box)
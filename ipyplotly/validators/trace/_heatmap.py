@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class HeatmapValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='heatmap', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Heatmap
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Heatmap)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class HeatmapglValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='heatmapgl', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Heatmapgl
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Heatmapgl)
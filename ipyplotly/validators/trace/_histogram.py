@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class HistogramValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='histogram', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Histogram
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Histogram)
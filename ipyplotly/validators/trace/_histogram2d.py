@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class Histogram2DValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='histogram2d', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Histogram2D
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Histogram2D)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class Histogram2DcontourValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='histogram2dcontour', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Histogram2Dcontour
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Histogram2Dcontour)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class Mesh3DValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='mesh3d', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Mesh3D
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Mesh3D)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class OhlcValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='ohlc', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Ohlc
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Ohlc)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ParcatsValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='parcats', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Parcats
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Parcats)
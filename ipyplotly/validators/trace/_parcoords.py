@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ParcoordsValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='parcoords', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Parcoords
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Parcoords)
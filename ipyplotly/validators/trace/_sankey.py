@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class SankeyValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='sankey', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Sankey
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Sankey)
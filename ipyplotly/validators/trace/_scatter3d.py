@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class Scatter3DValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='scatter3d', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Scatter3D
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Scatter3D)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ScattercarpetValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='scattercarpet', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Scattercarpet
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Scattercarpet)
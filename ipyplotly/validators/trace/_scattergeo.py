@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ScattergeoValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='scattergeo', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Scattergeo
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Scattergeo)
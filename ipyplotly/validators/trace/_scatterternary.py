@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ScatterternaryValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='scatterternary', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Scatterternary
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Scatterternary)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ViolinValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='violin', parent_name='trace'):
+        from ipyplotly.datatypes.trace import Violin
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Violin)
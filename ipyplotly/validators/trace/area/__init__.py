@@ -0,0 +1,60 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._r import RValidator
+    from ._t import TValidator
+    from ._marker import MarkerValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._rsrc import RsrcValidator
+    from ._tsrc import TsrcValidator
+    from ._transforms import TransformsValidator
+    from . import marker
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.marker',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._r.RValidator',
+            '._t.TValidator',
+            '._marker.MarkerValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._rsrc.RsrcValidator',
+            '._tsrc.TsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
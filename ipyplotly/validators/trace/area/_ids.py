@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class IdsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='ids', parent_name='trace.area'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
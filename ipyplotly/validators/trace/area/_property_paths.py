@@ -0,0 +1,48 @@
+# Property paths of trace.area
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'r': ('', 'RValidator', 'simple'),
+    't': ('', 'TValidator', 'simple'),
+    'marker': ('', 'MarkerValidator', 'compound'),
+    'marker.color': ('.marker', 'ColorValidator', 'simple'),
+    'marker.size': ('.marker', 'SizeValidator', 'simple'),
+    'marker.symbol': ('.marker', 'SymbolValidator', 'simple'),
+    'marker.opacity': ('.marker', 'OpacityValidator', 'simple'),
+    'marker.colorsrc': ('.marker', 'ColorsrcValidator', 'simple'),
+    'marker.sizesrc': ('.marker', 'SizesrcValidator', 'simple'),
+    'marker.symbolsrc': ('.marker', 'SymbolsrcValidator', 'simple'),
+    'marker.opacitysrc': ('.marker', 'OpacitysrcValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'rsrc': ('', 'RsrcValidator', 'simple'),
+    'tsrc': ('', 'TsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
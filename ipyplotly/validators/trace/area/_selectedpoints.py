@@ -0,0 +1,10 @@
+import ipyplotly.basevalidators
+
+
+class SelectedpointsValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='selectedpoints', parent_name='trace.area'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
+
+    def validate_coerce(self, v):
+        return v
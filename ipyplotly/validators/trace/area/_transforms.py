@@ -0,0 +1,7 @@
+import ipyplotly.validators
+
+
+class TransformsValidator(ipyplotly.validators.TransformsValidator):
+
+    def __init__(self, plotly_name='transforms', parent_name='trace.area'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name)
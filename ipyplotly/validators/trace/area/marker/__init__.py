@@ -0,0 +1,27 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._color import ColorValidator
+    from ._size import SizeValidator
+    from ._symbol import SymbolValidator
+    from ._opacity import OpacityValidator
+    from ._colorsrc import ColorsrcValidator
+    from ._sizesrc import SizesrcValidator
+    from ._symbolsrc import SymbolsrcValidator
+    from ._opacitysrc import OpacitysrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._color.ColorValidator',
+            '._size.SizeValidator',
+            '._symbol.SymbolValidator',
+            '._opacity.OpacityValidator',
+            '._colorsrc.ColorsrcValidator',
+            '._sizesrc.SizesrcValidator',
+            '._symbolsrc.SymbolsrcValidator',
+            '._opacitysrc.OpacitysrcValidator',
+        ]
+    )
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class OpacityValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='opacity', parent_name='trace.area.marker'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, min=0, max=1, array_ok=True, edit_type='style'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if 0 <= v <= 1:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
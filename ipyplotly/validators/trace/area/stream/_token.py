@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class TokenValidator(ipyplotly.basevalidators.StringValidator):
+
+    def __init__(self, plotly_name='token', parent_name='trace.area.stream'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, no_blank=True, strict=True, edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,140 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._x import XValidator
+    from ._x0 import X0Validator
+    from ._dx import DxValidator
+    from ._y import YValidator
+    from ._y0 import Y0Validator
+    from ._dy import DyValidator
+    from ._text import TextValidator
+    from ._hovertext import HovertextValidator
+    from ._textposition import TextpositionValidator
+    from ._textfont import TextfontValidator
+    from ._insidetextfont import InsidetextfontValidator
+    from ._outsidetextfont import OutsidetextfontValidator
+    from ._constraintext import ConstraintextValidator
+    from ._orientation import OrientationValidator
+    from ._base import BaseValidator
+    from ._offset import OffsetValidator
+    from ._width import WidthValidator
+    from ._marker import MarkerValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._r import RValidator
+    from ._t import TValidator
+    from ._error_y import ErrorYValidator
+    from ._error_x import ErrorXValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._hovertextsrc import HovertextsrcValidator
+    from ._textpositionsrc import TextpositionsrcValidator
+    from ._basesrc import BasesrcValidator
+    from ._offsetsrc import OffsetsrcValidator
+    from ._widthsrc import WidthsrcValidator
+    from ._rsrc import RsrcValidator
+    from ._tsrc import TsrcValidator
+    from ._transforms import TransformsValidator
+    from . import error_x
+    from . import error_y
+    from . import unselected
+    from . import selected
+    from . import marker
+    from . import outsidetextfont
+    from . import insidetextfont
+    from . import textfont
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.error_x',
+            '.error_y',
+            '.unselected',
+            '.selected',
+            '.marker',
+            '.outsidetextfont',
+            '.insidetextfont',
+            '.textfont',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._x.XValidator',
+            '._x0.X0Validator',
+            '._dx.DxValidator',
+            '._y.YValidator',
+            '._y0.Y0Validator',
+            '._dy.DyValidator',
+            '._text.TextValidator',
+            '._hovertext.HovertextValidator',
+            '._textposition.TextpositionValidator',
+            '._textfont.TextfontValidator',
+            '._insidetextfont.InsidetextfontValidator',
+            '._outsidetextfont.OutsidetextfontValidator',
+            '._constraintext.ConstraintextValidator',
+            '._orientation.OrientationValidator',
+            '._base.BaseValidator',
+            '._offset.OffsetValidator',
+            '._width.WidthValidator',
+            '._marker.MarkerValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._r.RValidator',
+            '._t.TValidator',
+            '._error_y.ErrorYValidator',
+            '._error_x.ErrorXValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._hovertextsrc.HovertextsrcValidator',
+            '._textpositionsrc.TextpositionsrcValidator',
+            '._basesrc.BasesrcValidator',
+            '._offsetsrc.OffsetsrcValidator',
+            '._widthsrc.WidthsrcValidator',
+            '._rsrc.RsrcValidator',
+            '._tsrc.TsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class BaseValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='base', parent_name='trace.bar'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, array_ok=True, edit_type='calc')
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ConstraintextValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='constraintext', parent_name='trace.bar'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['inside', 'outside', 'both', 'none'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'both', 'inside', 'none', 'outside'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
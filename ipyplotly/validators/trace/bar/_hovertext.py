@@ -0,0 +1,14 @@
+import ipyplotly.basevalidators
+
+
+class HovertextValidator(ipyplotly.basevalidators.StringValidator):
+
+    def __init__(self, plotly_name='hovertext', parent_name='trace.bar'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, array_ok=True, edit_type='style')
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
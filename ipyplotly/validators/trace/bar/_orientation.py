@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class OrientationValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='orientation', parent_name='trace.bar'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['v', 'h'], edit_type='calc+clearAxisTypes'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'h', 'v'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
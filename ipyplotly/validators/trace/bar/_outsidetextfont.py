@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class OutsidetextfontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='outsidetextfont', parent_name='trace.bar'):
+        from ipyplotly.datatypes.trace.bar import Outsidetextfont
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Outsidetextfont)
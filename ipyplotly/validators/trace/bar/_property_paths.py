@@ -0,0 +1,206 @@
+# Property paths of trace.bar
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'x': ('', 'XValidator', 'simple'),
+    'x0': ('', 'X0Validator', 'simple'),
+    'dx': ('', 'DxValidator', 'simple'),
+    'y': ('', 'YValidator', 'simple'),
+    'y0': ('', 'Y0Validator', 'simple'),
+    'dy': ('', 'DyValidator', 'simple'),
+    'text': ('', 'TextValidator', 'simple'),
+    'hovertext': ('', 'HovertextValidator', 'simple'),
+    'textposition': ('', 'TextpositionValidator', 'simple'),
+    'textfont': ('', 'TextfontValidator', 'compound'),
+    'textfont.family': ('.textfont', 'FamilyValidator', 'simple'),
+    'textfont.size': ('.textfont', 'SizeValidator', 'simple'),
+    'textfont.color': ('.textfont', 'ColorValidator', 'simple'),
+    'textfont.familysrc': ('.textfont', 'FamilysrcValidator', 'simple'),
+    'textfont.sizesrc': ('.textfont', 'SizesrcValidator', 'simple'),
+    'textfont.colorsrc': ('.textfont', 'ColorsrcValidator', 'simple'),
+    'insidetextfont': ('', 'InsidetextfontValidator', 'compound'),
+    'insidetextfont.family': ('.insidetextfont', 'FamilyValidator', 'simple'),
+    'insidetextfont.size': ('.insidetextfont', 'SizeValidator', 'simple'),
+    'insidetextfont.color': ('.insidetextfont', 'ColorValidator', 'simple'),
+    'insidetextfont.familysrc': ('.insidetextfont', 'FamilysrcValidator', 'simple'),
+    'insidetextfont.sizesrc': ('.insidetextfont', 'SizesrcValidator', 'simple'),
+    'insidetextfont.colorsrc': ('.insidetextfont', 'ColorsrcValidator', 'simple'),
+    'outsidetextfont': ('', 'OutsidetextfontValidator', 'compound'),
+    'outsidetextfont.family': ('.outsidetextfont', 'FamilyValidator', 'simple'),
+    'outsidetextfont.size': ('.outsidetextfont', 'SizeValidator', 'simple'),
+    'outsidetextfont.color': ('.outsidetextfont', 'ColorValidator', 'simple'),
+    'outsidetextfont.familysrc': ('.outsidetextfont', 'FamilysrcValidator', 'simple'),
+    'outsidetextfont.sizesrc': ('.outsidetextfont', 'SizesrcValidator', 'simple'),
+    'outsidetextfont.colorsrc': ('.outsidetextfont', 'ColorsrcValidator', 'simple'),
+    'constraintext': ('', 'ConstraintextValidator', 'simple'),
+    'orientation': ('', 'OrientationValidator', 'simple'),
+    'base': ('', 'BaseValidator', 'simple'),
+    'offset': ('', 'OffsetValidator', 'simple'),
+    'width': ('', 'WidthValidator', 'simple'),
+    'marker': ('', 'MarkerValidator', 'compound'),
+    'marker.line': ('.marker', 'LineValidator', 'compound'),
+    'marker.line.width': ('.marker.line', 'WidthValidator', 'simple'),
+    'marker.line.color': ('.marker.line', 'ColorValidator', 'simple'),
+    'marker.line.colorscale': ('.marker.line', 'ColorscaleValidator', 'simple'),
+    'marker.line.cauto': ('.marker.line', 'CautoValidator', 'simple'),
+    'marker.line.cmax': ('.marker.line', 'CmaxValidator', 'simple'),
+    'marker.line.cmin': ('.marker.line', 'CminValidator', 'simple'),
+    'marker.line.autocolorscale': ('.marker.line', 'AutocolorscaleValidator', 'simple'),
+    'marker.line.reversescale': ('.marker.line', 'ReversescaleValidator', 'simple'),
+    'marker.line.widthsrc': ('.marker.line', 'WidthsrcValidator', 'simple'),
+    'marker.line.colorsrc': ('.marker.line', 'ColorsrcValidator', 'simple'),
+    'marker.color': ('.marker', 'ColorValidator', 'simple'),
+    'marker.colorscale': ('.marker', 'ColorscaleValidator', 'simple'),
+    'marker.cauto': ('.marker', 'CautoValidator', 'simple'),
+    'marker.cmax': ('.marker', 'CmaxValidator', 'simple'),
+    'marker.cmin': ('.marker', 'CminValidator', 'simple'),
+    'marker.autocolorscale': ('.marker', 'AutocolorscaleValidator', 'simple'),
+    'marker.reversescale': ('.marker', 'ReversescaleValidator', 'simple'),
+    'marker.showscale': ('.marker', 'ShowscaleValidator', 'simple'),
+    'marker.colorbar': ('.marker', 'ColorbarValidator', 'compound'),
+    'marker.colorbar.thicknessmode': ('.marker.colorbar', 'ThicknessmodeValidator', 'simple'),
+    'marker.colorbar.thickness': ('.marker.colorbar', 'ThicknessValidator', 'simple'),
+    'marker.colorbar.lenmode': ('.marker.colorbar', 'LenmodeValidator', 'simple'),
+    'marker.colorbar.len': ('.marker.colorbar', 'LenValidator', 'simple'),
+    'marker.colorbar.x': ('.marker.colorbar', 'XValidator', 'simple'),
+    'marker.colorbar.xanchor': ('.marker.colorbar', 'XanchorValidator', 'simple'),
+    'marker.colorbar.xpad': ('.marker.colorbar', 'XpadValidator', 'simple'),
+    'marker.colorbar.y': ('.marker.colorbar', 'YValidator', 'simple'),
+    'marker.colorbar.yanchor': ('.marker.colorbar', 'YanchorValidator', 'simple'),
+    'marker.colorbar.ypad': ('.marker.colorbar', 'YpadValidator', 'simple'),
+    'marker.colorbar.outlinecolor': ('.marker.colorbar', 'OutlinecolorValidator', 'simple'),
+    'marker.colorbar.outlinewidth': ('.marker.colorbar', 'OutlinewidthValidator', 'simple'),
+    'marker.colorbar.bordercolor': ('.marker.colorbar', 'BordercolorValidator', 'simple'),
+    'marker.colorbar.borderwidth': ('.marker.colorbar', 'BorderwidthValidator', 'simple'),
+    'marker.colorbar.bgcolor': ('.marker.colorbar', 'BgcolorValidator', 'simple'),
+    'marker.colorbar.tickmode': ('.marker.colorbar', 'TickmodeValidator', 'simple'),
+    'marker.colorbar.nticks': ('.marker.colorbar', 'NticksValidator', 'simple'),
+    'marker.colorbar.tick0': ('.marker.colorbar', 'Tick0Validator', 'simple'),
+    'marker.colorbar.dtick': ('.marker.colorbar', 'DtickValidator', 'simple'),
+    'marker.colorbar.tickvals': ('.marker.colorbar', 'TickvalsValidator', 'simple'),
+    'marker.colorbar.ticktext': ('.marker.colorbar', 'TicktextValidator', 'simple'),
+    'marker.colorbar.ticks': ('.marker.colorbar', 'TicksValidator', 'simple'),
+    'marker.colorbar.ticklen': ('.marker.colorbar', 'TicklenValidator', 'simple'),
+    'marker.colorbar.tickwidth': ('.marker.colorbar', 'TickwidthValidator', 'simple'),
+    'marker.colorbar.tickcolor': ('.marker.colorbar', 'TickcolorValidator', 'simple'),
+    'marker.colorbar.showticklabels': ('.marker.colorbar', 'ShowticklabelsValidator', 'simple'),
+    'marker.colorbar.tickfont': ('.marker.colorbar', 'TickfontValidator', 'compound'),
+    'marker.colorbar.tickfont.family': ('.marker.colorbar.tickfont', 'FamilyValidator', 'simple'),
+    'marker.colorbar.tickfont.size': ('.marker.colorbar.tickfont', 'SizeValidator', 'simple'),
+    'marker.colorbar.tickfont.color': ('.marker.colorbar.tickfont', 'ColorValidator', 'simple'),
+    'marker.colorbar.tickangle': ('.marker.colorbar', 'TickangleValidator', 'simple'),
+    'marker.colorbar.tickformat': ('.marker.colorbar', 'TickformatValidator', 'simple'),
+    'marker.colorbar.tickformatstops': ('.marker.colorbar', 'TickformatstopsValidator', 'compound_array'),
+    'marker.colorbar.tickformatstops.dtickrange': ('.marker.colorbar.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'marker.colorbar.tickformatstops.value': ('.marker.colorbar.tickformatstop', 'ValueValidator', 'simple'),
+    'marker.colorbar.tickprefix': ('.marker.colorbar', 'TickprefixValidator', 'simple'),
+    'marker.colorbar.showtickprefix': ('.marker.colorbar', 'ShowtickprefixValidator', 'simple'),
+    'marker.colorbar.ticksuffix': ('.marker.colorbar', 'TicksuffixValidator', 'simple'),
+    'marker.colorbar.showticksuffix': ('.marker.colorbar', 'ShowticksuffixValidator', 'simple'),
+    'marker.colorbar.separatethousands': ('.marker.colorbar', 'SeparatethousandsValidator', 'simple'),
+    'marker.colorbar.exponentformat': ('.marker.colorbar', 'ExponentformatValidator', 'simple'),
+    'marker.colorbar.showexponent': ('.marker.colorbar', 'ShowexponentValidator', 'simple'),
+    'marker.colorbar.title': ('.marker.colorbar', 'TitleValidator', 'simple'),
+    'marker.colorbar.titlefont': ('.marker.colorbar', 'TitlefontValidator', 'compound'),
+    'marker.colorbar.titlefont.family': ('.marker.colorbar.titlefont', 'FamilyValidator', 'simple'),
+    'marker.colorbar.titlefont.size': ('.marker.colorbar.titlefont', 'SizeValidator', 'simple'),
+    'marker.colorbar.titlefont.color': ('.marker.colorbar.titlefont', 'ColorValidator', 'simple'),
+    'marker.colorbar.titleside': ('.marker.colorbar', 'TitlesideValidator', 'simple'),
+    'marker.colorbar.tickvalssrc': ('.marker.colorbar', 'TickvalssrcValidator', 'simple'),
+    'marker.colorbar.ticktextsrc': ('.marker.colorbar', 'TicktextsrcValidator', 'simple'),
+    'marker.opacity': ('.marker', 'OpacityValidator', 'simple'),
+    'marker.colorsrc': ('.marker', 'ColorsrcValidator', 'simple'),
+    'marker.opacitysrc': ('.marker', 'OpacitysrcValidator', 'simple'),
+    'selected': ('', 'SelectedValidator', 'compound'),
+    'selected.marker': ('.selected', 'MarkerValidator', 'compound'),
+    'selected.marker.opacity': ('.selected.marker', 'OpacityValidator', 'simple'),
+    'selected.marker.color': ('.selected.marker', 'ColorValidator', 'simple'),
+    'selected.textfont': ('.selected', 'TextfontValidator', 'compound'),
+    'selected.textfont.color': ('.selected.textfont', 'ColorValidator', 'simple'),
+    'unselected': ('', 'UnselectedValidator', 'compound'),
+    'unselected.marker': ('.unselected', 'MarkerValidator', 'compound'),
+    'unselected.marker.opacity': ('.unselected.marker', 'OpacityValidator', 'simple'),
+    'unselected.marker.color': ('.unselected.marker', 'ColorValidator', 'simple'),
+    'unselected.textfont': ('.unselected', 'TextfontValidator', 'compound'),
+    'unselected.textfont.color': ('.unselected.textfont', 'ColorValidator', 'simple'),
+    'r': ('', 'RValidator', 'simple'),
+    't': ('', 'TValidator', 'simple'),
+    'error_y': ('', 'ErrorYValidator', 'compound'),
+    'error_y.visible': ('.error_y', 'VisibleValidator', 'simple'),
+    'error_y.type': ('.error_y', 'TypeValidator', 'simple'),
+    'error_y.symmetric': ('.error_y', 'SymmetricValidator', 'simple'),
+    'error_y.array': ('.error_y', 'ArrayValidator', 'simple'),
+    'error_y.arrayminus': ('.error_y', 'ArrayminusValidator', 'simple'),
+    'error_y.value': ('.error_y', 'ValueValidator', 'simple'),
+    'error_y.valueminus': ('.error_y', 'ValueminusValidator', 'simple'),
+    'error_y.traceref': ('.error_y', 'TracerefValidator', 'simple'),
+    'error_y.tracerefminus': ('.error_y', 'TracerefminusValidator', 'simple'),
+    'error_y.copy_ystyle': ('.error_y', 'CopyYstyleValidator', 'simple'),
+    'error_y.copy_zstyle': ('.error_y', 'CopyZstyleValidator', 'simple'),
+    'error_y.color': ('.error_y', 'ColorValidator', 'simple'),
+    'error_y.thickness': ('.error_y', 'ThicknessValidator', 'simple'),
+    'error_y.width': ('.error_y', 'WidthValidator', 'simple'),
+    'error_y.arraysrc': ('.error_y', 'ArraysrcValidator', 'simple'),
+    'error_y.arrayminussrc': ('.error_y', 'ArrayminussrcValidator', 'simple'),
+    'error_x': ('', 'ErrorXValidator', 'compound'),
+    'error_x.visible': ('.error_x', 'VisibleValidator', 'simple'),
+    'error_x.type': ('.error_x', 'TypeValidator', 'simple'),
+    'error_x.symmetric': ('.error_x', 'SymmetricValidator', 'simple'),
+    'error_x.array': ('.error_x', 'ArrayValidator', 'simple'),
+    'error_x.arrayminus': ('.error_x', 'ArrayminusValidator', 'simple'),
+    'error_x.value': ('.error_x', 'ValueValidator', 'simple'),
+    'error_x.valueminus': ('.error_x', 'ValueminusValidator', 'simple'),
+    'error_x.traceref': ('.error_x', 'TracerefValidator', 'simple'),
+    'error_x.tracerefminus': ('.error_x', 'TracerefminusValidator', 'simple'),
+    'error_x.copy_ystyle': ('.error_x', 'CopyYstyleValidator', 'simple'),
+    'error_x.copy_zstyle': ('.error_x', 'CopyZstyleValidator', 'simple'),
+    'error_x.color': ('.error_x', 'ColorValidator', 'simple'),
+    'error_x.thickness': ('.error_x', 'ThicknessValidator', 'simple'),
+    'error_x.width': ('.error_x', 'WidthValidator', 'simple'),
+    'error_x.arraysrc': ('.error_x', 'ArraysrcValidator', 'simple'),
+    'error_x.arrayminussrc': ('.error_x', 'ArrayminussrcValidator', 'simple'),
+    'xcalendar': ('', 'XcalendarValidator', 'simple'),
+    'ycalendar': ('', 'YcalendarValidator', 'simple'),
+    'xaxis': ('', 'XaxisValidator', 'simple'),
+    'yaxis': ('', 'YaxisValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'xsrc': ('', 'XsrcValidator', 'simple'),
+    'ysrc': ('', 'YsrcValidator', 'simple'),
+    'textsrc': ('', 'TextsrcValidator', 'simple'),
+    'hovertextsrc': ('', 'HovertextsrcValidator', 'simple'),
+    'textpositionsrc': ('', 'TextpositionsrcValidator', 'simple'),
+    'basesrc': ('', 'BasesrcValidator', 'simple'),
+    'offsetsrc': ('', 'OffsetsrcValidator', 'simple'),
+    'widthsrc': ('', 'WidthsrcValidator', 'simple'),
+    'rsrc': ('', 'RsrcValidator', 'simple'),
+    'tsrc': ('', 'TsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class TextpositionValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='textposition', parent_name='trace.bar'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['inside', 'outside', 'auto', 'none'],
+            array_ok=True,
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'auto', 'inside', 'none', 'outside'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,10 @@
+import ipyplotly.basevalidators
+
+
+class Y0Validator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='y0', parent_name='trace.bar'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc+clearAxisTypes')
+
+    def validate_coerce(self, v):
+        return v
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class FontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='font', parent_name='trace.bar.hoverlabel'):
+        from ipyplotly.datatypes.trace.bar.hoverlabel import Font
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Font)
@@ -0,0 +1,23 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._family import FamilyValidator
+    from ._size import SizeValidator
+    from ._color import ColorValidator
+    from ._familysrc import FamilysrcValidator
+    from ._sizesrc import SizesrcValidator
+    from ._colorsrc import ColorsrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._family.FamilyValidator',
+            '._size.SizeValidator',
+            '._color.ColorValidator',
+            '._familysrc.FamilysrcValidator',
+            '._sizesrc.SizesrcValidator',
+            '._colorsrc.ColorsrcValidator',
+        ]
+    )
@@ -0,0 +1,16 @@
+import ipyplotly.basevalidators
+
+
+class CminValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='cmin', parent_name='trace.bar.marker'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, edit_type='plot', implied_edits={'cauto': False}
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
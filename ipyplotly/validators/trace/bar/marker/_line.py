@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LineValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='line', parent_name='trace.bar.marker'):
+        from ipyplotly.datatypes.trace.bar.marker import Line
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Line)
@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class ShowscaleValidator(ipyplotly.basevalidators.BooleanValidator):
+
+    def __init__(self, plotly_name='showscale', parent_name='trace.bar.marker'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v is True or v is False or v is None:
+            return v
+        return super().validate_coerce(v)
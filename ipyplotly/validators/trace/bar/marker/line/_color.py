@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class ColorValidator(ipyplotly.basevalidators.ColorValidator):
+
+    def __init__(self, plotly_name='color', parent_name='trace.bar.marker.line'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            array_ok=True,
+            edit_type='style',
+            colorscale_path='trace.bar.marker.line.colorscale'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in self.named_colors_set:
+                return v
+        elif v.__class__ is int or v.__class__ is float or v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class MaxpointsValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='maxpoints', parent_name='trace.bar.stream'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=0, max=10000, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if 0 <= v <= 10000:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class TextfontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='textfont', parent_name='trace.bar.unselected'):
+        from ipyplotly.datatypes.trace.bar.unselected import Textfont
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Textfont)
@@ -0,0 +1,104 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._y import YValidator
+    from ._x import XValidator
+    from ._x0 import X0Validator
+    from ._y0 import Y0Validator
+    from ._text import TextValidator
+    from ._whiskerwidth import WhiskerwidthValidator
+    from ._boxpoints import BoxpointsValidator
+    from ._boxmean import BoxmeanValidator
+    from ._jitter import JitterValidator
+    from ._pointpos import PointposValidator
+    from ._orientation import OrientationValidator
+    from ._marker import MarkerValidator
+    from ._line import LineValidator
+    from ._fillcolor import FillcolorValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._hoveron import HoveronValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._ysrc import YsrcValidator
+    from ._xsrc import XsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._transforms import TransformsValidator
+    from . import unselected
+    from . import selected
+    from . import line
+    from . import marker
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.unselected',
+            '.selected',
+            '.line',
+            '.marker',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._y.YValidator',
+            '._x.XValidator',
+            '._x0.X0Validator',
+            '._y0.Y0Validator',
+            '._text.TextValidator',
+            '._whiskerwidth.WhiskerwidthValidator',
+            '._boxpoints.BoxpointsValidator',
+            '._boxmean.BoxmeanValidator',
+            '._jitter.JitterValidator',
+            '._pointpos.PointposValidator',
+            '._orientation.OrientationValidator',
+            '._marker.MarkerValidator',
+            '._line.LineValidator',
+            '._fillcolor.FillcolorValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._hoveron.HoveronValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._ysrc.YsrcValidator',
+            '._xsrc.XsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
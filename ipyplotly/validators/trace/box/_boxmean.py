@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class BoxmeanValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='boxmean', parent_name='trace.box'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=[True, 'sd', False], edit_type='calcIfAutorange'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'sd', False, True}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
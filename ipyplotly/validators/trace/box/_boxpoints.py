@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class BoxpointsValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='boxpoints', parent_name='trace.box'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['all', 'outliers', 'suspectedoutliers', False],
+            edit_type='calcIfAutorange'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'all', 'outliers', 'suspectedoutliers', False}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class HoveronValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='hoveron', parent_name='trace.box'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, flags=['boxes', 'points'], edit_type='style'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'boxes', 'points'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class PointposValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='pointpos', parent_name='trace.box'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=-2, max=2, edit_type='calcIfAutorange')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if -2 <= v <= 2:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
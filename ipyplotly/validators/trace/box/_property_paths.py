@@ -0,0 +1,79 @@
+# Property paths of trace.box
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'y': ('', 'YValidator', 'simple'),
+    'x': ('', 'XValidator', 'simple'),
+    'x0': ('', 'X0Validator', 'simple'),
+    'y0': ('', 'Y0Validator', 'simple'),
+    'text': ('', 'TextValidator', 'simple'),
+    'whiskerwidth': ('', 'WhiskerwidthValidator', 'simple'),
+    'boxpoints': ('', 'BoxpointsValidator', 'simple'),
+    'boxmean': ('', 'BoxmeanValidator', 'simple'),
+    'jitter': ('', 'JitterValidator', 'simple'),
+    'pointpos': ('', 'PointposValidator', 'simple'),
+    'orientation': ('', 'OrientationValidator', 'simple'),
+    'marker': ('', 'MarkerValidator', 'compound'),
+    'marker.outliercolor': ('.marker', 'OutliercolorValidator', 'simple'),
+    'marker.symbol': ('.marker', 'SymbolValidator', 'simple'),
+    'marker.opacity': ('.marker', 'OpacityValidator', 'simple'),
+    'marker.size': ('.marker', 'SizeValidator', 'simple'),
+    'marker.color': ('.marker', 'ColorValidator', 'simple'),
+    'marker.line': ('.marker', 'LineValidator', 'compound'),
+    'marker.line.color': ('.marker.line', 'ColorValidator', 'simple'),
+    'marker.line.width': ('.marker.line', 'WidthValidator', 'simple'),
+    'marker.line.outliercolor': ('.marker.line', 'OutliercolorValidator', 'simple'),
+    'marker.line.outlierwidth': ('.marker.line', 'OutlierwidthValidator', 'simple'),
+    'line': ('', 'LineValidator', 'compound'),
+    'line.color': ('.line', 'ColorValidator', 'simple'),
+    'line.width': ('.line', 'WidthValidator', 'simple'),
+    'fillcolor': ('', 'FillcolorValidator', 'simple'),
+    'selected': ('', 'SelectedValidator', 'compound'),
+    'selected.marker': ('.selected', 'MarkerValidator', 'compound'),
+    'selected.marker.opacity': ('.selected.marker', 'OpacityValidator', 'simple'),
+    'selected.marker.color': ('.selected.marker', 'ColorValidator', 'simple'),
+    'selected.marker.size': ('.selected.marker', 'SizeValidator', 'simple'),
+    'unselected': ('', 'UnselectedValidator', 'compound'),
+    'unselected.marker': ('.unselected', 'MarkerValidator', 'compound'),
+    'unselected.marker.opacity': ('.unselected.marker', 'OpacityValidator', 'simple'),
+    'unselected.marker.color': ('.unselected.marker', 'ColorValidator', 'simple'),
+    'unselected.marker.size': ('.unselected.marker', 'SizeValidator', 'simple'),
+    'hoveron': ('', 'HoveronValidator', 'simple'),
+    'xcalendar': ('', 'XcalendarValidator', 'simple'),
+    'ycalendar': ('', 'YcalendarValidator', 'simple'),
+    'xaxis': ('', 'XaxisValidator', 'simple'),
+    'yaxis': ('', 'YaxisValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'ysrc': ('', 'YsrcValidator', 'simple'),
+    'xsrc': ('', 'XsrcValidator', 'simple'),
+    'textsrc': ('', 'TextsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
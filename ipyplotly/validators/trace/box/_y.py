@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class YValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='y', parent_name='trace.box'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc+clearAxisTypes')
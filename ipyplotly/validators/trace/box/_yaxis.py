@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class YaxisValidator(ipyplotly.basevalidators.SubplotidValidator):
+
+    def __init__(self, plotly_name='yaxis', parent_name='trace.box'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, dflt='y', edit_type='calc+clearAxisTypes')
+
+    def validate_coerce(self, v):
+        if v is None or (v.__class__ is str and v == 'y'):
+            return 'y'
+        return super().validate_coerce(v)
@@ -0,0 +1,26 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._outliercolor import OutliercolorValidator
+    from ._symbol import SymbolValidator
+    from ._opacity import OpacityValidator
+    from ._size import SizeValidator
+    from ._color import ColorValidator
+    from ._line import LineValidator
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+        ],
+        [
+            '._outliercolor.OutliercolorValidator',
+            '._symbol.SymbolValidator',
+            '._opacity.OpacityValidator',
+            '._size.SizeValidator',
+            '._color.ColorValidator',
+            '._line.LineValidator',
+        ]
+    )
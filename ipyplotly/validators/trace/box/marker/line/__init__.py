@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._color import ColorValidator
+    from ._width import WidthValidator
+    from ._outliercolor import OutliercolorValidator
+    from ._outlierwidth import OutlierwidthValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._color.ColorValidator',
+            '._width.WidthValidator',
+            '._outliercolor.OutliercolorValidator',
+            '._outlierwidth.OutlierwidthValidator',
+        ]
+    )
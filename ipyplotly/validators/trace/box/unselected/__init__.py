@@ -0,0 +1,16 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._marker import MarkerValidator
+    from . import marker
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.marker',
+        ],
+        [
+            '._marker.MarkerValidator',
+        ]
+    )
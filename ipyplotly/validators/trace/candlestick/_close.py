@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class CloseValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='close', parent_name='trace.candlestick'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
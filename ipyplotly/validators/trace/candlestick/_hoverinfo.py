@@ -0,0 +1,22 @@
+import ipyplotly.basevalidators
+
+
+class HoverinfoValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='hoverinfo', parent_name='trace.candlestick'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            flags=['x', 'y', 'z', 'text', 'name'],
+            extras=['all', 'none', 'skip'],
+            array_ok=True,
+            edit_type='none'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'all', 'name', 'none', 'skip', 'text', 'x', 'y', 'z'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
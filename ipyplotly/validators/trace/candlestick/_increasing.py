@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class IncreasingValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='increasing', parent_name='trace.candlestick'):
+        from ipyplotly.datatypes.trace.candlestick import Increasing
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Increasing)
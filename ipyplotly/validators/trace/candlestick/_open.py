@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class OpenValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='open', parent_name='trace.candlestick'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
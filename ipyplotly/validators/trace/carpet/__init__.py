@@ -0,0 +1,94 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._carpet import CarpetValidator
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._a import AValidator
+    from ._a0 import A0Validator
+    from ._da import DaValidator
+    from ._b import BValidator
+    from ._b0 import B0Validator
+    from ._db import DbValidator
+    from ._cheaterslope import CheaterslopeValidator
+    from ._aaxis import AaxisValidator
+    from ._baxis import BaxisValidator
+    from ._font import FontValidator
+    from ._color import ColorValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._asrc import AsrcValidator
+    from ._bsrc import BsrcValidator
+    from ._transforms import TransformsValidator
+    from . import font
+    from . import baxis
+    from . import aaxis
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+            '.baxis',
+            '.aaxis',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._carpet.CarpetValidator',
+            '._x.XValidator',
+            '._y.YValidator',
+            '._a.AValidator',
+            '._a0.A0Validator',
+            '._da.DaValidator',
+            '._b.BValidator',
+            '._b0.B0Validator',
+            '._db.DbValidator',
+            '._cheaterslope.CheaterslopeValidator',
+            '._aaxis.AaxisValidator',
+            '._baxis.BaxisValidator',
+            '._font.FontValidator',
+            '._color.ColorValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._asrc.AsrcValidator',
+            '._bsrc.BsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class AaxisValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='aaxis', parent_name='trace.carpet'):
+        from ipyplotly.datatypes.trace.carpet import Aaxis
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Aaxis)
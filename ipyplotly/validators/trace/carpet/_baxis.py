@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class BaxisValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='baxis', parent_name='trace.carpet'):
+        from ipyplotly.datatypes.trace.carpet import Baxis
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Baxis)
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class CustomdataValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='customdata', parent_name='trace.carpet'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
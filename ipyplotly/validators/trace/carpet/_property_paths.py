@@ -0,0 +1,182 @@
+# Property paths of trace.carpet
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'carpet': ('', 'CarpetValidator', 'simple'),
+    'x': ('', 'XValidator', 'simple'),
+    'y': ('', 'YValidator', 'simple'),
+    'a': ('', 'AValidator', 'simple'),
+    'a0': ('', 'A0Validator', 'simple'),
+    'da': ('', 'DaValidator', 'simple'),
+    'b': ('', 'BValidator', 'simple'),
+    'b0': ('', 'B0Validator', 'simple'),
+    'db': ('', 'DbValidator', 'simple'),
+    'cheaterslope': ('', 'CheaterslopeValidator', 'simple'),
+    'aaxis': ('', 'AaxisValidator', 'compound'),
+    'aaxis.color': ('.aaxis', 'ColorValidator', 'simple'),
+    'aaxis.smoothing': ('.aaxis', 'SmoothingValidator', 'simple'),
+    'aaxis.title': ('.aaxis', 'TitleValidator', 'simple'),
+    'aaxis.titlefont': ('.aaxis', 'TitlefontValidator', 'compound'),
+    'aaxis.titlefont.family': ('.aaxis.titlefont', 'FamilyValidator', 'simple'),
+    'aaxis.titlefont.size': ('.aaxis.titlefont', 'SizeValidator', 'simple'),
+    'aaxis.titlefont.color': ('.aaxis.titlefont', 'ColorValidator', 'simple'),
+    'aaxis.titleoffset': ('.aaxis', 'TitleoffsetValidator', 'simple'),
+    'aaxis.type': ('.aaxis', 'TypeValidator', 'simple'),
+    'aaxis.autorange': ('.aaxis', 'AutorangeValidator', 'simple'),
+    'aaxis.rangemode': ('.aaxis', 'RangemodeValidator', 'simple'),
+    'aaxis.range': ('.aaxis', 'RangeValidator', 'simple'),
+    'aaxis.fixedrange': ('.aaxis', 'FixedrangeValidator', 'simple'),
+    'aaxis.cheatertype': ('.aaxis', 'CheatertypeValidator', 'simple'),
+    'aaxis.tickmode': ('.aaxis', 'TickmodeValidator', 'simple'),
+    'aaxis.nticks': ('.aaxis', 'NticksValidator', 'simple'),
+    'aaxis.tickvals': ('.aaxis', 'TickvalsValidator', 'simple'),
+    'aaxis.ticktext': ('.aaxis', 'TicktextValidator', 'simple'),
+    'aaxis.showticklabels': ('.aaxis', 'ShowticklabelsValidator', 'simple'),
+    'aaxis.tickfont': ('.aaxis', 'TickfontValidator', 'compound'),
+    'aaxis.tickfont.family': ('.aaxis.tickfont', 'FamilyValidator', 'simple'),
+    'aaxis.tickfont.size': ('.aaxis.tickfont', 'SizeValidator', 'simple'),
+    'aaxis.tickfont.color': ('.aaxis.tickfont', 'ColorValidator', 'simple'),
+    'aaxis.tickangle': ('.aaxis', 'TickangleValidator', 'simple'),
+    'aaxis.tickprefix': ('.aaxis', 'TickprefixValidator', 'simple'),
+    'aaxis.showtickprefix': ('.aaxis', 'ShowtickprefixValidator', 'simple'),
+    'aaxis.ticksuffix': ('.aaxis', 'TicksuffixValidator', 'simple'),
+    'aaxis.showticksuffix': ('.aaxis', 'ShowticksuffixValidator', 'simple'),
+    'aaxis.showexponent': ('.aaxis', 'ShowexponentValidator', 'simple'),
+    'aaxis.exponentformat': ('.aaxis', 'ExponentformatValidator', 'simple'),
+    'aaxis.separatethousands': ('.aaxis', 'SeparatethousandsValidator', 'simple'),
+    'aaxis.tickformat': ('.aaxis', 'TickformatValidator', 'simple'),
+    'aaxis.tickformatstops': ('.aaxis', 'TickformatstopsValidator', 'compound_array'),
+    'aaxis.tickformatstops.dtickrange': ('.aaxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'aaxis.tickformatstops.value': ('.aaxis.tickformatstop', 'ValueValidator', 'simple'),
+    'aaxis.categoryorder': ('.aaxis', 'CategoryorderValidator', 'simple'),
+    'aaxis.categoryarray': ('.aaxis', 'CategoryarrayValidator', 'simple'),
+    'aaxis.labelpadding': ('.aaxis', 'LabelpaddingValidator', 'simple'),
+    'aaxis.labelprefix': ('.aaxis', 'LabelprefixValidator', 'simple'),
+    'aaxis.labelsuffix': ('.aaxis', 'LabelsuffixValidator', 'simple'),
+    'aaxis.showline': ('.aaxis', 'ShowlineValidator', 'simple'),
+    'aaxis.linecolor': ('.aaxis', 'LinecolorValidator', 'simple'),
+    'aaxis.linewidth': ('.aaxis', 'LinewidthValidator', 'simple'),
+    'aaxis.gridcolor': ('.aaxis', 'GridcolorValidator', 'simple'),
+    'aaxis.gridwidth': ('.aaxis', 'GridwidthValidator', 'simple'),
+    'aaxis.showgrid': ('.aaxis', 'ShowgridValidator', 'simple'),
+    'aaxis.minorgridcount': ('.aaxis', 'MinorgridcountValidator', 'simple'),
+    'aaxis.minorgridwidth': ('.aaxis', 'MinorgridwidthValidator', 'simple'),
+    'aaxis.minorgridcolor': ('.aaxis', 'MinorgridcolorValidator', 'simple'),
+    'aaxis.startline': ('.aaxis', 'StartlineValidator', 'simple'),
+    'aaxis.startlinecolor': ('.aaxis', 'StartlinecolorValidator', 'simple'),
+    'aaxis.startlinewidth': ('.aaxis', 'StartlinewidthValidator', 'simple'),
+    'aaxis.endline': ('.aaxis', 'EndlineValidator', 'simple'),
+    'aaxis.endlinewidth': ('.aaxis', 'EndlinewidthValidator', 'simple'),
+    'aaxis.endlinecolor': ('.aaxis', 'EndlinecolorValidator', 'simple'),
+    'aaxis.tick0': ('.aaxis', 'Tick0Validator', 'simple'),
+    'aaxis.dtick': ('.aaxis', 'DtickValidator', 'simple'),
+    'aaxis.arraytick0': ('.aaxis', 'Arraytick0Validator', 'simple'),
+    'aaxis.arraydtick': ('.aaxis', 'ArraydtickValidator', 'simple'),
+    'aaxis.tickvalssrc': ('.aaxis', 'TickvalssrcValidator', 'simple'),
+    'aaxis.ticktextsrc': ('.aaxis', 'TicktextsrcValidator', 'simple'),
+    'aaxis.categoryarraysrc': ('.aaxis', 'CategoryarraysrcValidator', 'simple'),
+    'baxis': ('', 'BaxisValidator', 'compound'),
+    'baxis.color': ('.baxis', 'ColorValidator', 'simple'),
+    'baxis.smoothing': ('.baxis', 'SmoothingValidator', 'simple'),
+    'baxis.title': ('.baxis', 'TitleValidator', 'simple'),
+    'baxis.titlefont': ('.baxis', 'TitlefontValidator', 'compound'),
+    'baxis.titlefont.family': ('.baxis.titlefont', 'FamilyValidator', 'simple'),
+    'baxis.titlefont.size': ('.baxis.titlefont', 'SizeValidator', 'simple'),
+    'baxis.titlefont.color': ('.baxis.titlefont', 'ColorValidator', 'simple'),
+    'baxis.titleoffset': ('.baxis', 'TitleoffsetValidator', 'simple'),
+    'baxis.type': ('.baxis', 'TypeValidator', 'simple'),
+    'baxis.autorange': ('.baxis', 'AutorangeValidator', 'simple'),
+    'baxis.rangemode': ('.baxis', 'RangemodeValidator', 'simple'),
+    'baxis.range': ('.baxis', 'RangeValidator', 'simple'),
+    'baxis.fixedrange': ('.baxis', 'FixedrangeValidator', 'simple'),
+    'baxis.cheatertype': ('.baxis', 'CheatertypeValidator', 'simple'),
+    'baxis.tickmode': ('.baxis', 'TickmodeValidator', 'simple'),
+    'baxis.nticks': ('.baxis', 'NticksValidator', 'simple'),
+    'baxis.tickvals': ('.baxis', 'TickvalsValidator', 'simple'),
+    'baxis.ticktext': ('.baxis', 'TicktextValidator', 'simple'),
+    'baxis.showticklabels': ('.baxis', 'ShowticklabelsValidator', 'simple'),
+    'baxis.tickfont': ('.baxis', 'TickfontValidator', 'compound'),
+    'baxis.tickfont.family': ('.baxis.tickfont', 'FamilyValidator', 'simple'),
+    'baxis.tickfont.size': ('.baxis.tickfont', 'SizeValidator', 'simple'),
+    'baxis.tickfont.color': ('.baxis.tickfont', 'ColorValidator', 'simple'),
+    'baxis.tickangle': ('.baxis', 'TickangleValidator', 'simple'),
+    'baxis.tickprefix': ('.baxis', 'TickprefixValidator', 'simple'),
+    'baxis.showtickprefix': ('.baxis', 'ShowtickprefixValidator', 'simple'),
+    'baxis.ticksuffix': ('.baxis', 'TicksuffixValidator', 'simple'),
+    'baxis.showticksuffix': ('.baxis', 'ShowticksuffixValidator', 'simple'),
+    'baxis.showexponent': ('.baxis', 'ShowexponentValidator', 'simple'),
+    'baxis.exponentformat': ('.baxis', 'ExponentformatValidator', 'simple'),
+    'baxis.separatethousands': ('.baxis', 'SeparatethousandsValidator', 'simple'),
+    'baxis.tickformat': ('.baxis', 'TickformatValidator', 'simple'),
+    'baxis.tickformatstops': ('.baxis', 'TickformatstopsValidator', 'compound_array'),
+    'baxis.tickformatstops.dtickrange': ('.baxis.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'baxis.tickformatstops.value': ('.baxis.tickformatstop', 'ValueValidator', 'simple'),
+    'baxis.categoryorder': ('.baxis', 'CategoryorderValidator', 'simple'),
+    'baxis.categoryarray': ('.baxis', 'CategoryarrayValidator', 'simple'),
+    'baxis.labelpadding': ('.baxis', 'LabelpaddingValidator', 'simple'),
+    'baxis.labelprefix': ('.baxis', 'LabelprefixValidator', 'simple'),
+    'baxis.labelsuffix': ('.baxis', 'LabelsuffixValidator', 'simple'),
+    'baxis.showline': ('.baxis', 'ShowlineValidator', 'simple'),
+    'baxis.linecolor': ('.baxis', 'LinecolorValidator', 'simple'),
+    'baxis.linewidth': ('.baxis', 'LinewidthValidator', 'simple'),
+    'baxis.gridcolor': ('.baxis', 'GridcolorValidator', 'simple'),
+    'baxis.gridwidth': ('.baxis', 'GridwidthValidator', 'simple'),
+    'baxis.showgrid': ('.baxis', 'ShowgridValidator', 'simple'),
+    'baxis.minorgridcount': ('.baxis', 'MinorgridcountValidator', 'simple'),
+    'baxis.minorgridwidth': ('.baxis', 'MinorgridwidthValidator', 'simple'),
+    'baxis.minorgridcolor': ('.baxis', 'MinorgridcolorValidator', 'simple'),
+    'baxis.startline': ('.baxis', 'StartlineValidator', 'simple'),
+    'baxis.startlinecolor': ('.baxis', 'StartlinecolorValidator', 'simple'),
+    'baxis.startlinewidth': ('.baxis', 'StartlinewidthValidator', 'simple'),
+    'baxis.endline': ('.baxis', 'EndlineValidator', 'simple'),
+    'baxis.endlinewidth': ('.baxis', 'EndlinewidthValidator', 'simple'),
+    'baxis.endlinecolor': ('.baxis', 'EndlinecolorValidator', 'simple'),
+    'baxis.tick0': ('.baxis', 'Tick0Validator', 'simple'),
+    'baxis.dtick': ('.baxis', 'DtickValidator', 'simple'),
+    'baxis.arraytick0': ('.baxis', 'Arraytick0Validator', 'simple'),
+    'baxis.arraydtick': ('.baxis', 'ArraydtickValidator', 'simple'),
+    'baxis.tickvalssrc': ('.baxis', 'TickvalssrcValidator', 'simple'),
+    'baxis.ticktextsrc': ('.baxis', 'TicktextsrcValidator', 'simple'),
+    'baxis.categoryarraysrc': ('.baxis', 'CategoryarraysrcValidator', 'simple'),
+    'font': ('', 'FontValidator', 'compound'),
+    'font.family': ('.font', 'FamilyValidator', 'simple'),
+    'font.size': ('.font', 'SizeValidator', 'simple'),
+    'font.color': ('.font', 'ColorValidator', 'simple'),
+    'color': ('', 'ColorValidator', 'simple'),
+    'xaxis': ('', 'XaxisValidator', 'simple'),
+    'yaxis': ('', 'YaxisValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'xsrc': ('', 'XsrcValidator', 'simple'),
+    'ysrc': ('', 'YsrcValidator', 'simple'),
+    'asrc': ('', 'AsrcValidator', 'simple'),
+    'bsrc': ('', 'BsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
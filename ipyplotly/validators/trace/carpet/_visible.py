@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class VisibleValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='visible', parent_name='trace.carpet'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=[True, False, 'legendonly'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'legendonly', False, True}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
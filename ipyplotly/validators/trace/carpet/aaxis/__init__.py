@@ -0,0 +1,126 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._color import ColorValidator
+    from ._smoothing import SmoothingValidator
+    from ._title import TitleValidator
+    from ._titlefont import TitlefontValidator
+    from ._titleoffset import TitleoffsetValidator
+    from ._type import TypeValidator
+    from ._autorange import AutorangeValidator
+    from ._rangemode import RangemodeValidator
+    from ._range import RangeValidator
+    from ._fixedrange import FixedrangeValidator
+    from ._cheatertype import CheatertypeValidator
+    from ._tickmode import TickmodeValidator
+    from ._nticks import NticksValidator
+    from ._tickvals import TickvalsValidator
+    from ._ticktext import TicktextValidator
+    from ._showticklabels import ShowticklabelsValidator
+    from ._tickfont import TickfontValidator
+    from ._tickangle import TickangleValidator
+    from ._tickprefix import TickprefixValidator
+    from ._showtickprefix import ShowtickprefixValidator
+    from ._ticksuffix import TicksuffixValidator
+    from ._showticksuffix import ShowticksuffixValidator
+    from ._showexponent import ShowexponentValidator
+    from ._exponentformat import ExponentformatValidator
+    from ._separatethousands import SeparatethousandsValidator
+    from ._tickformat import TickformatValidator
+    from ._tickformatstops import TickformatstopsValidator
+    from ._categoryorder import CategoryorderValidator
+    from ._categoryarray import CategoryarrayValidator
+    from ._labelpadding import LabelpaddingValidator
+    from ._labelprefix import LabelprefixValidator
+    from ._labelsuffix import LabelsuffixValidator
+    from ._showline import ShowlineValidator
+    from ._linecolor import LinecolorValidator
+    from ._linewidth import LinewidthValidator
+    from ._gridcolor import GridcolorValidator
+    from ._gridwidth import GridwidthValidator
+    from ._showgrid import ShowgridValidator
+    from ._minorgridcount import MinorgridcountValidator
+    from ._minorgridwidth import MinorgridwidthValidator
+    from ._minorgridcolor import MinorgridcolorValidator
+    from ._startline import StartlineValidator
+    from ._startlinecolor import StartlinecolorValidator
+    from ._startlinewidth import StartlinewidthValidator
+    from ._endline import EndlineValidator
+    from ._endlinewidth import EndlinewidthValidator
+    from ._endlinecolor import EndlinecolorValidator
+    from ._tick0 import Tick0Validator
+    from ._dtick import DtickValidator
+    from ._arraytick0 import Arraytick0Validator
+    from ._arraydtick import ArraydtickValidator
+    from ._tickvalssrc import TickvalssrcValidator
+    from ._ticktextsrc import TicktextsrcValidator
+    from ._categoryarraysrc import CategoryarraysrcValidator
+    from . import tickformatstop
+    from . import tickfont
+    from . import titlefont
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.tickformatstop',
+            '.tickfont',
+            '.titlefont',
+        ],
+        [
+            '._color.ColorValidator',
+            '._smoothing.SmoothingValidator',
+            '._title.TitleValidator',
+            '._titlefont.TitlefontValidator',
+            '._titleoffset.TitleoffsetValidator',
+            '._type.TypeValidator',
+            '._autorange.AutorangeValidator',
+            '._rangemode.RangemodeValidator',
+            '._range.RangeValidator',
+            '._fixedrange.FixedrangeValidator',
+            '._cheatertype.CheatertypeValidator',
+            '._tickmode.TickmodeValidator',
+            '._nticks.NticksValidator',
+            '._tickvals.TickvalsValidator',
+            '._ticktext.TicktextValidator',
+            '._showticklabels.ShowticklabelsValidator',
+            '._tickfont.TickfontValidator',
+            '._tickangle.TickangleValidator',
+            '._tickprefix.TickprefixValidator',
+            '._showtickprefix.ShowtickprefixValidator',
+            '._ticksuffix.TicksuffixValidator',
+            '._showticksuffix.ShowticksuffixValidator',
+            '._showexponent.ShowexponentValidator',
+            '._exponentformat.ExponentformatValidator',
+            '._separatethousands.SeparatethousandsValidator',
+            '._tickformat.TickformatValidator',
+            '._tickformatstops.TickformatstopsValidator',
+            '._categoryorder.CategoryorderValidator',
+            '._categoryarray.CategoryarrayValidator',
+            '._labelpadding.LabelpaddingValidator',
+            '._labelprefix.LabelprefixValidator',
+            '._labelsuffix.LabelsuffixValidator',
+            '._showline.ShowlineValidator',
+            '._linecolor.LinecolorValidator',
+            '._linewidth.LinewidthValidator',
+            '._gridcolor.GridcolorValidator',
+            '._gridwidth.GridwidthValidator',
+            '._showgrid.ShowgridValidator',
+            '._minorgridcount.MinorgridcountValidator',
+            '._minorgridwidth.MinorgridwidthValidator',
+            '._minorgridcolor.MinorgridcolorValidator',
+            '._startline.StartlineValidator',
+            '._startlinecolor.StartlinecolorValidator',
+            '._startlinewidth.StartlinewidthValidator',
+            '._endline.EndlineValidator',
+            '._endlinewidth.EndlinewidthValidator',
+            '._endlinecolor.EndlinecolorValidator',
+            '._tick0.Tick0Validator',
+            '._dtick.DtickValidator',
+            '._arraytick0.Arraytick0Validator',
+            '._arraydtick.ArraydtickValidator',
+            '._tickvalssrc.TickvalssrcValidator',
+            '._ticktextsrc.TicktextsrcValidator',
+            '._categoryarraysrc.CategoryarraysrcValidator',
+        ]
+    )
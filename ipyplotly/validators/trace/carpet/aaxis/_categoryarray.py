@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class CategoryarrayValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='categoryarray', parent_name='trace.carpet.aaxis'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
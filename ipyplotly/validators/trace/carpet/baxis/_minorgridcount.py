@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class MinorgridcountValidator(ipyplotly.basevalidators.IntegerValidator):
+
+    def __init__(self, plotly_name='minorgridcount', parent_name='trace.carpet.baxis'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=0, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int:
+            if 0 <= v <= 2147483647:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,18 @@
+import ipyplotly.basevalidators
+
+
+class RangeValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='range', parent_name='trace.carpet.baxis'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            edit_type='calc',
+            items=[{
+                'valType': 'any',
+                'editType': 'calc'
+            }, {
+                'valType': 'any',
+                'editType': 'calc'
+            }]
+        )
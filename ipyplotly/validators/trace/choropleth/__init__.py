@@ -0,0 +1,94 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._locations import LocationsValidator
+    from ._locationmode import LocationmodeValidator
+    from ._z import ZValidator
+    from ._text import TextValidator
+    from ._marker import MarkerValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._zauto import ZautoValidator
+    from ._zmin import ZminValidator
+    from ._zmax import ZmaxValidator
+    from ._colorscale import ColorscaleValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._geo import GeoValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._locationssrc import LocationssrcValidator
+    from ._zsrc import ZsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._transforms import TransformsValidator
+    from . import colorbar
+    from . import unselected
+    from . import selected
+    from . import marker
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+            '.unselected',
+            '.selected',
+            '.marker',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._locations.LocationsValidator',
+            '._locationmode.LocationmodeValidator',
+            '._z.ZValidator',
+            '._text.TextValidator',
+            '._marker.MarkerValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._zauto.ZautoValidator',
+            '._zmin.ZminValidator',
+            '._zmax.ZmaxValidator',
+            '._colorscale.ColorscaleValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._geo.GeoValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._locationssrc.LocationssrcValidator',
+            '._zsrc.ZsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ColorbarValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='colorbar', parent_name='trace.choropleth'):
+        from ipyplotly.datatypes.trace.choropleth import Colorbar
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Colorbar)
@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class GeoValidator(ipyplotly.basevalidators.SubplotidValidator):
+
+    def __init__(self, plotly_name='geo', parent_name='trace.choropleth'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, dflt='geo', edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v is None or (v.__class__ is str and v == 'geo'):
+            return 'geo'
+        return super().validate_coerce(v)
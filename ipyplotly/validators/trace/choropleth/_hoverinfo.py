@@ -0,0 +1,22 @@
+import ipyplotly.basevalidators
+
+
+class HoverinfoValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='hoverinfo', parent_name='trace.choropleth'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            flags=['location', 'z', 'text', 'name', 'name'],
+            extras=['all', 'none', 'skip'],
+            array_ok=True,
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'all', 'location', 'name', 'none', 'skip', 'text', 'z'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
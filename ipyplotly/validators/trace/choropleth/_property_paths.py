@@ -0,0 +1,115 @@
+# Property paths of trace.choropleth
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'locations': ('', 'LocationsValidator', 'simple'),
+    'locationmode': ('', 'LocationmodeValidator', 'simple'),
+    'z': ('', 'ZValidator', 'simple'),
+    'text': ('', 'TextValidator', 'simple'),
+    'marker': ('', 'MarkerValidator', 'compound'),
+    'marker.line': ('.marker', 'LineValidator', 'compound'),
+    'marker.line.color': ('.marker.line', 'ColorValidator', 'simple'),
+    'marker.line.width': ('.marker.line', 'WidthValidator', 'simple'),
+    'marker.line.colorsrc': ('.marker.line', 'ColorsrcValidator', 'simple'),
+    'marker.line.widthsrc': ('.marker.line', 'WidthsrcValidator', 'simple'),
+    'marker.opacity': ('.marker', 'OpacityValidator', 'simple'),
+    'marker.opacitysrc': ('.marker', 'OpacitysrcValidator', 'simple'),
+    'selected': ('', 'SelectedValidator', 'compound'),
+    'selected.marker': ('.selected', 'MarkerValidator', 'compound'),
+    'selected.marker.opacity': ('.selected.marker', 'OpacityValidator', 'simple'),
+    'unselected': ('', 'UnselectedValidator', 'compound'),
+    'unselected.marker': ('.unselected', 'MarkerValidator', 'compound'),
+    'unselected.marker.opacity': ('.unselected.marker', 'OpacityValidator', 'simple'),
+    'zauto': ('', 'ZautoValidator', 'simple'),
+    'zmin': ('', 'ZminValidator', 'simple'),
+    'zmax': ('', 'ZmaxValidator', 'simple'),
+    'colorscale': ('', 'ColorscaleValidator', 'simple'),
+    'autocolorscale': ('', 'AutocolorscaleValidator', 'simple'),
+    'reversescale': ('', 'ReversescaleValidator', 'simple'),
+    'showscale': ('', 'ShowscaleValidator', 'simple'),
+    'colorbar': ('', 'ColorbarValidator', 'compound'),
+    'colorbar.thicknessmode': ('.colorbar', 'ThicknessmodeValidator', 'simple'),
+    'colorbar.thickness': ('.colorbar', 'ThicknessValidator', 'simple'),
+    'colorbar.lenmode': ('.colorbar', 'LenmodeValidator', 'simple'),
+    'colorbar.len': ('.colorbar', 'LenValidator', 'simple'),
+    'colorbar.x': ('.colorbar', 'XValidator', 'simple'),
+    'colorbar.xanchor': ('.colorbar', 'XanchorValidator', 'simple'),
+    'colorbar.xpad': ('.colorbar', 'XpadValidator', 'simple'),
+    'colorbar.y': ('.colorbar', 'YValidator', 'simple'),
+    'colorbar.yanchor': ('.colorbar', 'YanchorValidator', 'simple'),
+    'colorbar.ypad': ('.colorbar', 'YpadValidator', 'simple'),
+    'colorbar.outlinecolor': ('.colorbar', 'OutlinecolorValidator', 'simple'),
+    'colorbar.outlinewidth': ('.colorbar', 'OutlinewidthValidator', 'simple'),
+    'colorbar.bordercolor': ('.colorbar', 'BordercolorValidator', 'simple'),
+    'colorbar.borderwidth': ('.colorbar', 'BorderwidthValidator', 'simple'),
+    'colorbar.bgcolor': ('.colorbar', 'BgcolorValidator', 'simple'),
+    'colorbar.tickmode': ('.colorbar', 'TickmodeValidator', 'simple'),
+    'colorbar.nticks': ('.colorbar', 'NticksValidator', 'simple'),
+    'colorbar.tick0': ('.colorbar', 'Tick0Validator', 'simple'),
+    'colorbar.dtick': ('.colorbar', 'DtickValidator', 'simple'),
+    'colorbar.tickvals': ('.colorbar', 'TickvalsValidator', 'simple'),
+    'colorbar.ticktext': ('.colorbar', 'TicktextValidator', 'simple'),
+    'colorbar.ticks': ('.colorbar', 'TicksValidator', 'simple'),
+    'colorbar.ticklen': ('.colorbar', 'TicklenValidator', 'simple'),
+    'colorbar.tickwidth': ('.colorbar', 'TickwidthValidator', 'simple'),
+    'colorbar.tickcolor': ('.colorbar', 'TickcolorValidator', 'simple'),
+    'colorbar.showticklabels': ('.colorbar', 'ShowticklabelsValidator', 'simple'),
+    'colorbar.tickfont': ('.colorbar', 'TickfontValidator', 'compound'),
+    'colorbar.tickfont.family': ('.colorbar.tickfont', 'FamilyValidator', 'simple'),
+    'colorbar.tickfont.size': ('.colorbar.tickfont', 'SizeValidator', 'simple'),
+    'colorbar.tickfont.color': ('.colorbar.tickfont', 'ColorValidator', 'simple'),
+    'colorbar.tickangle': ('.colorbar', 'TickangleValidator', 'simple'),
+    'colorbar.tickformat': ('.colorbar', 'TickformatValidator', 'simple'),
+    'colorbar.tickformatstops': ('.colorbar', 'TickformatstopsValidator', 'compound_array'),
+    'colorbar.tickformatstops.dtickrange': ('.colorbar.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'colorbar.tickformatstops.value': ('.colorbar.tickformatstop', 'ValueValidator', 'simple'),
+    'colorbar.tickprefix': ('.colorbar', 'TickprefixValidator', 'simple'),
+    'colorbar.showtickprefix': ('.colorbar', 'ShowtickprefixValidator', 'simple'),
+    'colorbar.ticksuffix': ('.colorbar', 'TicksuffixValidator', 'simple'),
+    'colorbar.showticksuffix': ('.colorbar', 'ShowticksuffixValidator', 'simple'),
+    'colorbar.separatethousands': ('.colorbar', 'SeparatethousandsValidator', 'simple'),
+    'colorbar.exponentformat': ('.colorbar', 'ExponentformatValidator', 'simple'),
+    'colorbar.showexponent': ('.colorbar', 'ShowexponentValidator', 'simple'),
+    'colorbar.title': ('.colorbar', 'TitleValidator', 'simple'),
+    'colorbar.titlefont': ('.colorbar', 'TitlefontValidator', 'compound'),
+    'colorbar.titlefont.family': ('.colorbar.titlefont', 'FamilyValidator', 'simple'),
+    'colorbar.titlefont.size': ('.colorbar.titlefont', 'SizeValidator', 'simple'),
+    'colorbar.titlefont.color': ('.colorbar.titlefont', 'ColorValidator', 'simple'),
+    'colorbar.titleside': ('.colorbar', 'TitlesideValidator', 'simple'),
+    'colorbar.tickvalssrc': ('.colorbar', 'TickvalssrcValidator', 'simple'),
+    'colorbar.ticktextsrc': ('.colorbar', 'TicktextsrcValidator', 'simple'),
+    'geo': ('', 'GeoValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'locationssrc': ('', 'LocationssrcValidator', 'simple'),
+    'zsrc': ('', 'ZsrcValidator', 'simple'),
+    'textsrc': ('', 'TextsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class UnselectedValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='unselected', parent_name='trace.choropleth'):
+        from ipyplotly.datatypes.trace.choropleth import Unselected
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Unselected)
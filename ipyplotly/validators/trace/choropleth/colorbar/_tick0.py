@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class Tick0Validator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='tick0', parent_name='trace.choropleth.colorbar'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            edit_type='colorbars',
+            implied_edits={'tickmode': 'linear'}
+        )
+
+    def validate_coerce(self, v):
+        return v
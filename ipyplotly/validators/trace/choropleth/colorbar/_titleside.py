@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class TitlesideValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='titleside', parent_name='trace.choropleth.colorbar'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['right', 'top', 'bottom'], edit_type='colorbars'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'bottom', 'right', 'top'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,120 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._z import ZValidator
+    from ._x import XValidator
+    from ._x0 import X0Validator
+    from ._dx import DxValidator
+    from ._y import YValidator
+    from ._y0 import Y0Validator
+    from ._dy import DyValidator
+    from ._text import TextValidator
+    from ._transpose import TransposeValidator
+    from ._xtype import XtypeValidator
+    from ._ytype import YtypeValidator
+    from ._zhoverformat import ZhoverformatValidator
+    from ._connectgaps import ConnectgapsValidator
+    from ._autocontour import AutocontourValidator
+    from ._ncontours import NcontoursValidator
+    from ._contours import ContoursValidator
+    from ._line import LineValidator
+    from ._zauto import ZautoValidator
+    from ._zmin import ZminValidator
+    from ._zmax import ZmaxValidator
+    from ._colorscale import ColorscaleValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._zsrc import ZsrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._transforms import TransformsValidator
+    from . import colorbar
+    from . import line
+    from . import contours
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+            '.line',
+            '.contours',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._z.ZValidator',
+            '._x.XValidator',
+            '._x0.X0Validator',
+            '._dx.DxValidator',
+            '._y.YValidator',
+            '._y0.Y0Validator',
+            '._dy.DyValidator',
+            '._text.TextValidator',
+            '._transpose.TransposeValidator',
+            '._xtype.XtypeValidator',
+            '._ytype.YtypeValidator',
+            '._zhoverformat.ZhoverformatValidator',
+            '._connectgaps.ConnectgapsValidator',
+            '._autocontour.AutocontourValidator',
+            '._ncontours.NcontoursValidator',
+            '._contours.ContoursValidator',
+            '._line.LineValidator',
+            '._zauto.ZautoValidator',
+            '._zmin.ZminValidator',
+            '._zmax.ZmaxValidator',
+            '._colorscale.ColorscaleValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._zsrc.ZsrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
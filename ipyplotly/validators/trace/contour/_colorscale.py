@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class ColorscaleValidator(ipyplotly.basevalidators.ColorscaleValidator):
+
+    def __init__(self, plotly_name='colorscale', parent_name='trace.contour'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            edit_type='calc',
+            implied_edits={'autocolorscale': False}
+        )
@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class XaxisValidator(ipyplotly.basevalidators.SubplotidValidator):
+
+    def __init__(self, plotly_name='xaxis', parent_name='trace.contour'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, dflt='x', edit_type='calc+clearAxisTypes')
+
+    def validate_coerce(self, v):
+        if v is None or (v.__class__ is str and v == 'x'):
+            return 'x'
+        return super().validate_coerce(v)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class DtickValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='dtick', parent_name='trace.contour.colorbar'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            edit_type='colorbars',
+            implied_edits={'tickmode': 'linear'}
+        )
+
+    def validate_coerce(self, v):
+        return v
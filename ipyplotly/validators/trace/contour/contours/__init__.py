@@ -0,0 +1,30 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._start import StartValidator
+    from ._end import EndValidator
+    from ._size import SizeValidator
+    from ._coloring import ColoringValidator
+    from ._showlines import ShowlinesValidator
+    from ._showlabels import ShowlabelsValidator
+    from ._labelfont import LabelfontValidator
+    from ._labelformat import LabelformatValidator
+    from . import labelfont
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.labelfont',
+        ],
+        [
+            '._start.StartValidator',
+            '._end.EndValidator',
+            '._size.SizeValidator',
+            '._coloring.ColoringValidator',
+            '._showlines.ShowlinesValidator',
+            '._showlabels.ShowlabelsValidator',
+            '._labelfont.LabelfontValidator',
+            '._labelformat.LabelformatValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LabelfontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='labelfont', parent_name='trace.contour.contours'):
+        from ipyplotly.datatypes.trace.contour.contours import Labelfont
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Labelfont)
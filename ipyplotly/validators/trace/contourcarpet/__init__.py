@@ -0,0 +1,120 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._carpet import CarpetValidator
+    from ._z import ZValidator
+    from ._a import AValidator
+    from ._a0 import A0Validator
+    from ._da import DaValidator
+    from ._b import BValidator
+    from ._b0 import B0Validator
+    from ._db import DbValidator
+    from ._text import TextValidator
+    from ._transpose import TransposeValidator
+    from ._atype import AtypeValidator
+    from ._btype import BtypeValidator
+    from ._mode import ModeValidator
+    from ._connectgaps import ConnectgapsValidator
+    from ._fillcolor import FillcolorValidator
+    from ._autocontour import AutocontourValidator
+    from ._ncontours import NcontoursValidator
+    from ._contours import ContoursValidator
+    from ._line import LineValidator
+    from ._zauto import ZautoValidator
+    from ._zmin import ZminValidator
+    from ._zmax import ZmaxValidator
+    from ._colorscale import ColorscaleValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._zsrc import ZsrcValidator
+    from ._asrc import AsrcValidator
+    from ._bsrc import BsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._transforms import TransformsValidator
+    from . import colorbar
+    from . import line
+    from . import contours
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+            '.line',
+            '.contours',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._carpet.CarpetValidator',
+            '._z.ZValidator',
+            '._a.AValidator',
+            '._a0.A0Validator',
+            '._da.DaValidator',
+            '._b.BValidator',
+            '._b0.B0Validator',
+            '._db.DbValidator',
+            '._text.TextValidator',
+            '._transpose.TransposeValidator',
+            '._atype.AtypeValidator',
+            '._btype.BtypeValidator',
+            '._mode.ModeValidator',
+            '._connectgaps.ConnectgapsValidator',
+            '._fillcolor.FillcolorValidator',
+            '._autocontour.AutocontourValidator',
+            '._ncontours.NcontoursValidator',
+            '._contours.ContoursValidator',
+            '._line.LineValidator',
+            '._zauto.ZautoValidator',
+            '._zmin.ZminValidator',
+            '._zmax.ZmaxValidator',
+            '._colorscale.ColorscaleValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._zsrc.ZsrcValidator',
+            '._asrc.AsrcValidator',
+            '._bsrc.BsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class A0Validator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='a0', parent_name='trace.contourcarpet'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            edit_type='calc+clearAxisTypes',
+            implied_edits={'xtype': 'scaled'}
+        )
+
+    def validate_coerce(self, v):
+        return v
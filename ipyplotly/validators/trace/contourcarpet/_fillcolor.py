@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class FillcolorValidator(ipyplotly.basevalidators.ColorValidator):
+
+    def __init__(self, plotly_name='fillcolor', parent_name='trace.contourcarpet'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            edit_type='calc',
+            colorscale_path='trace.contourcarpet.colorscale'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in self.named_colors_set:
+                return v
+        elif v.__class__ is int or v.__class__ is float or v is None:
+            return v
+        return super().validate_coerce(v)
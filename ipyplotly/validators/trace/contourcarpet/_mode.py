@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class ModeValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='mode', parent_name='trace.contourcarpet'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            flags=['lines', 'fill'],
+            extras=['none'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'fill', 'lines', 'none'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,16 @@
+import ipyplotly.basevalidators
+
+
+class EndValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='end', parent_name='trace.contourcarpet.contours'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, edit_type='plot', implied_edits={'^autocontour': False}
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
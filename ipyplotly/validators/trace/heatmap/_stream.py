@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class StreamValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='stream', parent_name='trace.heatmap'):
+        from ipyplotly.datatypes.trace.heatmap import Stream
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Stream)
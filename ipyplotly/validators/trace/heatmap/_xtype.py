@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class XtypeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='xtype', parent_name='trace.heatmap'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['array', 'scaled'],
+            edit_type='calc+clearAxisTypes'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'array', 'scaled'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
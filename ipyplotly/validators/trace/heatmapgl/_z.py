@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ZValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='z', parent_name='trace.heatmapgl'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
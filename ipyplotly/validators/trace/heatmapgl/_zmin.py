@@ -0,0 +1,16 @@
+import ipyplotly.basevalidators
+
+
+class ZminValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='zmin', parent_name='trace.heatmapgl'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, edit_type='calc', implied_edits={'zauto': False}
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,114 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._text import TextValidator
+    from ._orientation import OrientationValidator
+    from ._histfunc import HistfuncValidator
+    from ._histnorm import HistnormValidator
+    from ._cumulative import CumulativeValidator
+    from ._autobinx import AutobinxValidator
+    from ._nbinsx import NbinsxValidator
+    from ._xbins import XbinsValidator
+    from ._autobiny import AutobinyValidator
+    from ._nbinsy import NbinsyValidator
+    from ._ybins import YbinsValidator
+    from ._marker import MarkerValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._error_y import ErrorYValidator
+    from ._error_x import ErrorXValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._transforms import TransformsValidator
+    from . import error_x
+    from . import error_y
+    from . import unselected
+    from . import selected
+    from . import marker
+    from . import ybins
+    from . import xbins
+    from . import cumulative
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.error_x',
+            '.error_y',
+            '.unselected',
+            '.selected',
+            '.marker',
+            '.ybins',
+            '.xbins',
+            '.cumulative',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._x.XValidator',
+            '._y.YValidator',
+            '._text.TextValidator',
+            '._orientation.OrientationValidator',
+            '._histfunc.HistfuncValidator',
+            '._histnorm.HistnormValidator',
+            '._cumulative.CumulativeValidator',
+            '._autobinx.AutobinxValidator',
+            '._nbinsx.NbinsxValidator',
+            '._xbins.XbinsValidator',
+            '._autobiny.AutobinyValidator',
+            '._nbinsy.NbinsyValidator',
+            '._ybins.YbinsValidator',
+            '._marker.MarkerValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._error_y.ErrorYValidator',
+            '._error_x.ErrorXValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
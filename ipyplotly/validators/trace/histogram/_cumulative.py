@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class CumulativeValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='cumulative', parent_name='trace.histogram'):
+        from ipyplotly.datatypes.trace.histogram import Cumulative
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Cumulative)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ErrorXValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='error_x', parent_name='trace.histogram'):
+        from ipyplotly.datatypes.trace.histogram import ErrorX
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=ErrorX)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class HistnormValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='histnorm', parent_name='trace.histogram'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['', 'percent', 'probability', 'density', 'probability density'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'', 'density', 'percent', 'probability density', 'probability'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class CurrentbinValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='currentbin', parent_name='trace.histogram.cumulative'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['include', 'exclude', 'half'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'exclude', 'half', 'include'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class DirectionValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='direction', parent_name='trace.histogram.cumulative'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['increasing', 'decreasing'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'decreasing', 'increasing'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
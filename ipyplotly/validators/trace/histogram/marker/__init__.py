@@ -0,0 +1,42 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._line import LineValidator
+    from ._color import ColorValidator
+    from ._colorscale import ColorscaleValidator
+    from ._cauto import CautoValidator
+    from ._cmax import CmaxValidator
+    from ._cmin import CminValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._opacity import OpacityValidator
+    from ._colorsrc import ColorsrcValidator
+    from ._opacitysrc import OpacitysrcValidator
+    from . import colorbar
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+            '.line',
+        ],
+        [
+            '._line.LineValidator',
+            '._color.ColorValidator',
+            '._colorscale.ColorscaleValidator',
+            '._cauto.CautoValidator',
+            '._cmax.CmaxValidator',
+            '._cmin.CminValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._opacity.OpacityValidator',
+            '._colorsrc.ColorsrcValidator',
+            '._opacitysrc.OpacitysrcValidator',
+        ]
+    )
@@ -0,0 +1,118 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._z import ZValidator
+    from ._marker import MarkerValidator
+    from ._histnorm import HistnormValidator
+    from ._histfunc import HistfuncValidator
+    from ._autobinx import AutobinxValidator
+    from ._nbinsx import NbinsxValidator
+    from ._xbins import XbinsValidator
+    from ._autobiny import AutobinyValidator
+    from ._nbinsy import NbinsyValidator
+    from ._ybins import YbinsValidator
+    from ._xgap import XgapValidator
+    from ._ygap import YgapValidator
+    from ._zsmooth import ZsmoothValidator
+    from ._zhoverformat import ZhoverformatValidator
+    from ._zauto import ZautoValidator
+    from ._zmin import ZminValidator
+    from ._zmax import ZmaxValidator
+    from ._colorscale import ColorscaleValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._zsrc import ZsrcValidator
+    from ._transforms import TransformsValidator
+    from . import colorbar
+    from . import ybins
+    from . import xbins
+    from . import marker
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+            '.ybins',
+            '.xbins',
+            '.marker',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._x.XValidator',
+            '._y.YValidator',
+            '._z.ZValidator',
+            '._marker.MarkerValidator',
+            '._histnorm.HistnormValidator',
+            '._histfunc.HistfuncValidator',
+            '._autobinx.AutobinxValidator',
+            '._nbinsx.NbinsxValidator',
+            '._xbins.XbinsValidator',
+            '._autobiny.AutobinyValidator',
+            '._nbinsy.NbinsyValidator',
+            '._ybins.YbinsValidator',
+            '._xgap.XgapValidator',
+            '._ygap.YgapValidator',
+            '._zsmooth.ZsmoothValidator',
+            '._zhoverformat.ZhoverformatValidator',
+            '._zauto.ZautoValidator',
+            '._zmin.ZminValidator',
+            '._zmax.ZmaxValidator',
+            '._colorscale.ColorscaleValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._zsrc.ZsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class XbinsValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='xbins', parent_name='trace.histogram2d'):
+        from ipyplotly.datatypes.trace.histogram2d import Xbins
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Xbins)
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class ZsmoothValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='zsmooth', parent_name='trace.histogram2d'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['fast', 'best', False], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'best', 'fast', False}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
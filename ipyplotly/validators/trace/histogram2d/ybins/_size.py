@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class SizeValidator(ipyplotly.basevalidators.AnyValidator):
+
+    def __init__(self, plotly_name='size', parent_name='trace.histogram2d.ybins'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, edit_type='calc', implied_edits={'^autobiny': False}
+        )
+
+    def validate_coerce(self, v):
+        return v
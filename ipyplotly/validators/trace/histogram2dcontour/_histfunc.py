@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class HistfuncValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='histfunc', parent_name='trace.histogram2dcontour'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['count', 'sum', 'avg', 'min', 'max'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'avg', 'count', 'max', 'min', 'sum'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class YbinsValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='ybins', parent_name='trace.histogram2dcontour'):
+        from ipyplotly.datatypes.trace.histogram2dcontour import Ybins
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Ybins)
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ColoringValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='coloring', parent_name='trace.histogram2dcontour.contours'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['fill', 'heatmap', 'lines', 'none'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'fill', 'heatmap', 'lines', 'none'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LabelfontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='labelfont', parent_name='trace.histogram2dcontour.contours'):
+        from ipyplotly.datatypes.trace.histogram2dcontour.contours import Labelfont
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Labelfont)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class SmoothingValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='smoothing', parent_name='trace.histogram2dcontour.line'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=0, max=1.3, edit_type='plot')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if 0 <= v <= 1.3:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
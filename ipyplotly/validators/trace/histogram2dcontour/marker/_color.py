@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ColorValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='color', parent_name='trace.histogram2dcontour.marker'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
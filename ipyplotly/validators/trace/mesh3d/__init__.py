@@ -0,0 +1,130 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._color import ColorValidator
+    from ._colorscale import ColorscaleValidator
+    from ._cauto import CautoValidator
+    from ._cmax import CmaxValidator
+    from ._cmin import CminValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._z import ZValidator
+    from ._i import IValidator
+    from ._j import JValidator
+    from ._k import KValidator
+    from ._delaunayaxis import DelaunayaxisValidator
+    from ._alphahull import AlphahullValidator
+    from ._intensity import IntensityValidator
+    from ._vertexcolor import VertexcolorValidator
+    from ._facecolor import FacecolorValidator
+    from ._flatshading import FlatshadingValidator
+    from ._contour import ContourValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._lightposition import LightpositionValidator
+    from ._lighting import LightingValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._zcalendar import ZcalendarValidator
+    from ._scene import SceneValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._zsrc import ZsrcValidator
+    from ._isrc import IsrcValidator
+    from ._jsrc import JsrcValidator
+    from ._ksrc import KsrcValidator
+    from ._intensitysrc import IntensitysrcValidator
+    from ._vertexcolorsrc import VertexcolorsrcValidator
+    from ._facecolorsrc import FacecolorsrcValidator
+    from ._transforms import TransformsValidator
+    from . import lighting
+    from . import lightposition
+    from . import colorbar
+    from . import contour
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.lighting',
+            '.lightposition',
+            '.colorbar',
+            '.contour',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._color.ColorValidator',
+            '._colorscale.ColorscaleValidator',
+            '._cauto.CautoValidator',
+            '._cmax.CmaxValidator',
+            '._cmin.CminValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._x.XValidator',
+            '._y.YValidator',
+            '._z.ZValidator',
+            '._i.IValidator',
+            '._j.JValidator',
+            '._k.KValidator',
+            '._delaunayaxis.DelaunayaxisValidator',
+            '._alphahull.AlphahullValidator',
+            '._intensity.IntensityValidator',
+            '._vertexcolor.VertexcolorValidator',
+            '._facecolor.FacecolorValidator',
+            '._flatshading.FlatshadingValidator',
+            '._contour.ContourValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._lightposition.LightpositionValidator',
+            '._lighting.LightingValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._zcalendar.ZcalendarValidator',
+            '._scene.SceneValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._zsrc.ZsrcValidator',
+            '._isrc.IsrcValidator',
+            '._jsrc.JsrcValidator',
+            '._ksrc.KsrcValidator',
+            '._intensitysrc.IntensitysrcValidator',
+            '._vertexcolorsrc.VertexcolorsrcValidator',
+            '._facecolorsrc.FacecolorsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
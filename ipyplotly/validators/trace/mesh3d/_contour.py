@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ContourValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='contour', parent_name='trace.mesh3d'):
+        from ipyplotly.datatypes.trace.mesh3d import Contour
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Contour)
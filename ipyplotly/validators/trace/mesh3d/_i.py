@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class IValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='i', parent_name='trace.mesh3d'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LightpositionValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='lightposition', parent_name='trace.mesh3d'):
+        from ipyplotly.datatypes.trace.mesh3d import Lightposition
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Lightposition)
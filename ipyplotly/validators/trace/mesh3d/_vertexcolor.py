@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class VertexcolorValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='vertexcolor', parent_name='trace.mesh3d'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class XValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='x', parent_name='trace.mesh3d.lightposition'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=-100000, max=100000, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if -100000 <= v <= 100000:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,92 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._x import XValidator
+    from ._open import OpenValidator
+    from ._high import HighValidator
+    from ._low import LowValidator
+    from ._close import CloseValidator
+    from ._line import LineValidator
+    from ._increasing import IncreasingValidator
+    from ._decreasing import DecreasingValidator
+    from ._text import TextValidator
+    from ._tickwidth import TickwidthValidator
+    from ._xcalendar import XcalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._opensrc import OpensrcValidator
+    from ._highsrc import HighsrcValidator
+    from ._lowsrc import LowsrcValidator
+    from ._closesrc import ClosesrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._transforms import TransformsValidator
+    from . import decreasing
+    from . import increasing
+    from . import line
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.decreasing',
+            '.increasing',
+            '.line',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._x.XValidator',
+            '._open.OpenValidator',
+            '._high.HighValidator',
+            '._low.LowValidator',
+            '._close.CloseValidator',
+            '._line.LineValidator',
+            '._increasing.IncreasingValidator',
+            '._decreasing.DecreasingValidator',
+            '._text.TextValidator',
+            '._tickwidth.TickwidthValidator',
+            '._xcalendar.XcalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._opensrc.OpensrcValidator',
+            '._highsrc.HighsrcValidator',
+            '._lowsrc.LowsrcValidator',
+            '._closesrc.ClosesrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
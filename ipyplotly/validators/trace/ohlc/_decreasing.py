@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class DecreasingValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='decreasing', parent_name='trace.ohlc'):
+        from ipyplotly.datatypes.trace.ohlc import Decreasing
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Decreasing)
@@ -0,0 +1,68 @@
+# Property paths of trace.ohlc
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'x': ('', 'XValidator', 'simple'),
+    'open': ('', 'OpenValidator', 'simple'),
+    'high': ('', 'HighValidator', 'simple'),
+    'low': ('', 'LowValidator', 'simple'),
+    'close': ('', 'CloseValidator', 'simple'),
+    'line': ('', 'LineValidator', 'compound'),
+    'line.width': ('.line', 'WidthValidator', 'simple'),
+    'line.dash': ('.line', 'DashValidator', 'simple'),
+    'increasing': ('', 'IncreasingValidator', 'compound'),
+    'increasing.name': ('.increasing', 'NameValidator', 'simple'),
+    'increasing.showlegend': ('.increasing', 'ShowlegendValidator', 'simple'),
+    'increasing.line': ('.increasing', 'LineValidator', 'compound'),
+    'increasing.line.color': ('.increasing.line', 'ColorValidator', 'simple'),
+    'increasing.line.width': ('.increasing.line', 'WidthValidator', 'simple'),
+    'increasing.line.dash': ('.increasing.line', 'DashValidator', 'simple'),
+    'decreasing': ('', 'DecreasingValidator', 'compound'),
+    'decreasing.name': ('.decreasing', 'NameValidator', 'simple'),
+    'decreasing.showlegend': ('.decreasing', 'ShowlegendValidator', 'simple'),
+    'decreasing.line': ('.decreasing', 'LineValidator', 'compound'),
+    'decreasing.line.color': ('.decreasing.line', 'ColorValidator', 'simple'),
+    'decreasing.line.width': ('.decreasing.line', 'WidthValidator', 'simple'),
+    'decreasing.line.dash': ('.decreasing.line', 'DashValidator', 'simple'),
+    'text': ('', 'TextValidator', 'simple'),
+    'tickwidth': ('', 'TickwidthValidator', 'simple'),
+    'xcalendar': ('', 'XcalendarValidator', 'simple'),
+    'xaxis': ('', 'XaxisValidator', 'simple'),
+    'yaxis': ('', 'YaxisValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'xsrc': ('', 'XsrcValidator', 'simple'),
+    'opensrc': ('', 'OpensrcValidator', 'simple'),
+    'highsrc': ('', 'HighsrcValidator', 'simple'),
+    'lowsrc': ('', 'LowsrcValidator', 'simple'),
+    'closesrc': ('', 'ClosesrcValidator', 'simple'),
+    'textsrc': ('', 'TextsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class DashValidator(ipyplotly.basevalidators.StringValidator):
+
+    def __init__(self, plotly_name='dash', parent_name='trace.ohlc.decreasing.line'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['solid', 'dot', 'dash', 'longdash', 'dashdot', 'longdashdot'],
+            edit_type='style'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'dash', 'dashdot', 'dot', 'longdash', 'longdashdot', 'solid'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
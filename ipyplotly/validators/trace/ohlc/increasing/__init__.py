@@ -0,0 +1,20 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._name import NameValidator
+    from ._showlegend import ShowlegendValidator
+    from ._line import LineValidator
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+        ],
+        [
+            '._name.NameValidator',
+            '._showlegend.ShowlegendValidator',
+            '._line.LineValidator',
+        ]
+    )
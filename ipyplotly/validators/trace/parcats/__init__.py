@@ -0,0 +1,70 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._domain import DomainValidator
+    from ._tooltip import TooltipValidator
+    from ._hovermode import HovermodeValidator
+    from ._bundlecolors import BundlecolorsValidator
+    from ._dimensions import DimensionsValidator
+    from ._marker import MarkerValidator
+    from ._counts import CountsValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._countssrc import CountssrcValidator
+    from ._transforms import TransformsValidator
+    from . import marker
+    from . import dimension
+    from . import domain
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.marker',
+            '.dimension',
+            '.domain',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._domain.DomainValidator',
+            '._tooltip.TooltipValidator',
+            '._hovermode.HovermodeValidator',
+            '._bundlecolors.BundlecolorsValidator',
+            '._dimensions.DimensionsValidator',
+            '._marker.MarkerValidator',
+            '._counts.CountsValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._countssrc.CountssrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class HovermodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='hovermode', parent_name='trace.parcats'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['none', 'category', 'color'], edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'category', 'color', 'none'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
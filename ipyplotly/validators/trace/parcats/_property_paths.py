@@ -0,0 +1,117 @@
+# Property paths of trace.parcats
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'domain': ('', 'DomainValidator', 'compound'),
+    'domain.x': ('.domain', 'XValidator', 'simple'),
+    'domain.y': ('.domain', 'YValidator', 'simple'),
+    'tooltip': ('', 'TooltipValidator', 'simple'),
+    'hovermode': ('', 'HovermodeValidator', 'simple'),
+    'bundlecolors': ('', 'BundlecolorsValidator', 'simple'),
+    'dimensions': ('', 'DimensionsValidator', 'compound_array'),
+    'dimensions.label': ('.dimension', 'LabelValidator', 'simple'),
+    'dimensions.catDisplayInds': ('.dimension', 'CatdisplayindsValidator', 'simple'),
+    'dimensions.catValues': ('.dimension', 'CatvaluesValidator', 'simple'),
+    'dimensions.catLabels': ('.dimension', 'CatlabelsValidator', 'simple'),
+    'dimensions.visible': ('.dimension', 'VisibleValidator', 'simple'),
+    'dimensions.values': ('.dimension', 'ValuesValidator', 'simple'),
+    'dimensions.displayInd': ('.dimension', 'DisplayindValidator', 'simple'),
+    'dimensions.catDisplayIndssrc': ('.dimension', 'CatdisplayindssrcValidator', 'simple'),
+    'dimensions.catValuessrc': ('.dimension', 'CatvaluessrcValidator', 'simple'),
+    'dimensions.catLabelssrc': ('.dimension', 'CatlabelssrcValidator', 'simple'),
+    'dimensions.valuessrc': ('.dimension', 'ValuessrcValidator', 'simple'),
+    'marker': ('', 'MarkerValidator', 'compound'),
+    'marker.color': ('.marker', 'ColorValidator', 'simple'),
+    'marker.colorscale': ('.marker', 'ColorscaleValidator', 'simple'),
+    'marker.cauto': ('.marker', 'CautoValidator', 'simple'),
+    'marker.cmax': ('.marker', 'CmaxValidator', 'simple'),
+    'marker.cmin': ('.marker', 'CminValidator', 'simple'),
+    'marker.autocolorscale': ('.marker', 'AutocolorscaleValidator', 'simple'),
+    'marker.reversescale': ('.marker', 'ReversescaleValidator', 'simple'),
+    'marker.showscale': ('.marker', 'ShowscaleValidator', 'simple'),
+    'marker.colorbar': ('.marker', 'ColorbarValidator', 'compound'),
+    'marker.colorbar.thicknessmode': ('.marker.colorbar', 'ThicknessmodeValidator', 'simple'),
+    'marker.colorbar.thickness': ('.marker.colorbar', 'ThicknessValidator', 'simple'),
+    'marker.colorbar.lenmode': ('.marker.colorbar', 'LenmodeValidator', 'simple'),
+    'marker.colorbar.len': ('.marker.colorbar', 'LenValidator', 'simple'),
+    'marker.colorbar.x': ('.marker.colorbar', 'XValidator', 'simple'),
+    'marker.colorbar.xanchor': ('.marker.colorbar', 'XanchorValidator', 'simple'),
+    'marker.colorbar.xpad': ('.marker.colorbar', 'XpadValidator', 'simple'),
+    'marker.colorbar.y': ('.marker.colorbar', 'YValidator', 'simple'),
+    'marker.colorbar.yanchor': ('.marker.colorbar', 'YanchorValidator', 'simple'),
+    'marker.colorbar.ypad': ('.marker.colorbar', 'YpadValidator', 'simple'),
+    'marker.colorbar.outlinecolor': ('.marker.colorbar', 'OutlinecolorValidator', 'simple'),
+    'marker.colorbar.outlinewidth': ('.marker.colorbar', 'OutlinewidthValidator', 'simple'),
+    'marker.colorbar.bordercolor': ('.marker.colorbar', 'BordercolorValidator', 'simple'),
+    'marker.colorbar.borderwidth': ('.marker.colorbar', 'BorderwidthValidator', 'simple'),
+    'marker.colorbar.bgcolor': ('.marker.colorbar', 'BgcolorValidator', 'simple'),
+    'marker.colorbar.tickmode': ('.marker.colorbar', 'TickmodeValidator', 'simple'),
+    'marker.colorbar.nticks': ('.marker.colorbar', 'NticksValidator', 'simple'),
+    'marker.colorbar.tick0': ('.marker.colorbar', 'Tick0Validator', 'simple'),
+    'marker.colorbar.dtick': ('.marker.colorbar', 'DtickValidator', 'simple'),
+    'marker.colorbar.tickvals': ('.marker.colorbar', 'TickvalsValidator', 'simple'),
+    'marker.colorbar.ticktext': ('.marker.colorbar', 'TicktextValidator', 'simple'),
+    'marker.colorbar.ticks': ('.marker.colorbar', 'TicksValidator', 'simple'),
+    'marker.colorbar.ticklen': ('.marker.colorbar', 'TicklenValidator', 'simple'),
+    'marker.colorbar.tickwidth': ('.marker.colorbar', 'TickwidthValidator', 'simple'),
+    'marker.colorbar.tickcolor': ('.marker.colorbar', 'TickcolorValidator', 'simple'),
+    'marker.colorbar.showticklabels': ('.marker.colorbar', 'ShowticklabelsValidator', 'simple'),
+    'marker.colorbar.tickfont': ('.marker.colorbar', 'TickfontValidator', 'compound'),
+    'marker.colorbar.tickfont.family': ('.marker.colorbar.tickfont', 'FamilyValidator', 'simple'),
+    'marker.colorbar.tickfont.size': ('.marker.colorbar.tickfont', 'SizeValidator', 'simple'),
+    'marker.colorbar.tickfont.color': ('.marker.colorbar.tickfont', 'ColorValidator', 'simple'),
+    'marker.colorbar.tickangle': ('.marker.colorbar', 'TickangleValidator', 'simple'),
+    'marker.colorbar.tickformat': ('.marker.colorbar', 'TickformatValidator', 'simple'),
+    'marker.colorbar.tickformatstops': ('.marker.colorbar', 'TickformatstopsValidator', 'compound_array'),
+    'marker.colorbar.tickformatstops.dtickrange': ('.marker.colorbar.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'marker.colorbar.tickformatstops.value': ('.marker.colorbar.tickformatstop', 'ValueValidator', 'simple'),
+    'marker.colorbar.tickprefix': ('.marker.colorbar', 'TickprefixValidator', 'simple'),
+    'marker.colorbar.showtickprefix': ('.marker.colorbar', 'ShowtickprefixValidator', 'simple'),
+    'marker.colorbar.ticksuffix': ('.marker.colorbar', 'TicksuffixValidator', 'simple'),
+    'marker.colorbar.showticksuffix': ('.marker.colorbar', 'ShowticksuffixValidator', 'simple'),
+    'marker.colorbar.separatethousands': ('.marker.colorbar', 'SeparatethousandsValidator', 'simple'),
+    'marker.colorbar.exponentformat': ('.marker.colorbar', 'ExponentformatValidator', 'simple'),
+    'marker.colorbar.showexponent': ('.marker.colorbar', 'ShowexponentValidator', 'simple'),
+    'marker.colorbar.title': ('.marker.colorbar', 'TitleValidator', 'simple'),
+    'marker.colorbar.titlefont': ('.marker.colorbar', 'TitlefontValidator', 'compound'),
+    'marker.colorbar.titlefont.family': ('.marker.colorbar.titlefont', 'FamilyValidator', 'simple'),
+    'marker.colorbar.titlefont.size': ('.marker.colorbar.titlefont', 'SizeValidator', 'simple'),
+    'marker.colorbar.titlefont.color': ('.marker.colorbar.titlefont', 'ColorValidator', 'simple'),
+    'marker.colorbar.titleside': ('.marker.colorbar', 'TitlesideValidator', 'simple'),
+    'marker.colorbar.tickvalssrc': ('.marker.colorbar', 'TickvalssrcValidator', 'simple'),
+    'marker.colorbar.ticktextsrc': ('.marker.colorbar', 'TicktextsrcValidator', 'simple'),
+    'marker.shape': ('.marker', 'ShapeValidator', 'simple'),
+    'marker.colorsrc': ('.marker', 'ColorsrcValidator', 'simple'),
+    'counts': ('', 'CountsValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'countssrc': ('', 'CountssrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
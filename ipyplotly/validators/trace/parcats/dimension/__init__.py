@@ -0,0 +1,33 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._label import LabelValidator
+    from ._catDisplayInds import CatdisplayindsValidator
+    from ._catValues import CatvaluesValidator
+    from ._catLabels import CatlabelsValidator
+    from ._visible import VisibleValidator
+    from ._values import ValuesValidator
+    from ._displayInd import DisplayindValidator
+    from ._catDisplayIndssrc import CatdisplayindssrcValidator
+    from ._catValuessrc import CatvaluessrcValidator
+    from ._catLabelssrc import CatlabelssrcValidator
+    from ._valuessrc import ValuessrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._label.LabelValidator',
+            '._catDisplayInds.CatdisplayindsValidator',
+            '._catValues.CatvaluesValidator',
+            '._catLabels.CatlabelsValidator',
+            '._visible.VisibleValidator',
+            '._values.ValuesValidator',
+            '._displayInd.DisplayindValidator',
+            '._catDisplayIndssrc.CatdisplayindssrcValidator',
+            '._catValuessrc.CatvaluessrcValidator',
+            '._catLabelssrc.CatlabelssrcValidator',
+            '._valuessrc.ValuessrcValidator',
+        ]
+    )
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class CatlabelsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='catLabels', parent_name='trace.parcats.dimension'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,14 @@
+import ipyplotly.basevalidators
+
+
+class CatvaluessrcValidator(ipyplotly.basevalidators.StringValidator):
+
+    def __init__(self, plotly_name='catValuessrc', parent_name='trace.parcats.dimension'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='none')
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
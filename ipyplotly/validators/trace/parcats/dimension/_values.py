@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ValuesValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='values', parent_name='trace.parcats.dimension'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
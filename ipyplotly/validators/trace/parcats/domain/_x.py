@@ -0,0 +1,24 @@
+import ipyplotly.basevalidators
+
+
+class XValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='x', parent_name='trace.parcats.domain'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            items=[
+                {
+                    'valType': 'number',
+                    'min': 0,
+                    'max': 1,
+                    'editType': 'calc'
+                }, {
+                    'valType': 'number',
+                    'min': 0,
+                    'max': 1,
+                    'editType': 'calc'
+                }
+            ],
+            edit_type='calc'
+        )
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class ShapeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='shape', parent_name='trace.parcats.marker'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['straight', 'curved'], edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'curved', 'straight'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,72 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._domain import DomainValidator
+    from ._labelfont import LabelfontValidator
+    from ._tickfont import TickfontValidator
+    from ._rangefont import RangefontValidator
+    from ._dimensions import DimensionsValidator
+    from ._line import LineValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._transforms import TransformsValidator
+    from . import line
+    from . import dimension
+    from . import rangefont
+    from . import tickfont
+    from . import labelfont
+    from . import domain
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+            '.dimension',
+            '.rangefont',
+            '.tickfont',
+            '.labelfont',
+            '.domain',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._domain.DomainValidator',
+            '._labelfont.LabelfontValidator',
+            '._tickfont.TickfontValidator',
+            '._rangefont.RangefontValidator',
+            '._dimensions.DimensionsValidator',
+            '._line.LineValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
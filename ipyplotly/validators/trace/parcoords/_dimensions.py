@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class DimensionsValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='dimensions', parent_name='trace.parcoords'):
+        from ipyplotly.datatypes.trace.parcoords import Dimension
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Dimension)
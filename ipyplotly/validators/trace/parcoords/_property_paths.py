@@ -0,0 +1,123 @@
+# Property paths of trace.parcoords
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'domain': ('', 'DomainValidator', 'compound'),
+    'domain.x': ('.domain', 'XValidator', 'simple'),
+    'domain.y': ('.domain', 'YValidator', 'simple'),
+    'labelfont': ('', 'LabelfontValidator', 'compound'),
+    'labelfont.family': ('.labelfont', 'FamilyValidator', 'simple'),
+    'labelfont.size': ('.labelfont', 'SizeValidator', 'simple'),
+    'labelfont.color': ('.labelfont', 'ColorValidator', 'simple'),
+    'tickfont': ('', 'TickfontValidator', 'compound'),
+    'tickfont.family': ('.tickfont', 'FamilyValidator', 'simple'),
+    'tickfont.size': ('.tickfont', 'SizeValidator', 'simple'),
+    'tickfont.color': ('.tickfont', 'ColorValidator', 'simple'),
+    'rangefont': ('', 'RangefontValidator', 'compound'),
+    'rangefont.family': ('.rangefont', 'FamilyValidator', 'simple'),
+    'rangefont.size': ('.rangefont', 'SizeValidator', 'simple'),
+    'rangefont.color': ('.rangefont', 'ColorValidator', 'simple'),
+    'dimensions': ('', 'DimensionsValidator', 'compound_array'),
+    'dimensions.label': ('.dimension', 'LabelValidator', 'simple'),
+    'dimensions.tickvals': ('.dimension', 'TickvalsValidator', 'simple'),
+    'dimensions.ticktext': ('.dimension', 'TicktextValidator', 'simple'),
+    'dimensions.tickformat': ('.dimension', 'TickformatValidator', 'simple'),
+    'dimensions.visible': ('.dimension', 'VisibleValidator', 'simple'),
+    'dimensions.range': ('.dimension', 'RangeValidator', 'simple'),
+    'dimensions.constraintrange': ('.dimension', 'ConstraintrangeValidator', 'simple'),
+    'dimensions.values': ('.dimension', 'ValuesValidator', 'simple'),
+    'dimensions.tickvalssrc': ('.dimension', 'TickvalssrcValidator', 'simple'),
+    'dimensions.ticktextsrc': ('.dimension', 'TicktextsrcValidator', 'simple'),
+    'dimensions.valuessrc': ('.dimension', 'ValuessrcValidator', 'simple'),
+    'line': ('', 'LineValidator', 'compound'),
+    'line.color': ('.line', 'ColorValidator', 'simple'),
+    'line.colorscale': ('.line', 'ColorscaleValidator', 'simple'),
+    'line.cauto': ('.line', 'CautoValidator', 'simple'),
+    'line.cmax': ('.line', 'CmaxValidator', 'simple'),
+    'line.cmin': ('.line', 'CminValidator', 'simple'),
+    'line.autocolorscale': ('.line', 'AutocolorscaleValidator', 'simple'),
+    'line.reversescale': ('.line', 'ReversescaleValidator', 'simple'),
+    'line.showscale': ('.line', 'ShowscaleValidator', 'simple'),
+    'line.colorbar': ('.line', 'ColorbarValidator', 'compound'),
+    'line.colorbar.thicknessmode': ('.line.colorbar', 'ThicknessmodeValidator', 'simple'),
+    'line.colorbar.thickness': ('.line.colorbar', 'ThicknessValidator', 'simple'),
+    'line.colorbar.lenmode': ('.line.colorbar', 'LenmodeValidator', 'simple'),
+    'line.colorbar.len': ('.line.colorbar', 'LenValidator', 'simple'),
+    'line.colorbar.x': ('.line.colorbar', 'XValidator', 'simple'),
+    'line.colorbar.xanchor': ('.line.colorbar', 'XanchorValidator', 'simple'),
+    'line.colorbar.xpad': ('.line.colorbar', 'XpadValidator', 'simple'),
+    'line.colorbar.y': ('.line.colorbar', 'YValidator', 'simple'),
+    'line.colorbar.yanchor': ('.line.colorbar', 'YanchorValidator', 'simple'),
+    'line.colorbar.ypad': ('.line.colorbar', 'YpadValidator', 'simple'),
+    'line.colorbar.outlinecolor': ('.line.colorbar', 'OutlinecolorValidator', 'simple'),
+    'line.colorbar.outlinewidth': ('.line.colorbar', 'OutlinewidthValidator', 'simple'),
+    'line.colorbar.bordercolor': ('.line.colorbar', 'BordercolorValidator', 'simple'),
+    'line.colorbar.borderwidth': ('.line.colorbar', 'BorderwidthValidator', 'simple'),
+    'line.colorbar.bgcolor': ('.line.colorbar', 'BgcolorValidator', 'simple'),
+    'line.colorbar.tickmode': ('.line.colorbar', 'TickmodeValidator', 'simple'),
+    'line.colorbar.nticks': ('.line.colorbar', 'NticksValidator', 'simple'),
+    'line.colorbar.tick0': ('.line.colorbar', 'Tick0Validator', 'simple'),
+    'line.colorbar.dtick': ('.line.colorbar', 'DtickValidator', 'simple'),
+    'line.colorbar.tickvals': ('.line.colorbar', 'TickvalsValidator', 'simple'),
+    'line.colorbar.ticktext': ('.line.colorbar', 'TicktextValidator', 'simple'),
+    'line.colorbar.ticks': ('.line.colorbar', 'TicksValidator', 'simple'),
+    'line.colorbar.ticklen': ('.line.colorbar', 'TicklenValidator', 'simple'),
+    'line.colorbar.tickwidth': ('.line.colorbar', 'TickwidthValidator', 'simple'),
+    'line.colorbar.tickcolor': ('.line.colorbar', 'TickcolorValidator', 'simple'),
+    'line.colorbar.showticklabels': ('.line.colorbar', 'ShowticklabelsValidator', 'simple'),
+    'line.colorbar.tickfont': ('.line.colorbar', 'TickfontValidator', 'compound'),
+    'line.colorbar.tickfont.family': ('.line.colorbar.tickfont', 'FamilyValidator', 'simple'),
+    'line.colorbar.tickfont.size': ('.line.colorbar.tickfont', 'SizeValidator', 'simple'),
+    'line.colorbar.tickfont.color': ('.line.colorbar.tickfont', 'ColorValidator', 'simple'),
+    'line.colorbar.tickangle': ('.line.colorbar', 'TickangleValidator', 'simple'),
+    'line.colorbar.tickformat': ('.line.colorbar', 'TickformatValidator', 'simple'),
+    'line.colorbar.tickformatstops': ('.line.colorbar', 'TickformatstopsValidator', 'compound_array'),
+    'line.colorbar.tickformatstops.dtickrange': ('.line.colorbar.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'line.colorbar.tickformatstops.value': ('.line.colorbar.tickformatstop', 'ValueValidator', 'simple'),
+    'line.colorbar.tickprefix': ('.line.colorbar', 'TickprefixValidator', 'simple'),
+    'line.colorbar.showtickprefix': ('.line.colorbar', 'ShowtickprefixValidator', 'simple'),
+    'line.colorbar.ticksuffix': ('.line.colorbar', 'TicksuffixValidator', 'simple'),
+    'line.colorbar.showticksuffix': ('.line.colorbar', 'ShowticksuffixValidator', 'simple'),
+    'line.colorbar.separatethousands': ('.line.colorbar', 'SeparatethousandsValidator', 'simple'),
+    'line.colorbar.exponentformat': ('.line.colorbar', 'ExponentformatValidator', 'simple'),
+    'line.colorbar.showexponent': ('.line.colorbar', 'ShowexponentValidator', 'simple'),
+    'line.colorbar.title': ('.line.colorbar', 'TitleValidator', 'simple'),
+    'line.colorbar.titlefont': ('.line.colorbar', 'TitlefontValidator', 'compound'),
+    'line.colorbar.titlefont.family': ('.line.colorbar.titlefont', 'FamilyValidator', 'simple'),
+    'line.colorbar.titlefont.size': ('.line.colorbar.titlefont', 'SizeValidator', 'simple'),
+    'line.colorbar.titlefont.color': ('.line.colorbar.titlefont', 'ColorValidator', 'simple'),
+    'line.colorbar.titleside': ('.line.colorbar', 'TitlesideValidator', 'simple'),
+    'line.colorbar.tickvalssrc': ('.line.colorbar', 'TickvalssrcValidator', 'simple'),
+    'line.colorbar.ticktextsrc': ('.line.colorbar', 'TicktextsrcValidator', 'simple'),
+    'line.colorsrc': ('.line', 'ColorsrcValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
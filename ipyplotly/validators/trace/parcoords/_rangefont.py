@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class RangefontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='rangefont', parent_name='trace.parcoords'):
+        from ipyplotly.datatypes.trace.parcoords import Rangefont
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Rangefont)
@@ -0,0 +1,33 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._label import LabelValidator
+    from ._tickvals import TickvalsValidator
+    from ._ticktext import TicktextValidator
+    from ._tickformat import TickformatValidator
+    from ._visible import VisibleValidator
+    from ._range import RangeValidator
+    from ._constraintrange import ConstraintrangeValidator
+    from ._values import ValuesValidator
+    from ._tickvalssrc import TickvalssrcValidator
+    from ._ticktextsrc import TicktextsrcValidator
+    from ._valuessrc import ValuessrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._label.LabelValidator',
+            '._tickvals.TickvalsValidator',
+            '._ticktext.TicktextValidator',
+            '._tickformat.TickformatValidator',
+            '._visible.VisibleValidator',
+            '._range.RangeValidator',
+            '._constraintrange.ConstraintrangeValidator',
+            '._values.ValuesValidator',
+            '._tickvalssrc.TickvalssrcValidator',
+            '._ticktextsrc.TicktextsrcValidator',
+            '._valuessrc.ValuessrcValidator',
+        ]
+    )
@@ -0,0 +1,18 @@
+import ipyplotly.basevalidators
+
+
+class ConstraintrangeValidator(ipyplotly.basevalidators.InfoArrayValidator):
+
+    def __init__(self, plotly_name='constraintrange', parent_name='trace.parcoords.dimension'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            items=[{
+                'valType': 'number',
+                'editType': 'calc'
+            }, {
+                'valType': 'number',
+                'editType': 'calc'
+            }],
+            edit_type='calc'
+        )
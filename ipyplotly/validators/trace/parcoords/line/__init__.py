@@ -0,0 +1,34 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._color import ColorValidator
+    from ._colorscale import ColorscaleValidator
+    from ._cauto import CautoValidator
+    from ._cmax import CmaxValidator
+    from ._cmin import CminValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._colorsrc import ColorsrcValidator
+    from . import colorbar
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.colorbar',
+        ],
+        [
+            '._color.ColorValidator',
+            '._colorscale.ColorscaleValidator',
+            '._cauto.CautoValidator',
+            '._cmax.CmaxValidator',
+            '._cmin.CminValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._colorsrc.ColorsrcValidator',
+        ]
+    )
@@ -0,0 +1,108 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._labels import LabelsValidator
+    from ._label0 import Label0Validator
+    from ._dlabel import DlabelValidator
+    from ._values import ValuesValidator
+    from ._marker import MarkerValidator
+    from ._text import TextValidator
+    from ._hovertext import HovertextValidator
+    from ._scalegroup import ScalegroupValidator
+    from ._textinfo import TextinfoValidator
+    from ._textposition import TextpositionValidator
+    from ._textfont import TextfontValidator
+    from ._insidetextfont import InsidetextfontValidator
+    from ._outsidetextfont import OutsidetextfontValidator
+    from ._domain import DomainValidator
+    from ._hole import HoleValidator
+    from ._sort import SortValidator
+    from ._direction import DirectionValidator
+    from ._rotation import RotationValidator
+    from ._pull import PullValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._labelssrc import LabelssrcValidator
+    from ._valuessrc import ValuessrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._hovertextsrc import HovertextsrcValidator
+    from ._textpositionsrc import TextpositionsrcValidator
+    from ._pullsrc import PullsrcValidator
+    from ._transforms import TransformsValidator
+    from . import domain
+    from . import outsidetextfont
+    from . import insidetextfont
+    from . import textfont
+    from . import marker
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.domain',
+            '.outsidetextfont',
+            '.insidetextfont',
+            '.textfont',
+            '.marker',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._labels.LabelsValidator',
+            '._label0.Label0Validator',
+            '._dlabel.DlabelValidator',
+            '._values.ValuesValidator',
+            '._marker.MarkerValidator',
+            '._text.TextValidator',
+            '._hovertext.HovertextValidator',
+            '._scalegroup.ScalegroupValidator',
+            '._textinfo.TextinfoValidator',
+            '._textposition.TextpositionValidator',
+            '._textfont.TextfontValidator',
+            '._insidetextfont.InsidetextfontValidator',
+            '._outsidetextfont.OutsidetextfontValidator',
+            '._domain.DomainValidator',
+            '._hole.HoleValidator',
+            '._sort.SortValidator',
+            '._direction.DirectionValidator',
+            '._rotation.RotationValidator',
+            '._pull.PullValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._labelssrc.LabelssrcValidator',
+            '._valuessrc.ValuessrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._hovertextsrc.HovertextsrcValidator',
+            '._textpositionsrc.TextpositionsrcValidator',
+            '._pullsrc.PullsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class InsidetextfontValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='insidetextfont', parent_name='trace.pie'):
+        from ipyplotly.datatypes.trace.pie import Insidetextfont
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Insidetextfont)
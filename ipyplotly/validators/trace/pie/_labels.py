@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class LabelsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='labels', parent_name='trace.pie'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
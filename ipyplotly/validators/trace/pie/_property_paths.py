@@ -0,0 +1,78 @@
+# Property paths of trace.pie
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'labels': ('', 'LabelsValidator', 'simple'),
+    'label0': ('', 'Label0Validator', 'simple'),
+    'dlabel': ('', 'DlabelValidator', 'simple'),
+    'values': ('', 'ValuesValidator', 'simple'),
+    'marker': ('', 'MarkerValidator', 'compound'),
+    'marker.colors': ('.marker', 'ColorsValidator', 'simple'),
+    'marker.line': ('.marker', 'LineValidator', 'compound'),
+    'marker.line.color': ('.marker.line', 'ColorValidator', 'simple'),
+    'marker.line.width': ('.marker.line', 'WidthValidator', 'simple'),
+    'marker.line.colorsrc': ('.marker.line', 'ColorsrcValidator', 'simple'),
+    'marker.line.widthsrc': ('.marker.line', 'WidthsrcValidator', 'simple'),
+    'marker.colorssrc': ('.marker', 'ColorssrcValidator', 'simple'),
+    'text': ('', 'TextValidator', 'simple'),
+    'hovertext': ('', 'HovertextValidator', 'simple'),
+    'scalegroup': ('', 'ScalegroupValidator', 'simple'),
+    'textinfo': ('', 'TextinfoValidator', 'simple'),
+    'textposition': ('', 'TextpositionValidator', 'simple'),
+    'textfont': ('', 'TextfontValidator', 'compound'),
+    'textfont.family': ('.textfont', 'FamilyValidator', 'simple'),
+    'textfont.size': ('.textfont', 'SizeValidator', 'simple'),
+    'textfont.color': ('.textfont', 'ColorValidator', 'simple'),
+    'insidetextfont': ('', 'InsidetextfontValidator', 'compound'),
+    'insidetextfont.family': ('.insidetextfont', 'FamilyValidator', 'simple'),
+    'insidetextfont.size': ('.insidetextfont', 'SizeValidator', 'simple'),
+    'insidetextfont.color': ('.insidetextfont', 'ColorValidator', 'simple'),
+    'outsidetextfont': ('', 'OutsidetextfontValidator', 'compound'),
+    'outsidetextfont.family': ('.outsidetextfont', 'FamilyValidator', 'simple'),
+    'outsidetextfont.size': ('.outsidetextfont', 'SizeValidator', 'simple'),
+    'outsidetextfont.color': ('.outsidetextfont', 'ColorValidator', 'simple'),
+    'domain': ('', 'DomainValidator', 'compound'),
+    'domain.x': ('.domain', 'XValidator', 'simple'),
+    'domain.y': ('.domain', 'YValidator', 'simple'),
+    'hole': ('', 'HoleValidator', 'simple'),
+    'sort': ('', 'SortValidator', 'simple'),
+    'direction': ('', 'DirectionValidator', 'simple'),
+    'rotation': ('', 'RotationValidator', 'simple'),
+    'pull': ('', 'PullValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'labelssrc': ('', 'LabelssrcValidator', 'simple'),
+    'valuessrc': ('', 'ValuessrcValidator', 'simple'),
+    'textsrc': ('', 'TextsrcValidator', 'simple'),
+    'hovertextsrc': ('', 'HovertextsrcValidator', 'simple'),
+    'textpositionsrc': ('', 'TextpositionsrcValidator', 'simple'),
+    'pullsrc': ('', 'PullsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class RotationValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='rotation', parent_name='trace.pie'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=-360, max=360, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if -360 <= v <= 360:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
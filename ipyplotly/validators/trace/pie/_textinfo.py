@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class TextinfoValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='textinfo', parent_name='trace.pie'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            flags=['label', 'text', 'value', 'percent'],
+            extras=['none'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'label', 'none', 'percent', 'text', 'value'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,20 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._colors import ColorsValidator
+    from ._line import LineValidator
+    from ._colorssrc import ColorssrcValidator
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+        ],
+        [
+            '._colors.ColorsValidator',
+            '._line.LineValidator',
+            '._colorssrc.ColorssrcValidator',
+        ]
+    )
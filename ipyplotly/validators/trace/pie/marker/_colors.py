@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ColorsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='colors', parent_name='trace.pie.marker'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class MarkerValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='marker', parent_name='trace.pointcloud'):
+        from ipyplotly.datatypes.trace.pointcloud import Marker
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Marker)
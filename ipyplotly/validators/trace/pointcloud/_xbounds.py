@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class XboundsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='xbounds', parent_name='trace.pointcloud'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
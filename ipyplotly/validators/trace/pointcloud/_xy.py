@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class XyValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='xy', parent_name='trace.pointcloud'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
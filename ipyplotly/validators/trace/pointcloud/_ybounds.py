@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class YboundsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='ybounds', parent_name='trace.pointcloud'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,26 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._color import ColorValidator
+    from ._opacity import OpacityValidator
+    from ._blend import BlendValidator
+    from ._sizemin import SizeminValidator
+    from ._sizemax import SizemaxValidator
+    from ._border import BorderValidator
+    from . import border
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.border',
+        ],
+        [
+            '._color.ColorValidator',
+            '._opacity.OpacityValidator',
+            '._blend.BlendValidator',
+            '._sizemin.SizeminValidator',
+            '._sizemax.SizemaxValidator',
+            '._border.BorderValidator',
+        ]
+    )
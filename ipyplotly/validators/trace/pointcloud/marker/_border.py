@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class BorderValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='border', parent_name='trace.pointcloud.marker'):
+        from ipyplotly.datatypes.trace.pointcloud.marker import Border
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Border)
@@ -0,0 +1,72 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._domain import DomainValidator
+    from ._orientation import OrientationValidator
+    from ._valueformat import ValueformatValidator
+    from ._valuesuffix import ValuesuffixValidator
+    from ._arrangement import ArrangementValidator
+    from ._textfont import TextfontValidator
+    from ._node import NodeValidator
+    from ._link import LinkValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._transforms import TransformsValidator
+    from . import link
+    from . import node
+    from . import textfont
+    from . import domain
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.link',
+            '.node',
+            '.textfont',
+            '.domain',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._domain.DomainValidator',
+            '._orientation.OrientationValidator',
+            '._valueformat.ValueformatValidator',
+            '._valuesuffix.ValuesuffixValidator',
+            '._arrangement.ArrangementValidator',
+            '._textfont.TextfontValidator',
+            '._node.NodeValidator',
+            '._link.LinkValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
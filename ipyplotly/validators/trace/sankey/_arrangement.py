@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ArrangementValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='arrangement', parent_name='trace.sankey'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['snap', 'perpendicular', 'freeform', 'fixed'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'fixed', 'freeform', 'perpendicular', 'snap'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class DomainValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='domain', parent_name='trace.sankey'):
+        from ipyplotly.datatypes.trace.sankey import Domain
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Domain)
@@ -0,0 +1,74 @@
+# Property paths of trace.sankey
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'domain': ('', 'DomainValidator', 'compound'),
+    'domain.x': ('.domain', 'XValidator', 'simple'),
+    'domain.y': ('.domain', 'YValidator', 'simple'),
+    'orientation': ('', 'OrientationValidator', 'simple'),
+    'valueformat': ('', 'ValueformatValidator', 'simple'),
+    'valuesuffix': ('', 'ValuesuffixValidator', 'simple'),
+    'arrangement': ('', 'ArrangementValidator', 'simple'),
+    'textfont': ('', 'TextfontValidator', 'compound'),
+    'textfont.family': ('.textfont', 'FamilyValidator', 'simple'),
+    'textfont.size': ('.textfont', 'SizeValidator', 'simple'),
+    'textfont.color': ('.textfont', 'ColorValidator', 'simple'),
+    'node': ('', 'NodeValidator', 'compound'),
+    'node.label': ('.node', 'LabelValidator', 'simple'),
+    'node.color': ('.node', 'ColorValidator', 'simple'),
+    'node.line': ('.node', 'LineValidator', 'compound'),
+    'node.line.color': ('.node.line', 'ColorValidator', 'simple'),
+    'node.line.width': ('.node.line', 'WidthValidator', 'simple'),
+    'node.line.colorsrc': ('.node.line', 'ColorsrcValidator', 'simple'),
+    'node.line.widthsrc': ('.node.line', 'WidthsrcValidator', 'simple'),
+    'node.pad': ('.node', 'PadValidator', 'simple'),
+    'node.thickness': ('.node', 'ThicknessValidator', 'simple'),
+    'node.labelsrc': ('.node', 'LabelsrcValidator', 'simple'),
+    'node.colorsrc': ('.node', 'ColorsrcValidator', 'simple'),
+    'link': ('', 'LinkValidator', 'compound'),
+    'link.label': ('.link', 'LabelValidator', 'simple'),
+    'link.color': ('.link', 'ColorValidator', 'simple'),
+    'link.line': ('.link', 'LineValidator', 'compound'),
+    'link.line.color': ('.link.line', 'ColorValidator', 'simple'),
+    'link.line.width': ('.link.line', 'WidthValidator', 'simple'),
+    'link.line.colorsrc': ('.link.line', 'ColorsrcValidator', 'simple'),
+    'link.line.widthsrc': ('.link.line', 'WidthsrcValidator', 'simple'),
+    'link.source': ('.link', 'SourceValidator', 'simple'),
+    'link.target': ('.link', 'TargetValidator', 'simple'),
+    'link.value': ('.link', 'ValueValidator', 'simple'),
+    'link.labelsrc': ('.link', 'LabelsrcValidator', 'simple'),
+    'link.colorsrc': ('.link', 'ColorsrcValidator', 'simple'),
+    'link.sourcesrc': ('.link', 'SourcesrcValidator', 'simple'),
+    'link.targetsrc': ('.link', 'TargetsrcValidator', 'simple'),
+    'link.valuesrc': ('.link', 'ValuesrcValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
@@ -0,0 +1,36 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._label import LabelValidator
+    from ._color import ColorValidator
+    from ._line import LineValidator
+    from ._source import SourceValidator
+    from ._target import TargetValidator
+    from ._value import ValueValidator
+    from ._labelsrc import LabelsrcValidator
+    from ._colorsrc import ColorsrcValidator
+    from ._sourcesrc import SourcesrcValidator
+    from ._targetsrc import TargetsrcValidator
+    from ._valuesrc import ValuesrcValidator
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+        ],
+        [
+            '._label.LabelValidator',
+            '._color.ColorValidator',
+            '._line.LineValidator',
+            '._source.SourceValidator',
+            '._target.TargetValidator',
+            '._value.ValueValidator',
+            '._labelsrc.LabelsrcValidator',
+            '._colorsrc.ColorsrcValidator',
+            '._sourcesrc.SourcesrcValidator',
+            '._targetsrc.TargetsrcValidator',
+            '._valuesrc.ValuesrcValidator',
+        ]
+    )
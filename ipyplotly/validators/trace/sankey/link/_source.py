@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class SourceValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='source', parent_name='trace.sankey.link'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ValueValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='value', parent_name='trace.sankey.link'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._label import LabelValidator
+    from ._color import ColorValidator
+    from ._line import LineValidator
+    from ._pad import PadValidator
+    from ._thickness import ThicknessValidator
+    from ._labelsrc import LabelsrcValidator
+    from ._colorsrc import ColorsrcValidator
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+        ],
+        [
+            '._label.LabelValidator',
+            '._color.ColorValidator',
+            '._line.LineValidator',
+            '._pad.PadValidator',
+            '._thickness.ThicknessValidator',
+            '._labelsrc.LabelsrcValidator',
+            '._colorsrc.ColorsrcValidator',
+        ]
+    )
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class LabelValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='label', parent_name='trace.sankey.node'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
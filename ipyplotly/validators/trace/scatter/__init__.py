@@ -0,0 +1,132 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._x import XValidator
+    from ._x0 import X0Validator
+    from ._dx import DxValidator
+    from ._y import YValidator
+    from ._y0 import Y0Validator
+    from ._dy import DyValidator
+    from ._text import TextValidator
+    from ._hovertext import HovertextValidator
+    from ._mode import ModeValidator
+    from ._hoveron import HoveronValidator
+    from ._line import LineValidator
+    from ._connectgaps import ConnectgapsValidator
+    from ._cliponaxis import CliponaxisValidator
+    from ._fill import FillValidator
+    from ._fillcolor import FillcolorValidator
+    from ._marker import MarkerValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._textposition import TextpositionValidator
+    from ._textfont import TextfontValidator
+    from ._r import RValidator
+    from ._t import TValidator
+    from ._error_y import ErrorYValidator
+    from ._error_x import ErrorXValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._hovertextsrc import HovertextsrcValidator
+    from ._textpositionsrc import TextpositionsrcValidator
+    from ._rsrc import RsrcValidator
+    from ._tsrc import TsrcValidator
+    from ._transforms import TransformsValidator
+    from . import error_x
+    from . import error_y
+    from . import textfont
+    from . import unselected
+    from . import selected
+    from . import marker
+    from . import line
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.error_x',
+            '.error_y',
+            '.textfont',
+            '.unselected',
+            '.selected',
+            '.marker',
+            '.line',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._x.XValidator',
+            '._x0.X0Validator',
+            '._dx.DxValidator',
+            '._y.YValidator',
+            '._y0.Y0Validator',
+            '._dy.DyValidator',
+            '._text.TextValidator',
+            '._hovertext.HovertextValidator',
+            '._mode.ModeValidator',
+            '._hoveron.HoveronValidator',
+            '._line.LineValidator',
+            '._connectgaps.ConnectgapsValidator',
+            '._cliponaxis.CliponaxisValidator',
+            '._fill.FillValidator',
+            '._fillcolor.FillcolorValidator',
+            '._marker.MarkerValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._textposition.TextpositionValidator',
+            '._textfont.TextfontValidator',
+            '._r.RValidator',
+            '._t.TValidator',
+            '._error_y.ErrorYValidator',
+            '._error_x.ErrorXValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._hovertextsrc.HovertextsrcValidator',
+            '._textpositionsrc.TextpositionsrcValidator',
+            '._rsrc.RsrcValidator',
+            '._tsrc.TsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
@@ -0,0 +1,14 @@
+import ipyplotly.basevalidators
+
+
+class DxValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='dx', parent_name='trace.scatter'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
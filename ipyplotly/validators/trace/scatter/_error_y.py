@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ErrorYValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='error_y', parent_name='trace.scatter'):
+        from ipyplotly.datatypes.trace.scatter import ErrorY
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=ErrorY)
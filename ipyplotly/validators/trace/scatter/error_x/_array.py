@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ArrayValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='array', parent_name='trace.scatter.error_x'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,23 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._color import ColorValidator
+    from ._width import WidthValidator
+    from ._shape import ShapeValidator
+    from ._smoothing import SmoothingValidator
+    from ._dash import DashValidator
+    from ._simplify import SimplifyValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._color.ColorValidator',
+            '._width.WidthValidator',
+            '._shape.ShapeValidator',
+            '._smoothing.SmoothingValidator',
+            '._dash.DashValidator',
+            '._simplify.SimplifyValidator',
+        ]
+    )
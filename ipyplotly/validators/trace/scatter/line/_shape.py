@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class ShapeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='shape', parent_name='trace.scatter.line'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['linear', 'spline', 'hv', 'vh', 'hvh', 'vhv'],
+            edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'hv', 'hvh', 'linear', 'spline', 'vh', 'vhv'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
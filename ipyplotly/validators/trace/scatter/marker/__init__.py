@@ -0,0 +1,62 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._symbol import SymbolValidator
+    from ._opacity import OpacityValidator
+    from ._size import SizeValidator
+    from ._maxdisplayed import MaxdisplayedValidator
+    from ._sizeref import SizerefValidator
+    from ._sizemin import SizeminValidator
+    from ._sizemode import SizemodeValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._line import LineValidator
+    from ._gradient import GradientValidator
+    from ._color import ColorValidator
+    from ._colorscale import ColorscaleValidator
+    from ._cauto import CautoValidator
+    from ._cmax import CmaxValidator
+    from ._cmin import CminValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._symbolsrc import SymbolsrcValidator
+    from ._opacitysrc import OpacitysrcValidator
+    from ._sizesrc import SizesrcValidator
+    from ._colorsrc import ColorsrcValidator
+    from . import gradient
+    from . import line
+    from . import colorbar
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.gradient',
+            '.line',
+            '.colorbar',
+        ],
+        [
+            '._symbol.SymbolValidator',
+            '._opacity.OpacityValidator',
+            '._size.SizeValidator',
+            '._maxdisplayed.MaxdisplayedValidator',
+            '._sizeref.SizerefValidator',
+            '._sizemin.SizeminValidator',
+            '._sizemode.SizemodeValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._line.LineValidator',
+            '._gradient.GradientValidator',
+            '._color.ColorValidator',
+            '._colorscale.ColorscaleValidator',
+            '._cauto.CautoValidator',
+            '._cmax.CmaxValidator',
+            '._cmin.CminValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._symbolsrc.SymbolsrcValidator',
+            '._opacitysrc.OpacitysrcValidator',
+            '._sizesrc.SizesrcValidator',
+            '._colorsrc.ColorsrcValidator',
+        ]
+    )
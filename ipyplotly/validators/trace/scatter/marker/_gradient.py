@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class GradientValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='gradient', parent_name='trace.scatter.marker'):
+        from ipyplotly.datatypes.trace.scatter.marker import Gradient
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Gradient)
@@ -0,0 +1,87 @@
+import ipyplotly.basevalidators
+
+
+class SymbolValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='symbol', parent_name='trace.scatter.marker'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[
+                0, 'circle', 100, 'circle-open', 200, 'circle-dot', 300, 'circle-open-dot', 1, 'square', 101,
+                'square-open', 201, 'square-dot', 301, 'square-open-dot', 2, 'diamond', 102, 'diamond-open', 202,
+                'diamond-dot', 302, 'diamond-open-dot', 3, 'cross', 103, 'cross-open', 203, 'cross-dot', 303,
+                'cross-open-dot', 4, 'x', 104, 'x-open', 204, 'x-dot', 304, 'x-open-dot', 5, 'triangle-up', 105,
+                'triangle-up-open', 205, 'triangle-up-dot', 305, 'triangle-up-open-dot', 6, 'triangle-down', 106,
+                'triangle-down-open', 206, 'triangle-down-dot', 306, 'triangle-down-open-dot', 7, 'triangle-left', 107,
+                'triangle-left-open', 207, 'triangle-left-dot', 307, 'triangle-left-open-dot', 8, 'triangle-right',
+                108, 'triangle-right-open', 208, 'triangle-right-dot', 308, 'triangle-right-open-dot', 9,
+                'triangle-ne', 109, 'triangle-ne-open', 209, 'triangle-ne-dot', 309, 'triangle-ne-open-dot', 10,
+                'triangle-se', 110, 'triangle-se-open', 210, 'triangle-se-dot', 310, 'triangle-se-open-dot', 11,
+                'triangle-sw', 111, 'triangle-sw-open', 211, 'triangle-sw-dot', 311, 'triangle-sw-open-dot', 12,
+                'triangle-nw', 112, 'triangle-nw-open', 212, 'triangle-nw-dot', 312, 'triangle-nw-open-dot', 13,
+                'pentagon', 113, 'pentagon-open', 213, 'pentagon-dot', 313, 'pentagon-open-dot', 14, 'hexagon', 114,
+                'hexagon-open', 214, 'hexagon-dot', 314, 'hexagon-open-dot', 15, 'hexagon2', 115, 'hexagon2-open', 215,
+                'hexagon2-dot', 315, 'hexagon2-open-dot', 16, 'octagon', 116, 'octagon-open', 216, 'octagon-dot', 316,
+                'octagon-open-dot', 17, 'star', 117, 'star-open', 217, 'star-dot', 317, 'star-open-dot', 18,
+                'hexagram', 118, 'hexagram-open', 218, 'hexagram-dot', 318, 'hexagram-open-dot', 19,
+                'star-triangle-up', 119, 'star-triangle-up-open', 219, 'star-triangle-up-dot', 319,
+                'star-triangle-up-open-dot', 20, 'star-triangle-down', 120, 'star-triangle-down-open', 220,
+                'star-triangle-down-dot', 320, 'star-triangle-down-open-dot', 21, 'star-square', 121,
+                'star-square-open', 221, 'star-square-dot', 321, 'star-square-open-dot', 22, 'star-diamond', 122,
+                'star-diamond-open', 222, 'star-diamond-dot', 322, 'star-diamond-open-dot', 23, 'diamond-tall', 123,
+                'diamond-tall-open', 223, 'diamond-tall-dot', 323, 'diamond-tall-open-dot', 24, 'diamond-wide', 124,
+                'diamond-wide-open', 224, 'diamond-wide-dot', 324, 'diamond-wide-open-dot', 25, 'hourglass', 125,
+                'hourglass-open', 26, 'bowtie', 126, 'bowtie-open', 27, 'circle-cross', 127, 'circle-cross-open', 28,
+                'circle-x', 128, 'circle-x-open', 29, 'square-cross', 129, 'square-cross-open', 30, 'square-x', 130,
+                'square-x-open', 31, 'diamond-cross', 131, 'diamond-cross-open', 32, 'diamond-x', 132,
+                'diamond-x-open', 33, 'cross-thin', 133, 'cross-thin-open', 34, 'x-thin', 134, 'x-thin-open', 35,
+                'asterisk', 135, 'asterisk-open', 36, 'hash', 136, 'hash-open', 236, 'hash-dot', 336, 'hash-open-dot',
+                37, 'y-up', 137, 'y-up-open', 38, 'y-down', 138, 'y-down-open', 39, 'y-left', 139, 'y-left-open', 40,
+                'y-right', 140, 'y-right-open', 41, 'line-ew', 141, 'line-ew-open', 42, 'line-ns', 142, 'line-ns-open',
+                43, 'line-ne', 143, 'line-ne-open', 44, 'line-nw', 144, 'line-nw-open'
+            ],
+            array_ok=True,
+            edit_type='style'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {
+                'asterisk', 'asterisk-open', 'bowtie', 'bowtie-open', 'circle', 'circle-cross', 'circle-cross-open',
+                'circle-dot', 'circle-open', 'circle-open-dot', 'circle-x', 'circle-x-open', 'cross', 'cross-dot',
+                'cross-open', 'cross-open-dot', 'cross-thin', 'cross-thin-open', 'diamond', 'diamond-cross',
+                'diamond-cross-open', 'diamond-dot', 'diamond-open', 'diamond-open-dot', 'diamond-tall',
+                'diamond-tall-dot', 'diamond-tall-open', 'diamond-tall-open-dot', 'diamond-wide', 'diamond-wide-dot',
+                'diamond-wide-open', 'diamond-wide-open-dot', 'diamond-x', 'diamond-x-open', 'hash', 'hash-dot',
+                'hash-open', 'hash-open-dot', 'hexagon', 'hexagon-dot', 'hexagon-open', 'hexagon-open-dot', 'hexagon2',
+                'hexagon2-dot', 'hexagon2-open', 'hexagon2-open-dot', 'hexagram', 'hexagram-dot', 'hexagram-open',
+                'hexagram-open-dot', 'hourglass', 'hourglass-open', 'line-ew', 'line-ew-open', 'line-ne',
+                'line-ne-open', 'line-ns', 'line-ns-open', 'line-nw', 'line-nw-open', 'octagon', 'octagon-dot',
+                'octagon-open', 'octagon-open-dot', 'pentagon', 'pentagon-dot', 'pentagon-open', 'pentagon-open-dot',
+                'square', 'square-cross', 'square-cross-open', 'square-dot', 'square-open', 'square-open-dot',
+                'square-x', 'square-x-open', 'star', 'star-diamond', 'star-diamond-dot', 'star-diamond-open',
+                'star-diamond-open-dot', 'star-dot', 'star-open', 'star-open-dot', 'star-square', 'star-square-dot',
+                'star-square-open', 'star-square-open-dot', 'star-triangle-down', 'star-triangle-down-dot',
+                'star-triangle-down-open', 'star-triangle-down-open-dot', 'star-triangle-up', 'star-triangle-up-dot',
+                'star-triangle-up-open', 'star-triangle-up-open-dot', 'triangle-down', 'triangle-down-dot',
+                'triangle-down-open', 'triangle-down-open-dot', 'triangle-left', 'triangle-left-dot',
+                'triangle-left-open', 'triangle-left-open-dot', 'triangle-ne', 'triangle-ne-dot', 'triangle-ne-open',
+                'triangle-ne-open-dot', 'triangle-nw', 'triangle-nw-dot', 'triangle-nw-open', 'triangle-nw-open-dot',
+                'triangle-right', 'triangle-right-dot', 'triangle-right-open', 'triangle-right-open-dot',
+                'triangle-se', 'triangle-se-dot', 'triangle-se-open', 'triangle-se-open-dot', 'triangle-sw',
+                'triangle-sw-dot', 'triangle-sw-open', 'triangle-sw-open-dot', 'triangle-up', 'triangle-up-dot',
+                'triangle-up-open', 'triangle-up-open-dot', 'x', 'x-dot', 'x-open', 'x-open-dot', 'x-thin',
+                'x-thin-open', 'y-down', 'y-down-open', 'y-left', 'y-left-open', 'y-right', 'y-right-open', 'y-up',
+                'y-up-open', 0, 1, 10, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 11, 110, 111, 112, 113, 114,
+                115, 116, 117, 118, 119, 12, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 13, 130, 131, 132, 133,
+                134, 135, 136, 137, 138, 139, 14, 140, 141, 142, 143, 144, 15, 16, 17, 18, 19, 2, 20, 200, 201, 202,
+                203, 204, 205, 206, 207, 208, 209, 21, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 22, 220, 221,
+                222, 223, 224, 23, 236, 24, 25, 26, 27, 28, 29, 3, 30, 300, 301, 302, 303, 304, 305, 306, 307, 308,
+                309, 31, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 32, 320, 321, 322, 323, 324, 33, 336, 34,
+                35, 36, 37, 38, 39, 4, 40, 41, 42, 43, 44, 5, 6, 7, 8, 9
+            }:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
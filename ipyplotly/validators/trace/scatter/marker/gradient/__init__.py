@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._type import TypeValidator
+    from ._color import ColorValidator
+    from ._typesrc import TypesrcValidator
+    from ._colorsrc import ColorsrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._type.TypeValidator',
+            '._color.ColorValidator',
+            '._typesrc.TypesrcValidator',
+            '._colorsrc.ColorsrcValidator',
+        ]
+    )
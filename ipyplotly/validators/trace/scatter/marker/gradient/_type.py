@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class TypeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='type', parent_name='trace.scatter.marker.gradient'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['radial', 'horizontal', 'vertical', 'none'],
+            array_ok=True,
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'horizontal', 'none', 'radial', 'vertical'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
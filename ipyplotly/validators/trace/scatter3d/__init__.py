@@ -0,0 +1,116 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._z import ZValidator
+    from ._text import TextValidator
+    from ._hovertext import HovertextValidator
+    from ._mode import ModeValidator
+    from ._surfaceaxis import SurfaceaxisValidator
+    from ._surfacecolor import SurfacecolorValidator
+    from ._projection import ProjectionValidator
+    from ._connectgaps import ConnectgapsValidator
+    from ._line import LineValidator
+    from ._marker import MarkerValidator
+    from ._textposition import TextpositionValidator
+    from ._textfont import TextfontValidator
+    from ._error_x import ErrorXValidator
+    from ._error_y import ErrorYValidator
+    from ._error_z import ErrorZValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._zcalendar import ZcalendarValidator
+    from ._scene import SceneValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._zsrc import ZsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._hovertextsrc import HovertextsrcValidator
+    from ._textpositionsrc import TextpositionsrcValidator
+    from ._transforms import TransformsValidator
+    from . import error_z
+    from . import error_y
+    from . import error_x
+    from . import textfont
+    from . import marker
+    from . import line
+    from . import projection
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.error_z',
+            '.error_y',
+            '.error_x',
+            '.textfont',
+            '.marker',
+            '.line',
+            '.projection',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._x.XValidator',
+            '._y.YValidator',
+            '._z.ZValidator',
+            '._text.TextValidator',
+            '._hovertext.HovertextValidator',
+            '._mode.ModeValidator',
+            '._surfaceaxis.SurfaceaxisValidator',
+            '._surfacecolor.SurfacecolorValidator',
+            '._projection.ProjectionValidator',
+            '._connectgaps.ConnectgapsValidator',
+            '._line.LineValidator',
+            '._marker.MarkerValidator',
+            '._textposition.TextpositionValidator',
+            '._textfont.TextfontValidator',
+            '._error_x.ErrorXValidator',
+            '._error_y.ErrorYValidator',
+            '._error_z.ErrorZValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._zcalendar.ZcalendarValidator',
+            '._scene.SceneValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._zsrc.ZsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._hovertextsrc.HovertextsrcValidator',
+            '._textpositionsrc.TextpositionsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
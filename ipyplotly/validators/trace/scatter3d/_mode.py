@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class ModeValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='mode', parent_name='trace.scatter3d'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            flags=['lines', 'markers', 'text'],
+            extras=['none'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'lines', 'markers', 'none', 'text'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ProjectionValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='projection', parent_name='trace.scatter3d'):
+        from ipyplotly.datatypes.trace.scatter3d import Projection
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Projection)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class SurfaceaxisValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='surfaceaxis', parent_name='trace.scatter3d'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, values=[-1, 0, 1, 2], edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {-1, 0, 1, 2}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class SymbolValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='symbol', parent_name='trace.scatter3d.marker'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['circle', 'circle-open', 'square', 'square-open', 'diamond', 'diamond-open', 'cross', 'x'],
+            array_ok=True,
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'circle', 'circle-open', 'cross', 'diamond', 'diamond-open', 'square', 'square-open', 'x'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class YValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='y', parent_name='trace.scatter3d.projection'):
+        from ipyplotly.datatypes.trace.scatter3d.projection import Y
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Y)
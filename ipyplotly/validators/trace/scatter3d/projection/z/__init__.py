@@ -0,0 +1,17 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._show import ShowValidator
+    from ._opacity import OpacityValidator
+    from ._scale import ScaleValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._show.ShowValidator',
+            '._opacity.OpacityValidator',
+            '._scale.ScaleValidator',
+        ]
+    )
@@ -0,0 +1,27 @@
+import ipyplotly.basevalidators
+
+
+class TextpositionValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='textposition', parent_name='trace.scattercarpet'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[
+                'top left', 'top center', 'top right', 'middle left', 'middle center', 'middle right', 'bottom left',
+                'bottom center', 'bottom right'
+            ],
+            array_ok=True,
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {
+                'bottom center', 'bottom left', 'bottom right', 'middle center', 'middle left', 'middle right',
+                'top center', 'top left', 'top right'
+            }:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
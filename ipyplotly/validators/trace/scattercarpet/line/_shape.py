@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class ShapeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='shape', parent_name='trace.scattercarpet.line'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['linear', 'spline'], edit_type='plot'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'linear', 'spline'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class SizemodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='sizemode', parent_name='trace.scattercarpet.marker'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['diameter', 'area'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'area', 'diameter'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,104 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._lon import LonValidator
+    from ._lat import LatValidator
+    from ._locations import LocationsValidator
+    from ._locationmode import LocationmodeValidator
+    from ._mode import ModeValidator
+    from ._text import TextValidator
+    from ._hovertext import HovertextValidator
+    from ._textfont import TextfontValidator
+    from ._textposition import TextpositionValidator
+    from ._line import LineValidator
+    from ._connectgaps import ConnectgapsValidator
+    from ._marker import MarkerValidator
+    from ._fill import FillValidator
+    from ._fillcolor import FillcolorValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._geo import GeoValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._lonsrc import LonsrcValidator
+    from ._latsrc import LatsrcValidator
+    from ._locationssrc import LocationssrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._hovertextsrc import HovertextsrcValidator
+    from ._textpositionsrc import TextpositionsrcValidator
+    from ._transforms import TransformsValidator
+    from . import unselected
+    from . import selected
+    from . import marker
+    from . import line
+    from . import textfont
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.unselected',
+            '.selected',
+            '.marker',
+            '.line',
+            '.textfont',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._lon.LonValidator',
+            '._lat.LatValidator',
+            '._locations.LocationsValidator',
+            '._locationmode.LocationmodeValidator',
+            '._mode.ModeValidator',
+            '._text.TextValidator',
+            '._hovertext.HovertextValidator',
+            '._textfont.TextfontValidator',
+            '._textposition.TextpositionValidator',
+            '._line.LineValidator',
+            '._connectgaps.ConnectgapsValidator',
+            '._marker.MarkerValidator',
+            '._fill.FillValidator',
+            '._fillcolor.FillcolorValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._geo.GeoValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._lonsrc.LonsrcValidator',
+            '._latsrc.LatsrcValidator',
+            '._locationssrc.LocationssrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._hovertextsrc.HovertextsrcValidator',
+            '._textpositionsrc.TextpositionsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
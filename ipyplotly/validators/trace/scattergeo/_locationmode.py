@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class LocationmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='locationmode', parent_name='trace.scattergeo'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['ISO-3', 'USA-states', 'country names'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'ISO-3', 'USA-states', 'country names'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
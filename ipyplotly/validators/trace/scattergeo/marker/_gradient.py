@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class GradientValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='gradient', parent_name='trace.scattergeo.marker'):
+        from ipyplotly.datatypes.trace.scattergeo.marker import Gradient
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Gradient)
@@ -0,0 +1,102 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._thicknessmode import ThicknessmodeValidator
+    from ._thickness import ThicknessValidator
+    from ._lenmode import LenmodeValidator
+    from ._len import LenValidator
+    from ._x import XValidator
+    from ._xanchor import XanchorValidator
+    from ._xpad import XpadValidator
+    from ._y import YValidator
+    from ._yanchor import YanchorValidator
+    from ._ypad import YpadValidator
+    from ._outlinecolor import OutlinecolorValidator
+    from ._outlinewidth import OutlinewidthValidator
+    from ._bordercolor import BordercolorValidator
+    from ._borderwidth import BorderwidthValidator
+    from ._bgcolor import BgcolorValidator
+    from ._tickmode import TickmodeValidator
+    from ._nticks import NticksValidator
+    from ._tick0 import Tick0Validator
+    from ._dtick import DtickValidator
+    from ._tickvals import TickvalsValidator
+    from ._ticktext import TicktextValidator
+    from ._ticks import TicksValidator
+    from ._ticklen import TicklenValidator
+    from ._tickwidth import TickwidthValidator
+    from ._tickcolor import TickcolorValidator
+    from ._showticklabels import ShowticklabelsValidator
+    from ._tickfont import TickfontValidator
+    from ._tickangle import TickangleValidator
+    from ._tickformat import TickformatValidator
+    from ._tickformatstops import TickformatstopsValidator
+    from ._tickprefix import TickprefixValidator
+    from ._showtickprefix import ShowtickprefixValidator
+    from ._ticksuffix import TicksuffixValidator
+    from ._showticksuffix import ShowticksuffixValidator
+    from ._separatethousands import SeparatethousandsValidator
+    from ._exponentformat import ExponentformatValidator
+    from ._showexponent import ShowexponentValidator
+    from ._title import TitleValidator
+    from ._titlefont import TitlefontValidator
+    from ._titleside import TitlesideValidator
+    from ._tickvalssrc import TickvalssrcValidator
+    from ._ticktextsrc import TicktextsrcValidator
+    from . import titlefont
+    from . import tickformatstop
+    from . import tickfont
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.titlefont',
+            '.tickformatstop',
+            '.tickfont',
+        ],
+        [
+            '._thicknessmode.ThicknessmodeValidator',
+            '._thickness.ThicknessValidator',
+            '._lenmode.LenmodeValidator',
+            '._len.LenValidator',
+            '._x.XValidator',
+            '._xanchor.XanchorValidator',
+            '._xpad.XpadValidator',
+            '._y.YValidator',
+            '._yanchor.YanchorValidator',
+            '._ypad.YpadValidator',
+            '._outlinecolor.OutlinecolorValidator',
+            '._outlinewidth.OutlinewidthValidator',
+            '._bordercolor.BordercolorValidator',
+            '._borderwidth.BorderwidthValidator',
+            '._bgcolor.BgcolorValidator',
+            '._tickmode.TickmodeValidator',
+            '._nticks.NticksValidator',
+            '._tick0.Tick0Validator',
+            '._dtick.DtickValidator',
+            '._tickvals.TickvalsValidator',
+            '._ticktext.TicktextValidator',
+            '._ticks.TicksValidator',
+            '._ticklen.TicklenValidator',
+            '._tickwidth.TickwidthValidator',
+            '._tickcolor.TickcolorValidator',
+            '._showticklabels.ShowticklabelsValidator',
+            '._tickfont.TickfontValidator',
+            '._tickangle.TickangleValidator',
+            '._tickformat.TickformatValidator',
+            '._tickformatstops.TickformatstopsValidator',
+            '._tickprefix.TickprefixValidator',
+            '._showtickprefix.ShowtickprefixValidator',
+            '._ticksuffix.TicksuffixValidator',
+            '._showticksuffix.ShowticksuffixValidator',
+            '._separatethousands.SeparatethousandsValidator',
+            '._exponentformat.ExponentformatValidator',
+            '._showexponent.ShowexponentValidator',
+            '._title.TitleValidator',
+            '._titlefont.TitlefontValidator',
+            '._titleside.TitlesideValidator',
+            '._tickvalssrc.TickvalssrcValidator',
+            '._ticktextsrc.TicktextsrcValidator',
+        ]
+    )
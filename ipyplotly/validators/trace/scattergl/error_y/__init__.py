@@ -0,0 +1,43 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._type import TypeValidator
+    from ._symmetric import SymmetricValidator
+    from ._array import ArrayValidator
+    from ._arrayminus import ArrayminusValidator
+    from ._value import ValueValidator
+    from ._valueminus import ValueminusValidator
+    from ._traceref import TracerefValidator
+    from ._tracerefminus import TracerefminusValidator
+    from ._copy_ystyle import CopyYstyleValidator
+    from ._copy_zstyle import CopyZstyleValidator
+    from ._color import ColorValidator
+    from ._thickness import ThicknessValidator
+    from ._width import WidthValidator
+    from ._arraysrc import ArraysrcValidator
+    from ._arrayminussrc import ArrayminussrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._visible.VisibleValidator',
+            '._type.TypeValidator',
+            '._symmetric.SymmetricValidator',
+            '._array.ArrayValidator',
+            '._arrayminus.ArrayminusValidator',
+            '._value.ValueValidator',
+            '._valueminus.ValueminusValidator',
+            '._traceref.TracerefValidator',
+            '._tracerefminus.TracerefminusValidator',
+            '._copy_ystyle.CopyYstyleValidator',
+            '._copy_zstyle.CopyZstyleValidator',
+            '._color.ColorValidator',
+            '._thickness.ThicknessValidator',
+            '._width.WidthValidator',
+            '._arraysrc.ArraysrcValidator',
+            '._arrayminussrc.ArrayminussrcValidator',
+        ]
+    )
@@ -0,0 +1,41 @@
+import ipyplotly.basevalidators
+
+
+class SymbolValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='symbol', parent_name='trace.scattergl.marker'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=[
+                'circle', 'square', 'diamond', 'cross', 'x', 'triangle-up', 'triangle-down', 'triangle-left',
+                'triangle-right', 'triangle-ne', 'triangle-nw', 'triangle-se', 'triangle-sw', 'pentagon', 'hexagon',
+                'hexagon2', 'star', 'diamond-tall', 'bowtie', 'diamond-x', 'cross-thin', 'asterisk', 'y-up', 'y-down',
+                'line-ew', 'line-ns', 'circle-open', 'square-open', 'diamond-open', 'cross-open', 'x-open',
+                'triangle-up-open', 'triangle-down-open', 'triangle-left-open', 'triangle-right-open',
+                'triangle-ne-open', 'triangle-nw-open', 'triangle-se-open', 'triangle-sw-open', 'pentagon-open',
+                'hexagon-open', 'hexagon2-open', 'star-open', 'diamond-tall-open', 'bowtie-open', 'diamond-x-open',
+                'cross-thin-open', 'asterisk-open', 'y-up-open', 'y-down-open', 'line-ew-open', 'line-ns-open',
+                'circle-cross-open', 'circle-x-open', 'square-cross-open', 'square-x-open'
+            ],
+            array_ok=True,
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {
+                'asterisk', 'asterisk-open', 'bowtie', 'bowtie-open', 'circle', 'circle-cross-open', 'circle-open',
+                'circle-x-open', 'cross', 'cross-open', 'cross-thin', 'cross-thin-open', 'diamond', 'diamond-open',
+                'diamond-tall', 'diamond-tall-open', 'diamond-x', 'diamond-x-open', 'hexagon', 'hexagon-open',
+                'hexagon2', 'hexagon2-open', 'line-ew', 'line-ew-open', 'line-ns', 'line-ns-open', 'pentagon',
+                'pentagon-open', 'square', 'square-cross-open', 'square-open', 'square-x-open', 'star', 'star-open',
+                'triangle-down', 'triangle-down-open', 'triangle-left', 'triangle-left-open', 'triangle-ne',
+                'triangle-ne-open', 'triangle-nw', 'triangle-nw-open', 'triangle-right', 'triangle-right-open',
+                'triangle-se', 'triangle-se-open', 'triangle-sw', 'triangle-sw-open', 'triangle-up',
+                'triangle-up-open', 'x', 'x-open', 'y-down', 'y-down-open', 'y-up', 'y-up-open'
+            }:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class FillValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='fill', parent_name='trace.scattermapbox'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, values=['none', 'toself'], edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'none', 'toself'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
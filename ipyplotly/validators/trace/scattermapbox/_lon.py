@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class LonValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='lon', parent_name='trace.scattermapbox'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,108 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._a import AValidator
+    from ._b import BValidator
+    from ._c import CValidator
+    from ._sum import SumValidator
+    from ._mode import ModeValidator
+    from ._text import TextValidator
+    from ._hovertext import HovertextValidator
+    from ._line import LineValidator
+    from ._connectgaps import ConnectgapsValidator
+    from ._cliponaxis import CliponaxisValidator
+    from ._fill import FillValidator
+    from ._fillcolor import FillcolorValidator
+    from ._marker import MarkerValidator
+    from ._textfont import TextfontValidator
+    from ._textposition import TextpositionValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._hoveron import HoveronValidator
+    from ._subplot import SubplotValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._asrc import AsrcValidator
+    from ._bsrc import BsrcValidator
+    from ._csrc import CsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._hovertextsrc import HovertextsrcValidator
+    from ._textpositionsrc import TextpositionsrcValidator
+    from ._transforms import TransformsValidator
+    from . import unselected
+    from . import selected
+    from . import textfont
+    from . import marker
+    from . import line
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.unselected',
+            '.selected',
+            '.textfont',
+            '.marker',
+            '.line',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._a.AValidator',
+            '._b.BValidator',
+            '._c.CValidator',
+            '._sum.SumValidator',
+            '._mode.ModeValidator',
+            '._text.TextValidator',
+            '._hovertext.HovertextValidator',
+            '._line.LineValidator',
+            '._connectgaps.ConnectgapsValidator',
+            '._cliponaxis.CliponaxisValidator',
+            '._fill.FillValidator',
+            '._fillcolor.FillcolorValidator',
+            '._marker.MarkerValidator',
+            '._textfont.TextfontValidator',
+            '._textposition.TextpositionValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._hoveron.HoveronValidator',
+            '._subplot.SubplotValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._asrc.AsrcValidator',
+            '._bsrc.BsrcValidator',
+            '._csrc.CsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._hovertextsrc.HovertextsrcValidator',
+            '._textpositionsrc.TextpositionsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
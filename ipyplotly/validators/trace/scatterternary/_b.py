@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class BValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='b', parent_name='trace.scatterternary'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
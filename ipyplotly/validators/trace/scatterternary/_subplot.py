@@ -0,0 +1,12 @@
+import ipyplotly.basevalidators
+
+
+class SubplotValidator(ipyplotly.basevalidators.SubplotidValidator):
+
+    def __init__(self, plotly_name='subplot', parent_name='trace.scatterternary'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, dflt='ternary', edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v is None or (v.__class__ is str and v == 'ternary'):
+            return 'ternary'
+        return super().validate_coerce(v)
@@ -0,0 +1,20 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._marker import MarkerValidator
+    from ._textfont import TextfontValidator
+    from . import textfont
+    from . import marker
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.textfont',
+            '.marker',
+        ],
+        [
+            '._marker.MarkerValidator',
+            '._textfont.TextfontValidator',
+        ]
+    )
@@ -0,0 +1,108 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._z import ZValidator
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._text import TextValidator
+    from ._surfacecolor import SurfacecolorValidator
+    from ._cauto import CautoValidator
+    from ._cmin import CminValidator
+    from ._cmax import CmaxValidator
+    from ._colorscale import ColorscaleValidator
+    from ._autocolorscale import AutocolorscaleValidator
+    from ._reversescale import ReversescaleValidator
+    from ._showscale import ShowscaleValidator
+    from ._colorbar import ColorbarValidator
+    from ._contours import ContoursValidator
+    from ._hidesurface import HidesurfaceValidator
+    from ._lightposition import LightpositionValidator
+    from ._lighting import LightingValidator
+    from ._xcalendar import XcalendarValidator
+    from ._ycalendar import YcalendarValidator
+    from ._zcalendar import ZcalendarValidator
+    from ._scene import SceneValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._zsrc import ZsrcValidator
+    from ._xsrc import XsrcValidator
+    from ._ysrc import YsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._surfacecolorsrc import SurfacecolorsrcValidator
+    from ._transforms import TransformsValidator
+    from . import lighting
+    from . import lightposition
+    from . import contours
+    from . import colorbar
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.lighting',
+            '.lightposition',
+            '.contours',
+            '.colorbar',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._z.ZValidator',
+            '._x.XValidator',
+            '._y.YValidator',
+            '._text.TextValidator',
+            '._surfacecolor.SurfacecolorValidator',
+            '._cauto.CautoValidator',
+            '._cmin.CminValidator',
+            '._cmax.CmaxValidator',
+            '._colorscale.ColorscaleValidator',
+            '._autocolorscale.AutocolorscaleValidator',
+            '._reversescale.ReversescaleValidator',
+            '._showscale.ShowscaleValidator',
+            '._colorbar.ColorbarValidator',
+            '._contours.ContoursValidator',
+            '._hidesurface.HidesurfaceValidator',
+            '._lightposition.LightpositionValidator',
+            '._lighting.LightingValidator',
+            '._xcalendar.XcalendarValidator',
+            '._ycalendar.YcalendarValidator',
+            '._zcalendar.ZcalendarValidator',
+            '._scene.SceneValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._zsrc.ZsrcValidator',
+            '._xsrc.XsrcValidator',
+            '._ysrc.YsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._surfacecolorsrc.SurfacecolorsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
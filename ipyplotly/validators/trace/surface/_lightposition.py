@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class LightpositionValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='lightposition', parent_name='trace.surface'):
+        from ipyplotly.datatypes.trace.surface import Lightposition
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Lightposition)
@@ -0,0 +1,155 @@
+# Property paths of trace.surface
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'z': ('', 'ZValidator', 'simple'),
+    'x': ('', 'XValidator', 'simple'),
+    'y': ('', 'YValidator', 'simple'),
+    'text': ('', 'TextValidator', 'simple'),
+    'surfacecolor': ('', 'SurfacecolorValidator', 'simple'),
+    'cauto': ('', 'CautoValidator', 'simple'),
+    'cmin': ('', 'CminValidator', 'simple'),
+    'cmax': ('', 'CmaxValidator', 'simple'),
+    'colorscale': ('', 'ColorscaleValidator', 'simple'),
+    'autocolorscale': ('', 'AutocolorscaleValidator', 'simple'),
+    'reversescale': ('', 'ReversescaleValidator', 'simple'),
+    'showscale': ('', 'ShowscaleValidator', 'simple'),
+    'colorbar': ('', 'ColorbarValidator', 'compound'),
+    'colorbar.thicknessmode': ('.colorbar', 'ThicknessmodeValidator', 'simple'),
+    'colorbar.thickness': ('.colorbar', 'ThicknessValidator', 'simple'),
+    'colorbar.lenmode': ('.colorbar', 'LenmodeValidator', 'simple'),
+    'colorbar.len': ('.colorbar', 'LenValidator', 'simple'),
+    'colorbar.x': ('.colorbar', 'XValidator', 'simple'),
+    'colorbar.xanchor': ('.colorbar', 'XanchorValidator', 'simple'),
+    'colorbar.xpad': ('.colorbar', 'XpadValidator', 'simple'),
+    'colorbar.y': ('.colorbar', 'YValidator', 'simple'),
+    'colorbar.yanchor': ('.colorbar', 'YanchorValidator', 'simple'),
+    'colorbar.ypad': ('.colorbar', 'YpadValidator', 'simple'),
+    'colorbar.outlinecolor': ('.colorbar', 'OutlinecolorValidator', 'simple'),
+    'colorbar.outlinewidth': ('.colorbar', 'OutlinewidthValidator', 'simple'),
+    'colorbar.bordercolor': ('.colorbar', 'BordercolorValidator', 'simple'),
+    'colorbar.borderwidth': ('.colorbar', 'BorderwidthValidator', 'simple'),
+    'colorbar.bgcolor': ('.colorbar', 'BgcolorValidator', 'simple'),
+    'colorbar.tickmode': ('.colorbar', 'TickmodeValidator', 'simple'),
+    'colorbar.nticks': ('.colorbar', 'NticksValidator', 'simple'),
+    'colorbar.tick0': ('.colorbar', 'Tick0Validator', 'simple'),
+    'colorbar.dtick': ('.colorbar', 'DtickValidator', 'simple'),
+    'colorbar.tickvals': ('.colorbar', 'TickvalsValidator', 'simple'),
+    'colorbar.ticktext': ('.colorbar', 'TicktextValidator', 'simple'),
+    'colorbar.ticks': ('.colorbar', 'TicksValidator', 'simple'),
+    'colorbar.ticklen': ('.colorbar', 'TicklenValidator', 'simple'),
+    'colorbar.tickwidth': ('.colorbar', 'TickwidthValidator', 'simple'),
+    'colorbar.tickcolor': ('.colorbar', 'TickcolorValidator', 'simple'),
+    'colorbar.showticklabels': ('.colorbar', 'ShowticklabelsValidator', 'simple'),
+    'colorbar.tickfont': ('.colorbar', 'TickfontValidator', 'compound'),
+    'colorbar.tickfont.family': ('.colorbar.tickfont', 'FamilyValidator', 'simple'),
+    'colorbar.tickfont.size': ('.colorbar.tickfont', 'SizeValidator', 'simple'),
+    'colorbar.tickfont.color': ('.colorbar.tickfont', 'ColorValidator', 'simple'),
+    'colorbar.tickangle': ('.colorbar', 'TickangleValidator', 'simple'),
+    'colorbar.tickformat': ('.colorbar', 'TickformatValidator', 'simple'),
+    'colorbar.tickformatstops': ('.colorbar', 'TickformatstopsValidator', 'compound_array'),
+    'colorbar.tickformatstops.dtickrange': ('.colorbar.tickformatstop', 'DtickrangeValidator', 'simple'),
+    'colorbar.tickformatstops.value': ('.colorbar.tickformatstop', 'ValueValidator', 'simple'),
+    'colorbar.tickprefix': ('.colorbar', 'TickprefixValidator', 'simple'),
+    'colorbar.showtickprefix': ('.colorbar', 'ShowtickprefixValidator', 'simple'),
+    'colorbar.ticksuffix': ('.colorbar', 'TicksuffixValidator', 'simple'),
+    'colorbar.showticksuffix': ('.colorbar', 'ShowticksuffixValidator', 'simple'),
+    'colorbar.separatethousands': ('.colorbar', 'SeparatethousandsValidator', 'simple'),
+    'colorbar.exponentformat': ('.colorbar', 'ExponentformatValidator', 'simple'),
+    'colorbar.showexponent': ('.colorbar', 'ShowexponentValidator', 'simple'),
+    'colorbar.title': ('.colorbar', 'TitleValidator', 'simple'),
+    'colorbar.titlefont': ('.colorbar', 'TitlefontValidator', 'compound'),
+    'colorbar.titlefont.family': ('.colorbar.titlefont', 'FamilyValidator', 'simple'),
+    'colorbar.titlefont.size': ('.colorbar.titlefont', 'SizeValidator', 'simple'),
+    'colorbar.titlefont.color': ('.colorbar.titlefont', 'ColorValidator', 'simple'),
+    'colorbar.titleside': ('.colorbar', 'TitlesideValidator', 'simple'),
+    'colorbar.tickvalssrc': ('.colorbar', 'TickvalssrcValidator', 'simple'),
+    'colorbar.ticktextsrc': ('.colorbar', 'TicktextsrcValidator', 'simple'),
+    'contours': ('', 'ContoursValidator', 'compound'),
+    'contours.x': ('.contours', 'XValidator', 'compound'),
+    'contours.x.show': ('.contours.x', 'ShowValidator', 'simple'),
+    'contours.x.project': ('.contours.x', 'ProjectValidator', 'compound'),
+    'contours.x.project.x': ('.contours.x.project', 'XValidator', 'simple'),
+    'contours.x.project.y': ('.contours.x.project', 'YValidator', 'simple'),
+    'contours.x.project.z': ('.contours.x.project', 'ZValidator', 'simple'),
+    'contours.x.color': ('.contours.x', 'ColorValidator', 'simple'),
+    'contours.x.usecolormap': ('.contours.x', 'UsecolormapValidator', 'simple'),
+    'contours.x.width': ('.contours.x', 'WidthValidator', 'simple'),
+    'contours.x.highlight': ('.contours.x', 'HighlightValidator', 'simple'),
+    'contours.x.highlightcolor': ('.contours.x', 'HighlightcolorValidator', 'simple'),
+    'contours.x.highlightwidth': ('.contours.x', 'HighlightwidthValidator', 'simple'),
+    'contours.y': ('.contours', 'YValidator', 'compound'),
+    'contours.y.show': ('.contours.y', 'ShowValidator', 'simple'),
+    'contours.y.project': ('.contours.y', 'ProjectValidator', 'compound'),
+    'contours.y.project.x': ('.contours.y.project', 'XValidator', 'simple'),
+    'contours.y.project.y': ('.contours.y.project', 'YValidator', 'simple'),
+    'contours.y.project.z': ('.contours.y.project', 'ZValidator', 'simple'),
+    'contours.y.color': ('.contours.y', 'ColorValidator', 'simple'),
+    'contours.y.usecolormap': ('.contours.y', 'UsecolormapValidator', 'simple'),
+    'contours.y.width': ('.contours.y', 'WidthValidator', 'simple'),
+    'contours.y.highlight': ('.contours.y', 'HighlightValidator', 'simple'),
+    'contours.y.highlightcolor': ('.contours.y', 'HighlightcolorValidator', 'simple'),
+    'contours.y.highlightwidth': ('.contours.y', 'HighlightwidthValidator', 'simple'),
+    'contours.z': ('.contours', 'ZValidator', 'compound'),
+    'contours.z.show': ('.contours.z', 'ShowValidator', 'simple'),
+    'contours.z.project': ('.contours.z', 'ProjectValidator', 'compound'),
+    'contours.z.project.x': ('.contours.z.project', 'XValidator', 'simple'),
+    'contours.z.project.y': ('.contours.z.project', 'YValidator', 'simple'),
+    'contours.z.project.z': ('.contours.z.project', 'ZValidator', 'simple'),
+    'contours.z.color': ('.contours.z', 'ColorValidator', 'simple'),
+    'contours.z.usecolormap': ('.contours.z', 'UsecolormapValidator', 'simple'),
+    'contours.z.width': ('.contours.z', 'WidthValidator', 'simple'),
+    'contours.z.highlight': ('.contours.z', 'HighlightValidator', 'simple'),
+    'contours.z.highlightcolor': ('.contours.z', 'HighlightcolorValidator', 'simple'),
+    'contours.z.highlightwidth': ('.contours.z', 'HighlightwidthValidator', 'simple'),
+    'hidesurface': ('', 'HidesurfaceValidator', 'simple'),
+    'lightposition': ('', 'LightpositionValidator', 'compound'),
+    'lightposition.x': ('.lightposition', 'XValidator', 'simple'),
+    'lightposition.y': ('.lightposition', 'YValidator', 'simple'),
+    'lightposition.z': ('.lightposition', 'ZValidator', 'simple'),
+    'lighting': ('', 'LightingValidator', 'compound'),
+    'lighting.ambient': ('.lighting', 'AmbientValidator', 'simple'),
+    'lighting.diffuse': ('.lighting', 'DiffuseValidator', 'simple'),
+    'lighting.specular': ('.lighting', 'SpecularValidator', 'simple'),
+    'lighting.roughness': ('.lighting', 'RoughnessValidator', 'simple'),
+    'lighting.fresnel': ('.lighting', 'FresnelValidator', 'simple'),
+    'xcalendar': ('', 'XcalendarValidator', 'simple'),
+    'ycalendar': ('', 'YcalendarValidator', 'simple'),
+    'zcalendar': ('', 'ZcalendarValidator', 'simple'),
+    'scene': ('', 'SceneValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'zsrc': ('', 'ZsrcValidator', 'simple'),
+    'xsrc': ('', 'XsrcValidator', 'simple'),
+    'ysrc': ('', 'YsrcValidator', 'simple'),
+    'textsrc': ('', 'TextsrcValidator', 'simple'),
+    'surfacecolorsrc': ('', 'SurfacecolorsrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
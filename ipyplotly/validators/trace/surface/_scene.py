@@ -0,0 +1,14 @@
+import ipyplotly.basevalidators
+
+
+class SceneValidator(ipyplotly.basevalidators.SubplotidValidator):
+
+    def __init__(self, plotly_name='scene', parent_name='trace.surface'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, dflt='scene', edit_type='calc+clearAxisTypes'
+        )
+
+    def validate_coerce(self, v):
+        if v is None or (v.__class__ is str and v == 'scene'):
+            return 'scene'
+        return super().validate_coerce(v)
@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._x import XValidator
+    from ._y import YValidator
+    from ._z import ZValidator
+    from . import z
+    from . import y
+    from . import x
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.z',
+            '.y',
+            '.x',
+        ],
+        [
+            '._x.XValidator',
+            '._y.YValidator',
+            '._z.ZValidator',
+        ]
+    )
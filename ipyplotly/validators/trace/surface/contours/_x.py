@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class XValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='x', parent_name='trace.surface.contours'):
+        from ipyplotly.datatypes.trace.surface.contours import X
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=X)
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ZValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='z', parent_name='trace.surface.contours'):
+        from ipyplotly.datatypes.trace.surface.contours import Z
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Z)
@@ -0,0 +1,15 @@
+import ipyplotly.basevalidators
+
+
+class HighlightwidthValidator(ipyplotly.basevalidators.NumberValidator):
+
+    def __init__(self, plotly_name='highlightwidth', parent_name='trace.surface.contours.x'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, min=1, max=16, edit_type='calc')
+
+    def validate_coerce(self, v):
+        if v.__class__ is int or v.__class__ is float:
+            if 1 <= v <= 16:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,30 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._show import ShowValidator
+    from ._project import ProjectValidator
+    from ._color import ColorValidator
+    from ._usecolormap import UsecolormapValidator
+    from ._width import WidthValidator
+    from ._highlight import HighlightValidator
+    from ._highlightcolor import HighlightcolorValidator
+    from ._highlightwidth import HighlightwidthValidator
+    from . import project
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.project',
+        ],
+        [
+            '._show.ShowValidator',
+            '._project.ProjectValidator',
+            '._color.ColorValidator',
+            '._usecolormap.UsecolormapValidator',
+            '._width.WidthValidator',
+            '._highlight.HighlightValidator',
+            '._highlightcolor.HighlightcolorValidator',
+            '._highlightwidth.HighlightwidthValidator',
+        ]
+    )
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class ProjectValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='project', parent_name='trace.surface.contours.z'):
+        from ipyplotly.datatypes.trace.surface.contours.z import Project
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Project)
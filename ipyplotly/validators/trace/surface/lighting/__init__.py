@@ -0,0 +1,21 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._ambient import AmbientValidator
+    from ._diffuse import DiffuseValidator
+    from ._specular import SpecularValidator
+    from ._roughness import RoughnessValidator
+    from ._fresnel import FresnelValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._ambient.AmbientValidator',
+            '._diffuse.DiffuseValidator',
+            '._specular.SpecularValidator',
+            '._roughness.RoughnessValidator',
+            '._fresnel.FresnelValidator',
+        ]
+    )
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class ColumnorderValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='columnorder', parent_name='trace.table'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class HeaderValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='header', parent_name='trace.table'):
+        from ipyplotly.datatypes.trace.table import Header
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Header)
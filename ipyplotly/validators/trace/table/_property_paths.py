@@ -0,0 +1,96 @@
+# Property paths of trace.table
+# (dotted path: (relative validator package, validator class name, container kind))
+property_paths = {
+    'visible': ('', 'VisibleValidator', 'simple'),
+    'showlegend': ('', 'ShowlegendValidator', 'simple'),
+    'legendgroup': ('', 'LegendgroupValidator', 'simple'),
+    'opacity': ('', 'OpacityValidator', 'simple'),
+    'name': ('', 'NameValidator', 'simple'),
+    'uid': ('', 'UidValidator', 'simple'),
+    'ids': ('', 'IdsValidator', 'simple'),
+    'customdata': ('', 'CustomdataValidator', 'simple'),
+    'selectedpoints': ('', 'SelectedpointsValidator', 'simple'),
+    'hoverinfo': ('', 'HoverinfoValidator', 'simple'),
+    'hoverlabel': ('', 'HoverlabelValidator', 'compound'),
+    'hoverlabel.bgcolor': ('.hoverlabel', 'BgcolorValidator', 'simple'),
+    'hoverlabel.bordercolor': ('.hoverlabel', 'BordercolorValidator', 'simple'),
+    'hoverlabel.font': ('.hoverlabel', 'FontValidator', 'compound'),
+    'hoverlabel.font.family': ('.hoverlabel.font', 'FamilyValidator', 'simple'),
+    'hoverlabel.font.size': ('.hoverlabel.font', 'SizeValidator', 'simple'),
+    'hoverlabel.font.color': ('.hoverlabel.font', 'ColorValidator', 'simple'),
+    'hoverlabel.font.familysrc': ('.hoverlabel.font', 'FamilysrcValidator', 'simple'),
+    'hoverlabel.font.sizesrc': ('.hoverlabel.font', 'SizesrcValidator', 'simple'),
+    'hoverlabel.font.colorsrc': ('.hoverlabel.font', 'ColorsrcValidator', 'simple'),
+    'hoverlabel.namelength': ('.hoverlabel', 'NamelengthValidator', 'simple'),
+    'hoverlabel.bgcolorsrc': ('.hoverlabel', 'BgcolorsrcValidator', 'simple'),
+    'hoverlabel.bordercolorsrc': ('.hoverlabel', 'BordercolorsrcValidator', 'simple'),
+    'hoverlabel.namelengthsrc': ('.hoverlabel', 'NamelengthsrcValidator', 'simple'),
+    'stream': ('', 'StreamValidator', 'compound'),
+    'stream.token': ('.stream', 'TokenValidator', 'simple'),
+    'stream.maxpoints': ('.stream', 'MaxpointsValidator', 'simple'),
+    'domain': ('', 'DomainValidator', 'compound'),
+    'domain.x': ('.domain', 'XValidator', 'simple'),
+    'domain.y': ('.domain', 'YValidator', 'simple'),
+    'columnwidth': ('', 'ColumnwidthValidator', 'simple'),
+    'columnorder': ('', 'ColumnorderValidator', 'simple'),
+    'header': ('', 'HeaderValidator', 'compound'),
+    'header.values': ('.header', 'ValuesValidator', 'simple'),
+    'header.format': ('.header', 'FormatValidator', 'simple'),
+    'header.prefix': ('.header', 'PrefixValidator', 'simple'),
+    'header.suffix': ('.header', 'SuffixValidator', 'simple'),
+    'header.height': ('.header', 'HeightValidator', 'simple'),
+    'header.align': ('.header', 'AlignValidator', 'simple'),
+    'header.line': ('.header', 'LineValidator', 'compound'),
+    'header.line.width': ('.header.line', 'WidthValidator', 'simple'),
+    'header.line.color': ('.header.line', 'ColorValidator', 'simple'),
+    'header.line.widthsrc': ('.header.line', 'WidthsrcValidator', 'simple'),
+    'header.line.colorsrc': ('.header.line', 'ColorsrcValidator', 'simple'),
+    'header.fill': ('.header', 'FillValidator', 'compound'),
+    'header.fill.color': ('.header.fill', 'ColorValidator', 'simple'),
+    'header.fill.colorsrc': ('.header.fill', 'ColorsrcValidator', 'simple'),
+    'header.font': ('.header', 'FontValidator', 'compound'),
+    'header.font.family': ('.header.font', 'FamilyValidator', 'simple'),
+    'header.font.size': ('.header.font', 'SizeValidator', 'simple'),
+    'header.font.color': ('.header.font', 'ColorValidator', 'simple'),
+    'header.font.familysrc': ('.header.font', 'FamilysrcValidator', 'simple'),
+    'header.font.sizesrc': ('.header.font', 'SizesrcValidator', 'simple'),
+    'header.font.colorsrc': ('.header.font', 'ColorsrcValidator', 'simple'),
+    'header.valuessrc': ('.header', 'ValuessrcValidator', 'simple'),
+    'header.formatsrc': ('.header', 'FormatsrcValidator', 'simple'),
+    'header.prefixsrc': ('.header', 'PrefixsrcValidator', 'simple'),
+    'header.suffixsrc': ('.header', 'SuffixsrcValidator', 'simple'),
+    'header.alignsrc': ('.header', 'AlignsrcValidator', 'simple'),
+    'cells': ('', 'CellsValidator', 'compound'),
+    'cells.values': ('.cells', 'ValuesValidator', 'simple'),
+    'cells.format': ('.cells', 'FormatValidator', 'simple'),
+    'cells.prefix': ('.cells', 'PrefixValidator', 'simple'),
+    'cells.suffix': ('.cells', 'SuffixValidator', 'simple'),
+    'cells.height': ('.cells', 'HeightValidator', 'simple'),
+    'cells.align': ('.cells', 'AlignValidator', 'simple'),
+    'cells.line': ('.cells', 'LineValidator', 'compound'),
+    'cells.line.width': ('.cells.line', 'WidthValidator', 'simple'),
+    'cells.line.color': ('.cells.line', 'ColorValidator', 'simple'),
+    'cells.line.widthsrc': ('.cells.line', 'WidthsrcValidator', 'simple'),
+    'cells.line.colorsrc': ('.cells.line', 'ColorsrcValidator', 'simple'),
+    'cells.fill': ('.cells', 'FillValidator', 'compound'),
+    'cells.fill.color': ('.cells.fill', 'ColorValidator', 'simple'),
+    'cells.fill.colorsrc': ('.cells.fill', 'ColorsrcValidator', 'simple'),
+    'cells.font': ('.cells', 'FontValidator', 'compound'),
+    'cells.font.family': ('.cells.font', 'FamilyValidator', 'simple'),
+    'cells.font.size': ('.cells.font', 'SizeValidator', 'simple'),
+    'cells.font.color': ('.cells.font', 'ColorValidator', 'simple'),
+    'cells.font.familysrc': ('.cells.font', 'FamilysrcValidator', 'simple'),
+    'cells.font.sizesrc': ('.cells.font', 'SizesrcValidator', 'simple'),
+    'cells.font.colorsrc': ('.cells.font', 'ColorsrcValidator', 'simple'),
+    'cells.valuessrc': ('.cells', 'ValuessrcValidator', 'simple'),
+    'cells.formatsrc': ('.cells', 'FormatsrcValidator', 'simple'),
+    'cells.prefixsrc': ('.cells', 'PrefixsrcValidator', 'simple'),
+    'cells.suffixsrc': ('.cells', 'SuffixsrcValidator', 'simple'),
+    'cells.alignsrc': ('.cells', 'AlignsrcValidator', 'simple'),
+    'idssrc': ('', 'IdssrcValidator', 'simple'),
+    'customdatasrc': ('', 'CustomdatasrcValidator', 'simple'),
+    'hoverinfosrc': ('', 'HoverinfosrcValidator', 'simple'),
+    'columnwidthsrc': ('', 'ColumnwidthsrcValidator', 'simple'),
+    'columnordersrc': ('', 'ColumnordersrcValidator', 'simple'),
+    'transforms': ('', 'TransformsValidator', 'compound_array'),
+}
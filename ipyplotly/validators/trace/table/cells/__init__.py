@@ -0,0 +1,46 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._values import ValuesValidator
+    from ._format import FormatValidator
+    from ._prefix import PrefixValidator
+    from ._suffix import SuffixValidator
+    from ._height import HeightValidator
+    from ._align import AlignValidator
+    from ._line import LineValidator
+    from ._fill import FillValidator
+    from ._font import FontValidator
+    from ._valuessrc import ValuessrcValidator
+    from ._formatsrc import FormatsrcValidator
+    from ._prefixsrc import PrefixsrcValidator
+    from ._suffixsrc import SuffixsrcValidator
+    from ._alignsrc import AlignsrcValidator
+    from . import font
+    from . import fill
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+            '.fill',
+            '.line',
+        ],
+        [
+            '._values.ValuesValidator',
+            '._format.FormatValidator',
+            '._prefix.PrefixValidator',
+            '._suffix.SuffixValidator',
+            '._height.HeightValidator',
+            '._align.AlignValidator',
+            '._line.LineValidator',
+            '._fill.FillValidator',
+            '._font.FontValidator',
+            '._valuessrc.ValuessrcValidator',
+            '._formatsrc.FormatsrcValidator',
+            '._prefixsrc.PrefixsrcValidator',
+            '._suffixsrc.SuffixsrcValidator',
+            '._alignsrc.AlignsrcValidator',
+        ]
+    )
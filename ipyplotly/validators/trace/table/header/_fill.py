@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class FillValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='fill', parent_name='trace.table.header'):
+        from ipyplotly.datatypes.trace.table.header import Fill
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Fill)
@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class FormatValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='format', parent_name='trace.table.header'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
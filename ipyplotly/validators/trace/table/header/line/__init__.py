@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._width import WidthValidator
+    from ._color import ColorValidator
+    from ._widthsrc import WidthsrcValidator
+    from ._colorsrc import ColorsrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._width.WidthValidator',
+            '._color.ColorValidator',
+            '._widthsrc.WidthsrcValidator',
+            '._colorsrc.ColorsrcValidator',
+        ]
+    )
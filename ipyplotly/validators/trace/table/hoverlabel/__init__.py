@@ -0,0 +1,28 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._bgcolor import BgcolorValidator
+    from ._bordercolor import BordercolorValidator
+    from ._font import FontValidator
+    from ._namelength import NamelengthValidator
+    from ._bgcolorsrc import BgcolorsrcValidator
+    from ._bordercolorsrc import BordercolorsrcValidator
+    from ._namelengthsrc import NamelengthsrcValidator
+    from . import font
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.font',
+        ],
+        [
+            '._bgcolor.BgcolorValidator',
+            '._bordercolor.BordercolorValidator',
+            '._font.FontValidator',
+            '._namelength.NamelengthValidator',
+            '._bgcolorsrc.BgcolorsrcValidator',
+            '._bordercolorsrc.BordercolorsrcValidator',
+            '._namelengthsrc.NamelengthsrcValidator',
+        ]
+    )
@@ -0,0 +1,116 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._showlegend import ShowlegendValidator
+    from ._legendgroup import LegendgroupValidator
+    from ._opacity import OpacityValidator
+    from ._name import NameValidator
+    from ._uid import UidValidator
+    from ._ids import IdsValidator
+    from ._customdata import CustomdataValidator
+    from ._selectedpoints import SelectedpointsValidator
+    from ._hoverinfo import HoverinfoValidator
+    from ._hoverlabel import HoverlabelValidator
+    from ._stream import StreamValidator
+    from ._y import YValidator
+    from ._x import XValidator
+    from ._x0 import X0Validator
+    from ._y0 import Y0Validator
+    from ._orientation import OrientationValidator
+    from ._bandwidth import BandwidthValidator
+    from ._scalegroup import ScalegroupValidator
+    from ._scalemode import ScalemodeValidator
+    from ._spanmode import SpanmodeValidator
+    from ._span import SpanValidator
+    from ._line import LineValidator
+    from ._fillcolor import FillcolorValidator
+    from ._points import PointsValidator
+    from ._jitter import JitterValidator
+    from ._pointpos import PointposValidator
+    from ._marker import MarkerValidator
+    from ._text import TextValidator
+    from ._box import BoxValidator
+    from ._meanline import MeanlineValidator
+    from ._side import SideValidator
+    from ._selected import SelectedValidator
+    from ._unselected import UnselectedValidator
+    from ._hoveron import HoveronValidator
+    from ._xaxis import XaxisValidator
+    from ._yaxis import YaxisValidator
+    from ._idssrc import IdssrcValidator
+    from ._customdatasrc import CustomdatasrcValidator
+    from ._hoverinfosrc import HoverinfosrcValidator
+    from ._ysrc import YsrcValidator
+    from ._xsrc import XsrcValidator
+    from ._textsrc import TextsrcValidator
+    from ._transforms import TransformsValidator
+    from . import unselected
+    from . import selected
+    from . import meanline
+    from . import box
+    from . import marker
+    from . import line
+    from . import stream
+    from . import hoverlabel
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.unselected',
+            '.selected',
+            '.meanline',
+            '.box',
+            '.marker',
+            '.line',
+            '.stream',
+            '.hoverlabel',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._showlegend.ShowlegendValidator',
+            '._legendgroup.LegendgroupValidator',
+            '._opacity.OpacityValidator',
+            '._name.NameValidator',
+            '._uid.UidValidator',
+            '._ids.IdsValidator',
+            '._customdata.CustomdataValidator',
+            '._selectedpoints.SelectedpointsValidator',
+            '._hoverinfo.HoverinfoValidator',
+            '._hoverlabel.HoverlabelValidator',
+            '._stream.StreamValidator',
+            '._y.YValidator',
+            '._x.XValidator',
+            '._x0.X0Validator',
+            '._y0.Y0Validator',
+            '._orientation.OrientationValidator',
+            '._bandwidth.BandwidthValidator',
+            '._scalegroup.ScalegroupValidator',
+            '._scalemode.ScalemodeValidator',
+            '._spanmode.SpanmodeValidator',
+            '._span.SpanValidator',
+            '._line.LineValidator',
+            '._fillcolor.FillcolorValidator',
+            '._points.PointsValidator',
+            '._jitter.JitterValidator',
+            '._pointpos.PointposValidator',
+            '._marker.MarkerValidator',
+            '._text.TextValidator',
+            '._box.BoxValidator',
+            '._meanline.MeanlineValidator',
+            '._side.SideValidator',
+            '._selected.SelectedValidator',
+            '._unselected.UnselectedValidator',
+            '._hoveron.HoveronValidator',
+            '._xaxis.XaxisValidator',
+            '._yaxis.YaxisValidator',
+            '._idssrc.IdssrcValidator',
+            '._customdatasrc.CustomdatasrcValidator',
+            '._hoverinfosrc.HoverinfosrcValidator',
+            '._ysrc.YsrcValidator',
+            '._xsrc.XsrcValidator',
+            '._textsrc.TextsrcValidator',
+            '._transforms.TransformsValidator',
+        ]
+    )
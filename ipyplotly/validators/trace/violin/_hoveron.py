@@ -0,0 +1,21 @@
+import ipyplotly.basevalidators
+
+
+class HoveronValidator(ipyplotly.basevalidators.FlaglistValidator):
+
+    def __init__(self, plotly_name='hoveron', parent_name='trace.violin'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            flags=['violins', 'points', 'kde'],
+            extras=['all'],
+            edit_type='style'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v in {'all', 'kde', 'points', 'violins'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
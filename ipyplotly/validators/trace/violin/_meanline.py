@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class MeanlineValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='meanline', parent_name='trace.violin'):
+        from ipyplotly.datatypes.trace.violin import Meanline
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Meanline)
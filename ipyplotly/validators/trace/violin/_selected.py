@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class SelectedValidator(ipyplotly.basevalidators.CompoundValidator):
+
+    def __init__(self, plotly_name='selected', parent_name='trace.violin'):
+        from ipyplotly.datatypes.trace.violin import Selected
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, data_class=Selected)
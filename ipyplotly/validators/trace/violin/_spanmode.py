@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class SpanmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='spanmode', parent_name='trace.violin'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['soft', 'hard', 'manual'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'hard', 'manual', 'soft'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
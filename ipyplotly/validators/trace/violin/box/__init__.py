@@ -0,0 +1,22 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._width import WidthValidator
+    from ._fillcolor import FillcolorValidator
+    from ._line import LineValidator
+    from . import line
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.line',
+        ],
+        [
+            '._visible.VisibleValidator',
+            '._width.WidthValidator',
+            '._fillcolor.FillcolorValidator',
+            '._line.LineValidator',
+        ]
+    )
@@ -0,0 +1,17 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._visible import VisibleValidator
+    from ._color import ColorValidator
+    from ._width import WidthValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._visible.VisibleValidator',
+            '._color.ColorValidator',
+            '._width.WidthValidator',
+        ]
+    )
@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from . import sort
+    from . import groupby
+    from . import filter
+    from . import aggregate
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.sort',
+            '.groupby',
+            '.filter',
+            '.aggregate',
+        ],
+        []
+    )
@@ -0,0 +1,22 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._enabled import EnabledValidator
+    from ._groups import GroupsValidator
+    from ._aggregations import AggregationsValidator
+    from ._groupssrc import GroupssrcValidator
+    from . import aggregation
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.aggregation',
+        ],
+        [
+            '._enabled.EnabledValidator',
+            '._groups.GroupsValidator',
+            '._aggregations.AggregationsValidator',
+            '._groupssrc.GroupssrcValidator',
+        ]
+    )
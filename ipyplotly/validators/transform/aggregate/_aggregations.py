@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class AggregationsValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='aggregations', parent_name='transform.aggregate'):
+        from ipyplotly.datatypes.transform.aggregate import Aggregation
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Aggregation)
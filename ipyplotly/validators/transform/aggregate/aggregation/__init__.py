@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._target import TargetValidator
+    from ._func import FuncValidator
+    from ._funcmode import FuncmodeValidator
+    from ._enabled import EnabledValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._target.TargetValidator',
+            '._func.FuncValidator',
+            '._funcmode.FuncmodeValidator',
+            '._enabled.EnabledValidator',
+        ]
+    )
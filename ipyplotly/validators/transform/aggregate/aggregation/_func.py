@@ -0,0 +1,20 @@
+import ipyplotly.basevalidators
+
+
+class FuncValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='func', parent_name='transform.aggregate.aggregation'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            values=['count', 'sum', 'avg', 'median', 'mode', 'rms', 'stddev', 'min', 'max', 'first', 'last'],
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'avg', 'count', 'first', 'last', 'max', 'median', 'min', 'mode', 'rms', 'stddev', 'sum'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
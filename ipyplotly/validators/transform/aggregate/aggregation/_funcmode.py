@@ -0,0 +1,17 @@
+import ipyplotly.basevalidators
+
+
+class FuncmodeValidator(ipyplotly.basevalidators.EnumeratedValidator):
+
+    def __init__(self, plotly_name='funcmode', parent_name='transform.aggregate.aggregation'):
+        super().__init__(
+            plotly_name=plotly_name, parent_name=parent_name, values=['sample', 'population'], edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ in (str, int, float, bool):
+            if v in {'population', 'sample'}:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
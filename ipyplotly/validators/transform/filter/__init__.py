@@ -0,0 +1,27 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._enabled import EnabledValidator
+    from ._target import TargetValidator
+    from ._operation import OperationValidator
+    from ._value import ValueValidator
+    from ._preservegaps import PreservegapsValidator
+    from ._valuecalendar import ValuecalendarValidator
+    from ._targetcalendar import TargetcalendarValidator
+    from ._targetsrc import TargetsrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._enabled.EnabledValidator',
+            '._target.TargetValidator',
+            '._operation.OperationValidator',
+            '._value.ValueValidator',
+            '._preservegaps.PreservegapsValidator',
+            '._valuecalendar.ValuecalendarValidator',
+            '._targetcalendar.TargetcalendarValidator',
+            '._targetsrc.TargetsrcValidator',
+        ]
+    )
@@ -0,0 +1,22 @@
+import ipyplotly.basevalidators
+
+
+class TargetValidator(ipyplotly.basevalidators.StringValidator):
+
+    def __init__(self, plotly_name='target', parent_name='transform.filter'):
+        super().__init__(
+            plotly_name=plotly_name,
+            parent_name=parent_name,
+            strict=True,
+            no_blank=True,
+            array_ok=True,
+            edit_type='calc'
+        )
+
+    def validate_coerce(self, v):
+        if v.__class__ is str:
+            if v:
+                return v
+        elif v is None:
+            return v
+        return super().validate_coerce(v)
@@ -0,0 +1,24 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._enabled import EnabledValidator
+    from ._groups import GroupsValidator
+    from ._nameformat import NameformatValidator
+    from ._styles import StylesValidator
+    from ._groupssrc import GroupssrcValidator
+    from . import style
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [
+            '.style',
+        ],
+        [
+            '._enabled.EnabledValidator',
+            '._groups.GroupsValidator',
+            '._nameformat.NameformatValidator',
+            '._styles.StylesValidator',
+            '._groupssrc.GroupssrcValidator',
+        ]
+    )
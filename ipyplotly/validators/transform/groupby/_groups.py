@@ -0,0 +1,7 @@
+import ipyplotly.basevalidators
+
+
+class GroupsValidator(ipyplotly.basevalidators.DataArrayValidator):
+
+    def __init__(self, plotly_name='groups', parent_name='transform.groupby'):
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, edit_type='calc')
@@ -0,0 +1,8 @@
+import ipyplotly.basevalidators
+
+
+class StylesValidator(ipyplotly.basevalidators.CompoundArrayValidator):
+
+    def __init__(self, plotly_name='styles', parent_name='transform.groupby'):
+        from ipyplotly.datatypes.transform.groupby import Style
+        super().__init__(plotly_name=plotly_name, parent_name=parent_name, element_class=Style)
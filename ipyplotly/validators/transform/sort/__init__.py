@@ -0,0 +1,19 @@
+import sys
+
+if sys.version_info < (3, 7):
+    from ._enabled import EnabledValidator
+    from ._target import TargetValidator
+    from ._order import OrderValidator
+    from ._targetsrc import TargetsrcValidator
+else:
+    from ipyplotly.importers import relative_import
+    __all__, __getattr__, __dir__ = relative_import(
+        __name__,
+        [],
+        [
+            '._enabled.EnabledValidator',
+            '._target.TargetValidator',
+            '._order.OrderValidator',
+            '._targetsrc.TargetsrcValidator',
+        ]
+    )
@@ -435,6 +435,8 @@ var FigureModel = widgets.DOMWidgetModel.extend({
     }, widgets.DOMWidgetModel.serializers)
 });
 
+// Dtypes of the binary buffers sent by the Python side. The dtype transport policy
+// (ipyplotly.serializers.DtypePolicy) never sends int64/uint64 buffers
 var numpy_dtype_to_typedarray_type = {
     int8: Int8Array,
     int16: Int16Array,
@@ -468,6 +470,22 @@ function js2py_serializer(v, widgetManager) {
     return res
 }
 
+function typedarray_to_nested_arrays(typedarray, shape, offset) {
+    // Nested arrays of the C ordered typedarray with shape shape, whose innermost arrays are
+    // subarray views of typedarray (no per-element copies)
+    if (shape.length === 1) {
+        return typedarray.subarray(offset, offset + shape[0]);
+    }
+
+    var inner_shape = shape.slice(1);
+    var stride = inner_shape.reduce(function(a, b) { return a * b; }, 1);
+    var res = new Array(shape[0]);
+    for (var i = 0; i < shape[0]; i++) {
+        res[i] = typedarray_to_nested_arrays(typedarray, inner_shape, offset + i * stride);
+    }
+    return res;
+}
+
 function py2js_serializer(v, widgetManager) {
     var res;
     if (Array.isArray(v)) {
@@ -478,8 +496,40 @@ function py2js_serializer(v, widgetManager) {
     } else if (_.isPlainObject(v)) {
         if (_.has(v, 'buffer') && _.has(v, 'dtype') && _.has(v, 'shape')) {
             var typedarray_type = numpy_dtype_to_typedarray_type[v.dtype];
-            var typedarray = new typedarray_type(v.buffer.buffer);
-            res = Array.from(typedarray);
+            if (typedarray_type === undefined) {
+                throw new Error('Unsupported array dtype: ' + v.dtype);
+            }
+
+            // The buffer may be a view into a larger ArrayBuffer
+            var typedarray = new typedarray_type(v.buffer.buffer,
+                                                 v.buffer.byteOffset,
+                                                 v.buffer.byteLength / typedarray_type.BYTES_PER_ELEMENT);
+            if (v.shape.length > 1) {
+                // N-dimensional array (e.g. heatmap z), rows are views into the buffer
+                res = typedarray_to_nested_arrays(typedarray, v.shape, 0);
+            } else {
+                res = Array.from(typedarray);
+            }
+        } else if (_.has(v, 'codes') && _.has(v, 'categories')) {
+            // Array of repeated values, sent as codes into its distinct values. Missing values
+            // have code -1
+            var codes = py2js_serializer(v.codes);
+            var categories = py2js_serializer(v.categories);
+            res = new Array(codes.length);
+            for (var j = 0; j < codes.length; j++) {
+                res[j] = codes[j] < 0 ? null : categories[codes[j]];
+            }
+        } else if (_.has(v, 'offsets') && _.has(v, 'data')) {
+            // Array of strings, sent as UTF-8 data and the offsets of the strings in the data.
+            // Arrays with missing values also have a nulls mask, with 1 for missing values
+            var offsets = py2js_serializer(v.offsets);
+            var nulls = _.has(v, 'nulls') ? py2js_serializer(v.nulls) : null;
+            var bytes = new Uint8Array(v.data.buffer, v.data.byteOffset, v.data.byteLength);
+            var decoder = new TextDecoder('utf-8');
+            res = new Array(offsets.length - 1);
+            for (var k = 0; k < res.length; k++) {
+                res[k] = nulls && nulls[k] ? null : decoder.decode(bytes.subarray(offsets[k], offsets[k + 1]));
+            }
         } else {
             res = {};
             for (var p in v) {
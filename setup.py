@@ -123,17 +123,40 @@ class NPM(Command):
 
 class CodegenCommand(Command):
     description = 'Generate class hierarchy from Plotly JSON schema'
-    user_options = []
+    user_options = [
+        ('jobs=', 'j', 'number of worker processes used to generate and format source code (default 1)'),
+        ('full', None, 'regenerate all source code instead of only the nodes whose schema changed'),
+        ('profile', None, 'print the time spent in each codegen phase and write a JSON timing report'),
+        ('profile-report=', None, 'path of the JSON timing report (default codegen/.cache/profile.json)'),
+        ('trace-types=', None, 'comma separated trace types to generate (default all). scatter is always generated'),
+        ('validators-mode=', None, "'classes' for a class per validator (default), 'tables' for validator tables"),
+    ]
+    boolean_options = ['full', 'profile']
 
     def initialize_options(self):
-        pass
+        self.jobs = None
+        self.full = False
+        self.profile = False
+        self.profile_report = None
+        self.trace_types = None
+        self.validators_mode = 'classes'
 
     def finalize_options(self):
-        pass
+        if self.jobs is None:
+            self.jobs = 1
+        else:
+            self.jobs = int(self.jobs)
+            if self.jobs < 1:
+                raise ValueError('--jobs must be a positive integer. Received: %s' % self.jobs)
+
+        if self.trace_types is not None:
+            self.trace_types = [t.strip() for t in self.trace_types.split(',') if t.strip()]
 
     def run(self):
         from codegen import perform_codegen
-        perform_codegen()
+        perform_codegen(jobs=self.jobs, full=self.full,
+                        profile=self.profile, profile_report=self.profile_report,
+                        trace_types=self.trace_types, validators_mode=self.validators_mode)
 
 
 version_ns = {}
@@ -161,6 +184,8 @@ setup_args = {
         'plotly>=2.1'
     ],
     'packages': find_packages(exclude=('codegen',)),
+    # Docs resources of the generated datatypes (see ipyplotly.lazydocs)
+    'package_data': {'ipyplotly.datatypes': ['_docs/*.json']},
     'zip_safe': False,
     'cmdclass': {
         'build_py': js_prerelease(build_py),
@@ -8,8 +8,8 @@ import inspect
 # -----------------
 datatypes_root = 'ipyplotly/datatypes'
 datatype_modules = [dirpath.replace('/', '.')
-                    for dirpath, _, _ in os.walk(datatypes_root)
-                    if not dirpath.endswith('__pycache__')]
+                    for dirpath, _, filenames in os.walk(datatypes_root)
+                    if '__init__.py' in filenames]
 
 
 @pytest.fixture(params=datatype_modules)
@@ -25,20 +25,24 @@ def test_import_datatypes(datatypes_module):
 
 def test_construct_datatypes(datatypes_module):
     module = importlib.import_module(datatypes_module)
-    for name, obj in inspect.getmembers(module, inspect.isclass):
-        if obj.__module__ == datatypes_module:
+    for name in module.__all__:
+        obj = getattr(module, name)
+        if inspect.isclass(obj):
             datatype_class = obj
 
             # Call datatype constructor with not arguments
             datatype_class()
 
+            # Docs are loaded from the docs resources
+            assert datatype_class.__doc__
+
 
 # Validate validator modules
 # --------------------------
 validators_root = 'ipyplotly/validators'
 validator_modules = [dirpath.replace('/', '.')
-                     for dirpath, _, _ in os.walk(validators_root)
-                     if not dirpath.endswith('__pycache__')]
+                     for dirpath, _, filenames in os.walk(validators_root)
+                     if '__init__.py' in filenames]
 
 
 @pytest.fixture(params=validator_modules)
@@ -52,8 +56,9 @@ def test_import_validators(validators_module):
 
 def test_construct_validators(validators_module):
     module = importlib.import_module(validators_module)
-    for name, obj in inspect.getmembers(module, inspect.isclass):
-        if obj.__module__ == validators_module:
+    for name in module.__all__:
+        obj = getattr(module, name)
+        if inspect.isclass(obj):
             validator_class = obj
 
             # Call datatype constructor with not arguments
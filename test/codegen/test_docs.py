@@ -0,0 +1,34 @@
+import pytest
+
+from codegen.docs import build_docs_resources
+from codegen.utils import PlotlySchemaIndex, TraceNode
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def trace_node():
+    plotly_schema = {
+        'traces': {'scatter': {'meta': {'description': 'Scatter trace'},
+                               'attributes': {'type': 'scatter',
+                                              'opacity': {'valType': 'number',
+                                                          'description': 'Sets the opacity of the trace.'},
+                                              'marker': {'size': {'valType': 'number',
+                                                                  'description': 'Marker size ' * 10},
+                                                         'role': 'object'}}}}}
+    return PlotlySchemaIndex(plotly_schema).get_node(TraceNode)
+
+
+# Tests
+# -----
+def test_build_docs_resources(trace_node):
+    scatter_node = trace_node.child_compound_datatypes[0]
+    resources = build_docs_resources([trace_node, scatter_node])
+
+    assert list(resources) == ['trace.scatter']
+    assert list(resources['trace.scatter']) == ['trace.scatter', 'trace.scatter.marker']
+    assert resources['trace.scatter']['trace.scatter']['opacity'] == 'Sets the opacity of the trace.'
+
+    # Descriptions are wrapped
+    size_description = resources['trace.scatter']['trace.scatter.marker']['size']
+    assert max(len(line) for line in size_description.split('\n')) <= 68
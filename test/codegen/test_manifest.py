@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+import pytest
+
+from codegen.manifest import CodegenManifest, compute_node_hash
+from codegen.utils import TraceNode
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def plotly_schema():
+    return {'traces': {'scatter': {'meta': {'description': 'Scatter trace'},
+                                   'attributes': {'type': 'scatter',
+                                                  'marker': {'size': {'valType': 'number',
+                                                                      'description': 'Marker size'},
+                                                             'role': 'object'},
+                                                  'opacity': {'valType': 'number',
+                                                              'description': 'Trace opacity'}}}}}
+
+
+# Tests
+# -----
+def test_node_hash_tracks_subtree(plotly_schema):
+    marker_node = TraceNode(plotly_schema, ('scatter', 'marker'))
+    marker_hash = compute_node_hash(marker_node)
+
+    # Change outside of the marker subtree
+    plotly_schema['traces']['scatter']['attributes']['opacity']['description'] = 'Changed'
+    assert compute_node_hash(TraceNode(plotly_schema, ('scatter', 'marker'))) == marker_hash
+
+    # Change inside of the marker subtree
+    plotly_schema['traces']['scatter']['attributes']['marker']['size']['description'] = 'Changed'
+    assert compute_node_hash(TraceNode(plotly_schema, ('scatter', 'marker'))) != marker_hash
+
+
+def test_manifest_roundtrip(tmpdir):
+    cache_dir = str(tmpdir)
+
+    manifest = CodegenManifest(cache_dir, 'gen1')
+    assert manifest.get_source('validators/trace', 'hash1') is None
+
+    manifest.set_source('validators/trace', 'hash1', 'class A: pass\n')
+    manifest.set_source('validators/layout', 'hash1', None)
+    manifest.save()
+
+    manifest = CodegenManifest(cache_dir, 'gen1')
+    assert manifest.get_source('validators/trace', 'hash1') == 'class A: pass\n'
+    assert manifest.get_source('validators/layout', 'hash1') == ''
+    assert manifest.get_source('validators/trace', 'hash2') is None
+
+
+def test_manifest_invalidated_by_generator(tmpdir):
+    cache_dir = str(tmpdir)
+
+    manifest = CodegenManifest(cache_dir, 'gen1')
+    manifest.set_source('validators/trace', 'hash1', 'class A: pass\n')
+    manifest.save()
+
+    assert CodegenManifest(cache_dir, 'gen2').get_source('validators/trace', 'hash1') is None
+    assert CodegenManifest(cache_dir, 'gen1', reuse=False).get_source('validators/trace', 'hash1') is None
+
+
+def test_manifest_module_sources(tmpdir):
+    cache_dir = str(tmpdir)
+
+    manifest = CodegenManifest(cache_dir, 'gen1')
+    manifest.set_source('validators/trace', 'hash1', OrderedDict([('_y', 'class Y: pass\n'),
+                                                                  ('_x', 'class X: pass\n')]))
+    manifest.save()
+
+    module_sources = CodegenManifest(cache_dir, 'gen1').get_source('validators/trace', 'hash1')
+    assert list(module_sources.items()) == [('_y', 'class Y: pass\n'), ('_x', 'class X: pass\n')]
@@ -0,0 +1,49 @@
+import importlib
+import sys
+
+import pytest
+
+from codegen.packages import write_package_init_pys
+from codegen.staging import StagedOutputTree
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def lazy_package(tmpdir):
+    output_tree = StagedOutputTree()
+    output_tree.append_source('class Bar:\n    pass\n', 'lazypkg/_bar.py')
+    output_tree.append_source('class Baz:\n    pass\n', 'lazypkg/sub/_baz.py')
+    write_package_init_pys(output_tree, package_names=('lazypkg',))
+    output_tree.commit(str(tmpdir))
+
+    sys.path.insert(0, str(tmpdir))
+    yield importlib.import_module('lazypkg')
+
+    sys.path.remove(str(tmpdir))
+    for module_name in list(sys.modules):
+        if module_name.split('.')[0] == 'lazypkg':
+            del sys.modules[module_name]
+
+
+# Tests
+# -----
+def test_package_init_pys(lazy_package):
+    assert lazy_package.__all__ == ['sub', 'Bar']
+    assert lazy_package.sub.__all__ == ['Baz']
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Lazy imports require Python 3.7+')
+def test_lazy_imports(lazy_package):
+    # Nothing is imported until first accessed
+    assert 'lazypkg._bar' not in sys.modules
+    assert 'lazypkg.sub' not in sys.modules
+
+    assert lazy_package.Bar.__name__ == 'Bar'
+    assert 'lazypkg._bar' in sys.modules
+
+    from lazypkg.sub import Baz
+    assert Baz.__module__ == 'lazypkg.sub._baz'
+
+    with pytest.raises(AttributeError):
+        lazy_package.Bogus
@@ -0,0 +1,41 @@
+import pytest
+
+from codegen.paths import get_property_path_entries, build_property_paths_py
+from codegen.utils import PlotlySchemaIndex, TraceNode
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def scatter_node():
+    plotly_schema = {
+        'traces': {'scatter': {'meta': {'description': 'Scatter trace'},
+                               'attributes': {'type': 'scatter',
+                                              'x': {'valType': 'data_array',
+                                                    'description': 'X coordinates'},
+                                              'marker': {'size': {'valType': 'number',
+                                                                  'description': 'Marker size'},
+                                                         'role': 'object'},
+                                              'dimensions': {'items': {'dimension': {
+                                                  'label': {'valType': 'string',
+                                                            'description': 'Label'},
+                                                  'role': 'object'}},
+                                                  'role': 'object'}}}}}
+    return PlotlySchemaIndex(plotly_schema).get_node(TraceNode, ('scatter',))
+
+
+# Tests
+# -----
+def test_property_path_entries(scatter_node):
+    assert get_property_path_entries(scatter_node) == [
+        ('x', ('', 'XValidator', 'simple')),
+        ('marker', ('', 'MarkerValidator', 'compound')),
+        ('marker.size', ('.marker', 'SizeValidator', 'simple')),
+        ('dimensions', ('', 'DimensionsValidator', 'compound_array')),
+        ('dimensions.label', ('.dimension', 'LabelValidator', 'simple'))]
+
+
+def test_build_property_paths_py(scatter_node):
+    namespace = {}
+    exec(build_property_paths_py(scatter_node), namespace)
+    assert namespace['property_paths']['marker.size'] == ('.marker', 'SizeValidator', 'simple')
@@ -0,0 +1,72 @@
+import json
+
+from codegen.profiler import CodegenProfiler, start_profiler, stop_profiler, profile_phase, profile_node
+
+
+# Tests
+# -----
+def test_phase_and_node_times():
+    profiler = CodegenProfiler()
+    with profiler.node('validators/trace/trace.scatter'):
+        with profiler.phase('build'):
+            pass
+        with profiler.phase('format'):
+            pass
+    with profiler.phase('write'):
+        pass
+
+    assert list(profiler.phase_seconds) == ['build', 'format', 'write']
+    assert profiler.phase_counts['build'] == 1
+    assert list(profiler.node_seconds['validators/trace/trace.scatter']) == ['build', 'format', 'total']
+
+
+def test_merge():
+    profiler = CodegenProfiler()
+    profiler.add_time('format', 1.0, 'a')
+
+    other = CodegenProfiler()
+    other.add_time('format', 2.0, 'a')
+    other.add_time('format', 0.5, 'b')
+
+    profiler.merge(other)
+    assert profiler.phase_seconds['format'] == 3.5
+    assert profiler.phase_counts['format'] == 3
+    assert profiler.node_seconds['a']['format'] == 3.0
+
+
+def test_hot_spots():
+    profiler = CodegenProfiler()
+    for node_key, seconds in [('a', 1.0), ('b', 3.0), ('c', 2.0)]:
+        profiler.node_seconds[node_key] = {'total': seconds}
+
+    assert [node_key for node_key, _ in profiler.hot_spots(top=2)] == ['b', 'c']
+
+
+def test_json_report(tmpdir):
+    profiler = CodegenProfiler()
+    profiler.add_time('format', 1.0, 'a')
+    profiler.stop()
+
+    report_path = str(tmpdir.join('reports', 'profile.json'))
+    profiler.write_json(report_path, jobs=2)
+    with open(report_path) as f:
+        report = json.load(f)
+
+    assert report['jobs'] == 2
+    assert report['phases'] == {'format': {'seconds': 1.0, 'count': 1}}
+    assert report['hot_spots'] == [{'node': 'a', 'format': 1.0}]
+    assert 'Codegen profile' in profiler.format_report()
+
+
+def test_active_profiler():
+    # Without an active profiler, the context managers are no-ops
+    with profile_node('a'), profile_phase('build'):
+        pass
+
+    profiler = start_profiler()
+    with profile_node('a'), profile_phase('build'):
+        pass
+
+    assert stop_profiler() is profiler
+    assert profiler.phase_counts == {'build': 1}
+    assert profiler.total_seconds is not None
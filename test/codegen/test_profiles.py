@@ -0,0 +1,48 @@
+import pytest
+
+from codegen import compute_codegen_nodes, load_plotly_schema
+from codegen.profiles import select_trace_types
+
+
+# Fixtures
+# --------
+@pytest.fixture(scope='module')
+def plotly_schema():
+    return load_plotly_schema()
+
+
+# Tests
+# -----
+def test_select_all_trace_types(plotly_schema):
+    assert select_trace_types(plotly_schema) is plotly_schema
+
+
+def test_select_trace_types(plotly_schema):
+    selected_schema = select_trace_types(plotly_schema, ['heatmap', 'bar'])
+
+    # Schema order is preserved and the default trace type is always included
+    assert list(selected_schema['traces']) == [t for t in plotly_schema['traces']
+                                               if t in ('scatter', 'bar', 'heatmap')]
+    assert selected_schema['layout'] is plotly_schema['layout']
+
+    # Input schema is unchanged
+    assert 'pie' in plotly_schema['traces']
+
+
+def test_select_unknown_trace_types(plotly_schema):
+    with pytest.raises(ValueError) as err:
+        select_trace_types(plotly_schema, ['bar', 'bogus'])
+
+    assert "['bogus']" in str(err.value)
+
+
+def test_selected_codegen_nodes(plotly_schema):
+    codegen_nodes = compute_codegen_nodes(select_trace_types(plotly_schema, ['bar']))
+
+    trace_types = {node.node_path[0] for node in codegen_nodes['trace'] if node.node_path}
+    assert trace_types == {'scatter', 'bar'}
+
+    # Trace specific layout properties of unselected traces are dropped
+    extra_layout_names = {node.name_property for node in codegen_nodes['extra_layout'].values()}
+    assert 'barmode' in extra_layout_names
+    assert 'boxmode' not in extra_layout_names
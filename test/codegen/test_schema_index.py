@@ -0,0 +1,46 @@
+import pytest
+
+from codegen.utils import PlotlySchemaIndex, TraceNode, TraceLayoutNode
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def plotly_schema():
+    return {'traces': {'scatter': {'meta': {'description': 'Scatter trace'},
+                                   'attributes': {'type': 'scatter',
+                                                  'marker': {'size': {'valType': 'number',
+                                                                      'description': 'Marker size'},
+                                                             'role': 'object'}},
+                                   'layoutAttributes': {'scattergap': {'valType': 'number',
+                                                                       'description': 'Gap'}}}}}
+
+
+@pytest.fixture()
+def schema_index(plotly_schema):
+    return PlotlySchemaIndex(plotly_schema)
+
+
+# Tests
+# -----
+def test_get_node(schema_index):
+    size_node = schema_index.get_node(TraceNode, ('scatter', 'marker', 'size'))
+    assert size_node.dir_str == 'trace.scatter.marker.size'
+    assert size_node.datatype == 'number'
+
+    # Nodes are built once and shared with their parents
+    marker_node = schema_index.get_node(TraceNode, ('scatter', 'marker'))
+    assert schema_index.get_node(TraceNode, ('scatter', 'marker', 'size')) is size_node
+    assert size_node.parent is marker_node
+    assert marker_node.child_datatypes == [size_node]
+
+
+def test_get_trace_layout_node(schema_index):
+    gap_node = schema_index.get_node(TraceLayoutNode, ('scattergap',), trace_name='scatter')
+    assert gap_node.dir_str == 'layout.scattergap'
+
+
+def test_get_missing_node(schema_index):
+    with pytest.raises(KeyError):
+        schema_index.get_node(TraceNode, ('scatter', 'bogus'))
+
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+import ipyplotly.basevalidators
+from codegen.specialized import build_validate_coerce_py
+
+
+# Utilities
+# ---------
+def build_validators(base_validator, options):
+    """
+    Build a generic validator and a validator with a specialized validate_coerce method for
+    base_validator and options
+    """
+    validate_coerce_py = build_validate_coerce_py(base_validator, options)
+    assert validate_coerce_py
+
+    namespace = {}
+    exec(f'import ipyplotly.basevalidators\n\n'
+         f'class SpecializedValidator({base_validator}):{validate_coerce_py}', namespace)
+
+    base_class = eval(base_validator, {'ipyplotly': ipyplotly})
+    return (base_class('prop', 'parent', **options),
+            namespace['SpecializedValidator']('prop', 'parent', **options))
+
+
+def validate_coerce_result(validator, v):
+    try:
+        return 'ok', validator.validate_coerce(v)
+    except ValueError as e:
+        return 'error', str(e)
+
+
+# Cases
+# -----
+values = [None, True, False, 0, 1, 2, -3, 0.5, 1.5, 400, 2 ** 40, float('nan'), np.float64(0.5), np.int64(2),
+          '', 'a', 'red', 'Red', 'rgb(255, 0, 0)', 'lines', 'markers', 'lines+markers', 'none', 'x', 'x2',
+          'legendonly', 'circle', [1, 2], (0.5, 'red'), np.array([1, 2]), {'a': 1}]
+
+cases = [
+    ('NumberValidator', {}),
+    ('NumberValidator', {'min': 0}),
+    ('NumberValidator', {'max': 1}),
+    ('NumberValidator', {'min': 0, 'max': 1, 'array_ok': True}),
+    ('IntegerValidator', {}),
+    ('IntegerValidator', {'min': 1}),
+    ('IntegerValidator', {'min': 0, 'max': 2, 'array_ok': True}),
+    ('StringValidator', {}),
+    ('StringValidator', {'no_blank': True, 'strict': True}),
+    ('StringValidator', {'values': ['a', 'red'], 'array_ok': True}),
+    ('BooleanValidator', {}),
+    ('EnumeratedValidator', {'values': [True, False, 'legendonly']}),
+    ('EnumeratedValidator', {'values': [0, 'circle', 1, 'square'], 'array_ok': True}),
+    ('EnumeratedValidator', {'values': ['/^x([2-9]|[1-9][0-9]+)?$/', 'lines']}),
+    ('ColorValidator', {}),
+    ('ColorValidator', {'array_ok': True, 'colorscale_path': 'trace.scatter.marker.colorscale'}),
+    ('AngleValidator', {}),
+    ('SubplotidValidator', {'dflt': 'x'}),
+    ('FlaglistValidator', {'flags': ['lines', 'markers'], 'extras': ['none'], 'array_ok': True}),
+    ('AnyValidator', {}),
+]
+
+
+# Tests
+# -----
+@pytest.mark.parametrize('validator_name,options', cases)
+def test_specialized_matches_generic(validator_name, options):
+    generic, specialized = build_validators('ipyplotly.basevalidators.' + validator_name, options)
+
+    for v in values:
+        generic_status, generic_res = validate_coerce_result(generic, v)
+        specialized_status, specialized_res = validate_coerce_result(specialized, v)
+
+        assert specialized_status == generic_status, v
+        assert type(specialized_res) == type(generic_res), v
+        if isinstance(generic_res, np.ndarray):
+            np.testing.assert_array_equal(specialized_res, generic_res)
+        elif generic_res == generic_res:  # Not nan
+            assert specialized_res == generic_res, v
+
+
+def test_no_specialization():
+    assert build_validate_coerce_py('ipyplotly.basevalidators.ColorscaleValidator', {}) == ''
+    assert build_validate_coerce_py('ipyplotly.basevalidators.AnyValidator', {'array_ok': True}) == ''
+    assert build_validate_coerce_py('ipyplotly.basevalidators.EnumeratedValidator', {'values': ['/^x\\d*$/']}) == ''
+
+
+def test_range_checks_eliminated():
+    assert '<=' not in build_validate_coerce_py('ipyplotly.basevalidators.NumberValidator', {})
+    assert '0 <= v <= 1' in build_validate_coerce_py('ipyplotly.basevalidators.NumberValidator',
+                                                     {'min': 0, 'max': 1})
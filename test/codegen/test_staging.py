@@ -0,0 +1,62 @@
+import os
+import os.path as opath
+
+import pytest
+
+from codegen.staging import StagedOutputTree
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def output_tree():
+    output_tree = StagedOutputTree()
+    output_tree.append_source('import a\n', 'validators/__init__.py')
+    output_tree.append_source(None, 'validators/empty/__init__.py')
+    output_tree.append_source('import b\n', 'validators/__init__.py')
+    output_tree.append_source('import c\n', 'datatypes/trace/__init__.py')
+    return output_tree
+
+
+# Tests
+# -----
+def test_staged_sources(output_tree):
+    assert output_tree.relpaths == ['validators/__init__.py', 'datatypes/trace/__init__.py']
+    assert output_tree.package_names == ['validators', 'datatypes']
+    assert output_tree.get_source('validators/__init__.py') == 'import a\n\n\nimport b\n'
+    assert output_tree.get_source('validators/empty/__init__.py') is None
+
+
+def test_commit_replaces_packages(output_tree, tmpdir):
+    outdir = str(tmpdir)
+    os.makedirs(opath.join(outdir, 'validators', 'stale'))
+    os.makedirs(opath.join(outdir, 'other'))
+
+    output_tree.commit(outdir)
+
+    assert sorted(os.listdir(outdir)) == ['datatypes', 'other', 'validators']
+    assert not opath.exists(opath.join(outdir, 'validators', 'stale'))
+    with open(opath.join(outdir, 'datatypes', 'trace', '__init__.py')) as f:
+        assert f.read() == 'import c\n'
+
+
+def test_failed_commit_restores_packages(output_tree, tmpdir, monkeypatch):
+    outdir = str(tmpdir)
+    for package_name in ['validators', 'datatypes']:
+        os.makedirs(opath.join(outdir, package_name, 'previous'))
+
+    # Fail the swap of the second package, after the first one is in place
+    rename = os.rename
+
+    def failing_rename(src, dst):
+        if dst == opath.join(outdir, 'datatypes') and opath.basename(src) == 'datatypes':
+            raise OSError('rename failed')
+        rename(src, dst)
+
+    monkeypatch.setattr(os, 'rename', failing_rename)
+    with pytest.raises(OSError):
+        output_tree.commit(outdir)
+
+    assert sorted(os.listdir(outdir)) == ['datatypes', 'validators']
+    assert os.listdir(opath.join(outdir, 'validators')) == ['previous']
+    assert os.listdir(opath.join(outdir, 'datatypes')) == ['previous']
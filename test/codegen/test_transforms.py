@@ -0,0 +1,56 @@
+import pytest
+
+from codegen import compute_codegen_nodes, load_plotly_schema
+from codegen.transforms import add_trace_transforms
+from codegen.validators import build_transforms_validator_py
+
+
+# Fixtures
+# --------
+@pytest.fixture(scope='module')
+def codegen_nodes():
+    return compute_codegen_nodes(load_plotly_schema(['scatter']))
+
+
+# Tests
+# -----
+def test_add_trace_transforms():
+    plotly_schema = {'traces': {'scatter': {'attributes': {'x': {'valType': 'data_array'}}}}}
+    transforms_schema = add_trace_transforms(plotly_schema)
+
+    assert transforms_schema['traces']['scatter']['attributes']['transforms']['valType'] == 'transforms'
+
+    # Input schema is unchanged
+    assert 'transforms' not in plotly_schema['traces']['scatter']['attributes']
+
+
+def test_transform_nodes(codegen_nodes):
+    base_transform_node = codegen_nodes['base_transform']
+
+    # Transforms without attributes are internal to plotly.js
+    transform_types = [node.plotly_name for node in base_transform_node.child_compound_datatypes]
+    assert sorted(transform_types) == ['aggregate', 'filter', 'groupby', 'sort']
+
+    # Transform objects are elements of the transforms property of traces
+    filter_node = [node for node in base_transform_node.child_compound_datatypes
+                   if node.plotly_name == 'filter'][0]
+    assert filter_node.name_property == 'transforms'
+    assert filter_node.name_class == 'Filter'
+    assert [node.plotly_name for node in filter_node.child_literals if node.plotly_name == 'type'] == ['type']
+
+    # The root node only generates datatypes
+    assert codegen_nodes['transform_types'] == [base_transform_node]
+    assert base_transform_node not in codegen_nodes['transform']
+    assert 'transform.aggregate' in [node.dir_str for node in codegen_nodes['transform']]
+
+
+def test_trace_transforms_node(codegen_nodes):
+    scatter_node = [node for node in codegen_nodes['trace'] if node.dir_str == 'trace.scatter'][0]
+    transforms_node = [node for node in scatter_node.child_datatypes if node.plotly_name == 'transforms'][0]
+    assert transforms_node.name_base_validator == 'ipyplotly.validators.TransformsValidator'
+
+
+def test_transforms_validator_py(codegen_nodes):
+    source = build_transforms_validator_py(codegen_nodes['base_transform'])
+    assert "'filter': 'Filter'," in source
+    assert 'ohlc' not in source
@@ -0,0 +1,85 @@
+import importlib
+import sys
+
+import pytest
+
+from codegen import compute_codegen_nodes, load_plotly_schema
+from codegen.packages import write_package_init_pys, get_module_class_names
+from codegen.staging import StagedOutputTree
+from codegen.validators import build_validator_table_py, format_validator_tables_py, VALIDATOR_TABLE_MODULE
+
+
+# Fixtures
+# --------
+@pytest.fixture(scope='module')
+def codegen_nodes():
+    return compute_codegen_nodes(load_plotly_schema(['scatter']))
+
+
+def get_node(codegen_nodes, group, dir_str):
+    return [node for node in codegen_nodes[group] if node.dir_str == dir_str][0]
+
+
+@pytest.fixture()
+def marker_table_package(codegen_nodes, tmpdir):
+    # Table module of scatter.marker, in a standalone package
+    marker_node = get_node(codegen_nodes, 'trace', 'trace.scatter.marker')
+    output_tree = StagedOutputTree()
+    output_tree.append_source(build_validator_table_py(marker_node), f'tablepkg/{VALIDATOR_TABLE_MODULE}.py')
+    write_package_init_pys(output_tree, package_names=('tablepkg',))
+    output_tree.commit(str(tmpdir))
+
+    sys.path.insert(0, str(tmpdir))
+    yield importlib.import_module('tablepkg')
+
+    sys.path.remove(str(tmpdir))
+    for module_name in list(sys.modules):
+        if module_name.split('.')[0] == 'tablepkg':
+            del sys.modules[module_name]
+
+
+# Tests
+# -----
+def test_module_class_names(codegen_nodes):
+    marker_node = get_node(codegen_nodes, 'trace', 'trace.scatter.marker')
+    class_names = get_module_class_names(build_validator_table_py(marker_node))
+    assert class_names == [node.name_validator for node in marker_node.child_datatypes]
+
+    assert get_module_class_names('import foo\n\n\nclass SizeValidator(foo.Bar):\n    pass\n') == ['SizeValidator']
+    assert get_module_class_names('property_paths = {}\n') == []
+
+
+def test_figure_validators_are_classes(codegen_nodes):
+    # Figure-level validators are written by separate tasks, so they aren't tables
+    figure_node = get_node(codegen_nodes, 'frame', '')
+    assert VALIDATOR_TABLE_MODULE not in format_validator_tables_py(figure_node)
+
+
+def test_table_validators(marker_table_package):
+    from ipyplotly.validators.trace.scatter.marker import SizeValidator, ColorbarValidator, SymbolValidator
+
+    # Classes are built on first access
+    table_module = importlib.import_module('tablepkg.' + VALIDATOR_TABLE_MODULE)
+    assert 'SizeValidator' not in vars(table_module)
+    size_validator = marker_table_package.SizeValidator()
+    assert 'SizeValidator' in vars(table_module)
+    assert 'SizeValidator' in dir(table_module)
+
+    # Validators match the generated validator classes
+    for table_validator, class_validator in [(size_validator, SizeValidator()),
+                                             (marker_table_package.SymbolValidator(), SymbolValidator())]:
+        assert type(table_validator).__name__ == type(class_validator).__name__
+        assert type(table_validator).__bases__ == type(class_validator).__bases__
+        assert vars(table_validator).keys() == vars(class_validator).keys()
+        assert table_validator.plotly_name == class_validator.plotly_name
+        assert table_validator.parent_name == class_validator.parent_name
+
+    assert size_validator.validate_coerce(3) == 3
+    with pytest.raises(ValueError):
+        size_validator.validate_coerce(-1)
+
+    # Datatype classes of compound validators are resolved on construction
+    assert marker_table_package.ColorbarValidator().data_class is ColorbarValidator().data_class
+
+    with pytest.raises(AttributeError):
+        marker_table_package.BogusValidator
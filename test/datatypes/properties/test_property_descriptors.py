@@ -0,0 +1,82 @@
+import inspect
+from unittest import mock
+
+import pytest
+
+from ipyplotly.basedatatypes import BasePlotlyType, SimpleProperty, CompoundProperty, ItemProperty
+from ipyplotly.basevalidators import StringValidator
+from ipyplotly.datatypes import Figure
+from ipyplotly.datatypes.trace import Scatter
+
+
+# Fixtures
+# --------
+class PlotlyObj(BasePlotlyType):
+    # No __slots__, so that methods can be mocked out on instances
+    prop1 = SimpleProperty()
+    prop2 = ItemProperty()
+
+
+@pytest.fixture()
+def plotly_obj():
+    plotly_obj = PlotlyObj('plotly_obj')
+    plotly_obj._validators['prop1'] = StringValidator('prop1', 'plotly_obj')
+    plotly_obj._validators['prop2'] = StringValidator('prop2', 'plotly_obj')
+    plotly_obj._send_update = mock.Mock()
+    return plotly_obj
+
+
+# Tests
+# -----
+def test_simple_property_orphan(plotly_obj):
+    assert plotly_obj.prop1 is None
+
+    plotly_obj.prop1 = 'Hello'
+    assert plotly_obj.prop1 == 'Hello'
+    assert plotly_obj._orphan_props == {'prop1': 'Hello'}
+    plotly_obj._send_update.assert_called_once_with('prop1', 'Hello')
+
+    with pytest.raises(ValueError):
+        plotly_obj.prop1 = 23
+
+
+def test_simple_property_parent(plotly_obj, parent):
+    plotly_obj._parent = parent
+    parent._get_child_props.return_value = {'prop1': 'Hello'}
+    parent._get_child_prop_defaults.return_value = {'prop1': 'Default', 'prop2': 'Default'}
+
+    assert plotly_obj.prop1 == 'Hello'
+    assert plotly_obj.prop2 == 'Default'
+
+    # Matches __getitem__
+    assert plotly_obj.prop1 == plotly_obj['prop1']
+    assert plotly_obj.prop2 == plotly_obj['prop2']
+
+
+def test_item_property(plotly_obj):
+    plotly_obj.prop2 = 'Hello'
+    assert plotly_obj.prop2 == 'Hello'
+    assert plotly_obj['prop2'] == 'Hello'
+
+
+def test_generated_properties():
+    assert isinstance(Scatter.__dict__['opacity'], SimpleProperty)
+    assert isinstance(Scatter.__dict__['marker'], CompoundProperty)
+    assert Scatter.__annotations__['marker'] == 'd_scatter.Marker'
+
+    # Properties keep their lazily loaded docstrings
+    assert inspect.getdoc(Scatter.opacity).startswith('Sets the opacity of the trace.')
+
+    fig = Figure()
+    fig.add_scatter(y=[1, 2], marker={'size': 3})
+    trace = fig.data[0]
+    assert trace.marker is trace['marker']
+    assert trace.marker.size == 3
+
+    trace.marker.size = 5
+    assert fig._data[0]['marker']['size'] == 5
+
+
+def test_set_unknown_property():
+    with pytest.raises(ValueError):
+        Scatter().bogus = 'Hello'
@@ -5,10 +5,15 @@ from ipyplotly.basevalidators import StringValidator
 
 # Fixtures
 # --------
+class PlotlyObj(BasePlotlyType):
+    # No __slots__, so that methods can be mocked out on instances
+    pass
+
+
 @pytest.fixture()
 def plotly_obj():
     # ### Setup plotly obj (make fixture eventually) ###
-    plotly_obj = BasePlotlyType('plotly_obj')
+    plotly_obj = PlotlyObj('plotly_obj')
 
     # Add validator
     validator = mock.Mock(spec=StringValidator,
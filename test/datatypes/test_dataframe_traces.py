@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ipyplotly.datatypes import Figure
+from ipyplotly.serializers import _py_to_js, NATIVE_DTYPES
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def df():
+    return pd.DataFrame({'t': pd.date_range('2020-01-01', periods=3),
+                         'a': [1.0, 2.0, 3.0],
+                         'b': pd.Categorical(['x', 'y', 'x'])},
+                        index=[5, 6, 7])
+
+
+# Tests
+# -----
+def test_add_traces_from_dataframe(df):
+    fig = Figure()
+    traces = fig.add_traces_from_dataframe(df, x='t', mode='lines')
+
+    assert [trace.name for trace in traces] == ['a', 'b']
+    assert fig.data == traces
+    assert fig._data[0]['x'].tolist() == ['2020-01-01', '2020-01-02', '2020-01-03']
+    assert fig._data[0]['y'].tolist() == [1.0, 2.0, 3.0]
+    assert fig._data[1]['y'].tolist() == ['x', 'y', 'x']
+    assert fig._data[1]['mode'] == 'lines'
+
+
+def test_add_traces_from_dataframe_index(df):
+    fig = Figure()
+    traces = fig.add_traces_from_dataframe(df, y='a', trace_type='bar', name='A')
+
+    assert traces[0].type == 'bar'
+    assert traces[0].name == 'A'
+    assert traces[0].x.tolist() == [5, 6, 7]
+
+
+def test_add_traces_from_dataframe_invalid_type(df):
+    with pytest.raises(ValueError):
+        Figure().add_traces_from_dataframe(df, trace_type='bogus')
+
+
+def test_repeated_values_sent_as_codes():
+    res = _py_to_js(np.array(['x', 'y', 'x', 'x'], dtype='object'), None, NATIVE_DTYPES)
+    assert res['categories'] == ['x', 'y']
+    assert np.frombuffer(res['codes']['buffer'], dtype=res['codes']['dtype']).tolist() == [0, 1, 0, 0]
+
+    # Arrays of distinct values that aren't all strings are sent as lists
+    assert _py_to_js(np.array(['x', 1], dtype='object'), None, NATIVE_DTYPES) == ['x', 1]
+
+
+def test_strings_sent_as_buffers():
+    res = _py_to_js(np.array(['ab', '\u00e9', '']), None, NATIVE_DTYPES)
+    offsets = np.frombuffer(res['offsets']['buffer'], dtype=res['offsets']['dtype'])
+    assert offsets.tolist() == [0, 2, 4, 4]
+    assert bytes(res['data']).decode('utf-8') == 'ab\u00e9'
+
+
+def test_mixed_objects_not_factorized():
+    # Values of different types that compare equal keep their types
+    v = np.array([True, 1, True, 1, 1.0, True], dtype='object')
+    res = _py_to_js(v, None, NATIVE_DTYPES)
+    assert res == [True, 1, True, 1, 1.0, True]
+    assert [type(e) for e in res] == [bool, int, bool, int, float, bool]
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from ipyplotly import serializers
+from ipyplotly.basevalidators import copy_to_contiguous_readonly_numpy_array
+from ipyplotly.serializers import DtypePolicy, NATIVE_DTYPES, COMPACT_DTYPES, _py_to_js
+
+
+# Fixtures
+# --------
+@pytest.fixture(autouse=True)
+def global_policy():
+    yield
+    serializers.set_dtype_policy()
+
+
+def to_js_array(v, policy):
+    res = _py_to_js(v, None, policy)
+    return np.frombuffer(res['buffer'], dtype=res['dtype'])
+
+
+# Tests
+# -----
+@pytest.mark.parametrize('val,dtype',
+                         [(np.arange(5.0), 'float64'),
+                          (np.arange(5, dtype='int16'), 'int16'),
+                          (np.arange(5, dtype='int64'), 'int32'),
+                          (np.array([0, 2 ** 31], dtype='int64'), 'uint32'),
+                          (np.array([-1, 2 ** 40], dtype='int64'), 'float64'),
+                          (np.arange(5, dtype='uint64'), 'int32'),
+                          (np.arange(5.0, dtype='>f8'), 'float64')])
+def test_native(val, dtype):
+    js_val = to_js_array(val, NATIVE_DTYPES)
+    assert js_val.dtype == dtype
+    assert np.array_equal(js_val, val)
+
+
+@pytest.mark.parametrize('val,dtype',
+                         [(np.array([0.5, 1.25, np.nan]), 'float32'),
+                          (np.linspace(0, 1, 101), 'float32'),
+                          (np.array([0.1, 1e-50]), 'float64'),
+                          (np.array([1e300]), 'float64'),
+                          (np.linspace(0, 1, 10 ** 6), 'float64'),
+                          (np.arange(5, dtype='int32'), 'uint8'),
+                          (np.array([-1, 200], dtype='int64'), 'int16'),
+                          (np.array([], dtype='int64'), 'int32')])
+def test_compact(val, dtype):
+    js_val = to_js_array(val, COMPACT_DTYPES)
+    assert js_val.dtype == dtype
+    assert np.allclose(js_val, val, rtol=1e-6, equal_nan=True)
+
+
+def test_epoch_timestamps():
+    # Epoch milliseconds of a 1-minute series are closer than the float32 spacing at their magnitude
+    x = np.arange(1.6e12, 1.6e12 + 100 * 60000, 60000.)
+    js_val = to_js_array(x, COMPACT_DTYPES)
+    assert js_val.dtype == 'float64'
+    assert np.array_equal(js_val, x)
+
+    # So are epoch seconds, even with the loosest tolerance
+    assert to_js_array(x / 1000, DtypePolicy(float32_rtol=0.5)).dtype == 'float64'
+
+    # Seconds since the start of the series stay distinct and in order
+    js_val = to_js_array((x - x[0]) / 1000, COMPACT_DTYPES)
+    assert js_val.dtype == 'float32'
+    assert np.all(np.diff(js_val) > 0)
+
+
+def test_int64_precision_warning():
+    with pytest.warns(UserWarning, match='2\*\*53'):
+        js_val = to_js_array(np.array([0, 2 ** 53 + 1], dtype='int64'), NATIVE_DTYPES)
+    assert js_val.dtype == 'float64'
+
+
+def test_lossless_float32():
+    policy = DtypePolicy(float32_rtol=0)
+    assert to_js_array(np.array([0.5, 1.25]), policy).dtype == 'float32'
+    assert to_js_array(np.array([0.1]), policy).dtype == 'float64'
+
+
+def test_figure_policy():
+    class Widget:
+        _dtype_policy = COMPACT_DTYPES
+
+    serializers.set_dtype_policy(NATIVE_DTYPES)
+    assert serializers.get_dtype_policy() is NATIVE_DTYPES
+    assert serializers.get_dtype_policy(Widget()) is COMPACT_DTYPES
+
+    res = _py_to_js({'x': [np.arange(3.0)]}, Widget())
+    assert res['x'][0]['dtype'] == 'float32'
+
+
+def test_no_int64_wraparound():
+    v = copy_to_contiguous_readonly_numpy_array([1, 2 ** 40])
+    assert v.dtype == 'int64'
+    assert v[1] == 2 ** 40
+
+    assert copy_to_contiguous_readonly_numpy_array([1, 2]).dtype == 'int32'
+
+
+def test_two_dimensional():
+    val = np.arange(6, dtype='int64').reshape(2, 3)
+    res = _py_to_js(val, None, NATIVE_DTYPES)
+    assert res['shape'] == (2, 3)
+    assert np.array_equal(np.frombuffer(res['buffer'], dtype=res['dtype']).reshape(res['shape']), val)
+
+    # Non-contiguous arrays are sent in C order
+    res = _py_to_js(val.T, None, NATIVE_DTYPES)
+    assert res['shape'] == (3, 2)
+    assert np.array_equal(np.frombuffer(res['buffer'], dtype=res['dtype']).reshape(res['shape']), val.T)
+
+
+def test_heatmap_figure():
+    from ipyplotly.datatypes import Figure
+
+    z = np.arange(6.0).reshape(2, 3)
+    fig = Figure()
+    fig.add_heatmap(z=z)
+    assert fig._data[0]['z'].shape == (2, 3)
+
+    res = _py_to_js(fig._data, None, NATIVE_DTYPES)
+    assert res[0]['z']['shape'] == (2, 3)
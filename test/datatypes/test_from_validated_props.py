@@ -0,0 +1,57 @@
+from copy import deepcopy
+
+import numpy as np
+from ipyplotly.datatypes import Layout, Frame
+from ipyplotly.datatypes.trace import Scatter
+from ipyplotly.validators import LayoutValidator
+
+
+# Tests
+# -----
+def test_copy_trace():
+    scatter = Scatter(x=[1, 2, 3], marker={'color': 'red', 'line': {'width': 2}}, name='a')
+    copy = Scatter._from_validated_props('scatter', deepcopy(scatter._props))
+
+    assert copy._props.keys() == scatter._props.keys()
+    assert copy.plotly_name == 'scatter'
+    assert copy.marker.line.width == 2
+    assert copy.marker.line.parent is copy.marker
+    assert copy.marker.parent is copy
+    assert copy.selected.marker.color is None
+    assert copy._click_callbacks == ()
+    np.testing.assert_array_equal(copy.x, [1, 2, 3])
+
+    # Copy is independent of the original
+    copy.marker.line.width = 3
+    copy.name = 'b'
+    assert scatter.marker.line.width == 2
+    assert scatter.name == 'a'
+    assert copy._props['marker']['line']['width'] == 3
+
+
+def test_copy_layout():
+    layout = Layout(title='t', xaxis2={'title': 'x2'},
+                    annotations=[{'text': 'a'}, {'text': 'b'}])
+    copy = LayoutValidator().validate_coerce(layout)
+
+    assert copy is not layout
+    assert copy._props == layout._props
+    assert copy.xaxis2.title == 'x2'
+    assert copy.xaxis2.plotly_name == 'xaxis2'
+    assert [a.text for a in copy.annotations] == ['a', 'b']
+    assert copy.annotations[1].plotly_name == 'annotations'
+    assert copy.annotations[1].parent is copy
+
+    copy.annotations[1].text = 'c'
+    assert layout.annotations[1].text == 'b'
+
+
+def test_copy_frame():
+    frame = Frame(name='f', data=[Scatter(y=[1, 2])], layout={'title': 't'})
+    copy = Frame._from_validated_props('frames', deepcopy(frame._props))
+
+    assert copy._props.keys() == frame._props.keys()
+    assert isinstance(copy.data[0], Scatter)
+    assert copy.data[0].plotly_name == 'scatter'
+    assert copy.data[0].parent is copy
+    assert copy.layout.title == 't'
@@ -0,0 +1,52 @@
+import inspect
+
+import pytest
+
+from ipyplotly import lazydocs
+from ipyplotly.datatypes import Figure
+from ipyplotly.datatypes.trace import Scatter
+from ipyplotly.datatypes.trace.scatter import Line
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def slim():
+    lazydocs.set_slim(True)
+    yield
+    lazydocs.set_slim(False)
+
+
+# Tests
+# -----
+def test_class_docs():
+    assert Line.__doc__.startswith('Construct a new Line object')
+    assert 'width\n    Sets the line width (in px).' in Line.__doc__
+    assert Figure.__doc__.startswith('Create a new Figure instance')
+
+
+def test_property_docs():
+    doc = inspect.getdoc(Scatter.line)
+    assert doc.startswith("The 'line' property is an instance of")
+    assert 'Sets the line width (in px).' in doc
+
+
+def test_method_docs():
+    fig = Figure()
+    assert inspect.isfunction(Figure.add_scatter)
+    assert inspect.ismethod(fig.add_scatter)
+    assert 'help(ipyplotly.datatypes.trace.Scatter)' in fig.add_scatter.__doc__
+    assert 'self' not in inspect.signature(fig.add_scatter).parameters
+    assert Figure.__init__.__doc__.strip().startswith('Create a new Figure instance')
+
+    fig.add_scatter(y=[1, 2])
+    assert len(fig.data) == 1
+
+
+def test_slim(slim):
+    assert Scatter.line.__doc__ is None
+
+    # Error messages still include property descriptions
+    with pytest.raises(ValueError) as validation_failure:
+        Scatter(line={'bogus': 1})
+    assert 'Sets the line width (in px).' in str(validation_failure.value)
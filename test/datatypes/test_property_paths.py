@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from ipyplotly.datatypes import Figure
+from ipyplotly.propertypaths import get_property_path_table
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def fig():
+    return Figure(data=[{'type': 'scatter', 'y': [1, 2]}, {'type': 'bar', 'y': [3]}])
+
+
+# Tests
+# -----
+def test_property_path_table():
+    path_table = get_property_path_table('ipyplotly.validators.trace.scatter')
+    assert path_table is get_property_path_table('ipyplotly.validators.trace.scatter')
+    assert path_table.get_kind('marker') == 'compound'
+    assert path_table.get_kind('marker.line.width') == 'simple'
+    assert path_table.get_kind('marker.bogus') is None
+
+    validator = path_table.get_validator('marker.line.width')
+    assert validator.parent_name == 'trace.scatter.marker.line'
+    assert path_table.get_validator('marker.line.width') is validator
+
+
+def test_restyle_validates(fig):
+    fig.restyle({'marker.line.width': 3, 'x': [[1, 2]]})
+    assert fig._data[0]['marker'] == {'line': {'width': 3}}
+    assert fig._data[1]['marker'] == {'line': {'width': 3}}
+    assert isinstance(fig._data[0]['x'], np.ndarray)
+
+    with pytest.raises(ValueError):
+        fig.restyle({'marker.line.width': 'wide'})
+
+    with pytest.raises(ValueError):
+        fig.restyle({'marker.bogus': 1})
+
+
+def test_relayout_validates(fig):
+    fig.relayout({'xaxis2.range': [0, 1],
+                  'annotations[1].text': 'Hello',
+                  'shapes': [{'x0': 1}]})
+    assert fig._layout['xaxis2'] == {'range': [0, 1]}
+    assert fig._layout['annotations'] == [{}, {'text': 'Hello'}]
+    assert fig._layout['shapes'] == [{'x0': 1}]
+
+    with pytest.raises(ValueError):
+        fig.relayout({'xaxis.bogus': 1})
+
+    with pytest.raises(ValueError):
+        fig.relayout({'annotations[0].text': 1 + 2j})
+
+
+def test_invalid_restyle_leaves_data_unchanged(fig):
+    with pytest.raises(ValueError):
+        fig.restyle({'marker.size': 5, 'marker.color': 'bad'}, [0])
+    assert 'marker' not in fig._data[0]
+
+    # Invalid for the second trace only
+    with pytest.raises(ValueError):
+        fig.restyle({'opacity': [0.5, 2]}, [0, 1])
+    assert 'opacity' not in fig._data[0]
+
+
+def test_invalid_relayout_leaves_layout_unchanged(fig):
+    with pytest.raises(ValueError):
+        fig.relayout({'xaxis.range': [0, 1], 'xaxis.bogus': 1})
+    assert 'xaxis' not in fig._layout
+
+
+def test_invalid_update_leaves_figure_unchanged(fig):
+    with pytest.raises(ValueError):
+        fig.update(style={'marker.color': 'bad'}, layout={'title': 'Title'})
+    assert 'title' not in fig._layout
+    assert 'marker' not in fig._data[0]
+
+
+def test_invalid_batch_cleared(fig):
+    with pytest.raises(ValueError):
+        with fig.batch_update():
+            fig._restyle_child(fig.data[0], 'marker.bogus', 1)
+
+    assert not fig._batch_style_commands
+    with fig.batch_update():
+        fig.data[0].opacity = 0.5
+    assert fig._data[0]['opacity'] == 0.5
@@ -0,0 +1,45 @@
+from ipyplotly.datatypes import Layout
+from ipyplotly.datatypes.trace import Scatter
+
+
+# Tests
+# -----
+def test_no_instance_dict():
+    scatter = Scatter(marker={'color': 'red'})
+    assert not hasattr(scatter, '__dict__')
+    assert not hasattr(scatter.marker, '__dict__')
+    assert not hasattr(Layout(), '__dict__')
+
+
+def test_lazy_containers():
+    scatter = Scatter()
+    assert not scatter.marker.line._compound_props
+    assert not scatter._change_callbacks
+    assert scatter._hover_callbacks == ()
+
+    scatter.on_change(lambda *args: None, 'x')
+    assert len(scatter._change_callbacks) == 1
+    assert not Scatter()._change_callbacks
+
+
+def test_trace_callbacks():
+    scatter = Scatter()
+    callback1, callback2 = lambda *args: None, lambda *args: None
+
+    scatter.on_click(callback1)
+    scatter.on_click(callback2, append=True)
+    assert scatter._click_callbacks == (callback1, callback2)
+
+    scatter.on_click(callback2)
+    assert scatter._click_callbacks == (callback2,)
+    assert Scatter()._click_callbacks == ()
+
+
+def test_layout_subplot_attributes():
+    layout = Layout()
+    assert not layout._subplotid_props
+
+    layout.xaxis3 = {}
+    assert layout.xaxis3.plotly_name == 'xaxis3'
+    assert 'xaxis3' in dir(layout)
+    assert not Layout()._subplotid_props
@@ -0,0 +1,97 @@
+import pytest
+
+from ipyplotly.datatypes import Figure
+from ipyplotly.datatypes.trace import Scatter
+from ipyplotly.datatypes.transform import Filter, Sort
+
+
+# Fixtures
+# --------
+@pytest.fixture()
+def figure():
+    fig = Figure()
+    fig.restyle_msgs = []
+    fig._send_restyle_msg = lambda restyle, trace_indexes=None: fig.restyle_msgs.append((restyle, trace_indexes))
+    return fig
+
+
+# Tests
+# -----
+def test_construct_transforms():
+    trace = Scatter(transforms=[{'type': 'filter', 'target': 'y', 'operation': '>', 'value': 1},
+                                Sort(target='x')])
+
+    filter_transform, sort_transform = trace.transforms
+    assert isinstance(filter_transform, Filter)
+    assert filter_transform.type == 'filter'
+    assert filter_transform.value == 1
+    assert sort_transform.type == 'sort'
+    assert trace._props['transforms'] == [{'target': 'y', 'operation': '>', 'value': 1, 'type': 'filter'},
+                                          {'target': 'x', 'type': 'sort'}]
+
+
+def test_invalid_transforms():
+    with pytest.raises(ValueError):
+        Scatter(transforms=[{'type': 'bogus'}])
+
+    with pytest.raises(ValueError):
+        Scatter(transforms=[{'target': 'y'}])
+
+    with pytest.raises(ValueError):
+        Scatter(transforms=[Scatter()])
+
+    with pytest.raises(ValueError):
+        Filter(operation='bogus')
+
+
+def test_update_transform(figure):
+    figure.add_scatter(y=[1, 2, 3], transforms=[{'type': 'filter', 'target': 'y', 'operation': '>', 'value': 1}])
+
+    # Changing a transform only sends the transform property
+    figure.data[0].transforms[0].value = 2
+    assert figure.restyle_msgs == [({'transforms.0.value': [2]}, 0)]
+    assert figure._data[0]['transforms'][0]['value'] == 2
+
+
+def test_restyle_transforms(figure):
+    figure.add_scatter(y=[1, 2, 3])
+    figure.restyle({'transforms': [[{'type': 'sort', 'target': 'y'}]]}, 0)
+    assert figure._data[0]['transforms'] == [{'target': 'y', 'type': 'sort'}]
+
+    with pytest.raises(ValueError):
+        figure.restyle({'transforms': [[{'type': 'bogus'}]]}, 0)
+
+
+def test_batch_update_transform(figure):
+    figure.add_scatter(y=[1, 2, 3], transforms=[{'type': 'filter', 'target': 'y', 'operation': '>', 'value': 1}])
+    figure.update_msgs = []
+    figure._send_update_msg = lambda style, layout, trace_indexes=None: figure.update_msgs.append(
+        (style, layout, trace_indexes))
+
+    with figure.batch_update():
+        figure.data[0].transforms[0].value = 3
+    assert figure.update_msgs == [({'transforms.0.value': [3]}, {}, [0])]
+    assert figure._data[0]['transforms'][0]['value'] == 3
+
+    # Later batches are unaffected
+    with figure.batch_update():
+        figure.data[0].opacity = 0.5
+    assert figure.update_msgs[1] == ({'opacity': [0.5]}, {}, [0])
+
+
+def test_restyle_transform_property(figure):
+    figure.add_scatter(y=[1, 2, 3], transforms=[{'type': 'filter', 'target': 'y', 'operation': '>', 'value': 1},
+                                                {'type': 'aggregate', 'aggregations': [{'target': 'y'}]}])
+    figure.restyle({'transforms[0].operation': '<', 'transforms[1].aggregations[0].func': 'avg'}, 0)
+    assert figure._data[0]['transforms'][0]['operation'] == '<'
+    assert figure._data[0]['transforms'][1]['aggregations'] == [{'target': 'y', 'func': 'avg'}]
+
+    for style in [{'transforms[0].operation': 'bogus'},
+                  {'transforms[0].bogus': 1},
+                  {'transforms[1].value': 1},
+                  {'transforms.value': 1}]:
+        with pytest.raises(ValueError):
+            figure.restyle(style, 0)
+
+    assert figure._data[0]['transforms'][0] == {'target': 'y', 'operation': '<', 'value': 1, 'type': 'filter'}
+
@@ -0,0 +1,74 @@
+from types import MappingProxyType
+
+import pytest
+
+from ipyplotly.basedatatypes import BasePlotlyType, BaseLayoutType
+from ipyplotly.basevalidators import StringValidator
+
+
+# Fixtures
+# --------
+class Obj(BasePlotlyType):
+    _build_count = 0
+
+    @staticmethod
+    def _build_validators():
+        Obj._build_count += 1
+        return {'prop1': StringValidator('prop1', 'obj')}
+
+
+class SubObj(Obj):
+
+    @staticmethod
+    def _build_validators():
+        return {'prop2': StringValidator('prop2', 'obj')}
+
+
+class Layout(BaseLayoutType):
+
+    @staticmethod
+    def _build_validators():
+        return {'prop1': StringValidator('prop1', 'layout')}
+
+
+# Tests
+# -----
+def test_shared_registry():
+    obj1 = Obj('obj')
+    obj2 = Obj('obj')
+
+    assert Obj._build_count == 1
+    assert obj1._validators is obj2._validators
+    assert isinstance(obj1._validators, MappingProxyType)
+    assert 'prop1' in obj1
+
+    with pytest.raises(TypeError):
+        obj1._validators['prop2'] = StringValidator('prop2', 'obj')
+
+
+def test_subclass_registry():
+    assert 'prop2' in SubObj('obj')
+    assert 'prop1' not in SubObj('obj')
+
+
+def test_no_registry():
+    obj1 = BasePlotlyType('obj')
+    obj2 = BasePlotlyType('obj')
+    assert obj1._validators == {}
+    assert obj1._validators is not obj2._validators
+
+
+def test_layout_subplot_validators():
+    layout1 = Layout('layout', xaxis2={})
+    layout2 = Layout('layout')
+
+    # Subplot validators are per instance, but the registry is still shared
+    assert 'xaxis2' in layout1
+    assert layout1.xaxis2.plotly_name == 'xaxis2'
+    assert 'prop1' in layout1
+    assert 'xaxis2' not in layout2
+    assert 'xaxis2' not in Layout._get_class_validators()
+
+    layout2.xaxis2 = {}
+    assert layout1._validators['xaxis2'] is layout2._validators['xaxis2']
+    assert layout2._validators['xaxis2'].plotly_name == 'xaxis2'
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ipyplotly.basevalidators import (arrow_to_numpy_array, is_array, CategoricalArray, DataArrayValidator,
+                                      EnumeratedValidator, pandas_to_numpy_array)
+from ipyplotly.datatypes import Figure
+from ipyplotly.serializers import _py_to_js, NATIVE_DTYPES
+
+pa = pytest.importorskip('pyarrow')
+
+
+# arrow_to_numpy_array
+# --------------------
+def test_is_array():
+    assert is_array(pa.array([1, 2]))
+    assert is_array(pa.chunked_array([[1, 2], [3]]))
+
+
+def test_numeric_zero_copy():
+    arrow_array = pa.array(np.arange(5.0))
+    v = arrow_to_numpy_array(arrow_array)
+    assert v.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert not v.flags['WRITEABLE']
+
+    # DataArrayValidator adopts the buffer, Arrow buffers are immutable
+    coerce_val = DataArrayValidator('prop', 'parent').validate_coerce(arrow_array)
+    assert np.shares_memory(coerce_val, v)
+
+
+@pytest.mark.parametrize('val,expected',
+                         [(pa.array([1, None, 3]), [1.0, np.nan, 3.0]),
+                          (pa.chunked_array([[1.0], [2.0, 3.0]]), [1.0, 2.0, 3.0]),
+                          (pa.array(['a', None]), ['a', None]),
+                          (pa.array(['b', 'a', 'b']).dictionary_encode(), ['b', 'a', 'b']),
+                          (pa.array([0, 86400 * 1000 + 5], type=pa.timestamp('ms')),
+                           ['1970-01-01', '1970-01-02T00:00:00.005']),
+                          (pa.array([0, None], type=pa.date32()), ['1970-01-01', None])])
+def test_conversion(val, expected):
+    v = arrow_to_numpy_array(val)
+    assert len(v) == len(expected)
+    for e, expected_e in zip(v.tolist(), expected):
+        assert e == expected_e or (e != e and expected_e != expected_e)
+
+
+def test_dictionary_codes():
+    v = arrow_to_numpy_array(pa.array(['b', 'a', None, 'b']).dictionary_encode())
+    assert isinstance(v, CategoricalArray)
+    assert v.codes.tolist() == [0, 1, -1, 0]
+    assert v.tolist() == ['b', 'a', None, 'b']
+
+
+# Timezone-aware timestamps are sent as wall times, whether they come from pandas or Arrow
+def test_tz_aware_timestamps():
+    series = pd.Series(pd.to_datetime(['2020-01-01 12:00:00', '2020-06-01 12:30:01', None])
+                       .tz_localize('America/New_York'))
+    expected = ['2020-01-01T12:00', '2020-06-01T12:30:01', None]
+    assert pandas_to_numpy_array(series).tolist() == expected
+    assert arrow_to_numpy_array(pa.array(series)).tolist() == expected
+
+
+# Validators
+# ----------
+# String arrays are kept as Arrow arrays, and sent from their own buffers
+@pytest.mark.parametrize('val,expected',
+                         [(pa.array(['ab', '\u00e9', None, '']), ['ab', '\u00e9', None, '']),
+                          (pa.array(['ab', '\u00e9', None, 'xyz'])[1:], ['\u00e9', None, 'xyz']),
+                          (pa.chunked_array([['a', 'b'], [None, 'cd']]), ['a', 'b', None, 'cd']),
+                          (pa.array(['ab', 'cde'], type=pa.large_string())[1:], ['cde']),
+                          (pa.array([], type=pa.string()), [])])
+def test_strings_sent_from_buffers(val, expected):
+    v = DataArrayValidator('prop', 'parent').validate_coerce(val)
+    assert isinstance(v, pa.Array)
+    assert v.to_pylist() == expected
+
+    res = _py_to_js(v, None, NATIVE_DTYPES)
+    offsets = np.frombuffer(res['offsets']['buffer'], dtype=res['offsets']['dtype'])
+    nulls = np.frombuffer(res['nulls']['buffer'], dtype=res['nulls']['dtype']) if 'nulls' in res else None
+    data = bytes(res['data'])
+    assert [None if nulls is not None and nulls[i] else data[offsets[i]:offsets[i + 1]].decode('utf-8')
+            for i in range(len(offsets) - 1)] == expected
+
+
+def test_enumerated():
+    validator = EnumeratedValidator('prop', 'parent', ['a', 'b'], array_ok=True)
+    assert validator.validate_coerce(pa.array(['a', 'b']).dictionary_encode()).tolist() == ['a', 'b']
+
+    with pytest.raises(ValueError):
+        validator.validate_coerce(pa.array(['a', 'c']))
+
+
+def test_add_traces_from_table():
+    table = pa.table({'t': pa.array([1.0, 2.0]), 'a': pa.array([3.0, 4.0]), 'b': pa.array([5.0, 6.0])})
+    fig = Figure()
+    traces = fig.add_traces_from_dataframe(table, x='t')
+
+    assert [trace.name for trace in traces] == ['a', 'b']
+    assert fig._data[1]['x'].tolist() == [1.0, 2.0]
+    assert fig._data[1]['y'].tolist() == [5.0, 6.0]
+
+
+def test_string_trace():
+    fig = Figure()
+    fig.add_bar(x=pa.array(['a', 'b']), y=[1, 2])
+    assert fig.data[0].x.to_pylist() == ['a', 'b']
+    assert fig.to_dict()['data'][0]['x'].to_pylist() == ['a', 'b']
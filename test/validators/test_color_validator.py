@@ -155,6 +155,52 @@ def test_rejection_aok_colorscale(val, validator_aok_colorscale: ColorValidator)
     assert 'Invalid element(s)' in str(validation_failure.value)
 
 
+# Arrays of strings
+# -----------------
+# Validated once per distinct string, with the same results as validating each element
+def validate_coerce_elementwise(validator, val):
+    validated = [ColorValidator.perform_validate_coerce(e, allow_number=validator.numbers_allowed()) for e in val]
+    invalid_els = [e for e, validated_e in zip(val, validated) if validated_e is None]
+    dtype = 'object' if validator.numbers_allowed() else 'unicode'
+    return np.array(validated, dtype=dtype), invalid_els
+
+
+@pytest.mark.parametrize('val',
+                         [['red', 'Red', 'rgb(255, 0, 0)', 'red', '#ABCDEF', 'dark blue'],
+                          ('blue',),
+                          np.array(['red', 'hsl(0, 100%, 50%)', 'red', 'Light Green']),
+                          np.array(['red', 'BLUE', 'blue'], dtype='object')])
+def test_acceptance_str_array(val, validator_aok: ColorValidator, validator_aok_colorscale: ColorValidator):
+    for validator in (validator_aok, validator_aok_colorscale):
+        coerce_val = validator.validate_coerce(val)
+        expected, _ = validate_coerce_elementwise(validator, val)
+
+        assert coerce_val.dtype == expected.dtype
+        assert np.array_equal(coerce_val, expected)
+        assert not coerce_val.flags['WRITEABLE']
+
+
+@pytest.mark.parametrize('val',
+                         [['redd', 'red', 'redd', 'bogus'],
+                          np.array(['red', 'rgbbb(1, 2, 3)', 'blue'])])
+def test_rejection_str_array(val, validator_aok: ColorValidator):
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    _, invalid_els = validate_coerce_elementwise(validator_aok, val)
+    assert 'Invalid elements include: %s' % invalid_els[:10] in str(validation_failure.value)
+
+
+def test_factorize_strs():
+    codes, uniques = ColorValidator.factorize_strs(['red', 'blue', 'red'])
+    assert codes.tolist() == [0, 1, 0]
+    assert uniques == ['red', 'blue']
+
+    # Only non-empty arrays of strings are factorized
+    for val in [[], ['red', 1], [1, 'red'], ['red', ['blue']], np.array([1, 2])]:
+        assert ColorValidator.factorize_strs(val) is None
+
+
 # Description
 # -----------
 # Test dynamic description logic
@@ -1,5 +1,6 @@
 import pytest
-from ipyplotly.basevalidators import DataArrayValidator
+from ipyplotly import basevalidators
+from ipyplotly.basevalidators import DataArrayValidator, copy_to_contiguous_readonly_numpy_array
 import numpy as np
 
 
@@ -31,3 +32,65 @@ def test_rejection(val, validator: DataArrayValidator):
         validator.validate_coerce(val)
 
     assert 'Invalid value' in str(validation_failure.value)
+
+
+# Zero-copy mode
+# --------------
+@pytest.fixture()
+def zero_copy():
+    basevalidators.set_zero_copy(True)
+    yield
+    basevalidators.set_zero_copy(False)
+
+
+def test_copy_by_default(validator: DataArrayValidator):
+    val = np.arange(5.0)
+    coerce_val = validator.validate_coerce(val)
+    assert not np.shares_memory(coerce_val, val)
+    assert val.flags['WRITEABLE']
+    assert not coerce_val.flags['WRITEABLE']
+
+
+def test_zero_copy(validator: DataArrayValidator, zero_copy):
+    val = np.arange(5.0)
+    coerce_val = validator.validate_coerce(val)
+    assert np.shares_memory(coerce_val, val)
+    assert not val.flags['WRITEABLE']
+    assert not coerce_val.flags['WRITEABLE']
+
+
+@pytest.mark.parametrize('val', [
+    np.arange(10.0)[::2], np.arange(5), np.arange(5, dtype='float32'), np.array(['a', 'b']), [1.0, 2.0]
+])
+def test_zero_copy_conversion(val, validator: DataArrayValidator, zero_copy):
+    # Arrays that need a dtype or layout conversion are copied
+    coerce_val = validator.validate_coerce(val)
+    assert not np.shares_memory(coerce_val, val)
+    assert np.array_equal(coerce_val, val)
+    assert coerce_val.dtype == copy_to_contiguous_readonly_numpy_array(val).dtype
+
+
+def test_zero_copy_figure(zero_copy):
+    from ipyplotly.datatypes import Figure
+
+    x = np.random.rand(10)
+    y = np.random.rand(10)
+    fig = Figure(data=[{'x': x}])
+    fig.add_scatter(y=y)
+    assert np.shares_memory(fig._data[0]['x'], x)
+    assert np.shares_memory(fig._data[1]['y'], y)
+
+
+def test_two_dimensional(validator: DataArrayValidator):
+    val = np.arange(6.0).reshape(2, 3)
+    coerce_val = validator.validate_coerce(val)
+    assert coerce_val.shape == (2, 3)
+    assert np.array_equal(coerce_val, val)
+    assert not coerce_val.flags['WRITEABLE']
+
+
+def test_zero_copy_two_dimensional(validator: DataArrayValidator, zero_copy):
+    val = np.random.rand(4, 5)
+    coerce_val = validator.validate_coerce(val)
+    assert np.shares_memory(coerce_val, val)
+    assert coerce_val.shape == (4, 5)
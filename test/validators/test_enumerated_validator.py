@@ -129,3 +129,32 @@ def test_rejection_by_element_aok(val, validator_aok_re):
         validator_aok_re.validate_coerce(val)
 
     assert 'Invalid element(s)' in str(validation_failure.value)
+
+
+# Literal set and combined regex
+# ------------------------------
+def test_numeric_array_aok(validator_aok):
+    assert validator_aok.validate_coerce(np.array([4, 4, 4])).tolist() == [4, 4, 4]
+
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(np.array([4.0, 3.0, 4.0, 5.0]))
+
+    assert 'Invalid elements include: [3.0, 5.0]' in str(validation_failure.value)
+
+
+def test_combined_regex():
+    validator = EnumeratedValidator('prop', 'parent', ['/^x([2-9]|[1-9][0-9]+)?$/', '/^y$/', 'free'])
+    for val in ['x', 'x2', 'x10', 'y', 'free']:
+        assert validator.validate_coerce(val) == val
+
+    for val in ['x1', 'y2', 'xy', 'free2', 2]:
+        with pytest.raises(ValueError):
+            validator.validate_coerce(val)
+
+
+def test_unhashable_values():
+    validator = EnumeratedValidator('prop', 'parent', [[1, 2], 'first'])
+    assert validator.validate_coerce([1, 2]) == [1, 2]
+    assert validator.validate_coerce('first') == 'first'
+    with pytest.raises(ValueError):
+        validator.validate_coerce([1])
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from ipyplotly.basevalidators import (factorize_array, get_invalid_elements, take_uniques, EnumeratedValidator,
+                                      FlaglistValidator, StringValidator)
+
+
+# Factorization
+# -------------
+@pytest.mark.parametrize('val,codes,uniques',
+                         [(['b', 'a', 'b'], [0, 1, 0], ['b', 'a']),
+                          (('b', 'a', 'b'), [0, 1, 0], ['b', 'a']),
+                          (np.array(['b', 'a', 'b']), [0, 1, 0], ['b', 'a']),
+                          (np.array([3, 1, 3]), [1, 0, 1], [1, 3]),
+                          (np.array([True, False]), [1, 0], [False, True]),
+                          ([], [], [])])
+def test_factorize_array(val, codes, uniques):
+    factorized_codes, factorized_uniques = factorize_array(val)
+    assert factorized_codes.tolist() == codes
+    assert factorized_uniques == uniques
+    assert [factorized_uniques[c] for c in factorized_codes] == list(val)
+
+
+def test_factorize_unhashable():
+    assert factorize_array(['a', ['b']]) is None
+
+
+def test_get_invalid_elements():
+    val = ['a', 'b', 'a', 'c'] * 10
+    codes, uniques = factorize_array(val)
+    assert get_invalid_elements(val, codes, [False, False, False]) == []
+    assert get_invalid_elements(val, codes, [True, False, False]) == ['a'] * 10
+
+
+def test_take_uniques():
+    val = take_uniques(['a', 'bb'], np.array([1, 0, 1]), dtype='unicode')
+    assert val.tolist() == ['bb', 'a', 'bb']
+    assert val.dtype == '<U2'
+    assert not val.flags['WRITEABLE']
+
+
+# Validators
+# ----------
+# Same results as validating each element
+def test_enumerated_array():
+    validator = EnumeratedValidator('prop', 'parent', values=['circle', '/^x([2-9]|[1-9][0-9]+)?$/', 3],
+                                    array_ok=True)
+    val = ['circle', 'x2', 3, 'circle'] * 100
+    assert validator.validate_coerce(val).tolist() == val
+    assert validator.validate_coerce(np.array([3, 3])).tolist() == [3, 3]
+
+    with pytest.raises(ValueError) as validation_failure:
+        validator.validate_coerce(['circle', 'x1', 4, 'x1'])
+
+    assert "Invalid elements include: ['x1', 4, 'x1']" in str(validation_failure.value)
+
+
+def test_flaglist_array():
+    validator = FlaglistValidator('prop', 'parent', flags=['lines', 'markers'], extras=['none'], array_ok=True)
+    val = ['lines', 'markers + lines', 'none', 'lines'] * 100
+    coerce_val = validator.validate_coerce(val)
+    assert coerce_val.tolist() == ['lines', 'markers+lines', 'none', 'lines'] * 100
+    assert coerce_val.dtype == '<U13'
+
+    with pytest.raises(ValueError) as validation_failure:
+        validator.validate_coerce(['lines', 'none+lines', 1])
+
+    assert "Invalid elements include: ['none+lines', 1]" in str(validation_failure.value)
+
+
+def test_string_array():
+    validator = StringValidator('prop', 'parent', values=['a', 'bb', ''], no_blank=True, array_ok=True)
+    coerce_val = validator.validate_coerce(np.array(['a', 'bb', 'a'], dtype='object'))
+    assert coerce_val.tolist() == ['a', 'bb', 'a']
+    assert coerce_val.dtype == '<U2'
+
+    for val, invalid_els in [(['a', 1, 'a', 2.0], [1, 2.0]), (['a', '', 'a'], ['']), (['a', 'c', 'c'], ['c', 'c'])]:
+        with pytest.raises(ValueError) as validation_failure:
+            validator.validate_coerce(val)
+
+        assert 'Invalid elements include: %s' % invalid_els in str(validation_failure.value)
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ipyplotly.basevalidators import (pandas_to_numpy_array, is_array, CategoricalArray, DataArrayValidator,
+                                      EnumeratedValidator, NumberValidator, StringValidator)
+from ipyplotly.serializers import _py_to_js, NATIVE_DTYPES
+
+
+# pandas_to_numpy_array
+# ---------------------
+def test_is_array():
+    assert is_array(pd.Series([1, 2]))
+    assert is_array(pd.Index(['a', 'b']))
+    assert not is_array(pd.DataFrame({'a': [1, 2]}))
+
+
+def test_numeric_view():
+    series = pd.Series(np.arange(5.0), index=np.arange(5) + 10)
+    v = pandas_to_numpy_array(series)
+    assert isinstance(v, np.ndarray)
+    assert np.shares_memory(v, series.values)
+
+
+def test_categorical():
+    v = pandas_to_numpy_array(pd.Series(['b', 'a', None, 'b'], dtype='category'))
+    assert v.dtype == 'object'
+    assert v.tolist() == ['b', 'a', None, 'b']
+
+    v = pandas_to_numpy_array(pd.CategoricalIndex([2, 1, 2]))
+    assert not isinstance(v, CategoricalArray)
+    assert v.tolist() == [2, 1, 2]
+
+
+# String categoricals keep their codes, which are sent to the frontend as is
+def test_categorical_codes():
+    series = pd.Series(['b', 'a', None, 'b'], dtype='category')
+    v = DataArrayValidator('prop', 'parent').validate_coerce(series)
+    assert isinstance(v, CategoricalArray)
+    assert v.codes.tolist() == series.cat.codes.tolist() == [1, 0, -1, 1]
+
+    res = _py_to_js(v, None, NATIVE_DTYPES)
+    assert np.frombuffer(res['codes']['buffer'], dtype=res['codes']['dtype']).tolist() == [1, 0, -1, 1]
+
+    # Slices don't keep the codes
+    assert v[1:].codes is None
+    assert v[1:].tolist() == ['a', None, 'b']
+
+
+@pytest.mark.parametrize('val,expected',
+                         [(pd.Series(pd.to_datetime(['2020-01-01 00:00:00', None, '2020-01-02 03:04:05'])),
+                           ['2020-01-01', None, '2020-01-02T03:04:05']),
+                          (pd.date_range('2020-01-01 12:00', periods=2, freq='h', tz='US/Eastern'),
+                           ['2020-01-01T12:00', '2020-01-01T13:00'])])
+def test_datetime(val, expected):
+    assert pandas_to_numpy_array(val).tolist() == expected
+
+
+def test_nullable():
+    v = pandas_to_numpy_array(pd.Series([1, None], dtype='Int64'))
+    assert v.dtype == 'float64'
+    assert np.isnan(v[1])
+
+    assert pandas_to_numpy_array(pd.Series(['a', None], dtype='string')).tolist() == ['a', None]
+
+
+def test_passthrough():
+    val = [1, 2]
+    assert pandas_to_numpy_array(val) is val
+
+
+# Validators
+# ----------
+# Elements are looked up by position, not by index label
+def test_validators():
+    index = [10, 11, 12]
+    assert DataArrayValidator('prop', 'parent').validate_coerce(
+        pd.Series([1.0, 2.0, 3.0], index=index)).tolist() == [1.0, 2.0, 3.0]
+
+    with pytest.raises(ValueError) as validation_failure:
+        NumberValidator('prop', 'parent', min=0, array_ok=True).validate_coerce(pd.Series([1, -2, 3], index=index))
+
+    assert 'Invalid elements include: [-2]' in str(validation_failure.value)
+
+    validator = EnumeratedValidator('prop', 'parent', ['a', 'b'], array_ok=True)
+    with pytest.raises(ValueError) as validation_failure:
+        validator.validate_coerce(pd.Series(['a', 'c', 'a'], index=index, dtype='category'))
+
+    assert "Invalid elements include: ['c']" in str(validation_failure.value)
+
+    assert StringValidator('prop', 'parent', array_ok=True).validate_coerce(
+        pd.Series(['a', 'b', 'a'], dtype='category')).tolist() == ['a', 'b', 'a']
@@ -0,0 +1,118 @@
+import pytest
+
+from ipyplotly import validationmemo
+from ipyplotly.basevalidators import ColorValidator, ColorscaleValidator, FlaglistValidator
+
+
+# Fixtures
+# --------
+@pytest.fixture(autouse=True)
+def memo():
+    validationmemo.set_enabled(True)
+    validationmemo.clear()
+    yield
+    validationmemo.set_maxsize()
+    validationmemo.set_enabled(True)
+
+
+# Tests
+# -----
+def test_color_memo():
+    validator = ColorValidator('prop', 'parent')
+    assert validator.validate_coerce('#1F77B4') == '#1f77b4'
+    assert validator.validate_coerce('#1F77B4') == '#1f77b4'
+
+    stats = validationmemo.get_stats()['color']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['size'] == 1
+    assert stats['maxsize'] == validationmemo.DEFAULT_MAXSIZE
+
+
+def test_invalid_values_memoized():
+    validator = ColorValidator('prop', 'parent')
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            validator.validate_coerce('bogus')
+
+    assert validationmemo.get_stats()['color']['hits'] == 1
+
+
+def test_shared_by_validator_kind():
+    # Validators with the same flags share results, validators with other flags don't
+    validator1 = FlaglistValidator('prop1', 'parent', flags=['lines', 'markers'])
+    validator2 = FlaglistValidator('prop2', 'parent', flags=['lines', 'markers'])
+    validator3 = FlaglistValidator('prop3', 'parent', flags=['lines', 'text'])
+
+    assert validator1.validate_coerce('lines+markers') == 'lines+markers'
+    assert validator2.validate_coerce('lines+markers') == 'lines+markers'
+    with pytest.raises(ValueError):
+        validator3.validate_coerce('lines+markers')
+
+    stats = validationmemo.get_stats()['flaglist']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+
+
+def test_colorscale_memo():
+    validator = ColorscaleValidator('prop', 'parent')
+    assert validator.validate_coerce('viridis') == 'Viridis'
+    assert validator.validate_coerce('viridis') == 'Viridis'
+
+    stats = validationmemo.get_stats()['colorscale']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_number_types_not_conflated():
+    validator = ColorValidator('prop', 'parent', colorscale_path='parent.colorscale')
+    assert type(validator.validate_coerce(1)) is int
+    assert type(validator.validate_coerce(1.0)) is float
+
+
+def test_unhashable_values():
+    validator = FlaglistValidator('prop', 'parent', flags=['lines', 'markers'])
+    with pytest.raises(ValueError):
+        validator.validate_coerce({'lines': True})
+
+    assert validationmemo.get_stats()['flaglist']['size'] == 0
+
+
+def test_disable():
+    validationmemo.set_enabled(False)
+    assert not validationmemo.is_enabled()
+
+    validator = ColorValidator('prop', 'parent')
+    assert validator.validate_coerce('red') == 'red'
+    assert validationmemo.get_stats()['color'] == {
+        'hits': 0, 'misses': 0, 'size': 0, 'maxsize': validationmemo.DEFAULT_MAXSIZE}
+
+
+def test_maxsize():
+    validationmemo.set_maxsize(2)
+    validator = ColorValidator('prop', 'parent')
+    for color in ['red', 'green', 'blue', 'red']:
+        validator.validate_coerce(color)
+
+    stats = validationmemo.get_stats()['color']
+    assert stats['size'] == 2
+    assert stats['maxsize'] == 2
+    assert stats['misses'] == 4
+
+
+def test_errors_propagate():
+    calls = []
+
+    @validationmemo.memoized('test_errors')
+    def perform_validate_coerce(v):
+        calls.append(v)
+        raise TypeError('Invalid value')
+
+    try:
+        with pytest.raises(TypeError):
+            perform_validate_coerce('value')
+
+        # The function isn't called again without the memo
+        assert calls == ['value']
+    finally:
+        validationmemo._memos.pop('test_errors')